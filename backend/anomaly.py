@@ -0,0 +1,230 @@
+"""
+Streaming Anomaly Detection
+EWMA z-score and CUSUM detectors on every numeric telemetry series.
+
+Each (device_id, key) series is one row in a set of NumPy columns: EWMA
+mean and variance, the two CUSUM accumulators and a warm-up counter. A
+batch of samples is flattened to (row, value) pairs and every row is
+updated with a handful of array operations, whatever the keys are. Rows
+that appear several times in one batch are applied in rounds, so each
+series still sees its samples in arrival order.
+
+Memory is fixed per series: 4 float64 columns + 1 int32 column (36 bytes;
+columns grow by doubling, capped at `max_series` rows) plus the row index
+(device -> key -> row dicts and two reverse-lookup lists, roughly 130
+bytes per series). 100k series measure about 17 MB (bench_anomaly.py);
+series beyond `max_series` are not tracked.
+"""
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+NUMERIC = (int, float)  # Exact types, like history_store.is_number (bools excluded)
+
+SPIKE, SHIFT_UP, SHIFT_DOWN = "spike", "shift_up", "shift_down"
+
+
+class AnomalyDetector:
+    """
+    Per-series EWMA/z-score and CUSUM anomaly detection.
+
+    Why: The state rules only watch a few named keys against fixed
+    thresholds. These detectors learn each series' own level and spread,
+    so any auto-discovered key gets spike (|z| > z_threshold) and level
+    shift (CUSUM > cusum_h) alerts without configuration.
+    """
+
+    def __init__(self, alpha: float = 0.05, z_threshold: float = 4.0, cusum_k: float = 0.5,
+                 cusum_h: float = 8.0, warmup: int = 30, max_series: int = 200000,
+                 initial_rows: int = 4096, recent: int = 1000):
+        self.alpha = alpha              # EWMA weight of a new sample
+        self.z_threshold = z_threshold  # |z| above this is a spike
+        self.cusum_k = cusum_k          # CUSUM slack, in standard deviations
+        self.cusum_h = cusum_h          # CUSUM alarm level, in standard deviations
+        self.warmup = warmup            # Samples before a series can alert
+        self.max_series = max_series
+
+        # device_id -> key -> row, and row -> (device_id, key)
+        self.rows: Dict[str, Dict[str, int]] = {}
+        self.series_device: List[str] = []
+        self.series_key: List[str] = []
+        self._alloc(min(initial_rows, max_series))
+
+        # Latest events for REST clients (newest last)
+        self.recent: deque = deque(maxlen=recent)
+
+        # Metrics
+        self.samples = 0
+        self.events = 0
+        self.untracked = 0  # Samples of series beyond max_series
+
+    # Per-row columns and their fill values
+    _COLUMNS = (
+        ("mean", np.float64, 0.0),
+        ("var", np.float64, 0.0),
+        ("cusum_hi", np.float64, 0.0),
+        ("cusum_lo", np.float64, 0.0),
+        ("count", np.int32, 0),  # Samples seen, capped at warmup
+    )
+
+    def _alloc(self, rows: int):
+        for name, dtype, fill in self._COLUMNS:
+            setattr(self, name, np.full(rows, fill, dtype=dtype))
+
+    def _grow(self):
+        old = len(self.mean)
+        saved = {name: getattr(self, name) for name, _, _ in self._COLUMNS}
+        self._alloc(min(old * 2, self.max_series))
+        for name, column in saved.items():
+            getattr(self, name)[:old] = column
+
+    def _row(self, device_id: str, key: str) -> Optional[int]:
+        keys = self.rows.get(device_id)
+        if keys is None:
+            keys = self.rows[device_id] = {}
+        row = keys.get(key)
+        if row is None:
+            row = len(self.series_key)
+            if row >= self.max_series:
+                return None
+            if row >= len(self.mean):
+                self._grow()
+            keys[key] = row
+            self.series_device.append(device_id)
+            self.series_key.append(key)
+        return row
+
+    def observe(self, device_id: str, telemetry: Dict[str, Any], ts: Optional[float] = None) -> List[Dict]:
+        """Feed one sample; returns its anomaly events."""
+        return self.observe_many([(device_id, telemetry)], ts)
+
+    def observe_many(self, updates: List[tuple], ts: Optional[float] = None) -> List[Dict]:
+        """
+        Feed a batch of (device_id, telemetry) samples, oldest first.
+
+        Returns one event dict per anomalous (sample, key), in batch order:
+        {device_id, key, value, kind, score, mean, std, timestamp}.
+        """
+        rows, vals = [], []
+        row_of = self._row
+        for device_id, telemetry in updates:
+            for key, value in telemetry.items():
+                if type(value) in NUMERIC:
+                    row = row_of(device_id, key)
+                    if row is None:
+                        self.untracked += 1
+                        continue
+                    rows.append(row)
+                    vals.append(value)
+        if not rows:
+            return []
+
+        rows = np.asarray(rows, dtype=np.int64)
+        vals = np.asarray(vals, dtype=np.float64)
+        finite = np.isfinite(vals)
+        if not finite.all():
+            rows, vals = rows[finite], vals[finite]
+        self.samples += len(rows)
+
+        # Rank of each sample within its series; rank r is applied in round r
+        order = np.argsort(rows, kind="stable")
+        series, first, total = np.unique(rows[order], return_index=True, return_counts=True)
+        if len(series) == len(rows):
+            rounds = [np.arange(len(rows))]
+        else:
+            rank = np.empty(len(rows), dtype=np.int64)
+            rank[order] = np.arange(len(rows)) - np.repeat(first, total)
+            rounds = [np.flatnonzero(rank == r) for r in range(int(total.max()))]
+
+        fired = []
+        for positions in rounds:
+            fired.extend(self._update(positions, rows[positions], vals[positions]))
+        if not fired:
+            return []
+
+        fired.sort()
+        stamp = datetime.utcfromtimestamp(time.time() if ts is None else ts).isoformat()
+        events = []
+        for _, row, value, kind, z, mean, std in fired:
+            event = {
+                "device_id": self.series_device[row],
+                "key": self.series_key[row],
+                "value": value,
+                "kind": kind,
+                "score": round(z, 2),
+                "mean": round(mean, 4),
+                "std": round(std, 4),
+                "timestamp": stamp,
+            }
+            events.append(event)
+            self.recent.append(event)
+        self.events += len(events)
+        return events
+
+    def _update(self, positions: np.ndarray, idx: np.ndarray, x: np.ndarray) -> List[tuple]:
+        """Score and update rows `idx` (all distinct) with values `x`."""
+        n = self.count[idx]
+        m = self.mean[idx]
+        v = self.var[idx]
+        warm = n >= self.warmup
+
+        # z against the state before this sample; the floor keeps a flat
+        # series from dividing by zero (any step off it scores high)
+        d = x - m
+        std = np.sqrt(v)
+        z = d / np.maximum(std, 1e-9 + 1e-6 * np.abs(m))
+
+        # CUSUM on z clipped to the spike level, so one spike is not a shift
+        zc = np.clip(z, -self.z_threshold, self.z_threshold)
+        hi = np.where(warm, np.maximum(0.0, self.cusum_hi[idx] + zc - self.cusum_k), 0.0)
+        lo = np.where(warm, np.maximum(0.0, self.cusum_lo[idx] - zc - self.cusum_k), 0.0)
+        spike = warm & (np.abs(z) > self.z_threshold)
+        up = hi > self.cusum_h
+        down = lo > self.cusum_h
+        self.cusum_hi[idx] = np.where(up, 0.0, hi)
+        self.cusum_lo[idx] = np.where(down, 0.0, lo)
+
+        # EWMA mean/variance; a plain average while warming up, and spikes
+        # are winsorized so one outlier does not inflate the variance
+        a = np.maximum(self.alpha, 1.0 / (n + 1))
+        limit = self.z_threshold * std
+        d = np.where(warm, np.clip(d, -limit, limit), d)
+        self.mean[idx] = m + a * d
+        self.var[idx] = (1.0 - a) * (v + a * d * d)
+        self.count[idx] = np.minimum(n + 1, self.warmup)
+
+        alert = np.flatnonzero(spike | up | down)
+        if not len(alert):
+            return []
+        kinds = np.where(spike[alert], 0, np.where(up[alert], 1, 2))
+        return [
+            (pos, row, value, (SPIKE, SHIFT_UP, SHIFT_DOWN)[kind], score, mean, sd)
+            for pos, row, value, kind, score, mean, sd in zip(
+                positions[alert].tolist(), idx[alert].tolist(), x[alert].tolist(), kinds.tolist(),
+                z[alert].tolist(), m[alert].tolist(), std[alert].tolist())
+        ]
+
+    def get_recent(self, device_id: Optional[str] = None, limit: int = 100) -> List[Dict]:
+        """Latest events, newest last, optionally for one device."""
+        events = list(self.recent)
+        if device_id is not None:
+            events = [e for e in events if e["device_id"] == device_id]
+        return events[-limit:]
+
+    def memory_bytes(self) -> int:
+        """Column storage plus an estimate of the row index."""
+        columns = sum(getattr(self, name).nbytes for name, _, _ in self._COLUMNS)
+        return columns + 130 * len(self.series_key)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "series": len(self.series_key),
+            "max_series": self.max_series,
+            "samples": self.samples,
+            "events": self.events,
+            "untracked": self.untracked,
+            "memory_bytes": self.memory_bytes(),
+        }
@@ -0,0 +1,375 @@
+"""
+Multi-Worker Mode
+Runs N backend processes on one port, partitioned by device_id.
+
+    python cluster.py --workers 4 --port 8000
+
+Each device_id belongs to exactly one worker, which owns its history,
+persistence, anomaly detectors and state inference. HTTP and WebSocket
+connections land on any worker (they share one listening socket); samples
+for another worker's devices are forwarded to it, and every live update
+is relayed to all workers over a full mesh of Unix-domain sockets, so any
+worker's WebSocket clients see the whole fleet.
+
+MQTT telemetry reaches the workers through a shared subscription (each
+worker consumes a share of the devices) and SampleForwarder hands samples
+of devices owned elsewhere to their owner.
+
+Single-process `uvicorn main:app` is unchanged: WORKER_COUNT stays 1 and
+no bus is created. Multi-worker mode needs Unix-domain sockets (Linux/macOS).
+"""
+import argparse
+import asyncio
+import inspect
+import multiprocessing
+import os
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+import serialization
+
+# Set by the launcher in each worker process before main is imported
+WORKER_INDEX = 0
+WORKER_COUNT = 1
+SOCKET_DIR: Optional[str] = None
+
+_owner_of: Dict[str, int] = {}
+
+_HEADER = struct.Struct("<I")  # Frame length prefix
+
+
+def owner(device_id: str) -> int:
+    """
+    Worker index that owns a device.
+
+    Uses the high bits of crc32 so the split is independent of
+    InferencePool, which shards on the low bits of the same hash.
+    """
+    index = _owner_of.get(device_id)
+    if index is None:
+        index = _owner_of[device_id] = (zlib.crc32(device_id.encode()) >> 16) % WORKER_COUNT
+    return index
+
+
+def is_local(device_id: str) -> bool:
+    """True if this worker owns the device (always, with one worker)."""
+    return WORKER_COUNT == 1 or owner(device_id) == WORKER_INDEX
+
+
+def socket_path(socket_dir: str, index: int) -> str:
+    return os.path.join(socket_dir, f"worker-{index}.sock")
+
+
+class RemoteError(Exception):
+    """An error raised by a handler on another worker (see WorkerBus.call)."""
+
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class WorkerBus:
+    """
+    Length-prefixed JSON frames between the workers of one host.
+
+    Why: Unix-domain sockets stay in the kernel (no TCP stack, no broker
+    process) and asyncio serves them on the existing event loop. Each
+    worker listens on its own socket and dials every peer, so a relayed
+    update is one write per peer, encoded once.
+
+    Handlers are registered per message kind and called with the decoded
+    message (sync or async). call() runs a named procedure on one worker and
+    returns its result; a procedure raising an exception with `status_code`
+    and `detail` (an HTTPException) is re-raised as RemoteError.
+    """
+
+    def __init__(self, index: int, count: int, socket_dir: str, max_buffer: int = 8 << 20):
+        self.index = index
+        self.count = count
+        self.socket_dir = socket_dir
+        self.max_buffer = max_buffer  # Unsent bytes per peer before frames are dropped
+        self.handlers: Dict[str, Callable[[Any], Any]] = {}
+        self.procedures: Dict[str, Callable[..., Any]] = {}
+        self._peers: Dict[int, asyncio.StreamWriter] = {}
+        self._server = None
+        self._calls: Dict[int, asyncio.Future] = {}
+        self._next_call = 0
+
+        # Metrics
+        self.sent = 0
+        self.received = 0
+        self.dropped = 0
+        self.bytes_sent = 0
+
+    def on(self, kind: str, handler: Callable[[Any], Any]):
+        """Handle messages of `kind` from peers."""
+        self.handlers[kind] = handler
+
+    def procedure(self, name: str, function: Callable[..., Any]):
+        """Expose a function (sync or async) to call() from peers."""
+        self.procedures[name] = function
+
+    async def start(self):
+        """Listen for peers, then connect to every other worker."""
+        path = socket_path(self.socket_dir, self.index)
+        if os.path.exists(path):
+            os.unlink(path)
+        self._server = await asyncio.start_unix_server(self._serve_peer, path)
+        for peer in range(self.count):
+            if peer != self.index:
+                asyncio.create_task(self._connect(peer))
+        print(f"[CLUSTER] Worker {self.index}/{self.count} bus on {path}")
+
+    async def _connect(self, peer: int, retry: float = 0.1):
+        path = socket_path(self.socket_dir, peer)
+        while True:
+            try:
+                _, writer = await asyncio.open_unix_connection(path)
+                break
+            except OSError:
+                await asyncio.sleep(retry)  # Peer not listening yet
+        self._peers[peer] = writer
+
+    async def _serve_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read frames from one peer until it disconnects."""
+        try:
+            while True:
+                (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+                frame = serialization.loads(await reader.readexactly(length))
+                self.received += 1
+                if frame["kind"] == "call":
+                    asyncio.create_task(self._dispatch(frame))  # A slow query must not stall the relay
+                else:
+                    await self._dispatch(frame)
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass  # Peer or this worker shutting down
+        finally:
+            writer.close()
+
+    async def _dispatch(self, frame: Dict[str, Any]):
+        kind = frame["kind"]
+        try:
+            if kind == "call":
+                await self._answer(frame)
+            elif kind == "reply":
+                future = self._calls.pop(frame["id"], None)
+                if future and not future.done():
+                    if "error" in frame:
+                        future.set_exception(RemoteError(*frame["error"]))
+                    else:
+                        future.set_result(frame["result"])
+            else:
+                result = self.handlers[kind](frame["message"])
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            print(f"[CLUSTER] Error handling {kind} from a peer: {e}")
+
+    async def _answer(self, frame: Dict[str, Any]):
+        reply: Dict[str, Any] = {"kind": "reply", "id": frame["id"]}
+        try:
+            result = self.procedures[frame["call"]](**frame["params"])
+            reply["result"] = await result if inspect.isawaitable(result) else result
+        except Exception as e:
+            reply["error"] = [getattr(e, "status_code", 500), getattr(e, "detail", str(e))]
+        self._write(frame["from"], self._encode(reply), droppable=False)
+
+    def _encode(self, frame: Dict[str, Any]) -> bytes:
+        body = serialization.dumps(frame)
+        return _HEADER.pack(len(body)) + body
+
+    def _write(self, peer: int, data: bytes, droppable: bool = True) -> bool:
+        writer = self._peers.get(peer)
+        if writer is None or writer.is_closing():
+            self.dropped += 1
+            return False
+        if droppable and writer.transport.get_write_buffer_size() > self.max_buffer:
+            self.dropped += 1  # Peer is not keeping up; never block this worker
+            return False
+        writer.write(data)
+        self.sent += 1
+        self.bytes_sent += len(data)
+        return True
+
+    def publish(self, kind: str, message: Any):
+        """Send a message to every other worker (encoded once)."""
+        data = self._encode({"kind": kind, "message": message})
+        for peer in self._peers:
+            self._write(peer, data)
+
+    def connected(self, peer: int) -> bool:
+        """Whether a message to `peer` can be written right now."""
+        writer = self._peers.get(peer)
+        return writer is not None and not writer.is_closing()
+
+    def send(self, peer: int, kind: str, message: Any, droppable: bool = True) -> bool:
+        """
+        Send a message to one worker. Returns False if it was dropped.
+
+        With droppable=False a connected peer always gets it, however far
+        behind it is.
+        """
+        return self._write(peer, self._encode({"kind": kind, "message": message}), droppable)
+
+    async def call(self, peer: int, name: str, params: Dict[str, Any], timeout: float = 10.0) -> Any:
+        """Run procedure `name` on another worker and return its result."""
+        self._next_call += 1
+        call_id = self._next_call
+        future = asyncio.get_running_loop().create_future()
+        self._calls[call_id] = future
+        frame = {"kind": "call", "call": name, "params": params, "id": call_id, "from": self.index}
+        if not self._write(peer, self._encode(frame), droppable=False):
+            self._calls.pop(call_id, None)
+            raise RemoteError(503, f"Worker {peer} is not connected")
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise RemoteError(504, f"Worker {peer} did not answer {name}")
+        finally:
+            self._calls.pop(call_id, None)
+
+    async def call_all(self, name: str, params: Dict[str, Any], timeout: float = 10.0) -> List[Any]:
+        """Run procedure `name` on every other worker; results in worker order."""
+        peers = [peer for peer in range(self.count) if peer != self.index]
+        return await asyncio.gather(*(self.call(peer, name, params, timeout) for peer in peers))
+
+    def close(self):
+        if self._server:
+            self._server.close()
+        for writer in self._peers.values():
+            writer.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "worker": self.index,
+            "workers": self.count,
+            "peers_connected": len(self._peers),
+            "sent": self.sent,
+            "received": self.received,
+            "dropped": self.dropped,
+            "bytes_sent": self.bytes_sent,
+            "pending_calls": len(self._calls),
+        }
+
+
+class SampleForwarder:
+    """
+    MQTT ingestion entry point of a worker: keeps its own devices, forwards the rest.
+
+    Why: A shared MQTT subscription splits devices by the broker's hash,
+    not by owner(). Samples of other workers' devices are sent to their
+    owner ("submit" messages), batched per event-loop turn so the paho
+    thread does not cross into the loop once per message. Per-device
+    order is kept: one device always arrives here and goes to one owner.
+    """
+
+    def __init__(self, pipeline, bus: WorkerBus):
+        self.pipeline = pipeline
+        self.bus = bus
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._scheduled = False
+
+        # Metrics
+        self.forwarded = 0
+        self.dropped = 0
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def submit(self, device_id: str, telemetry: Dict[str, Any], timestamp: Optional[str] = None) -> bool:
+        """Same contract as IngestionPipeline.submit (any thread, never blocks)."""
+        if is_local(device_id):
+            return self.pipeline.submit(device_id, telemetry, timestamp)
+        with self._lock:
+            self._pending.append((device_id, telemetry, timestamp))
+            if self._scheduled:
+                return True
+            self._scheduled = True
+        self._loop.call_soon_threadsafe(self._flush)
+        return True
+
+    def seed(self, device_id: str, telemetry: Dict[str, Any], timestamp: Optional[str] = None):
+        """Retained values only seed this worker's device list (IngestionPipeline.seed)."""
+        self.pipeline.seed(device_id, telemetry, timestamp)
+
+    def _flush(self):
+        with self._lock:
+            samples, self._pending = self._pending, []
+            self._scheduled = False
+        by_owner: Dict[int, List[tuple]] = {}
+        for sample in samples:
+            by_owner.setdefault(owner(sample[0]), []).append(sample)
+        for peer, owned in by_owner.items():
+            if self.bus.send(peer, "submit", owned):
+                self.forwarded += len(owned)
+            else:
+                self.dropped += len(owned)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"forwarded": self.forwarded, "dropped": self.dropped, "pending": len(self._pending)}
+
+
+def _run_worker(index: int, count: int, socket_dir: str, sock: socket.socket, log_level: str):
+    """Worker process: configure the cluster module, then import and serve the app."""
+    import cluster  # Not this module when launched as `python cluster.py` (__main__)
+    cluster.WORKER_INDEX, cluster.WORKER_COUNT, cluster.SOCKET_DIR = index, count, socket_dir
+    import uvicorn
+    import main
+    server = uvicorn.Server(uvicorn.Config(main.app, log_level=log_level))
+    server.run(sockets=[sock])
+
+
+def run(workers: int, host: str = "0.0.0.0", port: int = 8000, log_level: str = "info"):
+    """Start `workers` backend processes sharing one listening socket."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    socket_dir = tempfile.mkdtemp(prefix="iot-cluster-")
+
+    # fork: workers inherit the listening socket and import main themselves
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_run_worker, args=(i, workers, socket_dir, sock, log_level),
+                                 name=f"worker-{i}")
+                 for i in range(workers)]
+    print(f"[CLUSTER] Starting {workers} workers on {host}:{port}")
+    for process in processes:
+        process.start()
+    # SIGTERM (service managers) shuts the workers down like Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        print("\n[CLUSTER] Shutting down...")
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        for index in range(workers):
+            path = socket_path(socket_dir, index)
+            if os.path.exists(path):
+                os.unlink(path)
+        os.rmdir(socket_dir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the backend as several worker processes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+    run(args.workers, args.host, args.port, args.log_level)
@@ -0,0 +1,161 @@
+"""
+Ring-Buffer History Store
+Fixed-capacity, array-backed telemetry history for chart widgets.
+
+Each (device_id, key) series owns two preallocated float64 arrays: one for
+epoch timestamps and one for values. Writes overwrite the oldest slot in
+place, so appending a sample is O(1) and allocates nothing.
+"""
+from array import array
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def is_number(value: Any) -> bool:
+    """True for int/float samples that can live in a float64 array."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def to_history(points: Iterable[Tuple[float, Any]]) -> List[Dict]:
+    """Convert (epoch_timestamp, value) pairs to the REST shape [{timestamp, value}]."""
+    fromts = datetime.utcfromtimestamp
+    return [{"timestamp": fromts(ts).isoformat(), "value": value} for ts, value in points]
+
+
+class RingBuffer:
+    """
+    Fixed-capacity circular buffer of (timestamp, value) float pairs.
+
+    Why: list.pop(0) is O(n) and a dict per point costs ~200 bytes.
+    Two packed arrays cost 16 bytes per point regardless of history length.
+    """
+
+    __slots__ = ("capacity", "timestamps", "values", "_head", "_size", "integral")
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.timestamps = array("d", bytes(8 * capacity))
+        self.values = array("d", bytes(8 * capacity))
+        self._head = 0  # Next slot to write
+        self._size = 0
+        # Remember whether every sample was an int so we can return ints
+        self.integral = True
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float):
+        """Write one sample, overwriting the oldest when full."""
+        head = self._head
+        self.timestamps[head] = timestamp
+        self.values[head] = value
+        head += 1
+        self._head = 0 if head == self.capacity else head
+        if self._size < self.capacity:
+            self._size += 1
+
+    def _start(self) -> int:
+        """Index of the oldest sample."""
+        return (self._head - self._size) % self.capacity
+
+    def items(self) -> List[Tuple[float, float]]:
+        """Return samples oldest-first as (timestamp, value) tuples."""
+        start = self._start()
+        end = start + self._size
+        if end <= self.capacity:
+            return list(zip(self.timestamps[start:end], self.values[start:end]))
+        wrap = end - self.capacity
+        return (
+            list(zip(self.timestamps[start:], self.values[start:]))
+            + list(zip(self.timestamps[:wrap], self.values[:wrap]))
+        )
+
+    def last(self) -> Optional[Tuple[float, float]]:
+        """Most recent sample, or None when empty."""
+        if not self._size:
+            return None
+        idx = self._head - 1
+        return self.timestamps[idx], self.values[idx]
+
+    def resize(self, capacity: int):
+        """Change capacity, keeping the newest samples that still fit."""
+        samples = self.items()[-capacity:]
+        integral = self.integral
+        self.__init__(capacity)
+        self.integral = integral
+        for ts, value in samples:
+            self.append(ts, value)
+
+
+class HistoryStore:
+    """
+    History for every (device_id, key) series, backed by ring buffers.
+
+    Numeric samples go into a RingBuffer. Non-numeric samples (strings,
+    booleans, nested objects) fall back to a bounded deque so the store
+    stays sensor-agnostic.
+    """
+
+    def __init__(self, default_capacity: int = 100,
+                 key_capacities: Optional[Dict[str, int]] = None):
+        self.default_capacity = default_capacity
+        # key -> capacity override (e.g. {"vibration": 1000})
+        self.key_capacities: Dict[str, int] = dict(key_capacities or {})
+
+        # device_id -> key -> RingBuffer | deque[(timestamp, value)]
+        self.series: Dict[str, Dict[str, Any]] = {}
+
+    def capacity_for(self, key: str) -> int:
+        """Configured capacity for a telemetry key."""
+        return self.key_capacities.get(key, self.default_capacity)
+
+    def set_capacity(self, key: str, capacity: int):
+        """Override capacity for a key and resize existing series."""
+        self.key_capacities[key] = capacity
+        for device_series in self.series.values():
+            buf = device_series.get(key)
+            if isinstance(buf, RingBuffer):
+                buf.resize(capacity)
+            elif buf is not None:
+                device_series[key] = deque(buf, maxlen=capacity)
+
+    def append(self, device_id: str, key: str, timestamp: float, value: Any):
+        """Record one sample at an epoch timestamp."""
+        device_series = self.series.get(device_id)
+        if device_series is None:
+            device_series = self.series[device_id] = {}
+
+        buf = device_series.get(key)
+        if buf is None:
+            capacity = self.capacity_for(key)
+            buf = RingBuffer(capacity) if is_number(value) else deque(maxlen=capacity)
+            device_series[key] = buf
+
+        if isinstance(buf, RingBuffer):
+            if is_number(value):
+                if buf.integral and not isinstance(value, int):
+                    buf.integral = False
+                buf.append(timestamp, value)
+                return
+            # Key changed type: demote to the generic deque
+            buf = device_series[key] = deque(self._iter_samples(buf), maxlen=buf.capacity)
+
+        buf.append((timestamp, value))
+
+    @staticmethod
+    def _iter_samples(buf) -> List[Tuple[float, Any]]:
+        if isinstance(buf, RingBuffer):
+            if buf.integral:
+                return [(ts, int(v)) for ts, v in buf.items()]
+            return buf.items()
+        return list(buf)
+
+    def get_series(self, device_id: str, key: str) -> List[Tuple[float, Any]]:
+        """Samples oldest-first as (epoch_timestamp, value) tuples."""
+        buf = self.series.get(device_id, {}).get(key)
+        if buf is None:
+            return []
+        return self._iter_samples(buf)
@@ -0,0 +1,210 @@
+"""
+Sharded State Inference Pool
+Runs state inference on worker threads, off the ingestion path.
+
+Each device_id hashes to one shard. A shard owns its own
+StateInferenceEngine, queue and thread, so a device's samples are always
+inferred in arrival order and engines never share mutable state. Engines
+report only committed state transitions, which are handed back to the
+event loop in batches, one call per drained queue. Queries from the event
+loop take the shard's engine lock, so they never see a half-applied sample.
+"""
+import asyncio
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Called on the event loop with the state transitions of one drain, in order
+ResultHandler = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class _Shard:
+    """One worker thread with its own queue and inference engine."""
+
+    def __init__(self, index: int, engine, max_queue: int):
+        self.index = index
+        self.engine = engine
+        self.max_queue = max_queue
+        self.queue: deque = deque()  # (device_id, telemetry, received_at epoch, enqueued_at)
+        self.ready = threading.Condition(threading.Lock())
+        self.lock = threading.Lock()  # Held per sample update and per query
+        self.thread: Optional[threading.Thread] = None
+
+        # Metrics
+        self.enqueued = 0
+        self.dropped = 0
+        self.processed = 0
+        self.transitions = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.error_logged = float("-inf")  # Monotonic time of the last error log line
+        self.last_latency = 0.0  # Oldest sample of a drain: enqueue -> result (s)
+        self.max_latency = 0.0
+
+
+class _Locked:
+    """Calls the wrapped object's methods under a lock."""
+
+    def __init__(self, target, lock: threading.Lock):
+        self._target = target
+        self._lock = lock
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return locked
+
+
+class InferencePool:
+    """
+    State inference for every ingestion path, sharded by device_id.
+
+    Why: Inference used to run inline on the event loop before each
+    broadcast (REST) or not at all (MQTT). Moving it to a pool keeps raw
+    telemetry latency independent of inference cost, and both paths get
+    machine states through the same stage.
+    """
+
+    def __init__(self, engine_factory: Callable[[], Any], workers: int = 4,
+                 max_queue: int = 10000, on_results: Optional[ResultHandler] = None):
+        self.on_results = on_results
+        self.error_log_interval = 10.0  # Seconds between inference error log lines per shard
+        self.shards = [_Shard(i, engine_factory(), max_queue) for i in range(workers)]
+        self._shard_of: Dict[str, _Shard] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = False
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start one worker thread per shard; results are delivered on `loop`."""
+        self._loop = loop or asyncio.get_running_loop()
+        self._running = True
+        for shard in self.shards:
+            shard.thread = threading.Thread(target=self._work, args=(shard,),
+                                            name=f"inference-{shard.index}", daemon=True)
+            shard.thread.start()
+        print(f"[INFER] Pool started ({len(self.shards)} shards)")
+
+    def stop(self):
+        """Stop the workers (pending samples are discarded)."""
+        self._running = False
+        for shard in self.shards:
+            with shard.ready:
+                shard.ready.notify()
+
+    def shard_for(self, device_id: str) -> _Shard:
+        """Stable device -> shard mapping (crc32, unlike hash(), is not salted)."""
+        shard = self._shard_of.get(device_id)
+        if shard is None:
+            shard = self.shards[zlib.crc32(device_id.encode()) % len(self.shards)]
+            self._shard_of[device_id] = shard
+        return shard
+
+    def submit(self, device_id: str, telemetry: Dict[str, Any]) -> bool:
+        """
+        Queue one sample for inference. Safe from any thread; never blocks.
+
+        Returns False if the device's shard is full and the sample was dropped.
+        """
+        shard = self.shard_for(device_id)
+        with shard.ready:
+            if len(shard.queue) >= shard.max_queue:
+                shard.dropped += 1
+                return False
+            shard.queue.append((device_id, telemetry, time.time(), time.monotonic()))
+            shard.enqueued += 1
+            if len(shard.queue) == 1:
+                shard.ready.notify()
+        return True
+
+    def _work(self, shard: _Shard):
+        engine = shard.engine
+        while self._running:
+            with shard.ready:
+                while not shard.queue and self._running:
+                    shard.ready.wait()
+                batch = list(shard.queue)
+                shard.queue.clear()
+            if not batch:
+                continue
+
+            changes: List[Dict[str, Any]] = []
+            failed = 0
+            for device_id, telemetry, received_at, _ in batch:
+                # Per sample, so a query waits for one update, not a whole drain
+                with shard.lock:
+                    try:
+                        change = engine.update_telemetry(device_id, telemetry, received_at)
+                    except Exception as e:
+                        failed += 1
+                        shard.last_error = f"{device_id}: {e}"
+                        continue
+                if change is not None:
+                    changes.append({"device_id": device_id, **change})
+
+            if failed:
+                shard.errors += failed
+                # At most one line per drain (and per error_log_interval)
+                now = time.monotonic()
+                if now - shard.error_logged >= self.error_log_interval:
+                    shard.error_logged = now
+                    print(f"[ERROR] State inference failed for {failed} samples on shard "
+                          f"{shard.index} (last: {shard.last_error}; {shard.errors} total)")
+
+            latency = time.monotonic() - batch[0][3]
+            shard.processed += len(batch)
+            shard.transitions += len(changes)
+            shard.last_latency = latency
+            shard.max_latency = max(shard.max_latency, latency)
+            if changes and self.on_results and self._loop is not None:
+                asyncio.run_coroutine_threadsafe(self.on_results(changes), self._loop)
+
+    def get_device_state(self, device_id: str) -> Optional[Dict]:
+        """Latest inferred state for a device."""
+        shard = self.shard_for(device_id)
+        with shard.lock:
+            return shard.engine.get_device_state(device_id)
+
+    def transition_log(self, device_id: str):
+        """
+        Transition log of the shard that owns `device_id`.
+
+        Its methods run under the shard's lock; the worker appends to the
+        same log while the event loop reads it.
+        """
+        shard = self.shard_for(device_id)
+        return _Locked(shard.engine.transitions, shard.lock)
+
+    def get_all_states(self) -> Dict:
+        """States for all devices across shards."""
+        states = {}
+        for shard in self.shards:
+            with shard.lock:
+                states.update(shard.engine.get_all_states())
+        return states
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-shard queue depth, throughput and latency."""
+        return {
+            "workers": len(self.shards),
+            "shards": [
+                {
+                    "queue_depth": len(shard.queue),
+                    "enqueued": shard.enqueued,
+                    "dropped": shard.dropped,
+                    "processed": shard.processed,
+                    "transitions": shard.transitions,
+                    "errors": shard.errors,
+                    "last_error": shard.last_error,
+                    "last_latency_ms": round(shard.last_latency * 1000, 3),
+                    "max_latency_ms": round(shard.max_latency * 1000, 3),
+                }
+                for shard in self.shards
+            ],
+        }
@@ -0,0 +1,251 @@
+"""
+Micro-Batched Ingestion Pipeline
+Moves telemetry from the MQTT network thread onto the asyncio event loop.
+
+The paho thread (or an embedded broker, via submit_message) only appends to
+a bounded queue. A single asyncio consumer drains the queue in micro-batches,
+applies storage updates in bulk and sends one `telemetry_batch` WebSocket
+frame per flush. The batch then goes through
+anomaly detection, and each sample is handed to the inference stage, which
+publishes states separately.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import serialization
+
+
+def parse_telemetry_message(topic: str, payload) -> tuple:
+    """
+    (device_id, telemetry, timestamp) of an app/device/{device_id}/telemetry
+    message whose payload is {"telemetry": {...}, "timestamp": "..."}.
+
+    `payload` may be bytes or a memoryview; it is decoded straight into a
+    typed struct (see serialization.py). Raises ValueError for other topics
+    or malformed payloads.
+    """
+    parts = topic.split("/")
+    if len(parts) != 4:
+        raise ValueError(f"Invalid topic format: {topic}")
+    telemetry, timestamp = serialization.decode_message(payload)
+    return parts[2], telemetry, timestamp
+
+
+def sample_time(timestamp) -> Optional[float]:
+    """
+    Epoch seconds of a payload timestamp (epoch seconds or ISO 8601,
+    naive = UTC), or None if it is missing or unreadable.
+    """
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    try:
+        parsed = datetime.fromisoformat(str(timestamp))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class IngestionPipeline:
+    """
+    Bounded queue + asyncio consumer between producers and the dashboard.
+
+    Why: One run_coroutine_threadsafe() per MQTT message costs a cross-thread
+    handoff, a json.dumps and a full fan-out per sample. Batching amortizes
+    all three across up to `batch_size` samples.
+    """
+
+    def __init__(self, storage, ws_manager, max_queue: int = 10000,
+                 batch_size: int = 256, max_delay: float = 0.05,
+                 inference: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+                 anomalies: Optional[Callable[[List[tuple]], Awaitable[None]]] = None):
+        self.storage = storage
+        self.ws_manager = ws_manager
+        self.inference = inference  # Called with (device_id, telemetry) after broadcast
+        self.anomalies = anomalies  # Awaited with [(device_id, telemetry)] after broadcast
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.max_delay = max_delay  # Seconds to wait for a batch to fill
+
+        # (device_id, telemetry, timestamp, enqueued_at)
+        self._queue: deque = deque()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._full: Optional[asyncio.Event] = None
+        self._idle = False         # Consumer is parked waiting for data
+        self._want_full = False    # Consumer is waiting for a full batch
+
+        # Metrics
+        self.enqueued = 0
+        self.dropped = 0
+        self.invalid = 0  # Messages submit_message could not parse
+        self.flushes = 0
+        self.flushed = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.last_flush_latency = 0.0  # Oldest sample: enqueue -> broadcast (s)
+        self.max_flush_latency = 0.0
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Start the consumer task on the running event loop."""
+        self._loop = loop or asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+        print(f"[INGEST] Pipeline started (batch={self.batch_size}, "
+              f"delay={self.max_delay * 1000:.0f}ms, queue={self.max_queue})")
+
+    def submit(self, device_id: str, telemetry: Dict[str, Any],
+               timestamp: Optional[str] = None) -> bool:
+        """
+        Enqueue one sample. Safe to call from any thread; never blocks.
+
+        Returns False if the queue is full and the sample was dropped.
+        """
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return False
+            self._queue.append((device_id, telemetry, timestamp, time.monotonic()))
+            self.enqueued += 1
+            depth = len(self._queue)
+
+        # Only cross threads when the consumer is actually waiting on us
+        if self._loop is not None:
+            if self._idle:
+                self._idle = False
+                self._call_soon(self._wakeup.set)
+            elif self._want_full and depth >= self.batch_size:
+                self._want_full = False
+                self._call_soon(self._full.set)
+        return True
+
+    def submit_message(self, topic: str, payload) -> bool:
+        """
+        Parse and enqueue one MQTT telemetry message (broker listener callback).
+
+        Why: With the broker embedded in this process the payload arrives as
+        a view into the broker's read buffer, so it is parsed here, before
+        the buffer is reused, instead of after a loopback client re-reads it.
+        """
+        try:
+            device_id, telemetry, timestamp = parse_telemetry_message(topic, payload)
+        except ValueError as e:
+            self.invalid += 1
+            print(f"[INGEST] Invalid MQTT message on {topic}: {e}")
+            return False
+        return self.submit(device_id, telemetry, timestamp)
+
+    def seed(self, device_id: str, telemetry: Dict[str, Any],
+             timestamp: Optional[str] = None):
+        """
+        Seed latest values from a retained MQTT message. Safe from any thread.
+
+        Why: The broker replays each device's retained last value on
+        subscribe, however old it is. It is not a new sample: it must not
+        reach history, detectors or inference, nor mark the device online.
+        """
+        ts = sample_time(timestamp)
+        self._call_soon(lambda: self.storage.seed_latest(device_id, telemetry, ts))
+
+    def _call_soon(self, callback):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            callback()
+        else:
+            self._loop.call_soon_threadsafe(callback)
+
+    def _drain(self) -> List[tuple]:
+        with self._lock:
+            count = min(len(self._queue), self.batch_size)
+            return [self._queue.popleft() for _ in range(count)]
+
+    async def _run(self):
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                self._idle = True
+                # Re-check after publishing the idle flag to avoid a lost wakeup
+                if not self._queue:
+                    await self._wakeup.wait()
+                self._idle = False
+
+            if len(self._queue) < self.batch_size and self.max_delay > 0:
+                self._full.clear()
+                self._want_full = True
+                if len(self._queue) < self.batch_size:
+                    try:
+                        await asyncio.wait_for(self._full.wait(), self.max_delay)
+                    except asyncio.TimeoutError:
+                        pass
+                self._want_full = False
+
+            batch = self._drain()
+            if not batch:
+                continue
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                print(f"[INGEST] Error flushing batch of {len(batch)}: {e}")
+
+    async def _flush(self, batch: List[tuple]):
+        """Apply a batch to storage and broadcast it as one frame."""
+        # Stored at the device's timestamp: a QoS 1 backlog the broker
+        # queued while the backend was down is not fresh data
+        self.storage.update_many([(device_id, telemetry, sample_time(timestamp))
+                                  for device_id, telemetry, timestamp, _ in batch])
+        samples = [(device_id, telemetry) for device_id, telemetry, _, _ in batch]
+
+        now = datetime.utcnow()  # Serialized natively by the WebSocket encoder
+        updates = [
+            {
+                "device_id": device_id,
+                "telemetry": telemetry,
+                "timestamp": timestamp or now,
+            }
+            for device_id, telemetry, timestamp, _ in batch
+        ]
+        await self.ws_manager.broadcast({"type": "telemetry_batch", "updates": updates})
+        if self.anomalies:
+            await self.anomalies(samples)
+        if self.inference:
+            for device_id, telemetry, _, _ in batch:
+                self.inference(device_id, telemetry)
+
+        latency = time.monotonic() - batch[0][3]
+        size = len(batch)
+        self.flushes += 1
+        self.flushed += size
+        self.last_batch_size = size
+        self.max_batch_size = max(self.max_batch_size, size)
+        self.last_flush_latency = latency
+        self.max_flush_latency = max(self.max_flush_latency, latency)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue and batching metrics."""
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue": self.max_queue,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "invalid": self.invalid,
+            "flushes": self.flushes,
+            "flushed": self.flushed,
+            "avg_batch_size": round(self.flushed / self.flushes, 2) if self.flushes else 0,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "last_flush_latency_ms": round(self.last_flush_latency * 1000, 3),
+            "max_flush_latency_ms": round(self.max_flush_latency * 1000, 3),
+        }
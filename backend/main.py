@@ -10,25 +10,59 @@ This is the core backend that:
 Architecture: Event-driven, stateless (except in-memory demo storage)
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Dict, List, Any, Literal, Optional, Union
+from array import array
+import base64
+import functools
+import sys
+from datetime import datetime, timezone
 import asyncio
-import json
 import paho.mqtt.client as mqtt
+import os
+import socket
 import threading
+import time
+
+from history_store import HistoryStore, is_number, to_history
+from tsdb import SegmentStore, TimeSeriesStore
+from rollups import RollupStore
+from downsample import lttb
+from ingestion import IngestionPipeline, parse_telemetry_message
+import serialization
+from ws_clients import ClientConnection, OVERFLOW_DROP_OLDEST, telemetry_updates
+import ws_binary
+from subscriptions import SubscriptionIndex, parse_filters
+from inference_pool import InferencePool
+import cluster
 
 # Import state inference engine
 try:
-    from state_inference import inference_engine, MachineState
+    from state_inference import inference_engine, MachineState, StateInferenceEngine
     STATE_INFERENCE_ENABLED = True
     print("[INFO] State inference engine loaded successfully")
 except ImportError as e:
     STATE_INFERENCE_ENABLED = False
     print(f"[WARNING] State inference module not found: {e}")
 
+# Vectorized fleet-wide inference needs NumPy (in requirements.txt)
+try:
+    from fleet_inference import FleetInferenceEngine
+    FLEET_INFERENCE_AVAILABLE = STATE_INFERENCE_ENABLED
+except ImportError as e:
+    FLEET_INFERENCE_AVAILABLE = False
+    print(f"[WARNING] Fleet inference disabled, is NumPy installed? {e}")
+
+# Streaming anomaly detection also needs NumPy
+try:
+    from anomaly import AnomalyDetector
+    ANOMALY_DETECTION_AVAILABLE = True
+except ImportError as e:
+    ANOMALY_DETECTION_AVAILABLE = False
+    print(f"[WARNING] Anomaly detection disabled, is NumPy installed? {e}")
+
 # ==================== DATA MODELS ====================
 
 class TelemetryPayload(BaseModel):
@@ -37,12 +71,36 @@ class TelemetryPayload(BaseModel):
     
     Why generic: We don't know what sensors the device has.
     The 'telemetry' dict can contain ANY key-value pairs.
+    
+    Request bodies are decoded by serialization.decode_record (a msgspec
+    struct when available); this model documents the schema in OpenAPI.
     """
     device_id: str
     telemetry: Dict[str, Any]  # Arbitrary key-value pairs
     timestamp: Optional[str] = None
 
 
+class HistorySelector(BaseModel):
+    """One (device, key, range, resolution) series in a bulk history query."""
+    device_id: str
+    key: str
+    start: Optional[Union[float, str]] = None  # Epoch seconds or ISO 8601
+    end: Optional[Union[float, str]] = None
+    resolution: Literal["auto", "raw", "1s", "1m", "1h"] = "auto"
+    max_points: int = Field(500, ge=3, le=10000)
+    method: Literal["minmax", "lttb"] = "minmax"
+
+
+class HistoryQuery(BaseModel):
+    """
+    Bulk history request.
+    
+    Why: A dashboard with 40 charts would otherwise need 40 round trips.
+    """
+    series: List[HistorySelector] = Field(..., max_length=500)
+    encoding: Literal["json", "base64"] = "json"
+
+
 class Device(BaseModel):
     """Device metadata discovered at runtime."""
     device_id: str
@@ -59,19 +117,51 @@ class InMemoryStorage:
     """
     Simple in-memory storage for demo purposes.
     
-    Why: Fast, simple, sufficient for demo. Loses data on restart.
+    Why: Fast, simple, sufficient for demo. Loses data on restart unless a
+    persistence store is attached, in which case numeric history is also
+    written to disk and devices are restored at startup.
     Production: Use Redis for real-time data + PostgreSQL for persistence.
     """
     
-    def __init__(self):
+    def __init__(self, history_capacity: int = 100,
+                 key_capacities: Optional[Dict[str, int]] = None,
+                 persistence: Optional[TimeSeriesStore] = None,
+                 max_clock_lag: float = 900.0):
         # device_id -> Device metadata
         self.devices: Dict[str, Dict[str, Any]] = {}
         
+        # Device timestamps further behind receive time than this (seconds)
+        # are not trusted: local-time clocks, uptime counters, unset RTCs
+        self.max_clock_lag = max_clock_lag
+        
         # device_id -> key -> {value, timestamp}
         self.telemetry: Dict[str, Dict[str, Any]] = {}
         
-        # device_id -> key -> List[{timestamp, value}] (last 100 points)
-        self.history: Dict[str, Dict[str, List[Dict]]] = {}
+        # device_id -> epoch of its latest stored sample
+        self.last_sample: Dict[str, float] = {}
+        
+        # device_id -> key -> ring buffer (last N points, N configurable per key)
+        self.history = HistoryStore(history_capacity, key_capacities)
+        
+        # 1s / 1m / 1h aggregates for range queries, updated per sample
+        self.rollups = RollupStore()
+        
+        # Durable numeric history (None = memory only)
+        self.persistence = persistence
+        # (device_id, key) -> rollup back-fill in progress
+        self._backfills: Dict[tuple, asyncio.Task] = {}
+        if persistence:
+            self._restore_devices()
+    
+    def _restore_devices(self):
+        """Re-register devices and keys known to the persistence store."""
+        for device_id, keys in self.persistence.series().items():
+            self.register_device(device_id)
+            device = self.devices[device_id]
+            device["status"] = "offline"
+            device["telemetry_keys"] = sorted(keys)
+        if self.devices:
+            print(f"[STORAGE] Restored {len(self.devices)} devices from disk")
     
     def register_device(self, device_id: str):
         """Auto-register device on first telemetry."""
@@ -85,19 +175,24 @@ class InMemoryStorage:
                 "status": "online"
             }
             self.telemetry[device_id] = {}
-            self.history[device_id] = {}
     
-    def update_telemetry(self, device_id: str, telemetry: Dict[str, Any]):
+    def update_telemetry(self, device_id: str, telemetry: Dict[str, Any],
+                         ts: Optional[float] = None):
         """
         Store latest telemetry and update device metadata.
         
         Why: Dashboard needs latest values + historical data for charts.
         We auto-discover new telemetry keys as they appear.
         """
-        now = datetime.utcnow().isoformat()
+        received = time.time()
+        if ts is None:
+            ts = received
+        self.last_sample[device_id] = ts
+        now = datetime.utcfromtimestamp(ts).isoformat()
         
-        # Update device last seen
-        self.devices[device_id]["last_seen"] = now
+        # Update device last seen (when we heard from it, whatever its clock says)
+        self.devices[device_id]["last_seen"] = (
+            now if ts == received else datetime.utcfromtimestamp(received).isoformat())
         self.devices[device_id]["status"] = "online"
         
         # Store telemetry
@@ -108,22 +203,87 @@ class InMemoryStorage:
                 "timestamp": now
             }
             
-            # Add to history (keep last 100 points)
-            if key not in self.history[device_id]:
-                self.history[device_id][key] = []
-            
-            self.history[device_id][key].append({
-                "timestamp": now,
-                "value": value
-            })
-            
-            # Limit history size
-            if len(self.history[device_id][key]) > 100:
-                self.history[device_id][key].pop(0)
-            
             # Auto-discover new keys
             if key not in self.devices[device_id]["telemetry_keys"]:
                 self.devices[device_id]["telemetry_keys"].append(key)
+            
+            if value is None:
+                continue  # A NaN/Infinity reading: a gap, not a history point
+            
+            # Add to history (ring buffer drops the oldest point when full)
+            self.history.append(device_id, key, ts, value)
+            if is_number(value):
+                self.rollups.add(device_id, key, ts, value)
+                if self.persistence:
+                    self.persistence.append(device_id, key, ts, value)
+    
+    def update_many(self, updates: List[tuple]):
+        """
+        Apply a batch of (device_id, telemetry, ts) updates (ts None = now).
+        
+        Why: The ingestion pipeline flushes many samples at once; registering
+        and storing them in one call keeps the per-sample cost minimal.
+        A device ts is used only within [now - max_clock_lag, now] (a
+        backlog the broker queued); anything else is a wrong clock and the
+        sample is stored at receive time. It is also clamped to the
+        device's previous sample, so history stays sorted.
+        """
+        now = time.time()
+        oldest = now - self.max_clock_lag
+        for device_id, telemetry, ts in updates:
+            if ts is None or ts < oldest:
+                ts = now
+            else:
+                ts = max(min(ts, now), self.last_sample.get(device_id, 0.0))
+            if device_id not in self.devices:
+                self.register_device(device_id)
+                self.devices[device_id]["first_seen"] = datetime.utcfromtimestamp(ts).isoformat()
+            self.update_telemetry(device_id, telemetry, ts)
+    
+    def seed_latest(self, device_id: str, telemetry: Dict[str, Any], ts: Optional[float]):
+        """
+        Latest values from a retained message (ts = the device's timestamp).
+        
+        Why: A retained value may be hours old. It fills in the device list
+        and values nothing newer has set, but is not history and does not
+        make the device online.
+        """
+        stamp = datetime.utcfromtimestamp(ts).isoformat() if ts is not None else None
+        if device_id not in self.devices:
+            self.register_device(device_id)
+            device = self.devices[device_id]
+            device["status"] = "offline"
+            if stamp:
+                device["first_seen"] = device["last_seen"] = stamp
+        device = self.devices[device_id]
+        latest = self.telemetry[device_id]
+        for key, value in telemetry.items():
+            if key not in latest:
+                latest[key] = {"value": value, "timestamp": stamp}
+            if key not in device["telemetry_keys"]:
+                device["telemetry_keys"].append(key)
+    
+    def update_latest(self, updates: List[Dict[str, Any]]):
+        """
+        Apply telemetry_update dicts for devices owned by another worker.
+        
+        Why: In multi-worker mode every worker answers device lists and
+        latest values for the whole fleet, but history, rollups and
+        persistence stay with the owning worker only.
+        """
+        for update in updates:
+            device_id = update["device_id"]
+            if device_id not in self.devices:
+                self.register_device(device_id)
+            device = self.devices[device_id]
+            now = datetime.utcnow().isoformat()
+            device["last_seen"] = now
+            device["status"] = "online"
+            latest = self.telemetry[device_id]
+            for key, value in update["telemetry"].items():
+                latest[key] = {"value": value, "timestamp": now}
+                if key not in device["telemetry_keys"]:
+                    device["telemetry_keys"].append(key)
     
     def get_devices(self) -> List[Dict]:
         """Return all registered devices."""
@@ -139,7 +299,135 @@ class InMemoryStorage:
     
     def get_history(self, device_id: str, key: str) -> List[Dict]:
         """Get historical data for a specific telemetry key."""
-        return self.history.get(device_id, {}).get(key, [])
+        points = self.history.get_series(device_id, key)
+        capacity = self.history.capacity_for(key)
+        # After a restart the ring buffer is cold; serve older points from disk
+        if self.persistence and len(points) < capacity:
+            stored = self.persistence.read(device_id, key, limit=capacity)
+            if len(stored) > len(points):
+                points = stored
+        return to_history(points)
+    
+    def _raw_points(self, device_id: str, key: str, start: Optional[float],
+                    end: Optional[float]) -> List[tuple]:
+        """Raw samples in [start, end] from disk, else from the ring buffer."""
+        if self.persistence:
+            points = self.persistence.read(device_id, key, start, end)
+            if points:
+                return points
+        return [
+            (ts, value) for ts, value in self.history.get_series(device_id, key)
+            if (start is None or ts >= start) and (end is None or ts <= end)
+        ]
+    
+    async def ensure_rollups(self, device_id: str, key: str):
+        """
+        Fold history written before this process started into the rollups.
+        
+        Why: Rollups live in memory. After a restart they only cover new
+        samples, so each series is back-filled once from disk (bounded by
+        the rollup retention). Reading and bucketing run on a worker thread;
+        concurrent callers wait for the same back-fill.
+        """
+        ident = (device_id, key)
+        if not self.persistence or ident in self.rollups.backfilled:
+            return
+        task = self._backfills.get(ident)
+        if task is None:
+            task = self._backfills[ident] = asyncio.create_task(self._backfill(device_id, key))
+            task.add_done_callback(lambda _: self._backfills.pop(ident, None))
+        await asyncio.shield(task)  # A cancelled request must not cancel a shared back-fill
+    
+    async def _backfill(self, device_id: str, key: str):
+        first_live = self.rollups.first_seen.get((device_id, key))
+        # Samples stored after this point are already in the live buckets
+        end = first_live - 0.001 if first_live is not None else time.time()
+        start = end - self.rollups.horizon()
+        levels = await asyncio.to_thread(
+            lambda: self.rollups.build(self.persistence.read(device_id, key, start, end)))
+        self.rollups.backfill(device_id, key, levels)
+    
+    async def backfill_rollups(self):
+        """Back-fill the rollups of every persisted series, one at a time."""
+        for device_id, keys in self.persistence.series().items():
+            for key in keys:
+                try:
+                    await self.ensure_rollups(device_id, key)
+                except Exception as e:
+                    print(f"[STORAGE] Rollup back-fill failed for {device_id}.{key}: {e}")
+    
+    def query_columns(self, device_id: str, key: str, start: Optional[float] = None,
+                      end: Optional[float] = None, max_points: int = 500,
+                      method: str = "minmax", resolution: str = "auto") -> Dict[str, Any]:
+        """
+        Time-range history as columns, reduced to at most `max_points` points.
+        
+        With resolution="auto", ranges that fit are returned raw. Larger
+        ranges are served from the finest rollup that fits (min/max/avg per
+        bucket), or reduced with LTTB when method="lttb". An explicit
+        resolution ("raw", "1s", "1m", "1h") returns the newest `max_points`
+        points at that resolution.
+        
+        Returns {"resolution", "timestamps" (epoch s), "values"} plus
+        "min", "max" and "count" columns for bucketed results. Await
+        ensure_rollups() first so history from before a restart is counted.
+        """
+        if resolution == "raw":
+            points = self._raw_points(device_id, key, start, end)[-max_points:]
+            return _point_columns("raw", points)
+        if resolution != "auto":
+            buckets = self.rollups.query_level(device_id, key, resolution, start, end)
+            return _bucket_columns(resolution, (buckets or [])[-max_points:])
+        
+        count = self.rollups.count(device_id, key, start, end)
+        
+        if count is None or count <= max_points:
+            points = self._raw_points(device_id, key, start, end)
+            if len(points) > max_points and count is not None:
+                points = lttb(points, max_points)
+            return _point_columns("raw", points)
+        
+        if method == "lttb":
+            # LTTB over raw data when that is cheap, else over a finer rollup
+            if count <= 10 * max_points:
+                level, points = "raw", self._raw_points(device_id, key, start, end)
+            else:
+                level, buckets = self.rollups.query(device_id, key, start, end, 10 * max_points)
+                points = [(b["timestamp"], b["avg"]) for b in buckets]
+            return _point_columns(level, lttb(points, max_points))
+        
+        level, buckets = self.rollups.query(device_id, key, start, end, max_points)
+        return _bucket_columns(level, buckets)
+    
+    def query_history(self, device_id: str, key: str, start: Optional[float] = None,
+                      end: Optional[float] = None, max_points: int = 500,
+                      method: str = "minmax") -> Dict[str, Any]:
+        """Time-range history in the REST row shape [{timestamp, value, ...}]."""
+        columns = self.query_columns(device_id, key, start, end, max_points, method)
+        history = to_history(zip(columns["timestamps"], columns["values"]))
+        if "min" in columns:
+            for row, low, high, count in zip(history, columns["min"], columns["max"], columns["count"]):
+                row.update(min=low, max=high, count=count)
+        return {"resolution": columns["resolution"], "history": history}
+
+
+def _point_columns(resolution: str, points: List[tuple]) -> Dict[str, Any]:
+    return {
+        "resolution": resolution,
+        "timestamps": [ts for ts, _ in points],
+        "values": [value for _, value in points],
+    }
+
+
+def _bucket_columns(resolution: str, buckets: List[dict]) -> Dict[str, Any]:
+    return {
+        "resolution": resolution,
+        "timestamps": [b["timestamp"] for b in buckets],
+        "values": [b["avg"] for b in buckets],
+        "min": [b["min"] for b in buckets],
+        "max": [b["max"] for b in buckets],
+        "count": [b["count"] for b in buckets],
+    }
 
 
 # ==================== WEBSOCKET MANAGER ====================
@@ -150,38 +438,191 @@ class ConnectionManager:
     
     Why: Dashboard needs instant updates without polling.
     WebSocket allows server to push data to all connected clients.
+    Each client has its own bounded queue and writer task, so a slow
+    dashboard never delays the others or the ingestion path.
+    Clients may subscribe to a subset of devices/keys; clients that never
+    subscribe receive everything. Device events (state, status, anomalies)
+    follow the same filters as the device's telemetry.
     """
     
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(self, max_queue: int = 256, overflow_policy: str = OVERFLOW_DROP_OLDEST):
+        self.max_queue = max_queue
+        self.overflow_policy = overflow_policy  # drop_oldest | coalesce | disconnect
+        self.active_connections: Dict[WebSocket, ClientConnection] = {}
+        self.subscriptions = SubscriptionIndex()
+        self.relay = None  # Called with every broadcast message (multi-worker fan-out)
+        self.frame_tables = ws_binary.FrameTables()  # Shared by binary-protocol clients
     
     async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"[WS] Client connected. Total: {len(self.active_connections)}")
+        # Clients offering the binary subprotocol get compact telemetry frames
+        binary = ws_binary.PROTOCOL in websocket.scope.get("subprotocols", ())
+        await websocket.accept(subprotocol=ws_binary.PROTOCOL if binary else None)
+        client = ClientConnection(websocket, self.max_queue, self.overflow_policy,
+                                  on_close=self._on_client_closed,
+                                  encoder=ws_binary.BinaryFrameEncoder(self.frame_tables) if binary else None)
+        self.active_connections[websocket] = client
+        client.start()
+        print(f"[WS] Client connected{' (binary)' if binary else ''}. "
+              f"Total: {len(self.active_connections)}")
     
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
-        print(f"[WS] Client disconnected. Total: {len(self.active_connections)}")
+        client = self.active_connections.get(websocket)
+        if client:
+            client.close()
+    
+    def _on_client_closed(self, client: ClientConnection):
+        self.subscriptions.remove(client)
+        if self.active_connections.pop(client.websocket, None) is not None:
+            print(f"[WS] Client disconnected. Total: {len(self.active_connections)}")
+    
+    def send(self, websocket: WebSocket, message: dict):
+        """Queue a message for a single client."""
+        client = self.active_connections.get(websocket)
+        if client:
+            client.enqueue(message)
     
-    async def broadcast(self, message: dict):
-        """Send message to all connected clients."""
+    def handle_client_message(self, websocket: WebSocket, data: Union[str, bytes]):
+        """
+        Handle a message sent by a dashboard.
+        
+        Supported:
+            {"type": "subscribe", "devices": [...], "keys": [...], "series": [...],
+             "replace": false}
+            {"type": "unsubscribe", "devices": [...], "keys": [...], "series": [...]}
+            {"type": "unsubscribe", "all": true}
+            {"type": "set_rate", "max_hz": 5}     (null/0 turns conflation off)
+        """
+        client = self.active_connections.get(websocket)
+        if not client:
+            return
+        try:
+            message = serialization.loads(data)
+            msg_type = message.get("type")
+            if msg_type == "subscribe":
+                self.subscriptions.subscribe(client, parse_filters(message),
+                                             replace=bool(message.get("replace")))
+            elif msg_type == "unsubscribe":
+                if message.get("all"):
+                    self.subscriptions.remove(client)
+                else:
+                    self.subscriptions.unsubscribe(client, parse_filters(message))
+            elif msg_type == "set_rate":
+                client.set_max_rate(message.get("max_hz"))
+                client.enqueue({"type": "rate", "max_hz": client.max_rate_hz})
+                return
+            else:
+                return
+        except (ValueError, TypeError, AttributeError) as e:
+            client.enqueue({"type": "error", "detail": f"Invalid message: {e}"})
+            return
+        
+        client.enqueue({
+            "type": "subscription",
+            "filters": self.subscriptions.describe(client)
+        })
+    
+    async def broadcast(self, message: dict, relay: bool = True):
+        """
+        Queue message for all connected clients (never waits on a socket).
+        
+        Messages relayed from another worker are broadcast with relay=False.
+        """
+        if relay and self.relay:
+            self.relay(message)
         if not self.active_connections:
             return
         
-        message_json = json.dumps(message)
+        updates = telemetry_updates(message)
+        if not self.subscriptions.filters:
+            self._send_all(self.active_connections.values(), message)
+            return
+        if updates is None:
+            self._route_event(message)
+            return
         
-        # Send to all clients concurrently
-        dead_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_json)
-            except:
-                dead_connections.append(connection)
+        # Route each (device, key) through the subscription index
+        routed: Dict[ClientConnection, List[dict]] = {}
+        for update in updates:
+            device_id = update["device_id"]
+            per_client: Dict[ClientConnection, Dict[str, Any]] = {}
+            internal = {}
+            for key, value in update["telemetry"].items():
+                if key.startswith("_"):
+                    internal[key] = value  # State fields ride along with any match
+                    continue
+                for client in self.subscriptions.subscribers(device_id, key):
+                    per_client.setdefault(client, {})[key] = value
+            for client, telemetry in per_client.items():
+                telemetry.update(internal)
+                routed.setdefault(client, []).append({**update, "telemetry": telemetry})
         
-        # Remove dead connections
-        for conn in dead_connections:
-            self.disconnect(conn)
+        self._send_all(self._unfiltered(), message)
+        
+        # Clients watching the same series share one encoded frame
+        # (binary-protocol clients share theirs through frame_tables)
+        encoded: Dict[tuple, list] = {}
+        for client, client_updates in routed.items():
+            signature = tuple((u["device_id"], tuple(u["telemetry"])) for u in client_updates)
+            frame = encoded.get(signature)
+            if frame is None:
+                if message["type"] == "telemetry_update":
+                    filtered = client_updates[0]
+                else:
+                    filtered = {"type": "telemetry_batch", "updates": client_updates}
+                frame = encoded[signature] = [filtered, None]
+            if frame[1] is None and client.encoder is None:
+                frame[1] = serialization.dumps(frame[0])
+            client.enqueue(*frame)
+    
+    def _unfiltered(self) -> List[ClientConnection]:
+        return [client for client in self.active_connections.values()
+                if not self.subscriptions.is_filtered(client)]
+    
+    @staticmethod
+    def _send_all(clients, message: dict):
+        """Queue one message for several clients, encoding JSON once."""
+        frame = None
+        for client in list(clients):
+            if frame is None and client.encoder is None:
+                frame = serialization.dumps(message)
+            client.enqueue(message, frame)
+    
+    def _route_event(self, message: dict):
+        """
+        Queue a non-telemetry message for the clients it concerns.
+        
+        Why: A dashboard subscribed to a few devices should not receive
+        state, status and anomaly events for the whole fleet. Anomaly events
+        are routed per (device, key) like telemetry; other messages with a
+        device_id go to clients with any filter on that device.
+        """
+        if message.get("type") == "anomaly":
+            self._send_all(self._unfiltered(), message)
+            routed: Dict[ClientConnection, List[dict]] = {}
+            for event in message["events"]:
+                for client in self.subscriptions.subscribers(event["device_id"], event["key"]):
+                    routed.setdefault(client, []).append(event)
+            for client, events in routed.items():
+                client.enqueue({**message, "events": events})
+            return
+        
+        device_id = message.get("device_id")
+        if device_id is None:
+            self._send_all(self.active_connections.values(), message)
+            return
+        self._send_all(self._unfiltered() + list(self.subscriptions.device_subscribers(device_id)), message)
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Per-client queue depth and lag."""
+        return {
+            "overflow_policy": self.overflow_policy,
+            "max_queue": self.max_queue,
+            "binary_frames": self.frame_tables.metrics(),
+            "clients": [
+            {**client.metrics(), "filters": self.subscriptions.describe(client)}
+            for client in self.active_connections.values()
+        ],
+        }
 
 
 # ==================== MQTT MANAGER ====================
@@ -194,13 +635,18 @@ class MQTTManager:
     This manager subscribes to the broker and forwards data to WebSocket pipeline.
     """
     
-    def __init__(self, broker_host: str = "localhost", broker_port: int = 1883):
+    def __init__(self, broker_host: str = "localhost", broker_port: int = 1883,
+                 client_id: str = "iot_dashboard_backend",
+                 shared_group: Optional[str] = None):
         self.broker_host = broker_host
         self.broker_port = broker_port
-        self.client = mqtt.Client(client_id="iot_dashboard_backend")
-        self.storage = None
-        self.ws_manager = None
-        self.loop = None  # Store the main event loop
+        # Persistent session: the broker queues QoS 1 telemetry while the backend is down
+        self.client = mqtt.Client(client_id=client_id, clean_session=False)
+        # In a shared group each message goes to one consumer of the group
+        # (mqtt_broker.py keeps each device on the same one)
+        self.topic = (f"$share/{shared_group}/app/device/+/telemetry" if shared_group
+                      else "app/device/+/telemetry")
+        self.pipeline = None  # Ingestion pipeline (owns storage + broadcast), or anything with submit()
         
         # MQTT Callbacks
         self.client.on_connect = self._on_connect
@@ -208,19 +654,18 @@ class MQTTManager:
         
         print(f"[MQTT] Initializing MQTT Manager (broker: {broker_host}:{broker_port})")
     
-    def set_dependencies(self, storage, ws_manager, loop=None):
-        """Inject dependencies for storage, WebSocket manager, and event loop."""
-        self.storage = storage
-        self.ws_manager = ws_manager
-        self.loop = loop  # Store the main asyncio event loop
+    def set_dependencies(self, pipeline):
+        """Inject the ingestion pipeline that messages are handed to."""
+        self.pipeline = pipeline
     
     def _on_connect(self, client, userdata, flags, rc):
         """Callback when connected to MQTT broker."""
         if rc == 0:
             print(f"[MQTT] ✓ Connected to broker at {self.broker_host}:{self.broker_port}")
-            # Subscribe to telemetry topic with wildcard for device ID
-            client.subscribe("app/device/+/telemetry")
-            print("[MQTT] ✓ Subscribed to: app/device/+/telemetry")
+            # Subscribe to telemetry topic with wildcard for device ID; unless
+            # shared, the broker answers with every device's retained last value
+            client.subscribe(self.topic, qos=1)
+            print(f"[MQTT] ✓ Subscribed to: {self.topic}")
         else:
             print(f"[MQTT] ✗ Connection failed with code {rc}")
     
@@ -232,44 +677,26 @@ class MQTTManager:
         Payload: JSON with telemetry data
         """
         try:
-            # Extract device_id from topic: app/device/ESP32_SIM_01/telemetry
-            topic_parts = msg.topic.split("/")
-            if len(topic_parts) != 4:
-                print(f"[MQTT] Invalid topic format: {msg.topic}")
-                return
-            
-            device_id = topic_parts[2]
+            # Device id from the topic, {"telemetry": {...}, "timestamp": "..."} payload
+            device_id, telemetry, timestamp = parse_telemetry_message(msg.topic, msg.payload)
             
-            # Parse JSON payload
-            payload = json.loads(msg.payload.decode())
+            print(f"[MQTT] Received from {device_id}: {telemetry}")
             
-            # Expect format: {"telemetry": {...}, "timestamp": "..."}
-            telemetry = payload.get("telemetry", {})
-            timestamp = payload.get("timestamp", datetime.utcnow().isoformat())
-            
-            print(f"[MQTT] Received from {device_id}: {json.dumps(telemetry)}")
+            # A retained message is the device's last value, possibly from
+            # long ago: it only seeds latest values and the device list
+            if msg.retain:
+                if self.pipeline:
+                    self.pipeline.seed(device_id, telemetry, timestamp)
+                return
             
-            # Forward to existing HTTP pipeline
-            if self.storage and self.ws_manager and self.loop:
-                # Auto-register device
-                self.storage.register_device(device_id)
-                
-                # Store telemetry
-                self.storage.update_telemetry(device_id, telemetry)
-                
-                # Broadcast to WebSocket clients using the main event loop
-                asyncio.run_coroutine_threadsafe(
-                    self.ws_manager.broadcast({
-                        "type": "telemetry_update",
-                        "device_id": device_id,
-                        "telemetry": telemetry,
-                        "timestamp": timestamp
-                    }),
-                    self.loop
-                )
+            # Hand off to the ingestion pipeline; storage updates and the
+            # WebSocket broadcast happen in batches on the event loop
+            if self.pipeline:
+                if not self.pipeline.submit(device_id, telemetry, timestamp):
+                    print(f"[MQTT] Ingestion queue full, dropped sample from {device_id}")
             
-        except json.JSONDecodeError:
-            print(f"[MQTT] Invalid JSON payload: {msg.payload}")
+        except ValueError as e:
+            print(f"[MQTT] Invalid message on {msg.topic}: {e}")
         except Exception as e:
             print(f"[MQTT] Error processing message: {e}")
     
@@ -301,37 +728,282 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Durable history lives next to the backend (set to None for memory only).
+# In multi-worker mode each worker persists only the devices it owns.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data",
+                        "tsdb" if cluster.WORKER_COUNT == 1
+                        else f"tsdb-{cluster.WORKER_INDEX}-of-{cluster.WORKER_COUNT}")
+
 # Initialize storage and WebSocket manager
-storage = InMemoryStorage()
-ws_manager = ConnectionManager()
+storage = InMemoryStorage(persistence=SegmentStore(DATA_DIR))
+# Slow clients get their pending telemetry merged to the latest values
+ws_manager = ConnectionManager(max_queue=256, overflow_policy="coalesce")
+
+# Multi-worker mode (python cluster.py --workers N): this worker ingests the
+# devices cluster.owner() maps to it and every broadcast is relayed to the
+# other workers, whose clients get it too. None when running alone.
+bus = (cluster.WorkerBus(cluster.WORKER_INDEX, cluster.WORKER_COUNT, cluster.SOCKET_DIR)
+       if cluster.WORKER_COUNT > 1 else None)
+if bus:
+    ws_manager.relay = lambda message: bus.publish("broadcast", message)
 
-# Initialize and start MQTT manager
-mqtt_manager = MQTTManager(broker_host="localhost", broker_port=1883)
+# Optional per-device-type rule file (JSON, or YAML with PyYAML installed),
+# reloaded when it changes; without it the built-in rules apply. The
+# RULES_PATH environment variable overrides the file; otherwise the first
+# of rules.json / rules.yaml / rules.yml next to the backend is used.
+_RULES_CANDIDATES = [os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+                     for name in ("rules.json", "rules.yaml", "rules.yml")]
+RULES_PATH = os.environ.get("RULES_PATH") or next(
+    (path for path in _RULES_CANDIDATES if os.path.exists(path)), _RULES_CANDIDATES[0])
+if STATE_INFERENCE_ENABLED:
+    inference_engine.rules.watch(RULES_PATH)
 
+# Seconds between fleet-wide inference ticks. When set (and NumPy is
+# available) all devices are evaluated together every tick and only state
+# transitions are broadcast; None runs per-sample inference in the pool.
+FLEET_TICK: Optional[float] = None
+fleet_engine = (FleetInferenceEngine(inference_engine)
+                if FLEET_TICK and FLEET_INFERENCE_AVAILABLE else None)
 
-# Note: We'll set the event loop during startup
+async def publish_states(transitions: List[Dict[str, Any]]):
+    """Broadcast debounced state transitions as state_update messages."""
+    for info in transitions:
+        print(f"[STATE] {info['device_id']}: {info['previous_state']} -> "
+              f"{info['state']} ({info['confidence']}%)")
+        await ws_manager.broadcast({"type": "state_update", **info})
+
+
+def _shard_engine():
+    """Engine for one inference shard, sharing the global engine's settings."""
+    tracker = inference_engine.tracker
+    engine = StateInferenceEngine(min_dwell=tracker.min_dwell,
+                                  confirm_samples=tracker.confirm_samples)
+    engine.thresholds = inference_engine.thresholds
+    engine.buffer_size = inference_engine.buffer_size
+    engine.rules = inference_engine.rules  # One registry, so a reload reaches every shard
+    return engine
+
+
+# Per-sample inference on worker threads sharded by device_id
+inference_pool = (InferencePool(_shard_engine, workers=4, max_queue=10000,
+                                on_results=publish_states)
+                  if STATE_INFERENCE_ENABLED and not fleet_engine else None)
+
+
+def submit_inference(device_id: str, telemetry: Dict[str, Any]):
+    """
+    Hand one sample to the inference stage (REST and MQTT alike).
+    
+    Why: Telemetry is broadcast first; states follow as state_update
+    messages, so inference cost never delays raw telemetry.
+    """
+    if fleet_engine:
+        fleet_engine.observe(device_id, telemetry)
+    elif inference_pool:
+        inference_pool.submit(device_id, telemetry)
+
+
+# EWMA/CUSUM detectors on every numeric series (bounded at max_series)
+anomaly_detector = AnomalyDetector(max_series=200000) if ANOMALY_DETECTION_AVAILABLE else None
+
+
+async def detect_anomalies(samples: List[tuple]):
+    """
+    Run a batch of (device_id, telemetry) through the anomaly detectors.
+    
+    Why: One vectorized update per batch; events go out as a single
+    anomaly message, and only when something fired.
+    """
+    if not anomaly_detector:
+        return
+    try:
+        events = anomaly_detector.observe_many(samples)
+    except Exception as e:
+        print(f"[ERROR] Anomaly detection failed: {e}")
+        return
+    if events:
+        print(f"[ANOMALY] {len(events)} events "
+              f"(first: {events[0]['device_id']}.{events[0]['key']} {events[0]['kind']})")
+        await ws_manager.broadcast({"type": "anomaly", "events": events})
+
+
+# Batches MQTT samples onto the event loop (batch size / delay are tunable)
+ingestion_pipeline = IngestionPipeline(storage, ws_manager, max_queue=10000,
+                                       batch_size=256, max_delay=0.05,
+                                       inference=submit_inference,
+                                       anomalies=detect_anomalies)
+
+# Run the MQTT broker inside this process: devices connect to the backend
+# on MQTT_PORT and telemetry goes from the broker's read buffer straight
+# into the pipeline, without a loopback paho client. False keeps an
+# external broker (mqtt_broker.py or Mosquitto) plus MQTTManager.
+MQTT_EMBEDDED_BROKER = False
+MQTT_HOST = "localhost"  # External broker, or bind address when embedded
+MQTT_PORT = 1883
+
+# Shared subscription group for several backend instances on one broker:
+# each gets a share of the devices instead of a copy of every message.
+# Multi-worker mode always uses one. None subscribes normally, which also
+# delivers every device's retained last value on connect.
+MQTT_SHARED_GROUP: Optional[str] = None
+
+if MQTT_EMBEDDED_BROKER and bus:
+    print("[CLUSTER] Embedded broker disabled with several workers; connecting to MQTT_HOST")
+if MQTT_EMBEDDED_BROKER and not bus:
+    # mqtt_broker.py lives at the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from mqtt_broker import AsyncMQTTBroker
+    embedded_broker = AsyncMQTTBroker(host="0.0.0.0" if MQTT_HOST == "localhost" else MQTT_HOST,
+                                      port=MQTT_PORT)
+    embedded_broker.add_listener("app/device/+/telemetry", ingestion_pipeline.submit_message)
+    mqtt_manager = None
+else:
+    embedded_broker = None
+    # Initialize and start MQTT manager. Group members need their own
+    # (stable) client ids, or they would take over each other's session.
+    shared_group = MQTT_SHARED_GROUP or ("iot_backend" if bus else None)
+    mqtt_manager = MQTTManager(broker_host=MQTT_HOST, broker_port=MQTT_PORT,
+                               client_id=(f"iot_dashboard_backend-{socket.gethostname()}-{cluster.WORKER_INDEX}"
+                                          if shared_group else "iot_dashboard_backend"),
+                               shared_group=shared_group)
+
+# The broker's share of devices is not the workers' partition, so MQTT
+# samples of other workers' devices are forwarded to their owner
+mqtt_forwarder = cluster.SampleForwarder(ingestion_pipeline, bus) if bus and mqtt_manager else None
+
+
+# Note: We'll start the pipeline on the running event loop during startup
 async def set_mqtt_loop():
-    """Set the main event loop for MQTT manager."""
-    loop = asyncio.get_running_loop()
-    mqtt_manager.set_dependencies(storage, ws_manager, loop)
+    """Start the ingestion pipeline and hand it to the MQTT manager."""
+    ingestion_pipeline.start(asyncio.get_running_loop())
+    if mqtt_forwarder:
+        mqtt_forwarder.start(asyncio.get_running_loop())
+    if mqtt_manager:
+        mqtt_manager.set_dependencies(mqtt_forwarder or ingestion_pipeline)
+
+
+# ==================== MULTI-WORKER ROUTING ====================
+
+async def ingest_samples(samples: List[tuple]):
+    """
+    Store, broadcast and analyze (device_id, telemetry, timestamp) samples
+    of devices this worker owns (REST batches and forwarded samples).
+    """
+    storage.update_many([(device_id, telemetry, None) for device_id, telemetry, _ in samples])
+    
+    now = datetime.utcnow().isoformat()
+    updates = [
+        {"device_id": device_id, "telemetry": telemetry, "timestamp": timestamp or now}
+        for device_id, telemetry, timestamp in samples
+    ]
+    if updates:
+        await ws_manager.broadcast({"type": "telemetry_batch", "updates": updates})
+        await detect_anomalies([(device_id, telemetry) for device_id, telemetry, _ in samples])
+    for device_id, telemetry, _ in samples:
+        submit_inference(device_id, telemetry)
+
+
+def forward_samples(samples: List[tuple]) -> List[tuple]:
+    """
+    Send samples of other workers' devices to their owners; return the rest.
+    
+    Why: A device's history, detectors and state machine live on one worker,
+    so its samples must be processed there, in order, whichever worker the
+    HTTP request happened to land on.
+    """
+    if not bus:
+        return samples
+    local, remote = [], {}
+    for sample in samples:
+        owner = cluster.owner(sample[0])
+        if owner == cluster.WORKER_INDEX:
+            local.append(sample)
+        else:
+            remote.setdefault(owner, []).append(sample)
+    # All or nothing: a retry after a 503 must not duplicate what one
+    # owner already received, so every owner is checked before any send
+    for owner in remote:
+        if not bus.connected(owner):
+            raise HTTPException(status_code=503, detail=f"Worker {owner} is unavailable")
+    for owner, owned in remote.items():
+        bus.send(owner, "ingest", owned, droppable=False)
+    return local
+
+
+def owner_routed(endpoint):
+    """
+    Run a per-device endpoint on the worker that owns the device.
+    
+    Why: History and machine state exist only on the owning worker; the
+    others forward the call over the bus and return its answer.
+    """
+    @functools.wraps(endpoint)
+    async def routed(device_id: str, **params):
+        if bus and not cluster.is_local(device_id):
+            try:
+                return await bus.call(cluster.owner(device_id), endpoint.__name__,
+                                      {"device_id": device_id, **params})
+            except cluster.RemoteError as e:
+                raise HTTPException(status_code=e.status, detail=e.detail)
+        return await endpoint(device_id=device_id, **params)
+    
+    if bus:
+        bus.procedure(endpoint.__name__, endpoint)
+    return routed
+
+
+async def apply_relayed(message: Dict[str, Any]):
+    """Handle a broadcast relayed by another worker: update replicas, then fan out."""
+    updates = telemetry_updates(message)
+    if updates is not None:
+        storage.update_latest(updates)
+    elif message.get("type") == "device_status":
+        device = storage.get_device(message["device_id"])
+        if device:
+            device["status"] = message["status"]
+    await ws_manager.broadcast(message, relay=False)
+
+
+def submit_forwarded(samples: List[list]):
+    """Queue MQTT samples another worker received for devices this one owns."""
+    for device_id, telemetry, timestamp in samples:
+        if not ingestion_pipeline.submit(device_id, telemetry, timestamp):
+            print(f"[MQTT] Ingestion queue full, dropped sample from {device_id}")
+
+
+if bus:
+    bus.on("broadcast", apply_relayed)
+    bus.on("ingest", lambda samples: ingest_samples([tuple(sample) for sample in samples]))
+    bus.on("submit", submit_forwarded)
 
 
 # ==================== REST API ENDPOINTS ====================
 
-@app.post("/api/telemetry")
-async def receive_telemetry(payload: TelemetryPayload):
+@app.post("/api/telemetry", openapi_extra={"requestBody": {
+    "required": True,
+    "content": {"application/json": {"schema": TelemetryPayload.model_json_schema()}},
+}})
+async def receive_telemetry(request: Request):
     """
     Receive telemetry from any IoT device and infer machine state.
     
     This is the main ingestion endpoint. It:
     1. Auto-registers new devices
     2. Auto-discovers new telemetry keys
-    3. Infers machine state (RUNNING/IDLE/FAULT)
-    4. Stores latest values
-    5. Broadcasts to all WebSocket clients
+    3. Stores latest values
+    4. Broadcasts to all WebSocket clients
+    5. Checks numeric keys for anomalies (broadcast as an anomaly message)
+    6. Queues machine state inference (RUNNING/IDLE/FAULT), which is
+       broadcast separately as a state_update message
     """
-    device_id = payload.device_id
-    telemetry = payload.telemetry
+    try:
+        device_id, telemetry, timestamp = serialization.decode_record(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid telemetry payload: {e}")
+    
+    # Another worker's device: it stores and broadcasts the sample
+    if not forward_samples([(device_id, telemetry, timestamp)]):
+        return {"status": "success", "device_id": device_id}
     
     # Auto-register device if new
     storage.register_device(device_id)
@@ -339,32 +1011,86 @@ async def receive_telemetry(payload: TelemetryPayload):
     # Store telemetry
     storage.update_telemetry(device_id, telemetry)
     
-    # NEW: Infer machine state
-    telemetry_with_state = telemetry.copy()
-    if STATE_INFERENCE_ENABLED:
-        try:
-            state_info = inference_engine.update_telemetry(device_id, telemetry)
-            
-            # Add state to telemetry for broadcast
-            telemetry_with_state["_machine_state"] = state_info["state"]
-            telemetry_with_state["_state_confidence"] = state_info["confidence"]
-            telemetry_with_state["_state_reasons"] = state_info["reasons"]
-            
-            print(f"[STATE] {device_id}: {state_info['state']} ({state_info['confidence']}%)")
-        except Exception as e:
-            print(f"[ERROR] State inference failed for {device_id}: {e}")
-    
     # Broadcast to all connected dashboards
     await ws_manager.broadcast({
         "type": "telemetry_update",
         "device_id": device_id,
-        "telemetry": telemetry_with_state,
-        "timestamp": payload.timestamp or datetime.utcnow().isoformat()
+        "telemetry": telemetry,
+        "timestamp": timestamp or datetime.utcnow()
     })
     
+    # Check for anomalies, then infer machine state off the request path
+    await detect_anomalies([(device_id, telemetry)])
+    submit_inference(device_id, telemetry)
+    
     return {"status": "success", "device_id": device_id}
 
 
+# Largest number of records accepted in one batch request
+MAX_BATCH_ITEMS = 10000
+
+
+def _parse_batch_body(body: bytes, content_type: str) -> List[Any]:
+    """Split a batch body into raw records (JSON array or NDJSON)."""
+    if "ndjson" not in content_type and body.lstrip().startswith(b"["):
+        records = serialization.loads_payload(body)
+        if not isinstance(records, list):
+            raise ValueError("Expected a JSON array")
+        return records
+    
+    # NDJSON: one record per line; a bad line becomes a per-item error
+    body.decode("utf-8")  # Reject invalid UTF-8 up front, like the array path
+    records = []
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(serialization.loads_payload(line))
+        except ValueError as e:
+            records.append(ValueError(f"Invalid JSON: {e}"))
+    return records
+
+
+@app.post("/api/telemetry/batch")
+async def receive_telemetry_batch(request: Request):
+    """
+    Receive many telemetry payloads in one request (for gateways).
+    
+    Body is a JSON array of TelemetryPayload objects, or NDJSON (one per
+    line, Content-Type: application/x-ndjson). Valid records are stored,
+    broadcast as one telemetry_batch frame and queued for state inference.
+    Invalid records are reported by index without rejecting the rest.
+    """
+    try:
+        records = _parse_batch_body(await request.body(), request.headers.get("content-type", ""))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid batch body: {e}")
+    if len(records) > MAX_BATCH_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {MAX_BATCH_ITEMS} records")
+    
+    samples: List[tuple] = []
+    errors = []
+    for index, record in enumerate(records):
+        if isinstance(record, Exception):
+            errors.append({"index": index, "error": str(record)})
+            continue
+        try:
+            samples.append(serialization.convert_record(record))
+        except ValueError as e:
+            errors.append({"index": index, "error": str(e)})
+    
+    # Store everything in one pass, then broadcast once (other workers'
+    # devices are forwarded to them)
+    await ingest_samples(forward_samples(samples))
+    
+    return {
+        "status": "success" if not errors else ("partial" if samples else "failed"),
+        "accepted": len(samples),
+        "rejected": len(errors),
+        "errors": errors
+    }
+
+
 @app.get("/api/devices")
 async def get_devices():
     """
@@ -377,12 +1103,13 @@ async def get_devices():
 
 
 @app.get("/api/devices/{device_id}/state")
+@owner_routed
 async def get_device_state(device_id: str):
     """Get inferred machine state for a specific device."""
     if not STATE_INFERENCE_ENABLED:
         raise HTTPException(status_code=501, detail="State inference not enabled")
     
-    state_info = inference_engine.get_device_state(device_id)
+    state_info = (fleet_engine or inference_pool).get_device_state(device_id)
     
     if not state_info:
         raise HTTPException(status_code=404, detail="Device not found or no state data")
@@ -390,13 +1117,72 @@ async def get_device_state(device_id: str):
     return state_info
 
 
+@app.get("/api/devices/{device_id}/state/transitions")
+@owner_routed
+async def get_state_transitions(
+    device_id: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=10000),
+):
+    """
+    Debounced state transitions of a device, oldest first.
+    
+    start/end accept epoch seconds or ISO 8601 (naive = UTC); timestamps
+    are returned as UTC ISO strings. At most the newest `limit` are returned.
+    
+    Why: Timelines and audits need when a machine changed state, not every
+    per-sample inference.
+    """
+    if not STATE_INFERENCE_ENABLED:
+        raise HTTPException(status_code=501, detail="State inference not enabled")
+    log = (fleet_engine or inference_pool).transition_log(device_id)
+    transitions = log.transitions(device_id, parse_time(start, "start"),
+                                  parse_time(end, "end"), limit)
+    for entry in transitions:
+        entry["timestamp"] = datetime.utcfromtimestamp(entry["timestamp"]).isoformat()
+    return {"device_id": device_id, "transitions": transitions}
+
+
+@app.get("/api/devices/{device_id}/state/summary")
+@owner_routed
+async def get_state_summary(
+    device_id: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    performance: float = Query(1.0, ge=0, le=1, description="OEE performance factor"),
+    quality: float = Query(1.0, ge=0, le=1, description="OEE quality factor"),
+):
+    """
+    Time in each state, uptime and OEE over a range (end defaults to now).
+    
+    Computed from the transition log, so a month costs the same as a
+    minute and no raw telemetry is replayed.
+    """
+    if not STATE_INFERENCE_ENABLED:
+        raise HTTPException(status_code=501, detail="State inference not enabled")
+    log = (fleet_engine or inference_pool).transition_log(device_id)
+    if log.current(device_id) is None:
+        raise HTTPException(status_code=404, detail="Device not found or no state data")
+    return log.summary(device_id, parse_time(start, "start"), parse_time(end, "end"),
+                       performance, quality)
+
+
+def local_states() -> Dict[str, Any]:
+    """Machine states of the devices this worker owns."""
+    if not STATE_INFERENCE_ENABLED:
+        return {}
+    return (fleet_engine or inference_pool).get_all_states()
+
+
 @app.get("/api/states")
 async def get_all_states():
     """Get machine states for all devices."""
-    if not STATE_INFERENCE_ENABLED:
-        return {}
-    
-    return inference_engine.get_all_states()
+    states = local_states()
+    if bus:
+        for worker_states in await bus.call_all("local_states", {}):
+            states.update(worker_states)
+    return states
 
 
 
@@ -434,11 +1220,128 @@ async def get_device_keys(device_id: str):
     return {"device_id": device_id, "keys": device["telemetry_keys"]}
 
 
+def parse_time(value: Optional[Union[str, float]], name: str) -> Optional[float]:
+    """Parse epoch seconds or ISO 8601 (naive = UTC) into epoch seconds."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
 @app.get("/api/devices/{device_id}/history/{key}")
-async def get_telemetry_history(device_id: str, key: str):
-    """Get historical data for a specific telemetry key (for charts)."""
-    history = storage.get_history(device_id, key)
-    return {"device_id": device_id, "key": key, "history": history}
+@owner_routed
+async def get_telemetry_history(
+    device_id: str,
+    key: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    max_points: Optional[int] = Query(None, ge=3, le=10000),
+    method: str = Query("minmax", pattern="^(minmax|lttb)$"),
+):
+    """
+    Get historical data for a specific telemetry key (for charts).
+    
+    Without parameters this returns the last ≤100 raw points. With `start`,
+    `end` (epoch seconds or ISO 8601) and/or `max_points`, long ranges are
+    reduced server-side to min/max/avg buckets or LTTB-selected points.
+    """
+    if start is None and end is None and max_points is None:
+        history = storage.get_history(device_id, key)
+        return {"device_id": device_id, "key": key, "history": history}
+    
+    await storage.ensure_rollups(device_id, key)
+    result = storage.query_history(
+        device_id, key,
+        start=parse_time(start, "start"),
+        end=parse_time(end, "end"),
+        max_points=max_points or 500,
+        method=method,
+    )
+    return {"device_id": device_id, "key": key, **result}
+
+
+# Column -> array typecode for packed (base64) bulk history responses
+PACKED_COLUMNS = {"timestamps": "q", "values": "d", "min": "d", "max": "d", "count": "I"}
+
+
+def _pack_column(typecode: str, values: List) -> str:
+    """Base64 of a little-endian packed array."""
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+@app.post("/api/history/query")
+async def query_history_bulk(query: HistoryQuery):
+    """
+    Fetch many history series in one request.
+    
+    Each selector is a device_id/key with an optional start/end, a resolution
+    ("auto" picks raw or a rollup from max_points) and a reduction method.
+    Series come back as columns instead of per-point dicts:
+        {"device_id", "key", "resolution", "timestamps": [epoch ms],
+         "values": [...], "min"/"max"/"count": [...] (bucketed only)}
+    With encoding="base64" each column is a base64 string of packed
+    little-endian arrays: int64 timestamps, float64 values/min/max and
+    uint32 counts.
+    """
+    selectors = [selector.model_dump() for selector in query.series]
+    if not bus:
+        return {"encoding": query.encoding, "series": await query_series(selectors, query.encoding)}
+    
+    # Each owner answers for its devices; results keep the request order
+    by_owner: Dict[int, List[int]] = {}
+    for index, selector in enumerate(selectors):
+        by_owner.setdefault(cluster.owner(selector["device_id"]), []).append(index)
+    results: List[Any] = [None] * len(selectors)
+    for owner, indexes in by_owner.items():
+        owned = [selectors[i] for i in indexes]
+        if owner == cluster.WORKER_INDEX:
+            series = await query_series(owned, query.encoding)
+        else:
+            try:
+                series = await bus.call(owner, "query_series",
+                                        {"selectors": owned, "encoding": query.encoding})
+            except cluster.RemoteError as e:
+                raise HTTPException(status_code=e.status, detail=e.detail)
+        for i, result in zip(indexes, series):
+            results[i] = result
+    return {"encoding": query.encoding, "series": results}
+
+
+async def query_series(selectors: List[Dict[str, Any]], encoding: str) -> List[Dict[str, Any]]:
+    """Columns for each HistorySelector dict (see query_history_bulk)."""
+    results = []
+    for selector in selectors:
+        await storage.ensure_rollups(selector["device_id"], selector["key"])
+        columns = storage.query_columns(
+            selector["device_id"], selector["key"],
+            start=parse_time(selector["start"], "start"),
+            end=parse_time(selector["end"], "end"),
+            max_points=selector["max_points"],
+            method=selector["method"],
+            resolution=selector["resolution"],
+        )
+        columns["timestamps"] = [int(ts * 1000) for ts in columns["timestamps"]]
+        
+        if encoding == "base64":
+            numeric = all(is_number(v) for v in columns["values"])
+            for name, typecode in PACKED_COLUMNS.items():
+                if name in columns and (numeric or name != "values"):
+                    columns[name] = _pack_column(typecode, columns[name])
+        
+        results.append({"device_id": selector["device_id"], "key": selector["key"], **columns})
+    return results
 
 
 # ==================== WEBSOCKET ENDPOINT ====================
@@ -449,27 +1352,101 @@ async def websocket_endpoint(websocket: WebSocket):
     WebSocket endpoint for real-time data streaming.
     
     Why: Enables instant dashboard updates without polling.
-    Dashboard connects once and receives all telemetry updates.
+    Dashboard connects once and receives all telemetry updates, or only
+    the devices/keys it subscribes to. `?max_hz=5` (or a set_rate message)
+    conflates updates to at most that many merged deltas per second.
+    Clients that offer the `iot-telemetry.v1` subprotocol get compact
+    binary telemetry frames (ws_binary.py) instead of JSON.
     """
     await ws_manager.connect(websocket)
     
     try:
-        # Send initial state
+        max_hz = websocket.query_params.get("max_hz")
+        if max_hz:
+            ws_manager.handle_client_message(websocket, serialization.dumps({
+                "type": "set_rate",
+                "max_hz": max_hz
+            }))
+        
+        # Send initial state (machine states too: state_update only fires on changes)
         devices = storage.get_devices()
-        await websocket.send_text(json.dumps({
+        try:
+            states = await get_all_states()
+        except cluster.RemoteError as e:
+            print(f"[WARNING] Initial states incomplete: {e.detail}")
+            states = local_states()
+        ws_manager.send(websocket, {
             "type": "initial_state",
-            "devices": devices
-        }))
+            "devices": devices,
+            "states": states
+        })
         
-        # Keep connection alive and handle incoming messages
+        # Keep connection alive and handle subscribe/unsubscribe messages
         while True:
             data = await websocket.receive_text()
-            # Echo back for ping/pong if needed
+            ws_manager.handle_client_message(websocket, data)
             
     except WebSocketDisconnect:
+        pass
+    finally:
         ws_manager.disconnect(websocket)
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """Runtime metrics for the ingestion pipeline and WebSocket clients."""
+    return {
+        "serializer": serialization.BACKEND,
+        "non_finite_values": serialization.non_finite_values,
+        "ingestion": ingestion_pipeline.metrics(),
+        "websocket": ws_manager.metrics(),
+        "persistence": storage.persistence.metrics() if storage.persistence else None,
+        "inference": inference_pool.metrics() if inference_pool else None,
+        "fleet_inference": fleet_engine.metrics() if fleet_engine else None,
+        "anomaly": anomaly_detector.metrics() if anomaly_detector else None,
+        "mqtt_broker": embedded_broker.metrics() if embedded_broker else None,
+        "cluster": ({**bus.metrics(), "mqtt_forwarder": mqtt_forwarder.metrics() if mqtt_forwarder else None}
+                    if bus else None),
+    }
+
+
+@app.get("/api/anomalies")
+async def get_anomalies(device_id: Optional[str] = None, limit: int = Query(100, ge=1, le=1000)):
+    """Latest anomaly events (all devices, or one), newest last."""
+    if not anomaly_detector:
+        raise HTTPException(status_code=503, detail="Anomaly detection not available (requires NumPy)")
+    if not bus or (device_id and cluster.is_local(device_id)):
+        return {"events": anomaly_detector.get_recent(device_id, limit)}
+    if device_id:
+        return {"events": await bus.call(cluster.owner(device_id), "recent_anomalies",
+                                         {"device_id": device_id, "limit": limit})}
+    events = anomaly_detector.get_recent(None, limit)
+    for worker_events in await bus.call_all("recent_anomalies", {"device_id": None, "limit": limit}):
+        events.extend(worker_events)
+    events.sort(key=lambda event: event["timestamp"])
+    return {"events": events[-limit:]}
+
+
+@app.get("/api/rules")
+async def get_rules():
+    """Active state rule configuration."""
+    if not STATE_INFERENCE_ENABLED:
+        raise HTTPException(status_code=503, detail="State inference not available")
+    return inference_engine.rules.describe()
+
+
+@app.post("/api/rules/reload")
+async def reload_rules():
+    """Reload the rules file now instead of waiting for the watcher."""
+    if not STATE_INFERENCE_ENABLED:
+        raise HTTPException(status_code=503, detail="State inference not available")
+    rules = inference_engine.rules
+    rules.watch(rules.path or RULES_PATH)
+    if rules.last_error:
+        raise HTTPException(status_code=422, detail=rules.last_error)
+    return rules.describe()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -481,6 +1458,14 @@ async def root():
     }
 
 
+# Fleet-wide queries other workers answer for their own devices
+if bus:
+    bus.procedure("local_states", local_states)
+    bus.procedure("query_series", query_series)
+    if anomaly_detector:
+        bus.procedure("recent_anomalies", anomaly_detector.get_recent)
+
+
 # ==================== BACKGROUND TASKS ====================
 
 @app.on_event("startup")
@@ -489,11 +1474,93 @@ async def startup_event():
     # Set the event loop for MQTT manager first
     await set_mqtt_loop()
     
-    # Start MQTT listener
-    mqtt_manager.start()
+    # Join the other workers (multi-worker mode)
+    if bus:
+        await bus.start()
+    
+    # Start MQTT listener (or the embedded broker on this loop)
+    if embedded_broker:
+        await embedded_broker.serve()
+    else:
+        mqtt_manager.start()
     
     # Start device status checker
     asyncio.create_task(check_device_status())
+    
+    # Periodically make persisted telemetry durable; rebuild rollups from
+    # disk in the background so range queries after a restart do not wait
+    if storage.persistence:
+        asyncio.create_task(sync_persistence())
+        asyncio.create_task(storage.backfill_rollups())
+    
+    # Start state inference workers (or the fleet-wide tick)
+    if inference_pool:
+        inference_pool.start(asyncio.get_running_loop())
+    if fleet_engine:
+        asyncio.create_task(run_fleet_inference(FLEET_TICK))
+    if STATE_INFERENCE_ENABLED:
+        asyncio.create_task(watch_rules())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop inference workers and checkpoint persistence so the next start replays only small tails."""
+    if inference_pool:
+        inference_pool.stop()
+    if embedded_broker:
+        embedded_broker.close()
+    if bus:
+        bus.close()
+    if storage.persistence:
+        await asyncio.to_thread(storage.persistence.close)
+
+
+async def sync_persistence(interval: float = 1.0):
+    """
+    Background task to flush the persistence WAL to disk.
+    
+    Why: fsync per sample is far too slow; at most `interval` seconds
+    of telemetry can be lost on power failure. The fsyncs, segment sealing
+    and checkpoints run on a worker thread so they never stall the loop.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(storage.persistence.sync)
+        except Exception as e:
+            print(f"[ERROR] Persistence sync failed: {e}")
+
+
+async def watch_rules(interval: float = 2.0):
+    """
+    Background task to pick up edits to the rules file.
+    
+    Why: Thresholds get tuned on a running plant; a stat() every few
+    seconds is cheaper than a file-watcher dependency.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            inference_engine.rules.reload_if_changed()
+        except Exception as e:
+            print(f"[ERROR] Rules reload failed: {e}")
+
+
+async def run_fleet_inference(interval: float):
+    """
+    Background task to evaluate every device's state once per tick.
+    
+    Why: Vectorized over the whole fleet, inference costs a few array
+    operations per tick instead of a Python rule pass per sample.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            transitions = fleet_engine.tick(explain=True)
+        except Exception as e:
+            print(f"[ERROR] Fleet inference failed: {e}")
+            continue
+        await publish_states(transitions)
 
 
 async def check_device_status():
@@ -509,6 +1576,9 @@ async def check_device_status():
         now = datetime.utcnow()
         
         for device_id, device in storage.devices.items():
+            if bus and not cluster.is_local(device_id):
+                continue  # The owning worker decides and relays the change
+            
             last_seen = datetime.fromisoformat(device["last_seen"])
             seconds_since = (now - last_seen).total_seconds()
             
@@ -0,0 +1,148 @@
+"""
+Rolling Window Statistics
+O(1) amortized mean / variance / min / max / trend over the last N samples.
+
+Sums are kept exactly as scaled Python integers (every finite float is an
+integer times a power of two), so mean() and variance() return exactly what
+statistics.mean() and statistics.variance() return for the same window,
+including their int/float result type. Min and max use monotonic deques.
+"""
+import math
+import statistics
+from collections import deque
+from typing import Any, Iterator
+
+
+def _ratio(value) -> tuple:
+    """(numerator, log2(denominator)) of an int or finite float."""
+    n, d = value.as_integer_ratio()
+    return n, d.bit_length() - 1
+
+
+def _is_exact(value: Any) -> bool:
+    """Numbers we can sum exactly: ints and finite floats."""
+    if isinstance(value, int):
+        return True
+    return isinstance(value, float) and math.isfinite(value)
+
+
+class RollingWindow:
+    """
+    The last `size` samples of one telemetry key with incremental stats.
+
+    Why: Recomputing statistics.mean/variance and min/max over the whole
+    buffer on every sample dominated inference CPU at high sample rates.
+    """
+
+    __slots__ = ("size", "values", "_seq", "_shift", "_sum", "_sumsq",
+                 "_floats", "_special", "_mins", "_maxs")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque = deque()
+        self._seq = 0       # Sequence number of the next sample
+        self._shift = 0     # Sums are scaled by 2**_shift (2**(2*_shift) for squares)
+        self._sum = 0
+        self._sumsq = 0
+        self._floats = 0    # Non-int samples in the window (result type follows statistics)
+        self._special = 0   # NaN/inf/non-numeric samples: fall back to statistics
+        self._mins: deque = deque()  # (seq, value), increasing values
+        self._maxs: deque = deque()  # (seq, value), decreasing values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def append(self, value):
+        """Add a sample, evicting the oldest once the window is full."""
+        if len(self.values) >= self.size:
+            self._remove(self.values.popleft())
+        self.values.append(value)
+        seq = self._seq
+        self._seq += 1
+
+        if not _is_exact(value):
+            self._special += 1
+            return
+        if not isinstance(value, int):
+            self._floats += 1
+
+        n, k = _ratio(value)
+        if k > self._shift:
+            grow = k - self._shift
+            self._sum <<= grow
+            self._sumsq <<= 2 * grow
+            self._shift = k
+        scaled = n << (self._shift - k)
+        self._sum += scaled
+        self._sumsq += scaled * scaled
+
+        # Keep the earliest of equal values at the front, like min()/max()
+        mins = self._mins
+        while mins and mins[-1][1] > value:
+            mins.pop()
+        mins.append((seq, value))
+        maxs = self._maxs
+        while maxs and maxs[-1][1] < value:
+            maxs.pop()
+        maxs.append((seq, value))
+
+    def _remove(self, value):
+        if not _is_exact(value):
+            self._special -= 1
+            return
+        if not isinstance(value, int):
+            self._floats -= 1
+        n, k = _ratio(value)
+        scaled = n << (self._shift - k)
+        self._sum -= scaled
+        self._sumsq -= scaled * scaled
+
+        # The evicted sample was the oldest, so it can only sit at the front
+        evicted = self._seq - len(self.values) - 1
+        if self._mins and self._mins[0][0] == evicted:
+            self._mins.popleft()
+        if self._maxs and self._maxs[0][0] == evicted:
+            self._maxs.popleft()
+
+    def mean(self):
+        """Same value and type as statistics.mean(window)."""
+        if self._special or not self.values:
+            return statistics.mean(self.values)
+        denom = len(self.values) << self._shift
+        if not self._floats and self._sum % denom == 0:
+            return self._sum // denom
+        return self._sum / denom
+
+    def variance(self):
+        """Same value and type as statistics.variance(window) (sample variance)."""
+        n = len(self.values)
+        if self._special or n < 2:
+            return statistics.variance(self.values)
+        num = n * self._sumsq - self._sum * self._sum
+        denom = (n * (n - 1)) << (2 * self._shift)
+        if not self._floats and num % denom == 0:
+            return num // denom
+        return num / denom
+
+    def min(self):
+        """Same as min(window)."""
+        if self._special or not self._mins:
+            return min(self.values)
+        return self._mins[0][1]
+
+    def max(self):
+        """Same as max(window)."""
+        if self._special or not self._maxs:
+            return max(self.values)
+        return self._maxs[0][1]
+
+    def trend(self) -> str:
+        """"up", "down" or "stable" comparing the newest sample to the oldest."""
+        first, last = self.values[0], self.values[-1]
+        return "up" if last > first else "down" if last < first else "stable"
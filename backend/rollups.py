@@ -0,0 +1,222 @@
+"""
+Incremental Rollups
+Pre-aggregated 1 s / 1 min / 1 h buckets (count, sum, min, max) per series.
+
+Every numeric sample updates the current bucket of each resolution in O(1),
+so a range query picks a resolution and reads a few hundred buckets instead
+of scanning raw samples.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from math import ceil
+from typing import Dict, List, Optional, Tuple
+
+# (label, bucket width in seconds), finest first
+RESOLUTIONS: Tuple[Tuple[str, int], ...] = (("1s", 1), ("1m", 60), ("1h", 3600))
+
+# Buckets kept per resolution: 10 minutes of 1 s, 1 day of 1 min, 30 days of 1 h.
+# Worst case per series is ~(600 + 1440 + 720) * 36 bytes ≈ 100 KB.
+DEFAULT_RETENTION: Dict[str, int] = {"1s": 600, "1m": 1440, "1h": 720}
+
+
+class _Level:
+    """Sorted bucket columns for one series at one resolution."""
+
+    __slots__ = ("label", "width", "capacity", "starts", "counts", "sums", "mins", "maxs", "trimmed")
+
+    def __init__(self, label: str, width: int, capacity: int):
+        self.label = label
+        self.width = width
+        self.capacity = capacity
+        self.starts = array("d")
+        self.counts = array("I")
+        self.sums = array("d")
+        self.mins = array("d")
+        self.maxs = array("d")
+        self.trimmed = False  # True once old buckets have been evicted
+
+    def add(self, ts: float, count: int, total: float, low: float, high: float):
+        """Fold an aggregate (a single sample is (1, v, v, v)) into its bucket."""
+        start = ts - ts % self.width
+        starts = self.starts
+        if starts and start == starts[-1]:
+            idx = len(starts) - 1
+        elif not starts or start > starts[-1]:
+            idx = self._insert(len(starts), start)
+        else:
+            # Late sample: update its bucket if still retained
+            idx = bisect_left(starts, start)
+            if starts[idx] != start:
+                if idx == 0 and len(starts) >= self.capacity:
+                    return
+                idx = self._insert(idx, start)
+        if idx < 0:
+            return
+
+        self.counts[idx] += count
+        self.sums[idx] += total
+        if low < self.mins[idx]:
+            self.mins[idx] = low
+        if high > self.maxs[idx]:
+            self.maxs[idx] = high
+
+    def _insert(self, idx: int, start: float) -> int:
+        """Insert an empty bucket; returns its index after any trimming (<0 if evicted)."""
+        self.starts.insert(idx, start)
+        self.counts.insert(idx, 0)
+        self.sums.insert(idx, 0.0)
+        self.mins.insert(idx, float("inf"))
+        self.maxs.insert(idx, float("-inf"))
+        # Trim in chunks so eviction is amortized O(1) per bucket
+        excess = len(self.starts) - self.capacity
+        if excess > self.capacity >> 2:
+            for column in (self.starts, self.counts, self.sums, self.mins, self.maxs):
+                del column[:excess]
+            self.trimmed = True
+            idx -= excess
+        return idx
+
+    def span(self, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        """Index range of buckets overlapping [start, end]."""
+        i = bisect_left(self.starts, start - start % self.width) if start is not None else 0
+        j = bisect_right(self.starts, end) if end is not None else len(self.starts)
+        return i, j
+
+    def covers(self, start: Optional[float]) -> bool:
+        """True if this level still holds buckets back to `start`."""
+        if not self.starts:
+            return False
+        if not self.trimmed:
+            return True
+        return start is not None and self.starts[0] <= start
+
+    def buckets(self, i: int, j: int, group: int = 1) -> List[dict]:
+        """Buckets i..j as dicts, merging `group` consecutive buckets each."""
+        out = []
+        for g in range(i, j, group):
+            h = min(g + group, j)
+            count = sum(self.counts[g:h])
+            out.append({
+                "timestamp": self.starts[g],
+                "count": count,
+                "avg": sum(self.sums[g:h]) / count,
+                "min": min(self.mins[g:h]),
+                "max": max(self.maxs[g:h]),
+            })
+        return out
+
+
+class RollupStore:
+    """
+    Rollups for every (device_id, key) numeric series.
+
+    Why: Charting a week of 10 Hz data from raw samples means decoding
+    millions of points per request. Rollups make the cost proportional to
+    the number of points drawn.
+    """
+
+    def __init__(self, retention: Optional[Dict[str, int]] = None):
+        self.retention = dict(DEFAULT_RETENTION, **(retention or {}))
+        # (device_id, key) -> levels, finest first
+        self.series: Dict[Tuple[str, str], List[_Level]] = {}
+        # Series whose older history has been folded in from persistence
+        self.backfilled = set()
+        # (device_id, key) -> timestamp of the first sample added live
+        self.first_seen: Dict[Tuple[str, str], float] = {}
+
+    def horizon(self) -> float:
+        """Seconds of history the coarsest resolution retains."""
+        label, width = RESOLUTIONS[-1]
+        return width * self.retention[label]
+
+    def _new_levels(self) -> List[_Level]:
+        return [_Level(label, width, self.retention[label]) for label, width in RESOLUTIONS]
+
+    def _levels(self, device_id: str, key: str) -> List[_Level]:
+        levels = self.series.get((device_id, key))
+        if levels is None:
+            levels = self.series[(device_id, key)] = self._new_levels()
+        return levels
+
+    def add(self, device_id: str, key: str, ts: float, value: float):
+        """Update every resolution with one sample."""
+        if self.first_seen.get((device_id, key)) is None:
+            self.first_seen[(device_id, key)] = ts
+        for level in self._levels(device_id, key):
+            level.add(ts, 1, value, value, value)
+
+    def build(self, points: List[Tuple[float, float]]) -> List[_Level]:
+        """
+        Levels holding only `points` (e.g. history read back from disk).
+
+        Touches no shared state, so it can run on a worker thread.
+        """
+        levels = self._new_levels()
+        for ts, value in points:
+            for level in levels:
+                level.add(ts, 1, value, value, value)
+        return levels
+
+    def backfill(self, device_id: str, key: str, levels: List[_Level]):
+        """
+        Install levels from build() for older samples.
+
+        Re-applies the live buckets on top, so it is safe to call while
+        samples keep arriving.
+        """
+        live = self.series.get((device_id, key))
+        if live:
+            for level, old in zip(levels, live):
+                for b in range(len(old.starts)):
+                    level.add(old.starts[b], old.counts[b], old.sums[b], old.mins[b], old.maxs[b])
+        self.series[(device_id, key)] = levels
+        self.backfilled.add((device_id, key))
+
+    def count(self, device_id: str, key: str, start: Optional[float],
+              end: Optional[float]) -> Optional[int]:
+        """Number of raw samples in [start, end] (None if the series is unknown)."""
+        levels = self.series.get((device_id, key))
+        if not levels:
+            return None
+        level = next((lvl for lvl in levels if lvl.covers(start)), levels[-1])
+        i, j = level.span(start, end)
+        return sum(level.counts[i:j])
+
+    def query(self, device_id: str, key: str, start: Optional[float], end: Optional[float],
+              max_points: int) -> Optional[Tuple[str, List[dict]]]:
+        """
+        Pick the finest resolution that fits `max_points` buckets.
+
+        Returns (resolution label, buckets), or None if the series has no
+        rollups. When even hourly buckets do not fit they are merged further.
+        """
+        levels = self.series.get((device_id, key))
+        if not levels:
+            return None
+        for level in levels:
+            if level is not levels[-1] and not level.covers(start):
+                continue  # Older part of the range already evicted here
+            i, j = level.span(start, end)
+            if j - i <= max_points:
+                return level.label, level.buckets(i, j)
+        coarsest = levels[-1]
+        i, j = coarsest.span(start, end)
+        group = ceil((j - i) / max_points)
+        return f"{coarsest.width * group}s", coarsest.buckets(i, j, group)
+
+    def query_level(self, device_id: str, key: str, label: str, start: Optional[float],
+                    end: Optional[float]) -> Optional[List[dict]]:
+        """Buckets in [start, end] at one named resolution ("1s", "1m", "1h")."""
+        levels = self.series.get((device_id, key))
+        if not levels:
+            return None
+        for level in levels:
+            if level.label == label:
+                return level.buckets(*level.span(start, end))
+        raise ValueError(f"Unknown resolution: {label}")
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by bucket columns."""
+        per_bucket = 8 + 4 + 8 + 8 + 8
+        return sum(len(level.starts) * per_bucket
+                   for levels in self.series.values() for level in levels)
@@ -0,0 +1,466 @@
+"""
+Declarative State Rules
+Per-device-type fault/activity rules loaded from JSON (or YAML) and
+compiled into closures.
+
+A rule set looks like:
+
+    {
+      "device_types": {
+        "pump": {
+          "match": ["PUMP_*"],                  # device_id globs, first type wins
+          "fault_threshold": 0.7,               # fault score above this -> FAULT
+          "running_above": 0.6,                 # activity above this -> RUNNING
+          "idle_below": 0.3,                    # activity below this -> IDLE
+          "fault": [
+            {"key": "temperature", "cases": [
+              {"op": ">", "value": 95, "score": 0.4, "reason": "Temperature critical: {value:.1f}°C"}
+            ]},
+            {"key": "current", "min_history": 4, "cases": [
+              {"op": ">", "deviation": true, "mean_factor": 1.5, "score": 0.3,
+               "reason": "Abnormal current: {value:.2f}A"}
+            ]}
+          ],
+          "activity": [
+            {"keys": ["flow", "pressure"], "source": "variance", "min_history": 4, "weight": 0.3,
+             "cases": [{"op": ">", "value": 2.0, "score": 0.3, "reason": "High data variance: {value:.1f}"}]}
+          ]
+        }
+      }
+    }
+
+Rule fields:
+    key / keys    telemetry key; with "keys" the first one present is used
+    source        "sample" (the current value, default), "mean" or "variance"
+                  (rolling statistics of the key's history)
+    min_history   samples of history the key needs before the rule applies
+    weight        activity rules only: added to the maximum activity score
+                  whenever the rule applies
+    cases         checked in order, the first matching case fires:
+                    op           >, >=, <, <=, ==, != (omit to always match)
+                    value        constant threshold, or
+                    mean_factor  threshold = rolling mean * factor
+                    deviation    compare |value - mean| instead of value
+                    score        added to the fault/activity score
+                    reason       str.format template ({value}, {mean}, {threshold})
+
+A type named "default" replaces the built-in rules (built from the
+engine's thresholds) for devices no other type matches.
+"""
+import json
+import operator
+import os
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import yaml  # Optional: only needed for .yaml/.yml rule files
+except ImportError:
+    yaml = None
+
+# A rules file failing with one of these leaves the current rules active
+_LOAD_ERRORS = (OSError, ValueError, KeyError, TypeError) + ((yaml.YAMLError,) if yaml else ())
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    ">": operator.gt, ">=": operator.ge, "<": operator.lt,
+    "<=": operator.le, "==": operator.eq, "!=": operator.ne,
+}
+SOURCES = ("sample", "mean", "variance")
+
+UNKNOWN_REASONS = ["Insufficient data for confident state inference"]
+NOMINAL_REASONS = ["Nominal operation"]
+
+
+def builtin_ruleset(thresholds: Dict[str, float]) -> Dict[str, Any]:
+    """The original hard-coded fault/activity rules, as a rule-set spec."""
+    return {
+        "fault_threshold": 0.7,
+        "running_above": 0.6,
+        "idle_below": 0.3,
+        "fault": [
+            {"key": "temperature", "cases": [
+                {"op": ">", "value": thresholds["temperature_max"], "score": 0.4,
+                 "reason": "Temperature critical: {value:.1f}°C"},
+                {"op": "<", "value": thresholds["temperature_min"], "score": 0.3,
+                 "reason": "Temperature too low: {value:.1f}°C"},
+            ]},
+            {"key": "vibration", "min_history": 4, "cases": [
+                {"op": ">", "mean_factor": 2, "score": 0.4, "reason": "Abnormal vibration: {value:.1f}"},
+            ]},
+            {"key": "current", "min_history": 4, "cases": [
+                {"op": ">", "deviation": True, "mean_factor": 1.5, "score": 0.3,
+                 "reason": "Abnormal current: {value:.2f}A"},
+            ]},
+            {"key": "battery", "cases": [
+                {"op": "<", "value": 10, "score": 0.2, "reason": "Battery critical: {value:.0f}%"},
+            ]},
+            {"key": "rssi", "cases": [
+                {"op": "<", "value": -90, "score": 0.1, "reason": "Weak signal: {value} dBm"},
+            ]},
+        ],
+        "activity": [
+            {"key": "current", "weight": 0.4, "cases": [
+                {"op": ">", "value": thresholds["current_running"], "score": 0.4,
+                 "reason": "High current draw: {value:.2f}A"},
+                {"op": "<", "value": thresholds["current_idle"], "reason": "Low current draw: {value:.2f}A"},
+            ]},
+            {"key": "vibration", "weight": 0.3, "cases": [
+                {"op": ">", "value": thresholds["vibration_max"], "score": 0.3,
+                 "reason": "High vibration: {value:.1f}"},
+                {"op": "<", "value": thresholds["vibration_idle"], "reason": "Low vibration: {value:.1f}"},
+                {"score": 0.15},
+            ]},
+            {"keys": ["sensor_data", "distance"], "source": "variance", "min_history": 4, "weight": 0.3,
+             "cases": [
+                {"op": ">", "value": thresholds["variance_threshold"], "score": 0.3,
+                 "reason": "High data variance: {value:.1f}"},
+            ]},
+        ],
+    }
+
+
+def _rule_keys(rule: Dict[str, Any]) -> List[str]:
+    keys = rule.get("keys") or ([rule["key"]] if "key" in rule else [])
+    if not keys or not all(isinstance(k, str) for k in keys):
+        raise ValueError(f"Rule needs 'key' or 'keys': {rule}")
+    return keys
+
+
+def validate_ruleset(spec: Dict[str, Any]):
+    """Raise ValueError if a rule-set spec is malformed."""
+    for section in ("fault", "activity"):
+        for rule in spec.get(section, []):
+            _rule_keys(rule)
+            if rule.get("source", "sample") not in SOURCES:
+                raise ValueError(f"Unknown source {rule.get('source')!r} (expected {SOURCES})")
+            for case in rule.get("cases", []):
+                if "op" in case and case["op"] not in OPERATORS:
+                    raise ValueError(f"Unknown op {case['op']!r}")
+                if "op" in case and ("value" in case) == ("mean_factor" in case):
+                    raise ValueError(f"Case needs exactly one of 'value' / 'mean_factor': {case}")
+                uses_mean = "mean_factor" in case or case.get("deviation")
+                if uses_mean and rule.get("source", "sample") == "sample" \
+                        and int(rule.get("min_history", 0)) < 1:
+                    raise ValueError(f"Mean-based case needs min_history >= 1: {rule}")
+
+
+# ---------- compiled path ----------
+
+# rule(telemetry, history, reasons) -> score, or None when the rule does not apply
+CompiledRule = Callable[[Dict[str, Any], Dict[str, Any], List[str]], Optional[float]]
+
+
+def _compile_case(case: Dict[str, Any]) -> Callable[[Any, Any, List[str]], Optional[float]]:
+    """case(value, window, reasons) -> score if the case fires, else None."""
+    score = float(case.get("score", 0.0))
+    reason = case.get("reason")
+    if "op" not in case:
+        def always(value, window, reasons):
+            if reason is not None:
+                reasons.append(reason.format(value=value, mean=None, threshold=None))
+            return score
+        return always
+
+    op = OPERATORS[case["op"]]
+    deviation = bool(case.get("deviation"))
+    if "mean_factor" in case:
+        factor = case["mean_factor"]
+
+        def relative(value, window, reasons):
+            mean = window.mean()
+            threshold = mean * factor
+            if op(abs(value - mean) if deviation else value, threshold):
+                if reason is not None:
+                    reasons.append(reason.format(value=value, mean=mean, threshold=threshold))
+                return score
+            return None
+        return relative
+
+    threshold = case["value"]
+    if deviation:
+        def deviates(value, window, reasons):
+            mean = window.mean()
+            if op(abs(value - mean), threshold):
+                if reason is not None:
+                    reasons.append(reason.format(value=value, mean=mean, threshold=threshold))
+                return score
+            return None
+        return deviates
+
+    def constant(value, window, reasons):
+        if op(value, threshold):
+            if reason is not None:
+                reasons.append(reason.format(value=value, mean=None, threshold=threshold))
+            return score
+        return None
+    return constant
+
+
+def _compile_rule(rule: Dict[str, Any]) -> CompiledRule:
+    keys = _rule_keys(rule)
+    source = rule.get("source", "sample")
+    min_history = int(rule.get("min_history", 0))
+    cases = tuple(_compile_case(case) for case in rule.get("cases", []))
+
+    def fire(value, window, reasons) -> float:
+        for case in cases:
+            score = case(value, window, reasons)
+            if score is not None:
+                return score
+        return 0.0
+
+    if source == "sample":
+        key = keys[0]
+
+        def sample_rule(telemetry, history, reasons):
+            value = telemetry.get(key)
+            if value is None:  # Missing, or a NaN reading (serialization.loads_payload)
+                return None
+            window = history.get(key)
+            if min_history and (window is None or len(window) < min_history):
+                return None
+            return fire(value, window, reasons)
+        return sample_rule
+
+    stat = source  # "mean" or "variance", read from the first key with history
+
+    def stat_rule(telemetry, history, reasons):
+        for key in keys:
+            window = history.get(key)
+            if window is not None:
+                break
+        else:
+            return None
+        if len(window) < max(min_history, 2 if stat == "variance" else 1):
+            return None
+        return fire(getattr(window, stat)(), window, reasons)
+    return stat_rule
+
+
+class CompiledRuleSet:
+    """
+    A rule set compiled to closures.
+
+    Why: The spec is walked once at load time; per sample only the bound
+    closures run, with keys, operators and thresholds already resolved.
+    """
+
+    def __init__(self, name: str, spec: Dict[str, Any]):
+        validate_ruleset(spec)
+        self.name = name
+        self.spec = spec
+        self.fault_threshold = spec.get("fault_threshold", 0.7)
+        self.running_above = spec.get("running_above", 0.6)
+        self.idle_below = spec.get("idle_below", 0.3)
+        self.fault_rules = tuple(_compile_rule(rule) for rule in spec.get("fault", []))
+        self.activity_rules = tuple(
+            (_compile_rule(rule), rule.get("weight", 0.0)) for rule in spec.get("activity", [])
+        )
+
+    def __call__(self, telemetry: Dict[str, Any], history: Dict[str, Any]) -> Tuple[str, float, List[str]]:
+        """(state, confidence 0..1, reasons) for one sample."""
+        reasons: List[str] = []
+        fault_score = 0.0
+        for rule in self.fault_rules:
+            score = rule(telemetry, history, reasons)
+            if score:
+                fault_score += score
+        fault_score = min(fault_score, 1.0)
+        if fault_score > self.fault_threshold:
+            return "FAULT", fault_score, reasons
+
+        reasons = []
+        activity_score = 0.0
+        max_score = 0.0
+        for rule, weight in self.activity_rules:
+            score = rule(telemetry, history, reasons)
+            if score is None:
+                continue
+            if score:
+                activity_score += score
+            max_score += weight
+        return self._decide(activity_score, max_score, reasons)
+
+    def _decide(self, activity_score: float, max_score: float, reasons: List[str]) -> tuple:
+        if max_score > 0:
+            activity_score = activity_score / max_score
+        if activity_score > self.running_above:
+            return "RUNNING", activity_score, reasons or NOMINAL_REASONS[:]
+        if activity_score < self.idle_below:
+            return "IDLE", 1.0 - activity_score, reasons or NOMINAL_REASONS[:]
+        return "UNKNOWN", 0.5, UNKNOWN_REASONS[:]
+
+
+# ---------- interpreted path (reference / benchmark baseline) ----------
+
+def interpret(spec: Dict[str, Any], telemetry: Dict[str, Any], history: Dict[str, Any]) -> tuple:
+    """Evaluate a rule-set spec by walking it directly; same result as CompiledRuleSet."""
+
+    def run(rule, reasons):
+        keys = rule.get("keys") or [rule["key"]]
+        source = rule.get("source", "sample")
+        if source == "sample":
+            if keys[0] not in telemetry:
+                return None
+            value = telemetry[keys[0]]
+            window = history.get(keys[0])
+            if rule.get("min_history", 0) and (window is None or len(window) < rule["min_history"]):
+                return None
+        else:
+            window = next((history[k] for k in keys if k in history), None)
+            if window is None or len(window) < max(rule.get("min_history", 0),
+                                                   2 if source == "variance" else 1):
+                return None
+            value = getattr(window, source)()
+        for case in rule.get("cases", []):
+            if "op" not in case:
+                mean = threshold = None
+                fired = True
+            else:
+                mean = window.mean() if ("mean_factor" in case or case.get("deviation")) else None
+                threshold = mean * case["mean_factor"] if "mean_factor" in case else case["value"]
+                lhs = abs(value - mean) if case.get("deviation") else value
+                fired = OPERATORS[case["op"]](lhs, threshold)
+            if fired:
+                if case.get("reason") is not None:
+                    reasons.append(case["reason"].format(value=value, mean=mean, threshold=threshold))
+                return float(case.get("score", 0.0))
+        return 0.0
+
+    reasons: List[str] = []
+    fault_score = 0.0
+    for rule in spec.get("fault", []):
+        score = run(rule, reasons)
+        if score:
+            fault_score += score
+    fault_score = min(fault_score, 1.0)
+    if fault_score > spec.get("fault_threshold", 0.7):
+        return "FAULT", fault_score, reasons
+
+    reasons = []
+    activity_score = max_score = 0.0
+    for rule in spec.get("activity", []):
+        score = run(rule, reasons)
+        if score is None:
+            continue
+        if score:
+            activity_score += score
+        max_score += rule.get("weight", 0.0)
+    if max_score > 0:
+        activity_score = activity_score / max_score
+    if activity_score > spec.get("running_above", 0.6):
+        return "RUNNING", activity_score, reasons or NOMINAL_REASONS[:]
+    if activity_score < spec.get("idle_below", 0.3):
+        return "IDLE", 1.0 - activity_score, reasons or NOMINAL_REASONS[:]
+    return "UNKNOWN", 0.5, UNKNOWN_REASONS[:]
+
+
+# ---------- registry with hot reload ----------
+
+def load_spec(path: str) -> Dict[str, Any]:
+    """Read a rules file (.json, or .yaml/.yml when PyYAML is installed)."""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ValueError("PyYAML is required for YAML rule files")
+            spec = yaml.safe_load(f) or {}
+        else:
+            spec = json.load(f)
+    if not isinstance(spec, dict) or not isinstance(spec.get("device_types", {}), dict):
+        raise ValueError("Rules file must be an object with a 'device_types' mapping")
+    return spec
+
+
+class RuleRegistry:
+    """
+    Device type -> compiled rule set, reloaded when the rules file changes.
+
+    A reload compiles everything first and then swaps one tuple, so
+    inference threads see either the old or the new rules, never a mix.
+    A file that fails to parse or validate leaves the current rules active.
+    """
+
+    def __init__(self, builtin: Dict[str, Any], path: Optional[str] = None):
+        self.builtin = CompiledRuleSet("default", builtin)
+        self.path = path
+        self._mtime: Optional[float] = None
+        # (types [(name, globs, ruleset)], default ruleset, device cache)
+        self._active = ([], self.builtin, {})
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+        if path:
+            self.reload_if_changed()
+
+    def watch(self, path: str) -> bool:
+        """Use `path` as the rules file and load it if present."""
+        self.path = path
+        return self.reload_if_changed(force=True)
+
+    def reload_if_changed(self, force: bool = False) -> bool:
+        """Reload the rules file if its mtime changed (or `force`). Returns True on reload."""
+        if not self.path:
+            return False
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            if self._mtime is not None:
+                # File removed: back to the built-in rules
+                self._mtime = None
+                self._active = ([], self.builtin, {})
+                print("[RULES] Rules file removed, using built-in rules")
+                return True
+            return False
+        if mtime == self._mtime and not force:
+            return False
+        self._mtime = mtime
+        try:
+            self.load(load_spec(self.path))
+        except _LOAD_ERRORS as e:
+            self.last_error = str(e)
+            print(f"[RULES] Keeping current rules, failed to load {self.path}: {e}")
+            return False
+        return True
+
+    def load(self, spec: Dict[str, Any]):
+        """Compile and activate a {"device_types": {...}} spec."""
+        types = []
+        default = self.builtin
+        for name, type_spec in spec.get("device_types", {}).items():
+            ruleset = CompiledRuleSet(name, type_spec)
+            if name == "default":
+                default = ruleset
+            else:
+                types.append((name, tuple(type_spec.get("match", [])), ruleset))
+        self._active = (types, default, {})
+        self.reloads += 1
+        self.last_error = None
+        print(f"[RULES] Loaded {len(types)} device types"
+              f"{' + default override' if default is not self.builtin else ''}")
+
+    @property
+    def customized(self) -> bool:
+        """Whether any device may get rules other than the built-in set."""
+        types, default, _ = self._active
+        return bool(types) or default is not self.builtin
+
+    def for_device(self, device_id: Optional[str]) -> CompiledRuleSet:
+        """Rule set for a device (first matching type, else default)."""
+        types, default, cache = self._active
+        if device_id is None:
+            return default
+        ruleset = cache.get(device_id)
+        if ruleset is None:
+            ruleset = next((rs for _, globs, rs in types
+                            if any(fnmatchcase(device_id, g) for g in globs)), default)
+            cache[device_id] = ruleset
+        return ruleset
+
+    def describe(self) -> Dict[str, Any]:
+        types, default, _ = self._active
+        return {
+            "path": self.path,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+            "default": "file" if default is not self.builtin else "builtin",
+            "device_types": {name: list(globs) for name, globs, _ in types},
+        }
@@ -0,0 +1,234 @@
+"""
+Pluggable JSON Serialization
+One codec for MQTT/REST ingest, WebSocket frames and the worker bus.
+
+The fastest installed library is picked at import: orjson, then msgspec,
+then the stdlib json module. Whichever is used, dumps() returns bytes,
+loads() accepts bytes, str or a memoryview, and datetimes are serialized
+natively (ISO 8601), so callers can put datetime objects in messages
+instead of formatting them first.
+
+Telemetry payloads are decoded into typed structs. With msgspec the shape
+is validated by the decoder itself; without it the decoded dict is
+checked here. Either way malformed input raises ValueError. NaN and
+Infinity, which are not JSON but which Python's json.dumps (and so many
+device scripts) emit, are accepted in payloads and stored as None. They
+are never written: every backend encodes them as null.
+"""
+import json
+import math
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+try:
+    import orjson  # Optional: fastest generic encode/decode
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # Optional: typed telemetry decoding
+except ImportError:
+    msgspec = None
+
+
+def _default(obj: Any) -> Any:
+    """Types the stdlib encoder (and msgspec's enc_hook) do not handle."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "item"):  # numpy scalars
+        value = obj.item()
+        return value if not isinstance(value, float) or math.isfinite(value) else None
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_json_encoder = json.JSONEncoder(default=_default, separators=(",", ":"), allow_nan=False)
+
+
+def _finite(obj: Any) -> Any:
+    """obj with NaN/Infinity floats replaced by None (nested dicts and lists)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """
+    Encode with the stdlib json module, writing NaN/Infinity as null.
+
+    Why: json.dumps writes bare NaN by default, which JSON.parse in the
+    dashboard rejects. orjson and msgspec write null, so this matches them;
+    only a message that actually holds one is copied and encoded again.
+    """
+    try:
+        return _json_encoder.encode(obj).encode()
+    except ValueError as e:
+        if "Out of range float" not in str(e):
+            raise
+        return _json_encoder.encode(_finite(obj)).encode()
+
+if orjson is not None:
+    BACKEND = "orjson"
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as compact JSON bytes."""
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits; the stdlib encodes them
+            return _stdlib_dumps(obj)
+
+    def loads(data) -> Any:
+        """Decode JSON from bytes, str or memoryview."""
+        return orjson.loads(data)
+
+elif msgspec is not None:
+    BACKEND = "msgspec"
+    _encoder = msgspec.json.Encoder(enc_hook=_default)
+    _decoder = msgspec.json.Decoder()
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as compact JSON bytes."""
+        return _encoder.encode(obj)
+
+    def loads(data) -> Any:
+        """Decode JSON from bytes, str or memoryview."""
+        try:
+            return _decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from None
+
+else:
+    BACKEND = "json"
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as compact JSON bytes."""
+        return _stdlib_dumps(obj)
+
+    def loads(data) -> Any:
+        """Decode JSON from bytes, str or memoryview."""
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+# ==================== TYPED TELEMETRY ====================
+
+non_finite_values = 0  # NaN/Infinity read from payloads as None
+
+
+def _non_finite(name: str) -> None:
+    global non_finite_values
+    non_finite_values += 1
+    return None
+
+
+def loads_payload(data) -> Any:
+    """
+    Like loads(), but NaN/Infinity become None instead of an error.
+
+    Why: The stdlib json module accepted them before orjson/msgspec were
+    used, so devices that send them kept working. Only a payload the fast
+    decoder rejects is decoded a second time.
+    """
+    error = None
+    if BACKEND != "json":
+        try:
+            return loads(data)
+        except ValueError as e:
+            error = e
+    try:
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data,
+                          parse_constant=_non_finite)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(str(error or e)) from None
+
+
+if msgspec is not None:
+    class TelemetryMessage(msgspec.Struct):
+        """MQTT telemetry payload; the device id comes from the topic."""
+        telemetry: Dict[str, Any] = {}
+        timestamp: Any = None  # Any JSON value: devices send ISO strings or epochs
+
+    class TelemetryRecord(msgspec.Struct):
+        """One REST telemetry record (POST /api/telemetry, batch items)."""
+        device_id: str
+        telemetry: Dict[str, Any]
+        timestamp: Optional[str] = None
+
+    _message_decoder = msgspec.json.Decoder(TelemetryMessage)
+    _record_decoder = msgspec.json.Decoder(TelemetryRecord)
+
+    def decode_message(data) -> tuple:
+        """(telemetry, timestamp) from an MQTT telemetry payload."""
+        try:
+            message = _message_decoder.decode(data)
+        except msgspec.DecodeError:
+            message = _convert_lenient(data, TelemetryMessage)
+        return message.telemetry, message.timestamp
+
+    def decode_record(data) -> tuple:
+        """(device_id, telemetry, timestamp) from one JSON record."""
+        try:
+            record = _record_decoder.decode(data)
+        except msgspec.DecodeError:
+            record = _convert_lenient(data, TelemetryRecord)
+        return record.device_id, record.telemetry, record.timestamp
+
+    def _convert_lenient(data, struct: type):
+        """Retry a payload the typed decoder rejected, in case it holds NaN."""
+        obj = loads_payload(data)
+        try:
+            return msgspec.convert(obj, struct)
+        except msgspec.ValidationError as e:
+            raise ValueError(str(e)) from None
+
+    def convert_record(obj: Any) -> tuple:
+        """(device_id, telemetry, timestamp) from an already decoded record."""
+        try:
+            record = msgspec.convert(obj, TelemetryRecord)
+        except msgspec.ValidationError as e:
+            raise ValueError(str(e)) from None
+        return record.device_id, record.telemetry, record.timestamp
+
+else:
+    _TYPE_NAMES = {dict: "object", list: "array", str: "str", int: "int",
+                   float: "float", bool: "bool", type(None): "null"}
+
+    def _type_name(value: Any) -> str:
+        return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+    def _field(obj: Dict[str, Any], name: str, kind: type, required: bool = False):
+        if name not in obj:
+            if required:
+                raise ValueError(f"Object missing required field `{name}`")
+            return None
+        value = obj[name]
+        if not isinstance(value, kind) and not (value is None and kind is str and not required):
+            expected = "object" if kind is dict else "str"
+            raise ValueError(f"Expected `{expected}`, got `{_type_name(value)}` - at `$.{name}`")
+        return value
+
+    def _object(obj: Any) -> Dict[str, Any]:
+        if not isinstance(obj, dict):
+            raise ValueError(f"Expected `object`, got `{_type_name(obj)}`")
+        return obj
+
+    def decode_message(data) -> tuple:
+        """(telemetry, timestamp) from an MQTT telemetry payload."""
+        message = _object(loads_payload(data))
+        telemetry = _field(message, "telemetry", dict)
+        return ({} if telemetry is None else telemetry), message.get("timestamp")
+
+    def convert_record(obj: Any) -> tuple:
+        """(device_id, telemetry, timestamp) from an already decoded record."""
+        record = _object(obj)
+        return (_field(record, "device_id", str, required=True),
+                _field(record, "telemetry", dict, required=True),
+                _field(record, "timestamp", str))
+
+    def decode_record(data) -> tuple:
+        """(device_id, telemetry, timestamp) from one JSON record."""
+        return convert_record(loads_payload(data))
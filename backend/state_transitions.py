@@ -0,0 +1,199 @@
+"""
+Machine State Transitions
+Debounces per-sample inferred states and keeps a compact transition log.
+
+StateTracker turns a stream of raw states into committed transitions
+(hysteresis: a new state must repeat `confirm_samples` times and the
+current state must have lasted `min_dwell` seconds). TransitionLog stores
+one (timestamp, state) entry per transition, so time-in-state, uptime and
+OEE availability over any range come from the log, not raw telemetry.
+"""
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+# Compact state codes for the log
+STATE_NAMES = ("UNKNOWN", "RUNNING", "IDLE", "FAULT")
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+
+class _DeviceLog:
+    """Transition times and state codes of one device, oldest first."""
+
+    __slots__ = ("times", "states", "trimmed")
+
+    def __init__(self):
+        self.times = array("d")
+        self.states = array("b")
+        self.trimmed = False  # True once the oldest entries have been dropped
+
+
+class TransitionLog:
+    """
+    Per-device state transition log.
+
+    Why: A day of 1 Hz telemetry is 86k samples per device; a day of
+    transitions is usually a few dozen 9-byte entries.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.devices: Dict[str, _DeviceLog] = {}
+
+    def record(self, device_id: str, ts: float, state: str):
+        """Append a transition into `state` at epoch `ts`."""
+        log = self.devices.get(device_id)
+        if log is None:
+            log = self.devices[device_id] = _DeviceLog()
+        # States first: readers on other threads size by len(times)
+        log.states.append(STATE_CODES[state])
+        log.times.append(ts)
+        # Trim in chunks so eviction is amortized O(1) per entry
+        excess = len(log.times) - self.max_entries
+        if excess > self.max_entries >> 2:
+            del log.times[:excess]
+            del log.states[:excess]
+            log.trimmed = True
+
+    def current(self, device_id: str) -> Optional[Tuple[str, float]]:
+        """(state, since) of the latest transition."""
+        log = self.devices.get(device_id)
+        if not log or not log.times:
+            return None
+        return STATE_NAMES[log.states[len(log.times) - 1]], log.times[-1]
+
+    def transitions(self, device_id: str, start: Optional[float] = None,
+                    end: Optional[float] = None, limit: Optional[int] = None) -> List[Dict]:
+        """Transitions in [start, end], oldest first (the newest `limit` if given)."""
+        log = self.devices.get(device_id)
+        if not log:
+            return []
+        times, states = log.times, log.states
+        n = len(times)
+        i = bisect_left(times, start, 0, n) if start is not None else 0
+        j = bisect_right(times, end, 0, n) if end is not None else n
+        if limit is not None:
+            i = max(i, j - limit)
+        return [
+            {
+                "timestamp": times[k],
+                "state": STATE_NAMES[states[k]],
+                "previous_state": STATE_NAMES[states[k - 1]] if k else None,
+            }
+            for k in range(i, j)
+        ]
+
+    def time_in_state(self, device_id: str, start: Optional[float] = None,
+                      end: Optional[float] = None) -> Dict[str, float]:
+        """
+        Seconds spent in each state within [start, end].
+
+        The range is clipped to the log: time before the first retained
+        transition is unknown and not counted; the latest state runs until
+        `end` (default: now).
+        """
+        totals = {name: 0.0 for name in STATE_NAMES}
+        log = self.devices.get(device_id)
+        if not log:
+            return totals
+        times, states = log.times, log.states
+        n = len(times)
+        if not n:
+            return totals
+        end = time.time() if end is None else end
+        begin = times[0] if start is None else max(start, times[0])
+        if end <= begin:
+            return totals
+
+        # Entry in effect at `begin`, then every transition up to `end`
+        k = bisect_right(times, begin, 0, n) - 1
+        while k < n:
+            seg_start = max(times[k], begin)
+            seg_end = min(times[k + 1], end) if k + 1 < n else end
+            if seg_start >= end:
+                break
+            if seg_end > seg_start:
+                totals[STATE_NAMES[states[k]]] += seg_end - seg_start
+            k += 1
+        return totals
+
+    def summary(self, device_id: str, start: Optional[float] = None, end: Optional[float] = None,
+                performance: float = 1.0, quality: float = 1.0) -> Dict:
+        """
+        Time in state plus uptime and OEE over [start, end].
+
+        uptime       = time not in FAULT / observed time
+        availability = RUNNING time / observed time
+        oee          = availability * performance * quality
+        (performance and quality are not inferred from telemetry; callers
+        that track them pass them in.)
+        """
+        totals = self.time_in_state(device_id, start, end)
+        observed = sum(totals.values())
+        availability = totals["RUNNING"] / observed if observed else None
+        return {
+            "device_id": device_id,
+            "start": start,
+            "end": end,
+            "time_in_state": {name: round(seconds, 3) for name, seconds in totals.items()},
+            "observed_seconds": round(observed, 3),
+            "transitions": len(self.transitions(device_id, start, end)),
+            "uptime": round(1 - totals["FAULT"] / observed, 4) if observed else None,
+            "availability": round(availability, 4) if availability is not None else None,
+            "oee": round(availability * performance * quality, 4) if availability is not None else None,
+        }
+
+    def memory_bytes(self) -> int:
+        return sum(9 * len(log.times) for log in self.devices.values())
+
+
+class StateTracker:
+    """
+    Hysteresis between raw per-sample states and published transitions.
+
+    Why: Rule-based states flicker when a reading hovers around a
+    threshold. Requiring a new state to repeat and the old one to last a
+    minimum time turns that flicker into one transition.
+    """
+
+    def __init__(self, log: TransitionLog, min_dwell: float = 5.0, confirm_samples: int = 3,
+                 immediate: Tuple[str, ...] = ("FAULT",)):
+        self.log = log
+        self.min_dwell = min_dwell              # Seconds a state is held before it may change
+        self.confirm_samples = confirm_samples  # Consecutive samples a new state needs
+        self.immediate = set(immediate)         # States entered without debouncing
+        # device_id -> [committed state, since, candidate state, candidate count]
+        self.devices: Dict[str, list] = {}
+
+    def observe(self, device_id: str, state: str, ts: float) -> Optional[Dict]:
+        """
+        Feed one raw state. Returns {state, previous_state, timestamp} when
+        the committed state changes, otherwise None.
+        """
+        entry = self.devices.get(device_id)
+        if entry is None:
+            self.devices[device_id] = [state, ts, None, 0]
+            self.log.record(device_id, ts, state)
+            return {"state": state, "previous_state": None, "timestamp": ts}
+
+        committed, since, candidate, count = entry
+        if state == committed:
+            entry[2], entry[3] = None, 0
+            return None
+        count = count + 1 if state == candidate else 1
+        if state not in self.immediate and (
+                count < self.confirm_samples or ts - since < self.min_dwell):
+            entry[2], entry[3] = state, count
+            return None
+
+        entry[:] = [state, ts, None, 0]
+        self.log.record(device_id, ts, state)
+        return {"state": state, "previous_state": committed, "timestamp": ts}
+
+    def committed(self, device_id: str) -> Optional[Tuple[str, float, Optional[str]]]:
+        """(committed state, since, pending candidate or None)."""
+        entry = self.devices.get(device_id)
+        if entry is None:
+            return None
+        return entry[0], entry[1], entry[2]
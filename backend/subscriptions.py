@@ -0,0 +1,149 @@
+"""
+Subscription Index for /ws/live
+Routes each (device_id, key) sample only to the clients that asked for it.
+
+Clients subscribe with device IDs, key globs or "device/key" pairs. Every
+filter is stored as a (device_glob, key_glob) pair. The first time a series
+is seen its subscriber set is resolved against all filters and memoized, so
+routing a sample is one dict lookup instead of a scan over every filter.
+Memoized routes left without subscribers are evicted whenever a client
+unsubscribes or leaves, so the memo tracks what clients currently watch
+rather than every series seen since startup.
+"""
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+Filter = Tuple[str, str]  # (device_glob, key_glob)
+
+
+def parse_filters(message: Dict[str, Any]) -> List[Filter]:
+    """
+    Build filters from a subscribe/unsubscribe message.
+
+    Accepts any combination of:
+        "devices": ["ESP32_01"]                 -> every key of a device
+        "keys":    ["temp*", "vibration"]       -> a key (glob) on every device
+        "series":  ["ESP32_01/temperature"]     -> one device/key pair (globs ok)
+    """
+    filters: List[Filter] = []
+    for device in message.get("devices") or []:
+        filters.append((str(device), "*"))
+    for key in message.get("keys") or []:
+        filters.append(("*", str(key)))
+    for series in message.get("series") or []:
+        device, sep, key = str(series).partition("/")
+        if not sep:
+            raise ValueError(f"Series must be 'device/key': {series}")
+        filters.append((device, key or "*"))
+    return filters
+
+
+def _matches(device_id: str, key: str, flt: Filter) -> bool:
+    device_glob, key_glob = flt
+    return fnmatchcase(device_id, device_glob) and fnmatchcase(key, key_glob)
+
+
+class SubscriptionIndex:
+    """
+    (device_id, key) -> subscribers, built lazily from per-client filters.
+
+    Clients that never subscribed (or sent "unsubscribe all") are not
+    indexed; the connection manager treats them as wanting everything (the
+    original /ws/live behaviour). An indexed client with no filters left
+    gets nothing.
+    """
+
+    def __init__(self):
+        # client -> set of filters
+        self.filters: Dict[Any, Set[Filter]] = {}
+        # (device_id, key) -> set of clients (memoized resolution)
+        self._routes: Dict[Tuple[str, str], Set[Any]] = {}
+        # device_id -> clients with any filter on that device (device events)
+        self._devices: Dict[str, Set[Any]] = {}
+
+    def is_filtered(self, client) -> bool:
+        return client in self.filters
+
+    def subscribe(self, client, filters: Iterable[Filter], replace: bool = False):
+        """Add filters for a client (or replace its filters entirely)."""
+        if replace:
+            self.remove(client)
+        client_filters = self.filters.setdefault(client, set())
+        new = [flt for flt in filters if flt not in client_filters]
+        client_filters.update(new)
+
+        # Patch memoized routes instead of rebuilding them
+        for (device_id, key), subscribers in self._routes.items():
+            if client not in subscribers and any(_matches(device_id, key, f) for f in new):
+                subscribers.add(client)
+        for device_id, subscribers in self._devices.items():
+            if client not in subscribers and any(fnmatchcase(device_id, f[0]) for f in new):
+                subscribers.add(client)
+
+    def unsubscribe(self, client, filters: Iterable[Filter]):
+        """Remove filters from a client; one left with none gets nothing."""
+        client_filters = self.filters.get(client)
+        if client_filters is None:
+            return
+        client_filters.difference_update(filters)
+        for (device_id, key), subscribers in self._routes.items():
+            if client in subscribers and not any(_matches(device_id, key, f) for f in client_filters):
+                subscribers.discard(client)
+        for device_id, subscribers in self._devices.items():
+            if client in subscribers and not any(fnmatchcase(device_id, f[0]) for f in client_filters):
+                subscribers.discard(client)
+        self._prune()
+
+    def remove(self, client):
+        """Forget a client entirely (disconnect or replace)."""
+        if self.filters.pop(client, None) is None:
+            return
+        for subscribers in self._routes.values():
+            subscribers.discard(client)
+        for subscribers in self._devices.values():
+            subscribers.discard(client)
+        self._prune()
+
+    def _prune(self):
+        """
+        Evict memoized routes that no client subscribes to.
+
+        Why: Every series a sample was routed for is memoized, including the
+        ones nobody wants. Without eviction the memo grows with every device
+        and key ever seen, and a dashboard that browses across a plant leaves
+        its old series behind after it moves on.
+        """
+        if not self.filters:
+            # No filtered clients: routing is bypassed until one subscribes
+            self._routes.clear()
+            self._devices.clear()
+            return
+        self._routes = {route: subs for route, subs in self._routes.items() if subs}
+        self._devices = {device_id: subs for device_id, subs in self._devices.items() if subs}
+
+    def subscribers(self, device_id: str, key: str) -> Set[Any]:
+        """Clients whose filters match this series."""
+        route = (device_id, key)
+        subscribers = self._routes.get(route)
+        if subscribers is None:
+            subscribers = {
+                client for client, client_filters in self.filters.items()
+                if any(_matches(device_id, key, f) for f in client_filters)
+            }
+            self._routes[route] = subscribers
+        return subscribers
+
+    def device_subscribers(self, device_id: str) -> Set[Any]:
+        """Clients with a filter on any key of this device (state, status)."""
+        subscribers = self._devices.get(device_id)
+        if subscribers is None:
+            subscribers = {
+                client for client, client_filters in self.filters.items()
+                if any(fnmatchcase(device_id, device_glob) for device_glob, _ in client_filters)
+            }
+            self._devices[device_id] = subscribers
+        return subscribers
+
+    def describe(self, client) -> List[str]:
+        """A client's filters as 'device/key' strings."""
+        return sorted(f"{device}/{key}" for device, key in self.filters.get(client, ()))
@@ -0,0 +1,8 @@
+"""Backend modules import each other flat (uvicorn main:app runs from backend/)."""
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+# mqtt_broker.py lives at the repository root
+sys.path.append(os.path.join(HERE, "..", ".."))
@@ -0,0 +1,64 @@
+"""POST /api/telemetry/batch: one bad record does not reject the rest."""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as c:
+        yield c
+
+
+def record(device_id, value):
+    return {"device_id": device_id, "telemetry": {"temperature": value}}
+
+
+def stored(client, device_id):
+    response = client.get(f"/api/devices/{device_id}/telemetry")
+    if response.status_code != 200:
+        return None
+    return {key: entry["value"] for key, entry in response.json()["telemetry"].items()}
+
+
+def test_invalid_record_in_a_json_array(client):
+    records = [record("BATCH_A0", 20.0), record("BATCH_A1", 21.0),
+               {"telemetry": {"temperature": 22.0}},  # No device_id
+               record("BATCH_A3", 23.0)]
+    response = client.post("/api/telemetry/batch", json=records)
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["status"], result["accepted"], result["rejected"]) == ("partial", 3, 1)
+    [error] = result["errors"]
+    assert error["index"] == 2 and "device_id" in error["error"]
+
+    for i in (0, 1, 3):
+        assert stored(client, f"BATCH_A{i}") == {"temperature": 20.0 + i}
+    assert stored(client, "BATCH_A2") is None
+
+
+def test_invalid_lines_in_ndjson(client):
+    lines = [json.dumps(record("BATCH_N0", 1.0)),
+             '{"device_id": "BATCH_N1", "telemetry": ',  # Truncated line
+             "",  # Blank lines are skipped, not counted
+             json.dumps({"device_id": "BATCH_N2", "telemetry": [1, 2]}),
+             json.dumps(record("BATCH_N3", 4.0))]
+    response = client.post("/api/telemetry/batch", content="\n".join(lines),
+                           headers={"Content-Type": "application/x-ndjson"})
+    result = response.json()
+    assert (result["accepted"], result["rejected"]) == (2, 2)
+    assert [e["index"] for e in result["errors"]] == [1, 2]
+    assert "Invalid JSON" in result["errors"][0]["error"]
+    assert "telemetry" in result["errors"][1]["error"]
+    assert stored(client, "BATCH_N0") == {"temperature": 1.0}
+    assert stored(client, "BATCH_N3") == {"temperature": 4.0}
+    assert stored(client, "BATCH_N2") is None
+
+
+def test_malformed_body_is_rejected_whole(client):
+    response = client.post("/api/telemetry/batch", content=b"[{",
+                           headers={"Content-Type": "application/json"})
+    assert response.status_code == 400
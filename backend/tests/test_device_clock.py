@@ -0,0 +1,59 @@
+"""Device timestamps are used only within a sanity window of receive time."""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from ingestion import sample_time
+from main import InMemoryStorage
+
+
+def ingest(storage, timestamp, device_id="D1", value=1.0):
+    """Store one sample the way IngestionPipeline._flush does."""
+    storage.update_many([(device_id, {"temperature": value}, sample_time(timestamp))])
+    return storage.history.get_series(device_id, "temperature")[-1][0]
+
+
+def seconds_since_seen(storage, device_id="D1"):
+    last_seen = datetime.fromisoformat(storage.devices[device_id]["last_seen"])
+    return (datetime.utcnow() - last_seen).total_seconds()
+
+
+@pytest.mark.parametrize("timestamp", [
+    # Naive local time west of UTC (simulator/esp32_enhanced_simulator.py)
+    (datetime.utcnow() - timedelta(hours=5)).isoformat(),
+    # millis() / uptime counter read as an epoch
+    123456,
+    "1970-01-01T00:02:03",
+])
+def test_wrong_device_clock_is_stored_at_receive_time(timestamp):
+    storage = InMemoryStorage()
+    before = time.time()
+    stored = ingest(storage, timestamp)
+    assert before <= stored <= time.time()
+    assert storage.devices["D1"]["status"] == "online"
+    assert seconds_since_seen(storage) < 5
+
+
+def test_backlog_within_window_keeps_device_time():
+    storage = InMemoryStorage(max_clock_lag=900)
+    sent = datetime.utcnow() - timedelta(minutes=2)
+    stored = ingest(storage, sent.isoformat() + "Z")
+    assert stored == pytest.approx(sample_time(sent.isoformat() + "Z"))
+    # Seen now, so check_device_status does not mark it offline
+    assert seconds_since_seen(storage) < 5
+
+
+def test_future_timestamp_is_clamped_to_receive_time():
+    storage = InMemoryStorage()
+    stored = ingest(storage, time.time() + 3600)
+    assert stored <= time.time()
+
+
+def test_history_stays_sorted_when_clocks_mix():
+    storage = InMemoryStorage()
+    ingest(storage, time.time() - 60, value=1)
+    ingest(storage, None, value=2)
+    ingest(storage, time.time() - 120, value=3)  # Behind the previous sample
+    times = [ts for ts, _ in storage.history.get_series("D1", "temperature")]
+    assert times == sorted(times)
@@ -0,0 +1,118 @@
+"""FleetInferenceEngine must reach the same states as the scalar engine."""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fleet_inference import FleetInferenceEngine  # noqa: E402
+from state_inference import StateInferenceEngine  # noqa: E402
+
+
+def tricky_sample(rng):
+    """Telemetry with random key subsets and values that hit thresholds exactly."""
+    sample = {}
+    if rng.random() < 0.8:
+        sample["temperature"] = rng.choice([25.0, 80.0, 80.01, -0.5, 0.0, rng.uniform(-10, 100)])
+    if rng.random() < 0.8:
+        sample["vibration"] = rng.choice([0.1, 0.2, 0.3, 1, 2, 4.0, 5.0, 50.0, 60.5, rng.uniform(0, 80)])
+    if rng.random() < 0.8:
+        sample["current"] = rng.choice([0.1, 0.2, 0.25, 0.5, 1.0, 1.5, 3, rng.uniform(0, 4)])
+    if rng.random() < 0.5:
+        sample["battery"] = rng.choice([5, 10, 50, 9.99])
+    if rng.random() < 0.5:
+        sample["rssi"] = rng.choice([-95, -90, -60])
+    if rng.random() < 0.3:
+        # Consecutive ints around a variance of exactly 5.0 (e.g. 0, 5 repeated)
+        sample["sensor_data"] = rng.choice([0, 5, 1, 6, 0.1, 5.1, rng.uniform(0, 10)])
+    if rng.random() < 0.6:
+        sample["distance"] = rng.choice([0, 5, 2, 7, rng.randint(0, 400)])
+    sample["status"] = "ok"
+    return sample
+
+
+@pytest.mark.parametrize("seed", [5, 6, 7])
+def test_states_and_transitions_match_scalar_engine(seed):
+    rng = random.Random(seed)
+    # No debouncing, so every raw state change is a transition on both sides
+    scalar = StateInferenceEngine(min_dwell=0, confirm_samples=1)
+    fleet = FleetInferenceEngine(StateInferenceEngine(min_dwell=0, confirm_samples=1), initial_rows=8)
+    names = [f"DEV_{i:03d}" for i in range(40)]
+    for _ in range(150):
+        before = {d: scalar.device_states.get(d, {}).get("state") for d in names}
+        touched = set()
+        for _ in range(rng.randint(1, len(names) * 3)):
+            device = rng.choice(names)
+            sample = tricky_sample(rng)
+            scalar.update_telemetry(device, sample)
+            fleet.observe(device, sample)
+            touched.add(device)
+        transitions = fleet.tick(explain=True)
+
+        for device in touched:
+            expected = scalar.device_states[device]
+            assert fleet.state_of(device) == (expected["state"], expected["confidence"]), device
+        changed = {d for d in touched if scalar.device_states[d]["state"] != before[d]}
+        assert {t["device_id"] for t in transitions} == changed
+        for t in transitions:
+            expected = scalar.device_states[t["device_id"]]
+            assert (t["state"], t["confidence"], t["reasons"]) == \
+                (expected["state"], expected["confidence"], expected["reasons"])
+
+
+def test_debounced_states_match_scalar_engine():
+    """Hysteresis per tick equals StateTracker with one sample per device per tick."""
+    rng = random.Random(3)
+    scalar = StateInferenceEngine(min_dwell=2.0, confirm_samples=2)
+    fleet = FleetInferenceEngine(StateInferenceEngine(min_dwell=2.0, confirm_samples=2))
+    names = [f"DEV_{i:02d}" for i in range(20)]
+    for tick in range(200):
+        now = 1_000_000.0 + tick
+        for device in names:
+            sample = tricky_sample(rng)
+            scalar.update_telemetry(device, sample, ts=now)
+            fleet.observe(device, sample)
+        fleet.tick(now=now)
+        for device in names:
+            state, since, pending = scalar.tracker.committed(device)
+            row = fleet.rows[device]
+            info = fleet.get_device_state(device)
+            assert (info["state"], info["pending_state"]) == (state, pending), device
+            assert fleet.since[row] == since
+
+
+def test_device_type_rules_decide_state_and_reasons():
+    rules = {"device_types": {"pump": {
+        "match": ["PUMP_*"],
+        "activity": [{"key": "pressure", "weight": 1.0,
+                      "cases": [{"op": ">", "value": 3, "score": 1.0, "reason": "Pressurized"}]}],
+    }}}
+    scalar = StateInferenceEngine(min_dwell=0, confirm_samples=1)
+    scalar.rules.load(rules)
+    fleet_scalar = StateInferenceEngine(min_dwell=0, confirm_samples=1)
+    fleet_scalar.rules.load(rules)
+    fleet = FleetInferenceEngine(fleet_scalar)
+
+    # The built-in rules would call this RUNNING; the pump rules say IDLE, then RUNNING
+    busy = {"current": 2.0, "vibration": 60.0, "distance": 1}
+    for pressure in (1.0, 5.0):
+        for device in ("PUMP_1", "DEV_1"):
+            sample = {**busy, "pressure": pressure}
+            scalar.update_telemetry(device, sample)
+            fleet.observe(device, sample)
+        fleet.tick(explain=True)
+        for device in ("PUMP_1", "DEV_1"):
+            expected = scalar.device_states[device]
+            info = fleet.get_device_state(device)
+            assert (info["state"], info["confidence"], info["reasons"]) == \
+                (expected["state"], expected["confidence"], expected["reasons"]), device
+    assert fleet.get_device_state("PUMP_1")["reasons"] == ["Pressurized"]
+
+    # Back to the built-in rules: the pump is vectorized again
+    fleet_scalar.rules.load({"device_types": {}})
+    scalar.rules.load({"device_types": {}})
+    scalar.update_telemetry("PUMP_1", busy)
+    fleet.observe("PUMP_1", busy)
+    fleet.tick()
+    assert fleet.state_of("PUMP_1") == (scalar.device_states["PUMP_1"]["state"],
+                                        scalar.device_states["PUMP_1"]["confidence"])
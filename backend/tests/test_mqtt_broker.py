@@ -0,0 +1,240 @@
+"""AsyncMQTTBroker sessions: QoS 1 redelivery, persistent sessions,
+retained messages and shared subscriptions, over real sockets."""
+import asyncio
+
+from mqtt_broker import (AsyncMQTTBroker, PacketDecoder, encode_publish,
+                         encode_remaining_length, parse_publish)
+
+TIMEOUT = 2.0
+
+
+def run_broker(**options):
+    """Run the test coroutine with a broker on a free local port."""
+    def decorator(test):
+        def wrapper():
+            async def main():
+                broker = AsyncMQTTBroker(host="127.0.0.1", port=0, **options)
+                await broker.serve()
+                try:
+                    await test(broker)
+                finally:
+                    broker.close()
+            asyncio.run(main())
+        wrapper.__name__ = test.__name__  # Not functools.wraps: pytest would want a `broker` fixture
+        return wrapper
+    return decorator
+
+
+def string(value):
+    data = value.encode()
+    return len(data).to_bytes(2, "big") + data
+
+
+class Client:
+    """Minimal MQTT 3.1.1 client speaking raw packets."""
+
+    def __init__(self, broker, client_id):
+        self.broker = broker
+        self.client_id = client_id
+        self.decoder = PacketDecoder()
+        self.packets = []
+        self.next_id = 1
+
+    async def connect(self, clean=True):
+        """Connect; returns the CONNACK session-present flag."""
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.broker.port)
+        body = string("MQTT") + bytes([4, 0x02 if clean else 0, 0, 60]) + string(self.client_id)
+        self.send(0x10, body)
+        header, connack = await self.receive()
+        assert header == 0x20 and connack[1] == 0
+        return bool(connack[0] & 0x01)
+
+    def send(self, header, body):
+        self.writer.write(bytes([header]) + encode_remaining_length(len(body)) + body)
+
+    async def receive(self, timeout=TIMEOUT):
+        """Next packet as (header byte, body bytes)."""
+        while not self.packets:
+            data = await asyncio.wait_for(self.reader.read(65536), timeout)
+            assert data, "connection closed"
+            self.packets += [(h, bytes(b)) for h, b in self.decoder.feed(data)]
+        return self.packets.pop(0)
+
+    async def messages(self, quiet=0.2):
+        """[(topic, payload, qos, retain, dup, packet_id)] until `quiet` s pass without one."""
+        received = []
+        while True:
+            try:
+                header, body = await self.receive(timeout=quiet)
+            except asyncio.TimeoutError:
+                return received
+            assert header >> 4 == 3
+            topic, qos, packet_id, payload = parse_publish(header, memoryview(body))
+            received.append((topic, bytes(payload), qos, bool(header & 0x01),
+                             bool(header & 0x08), packet_id))
+
+    async def subscribe(self, topic_filter, qos=0):
+        packet_id = self._packet_id()
+        self.send(0x82, packet_id + string(topic_filter) + bytes([qos]))
+        header, body = await self.receive()
+        assert header == 0x90 and body[:2] == packet_id
+
+    async def publish(self, topic, payload, qos=0, retain=False):
+        """Publish and wait until the broker has processed it."""
+        if qos:
+            packet_id = self._packet_id()
+            self.writer.write(encode_publish(topic, payload, 1, int.from_bytes(packet_id, "big"), retain))
+            assert await self.receive() == (0x40, packet_id)
+        else:
+            self.writer.write(encode_publish(topic, payload, retain=retain))
+            await self.ping()
+
+    async def ping(self):
+        self.send(0xc0, b"")
+        assert await self.receive() == (0xd0, b"")
+
+    def puback(self, packet_id):
+        self.send(0x40, packet_id)
+
+    async def disconnect(self, graceful=True):
+        if graceful:
+            self.send(0xe0, b"")
+        self.writer.close()
+        await self.writer.wait_closed()
+        # Wait for the broker to see it
+        while self.client_id in self.broker.clients:
+            await asyncio.sleep(0.01)
+
+    def _packet_id(self):
+        packet_id = self.next_id.to_bytes(2, "big")
+        self.next_id += 1
+        return packet_id
+
+
+async def connected(broker, client_id, clean=True):
+    client = Client(broker, client_id)
+    await client.connect(clean)
+    return client
+
+
+@run_broker(retry_interval=0.0)
+async def test_unacknowledged_qos1_is_resent_with_dup(broker):
+    # Housekeeping on a short interval instead of the 1 s default
+    broker._housekeeping.cancel()
+    broker._housekeeping = asyncio.get_running_loop().create_task(broker.housekeeping(0.05))
+    sub = await connected(broker, "sub")
+    await sub.subscribe("dev/#", qos=1)
+    pub = await connected(broker, "pub")
+    await pub.publish("dev/1", b"hello", qos=1)
+
+    header, first = await sub.receive()
+    assert header == 0x32  # QoS 1, no DUP
+    header, again = await sub.receive()
+    assert header == 0x3a and again == first  # DUP set, same packet id
+    assert broker.retries >= 1
+
+    topic, _, packet_id, _ = parse_publish(header, memoryview(again))
+    sub.puback(packet_id)
+    await sub.ping()
+    assert broker.sessions["sub"].inflight == {}
+    sub.packets.clear()  # Resends raced with the PUBACK
+    assert await sub.messages() == []
+
+
+@run_broker()
+async def test_unacknowledged_qos1_is_resent_on_reconnect(broker):
+    sub = await connected(broker, "sub", clean=False)
+    await sub.subscribe("dev/#", qos=1)
+    pub = await connected(broker, "pub")
+    await pub.publish("dev/1", b"hello", qos=1)
+    [(_, _, _, _, dup, packet_id)] = await sub.messages()
+    assert not dup
+    await sub.disconnect(graceful=False)  # No PUBACK
+
+    assert await sub.connect(clean=False) is True
+    assert await sub.messages() == [("dev/1", b"hello", 1, False, True, packet_id)]
+
+
+@run_broker()
+async def test_persistent_session_queues_qos1_while_offline(broker):
+    sub = await connected(broker, "sub", clean=False)
+    await sub.subscribe("dev/+/telemetry", qos=1)
+    await sub.disconnect()
+
+    pub = await connected(broker, "pub")
+    for i in range(3):
+        await pub.publish(f"dev/{i}/telemetry", str(i).encode(), qos=1)
+    await pub.publish("dev/9/telemetry", b"qos0", qos=0)  # Not queued
+
+    assert await sub.connect(clean=False) is True
+    received = await sub.messages()
+    assert [(t, p, q) for t, p, q, *_ in received] == [
+        (f"dev/{i}/telemetry", str(i).encode(), 1) for i in range(3)]
+    for *_, packet_id in received:
+        sub.puback(packet_id)
+    await sub.disconnect()
+
+    # A clean connect discards the session and its subscriptions
+    assert await sub.connect(clean=True) is False
+    await pub.publish("dev/0/telemetry", b"x", qos=1)
+    assert await sub.messages() == []
+
+
+@run_broker()
+async def test_retained_messages_replay_on_subscribe(broker):
+    pub = await connected(broker, "pub")
+    await pub.publish("dev/1/status", b"online", qos=1, retain=True)
+    await pub.publish("dev/2/status", b"offline", retain=True)
+    await pub.publish("dev/3/status", b"gone", retain=True)
+    await pub.publish("dev/3/status", b"", retain=True)  # Clears it
+    await pub.publish("dev/4/status", b"not retained")
+
+    sub = await connected(broker, "sub")
+    await sub.subscribe("dev/+/status", qos=1)
+    received = sorted((t, p, q, r) for t, p, q, r, *_ in await sub.messages())
+    assert received == [("dev/1/status", b"online", 1, True),
+                        ("dev/2/status", b"offline", 0, True)]
+
+    shared = await connected(broker, "shared")
+    await shared.subscribe("$share/g/dev/+/status")
+    assert await shared.messages() == []
+
+
+@run_broker()
+async def test_shared_subscription_delivers_each_message_to_one_member(broker):
+    members = [await connected(broker, f"m{i}") for i in range(3)]
+    for member in members:
+        await member.subscribe("$share/workers/dev/+/telemetry")
+    pub = await connected(broker, "pub")
+
+    topics = [f"dev/{i}/telemetry" for i in range(30)]
+    for _ in range(2):
+        for topic in topics:
+            await pub.publish(topic, b"x")
+    received = {m.client_id: [t for t, *_ in await m.messages()] for m in members}
+
+    owner = {}
+    for client_id, member_topics in received.items():
+        for topic in member_topics:
+            assert owner.setdefault(topic, client_id) == client_id  # Sticky per topic
+            assert broker.pick_shared(("share", "workers", "dev/+/telemetry"), topic)[0] == client_id
+    assert sorted(owner) == sorted(topics)
+    assert sum(len(t) for t in received.values()) == 2 * len(topics)
+    assert all(received.values())  # Spread across the group
+
+
+@run_broker()
+async def test_shared_subscription_skips_the_publishing_member(broker):
+    a = await connected(broker, "a")
+    b = await connected(broker, "b")
+    share_id = ("share", "g", "dev/#")
+    await a.subscribe("$share/g/dev/#")
+    # Alone in the group, a's own messages go nowhere
+    await a.publish("dev/1", b"own")
+    assert await a.messages() == []
+
+    await b.subscribe("$share/g/dev/#")
+    topic = next(f"dev/{i}" for i in range(100) if broker.pick_shared(share_id, f"dev/{i}")[0] == "a")
+    await a.publish(topic, b"to b")
+    assert [(t, p) for t, p, *_ in await b.messages()] == [(topic, b"to b")]
+    assert await a.messages() == []
@@ -0,0 +1,56 @@
+"""PacketDecoder: MQTT framing over arbitrary TCP read boundaries."""
+import pytest
+
+from mqtt_broker import PacketDecoder, encode_publish, encode_remaining_length
+
+
+def packet(header, body):
+    return bytes([header]) + encode_remaining_length(len(body)) + body
+
+
+def decode(decoder, data):
+    """Packets of one feed, copied (bodies are only valid until the next feed)."""
+    return [(header, bytes(body)) for header, body in decoder.feed(data)]
+
+
+def test_packet_split_across_reads():
+    frame = encode_publish("app/device/D1/telemetry", b'{"telemetry": {"t": 1}}')
+    decoder = PacketDecoder()
+    packets = []
+    for i in range(len(frame)):
+        packets += decode(decoder, frame[i:i + 1])
+        if i < len(frame) - 1:
+            assert packets == []
+    assert packets == [(frame[0], frame[2:])]
+    assert decoder.feed(b"") == []
+
+
+def test_several_packets_in_one_read():
+    frames = [packet(0x30, b"\x00\x01a" + bytes([i]) * i) for i in range(5)]
+    frames.append(b"\xc0\x00")  # PINGREQ, empty body
+    decoder = PacketDecoder()
+    packets = decode(decoder, b"".join(frames) + frames[0][:3])
+    assert packets == [(frame[0], frame[2:]) for frame in frames]
+    # The trailing partial packet completes on the next read
+    assert decode(decoder, frames[0][3:]) == [(frames[0][0], frames[0][2:])]
+
+
+@pytest.mark.parametrize("length, size", [(127, 1), (128, 2), (16383, 2), (16384, 3)])
+def test_remaining_length_boundaries(length, size):
+    assert len(encode_remaining_length(length)) == size
+    body = bytes(range(256)) * (length // 256) + bytes(length % 256)
+    frame = packet(0x30, body)
+    assert decode(PacketDecoder(), frame) == [(0x30, body)]
+
+    # Split inside the length bytes and again inside the body
+    decoder = PacketDecoder()
+    assert decode(decoder, frame[:size]) == []
+    assert decode(decoder, frame[size:size + 10]) == []
+    assert decode(decoder, frame[size + 10:]) == [(0x30, body)]
+
+
+def test_malformed_and_oversized_lengths_are_rejected():
+    with pytest.raises(ValueError):
+        PacketDecoder().feed(b"\x30\xff\xff\xff\xff\x01")
+    with pytest.raises(ValueError):
+        PacketDecoder(max_packet_size=100).feed(packet(0x30, bytes(101)))
@@ -0,0 +1,76 @@
+"""RollingWindow must match statistics/min/max over the same window exactly."""
+import math
+import statistics
+from collections import deque
+
+from hypothesis import given, settings, strategies as st
+
+from rolling_stats import RollingWindow
+
+ints = st.integers(min_value=-10 ** 6, max_value=10 ** 6)
+rounded = st.floats(min_value=-1000, max_value=1000).map(lambda v: round(v, 2))
+finite = st.floats(allow_nan=False, allow_infinity=False)
+values = st.one_of(ints, rounded, finite, st.sampled_from([0, 0.0, 1, 1.0, -1, 5e-324]))
+
+
+def outcome(function, window):
+    """Result of a stat, or the exception type it raised."""
+    try:
+        return function(window)
+    except Exception as exc:  # Errors must match too (e.g. OverflowError)
+        return type(exc)
+
+
+def same(got, expected) -> bool:
+    if type(got) is not type(expected):
+        return False
+    if isinstance(got, float) and math.isnan(got):
+        return math.isnan(expected)
+    return got == expected
+
+
+def check_window(window: RollingWindow, reference: deque):
+    expected = list(reference)
+    assert list(window) == expected
+    assert same(outcome(RollingWindow.mean, window), outcome(statistics.mean, expected))
+    if len(expected) > 1:
+        assert same(outcome(RollingWindow.variance, window), outcome(statistics.variance, expected))
+    assert same(window.min(), min(expected))
+    assert same(window.max(), max(expected))
+    first, last = expected[0], expected[-1]
+    assert window.trend() == ("up" if last > first else "down" if last < first else "stable")
+
+
+@settings(max_examples=300, deadline=None)
+@given(size=st.integers(min_value=1, max_value=20), stream=st.lists(values, min_size=1, max_size=80))
+def test_matches_statistics_with_evictions(size, stream):
+    window, reference = RollingWindow(size), deque(maxlen=size)
+    for value in stream:
+        window.append(value)
+        reference.append(value)
+        check_window(window, reference)
+
+
+@settings(max_examples=100, deadline=None)
+@given(size=st.integers(min_value=1, max_value=10),
+       stream=st.lists(st.one_of(ints, rounded, st.just(float("nan")), st.just(float("inf"))),
+                       min_size=1, max_size=40))
+def test_non_finite_samples_fall_back_to_statistics(size, stream):
+    window, reference = RollingWindow(size), deque(maxlen=size)
+    for value in stream:
+        window.append(value)
+        reference.append(value)
+        assert same(outcome(RollingWindow.mean, window), outcome(statistics.mean, list(reference)))
+        if len(reference) > 1:
+            assert same(outcome(RollingWindow.variance, window),
+                        outcome(statistics.variance, list(reference)))
+
+
+def test_int_results_stay_int():
+    window = RollingWindow(3)
+    for value in (1, 2, 3, 4):
+        window.append(value)
+    assert window.mean() == 3 and type(window.mean()) is int
+    assert window.variance() == 1 and type(window.variance()) is int
+    window.append(4.5)
+    assert type(window.mean()) is float
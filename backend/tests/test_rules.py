@@ -0,0 +1,37 @@
+"""RuleRegistry file loading and hot reload."""
+import os
+
+import pytest
+
+from state_inference import StateInferenceEngine
+
+yaml = pytest.importorskip("yaml")
+
+PUMP_YAML = """
+device_types:
+  pump:
+    match: ["PUMP_*"]
+    running_above: 0.5
+"""
+
+
+def test_yaml_rules_file_loads(tmp_path):
+    path = tmp_path / "rules.yaml"
+    path.write_text(PUMP_YAML)
+    rules = StateInferenceEngine().rules
+    assert rules.watch(str(path))
+    assert rules.describe()["device_types"] == {"pump": ["PUMP_*"]}
+    assert rules.for_device("PUMP_1").name == "pump"
+
+
+def test_malformed_yaml_keeps_current_rules(tmp_path):
+    path = tmp_path / "rules.yaml"
+    path.write_text(PUMP_YAML)
+    rules = StateInferenceEngine().rules
+    rules.watch(str(path))
+
+    path.write_text("device_types: [unclosed\n")
+    os.utime(path, (1, 1))  # A different mtime, whatever the clock resolution
+    assert rules.reload_if_changed() is False
+    assert rules.last_error
+    assert rules.for_device("PUMP_1").name == "pump"
@@ -0,0 +1,52 @@
+"""serialization: NaN/Infinity never reach the wire as bare tokens."""
+import json
+import math
+from datetime import datetime
+
+import pytest
+
+import serialization
+
+MESSAGE = {
+    "type": "telemetry_update",
+    "telemetry": {"temperature": math.nan, "limits": [1.5, math.inf, -math.inf]},
+    "timestamp": datetime(2026, 10, 17, 12, 0),
+}
+EXPECTED = {
+    "type": "telemetry_update",
+    "telemetry": {"temperature": None, "limits": [1.5, None, None]},
+    "timestamp": "2026-10-17T12:00:00",
+}
+
+
+def strict_loads(data):
+    """json.loads that, like JSON.parse, rejects NaN/Infinity."""
+    def reject(name):
+        raise ValueError(f"bare {name} in output")
+    return json.loads(data, parse_constant=reject)
+
+
+@pytest.mark.parametrize("dumps", [serialization.dumps, serialization._stdlib_dumps],
+                         ids=[serialization.BACKEND, "stdlib"])
+def test_non_finite_floats_are_written_as_null(dumps):
+    assert strict_loads(dumps(MESSAGE)) == EXPECTED
+    assert strict_loads(dumps(math.nan)) is None
+
+
+def test_integers_beyond_64_bits_keep_non_finite_floats_out():
+    # orjson rejects the integer, so this takes the stdlib fallback
+    message = {"serial": 2 ** 70, "value": math.nan}
+    assert strict_loads(serialization.dumps(message)) == {"serial": 2 ** 70, "value": None}
+
+
+def test_numpy_non_finite_scalars_are_written_as_null():
+    np = pytest.importorskip("numpy")
+    message = {"a": np.float32("nan"), "b": np.float64("inf"), "c": np.float32(0.5)}
+    assert strict_loads(serialization.dumps(message)) == {"a": None, "b": None, "c": 0.5}
+    assert strict_loads(serialization._stdlib_dumps(message)) == {"a": None, "b": None, "c": 0.5}
+
+
+def test_finite_output_is_unchanged():
+    message = {"a": [1, 2.5, "x", None, True], "b": {"c": -0.0}}
+    assert serialization._stdlib_dumps(message) == b'{"a":[1,2.5,"x",null,true],"b":{"c":-0.0}}'
+    assert strict_loads(serialization.dumps(message)) == message
@@ -0,0 +1,89 @@
+"""SubscriptionIndex routing, unsubscribe and memo eviction."""
+import pytest
+
+from subscriptions import SubscriptionIndex, parse_filters
+
+
+def test_parse_filters():
+    assert parse_filters({"devices": ["ESP32_01"], "keys": ["temp*"],
+                          "series": ["ESP32_02/vibration", "PUMP_*/"]}) == [
+        ("ESP32_01", "*"), ("*", "temp*"), ("ESP32_02", "vibration"), ("PUMP_*", "*")]
+    with pytest.raises(ValueError):
+        parse_filters({"series": ["no-key"]})
+
+
+def test_routes_by_device_key_and_series():
+    index = SubscriptionIndex()
+    index.subscribe("a", parse_filters({"devices": ["ESP32_01"]}))
+    index.subscribe("b", parse_filters({"keys": ["temp*"]}))
+    index.subscribe("c", parse_filters({"series": ["ESP32_0*/vibration"]}))
+
+    assert index.subscribers("ESP32_01", "temperature") == {"a", "b"}
+    assert index.subscribers("ESP32_01", "vibration") == {"a", "c"}
+    assert index.subscribers("ESP32_02", "vibration") == {"c"}
+    assert index.subscribers("ESP32_02", "humidity") == set()
+    assert index.device_subscribers("ESP32_01") == {"a", "b", "c"}
+    assert index.device_subscribers("PUMP_1") == {"b"}
+
+
+def test_subscribe_after_routes_are_memoized():
+    index = SubscriptionIndex()
+    index.subscribe("a", [("ESP32_01", "*")])
+    assert index.subscribers("ESP32_02", "temperature") == set()
+    index.subscribe("b", [("ESP32_02", "temperature")])
+    assert index.subscribers("ESP32_02", "temperature") == {"b"}
+    assert index.device_subscribers("ESP32_02") == {"b"}
+
+
+def test_unsubscribe_stops_routing():
+    index = SubscriptionIndex()
+    index.subscribe("a", [("ESP32_01", "*"), ("*", "temperature")])
+    index.subscribe("b", [("ESP32_01", "temperature")])
+    assert index.subscribers("ESP32_02", "temperature") == {"a"}
+    assert index.subscribers("ESP32_01", "temperature") == {"a", "b"}
+
+    index.unsubscribe("a", [("*", "temperature")])
+    assert index.subscribers("ESP32_02", "temperature") == set()
+    assert index.subscribers("ESP32_01", "temperature") == {"a", "b"}  # Still via ESP32_01/*
+
+    index.unsubscribe("a", [("ESP32_01", "*")])
+    assert index.is_filtered("a")  # No filters left: gets nothing
+    assert index.subscribers("ESP32_01", "temperature") == {"b"}
+    assert index.device_subscribers("ESP32_01") == {"b"}
+
+    index.remove("b")
+    assert not index.is_filtered("b")
+    assert index.subscribers("ESP32_01", "temperature") == set()
+
+
+def test_replace_swaps_filters():
+    index = SubscriptionIndex()
+    index.subscribe("a", [("ESP32_01", "*")])
+    assert index.subscribers("ESP32_01", "temperature") == {"a"}
+    index.subscribe("a", [("ESP32_02", "*")], replace=True)
+    assert index.subscribers("ESP32_01", "temperature") == set()
+    assert index.subscribers("ESP32_02", "temperature") == {"a"}
+    assert index.describe("a") == ["ESP32_02/*"]
+
+
+def test_routes_without_subscribers_are_evicted():
+    index = SubscriptionIndex()
+    index.subscribe("a", [("ESP32_01", "*")])
+    index.subscribe("b", [("*", "temperature")])
+    for i in range(100):
+        index.subscribers(f"DEV_{i}", "vibration")  # Nobody subscribes to these
+        index.subscribers(f"DEV_{i}", "temperature")
+        index.device_subscribers(f"DEV_{i}")
+    index.subscribers("ESP32_01", "vibration")
+    assert len(index._routes) == 201
+
+    index.unsubscribe("b", [("*", "temperature")])
+    assert set(index._routes) == {("ESP32_01", "vibration")}
+    assert set(index._devices) == set()
+    # Evicted routes resolve again on demand
+    index.subscribe("b", [("DEV_1", "vibration")])
+    assert index.subscribers("DEV_1", "vibration") == {"b"}
+
+    index.remove("a")
+    index.remove("b")
+    assert index._routes == {} and index._devices == {}
@@ -0,0 +1,95 @@
+"""TopicTrie against a straightforward reference matcher."""
+import re
+
+import pytest
+
+from mqtt_broker import TopicTrie, topic_matches
+
+
+def reference_match(topic, topic_filter):
+    """MQTT 3.1.1 section 4.7 as a regular expression, one filter at a time."""
+    if topic.startswith("$") and topic_filter[:1] in ("+", "#"):
+        return False
+    pattern = ""
+    for i, level in enumerate(topic_filter.split("/")):
+        sep = "/" if i else ""
+        if level == "#":
+            # Matches the parent level too: 'a/#' matches 'a'
+            pattern += f"(?:{sep}.*)?" if i else ".*"
+            break
+        pattern += sep + ("[^/]*" if level == "+" else re.escape(level))
+    return re.fullmatch(pattern, topic) is not None
+
+
+CASES = [
+    # filter, topic, matches
+    ("sport/tennis/player1", "sport/tennis/player1", True),
+    ("sport/tennis/player1", "sport/tennis/player2", False),
+    ("sport/tennis/+", "sport/tennis/player1", True),
+    ("sport/tennis/+", "sport/tennis", False),
+    ("sport/tennis/+", "sport/tennis/player1/ranking", False),
+    ("sport/+/player1", "sport/tennis/player1", True),
+    ("+/+", "/finance", True),
+    ("/+", "/finance", True),
+    ("+", "/finance", False),
+    ("+", "finance", True),
+    ("sport/+", "sport/", True),
+    ("sport/#", "sport/tennis/player1", True),
+    ("sport/#", "sport", True),  # Parent level
+    ("sport/tennis/#", "sport/tennis", True),
+    ("sport/tennis/#", "sport/tennisplayer", False),
+    ("sport/#", "sports", False),
+    ("#", "sport/tennis", True),
+    ("#", "/", True),
+    ("+/tennis/#", "sport/tennis/player1", True),
+    ("+/tennis/#", "sport/tennis", True),
+    ("#", "$SYS/broker/clients", False),
+    ("+/broker/clients", "$SYS/broker/clients", False),
+    ("+", "$SYS", False),
+    ("$SYS/#", "$SYS/broker/clients", True),
+    ("$SYS/#", "$SYS", True),
+    ("$SYS/+/clients", "$SYS/broker/clients", True),
+    ("app/device/+/telemetry", "app/device/D1/telemetry", True),
+    ("app/device/+/telemetry", "app/device/D1/status", False),
+]
+
+FILTERS = sorted({f for f, _, _ in CASES})
+TOPICS = sorted({t for _, t, _ in CASES})
+
+
+@pytest.mark.parametrize("topic_filter, topic, expected", CASES)
+def test_reference_matcher(topic_filter, topic, expected):
+    assert reference_match(topic, topic_filter) is expected
+    assert topic_matches(topic, topic_filter) is expected
+
+
+@pytest.mark.parametrize("topic", TOPICS)
+def test_trie_matches_reference_for_every_filter(topic):
+    trie = TopicTrie()
+    for i, topic_filter in enumerate(FILTERS):
+        trie.subscribe(topic_filter, f"c{i}")
+    expected = {f"c{i}" for i, f in enumerate(FILTERS) if reference_match(topic, f)}
+    assert set(trie.match(topic)) == expected
+
+
+def test_overlapping_filters_match_once_at_highest_qos():
+    trie = TopicTrie()
+    trie.subscribe("sport/#", "a", qos=0)
+    trie.subscribe("sport/+/player1", "a", qos=1)
+    trie.subscribe("sport/tennis/player1", "b", qos=0)
+    assert trie.match("sport/tennis/player1") == {"a": 1, "b": 0}
+    assert trie.match("sport/golf") == {"a": 0}
+
+
+def test_unsubscribe_and_remove_client_prune_the_tree():
+    trie = TopicTrie()
+    trie.subscribe("a/+/c", "x")
+    trie.subscribe("a/#", "x")
+    trie.subscribe("a/b/c", "y")
+    trie.unsubscribe("a/+/c", "x")
+    assert trie.match("a/b/c") == {"x": 0, "y": 0}
+    trie.remove_client("x")
+    assert trie.match("a/b/c") == {"y": 0}
+    trie.unsubscribe("a/b/c", "y")
+    assert trie.root.children == {}
+    assert not trie.filters
@@ -0,0 +1,83 @@
+"""SegmentStore: sealing, WAL replay and recovery from a torn WAL."""
+import os
+
+from tsdb import SegmentStore
+
+
+def fill(store, points, device_id="D1", key="temperature"):
+    for ts, value in points:
+        store.append(device_id, key, ts, value)
+
+
+def segment_files(data_dir, device_id="D1", key="temperature"):
+    path = os.path.join(data_dir, device_id, key)
+    return sorted(n for n in os.listdir(path) if n.endswith(".seg"))
+
+
+def test_segments_sharing_a_first_timestamp_are_all_kept(tmp_path):
+    # A burst clamped to one timestamp spans several segments
+    points = [(1000.0, float(i)) for i in range(12)]
+    store = SegmentStore(str(tmp_path), segment_points=4)
+    fill(store, points)
+    store.sync()
+    assert len(segment_files(str(tmp_path))) == 3
+    store.close()
+
+    reopened = SegmentStore(str(tmp_path), segment_points=4)
+    assert reopened.read("D1", "temperature") == points
+    reopened.close()
+
+
+def test_negative_timestamps_read_back_in_order(tmp_path):
+    points = [(float(t), float(t)) for t in range(-10, 6)]
+    store = SegmentStore(str(tmp_path), segment_points=4)
+    fill(store, points)
+    store.close()
+
+    reopened = SegmentStore(str(tmp_path), segment_points=4)
+    assert reopened.read("D1", "temperature") == points
+    assert reopened.read("D1", "temperature", start=-2, end=1) == points[8:12]
+    reopened.close()
+
+
+def test_wal_replay_after_crash(tmp_path):
+    # 6 points: one sealed segment of 4 plus a 2 point tail only in the WAL
+    points = [(1000.0 + i, float(i)) for i in range(6)]
+    store = SegmentStore(str(tmp_path), segment_points=4)
+    fill(store, points)
+    store.sync()  # No close(): the process dies here
+
+    reopened = SegmentStore(str(tmp_path), segment_points=4)
+    assert reopened.read("D1", "temperature") == points
+    reopened.close()
+
+
+def test_wal_replay_keeps_unsealed_points_at_the_last_sealed_timestamp(tmp_path):
+    points = [(1000.0, float(i)) for i in range(6)]
+    store = SegmentStore(str(tmp_path), segment_points=4)
+    fill(store, points)
+    store.sync()
+
+    reopened = SegmentStore(str(tmp_path), segment_points=4)
+    assert reopened.read("D1", "temperature") == points
+    reopened.close()
+
+
+def test_torn_wal_tail_is_discarded(tmp_path):
+    points = [(1000.0 + i, float(i)) for i in range(3)]
+    store = SegmentStore(str(tmp_path))
+    fill(store, points)
+    store.sync()
+    wal_size = os.path.getsize(store.wal_path)
+    with open(store.wal_path, "ab") as f:
+        f.write(b"\x12\x34\x56")  # A record cut short by the crash
+
+    reopened = SegmentStore(str(tmp_path))
+    assert reopened.read("D1", "temperature") == points
+    assert os.path.getsize(reopened.wal_path) == wal_size
+    fill(reopened, [(2000.0, 9.0)])
+    reopened.close()
+
+    again = SegmentStore(str(tmp_path))
+    assert again.read("D1", "temperature") == points + [(2000.0, 9.0)]
+    again.close()
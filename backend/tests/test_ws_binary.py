@@ -0,0 +1,159 @@
+"""ws_binary frames decoded by the dashboard's decoder (frontend/src/wsBinaryProtocol.js)."""
+import json
+import math
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import ws_binary
+from ws_binary import (KIND_JSON, TYPE_FLOAT32, TYPE_FLOAT64, TYPE_INT16, BinaryFrameEncoder,
+                       FrameTables, timestamp_ms)
+
+DECODER = os.path.join(os.path.dirname(__file__), "..", "..", "frontend", "src",
+                       "wsBinaryProtocol.js")
+NODE = shutil.which("node")
+
+RUNNER = """
+import { createFrameDecoder } from './wsBinaryProtocol.mjs';
+import { readFileSync } from 'fs';
+const decode = createFrameDecoder();
+const frames = JSON.parse(readFileSync(process.argv[2]));
+console.log(JSON.stringify(frames.map((hex) => {
+  const b = Buffer.from(hex, 'hex');
+  return decode(b.buffer.slice(b.byteOffset, b.byteOffset + b.length));
+})));
+"""
+
+
+@pytest.fixture
+def decode(tmp_path):
+    """Decode one connection's frames, in order, with the JS decoder."""
+    if NODE is None:
+        pytest.skip("node is not installed")
+    shutil.copy(DECODER, tmp_path / "wsBinaryProtocol.mjs")
+    (tmp_path / "run.mjs").write_text(RUNNER)
+
+    def run(frames):
+        path = tmp_path / "frames.json"
+        path.write_text(json.dumps([frame.hex() for frame in frames]))
+        out = subprocess.run([NODE, str(tmp_path / "run.mjs"), str(path)],
+                             capture_output=True, text=True, check=True)
+        return json.loads(out.stdout)
+    return run
+
+
+def update(device_id, telemetry, timestamp="2026-10-17T12:00:00"):
+    return {"type": "telemetry_update", "device_id": device_id,
+            "telemetry": telemetry, "timestamp": timestamp}
+
+
+def batch(*updates):
+    return {"type": "telemetry_batch",
+            "updates": [{k: v for k, v in u.items() if k != "type"} for u in updates]}
+
+
+def decoded(message):
+    """What the decoder yields for a telemetry message: timestamps in ms."""
+    if message.get("type") == "telemetry_batch":
+        return {**message, "updates": [decoded(u) for u in message["updates"]]}
+    if "timestamp" in message:
+        return {**message, "timestamp": timestamp_ms(message["timestamp"])}
+    return message
+
+
+TELEMETRY = {
+    "count": 42,                    # int16
+    "temperature": 21.5,            # int16 / 10
+    "humidity": 45.25,              # int16 / 100
+    "pressure": 1.013,              # int16 / 1000
+    "vibration": 0.1234567,         # float32
+    "energy": 123456.789012,        # float64
+    "pi": math.pi,                  # float64
+    "total": 100000,                # int32
+    "uptime_ms": 2 ** 40,           # float64 (exact)
+    "running": True,
+    "fault": False,
+    "error": None,
+    "mode": "auto",                 # Interned string
+    "note": "x" * 40,               # Inline string
+    "config": {"limits": [1, 2.5]},  # JSON
+}
+
+
+@pytest.mark.parametrize("value, value_type", [
+    (42.0, TYPE_INT16), (-3.0, TYPE_INT16), (21.5, 10), (-0.25, 11), (1.013, 12),
+    (0.1234567, TYPE_FLOAT32), (40000.5, TYPE_FLOAT32),
+    (math.pi, TYPE_FLOAT64), (123456.789012, TYPE_FLOAT64), (1e39, TYPE_FLOAT64),
+    (float("inf"), TYPE_FLOAT32), (float("nan"), TYPE_FLOAT64),
+])
+def test_float_value_types(value, value_type):
+    assert ws_binary._float(value)[0] == value_type
+
+
+def test_integers_beyond_a_double_are_sent_as_json():
+    value_type, payload = FrameTables()._value(2 ** 60 + 1, {})
+    assert value_type == ws_binary.TYPE_JSON
+    assert payload[4:] == b"1152921504606846977"
+
+
+def test_every_value_type_round_trips(decode):
+    encoder = BinaryFrameEncoder(FrameTables())
+    messages = [
+        update("D1", TELEMETRY),
+        update("D1", {**TELEMETRY, "temperature": 22.5}),  # Same layout, no definitions
+        batch(update("D1", {"temperature": 21.6}),
+              update("D2", {"temperature": 19.0, "mode": "auto"}, "2026-10-17T12:00:01.250"),
+              update("D3", {"temperature": 18.0}, None)),
+        batch(update("D1", {"temperature": 21.7}), update("D2", {"temperature": 19.1})),
+        {"type": "device_status", "device_id": "D1", "status": "online"},
+    ]
+    frames = [encoder.encode(m) for m in messages]
+    assert frames[1][1] & ws_binary.FLAG_DICTIONARY == 0
+    assert frames[2][1] & ws_binary.FLAG_OFFSETS
+    assert frames[4][0] == KIND_JSON
+    assert decode(frames) == [decoded(m) for m in messages]
+
+
+def test_each_connection_gets_the_definitions_it_lacks(decode):
+    tables = FrameTables()
+    early, late = BinaryFrameEncoder(tables), BinaryFrameEncoder(tables)
+    first = update("D1", {"temperature": 21.5, "mode": "auto"})
+    second = batch(update("D1", {"temperature": 21.6, "mode": "auto"}),
+                   update("D2", {"humidity": 40.0, "mode": "manual"}))
+    early.encode(first)
+    # Encoded once for both; the late client's frame carries D1's definitions too
+    assert decode([late.encode(second)]) == [decoded(second)]
+    assert len(late.encode(second)) < len(ws_binary.serialization.dumps(second))
+    assert tables.encoded == 2 and tables.cache_hits == 1
+
+
+def test_string_values_past_the_intern_limit_go_inline(decode, monkeypatch):
+    monkeypatch.setattr(ws_binary, "MAX_INTERNED_NAMES", 3)  # mode, auto, D1
+    encoder = BinaryFrameEncoder(FrameTables())
+    messages = [update("D1", {"mode": "auto"}), update("D1", {"mode": "manual"}),
+                update("D1", {"mode": "auto"})]  # Already interned: still by id
+    frames = [encoder.encode(m) for m in messages]
+    assert frames[1].endswith(b"\x06\x00manual")
+    assert decode(frames) == [decoded(m) for m in messages]
+
+
+def test_full_tables_fall_back_to_json_frames(decode, monkeypatch):
+    monkeypatch.setattr(ws_binary, "MAX_IDS", 3)
+    tables = FrameTables()
+    encoder = BinaryFrameEncoder(tables)
+    messages = [
+        update("D1", {"temperature": 21.5}),                # Names D1, temperature
+        batch(update("D1", {"temperature": 20.0}),          # D2 fits, D3 does not
+              update("D2", {"temperature": 20.0}),
+              update("D3", {"temperature": 20.0})),
+        update("D1", {"temperature": 21.6}),                # Known ids: binary again
+        update("D4", {"humidity": 40.0}),                   # Layout table full
+    ]
+    frames = [encoder.encode(m) for m in messages]
+    assert [frame[0] for frame in frames] == [2, KIND_JSON, 2, KIND_JSON]
+    assert tables.json_frames == 2
+    out = decode(frames)
+    # JSON frames are the message itself (ISO timestamps)
+    assert out == [decoded(messages[0]), messages[1], decoded(messages[2]), messages[3]]
@@ -0,0 +1,133 @@
+"""ClientConnection: per-client queues and slow-consumer policies."""
+import asyncio
+
+import serialization
+from ws_clients import (OVERFLOW_DISCONNECT, OVERFLOW_DROP_OLDEST, SLOW_CONSUMER_CLOSE_CODE,
+                        ClientConnection)
+
+
+class FakeWebSocket:
+    """Records frames; send_bytes blocks while `stalled` is set (a slow link)."""
+
+    client = None
+
+    def __init__(self, stalled=False):
+        self.frames = []
+        self.flowing = asyncio.Event()
+        if not stalled:
+            self.flowing.set()
+        self.close_code = None
+
+    async def send_bytes(self, frame):
+        await self.flowing.wait()
+        self.frames.append(serialization.loads(frame))
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+
+def message(seq):
+    return {"type": "device_status", "device_id": "D1", "seq": seq}
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_drop_oldest_keeps_the_newest_messages_for_a_slow_client():
+    async def scenario():
+        slow_socket, fast_socket = FakeWebSocket(stalled=True), FakeWebSocket()
+        slow = ClientConnection(slow_socket, max_queue=3, overflow_policy=OVERFLOW_DROP_OLDEST)
+        fast = ClientConnection(fast_socket, max_queue=3, overflow_policy=OVERFLOW_DROP_OLDEST)
+        slow.start()
+        fast.start()
+        await settle()
+
+        for seq in range(10):
+            assert slow.enqueue(message(seq))
+            assert fast.enqueue(message(seq))
+            await settle()
+        # The writer holds seq 0 in send_bytes; 1..9 went through a 3 slot queue
+        assert [m["seq"] for m, _, _ in slow.queue] == [7, 8, 9]
+        assert slow.dropped == 6
+        assert slow.metrics()["queue_depth"] == 3
+        # The slow client never delayed the fast one
+        assert [m["seq"] for m in fast_socket.frames] == list(range(10))
+
+        slow_socket.flowing.set()
+        await settle()
+        assert [m["seq"] for m in slow_socket.frames] == [0, 7, 8, 9]
+        assert not slow.closed
+        slow.close()
+        fast.close()
+
+    asyncio.run(scenario())
+
+
+def test_disconnect_policy_closes_a_slow_client():
+    async def scenario():
+        socket = FakeWebSocket(stalled=True)
+        closed = []
+        client = ClientConnection(socket, max_queue=3, overflow_policy=OVERFLOW_DISCONNECT,
+                                  on_close=closed.append)
+        client.start()
+        await settle()
+
+        assert client.enqueue(message(0))
+        await settle()  # seq 0 is now stuck in send_bytes
+        results = [client.enqueue(message(seq)) for seq in range(1, 6)]
+        # 1..3 fill the queue, seq 4 overflows
+        assert results == [True, True, True, False, False]
+        assert client.closed
+        assert closed == [client]
+        assert not client.queue
+        await settle()
+        assert socket.close_code == SLOW_CONSUMER_CLOSE_CODE
+
+    asyncio.run(scenario())
+
+
+def telemetry(device_id, timestamp=None, **values):
+    return {"type": "telemetry_update", "device_id": device_id, "telemetry": values,
+            "timestamp": timestamp}
+
+
+def test_conflation_sends_the_latest_value_per_key():
+    async def scenario():
+        socket = FakeWebSocket(stalled=True)
+        client = ClientConnection(socket)
+        client.start()
+        client.set_max_rate(5)  # One delta per 200 ms; the burst below fits in one window
+
+        for seq in range(50):
+            client.enqueue(telemetry("D1", vibration=seq, timestamp=seq))
+            if seq % 10 == 0:
+                client.enqueue(telemetry("D1", temperature=20 + seq))
+        client.enqueue(telemetry("D2", pressure=1.5))
+        client.enqueue(message(0))  # Not telemetry: queued as is
+        assert client.conflated == 50 + 5 + 1 - 2
+        assert [m["type"] for m, _, _ in client.queue] == ["device_status"]
+
+        await asyncio.sleep(0.3)  # One tick
+        socket.flowing.set()
+        await settle()
+        status, delta = socket.frames
+        assert status == message(0)
+        assert delta["type"] == "telemetry_batch"
+        assert delta["updates"][0]["timestamp"] == 49
+        assert {u["device_id"]: u["telemetry"] for u in delta["updates"]} == {
+            "D1": {"vibration": 49, "temperature": 60},
+            "D2": {"pressure": 1.5},
+        }
+
+        # Newer values after the tick go out in the next delta, not before
+        client.enqueue(telemetry("D1", vibration=99))
+        await settle()
+        assert len(socket.frames) == 2
+        client.set_max_rate(None)  # Turning conflation off flushes what is pending
+        await settle()
+        assert socket.frames[2]["telemetry"] == {"vibration": 99}
+        client.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,506 @@
+"""
+Embedded Time-Series Persistence
+Append-only columnar segment files per (device_id, key) with a write-ahead log.
+
+Layout under the data directory:
+    wal.log                              write-ahead log of recent samples
+    <device>/<key>/<first_ts_ms>-<seq>.seg  immutable, compressed segments
+
+Each segment holds up to `segment_points` samples:
+    header   "TSG1", version, count, first_ts_ms, last_ts_ms, ts_len, val_len
+    ts block zlib(byte-shuffled int64 timestamp deltas in ms)
+    values   zlib(byte-shuffled float64 values)
+
+Byte shuffling groups the Nth byte of every value together so that the
+slowly-changing exponent/high bytes form long runs zlib compresses well.
+Samples go to the WAL first and into an in-memory tail per series; full tails
+are sealed into segments by sync(), off the caller's thread. Checkpoints seal
+tails that are worth a segment and rewrite the WAL with the rest, so small
+tails never become tiny segment files. Segments are memory-mapped and decoded
+on demand, and nothing but the WAL is read at startup.
+"""
+import mmap
+import os
+import struct
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+SEGMENT_MAGIC = b"TSG1"
+SEGMENT_VERSION = 1
+SEGMENT_HEADER = struct.Struct("<4sBIqqII")  # magic, version, count, first, last, ts_len, val_len
+
+# crc32, ts_ms, value, device_len, key_len (device and key bytes follow)
+WAL_RECORD = struct.Struct("<IqdHH")
+WAL_BODY_OFFSET = 4  # crc covers everything after itself
+
+
+def _shuffle(raw: bytes, width: int = 8) -> bytes:
+    """Group byte i of every element together (transpose an n x width matrix)."""
+    return b"".join(raw[i::width] for i in range(width))
+
+
+def _unshuffle(data: bytes, count: int, width: int = 8) -> bytearray:
+    out = bytearray(count * width)
+    for i in range(width):
+        out[i::width] = data[i * count:(i + 1) * count]
+    return out
+
+
+def encode_segment(timestamps: array, values: array) -> bytes:
+    """Encode ms timestamps (int64) and float64 values into a segment blob."""
+    count = len(timestamps)
+    first = timestamps[0]
+    deltas = array("q", [0])
+    deltas.extend(b - a for a, b in zip(timestamps, timestamps[1:]))
+    ts_block = zlib.compress(_shuffle(deltas.tobytes()), 6)
+    val_block = zlib.compress(_shuffle(values.tobytes()), 6)
+    header = SEGMENT_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION, count, first,
+                                 timestamps[-1], len(ts_block), len(val_block))
+    return header + ts_block + val_block
+
+
+def decode_segment(buf) -> Tuple[array, array]:
+    """Decode a segment blob (bytes or mmap) into (timestamps_ms, values)."""
+    magic, version, count, first, _, ts_len, val_len = SEGMENT_HEADER.unpack_from(buf, 0)
+    if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+        raise ValueError("Not a TSG1 segment")
+    pos = SEGMENT_HEADER.size
+    deltas = array("q")
+    deltas.frombytes(_unshuffle(zlib.decompress(buf[pos:pos + ts_len]), count))
+    pos += ts_len
+    values = array("d")
+    values.frombytes(_unshuffle(zlib.decompress(buf[pos:pos + val_len]), count))
+    timestamps = array("q", accumulate(deltas, initial=first))
+    timestamps.pop(0)  # `initial` is emitted before the zero first delta
+    return timestamps, values
+
+
+class TimeSeriesStore(ABC):
+    """
+    Storage interface for durable numeric telemetry history.
+
+    Timestamps are epoch seconds (floats); values are floats.
+    """
+
+    @abstractmethod
+    def append(self, device_id: str, key: str, timestamp: float, value: float):
+        """Record one sample."""
+
+    @abstractmethod
+    def read(self, device_id: str, key: str, start: Optional[float] = None,
+             end: Optional[float] = None, limit: Optional[int] = None) -> List[Tuple[float, float]]:
+        """Samples in [start, end], oldest first; `limit` keeps the newest N."""
+
+    @abstractmethod
+    def series(self) -> Dict[str, List[str]]:
+        """All stored series as device_id -> [keys]."""
+
+    def sync(self):
+        """Make everything appended so far durable."""
+
+    def close(self):
+        """Flush and release resources."""
+
+
+def _segment_seq(name: str) -> int:
+    """Per-series sequence number of a segment file (0 for <first_ts_ms>.seg)."""
+    stem = name[:-len(".seg")]
+    return int(stem.rsplit("-", 1)[1]) if "-" in stem[1:] else 0
+
+
+class _Segment:
+    """Header of one sealed segment file; the body is mapped on demand."""
+
+    __slots__ = ("path", "seq", "count", "first", "last", "size")
+
+    def __init__(self, path: str):
+        self.seq = _segment_seq(os.path.basename(path))
+        with open(path, "rb") as f:
+            header = f.read(SEGMENT_HEADER.size)
+        magic, version, self.count, self.first, self.last, ts_len, val_len = SEGMENT_HEADER.unpack(header)
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            raise ValueError(f"Not a TSG1 segment: {path}")
+        self.path = path
+        self.size = SEGMENT_HEADER.size + ts_len + val_len
+
+
+class _Series:
+    """One (device, key): sealed segment list (lazy) plus the in-memory tail."""
+
+    __slots__ = ("path", "segments", "next_seq", "pending", "tail_ts", "tail_values", "wal_prefix")
+
+    def __init__(self, path: str, device_id: str, key: str):
+        self.path = path
+        self.segments: Optional[List[_Segment]] = None  # Loaded on first use
+        self.next_seq = 0  # Sequence number of the next sealed segment
+        self.pending: List[Tuple[array, array]] = []    # Detached tails not yet sealed
+        self.tail_ts = array("q")
+        self.tail_values = array("d")
+        device_bytes = device_id.encode("utf-8")
+        key_bytes = key.encode("utf-8")
+        self.wal_prefix = (len(device_bytes), len(key_bytes), device_bytes + key_bytes)
+
+    def load_segments(self) -> List[_Segment]:
+        if self.segments is None:
+            names = [n for n in os.listdir(self.path) if n.endswith(".seg")] \
+                if os.path.isdir(self.path) else []
+            # Time order from the headers (names do not sort negative times)
+            segments = sorted((_Segment(os.path.join(self.path, n)) for n in names),
+                              key=lambda segment: (segment.first, segment.seq))
+            self.next_seq = max((segment.seq for segment in segments), default=0) + 1
+            self.segments = segments
+        return self.segments
+
+    def last_sealed_ts(self) -> Optional[int]:
+        segments = self.load_segments()
+        return segments[-1].last if segments else None
+
+
+class SegmentStore(TimeSeriesStore):
+    """
+    Local embedded persistence engine.
+
+    Why: InMemoryStorage forgets everything on restart and keeps 100 points.
+    Segments cost a few bytes per point on disk and survive restarts; the
+    WAL covers points that have not been sealed into a segment yet.
+
+    Durability: appends reach the OS on sync() (call it periodically) and
+    are fsynced there. Sealed segments are written to a temp file, fsynced
+    and atomically renamed.
+
+    Threading: append() and read() never touch the disk beyond mapping
+    segments; sync(), checkpoint() and close() do all file I/O and fsyncs,
+    so callers on an event loop should run them in a worker thread. File
+    I/O happens outside the lock that append() takes.
+    """
+
+    def __init__(self, data_dir: str, segment_points: int = 4096,
+                 max_wal_bytes: int = 16 * 1024 * 1024, max_open_segments: int = 256):
+        self.data_dir = data_dir
+        self.segment_points = segment_points
+        # Checkpoints leave shorter tails in the WAL instead of sealing them
+        self.min_seal_points = max(1, segment_points // 8)
+        self.max_wal_bytes = max_wal_bytes
+        self._wal_limit = max_wal_bytes  # Raised when small tails alone fill the WAL
+        self.max_open_segments = max_open_segments
+
+        os.makedirs(data_dir, exist_ok=True)
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()  # One sync/checkpoint at a time
+        self._to_seal: Dict[_Series, None] = {}  # Series with pending tails
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        # path -> mmap, least recently used first
+        self._maps: "OrderedDict[str, mmap.mmap]" = OrderedDict()
+        # path -> decoded (timestamps, values), for the hot newest segments
+        self._decoded: "OrderedDict[str, Tuple[array, array]]" = OrderedDict()
+
+        self._discover()
+        self.wal_path = os.path.join(data_dir, "wal.log")
+        self._replay_wal()
+        self._wal = open(self.wal_path, "ab")
+        self._wal_buffer = bytearray()
+
+        # Metrics
+        self.points_written = 0
+        self.segments_written = 0
+
+    # ---------- Startup ----------
+
+    def _discover(self):
+        """Register series from the directory tree without reading segments."""
+        for device_dir in os.listdir(self.data_dir):
+            device_path = os.path.join(self.data_dir, device_dir)
+            if not os.path.isdir(device_path):
+                continue
+            for key_dir in os.listdir(device_path):
+                self._get_series(unquote(device_dir), unquote(key_dir))
+
+    def _replay_wal(self):
+        """Rebuild in-memory tails from the WAL after a restart or crash."""
+        if not os.path.exists(self.wal_path):
+            return
+        with open(self.wal_path, "rb") as f:
+            data = f.read()
+
+        pos = replayed = 0
+        sealed: Dict[Tuple[str, str], Optional[int]] = {}
+        # (ts, value) -> count of points at the last sealed ms, per series
+        at_last: Dict[Tuple[str, str], Dict[Tuple[int, float], int]] = {}
+        while pos + WAL_RECORD.size <= len(data):
+            crc, ts, value, dev_len, key_len = WAL_RECORD.unpack_from(data, pos)
+            end = pos + WAL_RECORD.size + dev_len + key_len
+            if end > len(data) or zlib.crc32(data[pos + WAL_BODY_OFFSET:end]) != crc:
+                break  # Torn write at the tail of the log
+            names = data[pos + WAL_RECORD.size:end]
+            device_id = names[:dev_len].decode("utf-8")
+            key = names[dev_len:].decode("utf-8")
+            pos = end
+
+            # Points already sealed into a segment before the crash are
+            # skipped. Several points can share the last sealed ms, so those
+            # are matched one for one against the segment.
+            ident = (device_id, key)
+            series = self._get_series(device_id, key)
+            if ident not in sealed:
+                sealed[ident] = series.last_sealed_ts()
+            last = sealed[ident]
+            if last is not None and ts <= last:
+                if ts < last:
+                    continue
+                seen = at_last.get(ident)
+                if seen is None:
+                    seen = at_last[ident] = self._points_at(series.segments[-1], last)
+                if seen.get((ts, value)):
+                    seen[(ts, value)] -= 1
+                    continue
+            series.tail_ts.append(ts)
+            series.tail_values.append(value)
+            replayed += 1
+
+        if pos < len(data):
+            print(f"[TSDB] Discarding {len(data) - pos} bytes of torn WAL tail")
+            with open(self.wal_path, "r+b") as f:
+                f.truncate(pos)
+        if replayed:
+            print(f"[TSDB] Replayed {replayed} points from WAL")
+
+    def _points_at(self, segment: _Segment, ts: int) -> Dict[Tuple[int, float], int]:
+        """(ts, value) -> count for the points of a segment at `ts` ms."""
+        timestamps, values = decode_segment(self._map(segment.path))
+        counts: Dict[Tuple[int, float], int] = {}
+        for i in range(bisect_left(timestamps, ts), bisect_right(timestamps, ts)):
+            counts[(ts, values[i])] = counts.get((ts, values[i]), 0) + 1
+        return counts
+
+    # ---------- Writes ----------
+
+    def _get_series(self, device_id: str, key: str) -> _Series:
+        series = self._series.get((device_id, key))
+        if series is None:
+            path = os.path.join(self.data_dir, quote(device_id, safe=""), quote(key, safe=""))
+            series = self._series[(device_id, key)] = _Series(path, device_id, key)
+        return series
+
+    @staticmethod
+    def _wal_record(series: _Series, ts: int, value: float) -> bytes:
+        dev_len, key_len, names = series.wal_prefix
+        record = WAL_RECORD.pack(0, ts, value, dev_len, key_len) + names
+        crc = zlib.crc32(memoryview(record)[WAL_BODY_OFFSET:])
+        return struct.pack("<I", crc) + record[WAL_BODY_OFFSET:]
+
+    def append(self, device_id: str, key: str, timestamp: float, value: float):
+        ts = int(timestamp * 1000)
+        value = float(value)
+        with self._lock:
+            series = self._get_series(device_id, key)
+            self._wal_buffer += self._wal_record(series, ts, value)
+            series.tail_ts.append(ts)
+            series.tail_values.append(value)
+            self.points_written += 1
+            if len(series.tail_ts) >= self.segment_points:
+                self._detach(series)
+
+    def _detach(self, series: _Series):
+        """Queue a series' tail for sealing by the next sync(); it stays readable."""
+        series.pending.append((series.tail_ts, series.tail_values))
+        series.tail_ts = array("q")
+        series.tail_values = array("d")
+        self._to_seal[series] = None
+
+    def _seal_pending(self):
+        """Write every detached tail out as an immutable segment."""
+        with self._lock:
+            work = [(series, list(series.pending)) for series in self._to_seal]
+            self._to_seal = {}
+        for index, (series, chunks) in enumerate(work):
+            try:
+                for timestamps, values in chunks:
+                    self._seal(series, timestamps, values)
+            except OSError:
+                with self._lock:  # Retried by the next sync()
+                    self._to_seal.update(dict.fromkeys(s for s, _ in work[index:]))
+                raise
+
+    def _seal(self, series: _Series, timestamps: array, values: array):
+        # Loaded before the file appears, so a read cannot list the new
+        # segment while its chunk is still pending
+        with self._lock:
+            series.load_segments()
+            seq = series.next_seq
+            series.next_seq += 1
+
+        # Encoding, fsync and rename run without the lock; appends continue.
+        # Sequence numbers keep names unique when first timestamps repeat.
+        os.makedirs(series.path, exist_ok=True)
+        blob = encode_segment(timestamps, values)
+        path = os.path.join(series.path, f"{timestamps[0]}-{seq:06d}.seg")
+        if os.path.exists(path):
+            raise FileExistsError(f"Segment already exists: {path}")
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        segment = _Segment(path)
+        with self._lock:
+            # Hand over in one step, so a read sees the chunk exactly once
+            series.segments.append(segment)
+            series.pending = [chunk for chunk in series.pending if chunk[0] is not timestamps]
+            self.segments_written += 1
+
+    def sync(self):
+        """Write buffered WAL records and fsync, seal full tails, checkpoint if the WAL is large."""
+        with self._io_lock:
+            with self._lock:
+                buffer, self._wal_buffer = self._wal_buffer, bytearray()
+            if buffer:
+                self._wal.write(buffer)
+                self._wal.flush()
+                os.fsync(self._wal.fileno())
+            self._seal_pending()
+            if self._wal.tell() >= self._wal_limit:
+                self._checkpoint()
+
+    def checkpoint(self):
+        """Seal tails worth a segment and rewrite the WAL with the rest."""
+        with self._io_lock:
+            self._checkpoint()
+
+    def _checkpoint(self):
+        with self._lock:
+            for series in self._series.values():
+                if len(series.tail_ts) >= self.min_seal_points:
+                    self._detach(series)
+        self._seal_pending()
+
+        # The new log holds everything not sealed yet (tails detached while
+        # sealing included); appends from here on are buffered for it
+        with self._lock:
+            self._wal_buffer = bytearray()
+            unsealed = [(series, timestamps[:], values[:])
+                        for series in self._series.values()
+                        for timestamps, values in series.pending + [(series.tail_ts, series.tail_values)]
+                        if timestamps]
+        tmp = self.wal_path + ".tmp"
+        with open(tmp, "wb") as f:
+            for series, timestamps, values in unsealed:
+                f.write(b"".join(self._wal_record(series, ts, value)
+                                 for ts, value in zip(timestamps, values)))
+            f.flush()
+            os.fsync(f.fileno())
+        self._wal.close()
+        os.replace(tmp, self.wal_path)
+        self._wal = open(self.wal_path, "ab")
+        self._wal_limit = max(self.max_wal_bytes, 2 * self._wal.tell())
+
+    def close(self):
+        with self._io_lock:
+            self._checkpoint()
+            self._wal.close()
+        with self._lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+            self._decoded.clear()
+
+    # ---------- Reads ----------
+
+    def _map(self, path: str) -> mmap.mmap:
+        mapped = self._maps.get(path)
+        if mapped is not None:
+            self._maps.move_to_end(path)
+            return mapped
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps[path] = mapped
+        if len(self._maps) > self.max_open_segments:
+            _, oldest = self._maps.popitem(last=False)
+            oldest.close()
+        return mapped
+
+    def _decode(self, segment: _Segment) -> Tuple[array, array]:
+        decoded = self._decoded.get(segment.path)
+        if decoded is not None:
+            self._decoded.move_to_end(segment.path)
+            return decoded
+        decoded = decode_segment(self._map(segment.path))
+        self._decoded[segment.path] = decoded
+        if len(self._decoded) > 64:
+            self._decoded.popitem(last=False)
+        return decoded
+
+    def _chunks(self, series: _Series) -> Iterator[Tuple[int, int, Any]]:
+        """(first_ms, last_ms, loader) for each segment and the tail, oldest first."""
+        for segment in series.load_segments():
+            yield segment.first, segment.last, (lambda s=segment: self._decode(s))
+        for chunk in series.pending:
+            yield chunk[0][0], chunk[0][-1], (lambda c=chunk: c)
+        if series.tail_ts:
+            tail = (series.tail_ts, series.tail_values)
+            yield series.tail_ts[0], series.tail_ts[-1], (lambda: tail)
+
+    def read(self, device_id: str, key: str, start: Optional[float] = None,
+             end: Optional[float] = None, limit: Optional[int] = None) -> List[Tuple[float, float]]:
+        with self._lock:
+            series = self._series.get((device_id, key))
+            if series is None:
+                return []
+            lo = int(start * 1000) if start is not None else None
+            hi = int(end * 1000) if end is not None else None
+
+            # Walk newest -> oldest so `limit` can stop early
+            parts: List[Tuple[array, array]] = []
+            found = 0
+            for first, last, load in reversed(list(self._chunks(series))):
+                if hi is not None and first > hi:
+                    continue
+                if lo is not None and last < lo:
+                    break
+                timestamps, values = load()
+                i = bisect_left(timestamps, lo) if lo is not None else 0
+                j = bisect_right(timestamps, hi) if hi is not None else len(timestamps)
+                if i < j:
+                    parts.append((timestamps[i:j], values[i:j]))
+                    found += j - i
+                if limit is not None and found >= limit:
+                    break
+
+        points: List[Tuple[float, float]] = []
+        for timestamps, values in reversed(parts):
+            points.extend(zip((t / 1000 for t in timestamps), values))
+        if limit is not None:
+            points = points[-limit:]
+        return points
+
+    def last(self, device_id: str, key: str) -> Optional[Tuple[float, float]]:
+        """Most recent stored sample of a series."""
+        points = self.read(device_id, key, limit=1)
+        return points[0] if points else None
+
+    def series(self) -> Dict[str, List[str]]:
+        result: Dict[str, List[str]] = {}
+        for device_id, key in self._series:
+            result.setdefault(device_id, []).append(key)
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Write counters and on-disk footprint."""
+        with self._lock:
+            disk = sum(seg.size for s in self._series.values() for seg in s.load_segments())
+            return {
+                "series": len(self._series),
+                "points_written": self.points_written,
+                "segments_written": self.segments_written,
+                "segment_bytes": disk,
+                "wal_bytes": self._wal.tell() + len(self._wal_buffer),
+                "pending_segments": sum(len(s.pending) for s in self._series.values()),
+                "open_segment_maps": len(self._maps),
+            }
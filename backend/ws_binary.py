@@ -0,0 +1,345 @@
+"""
+Binary WebSocket Subprotocol for /ws/live
+Compact telemetry frames for dashboards that negotiate `iot-telemetry.v1`.
+
+A client opts in through the WebSocket handshake
+(`new WebSocket(url, ["iot-telemetry.v1"])`); everyone else keeps getting
+JSON. Every frame is binary and starts with a kind byte:
+
+    0  JSON message (UTF-8 JSON follows): everything except telemetry
+    1  telemetry_batch
+    2  telemetry_update (one update)
+
+Telemetry frames (little-endian) continue with:
+
+    u8  flags          1: dictionary section follows
+                       2: updates carry their own timestamp offsets
+    dictionary section (flag 1):
+        u16 names      each: u16 id, u16 byte length, UTF-8
+        u16 layouts    each: u16 id, u16 key count,
+                       then (u16 name id, u8 type) per key
+    f64 base_ms        integer milliseconds since the epoch (UTC); without
+                       flag 2 every update has this timestamp
+    u32 updates        (telemetry_batch only)
+        each: u16 device name id, u16 layout id,
+              [i32 ms offset from base_ms, INT32_MIN = none] (flag 2),
+              then each layout key's value, packed by the key's type
+
+Value types and their payloads:
+
+    0 float32 (rounded to 7 significant digits by the decoder)
+    1 float64    2 int32    3 false    4 true    5 null (no payload)
+    6 string (u16 length + UTF-8)      7 JSON (u32 length + UTF-8)
+    8 interned string (u16 name id)
+    9 int16    10/11/12 int16 divided by 10/100/1000
+
+Device ids, key names and short string values are interned as names; a
+layout (the ordered keys of one update and the type of each value) is
+interned the same way, so a steady device costs 4 bytes plus its packed
+values. Every type decodes to exactly the value that was sent: a float
+only goes as a scaled int16 or a float32 when that round-trips, otherwise
+as float64.
+
+Ids come from one FrameTables per process, so the body of a frame is
+encoded once and shared by every binary client. Each connection remembers
+which definitions it has been sent; its frames carry only the ones it is
+missing. Frames are finished by the connection's writer right before they
+are sent, so a frame dropped or coalesced from the queue never takes
+definitions the client needs with it.
+"""
+import functools
+import struct
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import serialization
+
+PROTOCOL = "iot-telemetry.v1"
+
+KIND_JSON, KIND_BATCH, KIND_UPDATE = 0, 1, 2
+FLAG_DICTIONARY, FLAG_OFFSETS = 1, 2
+(TYPE_FLOAT32, TYPE_FLOAT64, TYPE_INT32, TYPE_FALSE, TYPE_TRUE, TYPE_NULL,
+ TYPE_STRING, TYPE_JSON, TYPE_NAME, TYPE_INT16) = range(10)
+# (type, scale): floats sent as round(value * scale) in an int16
+DECIMAL_TYPES = ((TYPE_INT16, 1.0), (10, 10.0), (11, 100.0), (12, 1000.0))
+
+NO_TIMESTAMP = -2 ** 31
+MAX_IDS = 0xFFFF            # Names and layouts per process (u16 ids)
+MAX_INTERNED_NAMES = 16384  # Stop interning string values past this many names
+MAX_INTERNED_LENGTH = 32    # Longer string values are sent inline
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I16 = struct.Struct("<h")
+_I32 = struct.Struct("<i")
+_F32 = struct.Struct("<f")
+_F64 = struct.Struct("<d")
+_LAYOUT_KEY = struct.Struct("<HB")
+_DEFINITION = struct.Struct("<HH")  # id + byte length / key count
+_UPDATE = struct.Struct("<HH")
+_UPDATE_OFFSET = struct.Struct("<HHi")
+_UPDATE_FIELDS = {"device_id", "telemetry", "timestamp"}
+
+_EPOCH = datetime(1970, 1, 1)
+_MS = timedelta(milliseconds=1)
+
+
+@functools.lru_cache(maxsize=4096)
+def timestamp_ms(value: Any) -> Optional[int]:
+    """Milliseconds since the epoch for a datetime or ISO string (naive = UTC)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    elif not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MS
+
+
+class _Full(Exception):
+    """The name or layout table ran out of ids; send JSON instead."""
+
+
+class SharedFrame:
+    """The connection-independent part of one encoded message."""
+
+    __slots__ = ("kind", "flags", "tail", "names", "layouts", "complete")
+
+    def __init__(self, kind: int, flags: int, tail: bytes, names=(), layouts=()):
+        self.kind = kind
+        self.flags = flags
+        self.tail = tail        # Everything after the dictionary section
+        self.names = names      # Name ids the frame uses
+        self.layouts = layouts  # Layout ids the frame uses
+        # The whole frame for a connection that already has every definition
+        self.complete = bytes((kind, flags)) + tail
+
+
+class FrameTables:
+    """
+    Process-wide name and layout ids, plus the last few encoded messages.
+
+    Why: Broadcasting hands the same message dict to every client; with
+    shared ids its frame body is packed once instead of once per client.
+    """
+
+    def __init__(self, cache_size: int = 256):
+        self.names: Dict[str, int] = {}
+        self.name_definitions: List[bytes] = []
+        self.layouts: Dict[tuple, int] = {}  # (key name ids, value types) -> id
+        self.layout_definitions: List[bytes] = []
+        self._key_ids: Dict[tuple, tuple] = {}  # Telemetry keys -> name ids
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[int, tuple]" = OrderedDict()  # id(message) -> (message, frame)
+
+        # Metrics
+        self.encoded = 0
+        self.cache_hits = 0
+        self.telemetry_frames = 0
+        self.json_frames = 0
+
+    def encode(self, message: Dict[str, Any]) -> SharedFrame:
+        """Encode a message once, however many connections send it."""
+        cached = self._cache.get(id(message))
+        if cached is not None and cached[0] is message:
+            self.cache_hits += 1
+            return cached[1]
+
+        frame = self._encode(message)
+        self.encoded += 1
+        self._cache[id(message)] = (message, frame)  # Holding message keeps its id unique
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return frame
+
+    def _encode(self, message: Dict[str, Any]) -> SharedFrame:
+        kind = message.get("type")
+        if kind == "telemetry_batch" and len(message) == 2:
+            updates, kind = message["updates"], KIND_BATCH
+        elif kind == "telemetry_update":
+            updates, kind = [{k: v for k, v in message.items() if k != "type"}], KIND_UPDATE
+        else:
+            updates = None
+
+        if updates is not None and all(update.keys() <= _UPDATE_FIELDS for update in updates):
+            try:
+                frame = self._encode_telemetry(kind, updates)
+                self.telemetry_frames += 1
+                return frame
+            except _Full:
+                pass  # Ids handed out so far are only sent once a frame uses them
+        self.json_frames += 1
+        frame = SharedFrame(KIND_JSON, 0, serialization.dumps(message))
+        frame.complete = b"\x00" + frame.tail
+        return frame
+
+    def _name(self, name: str) -> int:
+        index = self.names.get(name)
+        if index is None:
+            if len(self.names) >= MAX_IDS:
+                raise _Full()
+            encoded = name.encode()
+            index = self.names[name] = len(self.names)
+            self.name_definitions.append(_DEFINITION.pack(index, len(encoded)) + encoded)
+        return index
+
+    def _layout(self, key_ids: tuple, types: tuple) -> int:
+        index = self.layouts.get((key_ids, types))
+        if index is None:
+            if len(self.layouts) >= MAX_IDS:
+                raise _Full()
+            index = self.layouts[key_ids, types] = len(self.layouts)
+            self.layout_definitions.append(
+                _DEFINITION.pack(index, len(key_ids))
+                + b"".join(_LAYOUT_KEY.pack(*entry) for entry in zip(key_ids, types)))
+        return index
+
+    def _encode_telemetry(self, kind: int, updates: List[Dict[str, Any]]) -> SharedFrame:
+        stamps = [timestamp_ms(update.get("timestamp")) for update in updates]
+        base = next((ms for ms in stamps if ms is not None), 0)
+        flags = 0 if stamps[0] is not None and stamps.count(base) == len(stamps) else FLAG_OFFSETS
+
+        used_names: Dict[int, None] = {}
+        used_layouts: Dict[int, None] = {}
+        body = bytearray(_F64.pack(base))
+        if kind == KIND_BATCH:
+            body += _U32.pack(len(updates))
+        for update, ms in zip(updates, stamps):
+            telemetry = update["telemetry"]
+            keys = tuple(telemetry)
+            key_ids = self._key_ids.get(keys)
+            if key_ids is None:
+                if len(self._key_ids) >= MAX_IDS:
+                    self._key_ids.clear()
+                key_ids = self._key_ids[keys] = tuple(self._name(key) for key in keys)
+            used_names.update(dict.fromkeys(key_ids))
+
+            types = []
+            values = []
+            for value in telemetry.values():
+                if type(value) is float:
+                    value_type, payload = _float(value)
+                else:
+                    value_type, payload = self._value(value, used_names)
+                types.append(value_type)
+                values.append(payload)
+            layout = self._layout(key_ids, tuple(types))
+            used_layouts[layout] = None
+
+            device = self._name(update["device_id"])
+            used_names[device] = None
+            if flags & FLAG_OFFSETS:
+                offset = NO_TIMESTAMP
+                if ms is not None and NO_TIMESTAMP < ms - base < 2 ** 31:
+                    offset = ms - base
+                body += _UPDATE_OFFSET.pack(device, layout, offset)
+            else:
+                body += _UPDATE.pack(device, layout)
+            body += b"".join(values)
+        return SharedFrame(kind, flags, bytes(body), tuple(used_names), tuple(used_layouts))
+
+    def _value(self, value: Any, used_names: Dict[int, None]) -> tuple:
+        """(type, payload) for one telemetry value."""
+        kind = type(value)
+        if kind is bool:
+            return (TYPE_TRUE if value else TYPE_FALSE), b""
+        if value is None:
+            return TYPE_NULL, b""
+        if kind is int:
+            if -32768 <= value <= 32767:
+                return TYPE_INT16, _I16.pack(value)
+            if -2 ** 31 <= value < 2 ** 31:
+                return TYPE_INT32, _I32.pack(value)
+            if -2 ** 53 <= value <= 2 ** 53:
+                return TYPE_FLOAT64, _F64.pack(value)
+            return _json(value)  # Would lose precision as a double
+        if kind is float or isinstance(value, float):
+            return _float(value)
+        if kind is str:
+            encoded = value.encode()
+            if len(encoded) <= MAX_INTERNED_LENGTH and (
+                    value in self.names or len(self.names) < MAX_INTERNED_NAMES):
+                index = self._name(value)
+                used_names[index] = None
+                return TYPE_NAME, _U16.pack(index)
+            if len(encoded) <= 0xFFFF:
+                return TYPE_STRING, _U16.pack(len(encoded)) + encoded
+        return _json(value)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "names": len(self.names),
+            "layouts": len(self.layouts),
+            "encoded": self.encoded,
+            "cache_hits": self.cache_hits,
+            "telemetry_frames": self.telemetry_frames,
+            "json_frames": self.json_frames,
+        }
+
+
+class BinaryFrameEncoder:
+    """
+    One connection's view of the shared tables: which definitions it has.
+
+    Why: JSON repeats every device id, key name and ISO timestamp in every
+    frame. Sending each definition once per connection leaves mostly packed
+    numbers on the wire, which matters for tablets on plant-floor Wi-Fi.
+    """
+
+    def __init__(self, tables: FrameTables):
+        self.tables = tables
+        self.known_names: set = set()
+        self.known_layouts: set = set()
+
+    def encode(self, message: Dict[str, Any]) -> bytes:
+        """Encode one outgoing message as a frame of this subprotocol."""
+        frame = self.tables.encode(message)
+        if self.known_names.issuperset(frame.names) and self.known_layouts.issuperset(frame.layouts):
+            return frame.complete
+
+        new_names = [i for i in frame.names if i not in self.known_names]
+        new_layouts = [i for i in frame.layouts if i not in self.known_layouts]
+
+        self.known_names.update(new_names)
+        self.known_layouts.update(new_layouts)
+        names, layouts = self.tables.name_definitions, self.tables.layout_definitions
+        return b"".join((
+            bytes((frame.kind, frame.flags | FLAG_DICTIONARY)),
+            _U16.pack(len(new_names)), *(names[i] for i in new_names),
+            _U16.pack(len(new_layouts)), *(layouts[i] for i in new_layouts),
+            frame.tail,
+        ))
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "protocol": PROTOCOL,
+            "names": len(self.known_names),
+            "layouts": len(self.known_layouts),
+        }
+
+
+@functools.lru_cache(maxsize=65536)
+def _float(value: float) -> tuple:
+    """(type, payload) for a float; sensor readings repeat, so it is cached."""
+    for value_type, scale in DECIMAL_TYPES:
+        scaled = value * scale
+        if -32768 <= scaled <= 32767:  # False for NaN and infinities
+            rounded = round(scaled)
+            if rounded / scale == value:
+                return value_type, _I16.pack(rounded)
+    try:
+        single = _F32.unpack(_F32.pack(value))[0]
+    except OverflowError:
+        single = None
+    if single is not None and float(f"{single:.7g}") == value:
+        return TYPE_FLOAT32, _F32.pack(single)
+    return TYPE_FLOAT64, _F64.pack(value)
+
+
+def _json(value: Any) -> tuple:
+    encoded = serialization.dumps(value)
+    return TYPE_JSON, _U32.pack(len(encoded)) + encoded
@@ -0,0 +1,292 @@
+"""
+Per-Client WebSocket Delivery
+Each dashboard connection gets its own bounded outbound queue and writer task.
+
+Broadcasting only enqueues; the writer task drains the queue onto the socket.
+A slow client therefore only ever delays itself, and ingestion never awaits
+a client socket.
+
+A client may also ask for a maximum update rate. Telemetry is then conflated:
+only the latest value per (device, key) is kept and a merged delta is sent
+once per tick.
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import WebSocket
+
+import serialization
+
+# What to do when a client's queue is full
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # Discard the oldest queued message
+OVERFLOW_COALESCE = "coalesce"        # Merge queued telemetry to latest value per key
+OVERFLOW_DISCONNECT = "disconnect"    # Close the slow client
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE, OVERFLOW_DISCONNECT)
+
+# Close code sent to clients disconnected for falling behind ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Highest update rate a client can request for conflated delivery
+MAX_RATE_HZ = 60.0
+
+
+def telemetry_updates(message: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Return the per-device updates carried by a telemetry message, else None."""
+    msg_type = message.get("type")
+    if msg_type == "telemetry_update":
+        return [message]
+    if msg_type == "telemetry_batch":
+        return message["updates"]
+    return None
+
+
+def merge_updates(updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fold updates into one per device holding the latest value of each key."""
+    latest: Dict[str, Dict[str, Any]] = {}
+    merge_into(latest, updates)
+    return list(latest.values())
+
+
+def merge_into(latest: Dict[str, Dict[str, Any]], updates: List[Dict[str, Any]]):
+    """Merge updates into a device_id -> update map, newest value wins."""
+    for update in updates:
+        entry = latest.get(update["device_id"])
+        if entry is None:
+            entry = latest[update["device_id"]] = {
+                "device_id": update["device_id"],
+                "telemetry": {},
+                "timestamp": None,
+            }
+        entry["telemetry"].update(update["telemetry"])
+        entry["timestamp"] = update.get("timestamp")
+
+
+class ClientConnection:
+    """
+    One dashboard connection: bounded queue, writer task and lag metrics.
+
+    Queue entries are (message, frame, enqueued_at). The frame (JSON bytes,
+    sent as a binary WebSocket frame) is encoded once by the broadcaster and
+    shared by every client; the dict is kept so the coalesce policy can merge
+    pending telemetry without re-parsing it.
+
+    A client that negotiated a binary subprotocol has an `encoder` (see
+    ws_binary.py) with per-connection state. Its entries carry no shared
+    frame; the writer encodes each message just before sending it.
+    """
+
+    def __init__(self, websocket: WebSocket, max_queue: int = 256,
+                 overflow_policy: str = OVERFLOW_DROP_OLDEST,
+                 on_close: Optional[Callable[["ClientConnection"], None]] = None,
+                 encoder=None):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.overflow_policy = overflow_policy
+        self.on_close = on_close
+        self.encoder = encoder  # Anything with encode(message) -> bytes, or None for JSON
+
+        self.queue: deque = deque()
+        self.closed = False
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.connected_at = time.time()
+
+        # Conflation (off unless the client asks for a max rate)
+        self.max_rate_hz: Optional[float] = None
+        self._pending: Dict[str, Dict[str, Any]] = {}  # device_id -> merged update
+        self._ticker: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.sent = 0
+        self.bytes_sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.conflated = 0  # Telemetry updates merged away by rate limiting
+        self.last_send_ms = 0.0
+        self.max_lag_ms = 0.0  # Worst enqueue -> sent delay seen
+
+    @property
+    def client_id(self) -> str:
+        client = self.websocket.client
+        return f"{client.host}:{client.port}" if client else hex(id(self.websocket))
+
+    def start(self):
+        """Start the writer task."""
+        self._task = asyncio.create_task(self._writer())
+
+    def set_max_rate(self, max_hz: Optional[float]):
+        """
+        Limit telemetry to `max_hz` merged deltas per second (None/0 = off).
+
+        Why: Devices can publish faster than a browser repaints. Only the
+        latest value per (device, key) in each window is worth sending.
+        """
+        if max_hz:
+            max_hz = float(max_hz)
+            if not 0 < max_hz <= MAX_RATE_HZ:
+                raise ValueError(f"max_hz must be between 0 and {MAX_RATE_HZ:g}")
+            self.max_rate_hz = max_hz
+            if self._ticker is None:
+                self._ticker = asyncio.create_task(self._tick())
+        else:
+            self.max_rate_hz = None
+            if self._ticker:
+                self._ticker.cancel()
+                self._ticker = None
+            self._flush_conflated()
+
+    async def _tick(self):
+        while not self.closed and self.max_rate_hz:
+            await asyncio.sleep(1.0 / self.max_rate_hz)
+            self._flush_conflated()
+
+    def _flush_conflated(self):
+        """Send everything merged since the last tick as one delta."""
+        if not self._pending:
+            return
+        updates = [{"type": "telemetry_update", **u} for u in self._pending.values()]
+        self._pending = {}
+        if len(updates) == 1:
+            message = updates[0]
+        else:
+            message = {"type": "telemetry_batch", "updates": updates}
+        self._push(message, self._frame(message))
+
+    def _frame(self, message: Dict[str, Any]) -> Optional[bytes]:
+        """Shared JSON frame for message (None when the writer encodes it)."""
+        return None if self.encoder else serialization.dumps(message)
+
+    def enqueue(self, message: Dict[str, Any], frame: Optional[bytes] = None) -> bool:
+        """
+        Queue a message for this client without waiting on the socket.
+
+        Returns False if the client was closed instead (disconnect policy).
+        """
+        if self.closed:
+            return False
+
+        if self.max_rate_hz:
+            updates = telemetry_updates(message)
+            if updates is not None:
+                before = len(self._pending)
+                merge_into(self._pending, updates)
+                self.conflated += len(updates) - (len(self._pending) - before)
+                return True
+
+        if frame is None:
+            frame = self._frame(message)
+        return self._push(message, frame)
+
+    def _push(self, message: Dict[str, Any], frame: Optional[bytes]) -> bool:
+        """Append to the queue, applying the overflow policy when full."""
+        if len(self.queue) >= self.max_queue:
+            if self.overflow_policy == OVERFLOW_DISCONNECT:
+                print(f"[WS] Disconnecting slow client {self.client_id} "
+                      f"({len(self.queue)} messages behind)")
+                self.close(SLOW_CONSUMER_CLOSE_CODE)
+                return False
+            if self.overflow_policy == OVERFLOW_COALESCE:
+                self.queue.append((message, frame, time.monotonic()))
+                self._coalesce()
+                self._ready.set()
+                return True
+            self.queue.popleft()
+            self.dropped += 1
+
+        self.queue.append((message, frame, time.monotonic()))
+        self._ready.set()
+        return True
+
+    def _coalesce(self):
+        """Collapse queued telemetry into one frame with latest values per key."""
+        kept = deque()
+        updates: List[Dict[str, Any]] = []
+        slot = None  # Where the first telemetry entry was, so ordering holds
+        for entry in self.queue:
+            carried = telemetry_updates(entry[0])
+            if carried is None:
+                kept.append(entry)
+                continue
+            updates.extend(carried)
+            if slot is None:
+                slot, oldest = len(kept), entry[2]
+                kept.append(None)
+
+        if updates:
+            merged = {"type": "telemetry_batch", "updates": merge_updates(updates)}
+            kept[slot] = (merged, self._frame(merged), oldest)
+        self.coalesced += len(self.queue) - len(kept)
+
+        # Nothing left to merge: fall back to dropping the oldest entries
+        while len(kept) > self.max_queue:
+            kept.popleft()
+            self.dropped += 1
+        self.queue = kept
+
+    async def _writer(self):
+        try:
+            while not self.closed:
+                if not self.queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                message, frame, enqueued_at = self.queue.popleft()
+                if self.encoder:
+                    frame = self.encoder.encode(message)
+                start = time.monotonic()
+                await self.websocket.send_bytes(frame)
+                done = time.monotonic()
+                self.sent += 1
+                self.bytes_sent += len(frame)
+                self.last_send_ms = (done - start) * 1000
+                self.max_lag_ms = max(self.max_lag_ms, (done - enqueued_at) * 1000)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[WS] Send to {self.client_id} failed: {e}")
+            self.close()
+
+    def close(self, code: int = 1000):
+        """Stop the writer and close the socket; safe to call more than once."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.clear()
+        self._pending = {}
+        if self._ticker and self._ticker is not asyncio.current_task():
+            self._ticker.cancel()
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+        if code != 1000:
+            asyncio.ensure_future(self._close_socket(code))
+        if self.on_close:
+            self.on_close(self)
+
+    async def _close_socket(self, code: int):
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+    def metrics(self) -> Dict[str, Any]:
+        """Lag and delivery counters for this client."""
+        lag_ms = (time.monotonic() - self.queue[0][2]) * 1000 if self.queue else 0.0
+        return {
+            "client": self.client_id,
+            "connected_at": self.connected_at,
+            "queue_depth": len(self.queue),
+            "lag_ms": round(lag_ms, 3),
+            "max_lag_ms": round(self.max_lag_ms, 3),
+            "last_send_ms": round(self.last_send_ms, 3),
+            "sent": self.sent,
+            "bytes_sent": self.bytes_sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "max_rate_hz": self.max_rate_hz,
+            "conflated": self.conflated,
+            "protocol": self.encoder.metrics() if self.encoder else "json",
+        }
@@ -0,0 +1,141 @@
+"""
+Scaling benchmark for multi-worker mode (backend/cluster.py).
+
+For each worker count it starts `python cluster.py --workers N` on a free
+port, opens a WebSocket client, then has --clients load processes POST
+/api/telemetry/batch requests (--batch records over --devices devices) for
+--seconds. Reports accepted samples/s, speedup over one worker, and
+checks that the WebSocket client (connected to whichever worker accepted
+it) saw updates for every device.
+
+Scaling is bounded by the cores left over after the load generators; on a
+machine with fewer cores than workers the numbers stay flat. Like a normal
+run, the workers persist history under backend/data/.
+
+Usage:
+    python benchmarks/bench_cluster.py [--workers 1,2,4] [--clients 4] [--seconds 5]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import websockets
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(base: str, timeout: float = 30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(base + "/", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("cluster did not start")
+
+
+def load(base: str, client: int, devices: int, batch: int, seconds: float, results):
+    """One load process: POST batches until the deadline; report accepted samples."""
+    accepted = 0
+    sequence = 0
+    with httpx.Client(base_url=base, timeout=30) as http:
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            records = []
+            for _ in range(batch):
+                device = (client * 7919 + sequence) % devices
+                sequence += 1
+                records.append({"device_id": f"DEV_{device:05d}",
+                                "telemetry": {"temperature": 20 + sequence % 10, "current": 3.2}})
+            response = http.post("/api/telemetry/batch", json=records)
+            accepted += response.json()["accepted"]
+    results.put(accepted)
+
+
+async def watch(url: str, stop: asyncio.Event, seen: set):
+    async with websockets.connect(url, max_size=None) as ws:
+        while not stop.is_set():
+            try:
+                message = json.loads(await asyncio.wait_for(ws.recv(), 0.5))
+            except asyncio.TimeoutError:
+                continue
+            for update in message.get("updates", ()):
+                seen.add(update["device_id"])
+
+
+async def run(workers: int, args) -> float:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    cluster = subprocess.Popen([sys.executable, "cluster.py", "--workers", str(workers),
+                                "--port", str(port), "--log-level", "warning"],
+                               cwd=BACKEND, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(base)
+        await asyncio.sleep(1)  # Let the workers connect their bus
+        stop, seen = asyncio.Event(), set()
+        watcher = asyncio.create_task(watch(f"ws://127.0.0.1:{port}/ws/live", stop, seen))
+        await asyncio.sleep(0.5)
+
+        results = multiprocessing.Queue()
+        loaders = [multiprocessing.Process(target=load, args=(base, i, args.devices, args.batch,
+                                                              args.seconds, results))
+                   for i in range(args.clients)]
+        start = time.perf_counter()
+        for loader in loaders:
+            loader.start()
+        accepted = 0
+        for _ in loaders:
+            accepted += await asyncio.to_thread(results.get)
+        elapsed = time.perf_counter() - start
+        for loader in loaders:
+            loader.join()
+
+        await asyncio.sleep(1)
+        stop.set()
+        await watcher
+        rate = accepted / elapsed
+        print(f"{workers} worker(s): {rate:>10,.0f} samples/s  "
+              f"(WebSocket client saw {len(seen)}/{args.devices} devices)")
+        return rate
+    finally:
+        cluster.terminate()
+        cluster.wait()
+
+
+async def main_async(args):
+    rates = {}
+    for workers in args.workers:
+        rates[workers] = await run(workers, args)
+    first = args.workers[0]
+    print(f"speedup over {first} worker(s): " + ", ".join(
+        f"{w}: {rate / rates[first]:.2f}x" for w, rate in rates.items()) + f"  (cpu_count={os.cpu_count()})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=lambda s: [int(x) for x in s.split(",")], default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=4, help="load generator processes")
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--batch", type=int, default=200, help="records per request")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
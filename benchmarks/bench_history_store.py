@@ -0,0 +1,76 @@
+"""
+Benchmark: telemetry history write cost and memory per sample.
+
+Compares the original list-of-dicts history (append + pop(0)) against the
+ring-buffer HistoryStore.
+
+Usage:
+    python benchmarks/bench_history_store.py [--devices 200] [--keys 8] [--capacity 1000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from history_store import HistoryStore  # noqa: E402
+
+
+class ListHistory:
+    """The pre-ring-buffer implementation from InMemoryStorage."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.history = {}
+
+    def append(self, device_id, key, timestamp, value):
+        series = self.history.setdefault(device_id, {}).setdefault(key, [])
+        series.append({"timestamp": timestamp, "value": value})
+        if len(series) > self.capacity:
+            series.pop(0)
+
+
+def run(store, devices, keys, samples, iso):
+    start = time.perf_counter()
+    for i in range(samples):
+        ts = 1_700_000_000.0 + i
+        stamp = datetime.utcfromtimestamp(ts).isoformat() if iso else ts
+        for d in devices:
+            for k in keys:
+                store.append(d, k, stamp, i * 0.5)
+    return time.perf_counter() - start
+
+
+def measure(name, factory, devices, keys, capacity, iso):
+    tracemalloc.start()
+    store = factory()
+    # Fill to capacity so the steady state (evicting) path is measured
+    run(store, devices, keys, capacity, iso)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    points = len(devices) * len(keys) * capacity
+    elapsed = run(store, devices, keys, capacity, iso)
+    print(f"{name:<14} {elapsed / points * 1e9:>10.0f} ns/write {retained / points:>10.1f} bytes/point")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=200)
+    parser.add_argument("--keys", type=int, default=8)
+    parser.add_argument("--capacity", type=int, default=1000)
+    args = parser.parse_args()
+
+    devices = [f"DEV_{i:04d}" for i in range(args.devices)]
+    keys = [f"key_{i}" for i in range(args.keys)]
+    print(f"{args.devices} devices x {args.keys} keys, capacity {args.capacity}")
+    # The list version stored ISO strings per point, so time that path too
+    measure("list+pop(0)", lambda: ListHistory(args.capacity), devices, keys, args.capacity, True)
+    measure("ring buffer", lambda: HistoryStore(args.capacity), devices, keys, args.capacity, False)
+
+
+if __name__ == "__main__":
+    main()
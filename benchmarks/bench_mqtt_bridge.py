@@ -0,0 +1,154 @@
+"""
+Benchmark: embedded broker listener vs. loopback paho client into ingestion.
+
+Runs AsyncMQTTBroker and an IngestionPipeline (with stub storage and a stub
+WebSocket manager) on one event loop, then feeds telemetry in two ways:
+
+  loopback  a paho client subscribed over TCP, like MQTTManager: the broker
+            re-encodes each message, paho decodes it on its own thread and
+            calls pipeline.submit()
+  embedded  broker.add_listener() hands (topic, memoryview) straight to
+            pipeline.submit_message() on the broker loop
+
+A device connection publishes QoS 1 telemetry carrying its send time, first
+paced at --rate msg/s (latency from publish to broadcast, p50/p99) and then
+as one burst of --burst messages (throughput).
+
+Usage:
+    python benchmarks/bench_mqtt_bridge.py [--rate 2000] [--seconds 3] [--burst 20000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+import paho.mqtt.client as mqtt  # noqa: E402
+
+from ingestion import IngestionPipeline, parse_telemetry_message  # noqa: E402
+from mqtt_broker import AsyncMQTTBroker, encode_publish  # noqa: E402
+from bench_mqtt_broker import open_client  # noqa: E402
+
+TOPIC_FILTER = "app/device/+/telemetry"
+
+
+class StubStorage:
+    def update_many(self, samples):
+        pass
+
+
+class LatencySink:
+    """Stands in for ConnectionManager: records publish -> broadcast latency."""
+
+    def __init__(self):
+        self.latencies = []
+        self.done = None
+        self.expected = 0
+
+    async def broadcast(self, message):
+        now = time.perf_counter()
+        for update in message["updates"]:
+            self.latencies.append(now - update["telemetry"]["sent"])
+        if self.done and len(self.latencies) >= self.expected:
+            self.done.set()
+
+
+def loopback_client(port, pipeline, on_ready):
+    """paho subscriber doing what MQTTManager._on_message does."""
+    def on_message(client, userdata, msg):
+        device_id, telemetry, timestamp = parse_telemetry_message(msg.topic, msg.payload)
+        pipeline.submit(device_id, telemetry, timestamp)
+
+    client = mqtt.Client(client_id="bench_backend")
+    client.on_message = on_message
+    client.on_subscribe = lambda *_: on_ready()
+    client.on_connect = lambda c, u, f, rc: c.subscribe(TOPIC_FILTER, qos=1)
+    client.connect("127.0.0.1", port)
+    client.loop_start()
+    return client
+
+
+async def publish(writer, count, rate):
+    """Publish `count` messages, paced at `rate` msg/s (0: as fast as possible)."""
+    start = time.perf_counter()
+    for i in range(count):
+        if rate:
+            delay = start + i / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        payload = json.dumps({"telemetry": {"temperature": 21.5, "current": 3.2, "sent": time.perf_counter()},
+                              "timestamp": "2026-01-01T00:00:00"}).encode()
+        writer.write(encode_publish(f"app/device/DEV_{i % 100:05d}/telemetry", payload,
+                                    qos=1, packet_id=i % 65535 + 1))
+        if i % 256 == 0:
+            await writer.drain()
+    await writer.drain()
+
+
+async def run_mode(mode, args):
+    broker = AsyncMQTTBroker(host="127.0.0.1", port=0, max_queued=args.burst * 2)
+    await broker.serve()
+    sink = LatencySink()
+    pipeline = IngestionPipeline(StubStorage(), sink, max_queue=args.burst * 2,
+                                 batch_size=256, max_delay=args.delay)
+    pipeline.start()
+
+    client = None
+    if mode == "embedded":
+        broker.add_listener(TOPIC_FILTER, pipeline.submit_message)
+    else:
+        ready = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        client = loopback_client(broker.port, pipeline, lambda: loop.call_soon_threadsafe(ready.set))
+        await asyncio.wait_for(ready.wait(), 5)
+
+    reader, writer = await open_client(broker.port, "bench_device")
+    results = {}
+    for phase, count, rate in (("paced", int(args.rate * args.seconds), args.rate),
+                               ("burst", args.burst, 0)):
+        sink.latencies, sink.done, sink.expected = [], asyncio.Event(), count
+        start = time.perf_counter()
+        await publish(writer, count, rate)
+        try:
+            await asyncio.wait_for(sink.done.wait(), 30)
+        except asyncio.TimeoutError:
+            pass
+        elapsed = time.perf_counter() - start
+        latencies = sorted(sink.latencies)
+        results[phase] = (len(latencies), count, elapsed, latencies)
+
+    writer.close()
+    if client:
+        client.loop_stop()
+        client.disconnect()
+    broker.close()
+
+    received, count, _, latencies = results["paced"]
+    p50 = latencies[len(latencies) // 2] * 1000 if latencies else float("nan")
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else float("nan")
+    print(f"{mode:>9}: paced {args.rate} msg/s -> p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  "
+          f"({received}/{count} received)")
+    received, count, elapsed, _ = results["burst"]
+    print(f"{mode:>9}: burst {count} msgs -> {received / elapsed:>10,.0f} msg/s  "
+          f"({received}/{count} received)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=2000, help="paced publish rate (msg/s)")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--burst", type=int, default=20000)
+    parser.add_argument("--delay", type=float, default=0.0, help="pipeline max_delay (s)")
+    args = parser.parse_args()
+
+    for mode in ("loopback", "embedded"):
+        asyncio.run(run_mode(mode, args))
+
+
+if __name__ == "__main__":
+    main()
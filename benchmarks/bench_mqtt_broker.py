@@ -0,0 +1,192 @@
+"""
+Load benchmark for mqtt_broker.py.
+
+Starts the broker in a subprocess, opens --connections device connections
+(CONNECT/CONNACK) plus --subscribers subscribers on app/device/+/telemetry,
+then has every device publish --messages telemetry messages at --qos.
+Reports how many connections were held, publish and delivery (fan-out)
+rates, and lost messages. --stuck adds subscribers that never read their
+socket; the others must still receive everything. With --qos 1 the
+subscribers subscribe at QoS 1 and acknowledge every message.
+
+Usage:
+    python benchmarks/bench_mqtt_broker.py [--mode async|threaded] [--connections 2000] [--messages 20]
+                                           [--subscribers 1] [--stuck 0] [--qos 0|1]
+                                           [--max-inflight 32] [--max-queued 10000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from mqtt_broker import encode_publish, encode_remaining_length  # noqa: E402
+
+
+def connect_packet(client_id: str) -> bytes:
+    client = client_id.encode()
+    body = (b"\x00\x04MQTT\x04\x02\x00\x3c"  # MQTT 3.1.1, clean session, keepalive 60s
+            + len(client).to_bytes(2, "big") + client)
+    return b"\x10" + encode_remaining_length(len(body)) + body
+
+
+def subscribe_packet(topic_filter: str, packet_id: int = 1, qos: int = 0) -> bytes:
+    topic = topic_filter.encode()
+    body = packet_id.to_bytes(2, "big") + len(topic).to_bytes(2, "big") + topic + bytes([qos])
+    return b"\x82" + encode_remaining_length(len(body)) + body
+
+
+async def read_packet(reader):
+    header = (await reader.readexactly(1))[0]
+    length, multiplier = 0, 1
+    while True:
+        byte = (await reader.readexactly(1))[0]
+        length += (byte & 127) * multiplier
+        multiplier *= 128
+        if not byte & 128:
+            break
+    return header, (await reader.readexactly(length) if length else b"")
+
+
+async def open_client(port: int, client_id: str):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(connect_packet(client_id))
+    header, _ = await read_packet(reader)
+    assert header >> 4 == 2, "expected CONNACK"
+    return reader, writer
+
+
+async def subscribe(port: int, client_id: str, qos: int = 0):
+    reader, writer = await open_client(port, client_id)
+    writer.write(subscribe_packet("app/device/+/telemetry", qos=qos))
+    await read_packet(reader)  # SUBACK
+    return reader, writer
+
+
+async def subscriber(port: int, index: int, expected: int, received: list, done: asyncio.Event,
+                     qos: int = 0):
+    reader, writer = await subscribe(port, f"bench_subscriber_{index}", qos)
+    done.set()
+    try:
+        while received[0] < expected:
+            header, body = await read_packet(reader)
+            if header >> 4 == 3:
+                if header & 0x06:  # QoS 1: acknowledge the packet id after the topic
+                    topic_length = (body[0] << 8) | body[1]
+                    writer.write(b"\x40\x02" + body[2 + topic_length:4 + topic_length])
+                received[0] += 1
+                if received[0] == 1:
+                    received[1] = time.perf_counter()
+        received[2] = time.perf_counter()
+    finally:
+        writer.close()
+
+
+def wait_for_port(port: int, timeout: float = 10.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("broker did not start")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run(args):
+    port = free_port()
+    broker = subprocess.Popen([sys.executable, os.path.join(ROOT, "mqtt_broker.py"),
+                               "--host", "127.0.0.1", "--port", str(port), "--mode", args.mode]
+                              + (["--max-inflight", str(args.max_inflight), "--max-queued", str(args.max_queued)]
+                                 if args.mode == "async" else []),
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(port)
+        expected = args.connections * args.messages
+        counters = []  # Per subscriber: count, first arrival, last arrival
+        sub_tasks = []
+        for index in range(args.subscribers):
+            received, ready = [0, None, None], asyncio.Event()
+            counters.append(received)
+            sub_tasks.append(asyncio.create_task(subscriber(port, index, expected, received, ready, args.qos)))
+            await ready.wait()
+        # Subscribers that never read: their socket buffers fill up
+        stuck = [await subscribe(port, f"bench_stuck_{i}", args.qos) for i in range(args.stuck)]
+
+        # Open every device connection (bounded concurrency, like a fleet coming online)
+        limit = asyncio.Semaphore(200)
+        start = time.perf_counter()
+
+        async def device(i):
+            async with limit:
+                return await open_client(port, f"DEV_{i:05d}")
+        results = await asyncio.gather(*(device(i) for i in range(args.connections)),
+                                       return_exceptions=True)
+        clients = [r for r in results if not isinstance(r, Exception)]
+        connect_time = time.perf_counter() - start
+        print(f"[{args.mode}] connections held: {len(clients)}/{args.connections} "
+              f"(opened in {connect_time:.2f}s)")
+
+        # Every device publishes its messages
+        payload = json.dumps({"telemetry": {"temperature": 21.5, "current": 3.2, "rssi": -60},
+                              "timestamp": "2026-01-01T00:00:00"}).encode()
+        start = time.perf_counter()
+        for round_ in range(args.messages):
+            for i, (_, writer) in enumerate(clients):
+                writer.write(encode_publish(f"app/device/DEV_{i:05d}/telemetry", payload,
+                                            qos=args.qos, packet_id=round_ + 1))
+            await asyncio.gather(*(writer.drain() for _, writer in clients))
+        publish_time = time.perf_counter() - start
+        sent = len(clients) * args.messages
+        print(f"[{args.mode}] published {sent} messages in {publish_time:.2f}s "
+              f"({sent / publish_time:,.0f} msg/s)")
+
+        try:
+            await asyncio.wait_for(asyncio.gather(*sub_tasks), args.timeout)
+        except asyncio.TimeoutError:
+            pass
+        end = max(received[2] or time.perf_counter() for received in counters)
+        delivered = sum(received[0] for received in counters)
+        wanted = sent * args.subscribers
+        print(f"[{args.mode}] delivered {delivered}/{wanted} to {args.subscribers} subscriber(s)"
+              f"{f' ({args.stuck} stuck)' if args.stuck else ''} in {end - start:.2f}s "
+              f"({delivered / (end - start):,.0f} msg/s, {wanted - delivered} lost)")
+
+        alive = sum(1 for _, writer in clients if not writer.is_closing())
+        print(f"[{args.mode}] connections still open: {alive}")
+        for _, writer in clients + stuck:
+            writer.close()
+    finally:
+        broker.terminate()
+        broker.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("async", "threaded"), default="async")
+    parser.add_argument("--connections", type=int, default=2000)
+    parser.add_argument("--messages", type=int, default=20, help="messages per connection")
+    parser.add_argument("--subscribers", type=int, default=1)
+    parser.add_argument("--qos", type=int, choices=(0, 1), default=0)
+    parser.add_argument("--max-inflight", type=int, default=32, help="broker QoS 1 window (async)")
+    parser.add_argument("--max-queued", type=int, default=10000, help="broker QoS 1 queue per session (async)")
+    parser.add_argument("--stuck", type=int, default=0, help="subscribers that never read")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds to wait for delivery")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
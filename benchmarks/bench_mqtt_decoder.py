@@ -0,0 +1,110 @@
+"""
+Benchmark: incremental PacketDecoder vs. copy-per-packet framing.
+
+First runs a randomized parity check: a stream of random packets (empty
+bodies, 1- to 3-byte remaining lengths) is cut at random points, down to
+1-byte reads, and fed to PacketDecoder; it must return exactly the packets
+that were encoded, in order. Then it times decoding a stream of telemetry
+PUBLISH packets read in 4096-byte chunks against a decoder that copies
+each packet out of its buffer and deletes it from the front.
+
+Usage:
+    python benchmarks/bench_mqtt_decoder.py [--packets 200000] [--chunk 4096]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mqtt_broker import PacketDecoder, encode_publish, encode_remaining_length  # noqa: E402
+
+
+class CopyingDecoder:
+    """Reference: bytes(body) per packet and del buffer[:n] per packet."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        self.buffer += data
+        packets = []
+        while len(self.buffer) >= 2:
+            length, multiplier, i = 0, 1, 1
+            while i < len(self.buffer):
+                byte = self.buffer[i]
+                i += 1
+                length += (byte & 127) * multiplier
+                multiplier *= 128
+                if not byte & 128:
+                    break
+            else:
+                break
+            if len(self.buffer) - i < length:
+                break
+            packets.append((self.buffer[0], bytes(self.buffer[i:i + length])))
+            del self.buffer[:i + length]
+        return packets
+
+
+def random_packet(rng):
+    size = rng.choice([0, rng.randint(1, 127), rng.randint(128, 16383), rng.randint(16384, 70000)])
+    body = rng.randbytes(size)
+    header = rng.choice([0x30, 0x32, 0x82, 0xC0, 0xE0, 0x10])
+    return header, body, bytes([header]) + encode_remaining_length(size) + body
+
+
+def check_parity(rounds=200):
+    rng = random.Random(1)
+    for _ in range(rounds):
+        packets = [random_packet(rng) for _ in range(rng.randint(1, 20))]
+        stream = b"".join(raw for _, _, raw in packets)
+        decoder = PacketDecoder()
+        got = []
+        pos = 0
+        while pos < len(stream):
+            step = rng.choice([1, 2, 3, rng.randint(1, 100), rng.randint(1, 70000)])
+            for header, body in decoder.feed(stream[pos:pos + step]):
+                got.append((header, bytes(body)))
+            pos += step
+        expected = [(header, body) for header, body, _ in packets]
+        if got != expected:
+            raise AssertionError("decoded packets differ from the encoded stream")
+        if decoder.buffer[decoder._consumed:]:
+            raise AssertionError("bytes left over after a complete stream")
+    print(f"parity: {rounds} random streams decoded exactly")
+
+
+def bench(count, chunk):
+    payload = json.dumps({"telemetry": {"temperature": 21.5, "current": 3.2, "rssi": -60},
+                          "timestamp": "2026-01-01T00:00:00"}).encode()
+    stream = b"".join(encode_publish(f"app/device/DEV_{i % 1000:05d}/telemetry", payload)
+                      for i in range(count))
+    reads = [stream[i:i + chunk] for i in range(0, len(stream), chunk)]
+
+    for name, decoder in (("copying", CopyingDecoder()), ("PacketDecoder", PacketDecoder())):
+        start = time.perf_counter()
+        decoded = 0
+        for data in reads:
+            decoded += len(decoder.feed(data))
+        elapsed = time.perf_counter() - start
+        assert decoded == count
+        print(f"{name:>14}: {count / elapsed:>12,.0f} packets/s  "
+              f"({len(stream) / elapsed / 1e6:,.0f} MB/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packets", type=int, default=200000)
+    parser.add_argument("--chunk", type=int, default=4096, help="bytes per simulated recv()")
+    args = parser.parse_args()
+
+    check_parity()
+    bench(args.packets, args.chunk)
+
+
+if __name__ == "__main__":
+    main()
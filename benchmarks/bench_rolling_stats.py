@@ -0,0 +1,174 @@
+"""
+Benchmark: incremental RollingWindow vs. recomputing over a list.
+
+First runs a randomized parity check: for random streams (ints, floats,
+ties, large/small magnitudes, NaN) every mean/variance/min/max/trend must
+equal what statistics.mean / statistics.variance / min / max return on the
+same window, including the int/float result type. Then it compares
+StateInferenceEngine output against the previous list-based buffers and
+times both.
+
+Usage:
+    python benchmarks/bench_rolling_stats.py [--streams 2000] [--window 10] [--samples 200000]
+"""
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+import state_inference  # noqa: E402
+from rolling_stats import RollingWindow  # noqa: E402
+
+
+class ListWindow:
+    """The previous behaviour: a list trimmed with pop(0), stats recomputed per call."""
+
+    def __init__(self, size):
+        self.size = size
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, value):
+        self.values.append(value)
+        if len(self.values) > self.size:
+            self.values.pop(0)
+
+    def mean(self):
+        return statistics.mean(self.values)
+
+    def variance(self):
+        return statistics.variance(self.values)
+
+    def min(self):
+        return min(self.values)
+
+    def max(self):
+        return max(self.values)
+
+    def trend(self):
+        values = self.values
+        return "up" if values[-1] > values[0] else "down" if values[-1] < values[0] else "stable"
+
+
+def same(a, b):
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b
+
+
+def random_value(rng, kind):
+    if kind == "int":
+        return rng.randint(-5, 5)
+    if kind == "round":
+        return round(rng.uniform(0, 100), 2)
+    if kind == "wide":
+        return rng.choice([1e300, -1e300, 1e-300, 5e-324, 1.0, 3]) * rng.choice([1, -1])
+    if kind == "nan":
+        return float("nan") if rng.random() < 0.05 else rng.random()
+    return rng.choice([rng.randint(0, 3), float(rng.randint(0, 3)), rng.random()])
+
+
+def check(method, fast, slow):
+    try:
+        expected = getattr(slow, method)()
+    except Exception as exc:  # Errors must match too (e.g. OverflowError)
+        expected = type(exc)
+    try:
+        got = getattr(fast, method)()
+    except Exception as exc:
+        got = type(exc)
+    if not (got is expected or same(got, expected)):
+        raise AssertionError(f"{method}: {got!r} != {expected!r} for {slow.values}")
+
+
+def parity(streams, window):
+    rng = random.Random(7)
+    kinds = ["int", "round", "wide", "nan", "mixed"]
+    checked = 0
+    for i in range(streams):
+        kind = kinds[i % len(kinds)]
+        size = rng.randint(1, window * 2)
+        fast, slow = RollingWindow(size), ListWindow(size)
+        for _ in range(rng.randint(1, 60)):
+            value = random_value(rng, kind)
+            fast.append(value)
+            slow.append(value)
+            for method in ("mean", "variance", "min", "max", "trend"):
+                check(method, fast, slow)
+                checked += 1
+    print(f"parity: {checked:,} checks over {streams} streams OK")
+
+
+def telemetry_stream(samples, devices, seed=11):
+    rng = random.Random(seed)
+    for i in range(samples):
+        device = f"DEV_{i % devices:03d}"
+        yield device, {
+            "temperature": round(rng.uniform(20, 90), 2),
+            "vibration": round(rng.uniform(0, 60), 1),
+            "current": round(rng.uniform(0, 3), 2),
+            "battery": rng.randint(5, 100),
+            "distance": rng.randint(0, 400),
+        }
+
+
+def run_engine(window_cls, samples, devices, window):
+    state_inference.RollingWindow = window_cls
+    engine = state_inference.StateInferenceEngine()
+    engine.buffer_size = window
+    out = []
+    start = time.perf_counter()
+    for device, telemetry in telemetry_stream(samples, devices):
+        engine.update_telemetry(device, telemetry)
+        info = engine.device_states[device]
+        metrics = engine._calculate_metrics(telemetry, engine.telemetry_buffer[device])
+        out.append((info["state"], info["confidence"], info["reasons"], metrics))
+    elapsed = time.perf_counter() - start
+    state_inference.RollingWindow = RollingWindow
+    return out, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", type=int, default=2000)
+    parser.add_argument("--window", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=200_000)
+    parser.add_argument("--devices", type=int, default=100)
+    args = parser.parse_args()
+
+    parity(args.streams, args.window)
+
+    old, old_s = run_engine(ListWindow, args.samples, args.devices, args.window)
+    new, new_s = run_engine(RollingWindow, args.samples, args.devices, args.window)
+    assert old == new, "engine output differs from list-based buffers"
+    print(f"engine parity: {len(new):,} inferences identical")
+    print(f"list buffers:   {args.samples / old_s:,.0f} samples/sec")
+    print(f"rolling window: {args.samples / new_s:,.0f} samples/sec")
+
+    # Stats alone, at a larger window where recomputation hurts most
+    rng = random.Random(3)
+    values = [round(rng.uniform(0, 100), 2) for _ in range(args.samples)]
+    for size in (args.window, 1000):
+        for cls in (ListWindow, RollingWindow):
+            w = cls(size)
+            start = time.perf_counter()
+            for v in values[:50_000]:
+                w.append(v)
+                w.mean(), w.min(), w.max()
+                if len(w) > 1:
+                    w.variance()
+            elapsed = time.perf_counter() - start
+            print(f"window={size:<5} {cls.__name__:<14} {50_000 / elapsed:>12,.0f} updates/sec")
+
+
+if __name__ == "__main__":
+    main()
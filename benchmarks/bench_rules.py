@@ -0,0 +1,111 @@
+"""
+Benchmark: compiled rule sets vs. walking the rule spec per sample.
+
+First runs a randomized parity check: for the built-in rules and every
+device type in backend/rules.example.json, CompiledRuleSet must return the
+same (state, confidence, reasons) as rules.interpret() on the same sample
+and history. Then it times both paths on the same stream.
+
+Usage:
+    python benchmarks/bench_rules.py [--devices 200] [--samples 200000] [--window 10]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from rolling_stats import RollingWindow  # noqa: E402
+from rules import CompiledRuleSet, builtin_ruleset, interpret, load_spec  # noqa: E402
+from state_inference import StateInferenceEngine  # noqa: E402
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend", "rules.example.json")
+
+
+def sample(rng: random.Random) -> dict:
+    """Telemetry with sparse keys, ints and floats, values around the thresholds."""
+    candidates = {
+        "temperature": lambda: rng.choice([rng.uniform(-5, 100), rng.randint(0, 90)]),
+        "vibration": lambda: rng.uniform(0, 12),
+        "current": lambda: rng.choice([rng.uniform(0, 6), rng.randint(0, 5)]),
+        "battery": lambda: rng.randint(0, 100),
+        "rssi": lambda: rng.randint(-100, -40),
+        "sensor_data": lambda: rng.gauss(50, 3),
+        "distance": lambda: rng.uniform(0, 200),
+        "pressure": lambda: rng.uniform(0, 14),
+        "flow": lambda: rng.choice([0, 0.05, rng.uniform(0, 5)]),
+        "humidity": lambda: rng.uniform(30, 60),
+    }
+    return {key: make() for key, make in candidates.items() if rng.random() < 0.7}
+
+
+def stream(devices: int, samples: int, window: int, seed: int):
+    """(telemetry, history) pairs, history updated the way the engine does it."""
+    rng = random.Random(seed)
+    histories = [{} for _ in range(devices)]
+    for _ in range(samples):
+        history = histories[rng.randrange(devices)]
+        telemetry = sample(rng)
+        for key, value in telemetry.items():
+            buf = history.get(key)
+            if buf is None:
+                buf = history[key] = RollingWindow(window)
+            buf.append(value)
+        yield telemetry, history
+
+
+def rule_sets():
+    specs = {"builtin": builtin_ruleset(StateInferenceEngine().thresholds)}
+    for name, spec in load_spec(EXAMPLE)["device_types"].items():
+        specs[name] = spec
+    return specs
+
+
+def check_parity(specs, devices: int, samples: int, window: int):
+    compiled = {name: CompiledRuleSet(name, spec) for name, spec in specs.items()}
+    checked = 0
+    for telemetry, history in stream(devices, samples, window, seed=7):
+        for name, spec in specs.items():
+            expected = interpret(spec, telemetry, history)
+            got = compiled[name](telemetry, history)
+            if got != expected:
+                raise AssertionError(f"{name}: compiled {got} != interpreted {expected}\n{telemetry}")
+            checked += 1
+    print(f"parity: {checked} evaluations identical across {len(specs)} rule sets")
+
+
+def bench(specs, devices: int, samples: int, window: int):
+    pairs = list(stream(devices, samples, window, seed=11))
+    for name, spec in specs.items():
+        ruleset = CompiledRuleSet(name, spec)
+
+        start = time.perf_counter()
+        for telemetry, history in pairs:
+            interpret(spec, telemetry, history)
+        interpreted = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for telemetry, history in pairs:
+            ruleset(telemetry, history)
+        compiled = time.perf_counter() - start
+
+        print(f"{name:>8}: interpreted {len(pairs) / interpreted:>10,.0f}/s  "
+              f"compiled {len(pairs) / compiled:>10,.0f}/s  ({interpreted / compiled:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=200000)
+    parser.add_argument("--window", type=int, default=10)
+    args = parser.parse_args()
+
+    specs = rule_sets()
+    check_parity(specs, args.devices, min(args.samples, 50000), args.window)
+    bench(specs, args.devices, args.samples, args.window)
+
+
+if __name__ == "__main__":
+    main()
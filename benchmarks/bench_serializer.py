@@ -0,0 +1,193 @@
+"""
+Benchmark: backend/serialization.py codecs on the per-message ingest path.
+
+Each message goes decode -> store -> encode, as in the backend:
+
+  mqtt  a {"telemetry": {...}, "timestamp": ...} payload decoded into
+        (telemetry, timestamp), like parse_telemetry_message()
+  rest  a {"device_id": ..., "telemetry": {...}} record, like POST
+        /api/telemetry
+
+then the latest values go into a dict (standing in for storage, which is
+the same for every codec) and a telemetry_update frame carrying a datetime
+is encoded to bytes, as ConnectionManager.broadcast() does.
+
+The reference is the previous path: json.loads (pydantic TelemetryPayload
+validation for rest), isoformat() and json.dumps().encode(). Each codec
+installed (orjson, msgspec, stdlib json) is loaded as its own copy of the
+module. First checks that all of them decode the same values, reject the
+same malformed payloads and produce frames that parse to the same object.
+
+Usage:
+    python benchmarks/bench_serializer.py [--messages 100000] [--keys 8]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+
+from pydantic import BaseModel  # noqa: E402
+
+
+class TelemetryPayload(BaseModel):
+    """Same shape as main.TelemetryPayload (importing main starts the app)."""
+    device_id: str
+    telemetry: Dict[str, Any]
+    timestamp: Optional[str] = None
+
+
+def load_codec(name: str):
+    """A private copy of serialization.py with only `name` importable."""
+    blocked = {"orjson": ["msgspec"], "msgspec": ["orjson"], "json": ["orjson", "msgspec"]}[name]
+    saved = {module: sys.modules.get(module) for module in blocked}
+    try:
+        for module in blocked:
+            sys.modules[module] = None  # Makes `import module` raise ImportError
+        spec = importlib.util.spec_from_file_location(f"serialization_{name}",
+                                                      os.path.join(BACKEND, "serialization.py"))
+        codec = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(codec)
+    finally:
+        for module, previous in saved.items():
+            if previous is None:
+                sys.modules.pop(module, None)
+            else:
+                sys.modules[module] = previous
+    return codec if codec.BACKEND == name else None
+
+
+def make_messages(count: int, keys: int):
+    mqtt, rest = [], []
+    for i in range(count):
+        telemetry = {f"sensor_{k}": round(20 + (i * 7 + k) % 100 * 0.37, 2) for k in range(keys)}
+        telemetry["status"] = "ok"
+        timestamp = None if i % 2 else "2026-01-01T00:00:00.000250"
+        mqtt.append(json.dumps({"telemetry": telemetry, "timestamp": timestamp}).encode())
+        rest.append(json.dumps({"device_id": f"DEV_{i % 500:05d}", "telemetry": telemetry}).encode())
+    return mqtt, rest
+
+
+def reference_path(kind: str):
+    store = {}
+
+    def mqtt(index, payload):
+        message = json.loads(payload)
+        telemetry, timestamp = message.get("telemetry", {}), message.get("timestamp")
+        device_id = f"DEV_{index % 500:05d}"
+        store[device_id] = telemetry
+        return json.dumps({"type": "telemetry_update", "device_id": device_id, "telemetry": telemetry,
+                           "timestamp": timestamp or datetime.utcnow().isoformat()}).encode()
+
+    def rest(index, payload):
+        record = TelemetryPayload.model_validate_json(payload)
+        store[record.device_id] = record.telemetry
+        return json.dumps({"type": "telemetry_update", "device_id": record.device_id,
+                           "telemetry": record.telemetry,
+                           "timestamp": record.timestamp or datetime.utcnow().isoformat()}).encode()
+
+    return mqtt if kind == "mqtt" else rest
+
+
+def codec_path(codec, kind: str):
+    store = {}
+
+    def mqtt(index, payload):
+        telemetry, timestamp = codec.decode_message(memoryview(payload))
+        device_id = f"DEV_{index % 500:05d}"
+        store[device_id] = telemetry
+        return codec.dumps({"type": "telemetry_update", "device_id": device_id, "telemetry": telemetry,
+                            "timestamp": timestamp or datetime.utcnow()})
+
+    def rest(index, payload):
+        device_id, telemetry, timestamp = codec.decode_record(payload)
+        store[device_id] = telemetry
+        return codec.dumps({"type": "telemetry_update", "device_id": device_id, "telemetry": telemetry,
+                            "timestamp": timestamp or datetime.utcnow()})
+
+    return mqtt if kind == "mqtt" else rest
+
+
+MALFORMED_MESSAGES = [b"{bad", b"[1, 2]", b'{"telemetry": [1]}', b'{"telemetry": null}',
+                      b'{"timestamp": 5}', b"\xff\xfe"]
+MALFORMED_RECORDS = [b"{}", b'{"device_id": 5, "telemetry": {}}', b'{"device_id": "A"}',
+                     b'{"device_id": "A", "telemetry": "x"}', b'"A"']
+
+
+def rejects(function, payload) -> bool:
+    try:
+        function(payload)
+    except ValueError:
+        return True
+    return False
+
+
+def check_parity(codecs, mqtt, rest):
+    """Every codec decodes, rejects and encodes exactly like the stdlib."""
+    stamps = [datetime(2026, 1, 1, 12, 30, 5), datetime(2026, 1, 1, 12, 30, 5, 120)]
+    for name, codec in codecs.items():
+        for payload in mqtt[:200]:
+            message = json.loads(payload)
+            expected = (message["telemetry"], message["timestamp"])
+            assert codec.decode_message(memoryview(payload)) == expected, name
+        for payload in rest[:200]:
+            record = TelemetryPayload.model_validate_json(payload)
+            assert codec.decode_record(payload) == (record.device_id, record.telemetry, record.timestamp), name
+            assert codec.convert_record(json.loads(payload)) == codec.decode_record(payload), name
+        for payload in MALFORMED_MESSAGES:
+            assert rejects(codec.decode_message, payload), (name, payload)
+        for payload in MALFORMED_RECORDS:
+            assert rejects(codec.decode_record, payload), (name, payload)
+        assert codec.decode_message(b"{}") == ({}, None), name
+
+        for stamp in stamps:
+            frame = {"type": "telemetry_batch", "updates": [{"device_id": "A", "telemetry": {"t": 1.5, "ok": True},
+                                                             "timestamp": stamp}], "count": None}
+            encoded = codec.dumps(frame)
+            assert isinstance(encoded, bytes), name
+            reference = json.loads(json.dumps(frame, default=datetime.isoformat))
+            assert json.loads(encoded) == reference, (name, encoded)
+            assert codec.loads(encoded) == reference and codec.loads(encoded.decode()) == reference, name
+        assert rejects(codec.loads, b"{bad"), name
+        assert json.loads(codec.dumps({"counter": 2 ** 70})) == {"counter": 2 ** 70}, name
+    print(f"parity: {', '.join(codecs)} match the stdlib on {len(mqtt[:200]) + len(rest[:200])} messages, "
+          f"{len(MALFORMED_MESSAGES) + len(MALFORMED_RECORDS)} malformed payloads and datetime frames")
+
+
+def time_path(path, payloads, repeat: int = 3) -> float:
+    """Best of `repeat` runs, in microseconds per message."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for index, payload in enumerate(payloads):
+            path(index, payload)
+        best = min(best, time.perf_counter() - start)
+    return best / len(payloads) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=100000)
+    parser.add_argument("--keys", type=int, default=8, help="telemetry keys per message")
+    args = parser.parse_args()
+
+    codecs = {name: codec for name in ("orjson", "msgspec", "json") if (codec := load_codec(name))}
+    mqtt, rest = make_messages(args.messages, args.keys)
+    check_parity(codecs, mqtt, rest)
+
+    for kind, payloads in (("mqtt", mqtt), ("rest", rest)):
+        baseline = time_path(reference_path(kind), payloads)
+        label = "json.loads" if kind == "mqtt" else "pydantic"
+        print(f"{kind}: {'reference (' + label + ')':>22}: {baseline:6.2f} us/msg")
+        for name, codec in codecs.items():
+            cost = time_path(codec_path(codec, kind), payloads)
+            print(f"{kind}: {name:>22}: {cost:6.2f} us/msg  ({baseline / cost:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark: $share/{group}/ subscriptions in mqtt_broker.py (async mode).
+
+For each consumer count it starts the broker in a subprocess, runs N
+consumer processes subscribed at QoS 1 to $share/bench/app/device/+/telemetry
+(each parses every payload with json.loads and spends --work-us of CPU on
+it, standing in for ingestion), then publishes --messages QoS 1 messages
+from --devices devices, each carrying a per-device sequence number.
+
+Checks that every message reached exactly one consumer, that each device
+stayed on one consumer, and that every device's sequence arrived in order.
+Reports consumer throughput; it grows with consumers only while there are
+free cores for them.
+
+Usage:
+    python benchmarks/bench_shared_subscriptions.py [--consumers 1,2,4] [--devices 200]
+                                                    [--messages 20000] [--work-us 50]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from mqtt_broker import encode_publish  # noqa: E402
+from bench_mqtt_broker import free_port, open_client, read_packet, subscribe_packet, wait_for_port  # noqa: E402
+
+SHARED_FILTER = "$share/bench/app/device/+/telemetry"
+
+
+def consumer(port, index, work_us, ready, results):
+    """One consumer process: count messages per device and check their order."""
+    async def run():
+        reader, writer = await open_client(port, f"bench_consumer_{index}")
+        writer.write(subscribe_packet(SHARED_FILTER, qos=1))
+        await read_packet(reader)  # SUBACK
+        ready.set()
+        last = {}  # device -> last sequence number
+        received, out_of_order = 0, 0
+        first = end = None
+        while True:
+            try:
+                header, body = await asyncio.wait_for(read_packet(reader), 3)
+            except asyncio.TimeoutError:
+                break
+            if header >> 4 != 3:
+                continue
+            topic_length = (body[0] << 8) | body[1]
+            writer.write(b"\x40\x02" + body[2 + topic_length:4 + topic_length])  # PUBACK
+            message = json.loads(body[4 + topic_length:])
+            spin = time.perf_counter() + work_us / 1e6
+            while time.perf_counter() < spin:
+                pass
+            device, sequence = message["device"], message["seq"]
+            if sequence <= last.get(device, -1):
+                out_of_order += 1
+            last[device] = sequence
+            received += 1
+            first = first or time.perf_counter()
+            end = time.perf_counter()
+        writer.close()
+        results.put((index, received, sorted(last), out_of_order, first, end))
+
+    asyncio.run(run())
+
+
+async def publish(port, devices, messages):
+    _, writer = await open_client(port, "bench_publisher")
+    for i in range(messages):
+        device = i % devices
+        payload = json.dumps({"device": device, "seq": i // devices,
+                              "telemetry": {"temperature": 21.5}}).encode()
+        writer.write(encode_publish(f"app/device/DEV_{device:05d}/telemetry", payload,
+                                    qos=1, packet_id=i % 65535 + 1))
+        if i % 512 == 0:
+            await writer.drain()
+    await writer.drain()
+    return writer
+
+
+def run(consumers, args):
+    port = free_port()
+    broker = subprocess.Popen([sys.executable, os.path.join(ROOT, "mqtt_broker.py"),
+                               "--host", "127.0.0.1", "--port", str(port),
+                               "--max-queued", str(args.messages)],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(port)
+        results = multiprocessing.Queue()
+        readies = [multiprocessing.Event() for _ in range(consumers)]
+        processes = [multiprocessing.Process(target=consumer, args=(port, i, args.work_us, readies[i], results))
+                     for i in range(consumers)]
+        for process in processes:
+            process.start()
+        for ready in readies:
+            ready.wait(10)
+
+        writer = asyncio.run(publish(port, args.devices, args.messages))
+        reports = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+        del writer
+
+        received = sum(r[1] for r in reports)
+        owners = {}
+        for index, _, devices, _, _, _ in reports:
+            for device in devices:
+                owners.setdefault(device, []).append(index)
+        split = sum(1 for indexes in owners.values() if len(indexes) > 1)
+        out_of_order = sum(r[3] for r in reports)
+        start = min(r[4] for r in reports if r[4])
+        end = max(r[5] for r in reports if r[5])
+        share = ", ".join(str(r[1]) for r in sorted(reports))
+        print(f"{consumers} consumer(s): {received / (end - start):>9,.0f} msg/s  "
+              f"received {received}/{args.messages}  per consumer [{share}]  "
+              f"devices split {split}  out of order {out_of_order}")
+        return received / (end - start)
+    finally:
+        broker.terminate()
+        broker.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--consumers", type=lambda s: [int(x) for x in s.split(",")], default=[1, 2, 4])
+    parser.add_argument("--devices", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--work-us", type=float, default=50.0, help="CPU time per message in each consumer")
+    args = parser.parse_args()
+
+    rates = {n: run(n, args) for n in args.consumers}
+    first = args.consumers[0]
+    print(f"speedup over {first} consumer(s): " + ", ".join(
+        f"{n}: {rate / rates[first]:.2f}x" for n, rate in rates.items()) + f"  (cpu_count={os.cpu_count()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: TopicTrie vs. checking every filter with topic_matches.
+
+First runs a randomized parity check: for random filters (literal levels,
+'+', '#', $-topics, empty levels) and random topics, TopicTrie.match must
+return exactly the subscribers whose filter topic_matches accepts, each
+with the highest QoS of its matching filters, also after random
+unsubscribes. Then it times matching plant-style telemetry topics against
+--filters subscriptions both ways.
+
+Usage:
+    python benchmarks/bench_topic_trie.py [--filters 10000] [--topics 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from mqtt_broker import TopicTrie, topic_matches  # noqa: E402
+
+LEVELS = ["a", "b", "c", "", "$SYS", "dev"]
+
+
+def random_topic(rng):
+    return "/".join(rng.choice(LEVELS) for _ in range(rng.randint(1, 4)))
+
+
+def random_filter(rng):
+    depth = rng.randint(1, 4)
+    parts = [rng.choice(LEVELS + ["+", "+"]) for _ in range(depth)]
+    if rng.random() < 0.3:
+        parts[-1] = "#"
+    return "/".join(parts)
+
+
+def check_parity(rounds=300):
+    rng = random.Random(2)
+    for _ in range(rounds):
+        trie = TopicTrie()
+        subs = {}  # (filter, client) -> QoS; re-subscribing replaces the QoS
+        for i in range(rng.randint(1, 40)):
+            key = (random_filter(rng), f"c{rng.randint(0, 10)}")
+            subs[key] = rng.randint(0, 1)
+            trie.subscribe(*key, subs[key])
+        for key in rng.sample(sorted(subs), len(subs) // 3):
+            trie.unsubscribe(*key)
+            del subs[key]
+        for _ in range(30):
+            topic = random_topic(rng)
+            expected = {}
+            for (topic_filter, client), qos in subs.items():
+                if topic_matches(topic, topic_filter):
+                    expected[client] = max(qos, expected.get(client, 0))
+            got = trie.match(topic)
+            if got != expected:
+                raise AssertionError(f"{topic}: trie {got} != scan {expected}")
+    print(f"parity: {rounds} random subscription sets matched identically (clients and QoS)")
+
+
+def plant_filters(count, rng):
+    """Per-device dashboards, per-area '+' filters and a few '#' taps."""
+    filters = []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.8:
+            filters.append(f"app/device/DEV_{i:05d}/telemetry")
+        elif kind < 0.95:
+            filters.append(f"plant/{rng.randrange(50)}/+/line/{rng.randrange(20)}/#")
+        elif kind < 0.99:
+            filters.append(f"app/device/+/{rng.choice(['telemetry', 'status', 'cmd'])}")
+        else:
+            filters.append(rng.choice(["#", "app/#", "plant/#"]))
+    return filters
+
+
+def bench(filter_count, topic_count):
+    rng = random.Random(3)
+    filters = plant_filters(filter_count, rng)
+    trie = TopicTrie()
+    for i, topic_filter in enumerate(filters):
+        trie.subscribe(topic_filter, f"client_{i}")
+    topics = [f"app/device/DEV_{rng.randrange(filter_count):05d}/telemetry" if rng.random() < 0.7
+              else f"plant/{rng.randrange(50)}/cell{rng.randrange(5)}/line/{rng.randrange(20)}/speed"
+              for _ in range(topic_count)]
+
+    scan_topics = topics[:max(1, topic_count // 20)]  # The scan is too slow for all of them
+    start = time.perf_counter()
+    for topic in scan_topics:
+        {f"client_{i}" for i, topic_filter in enumerate(filters) if topic_matches(topic, topic_filter)}
+    scan = (time.perf_counter() - start) / len(scan_topics)
+
+    start = time.perf_counter()
+    for topic in topics:
+        trie.match(topic)
+    matched = (time.perf_counter() - start) / len(topics)
+
+    print(f"{filter_count} filters: scan {1 / scan:>10,.0f} topics/s   "
+          f"trie {1 / matched:>10,.0f} topics/s  ({scan / matched:,.0f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filters", type=int, default=10000)
+    parser.add_argument("--topics", type=int, default=20000)
+    args = parser.parse_args()
+
+    check_parity()
+    bench(args.filters, args.topics)
+
+
+if __name__ == "__main__":
+    main()
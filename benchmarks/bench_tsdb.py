@@ -0,0 +1,85 @@
+"""
+Benchmark: SegmentStore sustained write rate and on-disk bytes per point.
+
+Writes simulated sensor data (2-decimal values, 1 s spacing) through the
+WAL, syncing once per simulated second, then reads it back.
+
+Usage:
+    python benchmarks/bench_tsdb.py [--devices 50] [--keys 8] [--seconds 2000]
+"""
+import argparse
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from tsdb import SegmentStore  # noqa: E402
+
+
+def dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument("--keys", type=int, default=8)
+    parser.add_argument("--seconds", type=int, default=2000)
+    parser.add_argument("--segment-points", type=int, default=4096)
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="tsdb_bench_")
+    try:
+        store = SegmentStore(data_dir, segment_points=args.segment_points)
+        devices = [f"DEV_{i:04d}" for i in range(args.devices)]
+        keys = [f"key_{i}" for i in range(args.keys)]
+        rng = random.Random(42)
+        t0 = 1_700_000_000.0
+
+        start = time.perf_counter()
+        for second in range(args.seconds):
+            ts = t0 + second
+            for d, device in enumerate(devices):
+                for k, key in enumerate(keys):
+                    value = round(20 + 5 * math.sin(second / 60 + d + k) + rng.random(), 2)
+                    store.append(device, key, ts, value)
+            store.sync()
+        store.checkpoint()
+        elapsed = time.perf_counter() - start
+
+        points = args.devices * args.keys * args.seconds
+        size = dir_size(data_dir)
+        print(f"{points} points in {elapsed:.2f}s -> {points / elapsed:,.0f} points/sec")
+        print(f"on disk: {size:,} bytes -> {size / points:.2f} bytes/point "
+              f"(raw float64+int64 = 16.00)")
+        store.close()
+
+        # Cold start: only directories are listed, segments are mapped on read
+        start = time.perf_counter()
+        store = SegmentStore(data_dir, segment_points=args.segment_points)
+        print(f"reopen: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        full = store.read(devices[0], keys[0])
+        print(f"full read of one series ({len(full)} points): "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+        start = time.perf_counter()
+        for device in devices:
+            store.read(device, keys[0], limit=100)
+        print(f"last-100 read: {(time.perf_counter() - start) / len(devices) * 1000:.2f} ms/series")
+        store.close()
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Benchmark: /ws/live bandwidth, JSON frames vs. the iot-telemetry.v1 binary
+subprotocol (backend/ws_binary.py).
+
+Generates plant-floor telemetry (--devices devices, each with the same
+eight sensors rounded to one or two decimals, an integer rpm and a status
+string) and encodes the stream the way a dashboard receives it:
+
+  update  one telemetry_update frame per sample (POST /api/telemetry,
+          conflated single-device deltas)
+  batch   telemetry_batch frames of --batch samples (ingestion pipeline)
+
+Timestamps are either the ingest time (a datetime, shared by a batch) or
+device-sent ISO strings. For each case it reports bytes per sample for
+JSON and for one binary connection (its dictionary included), the ratio,
+the ratio after zlib with a shared window (roughly what permessage-deflate
+does, when the browser and server negotiate it) and the encode cost: one
+json dumps per message, which every JSON client shares, against the binary
+frames for --clients connections sharing one FrameTables.
+
+First decodes every binary frame with a Python port of
+frontend/src/wsBinaryProtocol.js and checks it against the original
+messages (timestamps as epoch milliseconds), for a connection that saw the
+whole stream and one that joined halfway.
+
+Usage:
+    python benchmarks/bench_ws_binary.py [--devices 200] [--samples 20000] [--batch 32]
+                                         [--clients 10]
+"""
+import argparse
+import json
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+import serialization  # noqa: E402
+from ws_binary import NO_TIMESTAMP, BinaryFrameEncoder, FrameTables, timestamp_ms  # noqa: E402
+
+SENSORS = {"temperature": (20, 90, 2), "humidity": (30, 70, 1), "current": (0, 16, 2),
+           "voltage": (215, 245, 1), "power": (0, 3500, 1), "vibration_rms": (0, 5, 3),
+           "pressure": (0.8, 6, 2), "power_factor": (0.7, 1, 2)}
+
+
+def make_samples(devices: int, count: int, device_timestamps: bool, seed: int = 7):
+    rng = random.Random(seed)
+    start = datetime(2026, 3, 1, 8, 0, 0)
+    samples = []
+    for i in range(count):
+        telemetry = {key: round(rng.uniform(low, high), digits) for key, (low, high, digits) in SENSORS.items()}
+        telemetry["rpm"] = rng.randint(0, 3000)
+        telemetry["status"] = "RUNNING" if rng.random() < 0.9 else "IDLE"
+        stamp = start + timedelta(milliseconds=i * 37)
+        samples.append({"device_id": f"ESP32_LINE{i % devices // 50 + 1}_{i % devices:04d}",
+                        "telemetry": telemetry,
+                        "timestamp": stamp.isoformat(timespec="milliseconds") + "Z" if device_timestamps else stamp})
+    return samples
+
+
+def make_messages(samples, mode: str, batch: int):
+    if mode == "update":
+        return [{"type": "telemetry_update", **sample} for sample in samples]
+    return [{"type": "telemetry_batch", "updates": samples[i:i + batch]} for i in range(0, len(samples), batch)]
+
+
+class ReferenceDecoder:
+    """Python port of createFrameDecoder() in frontend/src/wsBinaryProtocol.js."""
+
+    SCALES = {10: 10.0, 11: 100.0, 12: 1000.0}
+
+    def __init__(self):
+        self.names, self.layouts = {}, {}
+
+    def decode(self, frame: bytes):
+        if frame[0] == 0:
+            return json.loads(frame[1:])
+        flags, offset = frame[1], 2
+
+        def read(fmt):
+            nonlocal offset
+            values = struct.unpack_from(fmt, frame, offset)
+            offset += struct.calcsize(fmt)
+            return values[0] if len(values) == 1 else values
+
+        def text(length):
+            nonlocal offset
+            offset += length
+            return frame[offset - length:offset].decode()
+
+        def value(kind):
+            if kind == 0:
+                return float(f"{read('<f'):.7g}")  # toPrecision(7)
+            if kind in (3, 4, 5):
+                return (False, True, None)[kind - 3]
+            if kind == 6:
+                return text(read("<H"))
+            if kind == 7:
+                return json.loads(text(read("<I")))
+            if kind == 8:
+                return self.names[read("<H")]
+            if kind in self.SCALES:
+                return read("<h") / self.SCALES[kind]
+            return read({1: "<d", 2: "<i", 9: "<h"}[kind])
+
+        if flags & 1:
+            for _ in range(read("<H")):
+                index, length = read("<HH")
+                self.names[index] = text(length)
+            for _ in range(read("<H")):
+                index, keys = read("<HH")
+                self.layouts[index] = [(self.names[name], kind) for name, kind in (read("<HB") for _ in range(keys))]
+        base = read("<d")
+        updates = []
+        for _ in range(1 if frame[0] == 2 else read("<I")):
+            device, layout = read("<HH")
+            timestamp = base
+            if flags & 2:
+                delta = read("<i")
+                timestamp = None if delta == NO_TIMESTAMP else base + delta
+            telemetry = {key: value(kind) for key, kind in self.layouts[layout]}
+            updates.append({"device_id": self.names[device], "telemetry": telemetry, "timestamp": timestamp})
+        if frame[0] == 2:
+            return {"type": "telemetry_update", **updates[0]}
+        return {"type": "telemetry_batch", "updates": updates}
+
+
+def expected(message):
+    """The message as the binary decoder should return it."""
+    def update(u):
+        return {"device_id": u["device_id"], "telemetry": u["telemetry"], "timestamp": timestamp_ms(u["timestamp"])}
+    if message["type"] == "telemetry_update":
+        return {"type": "telemetry_update", **update(message)}
+    return {"type": "telemetry_batch", "updates": [update(u) for u in message["updates"]]}
+
+
+def check_parity(messages):
+    """Two connections, one joining halfway, decode what was sent."""
+    tables = FrameTables()
+    encoder, decoder = BinaryFrameEncoder(tables), ReferenceDecoder()
+    late_encoder, late_decoder = BinaryFrameEncoder(tables), ReferenceDecoder()
+    for index, message in enumerate(messages):
+        assert decoder.decode(encoder.encode(message)) == expected(message), message
+        if index >= len(messages) // 2:
+            assert late_decoder.decode(late_encoder.encode(message)) == expected(message), message
+    edge = {"type": "telemetry_update", "device_id": "EDGE", "timestamp": "not a time",
+            "telemetry": {"f32": 21.37, "f64": 3.141592653589793, "tiny": 1e-30, "big_int": 2 ** 40,
+                          "huge_int": 2 ** 70, "flag": True, "none": None, "text": "héllo",
+                          "nested": {"a": [1, 2]}, "inf": float("inf"), "max_f32": 3.4e38, "over_f32": 1e39,
+                          "scaled": -32.768, "edge": 32767.0, "past_edge": 32767.5, "long_text": "x" * 40}}
+    assert decoder.decode(encoder.encode(edge)) == expected(edge)
+    other = {"type": "state_update", "device_id": "EDGE", "state": "IDLE", "timestamp": datetime(2026, 1, 1)}
+    assert decoder.decode(encoder.encode(other)) == json.loads(serialization.dumps(other))
+    print(f"parity: {len(messages) + 2} frames decode to the original messages")
+
+
+def deflated_size(frames) -> int:
+    compressor = zlib.compressobj(wbits=-15)
+    return sum(len(compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)) for frame in frames)
+
+
+def run(samples, mode: str, label: str, args):
+    messages = make_messages(samples, mode, args.batch)
+    start = time.perf_counter()
+    json_frames = [serialization.dumps(message) for message in messages]
+    json_us = (time.perf_counter() - start) / len(samples) * 1e6
+
+    tables = FrameTables()
+    encoders = [BinaryFrameEncoder(tables) for _ in range(args.clients)]
+    binary_frames = []
+    start = time.perf_counter()
+    for message in messages:
+        binary_frames.append([encoder.encode(message) for encoder in encoders][0])
+    binary_us = (time.perf_counter() - start) / len(samples) * 1e6
+
+    json_bytes = sum(map(len, json_frames))
+    binary_bytes = sum(map(len, binary_frames))
+    ratio = json_bytes / binary_bytes
+    deflate_ratio = deflated_size(json_frames) / deflated_size(binary_frames)
+    print(f"{mode:>6} {label:<18} JSON {json_bytes / len(samples):6.1f} B/sample  "
+          f"binary {binary_bytes / len(samples):5.1f} B/sample  {ratio:5.1f}x  "
+          f"(deflated {deflate_ratio:4.1f}x)  encode {json_us:5.2f} / {binary_us:5.2f} us/sample "
+          f"({args.clients} clients)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=32, help="samples per telemetry_batch frame")
+    parser.add_argument("--clients", type=int, default=10, help="binary connections sharing the encoding")
+    args = parser.parse_args()
+
+    print(f"serializer: {serialization.BACKEND}")
+    for device_timestamps, label in ((False, "ingest timestamps"), (True, "device timestamps")):
+        samples = make_samples(args.devices, args.samples, device_timestamps)
+        check_parity(make_messages(samples[:2000], "update", args.batch)
+                     + make_messages(samples[2000:4000], "batch", args.batch))
+        for mode in ("update", "batch"):
+            run(samples, mode, label, args)
+
+
+if __name__ == "__main__":
+    main()
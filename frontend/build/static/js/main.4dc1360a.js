@@ -1,3 +0,0 @@
-/*! For license information please see main.4dc1360a.js.LICENSE.txt */
-(()=>{var e={14(e){e.exports=function(){return!1}},61(e){e.exports=function(e,t){return e<t}},143(e){var t=/\s/;e.exports=function(e){for(var n=e.length;n--&&t.test(e.charAt(n)););return n}},149(e){e.exports=function(e,t){for(var n=-1,r=null==e?0:e.length,o=Array(r);++n<r;)o[n]=t(e[n],n,e);return o}},320(e){e.exports=function(e,t){var n=e.length;for(e.sort(t);n--;)e[n]=e[n].value;return e}},396(e){e.exports=function(e){return function(t){return null==t?void 0:t[e]}}},438(e,t,n){var r=n(2622);e.exports=function(e){return r(this,e).get(e)}},539(e,t,n){var r=n(9742),o=n(7498),i=n(3279);e.exports=function(e){return e&&e.length?r(e,i,o):void 0}},579(e,t,n){"use strict";e.exports=n(1153)},620(e,t,n){var r=n(6913),o=n(4052),i=n(2761);e.exports=function(e){return"string"==typeof e||!o(e)&&i(e)&&"[object String]"==r(e)}},643(e,t,n){var r=n(7676)("toUpperCase");e.exports=r},644(e){e.exports=function(e){return e!==e}},705(e){e.exports=function(e){var t=typeof e;return"string"==t||"number"==t||"symbol"==t||"boolean"==t?"__proto__"!==e:null===e}},715(e){var t="\\ud800-\\udfff",n="["+t+"]",r="[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]",o="\\ud83c[\\udffb-\\udfff]",i="[^"+t+"]",a="(?:\\ud83c[\\udde6-\\uddff]){2}",l="[\\ud800-\\udbff][\\udc00-\\udfff]",u="(?:"+r+"|"+o+")"+"?",c="[\\ufe0e\\ufe0f]?",s=c+u+("(?:\\u200d(?:"+[i,a,l].join("|")+")"+c+u+")*"),f="(?:"+[i+r+"?",r,a,l,n].join("|")+")",d=RegExp(o+"(?="+o+")|"+f+s,"g");e.exports=function(e){return e.match(d)||[]}},755(e,t,n){var r=n(8895),o=n(7116);e.exports=function e(t,n,i,a,l){var u=-1,c=t.length;for(i||(i=o),l||(l=[]);++u<c;){var s=t[u];n>0&&i(s)?n>1?e(s,n-1,i,a,l):r(l,s):a||(l[l.length]=s)}return l}},793(e){e.exports=function(e){var t=this.__data__,n=t.delete(e);return this.size=t.size,n}},801(e,t,n){var r=n(1141),o=n(6686),i=n(9841),a=/^[-+]0x[0-9a-f]+$/i,l=/^0b[01]+$/i,u=/^0o[0-7]+$/i,c=parseInt;e.exports=function(e){if("number"==typeof e)return e;if(i(e))return NaN;if(o(e)){var t="function"==typeof e.valueOf?e.valueOf():e;e=o(t)?t+"":t}if("string"!=typeof e)return 0===e?e:+e;e=r(e);var n=l.test(e);return n||u.test(e)?c(e.slice(2),n?2:8):a.test(e)?NaN:+e}},914(e,t,n){var r=n(9841);e.exports=function(e){if("string"==typeof e||r(e))return e;var t=e+"";return"0"==t&&1/e==-1/0?"-0":t}},929(e,t,n){var r=n(3211),o=n(6571),i=n(9194),a=n(6686);e.exports=function(e,t,n){if(!a(n))return!1;var l=typeof t;return!!("number"==l?o(n)&&i(t,n.length):"string"==l&&t in n)&&r(n[t],e)}},935(e,t,n){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default=void 0;var r=function(e,t){if("function"==typeof WeakMap)var n=new WeakMap,r=new WeakMap;return function(e,t){if(!t&&e&&e.__esModule)return e;var o,i,a={__proto__:null,default:e};if(null===e||"object"!=typeof e&&"function"!=typeof e)return a;if(o=t?r:n){if(o.has(e))return o.get(e);o.set(e,a)}for(const n in e)"default"!==n&&{}.hasOwnProperty.call(e,n)&&((i=(o=Object.defineProperty)&&Object.getOwnPropertyDescriptor(e,n))&&(i.get||i.set)?o(a,n,i):a[n]=e[n]);return a}(e,t)}(n(5043)),o=s(n(5173)),i=s(n(7950)),a=n(1212),l=n(1777),u=n(2447),c=s(n(7768));function s(e){return e&&e.__esModule?e:{default:e}}function f(e,t,n){return(t=function(e){var t=function(e,t){if("object"!=typeof e||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=typeof r)return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==typeof t?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}const d={start:"touchstart",move:"touchmove",stop:"touchend"},p={start:"mousedown",move:"mousemove",stop:"mouseup"};let h=p;class y extends r.Component{constructor(){super(...arguments),f(this,"dragging",!1),f(this,"lastX",NaN),f(this,"lastY",NaN),f(this,"touchIdentifier",null),f(this,"mounted",!1),f(this,"handleDragStart",e=>{if(this.props.onMouseDown(e),!this.props.allowAnyClick&&"number"===typeof e.button&&0!==e.button)return!1;const t=this.findDOMNode();if(!t||!t.ownerDocument||!t.ownerDocument.body)throw new Error("<DraggableCore> not mounted on DragStart!");const{ownerDocument:n}=t;if(this.props.disabled||!(e.target instanceof n.defaultView.Node)||this.props.handle&&!(0,a.matchesSelectorAndParentsTo)(e.target,this.props.handle,t)||this.props.cancel&&(0,a.matchesSelectorAndParentsTo)(e.target,this.props.cancel,t))return;"touchstart"!==e.type||this.props.allowMobileScroll||e.preventDefault();const r=(0,a.getTouchIdentifier)(e);this.touchIdentifier=r;const o=(0,l.getControlPosition)(e,r,this);if(null==o)return;const{x:i,y:u}=o,s=(0,l.createCoreData)(this,i,u);(0,c.default)("DraggableCore: handleDragStart: %j",s),(0,c.default)("calling",this.props.onStart);!1!==this.props.onStart(e,s)&&!1!==this.mounted&&(this.props.enableUserSelectHack&&(0,a.addUserSelectStyles)(n),this.dragging=!0,this.lastX=i,this.lastY=u,(0,a.addEvent)(n,h.move,this.handleDrag),(0,a.addEvent)(n,h.stop,this.handleDragStop))}),f(this,"handleDrag",e=>{const t=(0,l.getControlPosition)(e,this.touchIdentifier,this);if(null==t)return;let{x:n,y:r}=t;if(Array.isArray(this.props.grid)){let e=n-this.lastX,t=r-this.lastY;if([e,t]=(0,l.snapToGrid)(this.props.grid,e,t),!e&&!t)return;n=this.lastX+e,r=this.lastY+t}const o=(0,l.createCoreData)(this,n,r);(0,c.default)("DraggableCore: handleDrag: %j",o);if(!1!==this.props.onDrag(e,o)&&!1!==this.mounted)this.lastX=n,this.lastY=r;else try{this.handleDragStop(new MouseEvent("mouseup"))}catch(i){const e=document.createEvent("MouseEvents");e.initMouseEvent("mouseup",!0,!0,window,0,0,0,0,0,!1,!1,!1,!1,0,null),this.handleDragStop(e)}}),f(this,"handleDragStop",e=>{if(!this.dragging)return;const t=(0,l.getControlPosition)(e,this.touchIdentifier,this);if(null==t)return;let{x:n,y:r}=t;if(Array.isArray(this.props.grid)){let e=n-this.lastX||0,t=r-this.lastY||0;[e,t]=(0,l.snapToGrid)(this.props.grid,e,t),n=this.lastX+e,r=this.lastY+t}const o=(0,l.createCoreData)(this,n,r);if(!1===this.props.onStop(e,o)||!1===this.mounted)return!1;const i=this.findDOMNode();i&&this.props.enableUserSelectHack&&(0,a.scheduleRemoveUserSelectStyles)(i.ownerDocument),(0,c.default)("DraggableCore: handleDragStop: %j",o),this.dragging=!1,this.lastX=NaN,this.lastY=NaN,i&&((0,c.default)("DraggableCore: Removing handlers"),(0,a.removeEvent)(i.ownerDocument,h.move,this.handleDrag),(0,a.removeEvent)(i.ownerDocument,h.stop,this.handleDragStop))}),f(this,"onMouseDown",e=>(h=p,this.handleDragStart(e))),f(this,"onMouseUp",e=>(h=p,this.handleDragStop(e))),f(this,"onTouchStart",e=>(h=d,this.handleDragStart(e))),f(this,"onTouchEnd",e=>(h=d,this.handleDragStop(e)))}componentDidMount(){this.mounted=!0;const e=this.findDOMNode();e&&(0,a.addEvent)(e,d.start,this.onTouchStart,{passive:!1})}componentWillUnmount(){this.mounted=!1;const e=this.findDOMNode();if(e){const{ownerDocument:t}=e;(0,a.removeEvent)(t,p.move,this.handleDrag),(0,a.removeEvent)(t,d.move,this.handleDrag),(0,a.removeEvent)(t,p.stop,this.handleDragStop),(0,a.removeEvent)(t,d.stop,this.handleDragStop),(0,a.removeEvent)(e,d.start,this.onTouchStart,{passive:!1}),this.props.enableUserSelectHack&&(0,a.scheduleRemoveUserSelectStyles)(t)}}findDOMNode(){var e,t;return null!==(e=this.props)&&void 0!==e&&e.nodeRef?null===(t=this.props)||void 0===t||null===(t=t.nodeRef)||void 0===t?void 0:t.current:i.default.findDOMNode(this)}render(){return r.cloneElement(r.Children.only(this.props.children),{onMouseDown:this.onMouseDown,onMouseUp:this.onMouseUp,onTouchEnd:this.onTouchEnd})}}t.default=y,f(y,"displayName","DraggableCore"),f(y,"propTypes",{allowAnyClick:o.default.bool,allowMobileScroll:o.default.bool,children:o.default.node.isRequired,disabled:o.default.bool,enableUserSelectHack:o.default.bool,offsetParent:function(e,t){if(e[t]&&1!==e[t].nodeType)throw new Error("Draggable's offsetParent must be a DOM Node.")},grid:o.default.arrayOf(o.default.number),handle:o.default.string,cancel:o.default.string,nodeRef:o.default.object,onStart:o.default.func,onDrag:o.default.func,onStop:o.default.func,onMouseDown:o.default.func,scale:o.default.number,className:u.dontSetMe,style:u.dontSetMe,transform:u.dontSetMe}),f(y,"defaultProps",{allowAnyClick:!1,allowMobileScroll:!1,disabled:!1,enableUserSelectHack:!0,onStart:function(){},onDrag:function(){},onStop:function(){},onMouseDown:function(){},scale:1})},977(e,t,n){var r=n(9096),o=n(4416);e.exports=function(e,t){return e&&e.length?o(e,r(t,2)):[]}},1069(e,t,n){var r=n(8541);e.exports=function(e){return null==e?"":r(e)}},1141(e,t,n){var r=n(143),o=/^\s+/;e.exports=function(e){return e?e.slice(0,r(e)+1).replace(o,""):e}},1143(e,t,n){var r=n(3028)(Object.keys,Object);e.exports=r},1153(e,t,n){"use strict";var r=n(5043),o=Symbol.for("react.element"),i=Symbol.for("react.fragment"),a=Object.prototype.hasOwnProperty,l=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,u={key:!0,ref:!0,__self:!0,__source:!0};function c(e,t,n){var r,i={},c=null,s=null;for(r in void 0!==n&&(c=""+n),void 0!==t.key&&(c=""+t.key),void 0!==t.ref&&(s=t.ref),t)a.call(t,r)&&!u.hasOwnProperty(r)&&(i[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps)void 0===i[r]&&(i[r]=t[r]);return{$$typeof:o,type:e,key:c,ref:s,props:i,_owner:l.current}}t.Fragment=i,t.jsx=c,t.jsxs=c},1170(e){e.exports=function(e,t,n){switch(n.length){case 0:return e.call(t);case 1:return e.call(t,n[0]);case 2:return e.call(t,n[0],n[1]);case 3:return e.call(t,n[0],n[1],n[2])}return e.apply(t,n)}},1212(e,t,n){"use strict";var r=n(2897).default;Object.defineProperty(t,"__esModule",{value:!0}),t.addClassName=s,t.addEvent=function(e,t,n,o){if(!e)return;const i=r({capture:!0},o);e.addEventListener?e.addEventListener(t,n,i):e.attachEvent?e.attachEvent("on"+t,n):e["on"+t]=n},t.addUserSelectStyles=function(e){if(!e)return;let t=e.getElementById("react-draggable-style-el");t||(t=e.createElement("style"),t.type="text/css",t.id="react-draggable-style-el",t.innerHTML=".react-draggable-transparent-selection *::-moz-selection {all: inherit;}\n",t.innerHTML+=".react-draggable-transparent-selection *::selection {all: inherit;}\n",e.getElementsByTagName("head")[0].appendChild(t));e.body&&s(e.body,"react-draggable-transparent-selection")},t.createCSSTransform=function(e,t){const n=u(e,t,"px");return{[(0,i.browserPrefixToKey)("transform",i.default)]:n}},t.createSVGTransform=function(e,t){return u(e,t,"")},t.getTouch=function(e,t){return e.targetTouches&&(0,o.findInArray)(e.targetTouches,e=>t===e.identifier)||e.changedTouches&&(0,o.findInArray)(e.changedTouches,e=>t===e.identifier)},t.getTouchIdentifier=function(e){if(e.targetTouches&&e.targetTouches[0])return e.targetTouches[0].identifier;if(e.changedTouches&&e.changedTouches[0])return e.changedTouches[0].identifier},t.getTranslation=u,t.innerHeight=function(e){let t=e.clientHeight;const n=e.ownerDocument.defaultView.getComputedStyle(e);return t-=(0,o.int)(n.paddingTop),t-=(0,o.int)(n.paddingBottom),t},t.innerWidth=function(e){let t=e.clientWidth;const n=e.ownerDocument.defaultView.getComputedStyle(e);return t-=(0,o.int)(n.paddingLeft),t-=(0,o.int)(n.paddingRight),t},t.matchesSelector=l,t.matchesSelectorAndParentsTo=function(e,t,n){let r=e;do{if(l(r,t))return!0;if(r===n)return!1;r=r.parentNode}while(r);return!1},t.offsetXYFromParent=function(e,t,n){const r=t===t.ownerDocument.body?{left:0,top:0}:t.getBoundingClientRect(),o=(e.clientX+t.scrollLeft-r.left)/n,i=(e.clientY+t.scrollTop-r.top)/n;return{x:o,y:i}},t.outerHeight=function(e){let t=e.clientHeight;const n=e.ownerDocument.defaultView.getComputedStyle(e);return t+=(0,o.int)(n.borderTopWidth),t+=(0,o.int)(n.borderBottomWidth),t},t.outerWidth=function(e){let t=e.clientWidth;const n=e.ownerDocument.defaultView.getComputedStyle(e);return t+=(0,o.int)(n.borderLeftWidth),t+=(0,o.int)(n.borderRightWidth),t},t.removeClassName=f,t.removeEvent=function(e,t,n,o){if(!e)return;const i=r({capture:!0},o);e.removeEventListener?e.removeEventListener(t,n,i):e.detachEvent?e.detachEvent("on"+t,n):e["on"+t]=null},t.scheduleRemoveUserSelectStyles=function(e){window.requestAnimationFrame?window.requestAnimationFrame(()=>{c(e)}):c(e)};var o=n(2447),i=function(e,t){if("function"==typeof WeakMap)var n=new WeakMap,r=new WeakMap;return function(e,t){if(!t&&e&&e.__esModule)return e;var o,i,a={__proto__:null,default:e};if(null===e||"object"!=typeof e&&"function"!=typeof e)return a;if(o=t?r:n){if(o.has(e))return o.get(e);o.set(e,a)}for(const n in e)"default"!==n&&{}.hasOwnProperty.call(e,n)&&((i=(o=Object.defineProperty)&&Object.getOwnPropertyDescriptor(e,n))&&(i.get||i.set)?o(a,n,i):a[n]=e[n]);return a}(e,t)}(n(1561));let a="";function l(e,t){return a||(a=(0,o.findInArray)(["matches","webkitMatchesSelector","mozMatchesSelector","msMatchesSelector","oMatchesSelector"],function(t){return(0,o.isFunction)(e[t])})),!!(0,o.isFunction)(e[a])&&e[a](t)}function u(e,t,n){let{x:r,y:o}=e,i="translate(".concat(r).concat(n,",").concat(o).concat(n,")");if(t){const e="".concat("string"===typeof t.x?t.x:t.x+n),r="".concat("string"===typeof t.y?t.y:t.y+n);i="translate(".concat(e,", ").concat(r,")")+i}return i}function c(e){if(e)try{if(e.body&&f(e.body,"react-draggable-transparent-selection"),e.selection)e.selection.empty();else{const t=(e.defaultView||window).getSelection();t&&"Caret"!==t.type&&t.removeAllRanges()}}catch(t){}}function s(e,t){e.classList?e.classList.add(t):e.className.match(new RegExp("(?:^|\\s)".concat(t,"(?!\\S)")))||(e.className+=" ".concat(t))}function f(e,t){e.classList?e.classList.remove(t):e.className=e.className.replace(new RegExp("(?:^|\\s)".concat(t,"(?!\\S)"),"g"),"")}},1268(e,t,n){var r=n(5428),o=n(7574),i=n(6832),a=i&&i.isTypedArray,l=a?o(a):r;e.exports=l},1310(e){e.exports=function(e,t){return function(n){return null!=n&&(n[e]===t&&(void 0!==t||e in Object(n)))}}},1340(e,t,n){var r=n(3211);e.exports=function(e,t){for(var n=e.length;n--;)if(r(e[n][0],t))return n;return-1}},1497(e,t,n){"use strict";var r=n(3218);function o(){}function i(){}i.resetWarningCache=o,e.exports=function(){function e(e,t,n,o,i,a){if(a!==r){var l=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw l.name="Invariant Violation",l}}function t(){return e}e.isRequired=e;var n={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:i,resetWarningCache:o};return n.PropTypes=n,n}},1558(e){e.exports=function(e,t,n){for(var r=-1,o=null==e?0:e.length;++r<o;)if(n(t,e[r]))return!0;return!1}},1561(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.browserPrefixToKey=o,t.browserPrefixToStyle=function(e,t){return t?"-".concat(t.toLowerCase(),"-").concat(e):e},t.default=void 0,t.getPrefix=r;const n=["Moz","Webkit","O","ms"];function r(){var e;let t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"transform";if("undefined"===typeof window)return"";const r=null===(e=window.document)||void 0===e||null===(e=e.documentElement)||void 0===e?void 0:e.style;if(!r)return"";if(t in r)return"";for(let i=0;i<n.length;i++)if(o(t,n[i])in r)return n[i];return""}function o(e,t){return t?"".concat(t).concat(function(e){let t="",n=!0;for(let r=0;r<e.length;r++)n?(t+=e[r].toUpperCase(),n=!1):"-"===e[r]?n=!0:t+=e[r];return t}(e)):e}t.default=r()},1629(e,t,n){var r=n(6913),o=n(6686);e.exports=function(e){if(!o(e))return!1;var t=r(e);return"[object Function]"==t||"[object GeneratorFunction]"==t||"[object AsyncFunction]"==t||"[object Proxy]"==t}},1714(e,t,n){var r=n(1340);e.exports=function(e,t){var n=this.__data__,o=r(n,e);return o<0?(++this.size,n.push([e,t])):n[o][1]=t,this}},1733(e,t,n){var r=n(1775),o=n(4664),i=n(9096);e.exports=function(e,t){var n={};return t=i(t,3),o(e,function(e,o,i){r(n,o,t(e,o,i))}),n}},1775(e,t,n){var r=n(5654);e.exports=function(e,t,n){"__proto__"==t&&r?r(e,t,{configurable:!0,enumerable:!0,value:n,writable:!0}):e[t]=n}},1777(e,t,n){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.canDragX=function(e){return"both"===e.props.axis||"x"===e.props.axis},t.canDragY=function(e){return"both"===e.props.axis||"y"===e.props.axis},t.createCoreData=function(e,t,n){const o=!(0,r.isNum)(e.lastX),a=i(e);return o?{node:a,deltaX:0,deltaY:0,lastX:t,lastY:n,x:t,y:n}:{node:a,deltaX:t-e.lastX,deltaY:n-e.lastY,lastX:e.lastX,lastY:e.lastY,x:t,y:n}},t.createDraggableData=function(e,t){const n=e.props.scale;return{node:t.node,x:e.state.x+t.deltaX/n,y:e.state.y+t.deltaY/n,deltaX:t.deltaX/n,deltaY:t.deltaY/n,lastX:e.state.x,lastY:e.state.y}},t.getBoundPosition=function(e,t,n){if(!e.props.bounds)return[t,n];let{bounds:a}=e.props;a="string"===typeof a?a:function(e){return{left:e.left,top:e.top,right:e.right,bottom:e.bottom}}(a);const l=i(e);if("string"===typeof a){const{ownerDocument:e}=l,t=e.defaultView;let n;if("parent"===a)n=l.parentNode;else{n=l.getRootNode().querySelector(a)}if(!(n instanceof t.HTMLElement))throw new Error('Bounds selector "'+a+'" could not find an element.');const i=n,u=t.getComputedStyle(l),c=t.getComputedStyle(i);a={left:-l.offsetLeft+(0,r.int)(c.paddingLeft)+(0,r.int)(u.marginLeft),top:-l.offsetTop+(0,r.int)(c.paddingTop)+(0,r.int)(u.marginTop),right:(0,o.innerWidth)(i)-(0,o.outerWidth)(l)-l.offsetLeft+(0,r.int)(c.paddingRight)-(0,r.int)(u.marginRight),bottom:(0,o.innerHeight)(i)-(0,o.outerHeight)(l)-l.offsetTop+(0,r.int)(c.paddingBottom)-(0,r.int)(u.marginBottom)}}(0,r.isNum)(a.right)&&(t=Math.min(t,a.right));(0,r.isNum)(a.bottom)&&(n=Math.min(n,a.bottom));(0,r.isNum)(a.left)&&(t=Math.max(t,a.left));(0,r.isNum)(a.top)&&(n=Math.max(n,a.top));return[t,n]},t.getControlPosition=function(e,t,n){const r="number"===typeof t?(0,o.getTouch)(e,t):null;if("number"===typeof t&&!r)return null;const a=i(n),l=n.props.offsetParent||a.offsetParent||a.ownerDocument.body;return(0,o.offsetXYFromParent)(r||e,l,n.props.scale)},t.snapToGrid=function(e,t,n){const r=Math.round(t/e[0])*e[0],o=Math.round(n/e[1])*e[1];return[r,o]};var r=n(2447),o=n(1212);function i(e){const t=e.findDOMNode();if(!t)throw new Error("<DraggableCore>: Unmounted during event!");return t}},1847(e,t,n){var r=n(4893);e.exports=function(e,t){if(null==e)return{};var n,o,i=r(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(o=0;o<a.length;o++)n=a[o],-1===t.indexOf(n)&&{}.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i},e.exports.__esModule=!0,e.exports.default=e.exports},1929(e,t,n){"use strict";const{default:r,DraggableCore:o}=n(8136);e.exports=r,e.exports.default=r,e.exports.DraggableCore=o},1946(e,t,n){var r=n(1340);e.exports=function(e){return r(this.__data__,e)>-1}},2070(e,t,n){var r=n(7937)(n(6552),"Set");e.exports=r},2074(e){e.exports=function(e){var t=-1,n=Array(e.size);return e.forEach(function(e){n[++t]=e}),n}},2154(e,t,n){var r=n(5575),o=Object.prototype.hasOwnProperty;e.exports=function(e){var t=this.__data__;if(r){var n=t[e];return"__lodash_hash_undefined__"===n?void 0:n}return o.call(t,e)?t[e]:void 0}},2165(e,t,n){var r=n(5652);e.exports=function(e,t){var n;return r(e,function(e,r,o){return!(n=t(e,r,o))}),!!n}},2322(e,t,n){var r=n(6913),o=n(5990),i=n(2761),a=Function.prototype,l=Object.prototype,u=a.toString,c=l.hasOwnProperty,s=u.call(Object);e.exports=function(e){if(!i(e)||"[object Object]"!=r(e))return!1;var t=o(e);if(null===t)return!0;var n=c.call(t,"constructor")&&t.constructor;return"function"==typeof n&&n instanceof n&&u.call(n)==s}},2447(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.dontSetMe=function(e,t,n){if(e[t])return new Error("Invalid prop ".concat(t," passed to ").concat(n," - do not set this, set it on the child."))},t.findInArray=function(e,t){for(let n=0,r=e.length;n<r;n++)if(t.apply(t,[e[n],n,e]))return e[n]},t.int=function(e){return parseInt(e,10)},t.isFunction=function(e){return"function"===typeof e||"[object Function]"===Object.prototype.toString.call(e)},t.isNum=function(e){return"number"===typeof e&&!isNaN(e)}},2520(e,t,n){var r=n(5816),o=n(9096),i=n(9140),a=Math.max;e.exports=function(e,t,n){var l=null==e?0:e.length;if(!l)return-1;var u=null==n?0:i(n);return u<0&&(u=a(l+u,0)),r(e,o(t,3),u)}},2536(e,t,n){var r=n(149),o=n(2969),i=n(9096),a=n(8883),l=n(320),u=n(7574),c=n(5893),s=n(3279),f=n(4052);e.exports=function(e,t,n){t=t.length?r(t,function(e){return f(e)?function(t){return o(t,1===e.length?e[0]:e)}:e}):[s];var d=-1;t=r(t,u(i));var p=a(e,function(e,n,o){return{criteria:r(t,function(t){return t(e)}),index:++d,value:e}});return l(p,function(e,t){return c(e,t,n)})}},2541(e){e.exports=function(e){return function(){return e}}},2587(e){e.exports=function(e,t){for(var n=-1,r=null==e?0:e.length;++n<r;)if(t(e[n],n,e))return!0;return!1}},2597(e,t,n){var r=n(4052),o=n(9841),i=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,a=/^\w*$/;e.exports=function(e,t){if(r(e))return!1;var n=typeof e;return!("number"!=n&&"symbol"!=n&&"boolean"!=n&&null!=e&&!o(e))||(a.test(e)||!i.test(e)||null!=t&&e in Object(t))}},2622(e,t,n){var r=n(705);e.exports=function(e,t){var n=e.__data__;return r(t)?n["string"==typeof t?"string":"hash"]:n.map}},2662(e,t,n){var r=n(5575);e.exports=function(e,t){var n=this.__data__;return this.size+=this.has(e)?0:1,n[e]=r&&void 0===t?"__lodash_hash_undefined__":t,this}},2730(e,t,n){"use strict";var r=n(5043),o=n(8853);function i(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var a=new Set,l={};function u(e,t){c(e,t),c(e+"Capture",t)}function c(e,t){for(l[e]=t,e=0;e<t.length;e++)a.add(t[e])}var s=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),f=Object.prototype.hasOwnProperty,d=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p={},h={};function y(e,t,n,r,o,i,a){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=i,this.removeEmptyString=a}var v={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){v[e]=new y(e,0,!1,e,null,!1,!1)}),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];v[t]=new y(t,1,!1,e[1],null,!1,!1)}),["contentEditable","draggable","spellCheck","value"].forEach(function(e){v[e]=new y(e,2,!1,e.toLowerCase(),null,!1,!1)}),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){v[e]=new y(e,2,!1,e,null,!1,!1)}),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){v[e]=new y(e,3,!1,e.toLowerCase(),null,!1,!1)}),["checked","multiple","muted","selected"].forEach(function(e){v[e]=new y(e,3,!0,e,null,!1,!1)}),["capture","download"].forEach(function(e){v[e]=new y(e,4,!1,e,null,!1,!1)}),["cols","rows","size","span"].forEach(function(e){v[e]=new y(e,6,!1,e,null,!1,!1)}),["rowSpan","start"].forEach(function(e){v[e]=new y(e,5,!1,e.toLowerCase(),null,!1,!1)});var m=/[\-:]([a-z])/g;function g(e){return e[1].toUpperCase()}function b(e,t,n,r){var o=v.hasOwnProperty(t)?v[t]:null;(null!==o?0!==o.type:r||!(2<t.length)||"o"!==t[0]&&"O"!==t[0]||"n"!==t[1]&&"N"!==t[1])&&(function(e,t,n,r){if(null===t||"undefined"===typeof t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,o,r)&&(n=null),r||null===o?function(e){return!!f.call(h,e)||!f.call(p,e)&&(d.test(e)?h[e]=!0:(p[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):o.mustUseProperty?e[o.propertyName]=null===n?3!==o.type&&"":n:(t=o.attributeName,r=o.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(o=o.type)||4===o&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(m,g);v[t]=new y(t,1,!1,e,null,!1,!1)}),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(m,g);v[t]=new y(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)}),["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(m,g);v[t]=new y(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)}),["tabIndex","crossOrigin"].forEach(function(e){v[e]=new y(e,1,!1,e.toLowerCase(),null,!1,!1)}),v.xlinkHref=new y("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach(function(e){v[e]=new y(e,1,!1,e.toLowerCase(),null,!0,!0)});var x=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,w=Symbol.for("react.element"),O=Symbol.for("react.portal"),S=Symbol.for("react.fragment"),j=Symbol.for("react.strict_mode"),k=Symbol.for("react.profiler"),P=Symbol.for("react.provider"),E=Symbol.for("react.context"),_=Symbol.for("react.forward_ref"),M=Symbol.for("react.suspense"),A=Symbol.for("react.suspense_list"),C=Symbol.for("react.memo"),T=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var N=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var D=Symbol.iterator;function I(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=D&&e[D]||e["@@iterator"])?e:null}var z,R=Object.assign;function L(e){if(void 0===z)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);z=t&&t[1]||""}return"\n"+z+e}var B=!1;function F(e,t){if(!e||B)return"";B=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&"string"===typeof c.stack){for(var o=c.stack.split("\n"),i=r.stack.split("\n"),a=o.length-1,l=i.length-1;1<=a&&0<=l&&o[a]!==i[l];)l--;for(;1<=a&&0<=l;a--,l--)if(o[a]!==i[l]){if(1!==a||1!==l)do{if(a--,0>--l||o[a]!==i[l]){var u="\n"+o[a].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}}while(1<=a&&0<=l);break}}}finally{B=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?L(e):""}function U(e){switch(e.tag){case 5:return L(e.type);case 16:return L("Lazy");case 13:return L("Suspense");case 19:return L("SuspenseList");case 0:case 2:case 15:return e=F(e.type,!1);case 11:return e=F(e.type.render,!1);case 1:return e=F(e.type,!0);default:return""}}function W(e){if(null==e)return null;if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case S:return"Fragment";case O:return"Portal";case k:return"Profiler";case j:return"StrictMode";case M:return"Suspense";case A:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case E:return(e.displayName||"Context")+".Consumer";case P:return(e._context.displayName||"Context")+".Provider";case _:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case C:return null!==(t=e.displayName||null)?t:W(e.type)||"Memo";case T:t=e._payload,e=e._init;try{return W(e(t))}catch(n){}}return null}function H(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=t.render).displayName||e.name||"",t.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return W(t);case 8:return t===j?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"===typeof t)return t.displayName||t.name||null;if("string"===typeof t)return t}return null}function q(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function V(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function X(e){e._valueTracker||(e._valueTracker=function(e){var t=V(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var o=n.get,i=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(e){r=""+e,i.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function $(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=V(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function Y(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function G(e,t){var n=t.checked;return R({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function K(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=q(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function Q(e,t){null!=(t=t.checked)&&b(e,"checked",t,!1)}function Z(e,t){Q(e,t);var n=q(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?ee(e,t.type,n):t.hasOwnProperty("defaultValue")&&ee(e,t.type,q(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function J(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function ee(e,t,n){"number"===t&&Y(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var te=Array.isArray;function ne(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+q(n),t=null,o=0;o<e.length;o++){if(e[o].value===n)return e[o].selected=!0,void(r&&(e[o].defaultSelected=!0));null!==t||e[o].disabled||(t=e[o])}null!==t&&(t.selected=!0)}}function re(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(i(91));return R({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function oe(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(i(92));if(te(n)){if(1<n.length)throw Error(i(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:q(n)}}function ie(e,t){var n=q(t.value),r=q(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function ae(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}function le(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ue(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?le(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var ce,se,fe=(se=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((ce=ce||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=ce.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!==typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction(function(){return se(e,t)})}:se);function de(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var pe={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},he=["Webkit","ms","Moz","O"];function ye(e,t,n){return null==t||"boolean"===typeof t||""===t?"":n||"number"!==typeof t||0===t||pe.hasOwnProperty(e)&&pe[e]?(""+t).trim():t+"px"}function ve(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),o=ye(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,o):e[n]=o}}Object.keys(pe).forEach(function(e){he.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),pe[t]=pe[e]})});var me=R({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ge(e,t){if(t){if(me[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(i(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(i(60));if("object"!==typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(i(61))}if(null!=t.style&&"object"!==typeof t.style)throw Error(i(62))}}function be(e,t){if(-1===e.indexOf("-"))return"string"===typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var xe=null;function we(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Oe=null,Se=null,je=null;function ke(e){if(e=xo(e)){if("function"!==typeof Oe)throw Error(i(280));var t=e.stateNode;t&&(t=Oo(t),Oe(e.stateNode,e.type,t))}}function Pe(e){Se?je?je.push(e):je=[e]:Se=e}function Ee(){if(Se){var e=Se,t=je;if(je=Se=null,ke(e),t)for(e=0;e<t.length;e++)ke(t[e])}}function _e(e,t){return e(t)}function Me(){}var Ae=!1;function Ce(e,t,n){if(Ae)return e(t,n);Ae=!0;try{return _e(e,t,n)}finally{Ae=!1,(null!==Se||null!==je)&&(Me(),Ee())}}function Te(e,t){var n=e.stateNode;if(null===n)return null;var r=Oo(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(i(231,t,typeof n));return n}var Ne=!1;if(s)try{var De={};Object.defineProperty(De,"passive",{get:function(){Ne=!0}}),window.addEventListener("test",De,De),window.removeEventListener("test",De,De)}catch(se){Ne=!1}function Ie(e,t,n,r,o,i,a,l,u){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(s){this.onError(s)}}var ze=!1,Re=null,Le=!1,Be=null,Fe={onError:function(e){ze=!0,Re=e}};function Ue(e,t,n,r,o,i,a,l,u){ze=!1,Re=null,Ie.apply(Fe,arguments)}function We(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function He(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function qe(e){if(We(e)!==e)throw Error(i(188))}function Ve(e){return null!==(e=function(e){var t=e.alternate;if(!t){if(null===(t=We(e)))throw Error(i(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(null===o)break;var a=o.alternate;if(null===a){if(null!==(r=o.return)){n=r;continue}break}if(o.child===a.child){for(a=o.child;a;){if(a===n)return qe(o),e;if(a===r)return qe(o),t;a=a.sibling}throw Error(i(188))}if(n.return!==r.return)n=o,r=a;else{for(var l=!1,u=o.child;u;){if(u===n){l=!0,n=o,r=a;break}if(u===r){l=!0,r=o,n=a;break}u=u.sibling}if(!l){for(u=a.child;u;){if(u===n){l=!0,n=a,r=o;break}if(u===r){l=!0,r=a,n=o;break}u=u.sibling}if(!l)throw Error(i(189))}}if(n.alternate!==r)throw Error(i(190))}if(3!==n.tag)throw Error(i(188));return n.stateNode.current===n?e:t}(e))?Xe(e):null}function Xe(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var t=Xe(e);if(null!==t)return t;e=e.sibling}return null}var $e=o.unstable_scheduleCallback,Ye=o.unstable_cancelCallback,Ge=o.unstable_shouldYield,Ke=o.unstable_requestPaint,Qe=o.unstable_now,Ze=o.unstable_getCurrentPriorityLevel,Je=o.unstable_ImmediatePriority,et=o.unstable_UserBlockingPriority,tt=o.unstable_NormalPriority,nt=o.unstable_LowPriority,rt=o.unstable_IdlePriority,ot=null,it=null;var at=Math.clz32?Math.clz32:function(e){return e>>>=0,0===e?32:31-(lt(e)/ut|0)|0},lt=Math.log,ut=Math.LN2;var ct=64,st=4194304;function ft(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function dt(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,o=e.suspendedLanes,i=e.pingedLanes,a=268435455&n;if(0!==a){var l=a&~o;0!==l?r=ft(l):0!==(i&=a)&&(r=ft(i))}else 0!==(a=n&~o)?r=ft(a):0!==i&&(r=ft(i));if(0===r)return 0;if(0!==t&&t!==r&&0===(t&o)&&((o=r&-r)>=(i=t&-t)||16===o&&0!==(4194240&i)))return t;if(0!==(4&r)&&(r|=16&n),0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)o=1<<(n=31-at(t)),r|=e[n],t&=~o;return r}function pt(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function ht(e){return 0!==(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function yt(){var e=ct;return 0===(4194240&(ct<<=1))&&(ct=64),e}function vt(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function mt(e,t,n){e.pendingLanes|=t,536870912!==t&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[t=31-at(t)]=n}function gt(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-at(n),o=1<<r;o&t|e[r]&t&&(e[r]|=t),n&=~o}}var bt=0;function xt(e){return 1<(e&=-e)?4<e?0!==(268435455&e)?16:536870912:4:1}var wt,Ot,St,jt,kt,Pt=!1,Et=[],_t=null,Mt=null,At=null,Ct=new Map,Tt=new Map,Nt=[],Dt="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function It(e,t){switch(e){case"focusin":case"focusout":_t=null;break;case"dragenter":case"dragleave":Mt=null;break;case"mouseover":case"mouseout":At=null;break;case"pointerover":case"pointerout":Ct.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Tt.delete(t.pointerId)}}function zt(e,t,n,r,o,i){return null===e||e.nativeEvent!==i?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:i,targetContainers:[o]},null!==t&&(null!==(t=xo(t))&&Ot(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==o&&-1===t.indexOf(o)&&t.push(o),e)}function Rt(e){var t=bo(e.target);if(null!==t){var n=We(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=He(n)))return e.blockedOn=t,void kt(e.priority,function(){St(n)})}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Lt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Gt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=xo(n))&&Ot(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);xe=r,n.target.dispatchEvent(r),xe=null,t.shift()}return!0}function Bt(e,t,n){Lt(e)&&n.delete(t)}function Ft(){Pt=!1,null!==_t&&Lt(_t)&&(_t=null),null!==Mt&&Lt(Mt)&&(Mt=null),null!==At&&Lt(At)&&(At=null),Ct.forEach(Bt),Tt.forEach(Bt)}function Ut(e,t){e.blockedOn===t&&(e.blockedOn=null,Pt||(Pt=!0,o.unstable_scheduleCallback(o.unstable_NormalPriority,Ft)))}function Wt(e){function t(t){return Ut(t,e)}if(0<Et.length){Ut(Et[0],e);for(var n=1;n<Et.length;n++){var r=Et[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==_t&&Ut(_t,e),null!==Mt&&Ut(Mt,e),null!==At&&Ut(At,e),Ct.forEach(t),Tt.forEach(t),n=0;n<Nt.length;n++)(r=Nt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<Nt.length&&null===(n=Nt[0]).blockedOn;)Rt(n),null===n.blockedOn&&Nt.shift()}var Ht=x.ReactCurrentBatchConfig,qt=!0;function Vt(e,t,n,r){var o=bt,i=Ht.transition;Ht.transition=null;try{bt=1,$t(e,t,n,r)}finally{bt=o,Ht.transition=i}}function Xt(e,t,n,r){var o=bt,i=Ht.transition;Ht.transition=null;try{bt=4,$t(e,t,n,r)}finally{bt=o,Ht.transition=i}}function $t(e,t,n,r){if(qt){var o=Gt(e,t,n,r);if(null===o)qr(e,t,r,Yt,n),It(e,r);else if(function(e,t,n,r,o){switch(t){case"focusin":return _t=zt(_t,e,t,n,r,o),!0;case"dragenter":return Mt=zt(Mt,e,t,n,r,o),!0;case"mouseover":return At=zt(At,e,t,n,r,o),!0;case"pointerover":var i=o.pointerId;return Ct.set(i,zt(Ct.get(i)||null,e,t,n,r,o)),!0;case"gotpointercapture":return i=o.pointerId,Tt.set(i,zt(Tt.get(i)||null,e,t,n,r,o)),!0}return!1}(o,e,t,n,r))r.stopPropagation();else if(It(e,r),4&t&&-1<Dt.indexOf(e)){for(;null!==o;){var i=xo(o);if(null!==i&&wt(i),null===(i=Gt(e,t,n,r))&&qr(e,t,r,Yt,n),i===o)break;o=i}null!==o&&r.stopPropagation()}else qr(e,t,r,null,n)}}var Yt=null;function Gt(e,t,n,r){if(Yt=null,null!==(e=bo(e=we(r))))if(null===(t=We(e)))e=null;else if(13===(n=t.tag)){if(null!==(e=He(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Yt=e,null}function Kt(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Ze()){case Je:return 1;case et:return 4;case tt:case nt:return 16;case rt:return 536870912;default:return 16}default:return 16}}var Qt=null,Zt=null,Jt=null;function en(){if(Jt)return Jt;var e,t,n=Zt,r=n.length,o="value"in Qt?Qt.value:Qt.textContent,i=o.length;for(e=0;e<r&&n[e]===o[e];e++);var a=r-e;for(t=1;t<=a&&n[r-t]===o[i-t];t++);return Jt=o.slice(e,1<t?1-t:void 0)}function tn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function nn(){return!0}function rn(){return!1}function on(e){function t(t,n,r,o,i){for(var a in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=o,this.target=i,this.currentTarget=null,e)e.hasOwnProperty(a)&&(t=e[a],this[a]=t?t(o):o[a]);return this.isDefaultPrevented=(null!=o.defaultPrevented?o.defaultPrevented:!1===o.returnValue)?nn:rn,this.isPropagationStopped=rn,this}return R(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=nn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=nn)},persist:function(){},isPersistent:nn}),t}var an,ln,un,cn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},sn=on(cn),fn=R({},cn,{view:0,detail:0}),dn=on(fn),pn=R({},fn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:kn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==un&&(un&&"mousemove"===e.type?(an=e.screenX-un.screenX,ln=e.screenY-un.screenY):ln=an=0,un=e),an)},movementY:function(e){return"movementY"in e?e.movementY:ln}}),hn=on(pn),yn=on(R({},pn,{dataTransfer:0})),vn=on(R({},fn,{relatedTarget:0})),mn=on(R({},cn,{animationName:0,elapsedTime:0,pseudoElement:0})),gn=R({},cn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),bn=on(gn),xn=on(R({},cn,{data:0})),wn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},On={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Sn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function jn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=Sn[e])&&!!t[e]}function kn(){return jn}var Pn=R({},fn,{key:function(e){if(e.key){var t=wn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=tn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?On[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:kn,charCode:function(e){return"keypress"===e.type?tn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),En=on(Pn),_n=on(R({},pn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Mn=on(R({},fn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:kn})),An=on(R({},cn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Cn=R({},pn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Tn=on(Cn),Nn=[9,13,27,32],Dn=s&&"CompositionEvent"in window,In=null;s&&"documentMode"in document&&(In=document.documentMode);var zn=s&&"TextEvent"in window&&!In,Rn=s&&(!Dn||In&&8<In&&11>=In),Ln=String.fromCharCode(32),Bn=!1;function Fn(e,t){switch(e){case"keyup":return-1!==Nn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Un(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var Wn=!1;var Hn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function qn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Hn[e.type]:"textarea"===t}function Vn(e,t,n,r){Pe(r),0<(t=Xr(t,"onChange")).length&&(n=new sn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Xn=null,$n=null;function Yn(e){Lr(e,0)}function Gn(e){if($(wo(e)))return e}function Kn(e,t){if("change"===e)return t}var Qn=!1;if(s){var Zn;if(s){var Jn="oninput"in document;if(!Jn){var er=document.createElement("div");er.setAttribute("oninput","return;"),Jn="function"===typeof er.oninput}Zn=Jn}else Zn=!1;Qn=Zn&&(!document.documentMode||9<document.documentMode)}function tr(){Xn&&(Xn.detachEvent("onpropertychange",nr),$n=Xn=null)}function nr(e){if("value"===e.propertyName&&Gn($n)){var t=[];Vn(t,$n,e,we(e)),Ce(Yn,t)}}function rr(e,t,n){"focusin"===e?(tr(),$n=n,(Xn=t).attachEvent("onpropertychange",nr)):"focusout"===e&&tr()}function or(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Gn($n)}function ir(e,t){if("click"===e)return Gn(t)}function ar(e,t){if("input"===e||"change"===e)return Gn(t)}var lr="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function ur(e,t){if(lr(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var o=n[r];if(!f.call(t,o)||!lr(e[o],t[o]))return!1}return!0}function cr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function sr(e,t){var n,r=cr(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=cr(r)}}function fr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?fr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function dr(){for(var e=window,t=Y();t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=Y((e=t.contentWindow).document)}return t}function pr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function hr(e){var t=dr(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&fr(n.ownerDocument.documentElement,n)){if(null!==r&&pr(n))if(t=r.start,void 0===(e=r.end)&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if((e=(t=n.ownerDocument||document)&&t.defaultView||window).getSelection){e=e.getSelection();var o=n.textContent.length,i=Math.min(r.start,o);r=void 0===r.end?i:Math.min(r.end,o),!e.extend&&i>r&&(o=r,r=i,i=o),o=sr(n,i);var a=sr(n,r);o&&a&&(1!==e.rangeCount||e.anchorNode!==o.node||e.anchorOffset!==o.offset||e.focusNode!==a.node||e.focusOffset!==a.offset)&&((t=t.createRange()).setStart(o.node,o.offset),e.removeAllRanges(),i>r?(e.addRange(t),e.extend(a.node,a.offset)):(t.setEnd(a.node,a.offset),e.addRange(t)))}for(t=[],e=n;e=e.parentNode;)1===e.nodeType&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"===typeof n.focus&&n.focus(),n=0;n<t.length;n++)(e=t[n]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var yr=s&&"documentMode"in document&&11>=document.documentMode,vr=null,mr=null,gr=null,br=!1;function xr(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;br||null==vr||vr!==Y(r)||("selectionStart"in(r=vr)&&pr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},gr&&ur(gr,r)||(gr=r,0<(r=Xr(mr,"onSelect")).length&&(t=new sn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=vr)))}function wr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Or={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},Sr={},jr={};function kr(e){if(Sr[e])return Sr[e];if(!Or[e])return e;var t,n=Or[e];for(t in n)if(n.hasOwnProperty(t)&&t in jr)return Sr[e]=n[t];return e}s&&(jr=document.createElement("div").style,"AnimationEvent"in window||(delete Or.animationend.animation,delete Or.animationiteration.animation,delete Or.animationstart.animation),"TransitionEvent"in window||delete Or.transitionend.transition);var Pr=kr("animationend"),Er=kr("animationiteration"),_r=kr("animationstart"),Mr=kr("transitionend"),Ar=new Map,Cr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Tr(e,t){Ar.set(e,t),u(t,[e])}for(var Nr=0;Nr<Cr.length;Nr++){var Dr=Cr[Nr];Tr(Dr.toLowerCase(),"on"+(Dr[0].toUpperCase()+Dr.slice(1)))}Tr(Pr,"onAnimationEnd"),Tr(Er,"onAnimationIteration"),Tr(_r,"onAnimationStart"),Tr("dblclick","onDoubleClick"),Tr("focusin","onFocus"),Tr("focusout","onBlur"),Tr(Mr,"onTransitionEnd"),c("onMouseEnter",["mouseout","mouseover"]),c("onMouseLeave",["mouseout","mouseover"]),c("onPointerEnter",["pointerout","pointerover"]),c("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ir="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),zr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Ir));function Rr(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,o,a,l,u,c){if(Ue.apply(this,arguments),ze){if(!ze)throw Error(i(198));var s=Re;ze=!1,Re=null,Le||(Le=!0,Be=s)}}(r,t,void 0,e),e.currentTarget=null}function Lr(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],o=r.event;r=r.listeners;e:{var i=void 0;if(t)for(var a=r.length-1;0<=a;a--){var l=r[a],u=l.instance,c=l.currentTarget;if(l=l.listener,u!==i&&o.isPropagationStopped())break e;Rr(o,l,c),i=u}else for(a=0;a<r.length;a++){if(u=(l=r[a]).instance,c=l.currentTarget,l=l.listener,u!==i&&o.isPropagationStopped())break e;Rr(o,l,c),i=u}}}if(Le)throw e=Be,Le=!1,Be=null,e}function Br(e,t){var n=t[vo];void 0===n&&(n=t[vo]=new Set);var r=e+"__bubble";n.has(r)||(Hr(t,e,2,!1),n.add(r))}function Fr(e,t,n){var r=0;t&&(r|=4),Hr(n,e,r,t)}var Ur="_reactListening"+Math.random().toString(36).slice(2);function Wr(e){if(!e[Ur]){e[Ur]=!0,a.forEach(function(t){"selectionchange"!==t&&(zr.has(t)||Fr(t,!1,e),Fr(t,!0,e))});var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Ur]||(t[Ur]=!0,Fr("selectionchange",!1,t))}}function Hr(e,t,n,r){switch(Kt(t)){case 1:var o=Vt;break;case 4:o=Xt;break;default:o=$t}n=o.bind(null,t,n,e),o=void 0,!Ne||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(o=!0),r?void 0!==o?e.addEventListener(t,n,{capture:!0,passive:o}):e.addEventListener(t,n,!0):void 0!==o?e.addEventListener(t,n,{passive:o}):e.addEventListener(t,n,!1)}function qr(e,t,n,r,o){var i=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var a=r.tag;if(3===a||4===a){var l=r.stateNode.containerInfo;if(l===o||8===l.nodeType&&l.parentNode===o)break;if(4===a)for(a=r.return;null!==a;){var u=a.tag;if((3===u||4===u)&&((u=a.stateNode.containerInfo)===o||8===u.nodeType&&u.parentNode===o))return;a=a.return}for(;null!==l;){if(null===(a=bo(l)))return;if(5===(u=a.tag)||6===u){r=i=a;continue e}l=l.parentNode}}r=r.return}Ce(function(){var r=i,o=we(n),a=[];e:{var l=Ar.get(e);if(void 0!==l){var u=sn,c=e;switch(e){case"keypress":if(0===tn(n))break e;case"keydown":case"keyup":u=En;break;case"focusin":c="focus",u=vn;break;case"focusout":c="blur",u=vn;break;case"beforeblur":case"afterblur":u=vn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=hn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=yn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=Mn;break;case Pr:case Er:case _r:u=mn;break;case Mr:u=An;break;case"scroll":u=dn;break;case"wheel":u=Tn;break;case"copy":case"cut":case"paste":u=bn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=_n}var s=0!==(4&t),f=!s&&"scroll"===e,d=s?null!==l?l+"Capture":null:l;s=[];for(var p,h=r;null!==h;){var y=(p=h).stateNode;if(5===p.tag&&null!==y&&(p=y,null!==d&&(null!=(y=Te(h,d))&&s.push(Vr(h,y,p)))),f)break;h=h.return}0<s.length&&(l=new u(l,c,null,n,o),a.push({event:l,listeners:s}))}}if(0===(7&t)){if(u="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||n===xe||!(c=n.relatedTarget||n.fromElement)||!bo(c)&&!c[yo])&&(u||l)&&(l=o.window===o?o:(l=o.ownerDocument)?l.defaultView||l.parentWindow:window,u?(u=r,null!==(c=(c=n.relatedTarget||n.toElement)?bo(c):null)&&(c!==(f=We(c))||5!==c.tag&&6!==c.tag)&&(c=null)):(u=null,c=r),u!==c)){if(s=hn,y="onMouseLeave",d="onMouseEnter",h="mouse","pointerout"!==e&&"pointerover"!==e||(s=_n,y="onPointerLeave",d="onPointerEnter",h="pointer"),f=null==u?l:wo(u),p=null==c?l:wo(c),(l=new s(y,h+"leave",u,n,o)).target=f,l.relatedTarget=p,y=null,bo(o)===r&&((s=new s(d,h+"enter",c,n,o)).target=p,s.relatedTarget=f,y=s),f=y,u&&c)e:{for(d=c,h=0,p=s=u;p;p=$r(p))h++;for(p=0,y=d;y;y=$r(y))p++;for(;0<h-p;)s=$r(s),h--;for(;0<p-h;)d=$r(d),p--;for(;h--;){if(s===d||null!==d&&s===d.alternate)break e;s=$r(s),d=$r(d)}s=null}else s=null;null!==u&&Yr(a,l,u,s,!1),null!==c&&null!==f&&Yr(a,f,c,s,!0)}if("select"===(u=(l=r?wo(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===u&&"file"===l.type)var v=Kn;else if(qn(l))if(Qn)v=ar;else{v=or;var m=rr}else(u=l.nodeName)&&"input"===u.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(v=ir);switch(v&&(v=v(e,r))?Vn(a,v,n,o):(m&&m(e,l,r),"focusout"===e&&(m=l._wrapperState)&&m.controlled&&"number"===l.type&&ee(l,"number",l.value)),m=r?wo(r):window,e){case"focusin":(qn(m)||"true"===m.contentEditable)&&(vr=m,mr=r,gr=null);break;case"focusout":gr=mr=vr=null;break;case"mousedown":br=!0;break;case"contextmenu":case"mouseup":case"dragend":br=!1,xr(a,n,o);break;case"selectionchange":if(yr)break;case"keydown":case"keyup":xr(a,n,o)}var g;if(Dn)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else Wn?Fn(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(Rn&&"ko"!==n.locale&&(Wn||"onCompositionStart"!==b?"onCompositionEnd"===b&&Wn&&(g=en()):(Zt="value"in(Qt=o)?Qt.value:Qt.textContent,Wn=!0)),0<(m=Xr(r,b)).length&&(b=new xn(b,e,null,n,o),a.push({event:b,listeners:m}),g?b.data=g:null!==(g=Un(n))&&(b.data=g))),(g=zn?function(e,t){switch(e){case"compositionend":return Un(t);case"keypress":return 32!==t.which?null:(Bn=!0,Ln);case"textInput":return(e=t.data)===Ln&&Bn?null:e;default:return null}}(e,n):function(e,t){if(Wn)return"compositionend"===e||!Dn&&Fn(e,t)?(e=en(),Jt=Zt=Qt=null,Wn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Rn&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(r=Xr(r,"onBeforeInput")).length&&(o=new xn("onBeforeInput","beforeinput",null,n,o),a.push({event:o,listeners:r}),o.data=g))}Lr(a,t)})}function Vr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Xr(e,t){for(var n=t+"Capture",r=[];null!==e;){var o=e,i=o.stateNode;5===o.tag&&null!==i&&(o=i,null!=(i=Te(e,n))&&r.unshift(Vr(e,i,o)),null!=(i=Te(e,t))&&r.push(Vr(e,i,o))),e=e.return}return r}function $r(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Yr(e,t,n,r,o){for(var i=t._reactName,a=[];null!==n&&n!==r;){var l=n,u=l.alternate,c=l.stateNode;if(null!==u&&u===r)break;5===l.tag&&null!==c&&(l=c,o?null!=(u=Te(n,i))&&a.unshift(Vr(n,u,l)):o||null!=(u=Te(n,i))&&a.push(Vr(n,u,l))),n=n.return}0!==a.length&&e.push({event:t,listeners:a})}var Gr=/\r\n?/g,Kr=/\u0000|\uFFFD/g;function Qr(e){return("string"===typeof e?e:""+e).replace(Gr,"\n").replace(Kr,"")}function Zr(e,t,n){if(t=Qr(t),Qr(e)!==t&&n)throw Error(i(425))}function Jr(){}var eo=null,to=null;function no(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ro="function"===typeof setTimeout?setTimeout:void 0,oo="function"===typeof clearTimeout?clearTimeout:void 0,io="function"===typeof Promise?Promise:void 0,ao="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof io?function(e){return io.resolve(null).then(e).catch(lo)}:ro;function lo(e){setTimeout(function(){throw e})}function uo(e,t){var n=t,r=0;do{var o=n.nextSibling;if(e.removeChild(n),o&&8===o.nodeType)if("/$"===(n=o.data)){if(0===r)return e.removeChild(o),void Wt(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=o}while(n);Wt(t)}function co(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t)break;if("/$"===t)return null}}return e}function so(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var fo=Math.random().toString(36).slice(2),po="__reactFiber$"+fo,ho="__reactProps$"+fo,yo="__reactContainer$"+fo,vo="__reactEvents$"+fo,mo="__reactListeners$"+fo,go="__reactHandles$"+fo;function bo(e){var t=e[po];if(t)return t;for(var n=e.parentNode;n;){if(t=n[yo]||n[po]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=so(e);null!==e;){if(n=e[po])return n;e=so(e)}return t}n=(e=n).parentNode}return null}function xo(e){return!(e=e[po]||e[yo])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function wo(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(i(33))}function Oo(e){return e[ho]||null}var So=[],jo=-1;function ko(e){return{current:e}}function Po(e){0>jo||(e.current=So[jo],So[jo]=null,jo--)}function Eo(e,t){jo++,So[jo]=e.current,e.current=t}var _o={},Mo=ko(_o),Ao=ko(!1),Co=_o;function To(e,t){var n=e.type.contextTypes;if(!n)return _o;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var o,i={};for(o in n)i[o]=t[o];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=i),i}function No(e){return null!==(e=e.childContextTypes)&&void 0!==e}function Do(){Po(Ao),Po(Mo)}function Io(e,t,n){if(Mo.current!==_o)throw Error(i(168));Eo(Mo,t),Eo(Ao,n)}function zo(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,"function"!==typeof r.getChildContext)return n;for(var o in r=r.getChildContext())if(!(o in t))throw Error(i(108,H(e)||"Unknown",o));return R({},n,r)}function Ro(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||_o,Co=Mo.current,Eo(Mo,e),Eo(Ao,Ao.current),!0}function Lo(e,t,n){var r=e.stateNode;if(!r)throw Error(i(169));n?(e=zo(e,t,Co),r.__reactInternalMemoizedMergedChildContext=e,Po(Ao),Po(Mo),Eo(Mo,e)):Po(Ao),Eo(Ao,n)}var Bo=null,Fo=!1,Uo=!1;function Wo(e){null===Bo?Bo=[e]:Bo.push(e)}function Ho(){if(!Uo&&null!==Bo){Uo=!0;var e=0,t=bt;try{var n=Bo;for(bt=1;e<n.length;e++){var r=n[e];do{r=r(!0)}while(null!==r)}Bo=null,Fo=!1}catch(o){throw null!==Bo&&(Bo=Bo.slice(e+1)),$e(Je,Ho),o}finally{bt=t,Uo=!1}}return null}var qo=[],Vo=0,Xo=null,$o=0,Yo=[],Go=0,Ko=null,Qo=1,Zo="";function Jo(e,t){qo[Vo++]=$o,qo[Vo++]=Xo,Xo=e,$o=t}function ei(e,t,n){Yo[Go++]=Qo,Yo[Go++]=Zo,Yo[Go++]=Ko,Ko=e;var r=Qo;e=Zo;var o=32-at(r)-1;r&=~(1<<o),n+=1;var i=32-at(t)+o;if(30<i){var a=o-o%5;i=(r&(1<<a)-1).toString(32),r>>=a,o-=a,Qo=1<<32-at(t)+o|n<<o|r,Zo=i+e}else Qo=1<<i|n<<o|r,Zo=e}function ti(e){null!==e.return&&(Jo(e,1),ei(e,1,0))}function ni(e){for(;e===Xo;)Xo=qo[--Vo],qo[Vo]=null,$o=qo[--Vo],qo[Vo]=null;for(;e===Ko;)Ko=Yo[--Go],Yo[Go]=null,Zo=Yo[--Go],Yo[Go]=null,Qo=Yo[--Go],Yo[Go]=null}var ri=null,oi=null,ii=!1,ai=null;function li(e,t){var n=Ac(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,null===(t=e.deletions)?(e.deletions=[n],e.flags|=16):t.push(n)}function ui(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,ri=e,oi=co(t.firstChild),!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,ri=e,oi=null,!0);case 13:return null!==(t=8!==t.nodeType?null:t)&&(n=null!==Ko?{id:Qo,overflow:Zo}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},(n=Ac(18,null,null,0)).stateNode=t,n.return=e,e.child=n,ri=e,oi=null,!0);default:return!1}}function ci(e){return 0!==(1&e.mode)&&0===(128&e.flags)}function si(e){if(ii){var t=oi;if(t){var n=t;if(!ui(e,t)){if(ci(e))throw Error(i(418));t=co(n.nextSibling);var r=ri;t&&ui(e,t)?li(r,n):(e.flags=-4097&e.flags|2,ii=!1,ri=e)}}else{if(ci(e))throw Error(i(418));e.flags=-4097&e.flags|2,ii=!1,ri=e}}}function fi(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ri=e}function di(e){if(e!==ri)return!1;if(!ii)return fi(e),ii=!0,!1;var t;if((t=3!==e.tag)&&!(t=5!==e.tag)&&(t="head"!==(t=e.type)&&"body"!==t&&!no(e.type,e.memoizedProps)),t&&(t=oi)){if(ci(e))throw pi(),Error(i(418));for(;t;)li(e,t),t=co(t.nextSibling)}if(fi(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(i(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){oi=co(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}oi=null}}else oi=ri?co(e.stateNode.nextSibling):null;return!0}function pi(){for(var e=oi;e;)e=co(e.nextSibling)}function hi(){oi=ri=null,ii=!1}function yi(e){null===ai?ai=[e]:ai.push(e)}var vi=x.ReactCurrentBatchConfig;function mi(e,t,n){if(null!==(e=n.ref)&&"function"!==typeof e&&"object"!==typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(i(309));var r=n.stateNode}if(!r)throw Error(i(147,e));var o=r,a=""+e;return null!==t&&null!==t.ref&&"function"===typeof t.ref&&t.ref._stringRef===a?t.ref:(t=function(e){var t=o.refs;null===e?delete t[a]:t[a]=e},t._stringRef=a,t)}if("string"!==typeof e)throw Error(i(284));if(!n._owner)throw Error(i(290,e))}return e}function gi(e,t){throw e=Object.prototype.toString.call(t),Error(i(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function bi(e){return(0,e._init)(e._payload)}function xi(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function o(e,t){return(e=Tc(e,t)).index=0,e.sibling=null,e}function a(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=2,n):r:(t.flags|=2,n):(t.flags|=1048576,n)}function l(t){return e&&null===t.alternate&&(t.flags|=2),t}function u(e,t,n,r){return null===t||6!==t.tag?((t=zc(n,e.mode,r)).return=e,t):((t=o(t,n)).return=e,t)}function c(e,t,n,r){var i=n.type;return i===S?f(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===i||"object"===typeof i&&null!==i&&i.$$typeof===T&&bi(i)===t.type)?((r=o(t,n.props)).ref=mi(e,t,n),r.return=e,r):((r=Nc(n.type,n.key,n.props,null,e.mode,r)).ref=mi(e,t,n),r.return=e,r)}function s(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Rc(n,e.mode,r)).return=e,t):((t=o(t,n.children||[])).return=e,t)}function f(e,t,n,r,i){return null===t||7!==t.tag?((t=Dc(n,e.mode,r,i)).return=e,t):((t=o(t,n)).return=e,t)}function d(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t)return(t=zc(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case w:return(n=Nc(t.type,t.key,t.props,null,e.mode,n)).ref=mi(e,null,t),n.return=e,n;case O:return(t=Rc(t,e.mode,n)).return=e,t;case T:return d(e,(0,t._init)(t._payload),n)}if(te(t)||I(t))return(t=Dc(t,e.mode,n,null)).return=e,t;gi(e,t)}return null}function p(e,t,n,r){var o=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n)return null!==o?null:u(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case w:return n.key===o?c(e,t,n,r):null;case O:return n.key===o?s(e,t,n,r):null;case T:return p(e,t,(o=n._init)(n._payload),r)}if(te(n)||I(n))return null!==o?null:f(e,t,n,r,null);gi(e,n)}return null}function h(e,t,n,r,o){if("string"===typeof r&&""!==r||"number"===typeof r)return u(t,e=e.get(n)||null,""+r,o);if("object"===typeof r&&null!==r){switch(r.$$typeof){case w:return c(t,e=e.get(null===r.key?n:r.key)||null,r,o);case O:return s(t,e=e.get(null===r.key?n:r.key)||null,r,o);case T:return h(e,t,n,(0,r._init)(r._payload),o)}if(te(r)||I(r))return f(t,e=e.get(n)||null,r,o,null);gi(t,r)}return null}function y(o,i,l,u){for(var c=null,s=null,f=i,y=i=0,v=null;null!==f&&y<l.length;y++){f.index>y?(v=f,f=null):v=f.sibling;var m=p(o,f,l[y],u);if(null===m){null===f&&(f=v);break}e&&f&&null===m.alternate&&t(o,f),i=a(m,i,y),null===s?c=m:s.sibling=m,s=m,f=v}if(y===l.length)return n(o,f),ii&&Jo(o,y),c;if(null===f){for(;y<l.length;y++)null!==(f=d(o,l[y],u))&&(i=a(f,i,y),null===s?c=f:s.sibling=f,s=f);return ii&&Jo(o,y),c}for(f=r(o,f);y<l.length;y++)null!==(v=h(f,o,y,l[y],u))&&(e&&null!==v.alternate&&f.delete(null===v.key?y:v.key),i=a(v,i,y),null===s?c=v:s.sibling=v,s=v);return e&&f.forEach(function(e){return t(o,e)}),ii&&Jo(o,y),c}function v(o,l,u,c){var s=I(u);if("function"!==typeof s)throw Error(i(150));if(null==(u=s.call(u)))throw Error(i(151));for(var f=s=null,y=l,v=l=0,m=null,g=u.next();null!==y&&!g.done;v++,g=u.next()){y.index>v?(m=y,y=null):m=y.sibling;var b=p(o,y,g.value,c);if(null===b){null===y&&(y=m);break}e&&y&&null===b.alternate&&t(o,y),l=a(b,l,v),null===f?s=b:f.sibling=b,f=b,y=m}if(g.done)return n(o,y),ii&&Jo(o,v),s;if(null===y){for(;!g.done;v++,g=u.next())null!==(g=d(o,g.value,c))&&(l=a(g,l,v),null===f?s=g:f.sibling=g,f=g);return ii&&Jo(o,v),s}for(y=r(o,y);!g.done;v++,g=u.next())null!==(g=h(y,o,v,g.value,c))&&(e&&null!==g.alternate&&y.delete(null===g.key?v:g.key),l=a(g,l,v),null===f?s=g:f.sibling=g,f=g);return e&&y.forEach(function(e){return t(o,e)}),ii&&Jo(o,v),s}return function e(r,i,a,u){if("object"===typeof a&&null!==a&&a.type===S&&null===a.key&&(a=a.props.children),"object"===typeof a&&null!==a){switch(a.$$typeof){case w:e:{for(var c=a.key,s=i;null!==s;){if(s.key===c){if((c=a.type)===S){if(7===s.tag){n(r,s.sibling),(i=o(s,a.props.children)).return=r,r=i;break e}}else if(s.elementType===c||"object"===typeof c&&null!==c&&c.$$typeof===T&&bi(c)===s.type){n(r,s.sibling),(i=o(s,a.props)).ref=mi(r,s,a),i.return=r,r=i;break e}n(r,s);break}t(r,s),s=s.sibling}a.type===S?((i=Dc(a.props.children,r.mode,u,a.key)).return=r,r=i):((u=Nc(a.type,a.key,a.props,null,r.mode,u)).ref=mi(r,i,a),u.return=r,r=u)}return l(r);case O:e:{for(s=a.key;null!==i;){if(i.key===s){if(4===i.tag&&i.stateNode.containerInfo===a.containerInfo&&i.stateNode.implementation===a.implementation){n(r,i.sibling),(i=o(i,a.children||[])).return=r,r=i;break e}n(r,i);break}t(r,i),i=i.sibling}(i=Rc(a,r.mode,u)).return=r,r=i}return l(r);case T:return e(r,i,(s=a._init)(a._payload),u)}if(te(a))return y(r,i,a,u);if(I(a))return v(r,i,a,u);gi(r,a)}return"string"===typeof a&&""!==a||"number"===typeof a?(a=""+a,null!==i&&6===i.tag?(n(r,i.sibling),(i=o(i,a)).return=r,r=i):(n(r,i),(i=zc(a,r.mode,u)).return=r,r=i),l(r)):n(r,i)}}var wi=xi(!0),Oi=xi(!1),Si=ko(null),ji=null,ki=null,Pi=null;function Ei(){Pi=ki=ji=null}function _i(e){var t=Si.current;Po(Si),e._currentValue=t}function Mi(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Ai(e,t){ji=e,Pi=ki=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&t)&&(bl=!0),e.firstContext=null)}function Ci(e){var t=e._currentValue;if(Pi!==e)if(e={context:e,memoizedValue:t,next:null},null===ki){if(null===ji)throw Error(i(308));ki=e,ji.dependencies={lanes:0,firstContext:e}}else ki=ki.next=e;return t}var Ti=null;function Ni(e){null===Ti?Ti=[e]:Ti.push(e)}function Di(e,t,n,r){var o=t.interleaved;return null===o?(n.next=n,Ni(t)):(n.next=o.next,o.next=n),t.interleaved=n,Ii(e,r)}function Ii(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}var zi=!1;function Ri(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Li(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Bi(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Fi(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&Eu)){var o=r.pending;return null===o?t.next=t:(t.next=o.next,o.next=t),r.pending=t,Ii(e,n)}return null===(o=r.interleaved)?(t.next=t,Ni(r)):(t.next=o.next,o.next=t),r.interleaved=t,Ii(e,n)}function Ui(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194240&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,gt(e,n)}}function Wi(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var o=null,i=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===i?o=i=a:i=i.next=a,n=n.next}while(null!==n);null===i?o=i=t:i=i.next=t}else o=i=t;return n={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:i,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Hi(e,t,n,r){var o=e.updateQueue;zi=!1;var i=o.firstBaseUpdate,a=o.lastBaseUpdate,l=o.shared.pending;if(null!==l){o.shared.pending=null;var u=l,c=u.next;u.next=null,null===a?i=c:a.next=c,a=u;var s=e.alternate;null!==s&&((l=(s=s.updateQueue).lastBaseUpdate)!==a&&(null===l?s.firstBaseUpdate=c:l.next=c,s.lastBaseUpdate=u))}if(null!==i){var f=o.baseState;for(a=0,s=c=u=null,l=i;;){var d=l.lane,p=l.eventTime;if((r&d)===d){null!==s&&(s=s.next={eventTime:p,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});e:{var h=e,y=l;switch(d=t,p=n,y.tag){case 1:if("function"===typeof(h=y.payload)){f=h.call(p,f,d);break e}f=h;break e;case 3:h.flags=-65537&h.flags|128;case 0:if(null===(d="function"===typeof(h=y.payload)?h.call(p,f,d):h)||void 0===d)break e;f=R({},f,d);break e;case 2:zi=!0}}null!==l.callback&&0!==l.lane&&(e.flags|=64,null===(d=o.effects)?o.effects=[l]:d.push(l))}else p={eventTime:p,lane:d,tag:l.tag,payload:l.payload,callback:l.callback,next:null},null===s?(c=s=p,u=f):s=s.next=p,a|=d;if(null===(l=l.next)){if(null===(l=o.shared.pending))break;l=(d=l).next,d.next=null,o.lastBaseUpdate=d,o.shared.pending=null}}if(null===s&&(u=f),o.baseState=u,o.firstBaseUpdate=c,o.lastBaseUpdate=s,null!==(t=o.shared.interleaved)){o=t;do{a|=o.lane,o=o.next}while(o!==t)}else null===i&&(o.shared.lanes=0);Iu|=a,e.lanes=a,e.memoizedState=f}}function qi(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],o=r.callback;if(null!==o){if(r.callback=null,r=n,"function"!==typeof o)throw Error(i(191,o));o.call(r)}}}var Vi={},Xi=ko(Vi),$i=ko(Vi),Yi=ko(Vi);function Gi(e){if(e===Vi)throw Error(i(174));return e}function Ki(e,t){switch(Eo(Yi,t),Eo($i,e),Eo(Xi,Vi),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ue(null,"");break;default:t=ue(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}Po(Xi),Eo(Xi,t)}function Qi(){Po(Xi),Po($i),Po(Yi)}function Zi(e){Gi(Yi.current);var t=Gi(Xi.current),n=ue(t,e.type);t!==n&&(Eo($i,e),Eo(Xi,n))}function Ji(e){$i.current===e&&(Po(Xi),Po($i))}var ea=ko(0);function ta(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var na=[];function ra(){for(var e=0;e<na.length;e++)na[e]._workInProgressVersionPrimary=null;na.length=0}var oa=x.ReactCurrentDispatcher,ia=x.ReactCurrentBatchConfig,aa=0,la=null,ua=null,ca=null,sa=!1,fa=!1,da=0,pa=0;function ha(){throw Error(i(321))}function ya(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!lr(e[n],t[n]))return!1;return!0}function va(e,t,n,r,o,a){if(aa=a,la=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,oa.current=null===e||null===e.memoizedState?Ja:el,e=n(r,o),fa){a=0;do{if(fa=!1,da=0,25<=a)throw Error(i(301));a+=1,ca=ua=null,t.updateQueue=null,oa.current=tl,e=n(r,o)}while(fa)}if(oa.current=Za,t=null!==ua&&null!==ua.next,aa=0,ca=ua=la=null,sa=!1,t)throw Error(i(300));return e}function ma(){var e=0!==da;return da=0,e}function ga(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ca?la.memoizedState=ca=e:ca=ca.next=e,ca}function ba(){if(null===ua){var e=la.alternate;e=null!==e?e.memoizedState:null}else e=ua.next;var t=null===ca?la.memoizedState:ca.next;if(null!==t)ca=t,ua=e;else{if(null===e)throw Error(i(310));e={memoizedState:(ua=e).memoizedState,baseState:ua.baseState,baseQueue:ua.baseQueue,queue:ua.queue,next:null},null===ca?la.memoizedState=ca=e:ca=ca.next=e}return ca}function xa(e,t){return"function"===typeof t?t(e):t}function wa(e){var t=ba(),n=t.queue;if(null===n)throw Error(i(311));n.lastRenderedReducer=e;var r=ua,o=r.baseQueue,a=n.pending;if(null!==a){if(null!==o){var l=o.next;o.next=a.next,a.next=l}r.baseQueue=o=a,n.pending=null}if(null!==o){a=o.next,r=r.baseState;var u=l=null,c=null,s=a;do{var f=s.lane;if((aa&f)===f)null!==c&&(c=c.next={lane:0,action:s.action,hasEagerState:s.hasEagerState,eagerState:s.eagerState,next:null}),r=s.hasEagerState?s.eagerState:e(r,s.action);else{var d={lane:f,action:s.action,hasEagerState:s.hasEagerState,eagerState:s.eagerState,next:null};null===c?(u=c=d,l=r):c=c.next=d,la.lanes|=f,Iu|=f}s=s.next}while(null!==s&&s!==a);null===c?l=r:c.next=u,lr(r,t.memoizedState)||(bl=!0),t.memoizedState=r,t.baseState=l,t.baseQueue=c,n.lastRenderedState=r}if(null!==(e=n.interleaved)){o=e;do{a=o.lane,la.lanes|=a,Iu|=a,o=o.next}while(o!==e)}else null===o&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Oa(e){var t=ba(),n=t.queue;if(null===n)throw Error(i(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,a=t.memoizedState;if(null!==o){n.pending=null;var l=o=o.next;do{a=e(a,l.action),l=l.next}while(l!==o);lr(a,t.memoizedState)||(bl=!0),t.memoizedState=a,null===t.baseQueue&&(t.baseState=a),n.lastRenderedState=a}return[a,r]}function Sa(){}function ja(e,t){var n=la,r=ba(),o=t(),a=!lr(r.memoizedState,o);if(a&&(r.memoizedState=o,bl=!0),r=r.queue,za(Ea.bind(null,n,r,e),[e]),r.getSnapshot!==t||a||null!==ca&&1&ca.memoizedState.tag){if(n.flags|=2048,Ca(9,Pa.bind(null,n,r,o,t),void 0,null),null===_u)throw Error(i(349));0!==(30&aa)||ka(n,t,o)}return o}function ka(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=la.updateQueue)?(t={lastEffect:null,stores:null},la.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Pa(e,t,n,r){t.value=n,t.getSnapshot=r,_a(t)&&Ma(e)}function Ea(e,t,n){return n(function(){_a(t)&&Ma(e)})}function _a(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!lr(e,n)}catch(r){return!0}}function Ma(e){var t=Ii(e,1);null!==t&&tc(t,e,1,-1)}function Aa(e){var t=ga();return"function"===typeof e&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:xa,lastRenderedState:e},t.queue=e,e=e.dispatch=Ya.bind(null,la,e),[t.memoizedState,e]}function Ca(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=la.updateQueue)?(t={lastEffect:null,stores:null},la.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function Ta(){return ba().memoizedState}function Na(e,t,n,r){var o=ga();la.flags|=e,o.memoizedState=Ca(1|t,n,void 0,void 0===r?null:r)}function Da(e,t,n,r){var o=ba();r=void 0===r?null:r;var i=void 0;if(null!==ua){var a=ua.memoizedState;if(i=a.destroy,null!==r&&ya(r,a.deps))return void(o.memoizedState=Ca(t,n,i,r))}la.flags|=e,o.memoizedState=Ca(1|t,n,i,r)}function Ia(e,t){return Na(8390656,8,e,t)}function za(e,t){return Da(2048,8,e,t)}function Ra(e,t){return Da(4,2,e,t)}function La(e,t){return Da(4,4,e,t)}function Ba(e,t){return"function"===typeof t?(e=e(),t(e),function(){t(null)}):null!==t&&void 0!==t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Fa(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,Da(4,4,Ba.bind(null,t,e),n)}function Ua(){}function Wa(e,t){var n=ba();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ya(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Ha(e,t){var n=ba();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ya(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function qa(e,t,n){return 0===(21&aa)?(e.baseState&&(e.baseState=!1,bl=!0),e.memoizedState=n):(lr(n,t)||(n=yt(),la.lanes|=n,Iu|=n,e.baseState=!0),t)}function Va(e,t){var n=bt;bt=0!==n&&4>n?n:4,e(!0);var r=ia.transition;ia.transition={};try{e(!1),t()}finally{bt=n,ia.transition=r}}function Xa(){return ba().memoizedState}function $a(e,t,n){var r=ec(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Ga(e))Ka(t,n);else if(null!==(n=Di(e,t,n,r))){tc(n,e,r,Ju()),Qa(n,t,r)}}function Ya(e,t,n){var r=ec(e),o={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Ga(e))Ka(t,o);else{var i=e.alternate;if(0===e.lanes&&(null===i||0===i.lanes)&&null!==(i=t.lastRenderedReducer))try{var a=t.lastRenderedState,l=i(a,n);if(o.hasEagerState=!0,o.eagerState=l,lr(l,a)){var u=t.interleaved;return null===u?(o.next=o,Ni(t)):(o.next=u.next,u.next=o),void(t.interleaved=o)}}catch(c){}null!==(n=Di(e,t,o,r))&&(tc(n,e,r,o=Ju()),Qa(n,t,r))}}function Ga(e){var t=e.alternate;return e===la||null!==t&&t===la}function Ka(e,t){fa=sa=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Qa(e,t,n){if(0!==(4194240&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,gt(e,n)}}var Za={readContext:Ci,useCallback:ha,useContext:ha,useEffect:ha,useImperativeHandle:ha,useInsertionEffect:ha,useLayoutEffect:ha,useMemo:ha,useReducer:ha,useRef:ha,useState:ha,useDebugValue:ha,useDeferredValue:ha,useTransition:ha,useMutableSource:ha,useSyncExternalStore:ha,useId:ha,unstable_isNewReconciler:!1},Ja={readContext:Ci,useCallback:function(e,t){return ga().memoizedState=[e,void 0===t?null:t],e},useContext:Ci,useEffect:Ia,useImperativeHandle:function(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,Na(4194308,4,Ba.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Na(4194308,4,e,t)},useInsertionEffect:function(e,t){return Na(4,2,e,t)},useMemo:function(e,t){var n=ga();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=ga();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=$a.bind(null,la,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},ga().memoizedState=e},useState:Aa,useDebugValue:Ua,useDeferredValue:function(e){return ga().memoizedState=e},useTransition:function(){var e=Aa(!1),t=e[0];return e=Va.bind(null,e[1]),ga().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=la,o=ga();if(ii){if(void 0===n)throw Error(i(407));n=n()}else{if(n=t(),null===_u)throw Error(i(349));0!==(30&aa)||ka(r,t,n)}o.memoizedState=n;var a={value:n,getSnapshot:t};return o.queue=a,Ia(Ea.bind(null,r,a,e),[e]),r.flags|=2048,Ca(9,Pa.bind(null,r,a,n,t),void 0,null),n},useId:function(){var e=ga(),t=_u.identifierPrefix;if(ii){var n=Zo;t=":"+t+"R"+(n=(Qo&~(1<<32-at(Qo)-1)).toString(32)+n),0<(n=da++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=pa++).toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},el={readContext:Ci,useCallback:Wa,useContext:Ci,useEffect:za,useImperativeHandle:Fa,useInsertionEffect:Ra,useLayoutEffect:La,useMemo:Ha,useReducer:wa,useRef:Ta,useState:function(){return wa(xa)},useDebugValue:Ua,useDeferredValue:function(e){return qa(ba(),ua.memoizedState,e)},useTransition:function(){return[wa(xa)[0],ba().memoizedState]},useMutableSource:Sa,useSyncExternalStore:ja,useId:Xa,unstable_isNewReconciler:!1},tl={readContext:Ci,useCallback:Wa,useContext:Ci,useEffect:za,useImperativeHandle:Fa,useInsertionEffect:Ra,useLayoutEffect:La,useMemo:Ha,useReducer:Oa,useRef:Ta,useState:function(){return Oa(xa)},useDebugValue:Ua,useDeferredValue:function(e){var t=ba();return null===ua?t.memoizedState=e:qa(t,ua.memoizedState,e)},useTransition:function(){return[Oa(xa)[0],ba().memoizedState]},useMutableSource:Sa,useSyncExternalStore:ja,useId:Xa,unstable_isNewReconciler:!1};function nl(e,t){if(e&&e.defaultProps){for(var n in t=R({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}function rl(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:R({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ol={isMounted:function(e){return!!(e=e._reactInternals)&&We(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Ju(),o=ec(e),i=Bi(r,o);i.payload=t,void 0!==n&&null!==n&&(i.callback=n),null!==(t=Fi(e,i,o))&&(tc(t,e,o,r),Ui(t,e,o))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Ju(),o=ec(e),i=Bi(r,o);i.tag=1,i.payload=t,void 0!==n&&null!==n&&(i.callback=n),null!==(t=Fi(e,i,o))&&(tc(t,e,o,r),Ui(t,e,o))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Ju(),r=ec(e),o=Bi(n,r);o.tag=2,void 0!==t&&null!==t&&(o.callback=t),null!==(t=Fi(e,o,r))&&(tc(t,e,r,n),Ui(t,e,r))}};function il(e,t,n,r,o,i,a){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,i,a):!t.prototype||!t.prototype.isPureReactComponent||(!ur(n,r)||!ur(o,i))}function al(e,t,n){var r=!1,o=_o,i=t.contextType;return"object"===typeof i&&null!==i?i=Ci(i):(o=No(t)?Co:Mo.current,i=(r=null!==(r=t.contextTypes)&&void 0!==r)?To(e,o):_o),t=new t(n,i),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ol,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=i),t}function ll(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ol.enqueueReplaceState(t,t.state,null)}function ul(e,t,n,r){var o=e.stateNode;o.props=n,o.state=e.memoizedState,o.refs={},Ri(e);var i=t.contextType;"object"===typeof i&&null!==i?o.context=Ci(i):(i=No(t)?Co:Mo.current,o.context=To(e,i)),o.state=e.memoizedState,"function"===typeof(i=t.getDerivedStateFromProps)&&(rl(e,t,i,n),o.state=e.memoizedState),"function"===typeof t.getDerivedStateFromProps||"function"===typeof o.getSnapshotBeforeUpdate||"function"!==typeof o.UNSAFE_componentWillMount&&"function"!==typeof o.componentWillMount||(t=o.state,"function"===typeof o.componentWillMount&&o.componentWillMount(),"function"===typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount(),t!==o.state&&ol.enqueueReplaceState(o,o.state,null),Hi(e,n,o,r),o.state=e.memoizedState),"function"===typeof o.componentDidMount&&(e.flags|=4194308)}function cl(e,t){try{var n="",r=t;do{n+=U(r),r=r.return}while(r);var o=n}catch(i){o="\nError generating stack: "+i.message+"\n"+i.stack}return{value:e,source:t,stack:o,digest:null}}function sl(e,t,n){return{value:e,source:null,stack:null!=n?n:null,digest:null!=t?t:null}}function fl(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var dl="function"===typeof WeakMap?WeakMap:Map;function pl(e,t,n){(n=Bi(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Hu||(Hu=!0,qu=r),fl(0,t)},n}function hl(e,t,n){(n=Bi(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"===typeof r){var o=t.value;n.payload=function(){return r(o)},n.callback=function(){fl(0,t)}}var i=e.stateNode;return null!==i&&"function"===typeof i.componentDidCatch&&(n.callback=function(){fl(0,t),"function"!==typeof r&&(null===Vu?Vu=new Set([this]):Vu.add(this));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}function yl(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new dl;var o=new Set;r.set(t,o)}else void 0===(o=r.get(t))&&(o=new Set,r.set(t,o));o.has(n)||(o.add(n),e=jc.bind(null,e,t,n),t.then(e,e))}function vl(e){do{var t;if((t=13===e.tag)&&(t=null===(t=e.memoizedState)||null!==t.dehydrated),t)return e;e=e.return}while(null!==e);return null}function ml(e,t,n,r,o){return 0===(1&e.mode)?(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((t=Bi(-1,1)).tag=2,Fi(n,t,1))),n.lanes|=1),e):(e.flags|=65536,e.lanes=o,e)}var gl=x.ReactCurrentOwner,bl=!1;function xl(e,t,n,r){t.child=null===e?Oi(t,null,n,r):wi(t,e.child,n,r)}function wl(e,t,n,r,o){n=n.render;var i=t.ref;return Ai(t,o),r=va(e,t,n,r,i,o),n=ma(),null===e||bl?(ii&&n&&ti(t),t.flags|=1,xl(e,t,r,o),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,Hl(e,t,o))}function Ol(e,t,n,r,o){if(null===e){var i=n.type;return"function"!==typeof i||Cc(i)||void 0!==i.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Nc(n.type,null,r,t,t.mode,o)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=i,Sl(e,t,i,r,o))}if(i=e.child,0===(e.lanes&o)){var a=i.memoizedProps;if((n=null!==(n=n.compare)?n:ur)(a,r)&&e.ref===t.ref)return Hl(e,t,o)}return t.flags|=1,(e=Tc(i,r)).ref=t.ref,e.return=t,t.child=e}function Sl(e,t,n,r,o){if(null!==e){var i=e.memoizedProps;if(ur(i,r)&&e.ref===t.ref){if(bl=!1,t.pendingProps=r=i,0===(e.lanes&o))return t.lanes=e.lanes,Hl(e,t,o);0!==(131072&e.flags)&&(bl=!0)}}return Pl(e,t,n,r,o)}function jl(e,t,n){var r=t.pendingProps,o=r.children,i=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(0===(1&t.mode))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},Eo(Tu,Cu),Cu|=n;else{if(0===(1073741824&n))return e=null!==i?i.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,Eo(Tu,Cu),Cu|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==i?i.baseLanes:n,Eo(Tu,Cu),Cu|=r}else null!==i?(r=i.baseLanes|n,t.memoizedState=null):r=n,Eo(Tu,Cu),Cu|=r;return xl(e,t,o,n),t.child}function kl(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Pl(e,t,n,r,o){var i=No(n)?Co:Mo.current;return i=To(t,i),Ai(t,o),n=va(e,t,n,r,i,o),r=ma(),null===e||bl?(ii&&r&&ti(t),t.flags|=1,xl(e,t,n,o),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,Hl(e,t,o))}function El(e,t,n,r,o){if(No(n)){var i=!0;Ro(t)}else i=!1;if(Ai(t,o),null===t.stateNode)Wl(e,t),al(t,n,r),ul(t,n,r,o),r=!0;else if(null===e){var a=t.stateNode,l=t.memoizedProps;a.props=l;var u=a.context,c=n.contextType;"object"===typeof c&&null!==c?c=Ci(c):c=To(t,c=No(n)?Co:Mo.current);var s=n.getDerivedStateFromProps,f="function"===typeof s||"function"===typeof a.getSnapshotBeforeUpdate;f||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(l!==r||u!==c)&&ll(t,a,r,c),zi=!1;var d=t.memoizedState;a.state=d,Hi(t,r,a,o),u=t.memoizedState,l!==r||d!==u||Ao.current||zi?("function"===typeof s&&(rl(t,n,s,r),u=t.memoizedState),(l=zi||il(t,n,l,r,d,u,c))?(f||"function"!==typeof a.UNSAFE_componentWillMount&&"function"!==typeof a.componentWillMount||("function"===typeof a.componentWillMount&&a.componentWillMount(),"function"===typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"===typeof a.componentDidMount&&(t.flags|=4194308)):("function"===typeof a.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=u),a.props=r,a.state=u,a.context=c,r=l):("function"===typeof a.componentDidMount&&(t.flags|=4194308),r=!1)}else{a=t.stateNode,Li(e,t),l=t.memoizedProps,c=t.type===t.elementType?l:nl(t.type,l),a.props=c,f=t.pendingProps,d=a.context,"object"===typeof(u=n.contextType)&&null!==u?u=Ci(u):u=To(t,u=No(n)?Co:Mo.current);var p=n.getDerivedStateFromProps;(s="function"===typeof p||"function"===typeof a.getSnapshotBeforeUpdate)||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(l!==f||d!==u)&&ll(t,a,r,u),zi=!1,d=t.memoizedState,a.state=d,Hi(t,r,a,o);var h=t.memoizedState;l!==f||d!==h||Ao.current||zi?("function"===typeof p&&(rl(t,n,p,r),h=t.memoizedState),(c=zi||il(t,n,c,r,d,h,u)||!1)?(s||"function"!==typeof a.UNSAFE_componentWillUpdate&&"function"!==typeof a.componentWillUpdate||("function"===typeof a.componentWillUpdate&&a.componentWillUpdate(r,h,u),"function"===typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,h,u)),"function"===typeof a.componentDidUpdate&&(t.flags|=4),"function"===typeof a.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof a.componentDidUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=h),a.props=r,a.state=h,a.context=u,r=c):("function"!==typeof a.componentDidUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return _l(e,t,n,r,i,o)}function _l(e,t,n,r,o,i){kl(e,t);var a=0!==(128&t.flags);if(!r&&!a)return o&&Lo(t,n,!1),Hl(e,t,i);r=t.stateNode,gl.current=t;var l=a&&"function"!==typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&a?(t.child=wi(t,e.child,null,i),t.child=wi(t,null,l,i)):xl(e,t,l,i),t.memoizedState=r.state,o&&Lo(t,n,!0),t.child}function Ml(e){var t=e.stateNode;t.pendingContext?Io(0,t.pendingContext,t.pendingContext!==t.context):t.context&&Io(0,t.context,!1),Ki(e,t.containerInfo)}function Al(e,t,n,r,o){return hi(),yi(o),t.flags|=256,xl(e,t,n,r),t.child}var Cl,Tl,Nl,Dl={dehydrated:null,treeContext:null,retryLane:0};function Il(e){return{baseLanes:e,cachePool:null,transitions:null}}function zl(e,t,n){var r,o=t.pendingProps,a=ea.current,l=!1,u=0!==(128&t.flags);if((r=u)||(r=(null===e||null!==e.memoizedState)&&0!==(2&a)),r?(l=!0,t.flags&=-129):null!==e&&null===e.memoizedState||(a|=1),Eo(ea,1&a),null===e)return si(t),null!==(e=t.memoizedState)&&null!==(e=e.dehydrated)?(0===(1&t.mode)?t.lanes=1:"$!"===e.data?t.lanes=8:t.lanes=1073741824,null):(u=o.children,e=o.fallback,l?(o=t.mode,l=t.child,u={mode:"hidden",children:u},0===(1&o)&&null!==l?(l.childLanes=0,l.pendingProps=u):l=Ic(u,o,0,null),e=Dc(e,o,n,null),l.return=t,e.return=t,l.sibling=e,t.child=l,t.child.memoizedState=Il(n),t.memoizedState=Dl,e):Rl(t,u));if(null!==(a=e.memoizedState)&&null!==(r=a.dehydrated))return function(e,t,n,r,o,a,l){if(n)return 256&t.flags?(t.flags&=-257,Ll(e,t,l,r=sl(Error(i(422))))):null!==t.memoizedState?(t.child=e.child,t.flags|=128,null):(a=r.fallback,o=t.mode,r=Ic({mode:"visible",children:r.children},o,0,null),(a=Dc(a,o,l,null)).flags|=2,r.return=t,a.return=t,r.sibling=a,t.child=r,0!==(1&t.mode)&&wi(t,e.child,null,l),t.child.memoizedState=Il(l),t.memoizedState=Dl,a);if(0===(1&t.mode))return Ll(e,t,l,null);if("$!"===o.data){if(r=o.nextSibling&&o.nextSibling.dataset)var u=r.dgst;return r=u,Ll(e,t,l,r=sl(a=Error(i(419)),r,void 0))}if(u=0!==(l&e.childLanes),bl||u){if(null!==(r=_u)){switch(l&-l){case 4:o=2;break;case 16:o=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:o=32;break;case 536870912:o=268435456;break;default:o=0}0!==(o=0!==(o&(r.suspendedLanes|l))?0:o)&&o!==a.retryLane&&(a.retryLane=o,Ii(e,o),tc(r,e,o,-1))}return hc(),Ll(e,t,l,r=sl(Error(i(421))))}return"$?"===o.data?(t.flags|=128,t.child=e.child,t=Pc.bind(null,e),o._reactRetry=t,null):(e=a.treeContext,oi=co(o.nextSibling),ri=t,ii=!0,ai=null,null!==e&&(Yo[Go++]=Qo,Yo[Go++]=Zo,Yo[Go++]=Ko,Qo=e.id,Zo=e.overflow,Ko=t),t=Rl(t,r.children),t.flags|=4096,t)}(e,t,u,o,r,a,n);if(l){l=o.fallback,u=t.mode,r=(a=e.child).sibling;var c={mode:"hidden",children:o.children};return 0===(1&u)&&t.child!==a?((o=t.child).childLanes=0,o.pendingProps=c,t.deletions=null):(o=Tc(a,c)).subtreeFlags=14680064&a.subtreeFlags,null!==r?l=Tc(r,l):(l=Dc(l,u,n,null)).flags|=2,l.return=t,o.return=t,o.sibling=l,t.child=o,o=l,l=t.child,u=null===(u=e.child.memoizedState)?Il(n):{baseLanes:u.baseLanes|n,cachePool:null,transitions:u.transitions},l.memoizedState=u,l.childLanes=e.childLanes&~n,t.memoizedState=Dl,o}return e=(l=e.child).sibling,o=Tc(l,{mode:"visible",children:o.children}),0===(1&t.mode)&&(o.lanes=n),o.return=t,o.sibling=null,null!==e&&(null===(n=t.deletions)?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=o,t.memoizedState=null,o}function Rl(e,t){return(t=Ic({mode:"visible",children:t},e.mode,0,null)).return=e,e.child=t}function Ll(e,t,n,r){return null!==r&&yi(r),wi(t,e.child,null,n),(e=Rl(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Bl(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),Mi(e.return,t,n)}function Fl(e,t,n,r,o){var i=e.memoizedState;null===i?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:o}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=n,i.tailMode=o)}function Ul(e,t,n){var r=t.pendingProps,o=r.revealOrder,i=r.tail;if(xl(e,t,r.children,n),0!==(2&(r=ea.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Bl(e,n,t);else if(19===e.tag)Bl(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Eo(ea,r),0===(1&t.mode))t.memoizedState=null;else switch(o){case"forwards":for(n=t.child,o=null;null!==n;)null!==(e=n.alternate)&&null===ta(e)&&(o=n),n=n.sibling;null===(n=o)?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),Fl(t,!1,o,n,i);break;case"backwards":for(n=null,o=t.child,t.child=null;null!==o;){if(null!==(e=o.alternate)&&null===ta(e)){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}Fl(t,!0,n,null,i);break;case"together":Fl(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Wl(e,t){0===(1&t.mode)&&null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Hl(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Iu|=t.lanes,0===(n&t.childLanes))return null;if(null!==e&&t.child!==e.child)throw Error(i(153));if(null!==t.child){for(n=Tc(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Tc(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function ql(e,t){if(!ii)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Vl(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var o=e.child;null!==o;)n|=o.lanes|o.childLanes,r|=14680064&o.subtreeFlags,r|=14680064&o.flags,o.return=e,o=o.sibling;else for(o=e.child;null!==o;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags,r|=o.flags,o.return=e,o=o.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Xl(e,t,n){var r=t.pendingProps;switch(ni(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Vl(t),null;case 1:case 17:return No(t.type)&&Do(),Vl(t),null;case 3:return r=t.stateNode,Qi(),Po(Ao),Po(Mo),ra(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(di(t)?t.flags|=4:null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,null!==ai&&(ic(ai),ai=null))),Vl(t),null;case 5:Ji(t);var o=Gi(Yi.current);if(n=t.type,null!==e&&null!=t.stateNode)Tl(e,t,n,r),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(null===t.stateNode)throw Error(i(166));return Vl(t),null}if(e=Gi(Xi.current),di(t)){r=t.stateNode,n=t.type;var a=t.memoizedProps;switch(r[po]=t,r[ho]=a,e=0!==(1&t.mode),n){case"dialog":Br("cancel",r),Br("close",r);break;case"iframe":case"object":case"embed":Br("load",r);break;case"video":case"audio":for(o=0;o<Ir.length;o++)Br(Ir[o],r);break;case"source":Br("error",r);break;case"img":case"image":case"link":Br("error",r),Br("load",r);break;case"details":Br("toggle",r);break;case"input":K(r,a),Br("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!a.multiple},Br("invalid",r);break;case"textarea":oe(r,a),Br("invalid",r)}for(var u in ge(n,a),o=null,a)if(a.hasOwnProperty(u)){var c=a[u];"children"===u?"string"===typeof c?r.textContent!==c&&(!0!==a.suppressHydrationWarning&&Zr(r.textContent,c,e),o=["children",c]):"number"===typeof c&&r.textContent!==""+c&&(!0!==a.suppressHydrationWarning&&Zr(r.textContent,c,e),o=["children",""+c]):l.hasOwnProperty(u)&&null!=c&&"onScroll"===u&&Br("scroll",r)}switch(n){case"input":X(r),J(r,a,!0);break;case"textarea":X(r),ae(r);break;case"select":case"option":break;default:"function"===typeof a.onClick&&(r.onclick=Jr)}r=o,t.updateQueue=r,null!==r&&(t.flags|=4)}else{u=9===o.nodeType?o:o.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=le(n)),"http://www.w3.org/1999/xhtml"===e?"script"===n?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"===typeof r.is?e=u.createElement(n,{is:r.is}):(e=u.createElement(n),"select"===n&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,n),e[po]=t,e[ho]=r,Cl(e,t),t.stateNode=e;e:{switch(u=be(n,r),n){case"dialog":Br("cancel",e),Br("close",e),o=r;break;case"iframe":case"object":case"embed":Br("load",e),o=r;break;case"video":case"audio":for(o=0;o<Ir.length;o++)Br(Ir[o],e);o=r;break;case"source":Br("error",e),o=r;break;case"img":case"image":case"link":Br("error",e),Br("load",e),o=r;break;case"details":Br("toggle",e),o=r;break;case"input":K(e,r),o=G(e,r),Br("invalid",e);break;case"option":default:o=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},o=R({},r,{value:void 0}),Br("invalid",e);break;case"textarea":oe(e,r),o=re(e,r),Br("invalid",e)}for(a in ge(n,o),c=o)if(c.hasOwnProperty(a)){var s=c[a];"style"===a?ve(e,s):"dangerouslySetInnerHTML"===a?null!=(s=s?s.__html:void 0)&&fe(e,s):"children"===a?"string"===typeof s?("textarea"!==n||""!==s)&&de(e,s):"number"===typeof s&&de(e,""+s):"suppressContentEditableWarning"!==a&&"suppressHydrationWarning"!==a&&"autoFocus"!==a&&(l.hasOwnProperty(a)?null!=s&&"onScroll"===a&&Br("scroll",e):null!=s&&b(e,a,s,u))}switch(n){case"input":X(e),J(e,r,!1);break;case"textarea":X(e),ae(e);break;case"option":null!=r.value&&e.setAttribute("value",""+q(r.value));break;case"select":e.multiple=!!r.multiple,null!=(a=r.value)?ne(e,!!r.multiple,a,!1):null!=r.defaultValue&&ne(e,!!r.multiple,r.defaultValue,!0);break;default:"function"===typeof o.onClick&&(e.onclick=Jr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}null!==t.ref&&(t.flags|=512,t.flags|=2097152)}return Vl(t),null;case 6:if(e&&null!=t.stateNode)Nl(0,t,e.memoizedProps,r);else{if("string"!==typeof r&&null===t.stateNode)throw Error(i(166));if(n=Gi(Yi.current),Gi(Xi.current),di(t)){if(r=t.stateNode,n=t.memoizedProps,r[po]=t,(a=r.nodeValue!==n)&&null!==(e=ri))switch(e.tag){case 3:Zr(r.nodeValue,n,0!==(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Zr(r.nodeValue,n,0!==(1&e.mode))}a&&(t.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[po]=t,t.stateNode=r}return Vl(t),null;case 13:if(Po(ea),r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(ii&&null!==oi&&0!==(1&t.mode)&&0===(128&t.flags))pi(),hi(),t.flags|=98560,a=!1;else if(a=di(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(i(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(i(317));a[po]=t}else hi(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Vl(t),a=!1}else null!==ai&&(ic(ai),ai=null),a=!0;if(!a)return 65536&t.flags?t:null}return 0!==(128&t.flags)?(t.lanes=n,t):((r=null!==r)!==(null!==e&&null!==e.memoizedState)&&r&&(t.child.flags|=8192,0!==(1&t.mode)&&(null===e||0!==(1&ea.current)?0===Nu&&(Nu=3):hc())),null!==t.updateQueue&&(t.flags|=4),Vl(t),null);case 4:return Qi(),null===e&&Wr(t.stateNode.containerInfo),Vl(t),null;case 10:return _i(t.type._context),Vl(t),null;case 19:if(Po(ea),null===(a=t.memoizedState))return Vl(t),null;if(r=0!==(128&t.flags),null===(u=a.rendering))if(r)ql(a,!1);else{if(0!==Nu||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(u=ta(e))){for(t.flags|=128,ql(a,!1),null!==(r=u.updateQueue)&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;null!==n;)e=r,(a=n).flags&=14680066,null===(u=a.alternate)?(a.childLanes=0,a.lanes=e,a.child=null,a.subtreeFlags=0,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null,a.stateNode=null):(a.childLanes=u.childLanes,a.lanes=u.lanes,a.child=u.child,a.subtreeFlags=0,a.deletions=null,a.memoizedProps=u.memoizedProps,a.memoizedState=u.memoizedState,a.updateQueue=u.updateQueue,a.type=u.type,e=u.dependencies,a.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return Eo(ea,1&ea.current|2),t.child}e=e.sibling}null!==a.tail&&Qe()>Uu&&(t.flags|=128,r=!0,ql(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=ta(u))){if(t.flags|=128,r=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),ql(a,!0),null===a.tail&&"hidden"===a.tailMode&&!u.alternate&&!ii)return Vl(t),null}else 2*Qe()-a.renderingStartTime>Uu&&1073741824!==n&&(t.flags|=128,r=!0,ql(a,!1),t.lanes=4194304);a.isBackwards?(u.sibling=t.child,t.child=u):(null!==(n=a.last)?n.sibling=u:t.child=u,a.last=u)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=Qe(),t.sibling=null,n=ea.current,Eo(ea,r?1&n|2:1&n),t):(Vl(t),null);case 22:case 23:return sc(),r=null!==t.memoizedState,null!==e&&null!==e.memoizedState!==r&&(t.flags|=8192),r&&0!==(1&t.mode)?0!==(1073741824&Cu)&&(Vl(t),6&t.subtreeFlags&&(t.flags|=8192)):Vl(t),null;case 24:case 25:return null}throw Error(i(156,t.tag))}function $l(e,t){switch(ni(t),t.tag){case 1:return No(t.type)&&Do(),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return Qi(),Po(Ao),Po(Mo),ra(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 5:return Ji(t),null;case 13:if(Po(ea),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(i(340));hi()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Po(ea),null;case 4:return Qi(),null;case 10:return _i(t.type._context),null;case 22:case 23:return sc(),null;default:return null}}Cl=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Tl=function(e,t,n,r){var o=e.memoizedProps;if(o!==r){e=t.stateNode,Gi(Xi.current);var i,a=null;switch(n){case"input":o=G(e,o),r=G(e,r),a=[];break;case"select":o=R({},o,{value:void 0}),r=R({},r,{value:void 0}),a=[];break;case"textarea":o=re(e,o),r=re(e,r),a=[];break;default:"function"!==typeof o.onClick&&"function"===typeof r.onClick&&(e.onclick=Jr)}for(s in ge(n,r),n=null,o)if(!r.hasOwnProperty(s)&&o.hasOwnProperty(s)&&null!=o[s])if("style"===s){var u=o[s];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else"dangerouslySetInnerHTML"!==s&&"children"!==s&&"suppressContentEditableWarning"!==s&&"suppressHydrationWarning"!==s&&"autoFocus"!==s&&(l.hasOwnProperty(s)?a||(a=[]):(a=a||[]).push(s,null));for(s in r){var c=r[s];if(u=null!=o?o[s]:void 0,r.hasOwnProperty(s)&&c!==u&&(null!=c||null!=u))if("style"===s)if(u){for(i in u)!u.hasOwnProperty(i)||c&&c.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in c)c.hasOwnProperty(i)&&u[i]!==c[i]&&(n||(n={}),n[i]=c[i])}else n||(a||(a=[]),a.push(s,n)),n=c;else"dangerouslySetInnerHTML"===s?(c=c?c.__html:void 0,u=u?u.__html:void 0,null!=c&&u!==c&&(a=a||[]).push(s,c)):"children"===s?"string"!==typeof c&&"number"!==typeof c||(a=a||[]).push(s,""+c):"suppressContentEditableWarning"!==s&&"suppressHydrationWarning"!==s&&(l.hasOwnProperty(s)?(null!=c&&"onScroll"===s&&Br("scroll",e),a||u===c||(a=[])):(a=a||[]).push(s,c))}n&&(a=a||[]).push("style",n);var s=a;(t.updateQueue=s)&&(t.flags|=4)}},Nl=function(e,t,n,r){n!==r&&(t.flags|=4)};var Yl=!1,Gl=!1,Kl="function"===typeof WeakSet?WeakSet:Set,Ql=null;function Zl(e,t){var n=e.ref;if(null!==n)if("function"===typeof n)try{n(null)}catch(r){Sc(e,t,r)}else n.current=null}function Jl(e,t,n){try{n()}catch(r){Sc(e,t,r)}}var eu=!1;function tu(e,t,n){var r=t.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var o=r=r.next;do{if((o.tag&e)===e){var i=o.destroy;o.destroy=void 0,void 0!==i&&Jl(t,n,i)}o=o.next}while(o!==r)}}function nu(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function ru(e){var t=e.ref;if(null!==t){var n=e.stateNode;e.tag,e=n,"function"===typeof t?t(e):t.current=e}}function ou(e){var t=e.alternate;null!==t&&(e.alternate=null,ou(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&(delete t[po],delete t[ho],delete t[vo],delete t[mo],delete t[go])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function iu(e){return 5===e.tag||3===e.tag||4===e.tag}function au(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||iu(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function lu(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Jr));else if(4!==r&&null!==(e=e.child))for(lu(e,t,n),e=e.sibling;null!==e;)lu(e,t,n),e=e.sibling}function uu(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(uu(e,t,n),e=e.sibling;null!==e;)uu(e,t,n),e=e.sibling}var cu=null,su=!1;function fu(e,t,n){for(n=n.child;null!==n;)du(e,t,n),n=n.sibling}function du(e,t,n){if(it&&"function"===typeof it.onCommitFiberUnmount)try{it.onCommitFiberUnmount(ot,n)}catch(l){}switch(n.tag){case 5:Gl||Zl(n,t);case 6:var r=cu,o=su;cu=null,fu(e,t,n),su=o,null!==(cu=r)&&(su?(e=cu,n=n.stateNode,8===e.nodeType?e.parentNode.removeChild(n):e.removeChild(n)):cu.removeChild(n.stateNode));break;case 18:null!==cu&&(su?(e=cu,n=n.stateNode,8===e.nodeType?uo(e.parentNode,n):1===e.nodeType&&uo(e,n),Wt(e)):uo(cu,n.stateNode));break;case 4:r=cu,o=su,cu=n.stateNode.containerInfo,su=!0,fu(e,t,n),cu=r,su=o;break;case 0:case 11:case 14:case 15:if(!Gl&&(null!==(r=n.updateQueue)&&null!==(r=r.lastEffect))){o=r=r.next;do{var i=o,a=i.destroy;i=i.tag,void 0!==a&&(0!==(2&i)||0!==(4&i))&&Jl(n,t,a),o=o.next}while(o!==r)}fu(e,t,n);break;case 1:if(!Gl&&(Zl(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(l){Sc(n,t,l)}fu(e,t,n);break;case 21:fu(e,t,n);break;case 22:1&n.mode?(Gl=(r=Gl)||null!==n.memoizedState,fu(e,t,n),Gl=r):fu(e,t,n);break;default:fu(e,t,n)}}function pu(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new Kl),t.forEach(function(t){var r=Ec.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))})}}function hu(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var o=n[r];try{var a=e,l=t,u=l;e:for(;null!==u;){switch(u.tag){case 5:cu=u.stateNode,su=!1;break e;case 3:case 4:cu=u.stateNode.containerInfo,su=!0;break e}u=u.return}if(null===cu)throw Error(i(160));du(a,l,o),cu=null,su=!1;var c=o.alternate;null!==c&&(c.return=null),o.return=null}catch(s){Sc(o,t,s)}}if(12854&t.subtreeFlags)for(t=t.child;null!==t;)yu(t,e),t=t.sibling}function yu(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(hu(t,e),vu(e),4&r){try{tu(3,e,e.return),nu(3,e)}catch(v){Sc(e,e.return,v)}try{tu(5,e,e.return)}catch(v){Sc(e,e.return,v)}}break;case 1:hu(t,e),vu(e),512&r&&null!==n&&Zl(n,n.return);break;case 5:if(hu(t,e),vu(e),512&r&&null!==n&&Zl(n,n.return),32&e.flags){var o=e.stateNode;try{de(o,"")}catch(v){Sc(e,e.return,v)}}if(4&r&&null!=(o=e.stateNode)){var a=e.memoizedProps,l=null!==n?n.memoizedProps:a,u=e.type,c=e.updateQueue;if(e.updateQueue=null,null!==c)try{"input"===u&&"radio"===a.type&&null!=a.name&&Q(o,a),be(u,l);var s=be(u,a);for(l=0;l<c.length;l+=2){var f=c[l],d=c[l+1];"style"===f?ve(o,d):"dangerouslySetInnerHTML"===f?fe(o,d):"children"===f?de(o,d):b(o,f,d,s)}switch(u){case"input":Z(o,a);break;case"textarea":ie(o,a);break;case"select":var p=o._wrapperState.wasMultiple;o._wrapperState.wasMultiple=!!a.multiple;var h=a.value;null!=h?ne(o,!!a.multiple,h,!1):p!==!!a.multiple&&(null!=a.defaultValue?ne(o,!!a.multiple,a.defaultValue,!0):ne(o,!!a.multiple,a.multiple?[]:"",!1))}o[ho]=a}catch(v){Sc(e,e.return,v)}}break;case 6:if(hu(t,e),vu(e),4&r){if(null===e.stateNode)throw Error(i(162));o=e.stateNode,a=e.memoizedProps;try{o.nodeValue=a}catch(v){Sc(e,e.return,v)}}break;case 3:if(hu(t,e),vu(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Wt(t.containerInfo)}catch(v){Sc(e,e.return,v)}break;case 4:default:hu(t,e),vu(e);break;case 13:hu(t,e),vu(e),8192&(o=e.child).flags&&(a=null!==o.memoizedState,o.stateNode.isHidden=a,!a||null!==o.alternate&&null!==o.alternate.memoizedState||(Fu=Qe())),4&r&&pu(e);break;case 22:if(f=null!==n&&null!==n.memoizedState,1&e.mode?(Gl=(s=Gl)||f,hu(t,e),Gl=s):hu(t,e),vu(e),8192&r){if(s=null!==e.memoizedState,(e.stateNode.isHidden=s)&&!f&&0!==(1&e.mode))for(Ql=e,f=e.child;null!==f;){for(d=Ql=f;null!==Ql;){switch(h=(p=Ql).child,p.tag){case 0:case 11:case 14:case 15:tu(4,p,p.return);break;case 1:Zl(p,p.return);var y=p.stateNode;if("function"===typeof y.componentWillUnmount){r=p,n=p.return;try{t=r,y.props=t.memoizedProps,y.state=t.memoizedState,y.componentWillUnmount()}catch(v){Sc(r,n,v)}}break;case 5:Zl(p,p.return);break;case 22:if(null!==p.memoizedState){xu(d);continue}}null!==h?(h.return=p,Ql=h):xu(d)}f=f.sibling}e:for(f=null,d=e;;){if(5===d.tag){if(null===f){f=d;try{o=d.stateNode,s?"function"===typeof(a=o.style).setProperty?a.setProperty("display","none","important"):a.display="none":(u=d.stateNode,l=void 0!==(c=d.memoizedProps.style)&&null!==c&&c.hasOwnProperty("display")?c.display:null,u.style.display=ye("display",l))}catch(v){Sc(e,e.return,v)}}}else if(6===d.tag){if(null===f)try{d.stateNode.nodeValue=s?"":d.memoizedProps}catch(v){Sc(e,e.return,v)}}else if((22!==d.tag&&23!==d.tag||null===d.memoizedState||d===e)&&null!==d.child){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;null===d.sibling;){if(null===d.return||d.return===e)break e;f===d&&(f=null),d=d.return}f===d&&(f=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:hu(t,e),vu(e),4&r&&pu(e);case 21:}}function vu(e){var t=e.flags;if(2&t){try{e:{for(var n=e.return;null!==n;){if(iu(n)){var r=n;break e}n=n.return}throw Error(i(160))}switch(r.tag){case 5:var o=r.stateNode;32&r.flags&&(de(o,""),r.flags&=-33),uu(e,au(e),o);break;case 3:case 4:var a=r.stateNode.containerInfo;lu(e,au(e),a);break;default:throw Error(i(161))}}catch(l){Sc(e,e.return,l)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function mu(e,t,n){Ql=e,gu(e,t,n)}function gu(e,t,n){for(var r=0!==(1&e.mode);null!==Ql;){var o=Ql,i=o.child;if(22===o.tag&&r){var a=null!==o.memoizedState||Yl;if(!a){var l=o.alternate,u=null!==l&&null!==l.memoizedState||Gl;l=Yl;var c=Gl;if(Yl=a,(Gl=u)&&!c)for(Ql=o;null!==Ql;)u=(a=Ql).child,22===a.tag&&null!==a.memoizedState?wu(o):null!==u?(u.return=a,Ql=u):wu(o);for(;null!==i;)Ql=i,gu(i,t,n),i=i.sibling;Ql=o,Yl=l,Gl=c}bu(e)}else 0!==(8772&o.subtreeFlags)&&null!==i?(i.return=o,Ql=i):bu(e)}}function bu(e){for(;null!==Ql;){var t=Ql;if(0!==(8772&t.flags)){var n=t.alternate;try{if(0!==(8772&t.flags))switch(t.tag){case 0:case 11:case 15:Gl||nu(5,t);break;case 1:var r=t.stateNode;if(4&t.flags&&!Gl)if(null===n)r.componentDidMount();else{var o=t.elementType===t.type?n.memoizedProps:nl(t.type,n.memoizedProps);r.componentDidUpdate(o,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var a=t.updateQueue;null!==a&&qi(t,a,r);break;case 3:var l=t.updateQueue;if(null!==l){if(n=null,null!==t.child)switch(t.child.tag){case 5:case 1:n=t.child.stateNode}qi(t,l,n)}break;case 5:var u=t.stateNode;if(null===n&&4&t.flags){n=u;var c=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":c.autoFocus&&n.focus();break;case"img":c.src&&(n.src=c.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===t.memoizedState){var s=t.alternate;if(null!==s){var f=s.memoizedState;if(null!==f){var d=f.dehydrated;null!==d&&Wt(d)}}}break;default:throw Error(i(163))}Gl||512&t.flags&&ru(t)}catch(p){Sc(t,t.return,p)}}if(t===e){Ql=null;break}if(null!==(n=t.sibling)){n.return=t.return,Ql=n;break}Ql=t.return}}function xu(e){for(;null!==Ql;){var t=Ql;if(t===e){Ql=null;break}var n=t.sibling;if(null!==n){n.return=t.return,Ql=n;break}Ql=t.return}}function wu(e){for(;null!==Ql;){var t=Ql;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{nu(4,t)}catch(u){Sc(t,n,u)}break;case 1:var r=t.stateNode;if("function"===typeof r.componentDidMount){var o=t.return;try{r.componentDidMount()}catch(u){Sc(t,o,u)}}var i=t.return;try{ru(t)}catch(u){Sc(t,i,u)}break;case 5:var a=t.return;try{ru(t)}catch(u){Sc(t,a,u)}}}catch(u){Sc(t,t.return,u)}if(t===e){Ql=null;break}var l=t.sibling;if(null!==l){l.return=t.return,Ql=l;break}Ql=t.return}}var Ou,Su=Math.ceil,ju=x.ReactCurrentDispatcher,ku=x.ReactCurrentOwner,Pu=x.ReactCurrentBatchConfig,Eu=0,_u=null,Mu=null,Au=0,Cu=0,Tu=ko(0),Nu=0,Du=null,Iu=0,zu=0,Ru=0,Lu=null,Bu=null,Fu=0,Uu=1/0,Wu=null,Hu=!1,qu=null,Vu=null,Xu=!1,$u=null,Yu=0,Gu=0,Ku=null,Qu=-1,Zu=0;function Ju(){return 0!==(6&Eu)?Qe():-1!==Qu?Qu:Qu=Qe()}function ec(e){return 0===(1&e.mode)?1:0!==(2&Eu)&&0!==Au?Au&-Au:null!==vi.transition?(0===Zu&&(Zu=yt()),Zu):0!==(e=bt)?e:e=void 0===(e=window.event)?16:Kt(e.type)}function tc(e,t,n,r){if(50<Gu)throw Gu=0,Ku=null,Error(i(185));mt(e,n,r),0!==(2&Eu)&&e===_u||(e===_u&&(0===(2&Eu)&&(zu|=n),4===Nu&&ac(e,Au)),nc(e,r),1===n&&0===Eu&&0===(1&t.mode)&&(Uu=Qe()+500,Fo&&Ho()))}function nc(e,t){var n=e.callbackNode;!function(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,o=e.expirationTimes,i=e.pendingLanes;0<i;){var a=31-at(i),l=1<<a,u=o[a];-1===u?0!==(l&n)&&0===(l&r)||(o[a]=pt(l,t)):u<=t&&(e.expiredLanes|=l),i&=~l}}(e,t);var r=dt(e,e===_u?Au:0);if(0===r)null!==n&&Ye(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(null!=n&&Ye(n),1===t)0===e.tag?function(e){Fo=!0,Wo(e)}(lc.bind(null,e)):Wo(lc.bind(null,e)),ao(function(){0===(6&Eu)&&Ho()}),n=null;else{switch(xt(r)){case 1:n=Je;break;case 4:n=et;break;case 16:default:n=tt;break;case 536870912:n=rt}n=_c(n,rc.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function rc(e,t){if(Qu=-1,Zu=0,0!==(6&Eu))throw Error(i(327));var n=e.callbackNode;if(wc()&&e.callbackNode!==n)return null;var r=dt(e,e===_u?Au:0);if(0===r)return null;if(0!==(30&r)||0!==(r&e.expiredLanes)||t)t=yc(e,r);else{t=r;var o=Eu;Eu|=2;var a=pc();for(_u===e&&Au===t||(Wu=null,Uu=Qe()+500,fc(e,t));;)try{mc();break}catch(u){dc(e,u)}Ei(),ju.current=a,Eu=o,null!==Mu?t=0:(_u=null,Au=0,t=Nu)}if(0!==t){if(2===t&&(0!==(o=ht(e))&&(r=o,t=oc(e,o))),1===t)throw n=Du,fc(e,0),ac(e,r),nc(e,Qe()),n;if(6===t)ac(e,r);else{if(o=e.current.alternate,0===(30&r)&&!function(e){for(var t=e;;){if(16384&t.flags){var n=t.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var o=n[r],i=o.getSnapshot;o=o.value;try{if(!lr(i(),o))return!1}catch(l){return!1}}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}(o)&&(2===(t=yc(e,r))&&(0!==(a=ht(e))&&(r=a,t=oc(e,a))),1===t))throw n=Du,fc(e,0),ac(e,r),nc(e,Qe()),n;switch(e.finishedWork=o,e.finishedLanes=r,t){case 0:case 1:throw Error(i(345));case 2:case 5:xc(e,Bu,Wu);break;case 3:if(ac(e,r),(130023424&r)===r&&10<(t=Fu+500-Qe())){if(0!==dt(e,0))break;if(((o=e.suspendedLanes)&r)!==r){Ju(),e.pingedLanes|=e.suspendedLanes&o;break}e.timeoutHandle=ro(xc.bind(null,e,Bu,Wu),t);break}xc(e,Bu,Wu);break;case 4:if(ac(e,r),(4194240&r)===r)break;for(t=e.eventTimes,o=-1;0<r;){var l=31-at(r);a=1<<l,(l=t[l])>o&&(o=l),r&=~a}if(r=o,10<(r=(120>(r=Qe()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Su(r/1960))-r)){e.timeoutHandle=ro(xc.bind(null,e,Bu,Wu),r);break}xc(e,Bu,Wu);break;default:throw Error(i(329))}}}return nc(e,Qe()),e.callbackNode===n?rc.bind(null,e):null}function oc(e,t){var n=Lu;return e.current.memoizedState.isDehydrated&&(fc(e,t).flags|=256),2!==(e=yc(e,t))&&(t=Bu,Bu=n,null!==t&&ic(t)),e}function ic(e){null===Bu?Bu=e:Bu.push.apply(Bu,e)}function ac(e,t){for(t&=~Ru,t&=~zu,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-at(t),r=1<<n;e[n]=-1,t&=~r}}function lc(e){if(0!==(6&Eu))throw Error(i(327));wc();var t=dt(e,0);if(0===(1&t))return nc(e,Qe()),null;var n=yc(e,t);if(0!==e.tag&&2===n){var r=ht(e);0!==r&&(t=r,n=oc(e,r))}if(1===n)throw n=Du,fc(e,0),ac(e,t),nc(e,Qe()),n;if(6===n)throw Error(i(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,xc(e,Bu,Wu),nc(e,Qe()),null}function uc(e,t){var n=Eu;Eu|=1;try{return e(t)}finally{0===(Eu=n)&&(Uu=Qe()+500,Fo&&Ho())}}function cc(e){null!==$u&&0===$u.tag&&0===(6&Eu)&&wc();var t=Eu;Eu|=1;var n=Pu.transition,r=bt;try{if(Pu.transition=null,bt=1,e)return e()}finally{bt=r,Pu.transition=n,0===(6&(Eu=t))&&Ho()}}function sc(){Cu=Tu.current,Po(Tu)}function fc(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,oo(n)),null!==Mu)for(n=Mu.return;null!==n;){var r=n;switch(ni(r),r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&Do();break;case 3:Qi(),Po(Ao),Po(Mo),ra();break;case 5:Ji(r);break;case 4:Qi();break;case 13:case 19:Po(ea);break;case 10:_i(r.type._context);break;case 22:case 23:sc()}n=n.return}if(_u=e,Mu=e=Tc(e.current,null),Au=Cu=t,Nu=0,Du=null,Ru=zu=Iu=0,Bu=Lu=null,null!==Ti){for(t=0;t<Ti.length;t++)if(null!==(r=(n=Ti[t]).interleaved)){n.interleaved=null;var o=r.next,i=n.pending;if(null!==i){var a=i.next;i.next=o,r.next=a}n.pending=r}Ti=null}return e}function dc(e,t){for(;;){var n=Mu;try{if(Ei(),oa.current=Za,sa){for(var r=la.memoizedState;null!==r;){var o=r.queue;null!==o&&(o.pending=null),r=r.next}sa=!1}if(aa=0,ca=ua=la=null,fa=!1,da=0,ku.current=null,null===n||null===n.return){Nu=1,Du=t,Mu=null;break}e:{var a=e,l=n.return,u=n,c=t;if(t=Au,u.flags|=32768,null!==c&&"object"===typeof c&&"function"===typeof c.then){var s=c,f=u,d=f.tag;if(0===(1&f.mode)&&(0===d||11===d||15===d)){var p=f.alternate;p?(f.updateQueue=p.updateQueue,f.memoizedState=p.memoizedState,f.lanes=p.lanes):(f.updateQueue=null,f.memoizedState=null)}var h=vl(l);if(null!==h){h.flags&=-257,ml(h,l,u,0,t),1&h.mode&&yl(a,s,t),c=s;var y=(t=h).updateQueue;if(null===y){var v=new Set;v.add(c),t.updateQueue=v}else y.add(c);break e}if(0===(1&t)){yl(a,s,t),hc();break e}c=Error(i(426))}else if(ii&&1&u.mode){var m=vl(l);if(null!==m){0===(65536&m.flags)&&(m.flags|=256),ml(m,l,u,0,t),yi(cl(c,u));break e}}a=c=cl(c,u),4!==Nu&&(Nu=2),null===Lu?Lu=[a]:Lu.push(a),a=l;do{switch(a.tag){case 3:a.flags|=65536,t&=-t,a.lanes|=t,Wi(a,pl(0,c,t));break e;case 1:u=c;var g=a.type,b=a.stateNode;if(0===(128&a.flags)&&("function"===typeof g.getDerivedStateFromError||null!==b&&"function"===typeof b.componentDidCatch&&(null===Vu||!Vu.has(b)))){a.flags|=65536,t&=-t,a.lanes|=t,Wi(a,hl(a,u,t));break e}}a=a.return}while(null!==a)}bc(n)}catch(x){t=x,Mu===n&&null!==n&&(Mu=n=n.return);continue}break}}function pc(){var e=ju.current;return ju.current=Za,null===e?Za:e}function hc(){0!==Nu&&3!==Nu&&2!==Nu||(Nu=4),null===_u||0===(268435455&Iu)&&0===(268435455&zu)||ac(_u,Au)}function yc(e,t){var n=Eu;Eu|=2;var r=pc();for(_u===e&&Au===t||(Wu=null,fc(e,t));;)try{vc();break}catch(o){dc(e,o)}if(Ei(),Eu=n,ju.current=r,null!==Mu)throw Error(i(261));return _u=null,Au=0,Nu}function vc(){for(;null!==Mu;)gc(Mu)}function mc(){for(;null!==Mu&&!Ge();)gc(Mu)}function gc(e){var t=Ou(e.alternate,e,Cu);e.memoizedProps=e.pendingProps,null===t?bc(e):Mu=t,ku.current=null}function bc(e){var t=e;do{var n=t.alternate;if(e=t.return,0===(32768&t.flags)){if(null!==(n=Xl(n,t,Cu)))return void(Mu=n)}else{if(null!==(n=$l(n,t)))return n.flags&=32767,void(Mu=n);if(null===e)return Nu=6,void(Mu=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}if(null!==(t=t.sibling))return void(Mu=t);Mu=t=e}while(null!==t);0===Nu&&(Nu=5)}function xc(e,t,n){var r=bt,o=Pu.transition;try{Pu.transition=null,bt=1,function(e,t,n,r){do{wc()}while(null!==$u);if(0!==(6&Eu))throw Error(i(327));n=e.finishedWork;var o=e.finishedLanes;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(i(177));e.callbackNode=null,e.callbackPriority=0;var a=n.lanes|n.childLanes;if(function(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var o=31-at(n),i=1<<o;t[o]=0,r[o]=-1,e[o]=-1,n&=~i}}(e,a),e===_u&&(Mu=_u=null,Au=0),0===(2064&n.subtreeFlags)&&0===(2064&n.flags)||Xu||(Xu=!0,_c(tt,function(){return wc(),null})),a=0!==(15990&n.flags),0!==(15990&n.subtreeFlags)||a){a=Pu.transition,Pu.transition=null;var l=bt;bt=1;var u=Eu;Eu|=4,ku.current=null,function(e,t){if(eo=qt,pr(e=dr())){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var o=r.anchorOffset,a=r.focusNode;r=r.focusOffset;try{n.nodeType,a.nodeType}catch(w){n=null;break e}var l=0,u=-1,c=-1,s=0,f=0,d=e,p=null;t:for(;;){for(var h;d!==n||0!==o&&3!==d.nodeType||(u=l+o),d!==a||0!==r&&3!==d.nodeType||(c=l+r),3===d.nodeType&&(l+=d.nodeValue.length),null!==(h=d.firstChild);)p=d,d=h;for(;;){if(d===e)break t;if(p===n&&++s===o&&(u=l),p===a&&++f===r&&(c=l),null!==(h=d.nextSibling))break;p=(d=p).parentNode}d=h}n=-1===u||-1===c?null:{start:u,end:c}}else n=null}n=n||{start:0,end:0}}else n=null;for(to={focusedElem:e,selectionRange:n},qt=!1,Ql=t;null!==Ql;)if(e=(t=Ql).child,0!==(1028&t.subtreeFlags)&&null!==e)e.return=t,Ql=e;else for(;null!==Ql;){t=Ql;try{var y=t.alternate;if(0!==(1024&t.flags))switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==y){var v=y.memoizedProps,m=y.memoizedState,g=t.stateNode,b=g.getSnapshotBeforeUpdate(t.elementType===t.type?v:nl(t.type,v),m);g.__reactInternalSnapshotBeforeUpdate=b}break;case 3:var x=t.stateNode.containerInfo;1===x.nodeType?x.textContent="":9===x.nodeType&&x.documentElement&&x.removeChild(x.documentElement);break;default:throw Error(i(163))}}catch(w){Sc(t,t.return,w)}if(null!==(e=t.sibling)){e.return=t.return,Ql=e;break}Ql=t.return}y=eu,eu=!1}(e,n),yu(n,e),hr(to),qt=!!eo,to=eo=null,e.current=n,mu(n,e,o),Ke(),Eu=u,bt=l,Pu.transition=a}else e.current=n;if(Xu&&(Xu=!1,$u=e,Yu=o),a=e.pendingLanes,0===a&&(Vu=null),function(e){if(it&&"function"===typeof it.onCommitFiberRoot)try{it.onCommitFiberRoot(ot,e,void 0,128===(128&e.current.flags))}catch(t){}}(n.stateNode),nc(e,Qe()),null!==t)for(r=e.onRecoverableError,n=0;n<t.length;n++)o=t[n],r(o.value,{componentStack:o.stack,digest:o.digest});if(Hu)throw Hu=!1,e=qu,qu=null,e;0!==(1&Yu)&&0!==e.tag&&wc(),a=e.pendingLanes,0!==(1&a)?e===Ku?Gu++:(Gu=0,Ku=e):Gu=0,Ho()}(e,t,n,r)}finally{Pu.transition=o,bt=r}return null}function wc(){if(null!==$u){var e=xt(Yu),t=Pu.transition,n=bt;try{if(Pu.transition=null,bt=16>e?16:e,null===$u)var r=!1;else{if(e=$u,$u=null,Yu=0,0!==(6&Eu))throw Error(i(331));var o=Eu;for(Eu|=4,Ql=e.current;null!==Ql;){var a=Ql,l=a.child;if(0!==(16&Ql.flags)){var u=a.deletions;if(null!==u){for(var c=0;c<u.length;c++){var s=u[c];for(Ql=s;null!==Ql;){var f=Ql;switch(f.tag){case 0:case 11:case 15:tu(8,f,a)}var d=f.child;if(null!==d)d.return=f,Ql=d;else for(;null!==Ql;){var p=(f=Ql).sibling,h=f.return;if(ou(f),f===s){Ql=null;break}if(null!==p){p.return=h,Ql=p;break}Ql=h}}}var y=a.alternate;if(null!==y){var v=y.child;if(null!==v){y.child=null;do{var m=v.sibling;v.sibling=null,v=m}while(null!==v)}}Ql=a}}if(0!==(2064&a.subtreeFlags)&&null!==l)l.return=a,Ql=l;else e:for(;null!==Ql;){if(0!==(2048&(a=Ql).flags))switch(a.tag){case 0:case 11:case 15:tu(9,a,a.return)}var g=a.sibling;if(null!==g){g.return=a.return,Ql=g;break e}Ql=a.return}}var b=e.current;for(Ql=b;null!==Ql;){var x=(l=Ql).child;if(0!==(2064&l.subtreeFlags)&&null!==x)x.return=l,Ql=x;else e:for(l=b;null!==Ql;){if(0!==(2048&(u=Ql).flags))try{switch(u.tag){case 0:case 11:case 15:nu(9,u)}}catch(O){Sc(u,u.return,O)}if(u===l){Ql=null;break e}var w=u.sibling;if(null!==w){w.return=u.return,Ql=w;break e}Ql=u.return}}if(Eu=o,Ho(),it&&"function"===typeof it.onPostCommitFiberRoot)try{it.onPostCommitFiberRoot(ot,e)}catch(O){}r=!0}return r}finally{bt=n,Pu.transition=t}}return!1}function Oc(e,t,n){e=Fi(e,t=pl(0,t=cl(n,t),1),1),t=Ju(),null!==e&&(mt(e,1,t),nc(e,t))}function Sc(e,t,n){if(3===e.tag)Oc(e,e,n);else for(;null!==t;){if(3===t.tag){Oc(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Vu||!Vu.has(r))){t=Fi(t,e=hl(t,e=cl(n,e),1),1),e=Ju(),null!==t&&(mt(t,1,e),nc(t,e));break}}t=t.return}}function jc(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=Ju(),e.pingedLanes|=e.suspendedLanes&n,_u===e&&(Au&n)===n&&(4===Nu||3===Nu&&(130023424&Au)===Au&&500>Qe()-Fu?fc(e,0):Ru|=n),nc(e,t)}function kc(e,t){0===t&&(0===(1&e.mode)?t=1:(t=st,0===(130023424&(st<<=1))&&(st=4194304)));var n=Ju();null!==(e=Ii(e,t))&&(mt(e,t,n),nc(e,n))}function Pc(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),kc(e,n)}function Ec(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,o=e.memoizedState;null!==o&&(n=o.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(i(314))}null!==r&&r.delete(t),kc(e,n)}function _c(e,t){return $e(e,t)}function Mc(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ac(e,t,n,r){return new Mc(e,t,n,r)}function Cc(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Tc(e,t){var n=e.alternate;return null===n?((n=Ac(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Nc(e,t,n,r,o,a){var l=2;if(r=e,"function"===typeof e)Cc(e)&&(l=1);else if("string"===typeof e)l=5;else e:switch(e){case S:return Dc(n.children,o,a,t);case j:l=8,o|=8;break;case k:return(e=Ac(12,n,t,2|o)).elementType=k,e.lanes=a,e;case M:return(e=Ac(13,n,t,o)).elementType=M,e.lanes=a,e;case A:return(e=Ac(19,n,t,o)).elementType=A,e.lanes=a,e;case N:return Ic(n,o,a,t);default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case P:l=10;break e;case E:l=9;break e;case _:l=11;break e;case C:l=14;break e;case T:l=16,r=null;break e}throw Error(i(130,null==e?e:typeof e,""))}return(t=Ac(l,n,t,o)).elementType=e,t.type=r,t.lanes=a,t}function Dc(e,t,n,r){return(e=Ac(7,e,r,t)).lanes=n,e}function Ic(e,t,n,r){return(e=Ac(22,e,r,t)).elementType=N,e.lanes=n,e.stateNode={isHidden:!1},e}function zc(e,t,n){return(e=Ac(6,e,null,t)).lanes=n,e}function Rc(e,t,n){return(t=Ac(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Lc(e,t,n,r,o){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=vt(0),this.expirationTimes=vt(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=vt(0),this.identifierPrefix=r,this.onRecoverableError=o,this.mutableSourceEagerHydrationData=null}function Bc(e,t,n,r,o,i,a,l,u){return e=new Lc(e,t,n,l,u),1===t?(t=1,!0===i&&(t|=8)):t=0,i=Ac(3,null,null,t),e.current=i,i.stateNode=e,i.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Ri(i),e}function Fc(e){if(!e)return _o;e:{if(We(e=e._reactInternals)!==e||1!==e.tag)throw Error(i(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(No(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(null!==t);throw Error(i(171))}if(1===e.tag){var n=e.type;if(No(n))return zo(e,n,t)}return t}function Uc(e,t,n,r,o,i,a,l,u){return(e=Bc(n,r,!0,e,0,i,0,l,u)).context=Fc(null),n=e.current,(i=Bi(r=Ju(),o=ec(n))).callback=void 0!==t&&null!==t?t:null,Fi(n,i,o),e.current.lanes=o,mt(e,o,r),nc(e,r),e}function Wc(e,t,n,r){var o=t.current,i=Ju(),a=ec(o);return n=Fc(n),null===t.context?t.context=n:t.pendingContext=n,(t=Bi(i,a)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),null!==(e=Fi(o,t,a))&&(tc(e,o,a,i),Ui(e,o,a)),a}function Hc(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function qc(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Vc(e,t){qc(e,t),(e=e.alternate)&&qc(e,t)}Ou=function(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps||Ao.current)bl=!0;else{if(0===(e.lanes&n)&&0===(128&t.flags))return bl=!1,function(e,t,n){switch(t.tag){case 3:Ml(t),hi();break;case 5:Zi(t);break;case 1:No(t.type)&&Ro(t);break;case 4:Ki(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,o=t.memoizedProps.value;Eo(Si,r._currentValue),r._currentValue=o;break;case 13:if(null!==(r=t.memoizedState))return null!==r.dehydrated?(Eo(ea,1&ea.current),t.flags|=128,null):0!==(n&t.child.childLanes)?zl(e,t,n):(Eo(ea,1&ea.current),null!==(e=Hl(e,t,n))?e.sibling:null);Eo(ea,1&ea.current);break;case 19:if(r=0!==(n&t.childLanes),0!==(128&e.flags)){if(r)return Ul(e,t,n);t.flags|=128}if(null!==(o=t.memoizedState)&&(o.rendering=null,o.tail=null,o.lastEffect=null),Eo(ea,ea.current),r)break;return null;case 22:case 23:return t.lanes=0,jl(e,t,n)}return Hl(e,t,n)}(e,t,n);bl=0!==(131072&e.flags)}else bl=!1,ii&&0!==(1048576&t.flags)&&ei(t,$o,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Wl(e,t),e=t.pendingProps;var o=To(t,Mo.current);Ai(t,n),o=va(null,t,r,e,o,n);var a=ma();return t.flags|=1,"object"===typeof o&&null!==o&&"function"===typeof o.render&&void 0===o.$$typeof?(t.tag=1,t.memoizedState=null,t.updateQueue=null,No(r)?(a=!0,Ro(t)):a=!1,t.memoizedState=null!==o.state&&void 0!==o.state?o.state:null,Ri(t),o.updater=ol,t.stateNode=o,o._reactInternals=t,ul(t,r,e,n),t=_l(null,t,r,!0,a,n)):(t.tag=0,ii&&a&&ti(t),xl(null,t,o,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Wl(e,t),e=t.pendingProps,r=(o=r._init)(r._payload),t.type=r,o=t.tag=function(e){if("function"===typeof e)return Cc(e)?1:0;if(void 0!==e&&null!==e){if((e=e.$$typeof)===_)return 11;if(e===C)return 14}return 2}(r),e=nl(r,e),o){case 0:t=Pl(null,t,r,e,n);break e;case 1:t=El(null,t,r,e,n);break e;case 11:t=wl(null,t,r,e,n);break e;case 14:t=Ol(null,t,r,nl(r.type,e),n);break e}throw Error(i(306,r,""))}return t;case 0:return r=t.type,o=t.pendingProps,Pl(e,t,r,o=t.elementType===r?o:nl(r,o),n);case 1:return r=t.type,o=t.pendingProps,El(e,t,r,o=t.elementType===r?o:nl(r,o),n);case 3:e:{if(Ml(t),null===e)throw Error(i(387));r=t.pendingProps,o=(a=t.memoizedState).element,Li(e,t),Hi(t,r,null,n);var l=t.memoizedState;if(r=l.element,a.isDehydrated){if(a={element:r,isDehydrated:!1,cache:l.cache,pendingSuspenseBoundaries:l.pendingSuspenseBoundaries,transitions:l.transitions},t.updateQueue.baseState=a,t.memoizedState=a,256&t.flags){t=Al(e,t,r,n,o=cl(Error(i(423)),t));break e}if(r!==o){t=Al(e,t,r,n,o=cl(Error(i(424)),t));break e}for(oi=co(t.stateNode.containerInfo.firstChild),ri=t,ii=!0,ai=null,n=Oi(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(hi(),r===o){t=Hl(e,t,n);break e}xl(e,t,r,n)}t=t.child}return t;case 5:return Zi(t),null===e&&si(t),r=t.type,o=t.pendingProps,a=null!==e?e.memoizedProps:null,l=o.children,no(r,o)?l=null:null!==a&&no(r,a)&&(t.flags|=32),kl(e,t),xl(e,t,l,n),t.child;case 6:return null===e&&si(t),null;case 13:return zl(e,t,n);case 4:return Ki(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=wi(t,null,r,n):xl(e,t,r,n),t.child;case 11:return r=t.type,o=t.pendingProps,wl(e,t,r,o=t.elementType===r?o:nl(r,o),n);case 7:return xl(e,t,t.pendingProps,n),t.child;case 8:case 12:return xl(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,o=t.pendingProps,a=t.memoizedProps,l=o.value,Eo(Si,r._currentValue),r._currentValue=l,null!==a)if(lr(a.value,l)){if(a.children===o.children&&!Ao.current){t=Hl(e,t,n);break e}}else for(null!==(a=t.child)&&(a.return=t);null!==a;){var u=a.dependencies;if(null!==u){l=a.child;for(var c=u.firstContext;null!==c;){if(c.context===r){if(1===a.tag){(c=Bi(-1,n&-n)).tag=2;var s=a.updateQueue;if(null!==s){var f=(s=s.shared).pending;null===f?c.next=c:(c.next=f.next,f.next=c),s.pending=c}}a.lanes|=n,null!==(c=a.alternate)&&(c.lanes|=n),Mi(a.return,n,t),u.lanes|=n;break}c=c.next}}else if(10===a.tag)l=a.type===t.type?null:a.child;else if(18===a.tag){if(null===(l=a.return))throw Error(i(341));l.lanes|=n,null!==(u=l.alternate)&&(u.lanes|=n),Mi(l,n,t),l=a.sibling}else l=a.child;if(null!==l)l.return=a;else for(l=a;null!==l;){if(l===t){l=null;break}if(null!==(a=l.sibling)){a.return=l.return,l=a;break}l=l.return}a=l}xl(e,t,o.children,n),t=t.child}return t;case 9:return o=t.type,r=t.pendingProps.children,Ai(t,n),r=r(o=Ci(o)),t.flags|=1,xl(e,t,r,n),t.child;case 14:return o=nl(r=t.type,t.pendingProps),Ol(e,t,r,o=nl(r.type,o),n);case 15:return Sl(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:nl(r,o),Wl(e,t),t.tag=1,No(r)?(e=!0,Ro(t)):e=!1,Ai(t,n),al(t,r,o),ul(t,r,o,n),_l(null,t,r,!0,e,n);case 19:return Ul(e,t,n);case 22:return jl(e,t,n)}throw Error(i(156,t.tag))};var Xc="function"===typeof reportError?reportError:function(e){console.error(e)};function $c(e){this._internalRoot=e}function Yc(e){this._internalRoot=e}function Gc(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Kc(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Qc(){}function Zc(e,t,n,r,o){var i=n._reactRootContainer;if(i){var a=i;if("function"===typeof o){var l=o;o=function(){var e=Hc(a);l.call(e)}}Wc(t,a,e,o)}else a=function(e,t,n,r,o){if(o){if("function"===typeof r){var i=r;r=function(){var e=Hc(a);i.call(e)}}var a=Uc(t,r,e,0,null,!1,0,"",Qc);return e._reactRootContainer=a,e[yo]=a.current,Wr(8===e.nodeType?e.parentNode:e),cc(),a}for(;o=e.lastChild;)e.removeChild(o);if("function"===typeof r){var l=r;r=function(){var e=Hc(u);l.call(e)}}var u=Bc(e,0,!1,null,0,!1,0,"",Qc);return e._reactRootContainer=u,e[yo]=u.current,Wr(8===e.nodeType?e.parentNode:e),cc(function(){Wc(t,u,n,r)}),u}(n,t,e,o,r);return Hc(a)}Yc.prototype.render=$c.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(i(409));Wc(e,t,null,null)},Yc.prototype.unmount=$c.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;cc(function(){Wc(null,e,null,null)}),t[yo]=null}},Yc.prototype.unstable_scheduleHydration=function(e){if(e){var t=jt();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Nt.length&&0!==t&&t<Nt[n].priority;n++);Nt.splice(n,0,e),0===n&&Rt(e)}},wt=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=ft(t.pendingLanes);0!==n&&(gt(t,1|n),nc(t,Qe()),0===(6&Eu)&&(Uu=Qe()+500,Ho()))}break;case 13:cc(function(){var t=Ii(e,1);if(null!==t){var n=Ju();tc(t,e,1,n)}}),Vc(e,1)}},Ot=function(e){if(13===e.tag){var t=Ii(e,134217728);if(null!==t)tc(t,e,134217728,Ju());Vc(e,134217728)}},St=function(e){if(13===e.tag){var t=ec(e),n=Ii(e,t);if(null!==n)tc(n,e,t,Ju());Vc(e,t)}},jt=function(){return bt},kt=function(e,t){var n=bt;try{return bt=e,t()}finally{bt=n}},Oe=function(e,t,n){switch(t){case"input":if(Z(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=Oo(r);if(!o)throw Error(i(90));$(r),Z(r,o)}}}break;case"textarea":ie(e,n);break;case"select":null!=(t=n.value)&&ne(e,!!n.multiple,t,!1)}},_e=uc,Me=cc;var Jc={usingClientEntryPoint:!1,Events:[xo,wo,Oo,Pe,Ee,uc]},es={findFiberByHostInstance:bo,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},ts={bundleType:es.bundleType,version:es.version,rendererPackageName:es.rendererPackageName,rendererConfig:es.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:x.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=Ve(e))?null:e.stateNode},findFiberByHostInstance:es.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var ns=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ns.isDisabled&&ns.supportsFiber)try{ot=ns.inject(ts),it=ns}catch(se){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Jc,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Gc(t))throw Error(i(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:O,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.createRoot=function(e,t){if(!Gc(e))throw Error(i(299));var n=!1,r="",o=Xc;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onRecoverableError&&(o=t.onRecoverableError)),t=Bc(e,1,!1,null,0,n,0,r,o),e[yo]=t.current,Wr(8===e.nodeType?e.parentNode:e),new $c(t)},t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(i(188));throw e=Object.keys(e).join(","),Error(i(268,e))}return e=null===(e=Ve(t))?null:e.stateNode},t.flushSync=function(e){return cc(e)},t.hydrate=function(e,t,n){if(!Kc(t))throw Error(i(200));return Zc(null,e,t,!0,n)},t.hydrateRoot=function(e,t,n){if(!Gc(e))throw Error(i(405));var r=null!=n&&n.hydratedSources||null,o=!1,a="",l=Xc;if(null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(o=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onRecoverableError&&(l=n.onRecoverableError)),t=Uc(t,null,e,1,null!=n?n:null,o,0,a,l),e[yo]=t.current,Wr(e),r)for(e=0;e<r.length;e++)o=(o=(n=r[e])._getVersion)(n._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[n,o]:t.mutableSourceEagerHydrationData.push(n,o);return new Yc(t)},t.render=function(e,t,n){if(!Kc(t))throw Error(i(200));return Zc(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Kc(e))throw Error(i(40));return!!e._reactRootContainer&&(cc(function(){Zc(null,null,e,!1,function(){e._reactRootContainer=null,e[yo]=null})}),!0)},t.unstable_batchedUpdates=uc,t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Kc(n))throw Error(i(200));if(null==e||void 0===e._reactInternals)throw Error(i(38));return Zc(e,t,n,!1,r)},t.version="18.3.1-next-f1338f8080-20240426"},2761(e){e.exports=function(e){return null!=e&&"object"==typeof e}},2777(e,t,n){var r=n(5193),o=n(2761),i=Object.prototype,a=i.hasOwnProperty,l=i.propertyIsEnumerable,u=r(function(){return arguments}())?r:function(e){return o(e)&&a.call(e,"callee")&&!l.call(e,"callee")};e.exports=u},2866(e,t,n){var r=n(2969);e.exports=function(e){return function(t){return r(t,e)}}},2897(e,t,n){var r=n(3693);function o(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}e.exports=function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?o(Object(n),!0).forEach(function(t){r(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):o(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e},e.exports.__esModule=!0,e.exports.default=e.exports},2929(e,t,n){var r=n(6552).Uint8Array;e.exports=r},2949(e){function t(e){var n,r,o="";if("string"==typeof e||"number"==typeof e)o+=e;else if("object"==typeof e)if(Array.isArray(e)){var i=e.length;for(n=0;n<i;n++)e[n]&&(r=t(e[n]))&&(o&&(o+=" "),o+=r)}else for(r in e)e[r]&&(o&&(o+=" "),o+=r);return o}function n(){for(var e,n,r=0,o="",i=arguments.length;r<i;r++)(e=arguments[r])&&(n=t(e))&&(o&&(o+=" "),o+=n);return o}e.exports=n,e.exports.clsx=n},2969(e,t,n){var r=n(5324),o=n(914);e.exports=function(e,t){for(var n=0,i=(t=r(t,e)).length;null!=e&&n<i;)e=e[o(t[n++])];return n&&n==i?e:void 0}},3028(e){e.exports=function(e,t){return function(n){return e(t(n))}}},3097(e,t,n){var r=n(2969);e.exports=function(e,t,n){var o=null==e?void 0:r(e,t);return void 0===o?n:o}},3204(e,t,n){var r=n(3343),o=n(2777),i=n(4052),a=n(4543),l=n(9194),u=n(1268),c=Object.prototype.hasOwnProperty;e.exports=function(e,t){var n=i(e),s=!n&&o(e),f=!n&&!s&&a(e),d=!n&&!s&&!f&&u(e),p=n||s||f||d,h=p?r(e.length,String):[],y=h.length;for(var v in e)!t&&!c.call(e,v)||p&&("length"==v||f&&("offset"==v||"parent"==v)||d&&("buffer"==v||"byteLength"==v||"byteOffset"==v)||l(v,y))||h.push(v);return h}},3211(e){e.exports=function(e,t){return e===t||e!==e&&t!==t}},3218(e){"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},3279(e){e.exports=function(e){return e}},3331(e,t,n){var r=n(9676),o=n(929),i=n(7303);e.exports=function(e){return function(t,n,a){return a&&"number"!=typeof a&&o(t,n,a)&&(n=a=void 0),t=i(t),void 0===n?(n=t,t=0):n=i(n),a=void 0===a?t<n?1:-1:i(a),r(t,n,a,e)}}},3343(e){e.exports=function(e,t){for(var n=-1,r=Array(e);++n<e;)r[n]=t(n);return r}},3366(e,t,n){var r=n(7894),o=n(9057);e.exports=function(e,t){return null!=e&&o(e,t,r)}},3411(e,t,n){var r=n(149),o=n(9096),i=n(8883),a=n(4052);e.exports=function(e,t){return(a(e)?r:i)(e,o(t,3))}},3440(e,t,n){var r=n(6552)["__core-js_shared__"];e.exports=r},3538(e,t,n){var r=n(755),o=n(3411);e.exports=function(e,t){return r(o(e,t),1)}},3668(e,t,n){var r=n(8902),o=n(2587),i=n(8114);e.exports=function(e,t,n,a,l,u){var c=1&n,s=e.length,f=t.length;if(s!=f&&!(c&&f>s))return!1;var d=u.get(e),p=u.get(t);if(d&&p)return d==t&&p==e;var h=-1,y=!0,v=2&n?new r:void 0;for(u.set(e,t),u.set(t,e);++h<s;){var m=e[h],g=t[h];if(a)var b=c?a(g,m,h,t,e,u):a(m,g,h,e,t,u);if(void 0!==b){if(b)continue;y=!1;break}if(v){if(!o(t,function(e,t){if(!i(v,t)&&(m===e||l(m,e,n,a,u)))return v.push(t)})){y=!1;break}}else if(m!==g&&!l(m,g,n,a,u)){y=!1;break}}return u.delete(e),u.delete(t),y}},3693(e,t,n){var r=n(7736);e.exports=function(e,t,n){return(t=r(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e},e.exports.__esModule=!0,e.exports.default=e.exports},3713(e,t,n){var r=n(6140),o=n(1143),i=Object.prototype.hasOwnProperty;e.exports=function(e){if(!r(e))return o(e);var t=[];for(var n in Object(e))i.call(e,n)&&"constructor"!=n&&t.push(n);return t}},3738(e){function t(n){return e.exports=t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},e.exports.__esModule=!0,e.exports.default=e.exports,t(n)}e.exports=t,e.exports.__esModule=!0,e.exports.default=e.exports},3781(e,t,n){var r=n(9417),o=n(8673);e.exports=function(e){for(var t=o(e),n=t.length;n--;){var i=t[n],a=e[i];t[n]=[i,a,r(a)]}return t}},3871(e){e.exports=function(e,t,n){var r=-1,o=e.length;t<0&&(t=-t>o?0:o+t),(n=n>o?o:n)<0&&(n+=o),o=t>n?0:n-t>>>0,t>>>=0;for(var i=Array(o);++r<o;)i[r]=e[r+t];return i}},3892(e){e.exports=function(e){return this.__data__.has(e)}},3932(e,t,n){var r=n(396),o=n(2866),i=n(2597),a=n(914);e.exports=function(e){return i(e)?r(a(e)):o(e)}},3950(e,t,n){var r=n(6686),o=n(4757),i=n(801),a=Math.max,l=Math.min;e.exports=function(e,t,n){var u,c,s,f,d,p,h=0,y=!1,v=!1,m=!0;if("function"!=typeof e)throw new TypeError("Expected a function");function g(t){var n=u,r=c;return u=c=void 0,h=t,f=e.apply(r,n)}function b(e){var n=e-p;return void 0===p||n>=t||n<0||v&&e-h>=s}function x(){var e=o();if(b(e))return w(e);d=setTimeout(x,function(e){var n=t-(e-p);return v?l(n,s-(e-h)):n}(e))}function w(e){return d=void 0,m&&u?g(e):(u=c=void 0,f)}function O(){var e=o(),n=b(e);if(u=arguments,c=this,p=e,n){if(void 0===d)return function(e){return h=e,d=setTimeout(x,t),y?g(e):f}(p);if(v)return clearTimeout(d),d=setTimeout(x,t),g(p)}return void 0===d&&(d=setTimeout(x,t)),f}return t=i(t)||0,r(n)&&(y=!!n.leading,s=(v="maxWait"in n)?a(i(n.maxWait)||0,t):s,m="trailing"in n?!!n.trailing:m),O.cancel=function(){void 0!==d&&clearTimeout(d),h=0,u=p=c=d=void 0},O.flush=function(){return void 0===d?f:w(o())},O}},4020(e){e.exports=function(e,t,n){for(var r=n-1,o=e.length;++r<o;)if(e[r]===t)return r;return-1}},4052(e){var t=Array.isArray;e.exports=t},4065(e){e.exports=function(e){var t=null==e?0:e.length;return t?e[t-1]:void 0}},4079(e,t,n){var r=n(8259),o=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,i=/\\(\\)?/g,a=r(function(e){var t=[];return 46===e.charCodeAt(0)&&t.push(""),e.replace(o,function(e,n,r,o){t.push(r?o.replace(i,"$1"):n||e)}),t});e.exports=a},4160(e){e.exports=function(e){var t=-1,n=Array(e.size);return e.forEach(function(e,r){n[++t]=[r,e]}),n}},4190(e,t,n){var r=n(1340);e.exports=function(e){var t=this.__data__,n=r(t,e);return n<0?void 0:t[n][1]}},4202(e,t){"use strict";var n=Symbol.for("react.element"),r=Symbol.for("react.portal"),o=Symbol.for("react.fragment"),i=Symbol.for("react.strict_mode"),a=Symbol.for("react.profiler"),l=Symbol.for("react.provider"),u=Symbol.for("react.context"),c=Symbol.for("react.forward_ref"),s=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),p=Symbol.iterator;var h={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},y=Object.assign,v={};function m(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||h}function g(){}function b(e,t,n){this.props=e,this.context=t,this.refs=v,this.updater=n||h}m.prototype.isReactComponent={},m.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},m.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},g.prototype=m.prototype;var x=b.prototype=new g;x.constructor=b,y(x,m.prototype),x.isPureReactComponent=!0;var w=Array.isArray,O=Object.prototype.hasOwnProperty,S={current:null},j={key:!0,ref:!0,__self:!0,__source:!0};function k(e,t,r){var o,i={},a=null,l=null;if(null!=t)for(o in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(a=""+t.key),t)O.call(t,o)&&!j.hasOwnProperty(o)&&(i[o]=t[o]);var u=arguments.length-2;if(1===u)i.children=r;else if(1<u){for(var c=Array(u),s=0;s<u;s++)c[s]=arguments[s+2];i.children=c}if(e&&e.defaultProps)for(o in u=e.defaultProps)void 0===i[o]&&(i[o]=u[o]);return{$$typeof:n,type:e,key:a,ref:l,props:i,_owner:S.current}}function P(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var E=/\/+/g;function _(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return t[e]})}(""+e.key):t.toString(36)}function M(e,t,o,i,a){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var u=!1;if(null===e)u=!0;else switch(l){case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case n:case r:u=!0}}if(u)return a=a(u=e),e=""===i?"."+_(u,0):i,w(a)?(o="",null!=e&&(o=e.replace(E,"$&/")+"/"),M(a,t,o,"",function(e){return e})):null!=a&&(P(a)&&(a=function(e,t){return{$$typeof:n,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(a,o+(!a.key||u&&u.key===a.key?"":(""+a.key).replace(E,"$&/")+"/")+e)),t.push(a)),1;if(u=0,i=""===i?".":i+":",w(e))for(var c=0;c<e.length;c++){var s=i+_(l=e[c],c);u+=M(l,t,o,s,a)}else if(s=function(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=p&&e[p]||e["@@iterator"])?e:null}(e),"function"===typeof s)for(e=s.call(e),c=0;!(l=e.next()).done;)u+=M(l=l.value,t,o,s=i+_(l,c++),a);else if("object"===l)throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return u}function A(e,t,n){if(null==e)return e;var r=[],o=0;return M(e,r,"","",function(e){return t.call(n,e,o++)}),r}function C(e){if(-1===e._status){var t=e._result;(t=t()).then(function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)},function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)}),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var T={current:null},N={transition:null},D={ReactCurrentDispatcher:T,ReactCurrentBatchConfig:N,ReactCurrentOwner:S};function I(){throw Error("act(...) is not supported in production builds of React.")}t.Children={map:A,forEach:function(e,t,n){A(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return A(e,function(){t++}),t},toArray:function(e){return A(e,function(e){return e})||[]},only:function(e){if(!P(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=m,t.Fragment=o,t.Profiler=a,t.PureComponent=b,t.StrictMode=i,t.Suspense=s,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=D,t.act=I,t.cloneElement=function(e,t,r){if(null===e||void 0===e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var o=y({},e.props),i=e.key,a=e.ref,l=e._owner;if(null!=t){if(void 0!==t.ref&&(a=t.ref,l=S.current),void 0!==t.key&&(i=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(c in t)O.call(t,c)&&!j.hasOwnProperty(c)&&(o[c]=void 0===t[c]&&void 0!==u?u[c]:t[c])}var c=arguments.length-2;if(1===c)o.children=r;else if(1<c){u=Array(c);for(var s=0;s<c;s++)u[s]=arguments[s+2];o.children=u}return{$$typeof:n,type:e.type,key:i,ref:a,props:o,_owner:l}},t.createContext=function(e){return(e={$$typeof:u,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:l,_context:e},e.Consumer=e},t.createElement=k,t.createFactory=function(e){var t=k.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:c,render:e}},t.isValidElement=P,t.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:C}},t.memo=function(e,t){return{$$typeof:f,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=N.transition;N.transition={};try{e()}finally{N.transition=t}},t.unstable_act=I,t.useCallback=function(e,t){return T.current.useCallback(e,t)},t.useContext=function(e){return T.current.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e){return T.current.useDeferredValue(e)},t.useEffect=function(e,t){return T.current.useEffect(e,t)},t.useId=function(){return T.current.useId()},t.useImperativeHandle=function(e,t,n){return T.current.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return T.current.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return T.current.useLayoutEffect(e,t)},t.useMemo=function(e,t){return T.current.useMemo(e,t)},t.useReducer=function(e,t,n){return T.current.useReducer(e,t,n)},t.useRef=function(e){return T.current.useRef(e)},t.useState=function(e){return T.current.useState(e)},t.useSyncExternalStore=function(e,t,n){return T.current.useSyncExternalStore(e,t,n)},t.useTransition=function(){return T.current.useTransition()},t.version="18.3.1"},4258(e,t,n){var r=n(5906)();e.exports=r},4262(e,t,n){var r=n(8895),o=n(4052);e.exports=function(e,t,n){var i=t(e);return o(e)?i:r(i,n(e))}},4391(e,t,n){"use strict";var r=n(7950);t.createRoot=r.createRoot,t.hydrateRoot=r.hydrateRoot},4416(e,t,n){var r=n(8902),o=n(5866),i=n(1558),a=n(8114),l=n(8182),u=n(2074);e.exports=function(e,t,n){var c=-1,s=o,f=e.length,d=!0,p=[],h=p;if(n)d=!1,s=i;else if(f>=200){var y=t?null:l(e);if(y)return u(y);d=!1,s=a,h=new r}else h=t?[]:p;e:for(;++c<f;){var v=e[c],m=t?t(v):v;if(v=n||0!==v?v:0,d&&m===m){for(var g=h.length;g--;)if(h[g]===m)continue e;t&&h.push(m),p.push(v)}else s(h,m,n)||(h!==p&&h.push(m),p.push(v))}return p}},4543(e,t,n){e=n.nmd(e);var r=n(6552),o=n(14),i=t&&!t.nodeType&&t,a=i&&e&&!e.nodeType&&e,l=a&&a.exports===i?r.Buffer:void 0,u=(l?l.isBuffer:void 0)||o;e.exports=u},4545(e,t,n){var r=n(7160);e.exports=function(){this.__data__=new r,this.size=0}},4552(e,t,n){var r=n(9812),o=Object.prototype,i=o.hasOwnProperty,a=o.toString,l=r?r.toStringTag:void 0;e.exports=function(e){var t=i.call(e,l),n=e[l];try{e[l]=void 0;var r=!0}catch(u){}var o=a.call(e);return r&&(t?e[l]=n:delete e[l]),o}},4597(e,t,n){var r=n(2587),o=n(9096),i=n(2165),a=n(4052),l=n(929);e.exports=function(e,t,n){var u=a(e)?r:i;return n&&l(e,t,n)&&(t=void 0),u(e,o(t,3))}},4657(e){e.exports=function(e,t){return null==e?void 0:e[t]}},4664(e,t,n){var r=n(4258),o=n(8673);e.exports=function(e,t){return e&&r(e,t,o)}},4746(e,t,n){var r=n(5652);e.exports=function(e,t){var n=!0;return r(e,function(e,r,o){return n=!!t(e,r,o)}),n}},4757(e,t,n){var r=n(6552);e.exports=function(){return r.Date.now()}},4816(e,t,n){var r=n(7251),o=n(7159),i=n(438),a=n(9394),l=n(6874);function u(e){var t=-1,n=null==e?0:e.length;for(this.clear();++t<n;){var r=e[t];this.set(r[0],r[1])}}u.prototype.clear=r,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=l,e.exports=u},4893(e){e.exports=function(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n},e.exports.__esModule=!0,e.exports.default=e.exports},5003(e,t,n){"use strict";e.exports=function(){throw new Error("Don't instantiate Resizable directly! Use require('react-resizable').Resizable")},e.exports.Resizable=n(6325).default,e.exports.ResizableBox=n(7276).default},5029(e,t,n){var r=n(6989),o=n(3097),i=n(3366),a=n(2597),l=n(9417),u=n(1310),c=n(914);e.exports=function(e,t){return a(e)&&l(t)?u(c(e),t):function(n){var a=o(n,e);return void 0===a&&a===t?i(n,e):r(t,a,3)}}},5043(e,t,n){"use strict";e.exports=n(4202)},5051(e){e.exports=function(e){var t=this.has(e)&&delete this.__data__[e];return this.size-=t?1:0,t}},5173(e,t,n){e.exports=n(1497)()},5193(e,t,n){var r=n(6913),o=n(2761);e.exports=function(e){return o(e)&&"[object Arguments]"==r(e)}},5204(e,t,n){var r=n(7937)(n(6552),"Map");e.exports=r},5268(e,t,n){var r=n(9160);e.exports=function(e){return r(e)&&e!=+e}},5295(e){e.exports=function(e,t){for(var n=-1,r=null==e?0:e.length;++n<r;)if(!t(e[n],n,e))return!1;return!0}},5324(e,t,n){var r=n(4052),o=n(2597),i=n(4079),a=n(1069);e.exports=function(e,t){return r(e)?e:o(e,t)?[e]:i(a(e))}},5387(e,t,n){var r=n(7937)(n(6552),"Promise");e.exports=r},5394(e,t,n){"use strict";t.__esModule=!0,t.resizableProps=void 0;var r,o=(r=n(5173))&&r.__esModule?r:{default:r};n(1929);var i={axis:o.default.oneOf(["both","x","y","none"]),className:o.default.string,children:o.default.element.isRequired,draggableOpts:o.default.shape({allowAnyClick:o.default.bool,cancel:o.default.string,children:o.default.node,disabled:o.default.bool,enableUserSelectHack:o.default.bool,offsetParent:o.default.node,grid:o.default.arrayOf(o.default.number),handle:o.default.string,nodeRef:o.default.object,onStart:o.default.func,onDrag:o.default.func,onStop:o.default.func,onMouseDown:o.default.func,scale:o.default.number}),height:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r,i=t[0];return"both"===i.axis||"y"===i.axis?(r=o.default.number).isRequired.apply(r,t):o.default.number.apply(o.default,t)},handle:o.default.oneOfType([o.default.node,o.default.func]),handleSize:o.default.arrayOf(o.default.number),lockAspectRatio:o.default.bool,maxConstraints:o.default.arrayOf(o.default.number),minConstraints:o.default.arrayOf(o.default.number),onResizeStop:o.default.func,onResizeStart:o.default.func,onResize:o.default.func,resizeHandles:o.default.arrayOf(o.default.oneOf(["s","w","e","n","sw","nw","se","ne"])),transformScale:o.default.number,width:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r,i=t[0];return"both"===i.axis||"x"===i.axis?(r=o.default.number).isRequired.apply(r,t):o.default.number.apply(o.default,t)}};t.resizableProps=i},5428(e,t,n){var r=n(6913),o=n(6173),i=n(2761),a={};a["[object Float32Array]"]=a["[object Float64Array]"]=a["[object Int8Array]"]=a["[object Int16Array]"]=a["[object Int32Array]"]=a["[object Uint8Array]"]=a["[object Uint8ClampedArray]"]=a["[object Uint16Array]"]=a["[object Uint32Array]"]=!0,a["[object Arguments]"]=a["[object Array]"]=a["[object ArrayBuffer]"]=a["[object Boolean]"]=a["[object DataView]"]=a["[object Date]"]=a["[object Error]"]=a["[object Function]"]=a["[object Map]"]=a["[object Number]"]=a["[object Object]"]=a["[object RegExp]"]=a["[object Set]"]=a["[object String]"]=a["[object WeakMap]"]=!1,e.exports=function(e){return i(e)&&o(e.length)&&!!a[r(e)]}},5538(e,t,n){var r=n(7160),o=n(4545),i=n(793),a=n(7760),l=n(3892),u=n(6788);function c(e){var t=this.__data__=new r(e);this.size=t.size}c.prototype.clear=o,c.prototype.delete=i,c.prototype.get=a,c.prototype.has=l,c.prototype.set=u,e.exports=c},5575(e,t,n){var r=n(7937)(Object,"create");e.exports=r},5636(e,t,n){var r=n(1170),o=Math.max;e.exports=function(e,t,n){return t=o(void 0===t?e.length-1:t,0),function(){for(var i=arguments,a=-1,l=o(i.length-t,0),u=Array(l);++a<l;)u[a]=i[t+a];a=-1;for(var c=Array(t+1);++a<t;)c[a]=i[a];return c[t]=n(u),r(e,this,c)}}},5647(e,t,n){var r=n(3279),o=n(5636),i=n(6350);e.exports=function(e,t){return i(o(e,t,r),e+"")}},5652(e,t,n){var r=n(4664),o=n(6516)(r);e.exports=o},5654(e,t,n){var r=n(7937),o=function(){try{var e=r(Object,"defineProperty");return e({},"",{}),e}catch(t){}}();e.exports=o},5713(e){e.exports=function(){}},5752(e,t,n){var r=n(9395),o=Object.prototype.hasOwnProperty;e.exports=function(e,t,n,i,a,l){var u=1&n,c=r(e),s=c.length;if(s!=r(t).length&&!u)return!1;for(var f=s;f--;){var d=c[f];if(!(u?d in t:o.call(t,d)))return!1}var p=l.get(e),h=l.get(t);if(p&&h)return p==t&&h==e;var y=!0;l.set(e,t),l.set(t,e);for(var v=u;++f<s;){var m=e[d=c[f]],g=t[d];if(i)var b=u?i(g,m,d,t,e,l):i(m,g,d,e,t,l);if(!(void 0===b?m===g||a(m,g,n,i,l):b)){y=!1;break}v||(v="constructor"==d)}if(y&&!v){var x=e.constructor,w=t.constructor;x==w||!("constructor"in e)||!("constructor"in t)||"function"==typeof x&&x instanceof x&&"function"==typeof w&&w instanceof w||(y=!1)}return l.delete(e),l.delete(t),y}},5769(e,t,n){"use strict";t.__esModule=!0,t.cloneElement=function(e,t){t.style&&e.props.style&&(t.style=a(a({},e.props.style),t.style));t.className&&e.props.className&&(t.className=e.props.className+" "+t.className);return o.default.cloneElement(e,t)};var r,o=(r=n(5043))&&r.__esModule?r:{default:r};function i(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function a(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?i(Object(n),!0).forEach(function(t){l(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):i(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function l(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==typeof e||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==typeof r)return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===typeof t?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}},5797(e,t,n){var r=n(4816);function o(e,t){if("function"!=typeof e||null!=t&&"function"!=typeof t)throw new TypeError("Expected a function");var n=function(){var r=arguments,o=t?t.apply(this,r):r[0],i=n.cache;if(i.has(o))return i.get(o);var a=e.apply(this,r);return n.cache=i.set(o,a)||i,a};return n.cache=new(o.Cache||r),n}o.Cache=r,e.exports=o},5816(e){e.exports=function(e,t,n,r){for(var o=e.length,i=n+(r?1:-1);r?i--:++i<o;)if(t(e[i],i,e))return i;return-1}},5866(e,t,n){var r=n(8468);e.exports=function(e,t){return!!(null==e?0:e.length)&&r(e,t,0)>-1}},5893(e,t,n){var r=n(6599);e.exports=function(e,t,n){for(var o=-1,i=e.criteria,a=t.criteria,l=i.length,u=n.length;++o<l;){var c=r(i[o],a[o]);if(c)return o>=u?c:c*("desc"==n[o]?-1:1)}return e.index-t.index}},5906(e){e.exports=function(e){return function(t,n,r){for(var o=-1,i=Object(t),a=r(t),l=a.length;l--;){var u=a[e?l:++o];if(!1===n(i[u],u,i))break}return t}}},5967(e){e.exports=function(e){return e.split("")}},5990(e,t,n){var r=n(3028)(Object.getPrototypeOf,Object);e.exports=r},6095(e){var t=Object.prototype.toString;e.exports=function(e){return t.call(e)}},6140(e){var t=Object.prototype;e.exports=function(e){var n=e&&e.constructor;return e===("function"==typeof n&&n.prototype||t)}},6173(e){e.exports=function(e){return"number"==typeof e&&e>-1&&e%1==0&&e<=9007199254740991}},6179(e){e.exports=function(e){return this.__data__.set(e,"__lodash_hash_undefined__"),this}},6311(e){var t=RegExp("[\\u200d\\ud800-\\udfff\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff\\ufe0e\\ufe0f]");e.exports=function(e){return t.test(e)}},6325(e,t,n){"use strict";t.__esModule=!0,t.default=void 0;var r=function(e,t){if(!t&&e&&e.__esModule)return e;if(null===e||"object"!==typeof e&&"function"!==typeof e)return{default:e};var n=u(t);if(n&&n.has(e))return n.get(e);var r={},o=Object.defineProperty&&Object.getOwnPropertyDescriptor;for(var i in e)if("default"!==i&&Object.prototype.hasOwnProperty.call(e,i)){var a=o?Object.getOwnPropertyDescriptor(e,i):null;a&&(a.get||a.set)?Object.defineProperty(r,i,a):r[i]=e[i]}r.default=e,n&&n.set(e,r);return r}(n(5043)),o=n(1929),i=n(5769),a=n(5394),l=["children","className","draggableOpts","width","height","handle","handleSize","lockAspectRatio","axis","minConstraints","maxConstraints","onResize","onResizeStop","onResizeStart","resizeHandles","transformScale"];function u(e){if("function"!==typeof WeakMap)return null;var t=new WeakMap,n=new WeakMap;return(u=function(e){return e?n:t})(e)}function c(){return c=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},c.apply(this,arguments)}function s(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function f(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?s(Object(n),!0).forEach(function(t){d(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):s(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function d(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==typeof e||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==typeof r)return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===typeof t?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function p(e,t){return p=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},p(e,t)}var h=function(e){var t,n;function a(){for(var t,n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return(t=e.call.apply(e,[this].concat(r))||this).handleRefs={},t.lastHandleRect=null,t.slack=null,t}n=e,(t=a).prototype=Object.create(n.prototype),t.prototype.constructor=t,p(t,n);var u=a.prototype;return u.componentWillUnmount=function(){this.resetData()},u.resetData=function(){this.lastHandleRect=this.slack=null},u.runConstraints=function(e,t){var n=this.props,r=n.minConstraints,o=n.maxConstraints,i=n.lockAspectRatio;if(!r&&!o&&!i)return[e,t];if(i){var a=this.props.width/this.props.height,l=e-this.props.width,u=t-this.props.height;Math.abs(l)>Math.abs(u*a)?t=e/a:e=t*a}var c=e,s=t,f=this.slack||[0,0],d=f[0],p=f[1];return e+=d,t+=p,r&&(e=Math.max(r[0],e),t=Math.max(r[1],t)),o&&(e=Math.min(o[0],e),t=Math.min(o[1],t)),this.slack=[d+(c-e),p+(s-t)],[e,t]},u.resizeHandler=function(e,t){var n=this;return function(r,o){var i=o.node,a=o.deltaX,l=o.deltaY;"onResizeStart"===e&&n.resetData();var u=("both"===n.props.axis||"x"===n.props.axis)&&"n"!==t&&"s"!==t,c=("both"===n.props.axis||"y"===n.props.axis)&&"e"!==t&&"w"!==t;if(u||c){var s=t[0],f=t[t.length-1],d=i.getBoundingClientRect();if(null!=n.lastHandleRect){if("w"===f)a+=d.left-n.lastHandleRect.left;if("n"===s)l+=d.top-n.lastHandleRect.top}n.lastHandleRect=d,"w"===f&&(a=-a),"n"===s&&(l=-l);var p=n.props.width+(u?a/n.props.transformScale:0),h=n.props.height+(c?l/n.props.transformScale:0),y=n.runConstraints(p,h);p=y[0],h=y[1];var v=p!==n.props.width||h!==n.props.height,m="function"===typeof n.props[e]?n.props[e]:null;m&&!("onResize"===e&&!v)&&(null==r.persist||r.persist(),m(r,{node:i,size:{width:p,height:h},handle:t})),"onResizeStop"===e&&n.resetData()}}},u.renderResizeHandle=function(e,t){var n=this.props.handle;if(!n)return r.createElement("span",{className:"react-resizable-handle react-resizable-handle-"+e,ref:t});if("function"===typeof n)return n(e,t);var o=f({ref:t},"string"===typeof n.type?{}:{handleAxis:e});return r.cloneElement(n,o)},u.render=function(){var e=this,t=this.props,n=t.children,a=t.className,u=t.draggableOpts,s=(t.width,t.height,t.handle,t.handleSize,t.lockAspectRatio,t.axis,t.minConstraints,t.maxConstraints,t.onResize,t.onResizeStop,t.onResizeStart,t.resizeHandles),d=(t.transformScale,function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(t,l));return(0,i.cloneElement)(n,f(f({},d),{},{className:(a?a+" ":"")+"react-resizable",children:[].concat(n.props.children,s.map(function(t){var n,i=null!=(n=e.handleRefs[t])?n:e.handleRefs[t]=r.createRef();return r.createElement(o.DraggableCore,c({},u,{nodeRef:i,key:"resizableHandle-"+t,onStop:e.resizeHandler("onResizeStop",t),onStart:e.resizeHandler("onResizeStart",t),onDrag:e.resizeHandler("onResize",t)}),e.renderResizeHandle(t,i))}))}))},a}(r.Component);t.default=h,h.propTypes=a.resizableProps,h.defaultProps={axis:"both",handleSize:[20,20],lockAspectRatio:!1,minConstraints:[20,20],maxConstraints:[1/0,1/0],resizeHandles:["se"],transformScale:1}},6350(e,t,n){var r=n(8325),o=n(6578)(r);e.exports=o},6361(e,t,n){var r=n(6913),o=n(2761);e.exports=function(e){return!0===e||!1===e||o(e)&&"[object Boolean]"==r(e)}},6378(e,t){"use strict";var n,r=Symbol.for("react.element"),o=Symbol.for("react.portal"),i=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),l=Symbol.for("react.profiler"),u=Symbol.for("react.provider"),c=Symbol.for("react.context"),s=Symbol.for("react.server_context"),f=Symbol.for("react.forward_ref"),d=Symbol.for("react.suspense"),p=Symbol.for("react.suspense_list"),h=Symbol.for("react.memo"),y=Symbol.for("react.lazy"),v=Symbol.for("react.offscreen");function m(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case i:case l:case a:case d:case p:return e;default:switch(e=e&&e.$$typeof){case s:case c:case f:case y:case h:case u:return e;default:return t}}case o:return t}}}n=Symbol.for("react.module.reference"),t.isFragment=function(e){return m(e)===i}},6399(e,t,n){var r=n(5538),o=n(3668),i=n(9987),a=n(5752),l=n(6924),u=n(4052),c=n(4543),s=n(1268),f="[object Arguments]",d="[object Array]",p="[object Object]",h=Object.prototype.hasOwnProperty;e.exports=function(e,t,n,y,v,m){var g=u(e),b=u(t),x=g?d:l(e),w=b?d:l(t),O=(x=x==f?p:x)==p,S=(w=w==f?p:w)==p,j=x==w;if(j&&c(e)){if(!c(t))return!1;g=!0,O=!1}if(j&&!O)return m||(m=new r),g||s(e)?o(e,t,n,y,v,m):i(e,t,x,n,y,v,m);if(!(1&n)){var k=O&&h.call(e,"__wrapped__"),P=S&&h.call(t,"__wrapped__");if(k||P){var E=k?e.value():e,_=P?t.value():t;return m||(m=new r),v(E,_,n,y,m)}}return!!j&&(m||(m=new r),a(e,t,n,y,v,m))}},6516(e,t,n){var r=n(6571);e.exports=function(e,t){return function(n,o){if(null==n)return n;if(!r(n))return e(n,o);for(var i=n.length,a=t?i:-1,l=Object(n);(t?a--:++a<i)&&!1!==o(l[a],a,l););return n}}},6532(e,t,n){var r=n(5538),o=n(6989);e.exports=function(e,t,n,i){var a=n.length,l=a,u=!i;if(null==e)return!l;for(e=Object(e);a--;){var c=n[a];if(u&&c[2]?c[1]!==e[c[0]]:!(c[0]in e))return!1}for(;++a<l;){var s=(c=n[a])[0],f=e[s],d=c[1];if(u&&c[2]){if(void 0===f&&!(s in e))return!1}else{var p=new r;if(i)var h=i(f,d,s,e,t,p);if(!(void 0===h?o(d,f,3,i,p):h))return!1}}return!0}},6552(e,t,n){var r=n(7105),o="object"==typeof self&&self&&self.Object===Object&&self,i=r||o||Function("return this")();e.exports=i},6571(e,t,n){var r=n(1629),o=n(6173);e.exports=function(e){return null!=e&&o(e.length)&&!r(e)}},6578(e){var t=Date.now;e.exports=function(e){var n=0,r=0;return function(){var o=t(),i=16-(o-r);if(r=o,i>0){if(++n>=800)return arguments[0]}else n=0;return e.apply(void 0,arguments)}}},6599(e,t,n){var r=n(9841);e.exports=function(e,t){if(e!==t){var n=void 0!==e,o=null===e,i=e===e,a=r(e),l=void 0!==t,u=null===t,c=t===t,s=r(t);if(!u&&!s&&!a&&e>t||a&&l&&c&&!u&&!s||o&&l&&c||!n&&c||!i)return 1;if(!o&&!a&&!s&&e<t||s&&n&&i&&!o&&!a||u&&n&&i||!l&&i||!c)return-1}return 0}},6600(e,t,n){var r=n(7937)(n(6552),"WeakMap");e.exports=r},6604(e,t,n){var r=n(3331)();e.exports=r},6686(e){e.exports=function(e){var t=typeof e;return null!=e&&("object"==t||"function"==t)}},6704(e){e.exports=function(e){return this.__data__.has(e)}},6745(e,t,n){var r=n(9742),o=n(61),i=n(3279);e.exports=function(e){return e&&e.length?r(e,i,o):void 0}},6788(e,t,n){var r=n(7160),o=n(5204),i=n(4816);e.exports=function(e,t){var n=this.__data__;if(n instanceof r){var a=n.__data__;if(!o||a.length<199)return a.push([e,t]),this.size=++n.size,this;n=this.__data__=new i(a)}return n.set(e,t),this.size=n.size,this}},6832(e,t,n){e=n.nmd(e);var r=n(7105),o=t&&!t.nodeType&&t,i=o&&e&&!e.nodeType&&e,a=i&&i.exports===o&&r.process,l=function(){try{var e=i&&i.require&&i.require("util").types;return e||a&&a.binding&&a.binding("util")}catch(t){}}();e.exports=l},6874(e,t,n){var r=n(2622);e.exports=function(e,t){var n=r(this,e),o=n.size;return n.set(e,t),this.size+=n.size==o?0:1,this}},6913(e,t,n){var r=n(9812),o=n(4552),i=n(6095),a=r?r.toStringTag:void 0;e.exports=function(e){return null==e?void 0===e?"[object Undefined]":"[object Null]":a&&a in Object(e)?o(e):i(e)}},6924(e,t,n){var r=n(7685),o=n(5204),i=n(5387),a=n(2070),l=n(6600),u=n(6913),c=n(6996),s="[object Map]",f="[object Promise]",d="[object Set]",p="[object WeakMap]",h="[object DataView]",y=c(r),v=c(o),m=c(i),g=c(a),b=c(l),x=u;(r&&x(new r(new ArrayBuffer(1)))!=h||o&&x(new o)!=s||i&&x(i.resolve())!=f||a&&x(new a)!=d||l&&x(new l)!=p)&&(x=function(e){var t=u(e),n="[object Object]"==t?e.constructor:void 0,r=n?c(n):"";if(r)switch(r){case y:return h;case v:return s;case m:return f;case g:return d;case b:return p}return t}),e.exports=x},6954(e,t,n){var r=n(1629),o=n(7857),i=n(6686),a=n(6996),l=/^\[object .+?Constructor\]$/,u=Function.prototype,c=Object.prototype,s=u.toString,f=c.hasOwnProperty,d=RegExp("^"+s.call(f).replace(/[\\^$.*+?()[\]{}|]/g,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");e.exports=function(e){return!(!i(e)||o(e))&&(r(e)?d:l).test(a(e))}},6989(e,t,n){var r=n(6399),o=n(2761);e.exports=function e(t,n,i,a,l){return t===n||(null==t||null==n||!o(t)&&!o(n)?t!==t&&n!==n:r(t,n,i,a,e,l))}},6996(e){var t=Function.prototype.toString;e.exports=function(e){if(null!=e){try{return t.call(e)}catch(n){}try{return e+""}catch(n){}}return""}},7002(e,t,n){var r=n(5295),o=n(4746),i=n(9096),a=n(4052),l=n(929);e.exports=function(e,t,n){var u=a(e)?r:o;return n&&l(e,t,n)&&(t=void 0),u(e,i(t,3))}},7105(e,t,n){var r="object"==typeof n.g&&n.g&&n.g.Object===Object&&n.g;e.exports=r},7116(e,t,n){var r=n(9812),o=n(2777),i=n(4052),a=r?r.isConcatSpreadable:void 0;e.exports=function(e){return i(e)||o(e)||!!(a&&e&&e[a])}},7159(e,t,n){var r=n(2622);e.exports=function(e){var t=r(this,e).delete(e);return this.size-=t?1:0,t}},7160(e,t,n){var r=n(7563),o=n(9935),i=n(4190),a=n(1946),l=n(1714);function u(e){var t=-1,n=null==e?0:e.length;for(this.clear();++t<n;){var r=e[t];this.set(r[0],r[1])}}u.prototype.clear=r,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=l,e.exports=u},7234(e,t){"use strict";function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,o=e[r];if(!(0<i(o,t)))break e;e[r]=t,e[n]=o,n=r}}function r(e){return 0===e.length?null:e[0]}function o(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,o=e.length,a=o>>>1;r<a;){var l=2*(r+1)-1,u=e[l],c=l+1,s=e[c];if(0>i(u,n))c<o&&0>i(s,u)?(e[r]=s,e[c]=n,r=c):(e[r]=u,e[l]=n,r=l);else{if(!(c<o&&0>i(s,n)))break e;e[r]=s,e[c]=n,r=c}}}return t}function i(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if("object"===typeof performance&&"function"===typeof performance.now){var a=performance;t.unstable_now=function(){return a.now()}}else{var l=Date,u=l.now();t.unstable_now=function(){return l.now()-u}}var c=[],s=[],f=1,d=null,p=3,h=!1,y=!1,v=!1,m="function"===typeof setTimeout?setTimeout:null,g="function"===typeof clearTimeout?clearTimeout:null,b="undefined"!==typeof setImmediate?setImmediate:null;function x(e){for(var t=r(s);null!==t;){if(null===t.callback)o(s);else{if(!(t.startTime<=e))break;o(s),t.sortIndex=t.expirationTime,n(c,t)}t=r(s)}}function w(e){if(v=!1,x(e),!y)if(null!==r(c))y=!0,N(O);else{var t=r(s);null!==t&&D(w,t.startTime-e)}}function O(e,n){y=!1,v&&(v=!1,g(P),P=-1),h=!0;var i=p;try{for(x(n),d=r(c);null!==d&&(!(d.expirationTime>n)||e&&!M());){var a=d.callback;if("function"===typeof a){d.callback=null,p=d.priorityLevel;var l=a(d.expirationTime<=n);n=t.unstable_now(),"function"===typeof l?d.callback=l:d===r(c)&&o(c),x(n)}else o(c);d=r(c)}if(null!==d)var u=!0;else{var f=r(s);null!==f&&D(w,f.startTime-n),u=!1}return u}finally{d=null,p=i,h=!1}}"undefined"!==typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var S,j=!1,k=null,P=-1,E=5,_=-1;function M(){return!(t.unstable_now()-_<E)}function A(){if(null!==k){var e=t.unstable_now();_=e;var n=!0;try{n=k(!0,e)}finally{n?S():(j=!1,k=null)}}else j=!1}if("function"===typeof b)S=function(){b(A)};else if("undefined"!==typeof MessageChannel){var C=new MessageChannel,T=C.port2;C.port1.onmessage=A,S=function(){T.postMessage(null)}}else S=function(){m(A,0)};function N(e){k=e,j||(j=!0,S())}function D(e,n){P=m(function(){e(t.unstable_now())},n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){y||h||(y=!0,N(O))},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):E=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return p},t.unstable_getFirstCallbackNode=function(){return r(c)},t.unstable_next=function(e){switch(p){case 1:case 2:case 3:var t=3;break;default:t=p}var n=p;p=t;try{return e()}finally{p=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=function(){},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=p;p=e;try{return t()}finally{p=n}},t.unstable_scheduleCallback=function(e,o,i){var a=t.unstable_now();switch("object"===typeof i&&null!==i?i="number"===typeof(i=i.delay)&&0<i?a+i:a:i=a,e){case 1:var l=-1;break;case 2:l=250;break;case 5:l=1073741823;break;case 4:l=1e4;break;default:l=5e3}return e={id:f++,callback:o,priorityLevel:e,startTime:i,expirationTime:l=i+l,sortIndex:-1},i>a?(e.sortIndex=i,n(s,e),null===r(c)&&e===r(s)&&(v?(g(P),P=-1):v=!0,D(w,i-a))):(e.sortIndex=l,n(c,e),y||h||(y=!0,N(O))),e},t.unstable_shouldYield=M,t.unstable_wrapCallback=function(e){var t=p;return function(){var n=p;p=t;try{return e.apply(this,arguments)}finally{p=n}}}},7251(e,t,n){var r=n(8724),o=n(7160),i=n(5204);e.exports=function(){this.size=0,this.__data__={hash:new r,map:new(i||o),string:new r}}},7276(e,t,n){"use strict";t.default=void 0;var r=function(e,t){if(!t&&e&&e.__esModule)return e;if(null===e||"object"!==typeof e&&"function"!==typeof e)return{default:e};var n=c(t);if(n&&n.has(e))return n.get(e);var r={},o=Object.defineProperty&&Object.getOwnPropertyDescriptor;for(var i in e)if("default"!==i&&Object.prototype.hasOwnProperty.call(e,i)){var a=o?Object.getOwnPropertyDescriptor(e,i):null;a&&(a.get||a.set)?Object.defineProperty(r,i,a):r[i]=e[i]}r.default=e,n&&n.set(e,r);return r}(n(5043)),o=u(n(5173)),i=u(n(6325)),a=n(5394),l=["handle","handleSize","onResize","onResizeStart","onResizeStop","draggableOpts","minConstraints","maxConstraints","lockAspectRatio","axis","width","height","resizeHandles","style","transformScale"];function u(e){return e&&e.__esModule?e:{default:e}}function c(e){if("function"!==typeof WeakMap)return null;var t=new WeakMap,n=new WeakMap;return(c=function(e){return e?n:t})(e)}function s(){return s=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},s.apply(this,arguments)}function f(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function d(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?f(Object(n),!0).forEach(function(t){p(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):f(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function p(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==typeof e||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==typeof r)return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===typeof t?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function h(e,t){return h=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},h(e,t)}var y=function(e){var t,n;function o(){for(var t,n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return(t=e.call.apply(e,[this].concat(r))||this).state={width:t.props.width,height:t.props.height,propsWidth:t.props.width,propsHeight:t.props.height},t.onResize=function(e,n){var r=n.size;t.props.onResize?(null==e.persist||e.persist(),t.setState(r,function(){return t.props.onResize&&t.props.onResize(e,n)})):t.setState(r)},t}return n=e,(t=o).prototype=Object.create(n.prototype),t.prototype.constructor=t,h(t,n),o.getDerivedStateFromProps=function(e,t){return t.propsWidth!==e.width||t.propsHeight!==e.height?{width:e.width,height:e.height,propsWidth:e.width,propsHeight:e.height}:null},o.prototype.render=function(){var e=this.props,t=e.handle,n=e.handleSize,o=(e.onResize,e.onResizeStart),a=e.onResizeStop,u=e.draggableOpts,c=e.minConstraints,f=e.maxConstraints,p=e.lockAspectRatio,h=e.axis,y=(e.width,e.height,e.resizeHandles),v=e.style,m=e.transformScale,g=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,l);return r.createElement(i.default,{axis:h,draggableOpts:u,handle:t,handleSize:n,height:this.state.height,lockAspectRatio:p,maxConstraints:f,minConstraints:c,onResizeStart:o,onResize:this.onResize,onResizeStop:a,resizeHandles:y,transformScale:m,width:this.state.width},r.createElement("div",s({},g,{style:d(d({},v),{},{width:this.state.width+"px",height:this.state.height+"px"})})))},o}(r.Component);t.default=y,y.propTypes=d(d({},a.resizableProps),{},{children:o.default.element})},7283(e){"use strict";var t=Object.prototype.hasOwnProperty,n="~";function r(){}function o(e,t,n){this.fn=e,this.context=t,this.once=n||!1}function i(e,t,r,i,a){if("function"!==typeof r)throw new TypeError("The listener must be a function");var l=new o(r,i||e,a),u=n?n+t:t;return e._events[u]?e._events[u].fn?e._events[u]=[e._events[u],l]:e._events[u].push(l):(e._events[u]=l,e._eventsCount++),e}function a(e,t){0===--e._eventsCount?e._events=new r:delete e._events[t]}function l(){this._events=new r,this._eventsCount=0}Object.create&&(r.prototype=Object.create(null),(new r).__proto__||(n=!1)),l.prototype.eventNames=function(){var e,r,o=[];if(0===this._eventsCount)return o;for(r in e=this._events)t.call(e,r)&&o.push(n?r.slice(1):r);return Object.getOwnPropertySymbols?o.concat(Object.getOwnPropertySymbols(e)):o},l.prototype.listeners=function(e){var t=n?n+e:e,r=this._events[t];if(!r)return[];if(r.fn)return[r.fn];for(var o=0,i=r.length,a=new Array(i);o<i;o++)a[o]=r[o].fn;return a},l.prototype.listenerCount=function(e){var t=n?n+e:e,r=this._events[t];return r?r.fn?1:r.length:0},l.prototype.emit=function(e,t,r,o,i,a){var l=n?n+e:e;if(!this._events[l])return!1;var u,c,s=this._events[l],f=arguments.length;if(s.fn){switch(s.once&&this.removeListener(e,s.fn,void 0,!0),f){case 1:return s.fn.call(s.context),!0;case 2:return s.fn.call(s.context,t),!0;case 3:return s.fn.call(s.context,t,r),!0;case 4:return s.fn.call(s.context,t,r,o),!0;case 5:return s.fn.call(s.context,t,r,o,i),!0;case 6:return s.fn.call(s.context,t,r,o,i,a),!0}for(c=1,u=new Array(f-1);c<f;c++)u[c-1]=arguments[c];s.fn.apply(s.context,u)}else{var d,p=s.length;for(c=0;c<p;c++)switch(s[c].once&&this.removeListener(e,s[c].fn,void 0,!0),f){case 1:s[c].fn.call(s[c].context);break;case 2:s[c].fn.call(s[c].context,t);break;case 3:s[c].fn.call(s[c].context,t,r);break;case 4:s[c].fn.call(s[c].context,t,r,o);break;default:if(!u)for(d=1,u=new Array(f-1);d<f;d++)u[d-1]=arguments[d];s[c].fn.apply(s[c].context,u)}}return!0},l.prototype.on=function(e,t,n){return i(this,e,t,n,!1)},l.prototype.once=function(e,t,n){return i(this,e,t,n,!0)},l.prototype.removeListener=function(e,t,r,o){var i=n?n+e:e;if(!this._events[i])return this;if(!t)return a(this,i),this;var l=this._events[i];if(l.fn)l.fn!==t||o&&!l.once||r&&l.context!==r||a(this,i);else{for(var u=0,c=[],s=l.length;u<s;u++)(l[u].fn!==t||o&&!l[u].once||r&&l[u].context!==r)&&c.push(l[u]);c.length?this._events[i]=1===c.length?c[0]:c:a(this,i)}return this},l.prototype.removeAllListeners=function(e){var t;return e?(t=n?n+e:e,this._events[t]&&a(this,t)):(this._events=new r,this._eventsCount=0),this},l.prototype.off=l.prototype.removeListener,l.prototype.addListener=l.prototype.on,l.prefixed=n,l.EventEmitter=l,e.exports=l},7303(e,t,n){var r=n(801),o=1/0;e.exports=function(e){return e?(e=r(e))===o||e===-1/0?17976931348623157e292*(e<0?-1:1):e===e?e:0:0===e?e:0}},7424(e,t,n){var r=n(755),o=n(2536),i=n(5647),a=n(929),l=i(function(e,t){if(null==e)return[];var n=t.length;return n>1&&a(e,t[0],t[1])?t=[]:n>2&&a(t[0],t[1],t[2])&&(t=[t[0]]),o(e,r(t,1),[])});e.exports=l},7498(e){e.exports=function(e,t){return e>t}},7529(e){e.exports=function(e,t){for(var n=-1,r=null==e?0:e.length,o=0,i=[];++n<r;){var a=e[n];t(a,n,e)&&(i[o++]=a)}return i}},7563(e){e.exports=function(){this.__data__=[],this.size=0}},7574(e){e.exports=function(e){return function(t){return e(t)}}},7615(e,t,n){var r=n(5575);e.exports=function(){this.__data__=r?r(null):{},this.size=0}},7676(e,t,n){var r=n(8189),o=n(6311),i=n(9115),a=n(1069);e.exports=function(e){return function(t){t=a(t);var n=o(t)?i(t):void 0,l=n?n[0]:t.charAt(0),u=n?r(n,1).join(""):t.slice(1);return l[e]()+u}}},7685(e,t,n){var r=n(7937)(n(6552),"DataView");e.exports=r},7736(e,t,n){var r=n(3738).default,o=n(9045);e.exports=function(e){var t=o(e,"string");return"symbol"==r(t)?t:t+""},e.exports.__esModule=!0,e.exports.default=e.exports},7760(e){e.exports=function(e){return this.__data__.get(e)}},7768(e,t){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.default=function(){0}},7790(e,t){!function(e){"use strict";function t(e){return function(t,n,r,o,i,a,l){return e(t,n,l)}}function n(e){return function(t,n,r,o){if(!t||!n||"object"!==typeof t||"object"!==typeof n)return e(t,n,r,o);var i=o.get(t),a=o.get(n);if(i&&a)return i===n&&a===t;o.set(t,n),o.set(n,t);var l=e(t,n,r,o);return o.delete(t),o.delete(n),l}}function r(e,t){var n={};for(var r in e)n[r]=e[r];for(var r in t)n[r]=t[r];return n}function o(e){return e.constructor===Object||null==e.constructor}function i(e){return"function"===typeof e.then}function a(e,t){return e===t||e!==e&&t!==t}var l="[object Arguments]",u="[object Boolean]",c="[object Date]",s="[object RegExp]",f="[object Map]",d="[object Number]",p="[object Object]",h="[object Set]",y="[object String]",v=Object.prototype.toString;function m(e){var t=e.areArraysEqual,n=e.areDatesEqual,r=e.areMapsEqual,m=e.areObjectsEqual,g=e.areRegExpsEqual,b=e.areSetsEqual,x=(0,e.createIsNestedEqual)(w);function w(e,w,O){if(e===w)return!0;if(!e||!w||"object"!==typeof e||"object"!==typeof w)return e!==e&&w!==w;if(o(e)&&o(w))return m(e,w,x,O);var S=Array.isArray(e),j=Array.isArray(w);if(S||j)return S===j&&t(e,w,x,O);var k=v.call(e);return k===v.call(w)&&(k===c?n(e,w,x,O):k===s?g(e,w,x,O):k===f?r(e,w,x,O):k===h?b(e,w,x,O):k===p||k===l?!i(e)&&!i(w)&&m(e,w,x,O):(k===u||k===d||k===y)&&a(e.valueOf(),w.valueOf()))}return w}function g(e,t,n,r){var o=e.length;if(t.length!==o)return!1;for(;o-- >0;)if(!n(e[o],t[o],o,o,e,t,r))return!1;return!0}var b=n(g);function x(e,t){return a(e.valueOf(),t.valueOf())}function w(e,t,n,r){var o=e.size===t.size;if(!o)return!1;if(!e.size)return!0;var i={},a=0;return e.forEach(function(l,u){if(o){var c=!1,s=0;t.forEach(function(o,f){c||i[s]||!(c=n(u,f,a,s,e,t,r)&&n(l,o,u,f,e,t,r))||(i[s]=!0),s++}),a++,o=c}}),o}var O=n(w),S="_owner",j=Object.prototype.hasOwnProperty;function k(e,t,n,r){var o,i=Object.keys(e),a=i.length;if(Object.keys(t).length!==a)return!1;for(;a-- >0;){if((o=i[a])===S){var l=!!e.$$typeof,u=!!t.$$typeof;if((l||u)&&l!==u)return!1}if(!j.call(t,o)||!n(e[o],t[o],o,o,e,t,r))return!1}return!0}var P=n(k);function E(e,t){return e.source===t.source&&e.flags===t.flags}function _(e,t,n,r){var o=e.size===t.size;if(!o)return!1;if(!e.size)return!0;var i={};return e.forEach(function(a,l){if(o){var u=!1,c=0;t.forEach(function(o,s){u||i[c]||!(u=n(a,o,l,s,e,t,r))||(i[c]=!0),c++}),o=u}}),o}var M=n(_),A=Object.freeze({areArraysEqual:g,areDatesEqual:x,areMapsEqual:w,areObjectsEqual:k,areRegExpsEqual:E,areSetsEqual:_,createIsNestedEqual:t}),C=Object.freeze({areArraysEqual:b,areDatesEqual:x,areMapsEqual:O,areObjectsEqual:P,areRegExpsEqual:E,areSetsEqual:M,createIsNestedEqual:t}),T=m(A);function N(e,t){return T(e,t,void 0)}var D=m(r(A,{createIsNestedEqual:function(){return a}}));function I(e,t){return D(e,t,void 0)}var z=m(C);function R(e,t){return z(e,t,new WeakMap)}var L=m(r(C,{createIsNestedEqual:function(){return a}}));function B(e,t){return L(e,t,new WeakMap)}function F(e){return m(r(A,e(A)))}function U(e){var t=m(r(C,e(C)));return function(e,n,r){return void 0===r&&(r=new WeakMap),t(e,n,r)}}e.circularDeepEqual=R,e.circularShallowEqual=B,e.createCustomCircularEqual=U,e.createCustomEqual=F,e.deepEqual=N,e.sameValueZeroEqual=a,e.shallowEqual=I,Object.defineProperty(e,"__esModule",{value:!0})}(t)},7828(e){e.exports=function(){return[]}},7857(e,t,n){var r=n(3440),o=function(){var e=/[^.]+$/.exec(r&&r.keys&&r.keys.IE_PROTO||"");return e?"Symbol(src)_1."+e:""}();e.exports=function(e){return!!o&&o in e}},7894(e){e.exports=function(e,t){return null!=e&&t in Object(e)}},7937(e,t,n){var r=n(6954),o=n(4657);e.exports=function(e,t){var n=o(e,t);return r(n)?n:void 0}},7950(e,t,n){"use strict";!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(2730)},8114(e){e.exports=function(e,t){return e.has(t)}},8136(e,t,n){"use strict";var r=n(1847).default,o=n(2897).default;const i=["axis","bounds","children","defaultPosition","defaultClassName","defaultClassNameDragging","defaultClassNameDragged","position","positionOffset","scale"];Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"DraggableCore",{enumerable:!0,get:function(){return p.default}}),t.default=void 0;var a=function(e,t){if("function"==typeof WeakMap)var n=new WeakMap,r=new WeakMap;return function(e,t){if(!t&&e&&e.__esModule)return e;var o,i,a={__proto__:null,default:e};if(null===e||"object"!=typeof e&&"function"!=typeof e)return a;if(o=t?r:n){if(o.has(e))return o.get(e);o.set(e,a)}for(const n in e)"default"!==n&&{}.hasOwnProperty.call(e,n)&&((i=(o=Object.defineProperty)&&Object.getOwnPropertyDescriptor(e,n))&&(i.get||i.set)?o(a,n,i):a[n]=e[n]);return a}(e,t)}(n(5043)),l=y(n(5173)),u=y(n(7950)),c=n(2949),s=n(1212),f=n(1777),d=n(2447),p=y(n(935)),h=y(n(7768));function y(e){return e&&e.__esModule?e:{default:e}}function v(){return v=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},v.apply(null,arguments)}function m(e,t,n){return(t=function(e){var t=function(e,t){if("object"!=typeof e||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=typeof r)return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==typeof t?t:t+""}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}class g extends a.Component{static getDerivedStateFromProps(e,t){let{position:n}=e,{prevPropsPosition:r}=t;return!n||r&&n.x===r.x&&n.y===r.y?null:((0,h.default)("Draggable: getDerivedStateFromProps %j",{position:n,prevPropsPosition:r}),{x:n.x,y:n.y,prevPropsPosition:o({},n)})}constructor(e){super(e),m(this,"onDragStart",(e,t)=>{(0,h.default)("Draggable: onDragStart: %j",t);if(!1===this.props.onStart(e,(0,f.createDraggableData)(this,t)))return!1;this.setState({dragging:!0,dragged:!0})}),m(this,"onDrag",(e,t)=>{if(!this.state.dragging)return!1;(0,h.default)("Draggable: onDrag: %j",t);const n=(0,f.createDraggableData)(this,t),r={x:n.x,y:n.y,slackX:0,slackY:0};if(this.props.bounds){const{x:e,y:t}=r;r.x+=this.state.slackX,r.y+=this.state.slackY;const[o,i]=(0,f.getBoundPosition)(this,r.x,r.y);r.x=o,r.y=i,r.slackX=this.state.slackX+(e-r.x),r.slackY=this.state.slackY+(t-r.y),n.x=r.x,n.y=r.y,n.deltaX=r.x-this.state.x,n.deltaY=r.y-this.state.y}if(!1===this.props.onDrag(e,n))return!1;this.setState(r)}),m(this,"onDragStop",(e,t)=>{if(!this.state.dragging)return!1;if(!1===this.props.onStop(e,(0,f.createDraggableData)(this,t)))return!1;(0,h.default)("Draggable: onDragStop: %j",t);const n={dragging:!1,slackX:0,slackY:0};if(Boolean(this.props.position)){const{x:e,y:t}=this.props.position;n.x=e,n.y=t}this.setState(n)}),this.state={dragging:!1,dragged:!1,x:e.position?e.position.x:e.defaultPosition.x,y:e.position?e.position.y:e.defaultPosition.y,prevPropsPosition:o({},e.position),slackX:0,slackY:0,isElementSVG:!1},!e.position||e.onDrag||e.onStop||console.warn("A `position` was applied to this <Draggable>, without drag handlers. This will make this component effectively undraggable. Please attach `onDrag` or `onStop` handlers so you can adjust the `position` of this element.")}componentDidMount(){"undefined"!==typeof window.SVGElement&&this.findDOMNode()instanceof window.SVGElement&&this.setState({isElementSVG:!0})}componentWillUnmount(){this.state.dragging&&this.setState({dragging:!1})}findDOMNode(){var e,t;return null!==(e=null===(t=this.props)||void 0===t||null===(t=t.nodeRef)||void 0===t?void 0:t.current)&&void 0!==e?e:u.default.findDOMNode(this)}render(){const e=this.props,{axis:t,bounds:n,children:l,defaultPosition:u,defaultClassName:d,defaultClassNameDragging:h,defaultClassNameDragged:y,position:m,positionOffset:g,scale:b}=e,x=r(e,i);let w={},O=null;const S=!Boolean(m)||this.state.dragging,j=m||u,k={x:(0,f.canDragX)(this)&&S?this.state.x:j.x,y:(0,f.canDragY)(this)&&S?this.state.y:j.y};this.state.isElementSVG?O=(0,s.createSVGTransform)(k,g):w=(0,s.createCSSTransform)(k,g);const P=(0,c.clsx)(l.props.className||"",d,{[h]:this.state.dragging,[y]:this.state.dragged});return a.createElement(p.default,v({},x,{onStart:this.onDragStart,onDrag:this.onDrag,onStop:this.onDragStop}),a.cloneElement(a.Children.only(l),{className:P,style:o(o({},l.props.style),w),transform:O}))}}t.default=g,m(g,"displayName","Draggable"),m(g,"propTypes",o(o({},p.default.propTypes),{},{axis:l.default.oneOf(["both","x","y","none"]),bounds:l.default.oneOfType([l.default.shape({left:l.default.number,right:l.default.number,top:l.default.number,bottom:l.default.number}),l.default.string,l.default.oneOf([!1])]),defaultClassName:l.default.string,defaultClassNameDragging:l.default.string,defaultClassNameDragged:l.default.string,defaultPosition:l.default.shape({x:l.default.number,y:l.default.number}),positionOffset:l.default.shape({x:l.default.oneOfType([l.default.number,l.default.string]),y:l.default.oneOfType([l.default.number,l.default.string])}),position:l.default.shape({x:l.default.number,y:l.default.number}),className:d.dontSetMe,style:d.dontSetMe,transform:d.dontSetMe})),m(g,"defaultProps",o(o({},p.default.defaultProps),{},{axis:"both",bounds:!1,defaultClassName:"react-draggable",defaultClassNameDragging:"react-draggable-dragging",defaultClassNameDragged:"react-draggable-dragged",defaultPosition:{x:0,y:0},scale:1}))},8182(e,t,n){var r=n(2070),o=n(5713),i=n(2074),a=r&&1/i(new r([,-0]))[1]==1/0?function(e){return new r(e)}:o;e.exports=a},8189(e,t,n){var r=n(3871);e.exports=function(e,t,n){var o=e.length;return n=void 0===n?o:n,!t&&n>=o?e:r(e,t,n)}},8210(e,t,n){var r;!function(){"use strict";var o,i=1e9,a={precision:20,rounding:4,toExpNeg:-7,toExpPos:21,LN10:"2.302585092994045684017991454684364207601101488628772976033327900967572609677352480235997205089598298341967784042286"},l=!0,u="[DecimalError] ",c=u+"Invalid argument: ",s=u+"Exponent out of range: ",f=Math.floor,d=Math.pow,p=/^(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i,h=1e7,y=9007199254740991,v=f(1286742750677284.5),m={};function g(e,t){var n,r,o,i,a,u,c,s,f=e.constructor,d=f.precision;if(!e.s||!t.s)return t.s||(t=new f(e)),l?_(t,d):t;if(c=e.d,s=t.d,a=e.e,o=t.e,c=c.slice(),i=a-o){for(i<0?(r=c,i=-i,u=s.length):(r=s,o=a,u=c.length),i>(u=(a=Math.ceil(d/7))>u?a+1:u+1)&&(i=u,r.length=1),r.reverse();i--;)r.push(0);r.reverse()}for((u=c.length)-(i=s.length)<0&&(i=u,r=s,s=c,c=r),n=0;i;)n=(c[--i]=c[i]+s[i]+n)/h|0,c[i]%=h;for(n&&(c.unshift(n),++o),u=c.length;0==c[--u];)c.pop();return t.d=c,t.e=o,l?_(t,d):t}function b(e,t,n){if(e!==~~e||e<t||e>n)throw Error(c+e)}function x(e){var t,n,r,o=e.length-1,i="",a=e[0];if(o>0){for(i+=a,t=1;t<o;t++)(n=7-(r=e[t]+"").length)&&(i+=k(n)),i+=r;(n=7-(r=(a=e[t])+"").length)&&(i+=k(n))}else if(0===a)return"0";for(;a%10===0;)a/=10;return i+a}m.absoluteValue=m.abs=function(){var e=new this.constructor(this);return e.s&&(e.s=1),e},m.comparedTo=m.cmp=function(e){var t,n,r,o,i=this;if(e=new i.constructor(e),i.s!==e.s)return i.s||-e.s;if(i.e!==e.e)return i.e>e.e^i.s<0?1:-1;for(t=0,n=(r=i.d.length)<(o=e.d.length)?r:o;t<n;++t)if(i.d[t]!==e.d[t])return i.d[t]>e.d[t]^i.s<0?1:-1;return r===o?0:r>o^i.s<0?1:-1},m.decimalPlaces=m.dp=function(){var e=this,t=e.d.length-1,n=7*(t-e.e);if(t=e.d[t])for(;t%10==0;t/=10)n--;return n<0?0:n},m.dividedBy=m.div=function(e){return w(this,new this.constructor(e))},m.dividedToIntegerBy=m.idiv=function(e){var t=this.constructor;return _(w(this,new t(e),0,1),t.precision)},m.equals=m.eq=function(e){return!this.cmp(e)},m.exponent=function(){return S(this)},m.greaterThan=m.gt=function(e){return this.cmp(e)>0},m.greaterThanOrEqualTo=m.gte=function(e){return this.cmp(e)>=0},m.isInteger=m.isint=function(){return this.e>this.d.length-2},m.isNegative=m.isneg=function(){return this.s<0},m.isPositive=m.ispos=function(){return this.s>0},m.isZero=function(){return 0===this.s},m.lessThan=m.lt=function(e){return this.cmp(e)<0},m.lessThanOrEqualTo=m.lte=function(e){return this.cmp(e)<1},m.logarithm=m.log=function(e){var t,n=this,r=n.constructor,i=r.precision,a=i+5;if(void 0===e)e=new r(10);else if((e=new r(e)).s<1||e.eq(o))throw Error(u+"NaN");if(n.s<1)throw Error(u+(n.s?"NaN":"-Infinity"));return n.eq(o)?new r(0):(l=!1,t=w(P(n,a),P(e,a),a),l=!0,_(t,i))},m.minus=m.sub=function(e){var t=this;return e=new t.constructor(e),t.s==e.s?M(t,e):g(t,(e.s=-e.s,e))},m.modulo=m.mod=function(e){var t,n=this,r=n.constructor,o=r.precision;if(!(e=new r(e)).s)throw Error(u+"NaN");return n.s?(l=!1,t=w(n,e,0,1).times(e),l=!0,n.minus(t)):_(new r(n),o)},m.naturalExponential=m.exp=function(){return O(this)},m.naturalLogarithm=m.ln=function(){return P(this)},m.negated=m.neg=function(){var e=new this.constructor(this);return e.s=-e.s||0,e},m.plus=m.add=function(e){var t=this;return e=new t.constructor(e),t.s==e.s?g(t,e):M(t,(e.s=-e.s,e))},m.precision=m.sd=function(e){var t,n,r,o=this;if(void 0!==e&&e!==!!e&&1!==e&&0!==e)throw Error(c+e);if(t=S(o)+1,n=7*(r=o.d.length-1)+1,r=o.d[r]){for(;r%10==0;r/=10)n--;for(r=o.d[0];r>=10;r/=10)n++}return e&&t>n?t:n},m.squareRoot=m.sqrt=function(){var e,t,n,r,o,i,a,c=this,s=c.constructor;if(c.s<1){if(!c.s)return new s(0);throw Error(u+"NaN")}for(e=S(c),l=!1,0==(o=Math.sqrt(+c))||o==1/0?(((t=x(c.d)).length+e)%2==0&&(t+="0"),o=Math.sqrt(t),e=f((e+1)/2)-(e<0||e%2),r=new s(t=o==1/0?"5e"+e:(t=o.toExponential()).slice(0,t.indexOf("e")+1)+e)):r=new s(o.toString()),o=a=(n=s.precision)+3;;)if(r=(i=r).plus(w(c,i,a+2)).times(.5),x(i.d).slice(0,a)===(t=x(r.d)).slice(0,a)){if(t=t.slice(a-3,a+1),o==a&&"4999"==t){if(_(i,n+1,0),i.times(i).eq(c)){r=i;break}}else if("9999"!=t)break;a+=4}return l=!0,_(r,n)},m.times=m.mul=function(e){var t,n,r,o,i,a,u,c,s,f=this,d=f.constructor,p=f.d,y=(e=new d(e)).d;if(!f.s||!e.s)return new d(0);for(e.s*=f.s,n=f.e+e.e,(c=p.length)<(s=y.length)&&(i=p,p=y,y=i,a=c,c=s,s=a),i=[],r=a=c+s;r--;)i.push(0);for(r=s;--r>=0;){for(t=0,o=c+r;o>r;)u=i[o]+y[r]*p[o-r-1]+t,i[o--]=u%h|0,t=u/h|0;i[o]=(i[o]+t)%h|0}for(;!i[--a];)i.pop();return t?++n:i.shift(),e.d=i,e.e=n,l?_(e,d.precision):e},m.toDecimalPlaces=m.todp=function(e,t){var n=this,r=n.constructor;return n=new r(n),void 0===e?n:(b(e,0,i),void 0===t?t=r.rounding:b(t,0,8),_(n,e+S(n)+1,t))},m.toExponential=function(e,t){var n,r=this,o=r.constructor;return void 0===e?n=A(r,!0):(b(e,0,i),void 0===t?t=o.rounding:b(t,0,8),n=A(r=_(new o(r),e+1,t),!0,e+1)),n},m.toFixed=function(e,t){var n,r,o=this,a=o.constructor;return void 0===e?A(o):(b(e,0,i),void 0===t?t=a.rounding:b(t,0,8),n=A((r=_(new a(o),e+S(o)+1,t)).abs(),!1,e+S(r)+1),o.isneg()&&!o.isZero()?"-"+n:n)},m.toInteger=m.toint=function(){var e=this,t=e.constructor;return _(new t(e),S(e)+1,t.rounding)},m.toNumber=function(){return+this},m.toPower=m.pow=function(e){var t,n,r,i,a,c,s=this,d=s.constructor,p=+(e=new d(e));if(!e.s)return new d(o);if(!(s=new d(s)).s){if(e.s<1)throw Error(u+"Infinity");return s}if(s.eq(o))return s;if(r=d.precision,e.eq(o))return _(s,r);if(c=(t=e.e)>=(n=e.d.length-1),a=s.s,c){if((n=p<0?-p:p)<=y){for(i=new d(o),t=Math.ceil(r/7+4),l=!1;n%2&&C((i=i.times(s)).d,t),0!==(n=f(n/2));)C((s=s.times(s)).d,t);return l=!0,e.s<0?new d(o).div(i):_(i,r)}}else if(a<0)throw Error(u+"NaN");return a=a<0&&1&e.d[Math.max(t,n)]?-1:1,s.s=1,l=!1,i=e.times(P(s,r+12)),l=!0,(i=O(i)).s=a,i},m.toPrecision=function(e,t){var n,r,o=this,a=o.constructor;return void 0===e?r=A(o,(n=S(o))<=a.toExpNeg||n>=a.toExpPos):(b(e,1,i),void 0===t?t=a.rounding:b(t,0,8),r=A(o=_(new a(o),e,t),e<=(n=S(o))||n<=a.toExpNeg,e)),r},m.toSignificantDigits=m.tosd=function(e,t){var n=this.constructor;return void 0===e?(e=n.precision,t=n.rounding):(b(e,1,i),void 0===t?t=n.rounding:b(t,0,8)),_(new n(this),e,t)},m.toString=m.valueOf=m.val=m.toJSON=function(){var e=this,t=S(e),n=e.constructor;return A(e,t<=n.toExpNeg||t>=n.toExpPos)};var w=function(){function e(e,t){var n,r=0,o=e.length;for(e=e.slice();o--;)n=e[o]*t+r,e[o]=n%h|0,r=n/h|0;return r&&e.unshift(r),e}function t(e,t,n,r){var o,i;if(n!=r)i=n>r?1:-1;else for(o=i=0;o<n;o++)if(e[o]!=t[o]){i=e[o]>t[o]?1:-1;break}return i}function n(e,t,n){for(var r=0;n--;)e[n]-=r,r=e[n]<t[n]?1:0,e[n]=r*h+e[n]-t[n];for(;!e[0]&&e.length>1;)e.shift()}return function(r,o,i,a){var l,c,s,f,d,p,y,v,m,g,b,x,w,O,j,k,P,E,M=r.constructor,A=r.s==o.s?1:-1,C=r.d,T=o.d;if(!r.s)return new M(r);if(!o.s)throw Error(u+"Division by zero");for(c=r.e-o.e,P=T.length,j=C.length,v=(y=new M(A)).d=[],s=0;T[s]==(C[s]||0);)++s;if(T[s]>(C[s]||0)&&--c,(x=null==i?i=M.precision:a?i+(S(r)-S(o))+1:i)<0)return new M(0);if(x=x/7+2|0,s=0,1==P)for(f=0,T=T[0],x++;(s<j||f)&&x--;s++)w=f*h+(C[s]||0),v[s]=w/T|0,f=w%T|0;else{for((f=h/(T[0]+1)|0)>1&&(T=e(T,f),C=e(C,f),P=T.length,j=C.length),O=P,g=(m=C.slice(0,P)).length;g<P;)m[g++]=0;(E=T.slice()).unshift(0),k=T[0],T[1]>=h/2&&++k;do{f=0,(l=t(T,m,P,g))<0?(b=m[0],P!=g&&(b=b*h+(m[1]||0)),(f=b/k|0)>1?(f>=h&&(f=h-1),1==(l=t(d=e(T,f),m,p=d.length,g=m.length))&&(f--,n(d,P<p?E:T,p))):(0==f&&(l=f=1),d=T.slice()),(p=d.length)<g&&d.unshift(0),n(m,d,g),-1==l&&(l=t(T,m,P,g=m.length))<1&&(f++,n(m,P<g?E:T,g)),g=m.length):0===l&&(f++,m=[0]),v[s++]=f,l&&m[0]?m[g++]=C[O]||0:(m=[C[O]],g=1)}while((O++<j||void 0!==m[0])&&x--)}return v[0]||v.shift(),y.e=c,_(y,a?i+S(y)+1:i)}}();function O(e,t){var n,r,i,a,u,c=0,f=0,p=e.constructor,h=p.precision;if(S(e)>16)throw Error(s+S(e));if(!e.s)return new p(o);for(null==t?(l=!1,u=h):u=t,a=new p(.03125);e.abs().gte(.1);)e=e.times(a),f+=5;for(u+=Math.log(d(2,f))/Math.LN10*2+5|0,n=r=i=new p(o),p.precision=u;;){if(r=_(r.times(e),u),n=n.times(++c),x((a=i.plus(w(r,n,u))).d).slice(0,u)===x(i.d).slice(0,u)){for(;f--;)i=_(i.times(i),u);return p.precision=h,null==t?(l=!0,_(i,h)):i}i=a}}function S(e){for(var t=7*e.e,n=e.d[0];n>=10;n/=10)t++;return t}function j(e,t,n){if(t>e.LN10.sd())throw l=!0,n&&(e.precision=n),Error(u+"LN10 precision limit exceeded");return _(new e(e.LN10),t)}function k(e){for(var t="";e--;)t+="0";return t}function P(e,t){var n,r,i,a,c,s,f,d,p,h=1,y=e,v=y.d,m=y.constructor,g=m.precision;if(y.s<1)throw Error(u+(y.s?"NaN":"-Infinity"));if(y.eq(o))return new m(0);if(null==t?(l=!1,d=g):d=t,y.eq(10))return null==t&&(l=!0),j(m,d);if(d+=10,m.precision=d,r=(n=x(v)).charAt(0),a=S(y),!(Math.abs(a)<15e14))return f=j(m,d+2,g).times(a+""),y=P(new m(r+"."+n.slice(1)),d-10).plus(f),m.precision=g,null==t?(l=!0,_(y,g)):y;for(;r<7&&1!=r||1==r&&n.charAt(1)>3;)r=(n=x((y=y.times(e)).d)).charAt(0),h++;for(a=S(y),r>1?(y=new m("0."+n),a++):y=new m(r+"."+n.slice(1)),s=c=y=w(y.minus(o),y.plus(o),d),p=_(y.times(y),d),i=3;;){if(c=_(c.times(p),d),x((f=s.plus(w(c,new m(i),d))).d).slice(0,d)===x(s.d).slice(0,d))return s=s.times(2),0!==a&&(s=s.plus(j(m,d+2,g).times(a+""))),s=w(s,new m(h),d),m.precision=g,null==t?(l=!0,_(s,g)):s;s=f,i+=2}}function E(e,t){var n,r,o;for((n=t.indexOf("."))>-1&&(t=t.replace(".","")),(r=t.search(/e/i))>0?(n<0&&(n=r),n+=+t.slice(r+1),t=t.substring(0,r)):n<0&&(n=t.length),r=0;48===t.charCodeAt(r);)++r;for(o=t.length;48===t.charCodeAt(o-1);)--o;if(t=t.slice(r,o)){if(o-=r,n=n-r-1,e.e=f(n/7),e.d=[],r=(n+1)%7,n<0&&(r+=7),r<o){for(r&&e.d.push(+t.slice(0,r)),o-=7;r<o;)e.d.push(+t.slice(r,r+=7));r=7-(t=t.slice(r)).length}else r-=o;for(;r--;)t+="0";if(e.d.push(+t),l&&(e.e>v||e.e<-v))throw Error(s+n)}else e.s=0,e.e=0,e.d=[0];return e}function _(e,t,n){var r,o,i,a,u,c,p,y,m=e.d;for(a=1,i=m[0];i>=10;i/=10)a++;if((r=t-a)<0)r+=7,o=t,p=m[y=0];else{if((y=Math.ceil((r+1)/7))>=(i=m.length))return e;for(p=i=m[y],a=1;i>=10;i/=10)a++;o=(r%=7)-7+a}if(void 0!==n&&(u=p/(i=d(10,a-o-1))%10|0,c=t<0||void 0!==m[y+1]||p%i,c=n<4?(u||c)&&(0==n||n==(e.s<0?3:2)):u>5||5==u&&(4==n||c||6==n&&(r>0?o>0?p/d(10,a-o):0:m[y-1])%10&1||n==(e.s<0?8:7))),t<1||!m[0])return c?(i=S(e),m.length=1,t=t-i-1,m[0]=d(10,(7-t%7)%7),e.e=f(-t/7)||0):(m.length=1,m[0]=e.e=e.s=0),e;if(0==r?(m.length=y,i=1,y--):(m.length=y+1,i=d(10,7-r),m[y]=o>0?(p/d(10,a-o)%d(10,o)|0)*i:0),c)for(;;){if(0==y){(m[0]+=i)==h&&(m[0]=1,++e.e);break}if(m[y]+=i,m[y]!=h)break;m[y--]=0,i=1}for(r=m.length;0===m[--r];)m.pop();if(l&&(e.e>v||e.e<-v))throw Error(s+S(e));return e}function M(e,t){var n,r,o,i,a,u,c,s,f,d,p=e.constructor,y=p.precision;if(!e.s||!t.s)return t.s?t.s=-t.s:t=new p(e),l?_(t,y):t;if(c=e.d,d=t.d,r=t.e,s=e.e,c=c.slice(),a=s-r){for((f=a<0)?(n=c,a=-a,u=d.length):(n=d,r=s,u=c.length),a>(o=Math.max(Math.ceil(y/7),u)+2)&&(a=o,n.length=1),n.reverse(),o=a;o--;)n.push(0);n.reverse()}else{for((f=(o=c.length)<(u=d.length))&&(u=o),o=0;o<u;o++)if(c[o]!=d[o]){f=c[o]<d[o];break}a=0}for(f&&(n=c,c=d,d=n,t.s=-t.s),u=c.length,o=d.length-u;o>0;--o)c[u++]=0;for(o=d.length;o>a;){if(c[--o]<d[o]){for(i=o;i&&0===c[--i];)c[i]=h-1;--c[i],c[o]+=h}c[o]-=d[o]}for(;0===c[--u];)c.pop();for(;0===c[0];c.shift())--r;return c[0]?(t.d=c,t.e=r,l?_(t,y):t):new p(0)}function A(e,t,n){var r,o=S(e),i=x(e.d),a=i.length;return t?(n&&(r=n-a)>0?i=i.charAt(0)+"."+i.slice(1)+k(r):a>1&&(i=i.charAt(0)+"."+i.slice(1)),i=i+(o<0?"e":"e+")+o):o<0?(i="0."+k(-o-1)+i,n&&(r=n-a)>0&&(i+=k(r))):o>=a?(i+=k(o+1-a),n&&(r=n-o-1)>0&&(i=i+"."+k(r))):((r=o+1)<a&&(i=i.slice(0,r)+"."+i.slice(r)),n&&(r=n-a)>0&&(o+1===a&&(i+="."),i+=k(r))),e.s<0?"-"+i:i}function C(e,t){if(e.length>t)return e.length=t,!0}function T(e){if(!e||"object"!==typeof e)throw Error(u+"Object expected");var t,n,r,o=["precision",1,i,"rounding",0,8,"toExpNeg",-1/0,0,"toExpPos",0,1/0];for(t=0;t<o.length;t+=3)if(void 0!==(r=e[n=o[t]])){if(!(f(r)===r&&r>=o[t+1]&&r<=o[t+2]))throw Error(c+n+": "+r);this[n]=r}if(void 0!==(r=e[n="LN10"])){if(r!=Math.LN10)throw Error(c+n+": "+r);this[n]=new this(r)}return this}a=function e(t){var n,r,o;function i(e){var t=this;if(!(t instanceof i))return new i(e);if(t.constructor=i,e instanceof i)return t.s=e.s,t.e=e.e,void(t.d=(e=e.d)?e.slice():e);if("number"===typeof e){if(0*e!==0)throw Error(c+e);if(e>0)t.s=1;else{if(!(e<0))return t.s=0,t.e=0,void(t.d=[0]);e=-e,t.s=-1}return e===~~e&&e<1e7?(t.e=0,void(t.d=[e])):E(t,e.toString())}if("string"!==typeof e)throw Error(c+e);if(45===e.charCodeAt(0)?(e=e.slice(1),t.s=-1):t.s=1,!p.test(e))throw Error(c+e);E(t,e)}if(i.prototype=m,i.ROUND_UP=0,i.ROUND_DOWN=1,i.ROUND_CEIL=2,i.ROUND_FLOOR=3,i.ROUND_HALF_UP=4,i.ROUND_HALF_DOWN=5,i.ROUND_HALF_EVEN=6,i.ROUND_HALF_CEIL=7,i.ROUND_HALF_FLOOR=8,i.clone=e,i.config=i.set=T,void 0===t&&(t={}),t)for(o=["precision","rounding","toExpNeg","toExpPos","LN10"],n=0;n<o.length;)t.hasOwnProperty(r=o[n++])||(t[r]=this[r]);return i.config(t),i}(a),a.default=a.Decimal=a,o=new a(1),void 0===(r=function(){return a}.call(t,n,t,e))||(e.exports=r)}()},8259(e,t,n){var r=n(5797);e.exports=function(e){var t=r(e,function(e){return 500===n.size&&n.clear(),e}),n=t.cache;return t}},8325(e,t,n){var r=n(2541),o=n(5654),i=n(3279),a=o?function(e,t){return o(e,"toString",{configurable:!0,enumerable:!1,value:r(t),writable:!0})}:i;e.exports=a},8468(e,t,n){var r=n(5816),o=n(644),i=n(4020);e.exports=function(e,t,n){return t===t?i(e,t,n):r(e,o,n)}},8541(e,t,n){var r=n(9812),o=n(149),i=n(4052),a=n(9841),l=r?r.prototype:void 0,u=l?l.toString:void 0;e.exports=function e(t){if("string"==typeof t)return t;if(i(t))return o(t,e)+"";if(a(t))return u?u.call(t):"";var n=t+"";return"0"==n&&1/t==-1/0?"-0":n}},8673(e,t,n){var r=n(3204),o=n(3713),i=n(6571);e.exports=function(e){return i(e)?r(e):o(e)}},8724(e,t,n){var r=n(7615),o=n(5051),i=n(2154),a=n(8734),l=n(2662);function u(e){var t=-1,n=null==e?0:e.length;for(this.clear();++t<n;){var r=e[t];this.set(r[0],r[1])}}u.prototype.clear=r,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=a,u.prototype.set=l,e.exports=u},8734(e,t,n){var r=n(5575),o=Object.prototype.hasOwnProperty;e.exports=function(e){var t=this.__data__;return r?void 0!==t[e]:o.call(t,e)}},8853(e,t,n){"use strict";e.exports=n(7234)},8883(e,t,n){var r=n(5652),o=n(6571);e.exports=function(e,t){var n=-1,i=o(e)?Array(e.length):[];return r(e,function(e,r,o){i[++n]=t(e,r,o)}),i}},8895(e){e.exports=function(e,t){for(var n=-1,r=t.length,o=e.length;++n<r;)e[o+n]=t[n];return e}},8902(e,t,n){var r=n(4816),o=n(6179),i=n(6704);function a(e){var t=-1,n=null==e?0:e.length;for(this.__data__=new r;++t<n;)this.add(e[t])}a.prototype.add=a.prototype.push=o,a.prototype.has=i,e.exports=a},8990(e,t,n){var r=n(9995)(n(2520));e.exports=r},9045(e,t,n){var r=n(3738).default;e.exports=function(e,t){if("object"!=r(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var o=n.call(e,t||"default");if("object"!=r(o))return o;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)},e.exports.__esModule=!0,e.exports.default=e.exports},9057(e,t,n){var r=n(5324),o=n(2777),i=n(4052),a=n(9194),l=n(6173),u=n(914);e.exports=function(e,t,n){for(var c=-1,s=(t=r(t,e)).length,f=!1;++c<s;){var d=u(t[c]);if(!(f=null!=e&&n(e,d)))break;e=e[d]}return f||++c!=s?f:!!(s=null==e?0:e.length)&&l(s)&&a(d,s)&&(i(e)||o(e))}},9062(e,t,n){"use strict";e.exports=n(6378)},9096(e,t,n){var r=n(9256),o=n(5029),i=n(3279),a=n(4052),l=n(3932);e.exports=function(e){return"function"==typeof e?e:null==e?i:"object"==typeof e?a(e)?o(e[0],e[1]):r(e):l(e)}},9115(e,t,n){var r=n(5967),o=n(6311),i=n(715);e.exports=function(e){return o(e)?i(e):r(e)}},9140(e,t,n){var r=n(7303);e.exports=function(e){var t=r(e),n=t%1;return t===t?n?t-n:t:0}},9160(e,t,n){var r=n(6913),o=n(2761);e.exports=function(e){return"number"==typeof e||o(e)&&"[object Number]"==r(e)}},9194(e){var t=/^(?:0|[1-9]\d*)$/;e.exports=function(e,n){var r=typeof e;return!!(n=null==n?9007199254740991:n)&&("number"==r||"symbol"!=r&&t.test(e))&&e>-1&&e%1==0&&e<n}},9256(e,t,n){var r=n(6532),o=n(3781),i=n(1310);e.exports=function(e){var t=o(e);return 1==t.length&&t[0][2]?i(t[0][0],t[0][1]):function(n){return n===e||r(n,e,t)}}},9394(e,t,n){var r=n(2622);e.exports=function(e){return r(this,e).has(e)}},9395(e,t,n){var r=n(4262),o=n(9621),i=n(8673);e.exports=function(e){return r(e,i,o)}},9417(e,t,n){var r=n(6686);e.exports=function(e){return e===e&&!r(e)}},9621(e,t,n){var r=n(7529),o=n(7828),i=Object.prototype.propertyIsEnumerable,a=Object.getOwnPropertySymbols,l=a?function(e){return null==e?[]:(e=Object(e),r(a(e),function(t){return i.call(e,t)}))}:o;e.exports=l},9676(e){var t=Math.ceil,n=Math.max;e.exports=function(e,r,o,i){for(var a=-1,l=n(t((r-e)/(o||1)),0),u=Array(l);l--;)u[i?l:++a]=e,e+=o;return u}},9686(e){e.exports=function(e){return null==e}},9742(e,t,n){var r=n(9841);e.exports=function(e,t,n){for(var o=-1,i=e.length;++o<i;){var a=e[o],l=t(a);if(null!=l&&(void 0===u?l===l&&!r(l):n(l,u)))var u=l,c=a}return c}},9812(e,t,n){var r=n(6552).Symbol;e.exports=r},9841(e,t,n){var r=n(6913),o=n(2761);e.exports=function(e){return"symbol"==typeof e||o(e)&&"[object Symbol]"==r(e)}},9853(e,t,n){var r=n(6989);e.exports=function(e,t){return r(e,t)}},9889(e,t,n){var r=n(3950),o=n(6686);e.exports=function(e,t,n){var i=!0,a=!0;if("function"!=typeof e)throw new TypeError("Expected a function");return o(n)&&(i="leading"in n?!!n.leading:i,a="trailing"in n?!!n.trailing:a),r(e,t,{leading:i,maxWait:t,trailing:a})}},9935(e,t,n){var r=n(1340),o=Array.prototype.splice;e.exports=function(e){var t=this.__data__,n=r(t,e);return!(n<0)&&(n==t.length-1?t.pop():o.call(t,n,1),--this.size,!0)}},9987(e,t,n){var r=n(9812),o=n(2929),i=n(3211),a=n(3668),l=n(4160),u=n(2074),c=r?r.prototype:void 0,s=c?c.valueOf:void 0;e.exports=function(e,t,n,r,c,f,d){switch(n){case"[object DataView]":if(e.byteLength!=t.byteLength||e.byteOffset!=t.byteOffset)return!1;e=e.buffer,t=t.buffer;case"[object ArrayBuffer]":return!(e.byteLength!=t.byteLength||!f(new o(e),new o(t)));case"[object Boolean]":case"[object Date]":case"[object Number]":return i(+e,+t);case"[object Error]":return e.name==t.name&&e.message==t.message;case"[object RegExp]":case"[object String]":return e==t+"";case"[object Map]":var p=l;case"[object Set]":var h=1&r;if(p||(p=u),e.size!=t.size&&!h)return!1;var y=d.get(e);if(y)return y==t;r|=2,d.set(e,t);var v=a(p(e),p(t),r,c,f,d);return d.delete(e),v;case"[object Symbol]":if(s)return s.call(e)==s.call(t)}return!1}},9995(e,t,n){var r=n(9096),o=n(6571),i=n(8673);e.exports=function(e){return function(t,n,a){var l=Object(t);if(!o(t)){var u=r(n,3);t=i(t),n=function(e){return u(l[e],e,l)}}var c=e(t,n,a);return c>-1?l[u?t[c]:c]:void 0}}}},t={};function n(r){var o=t[r];if(void 0!==o)return o.exports;var i=t[r]={id:r,loaded:!1,exports:{}};return e[r].call(i.exports,i,i.exports,n),i.loaded=!0,i.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.g=function(){if("object"===typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"===typeof window)return window}}(),n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.r=e=>{"undefined"!==typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},n.nmd=e=>(e.paths=[],e.children||(e.children=[]),e),(()=>{"use strict";var e={};n.r(e),n.d(e,{scaleBand:()=>Ko,scaleDiverging:()=>Es,scaleDivergingLog:()=>_s,scaleDivergingPow:()=>As,scaleDivergingSqrt:()=>Cs,scaleDivergingSymlog:()=>Ms,scaleIdentity:()=>wl,scaleImplicit:()=>Yo,scaleLinear:()=>xl,scaleLog:()=>Al,scaleOrdinal:()=>Go,scalePoint:()=>Zo,scalePow:()=>Bl,scaleQuantile:()=>Ql,scaleQuantize:()=>Zl,scaleRadial:()=>Wl,scaleSequential:()=>xs,scaleSequentialLog:()=>ws,scaleSequentialPow:()=>Ss,scaleSequentialQuantile:()=>ks,scaleSequentialSqrt:()=>js,scaleSequentialSymlog:()=>Os,scaleSqrt:()=>Fl,scaleSymlog:()=>Dl,scaleThreshold:()=>Jl,scaleTime:()=>vs,scaleUtc:()=>ms,tickFormat:()=>gl});var t=n(5043),r=n(4391);function o(e){return o="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},o(e)}function i(e){var t=function(e,t){if("object"!=o(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=o(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==o(t)?t:t+""}function a(e,t,n){return(t=i(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function l(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function u(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?l(Object(n),!0).forEach(function(t){a(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):l(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function c(e){var t,n,r="";if("string"==typeof e||"number"==typeof e)r+=e;else if("object"==typeof e)if(Array.isArray(e)){var o=e.length;for(t=0;t<o;t++)e[t]&&(n=c(e[t]))&&(r&&(r+=" "),r+=n)}else for(n in e)e[n]&&(r&&(r+=" "),r+=n);return r}const s=function(){for(var e,t,n=0,r="",o=arguments.length;n<o;n++)(e=arguments[n])&&(t=c(e))&&(r&&(r+=" "),r+=t);return r};var f=n(9889),d=n.n(f),p=n(620),h=n.n(p),y=n(5268),v=n.n(y),m=n(3097),g=n.n(m),b=n(9160),x=n.n(b),w=n(9686),O=n.n(w),S=function(e){return 0===e?0:e>0?1:-1},j=function(e){return h()(e)&&e.indexOf("%")===e.length-1},k=function(e){return x()(e)&&!v()(e)},P=function(e){return k(e)||h()(e)},E=0,_=function(e){var t=++E;return"".concat(e||"").concat(t)},M=function(e,t){var n,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,o=arguments.length>3&&void 0!==arguments[3]&&arguments[3];if(!k(e)&&!h()(e))return r;if(j(e)){var i=e.indexOf("%");n=t*parseFloat(e.slice(0,i))/100}else n=+e;return v()(n)&&(n=r),o&&n>t&&(n=t),n},A=function(e){if(!e)return null;var t=Object.keys(e);return t&&t.length?e[t[0]]:null},C=function(e,t){return k(e)&&k(t)?function(n){return e+n*(t-e)}:function(){return t}};function T(e,t,n){return e&&e.length?e.find(function(e){return e&&("function"===typeof t?t(e):g()(e,t))===n}):null}var N=function(e,t){return k(e)&&k(t)?e-t:h()(e)&&h()(t)?e.localeCompare(t):e instanceof Date&&t instanceof Date?e.getTime()-t.getTime():String(e).localeCompare(String(t))},D=function(e,t){for(var n=arguments.length,r=new Array(n>2?n-2:0),o=2;o<n;o++)r[o-2]=arguments[o]},I=n(1629),z=n.n(I),R=n(6686),L=n.n(R),B=n(9062);function F(e,t){for(var n in e)if({}.hasOwnProperty.call(e,n)&&(!{}.hasOwnProperty.call(t,n)||e[n]!==t[n]))return!1;for(var r in t)if({}.hasOwnProperty.call(t,r)&&!{}.hasOwnProperty.call(e,r))return!1;return!0}function U(e){return U="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},U(e)}var W=["aria-activedescendant","aria-atomic","aria-autocomplete","aria-busy","aria-checked","aria-colcount","aria-colindex","aria-colspan","aria-controls","aria-current","aria-describedby","aria-details","aria-disabled","aria-errormessage","aria-expanded","aria-flowto","aria-haspopup","aria-hidden","aria-invalid","aria-keyshortcuts","aria-label","aria-labelledby","aria-level","aria-live","aria-modal","aria-multiline","aria-multiselectable","aria-orientation","aria-owns","aria-placeholder","aria-posinset","aria-pressed","aria-readonly","aria-relevant","aria-required","aria-roledescription","aria-rowcount","aria-rowindex","aria-rowspan","aria-selected","aria-setsize","aria-sort","aria-valuemax","aria-valuemin","aria-valuenow","aria-valuetext","className","color","height","id","lang","max","media","method","min","name","style","target","width","role","tabIndex","accentHeight","accumulate","additive","alignmentBaseline","allowReorder","alphabetic","amplitude","arabicForm","ascent","attributeName","attributeType","autoReverse","azimuth","baseFrequency","baselineShift","baseProfile","bbox","begin","bias","by","calcMode","capHeight","clip","clipPath","clipPathUnits","clipRule","colorInterpolation","colorInterpolationFilters","colorProfile","colorRendering","contentScriptType","contentStyleType","cursor","cx","cy","d","decelerate","descent","diffuseConstant","direction","display","divisor","dominantBaseline","dur","dx","dy","edgeMode","elevation","enableBackground","end","exponent","externalResourcesRequired","fill","fillOpacity","fillRule","filter","filterRes","filterUnits","floodColor","floodOpacity","focusable","fontFamily","fontSize","fontSizeAdjust","fontStretch","fontStyle","fontVariant","fontWeight","format","from","fx","fy","g1","g2","glyphName","glyphOrientationHorizontal","glyphOrientationVertical","glyphRef","gradientTransform","gradientUnits","hanging","horizAdvX","horizOriginX","href","ideographic","imageRendering","in2","in","intercept","k1","k2","k3","k4","k","kernelMatrix","kernelUnitLength","kerning","keyPoints","keySplines","keyTimes","lengthAdjust","letterSpacing","lightingColor","limitingConeAngle","local","markerEnd","markerHeight","markerMid","markerStart","markerUnits","markerWidth","mask","maskContentUnits","maskUnits","mathematical","mode","numOctaves","offset","opacity","operator","order","orient","orientation","origin","overflow","overlinePosition","overlineThickness","paintOrder","panose1","pathLength","patternContentUnits","patternTransform","patternUnits","pointerEvents","pointsAtX","pointsAtY","pointsAtZ","preserveAlpha","preserveAspectRatio","primitiveUnits","r","radius","refX","refY","renderingIntent","repeatCount","repeatDur","requiredExtensions","requiredFeatures","restart","result","rotate","rx","ry","seed","shapeRendering","slope","spacing","specularConstant","specularExponent","speed","spreadMethod","startOffset","stdDeviation","stemh","stemv","stitchTiles","stopColor","stopOpacity","strikethroughPosition","strikethroughThickness","string","stroke","strokeDasharray","strokeDashoffset","strokeLinecap","strokeLinejoin","strokeMiterlimit","strokeOpacity","strokeWidth","surfaceScale","systemLanguage","tableValues","targetX","targetY","textAnchor","textDecoration","textLength","textRendering","to","transform","u1","u2","underlinePosition","underlineThickness","unicode","unicodeBidi","unicodeRange","unitsPerEm","vAlphabetic","values","vectorEffect","version","vertAdvY","vertOriginX","vertOriginY","vHanging","vIdeographic","viewTarget","visibility","vMathematical","widths","wordSpacing","writingMode","x1","x2","x","xChannelSelector","xHeight","xlinkActuate","xlinkArcrole","xlinkHref","xlinkRole","xlinkShow","xlinkTitle","xlinkType","xmlBase","xmlLang","xmlns","xmlnsXlink","xmlSpace","y1","y2","y","yChannelSelector","z","zoomAndPan","ref","key","angle"],H=["points","pathLength"],q={svg:["viewBox","children"],polygon:H,polyline:H},V=["dangerouslySetInnerHTML","onCopy","onCopyCapture","onCut","onCutCapture","onPaste","onPasteCapture","onCompositionEnd","onCompositionEndCapture","onCompositionStart","onCompositionStartCapture","onCompositionUpdate","onCompositionUpdateCapture","onFocus","onFocusCapture","onBlur","onBlurCapture","onChange","onChangeCapture","onBeforeInput","onBeforeInputCapture","onInput","onInputCapture","onReset","onResetCapture","onSubmit","onSubmitCapture","onInvalid","onInvalidCapture","onLoad","onLoadCapture","onError","onErrorCapture","onKeyDown","onKeyDownCapture","onKeyPress","onKeyPressCapture","onKeyUp","onKeyUpCapture","onAbort","onAbortCapture","onCanPlay","onCanPlayCapture","onCanPlayThrough","onCanPlayThroughCapture","onDurationChange","onDurationChangeCapture","onEmptied","onEmptiedCapture","onEncrypted","onEncryptedCapture","onEnded","onEndedCapture","onLoadedData","onLoadedDataCapture","onLoadedMetadata","onLoadedMetadataCapture","onLoadStart","onLoadStartCapture","onPause","onPauseCapture","onPlay","onPlayCapture","onPlaying","onPlayingCapture","onProgress","onProgressCapture","onRateChange","onRateChangeCapture","onSeeked","onSeekedCapture","onSeeking","onSeekingCapture","onStalled","onStalledCapture","onSuspend","onSuspendCapture","onTimeUpdate","onTimeUpdateCapture","onVolumeChange","onVolumeChangeCapture","onWaiting","onWaitingCapture","onAuxClick","onAuxClickCapture","onClick","onClickCapture","onContextMenu","onContextMenuCapture","onDoubleClick","onDoubleClickCapture","onDrag","onDragCapture","onDragEnd","onDragEndCapture","onDragEnter","onDragEnterCapture","onDragExit","onDragExitCapture","onDragLeave","onDragLeaveCapture","onDragOver","onDragOverCapture","onDragStart","onDragStartCapture","onDrop","onDropCapture","onMouseDown","onMouseDownCapture","onMouseEnter","onMouseLeave","onMouseMove","onMouseMoveCapture","onMouseOut","onMouseOutCapture","onMouseOver","onMouseOverCapture","onMouseUp","onMouseUpCapture","onSelect","onSelectCapture","onTouchCancel","onTouchCancelCapture","onTouchEnd","onTouchEndCapture","onTouchMove","onTouchMoveCapture","onTouchStart","onTouchStartCapture","onPointerDown","onPointerDownCapture","onPointerMove","onPointerMoveCapture","onPointerUp","onPointerUpCapture","onPointerCancel","onPointerCancelCapture","onPointerEnter","onPointerEnterCapture","onPointerLeave","onPointerLeaveCapture","onPointerOver","onPointerOverCapture","onPointerOut","onPointerOutCapture","onGotPointerCapture","onGotPointerCaptureCapture","onLostPointerCapture","onLostPointerCaptureCapture","onScroll","onScrollCapture","onWheel","onWheelCapture","onAnimationStart","onAnimationStartCapture","onAnimationEnd","onAnimationEndCapture","onAnimationIteration","onAnimationIterationCapture","onTransitionEnd","onTransitionEndCapture"],X=function(e,n){if(!e||"function"===typeof e||"boolean"===typeof e)return null;var r=e;if((0,t.isValidElement)(e)&&(r=e.props),!L()(r))return null;var o={};return Object.keys(r).forEach(function(e){V.includes(e)&&(o[e]=n||function(t){return r[e](r,t)})}),o},$=function(e,t,n){if(!L()(e)||"object"!==U(e))return null;var r=null;return Object.keys(e).forEach(function(o){var i=e[o];V.includes(o)&&"function"===typeof i&&(r||(r={}),r[o]=function(e,t,n){return function(r){return e(t,n,r),null}}(i,t,n))}),r},Y=["children"],G=["children"];function K(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Q(e){return Q="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Q(e)}var Z={click:"onClick",mousedown:"onMouseDown",mouseup:"onMouseUp",mouseover:"onMouseOver",mousemove:"onMouseMove",mouseout:"onMouseOut",mouseenter:"onMouseEnter",mouseleave:"onMouseLeave",touchcancel:"onTouchCancel",touchend:"onTouchEnd",touchmove:"onTouchMove",touchstart:"onTouchStart",contextmenu:"onContextMenu",dblclick:"onDoubleClick"},J=function(e){return"string"===typeof e?e:e?e.displayName||e.name||"Component":""},ee=null,te=null,ne=function e(n){if(n===ee&&Array.isArray(te))return te;var r=[];return t.Children.forEach(n,function(t){O()(t)||((0,B.isFragment)(t)?r=r.concat(e(t.props.children)):r.push(t))}),te=r,ee=n,r};function re(e,t){var n=[],r=[];return r=Array.isArray(t)?t.map(function(e){return J(e)}):[J(t)],ne(e).forEach(function(e){var t=g()(e,"type.displayName")||g()(e,"type.name");-1!==r.indexOf(t)&&n.push(e)}),n}function oe(e,t){var n=re(e,t);return n&&n[0]}var ie=function(e){if(!e||!e.props)return!1;var t=e.props,n=t.width,r=t.height;return!(!k(n)||n<=0||!k(r)||r<=0)},ae=["a","altGlyph","altGlyphDef","altGlyphItem","animate","animateColor","animateMotion","animateTransform","circle","clipPath","color-profile","cursor","defs","desc","ellipse","feBlend","feColormatrix","feComponentTransfer","feComposite","feConvolveMatrix","feDiffuseLighting","feDisplacementMap","feDistantLight","feFlood","feFuncA","feFuncB","feFuncG","feFuncR","feGaussianBlur","feImage","feMerge","feMergeNode","feMorphology","feOffset","fePointLight","feSpecularLighting","feSpotLight","feTile","feTurbulence","filter","font","font-face","font-face-format","font-face-name","font-face-url","foreignObject","g","glyph","glyphRef","hkern","image","line","lineGradient","marker","mask","metadata","missing-glyph","mpath","path","pattern","polygon","polyline","radialGradient","rect","script","set","stop","style","svg","switch","symbol","text","textPath","title","tref","tspan","use","view","vkern"],le=function(e){return e&&e.type&&h()(e.type)&&ae.indexOf(e.type)>=0},ue=function(e,n,r){if(!e||"function"===typeof e||"boolean"===typeof e)return null;var o=e;if((0,t.isValidElement)(e)&&(o=e.props),!L()(o))return null;var i={};return Object.keys(o).forEach(function(e){var t;(function(e,t,n,r){var o,i=null!==(o=null===q||void 0===q?void 0:q[r])&&void 0!==o?o:[];return t.startsWith("data-")||!z()(e)&&(r&&i.includes(t)||W.includes(t))||n&&V.includes(t)})(null===(t=o)||void 0===t?void 0:t[e],e,n,r)&&(i[e]=o[e])}),i},ce=function e(n,r){if(n===r)return!0;var o=t.Children.count(n);if(o!==t.Children.count(r))return!1;if(0===o)return!0;if(1===o)return se(Array.isArray(n)?n[0]:n,Array.isArray(r)?r[0]:r);for(var i=0;i<o;i++){var a=n[i],l=r[i];if(Array.isArray(a)||Array.isArray(l)){if(!e(a,l))return!1}else if(!se(a,l))return!1}return!0},se=function(e,t){if(O()(e)&&O()(t))return!0;if(!O()(e)&&!O()(t)){var n=e.props||{},r=n.children,o=K(n,Y),i=t.props||{},a=i.children,l=K(i,G);return r&&a?F(o,l)&&ce(r,a):!r&&!a&&F(o,l)}return!1},fe=function(e,t){var n=[],r={};return ne(e).forEach(function(e,o){if(le(e))n.push(e);else if(e){var i=J(e.type),a=t[i]||{},l=a.handler,u=a.once;if(l&&(!u||!r[i])){var c=l(e,i,o);n.push(c),r[i]=!0}}}),n};function de(e){return de="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},de(e)}function pe(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function he(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?pe(Object(n),!0).forEach(function(t){ye(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pe(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function ye(e,t,n){return t=function(e){var t=function(e,t){if("object"!=de(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=de(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==de(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ve(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return me(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return me(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function me(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var ge=(0,t.forwardRef)(function(e,n){var r=e.aspect,o=e.initialDimension,i=void 0===o?{width:-1,height:-1}:o,a=e.width,l=void 0===a?"100%":a,u=e.height,c=void 0===u?"100%":u,f=e.minWidth,p=void 0===f?0:f,h=e.minHeight,y=e.maxHeight,v=e.children,m=e.debounce,g=void 0===m?0:m,b=e.id,x=e.className,w=e.onResize,O=e.style,S=void 0===O?{}:O,k=(0,t.useRef)(null),P=(0,t.useRef)();P.current=w,(0,t.useImperativeHandle)(n,function(){return Object.defineProperty(k.current,"current",{get:function(){return console.warn("The usage of ref.current.current is deprecated and will no longer be supported."),k.current},configurable:!0})});var E=ve((0,t.useState)({containerWidth:i.width,containerHeight:i.height}),2),_=E[0],M=E[1],A=(0,t.useCallback)(function(e,t){M(function(n){var r=Math.round(e),o=Math.round(t);return n.containerWidth===r&&n.containerHeight===o?n:{containerWidth:r,containerHeight:o}})},[]);(0,t.useEffect)(function(){var e=function(e){var t,n=e[0].contentRect,r=n.width,o=n.height;A(r,o),null===(t=P.current)||void 0===t||t.call(P,r,o)};g>0&&(e=d()(e,g,{trailing:!0,leading:!1}));var t=new ResizeObserver(e),n=k.current.getBoundingClientRect(),r=n.width,o=n.height;return A(r,o),t.observe(k.current),function(){t.disconnect()}},[A,g]);var C=(0,t.useMemo)(function(){var e=_.containerWidth,n=_.containerHeight;if(e<0||n<0)return null;D(j(l)||j(c),"The width(%s) and height(%s) are both fixed numbers,\n       maybe you don't need to use a ResponsiveContainer.",l,c),D(!r||r>0,"The aspect(%s) must be greater than zero.",r);var o=j(l)?e:l,i=j(c)?n:c;r&&r>0&&(o?i=o/r:i&&(o=i*r),y&&i>y&&(i=y)),D(o>0||i>0,"The width(%s) and height(%s) of chart should be greater than 0,\n       please check the style of container, or the props width(%s) and height(%s),\n       or add a minWidth(%s) or minHeight(%s) or use aspect(%s) to control the\n       height and width.",o,i,l,c,p,h,r);var a=!Array.isArray(v)&&J(v.type).endsWith("Chart");return t.Children.map(v,function(e){return t.isValidElement(e)?(0,t.cloneElement)(e,he({width:o,height:i},a?{style:he({height:"100%",width:"100%",maxHeight:i,maxWidth:o},e.props.style)}:{})):e})},[r,v,c,y,h,p,_,l]);return t.createElement("div",{id:b?"".concat(b):void 0,className:s("recharts-responsive-container",x),style:he(he({},S),{},{width:l,height:c,minWidth:p,minHeight:h,maxHeight:y}),ref:k},C)}),be=n(6604),xe=n.n(be),we=n(7424),Oe=n.n(we),Se="Invariant failed";function je(e,t){if(!e)throw new Error(Se)}var ke=["children","width","height","viewBox","className","style","title","desc"];function Pe(){return Pe=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Pe.apply(this,arguments)}function Ee(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function _e(e){var n=e.children,r=e.width,o=e.height,i=e.viewBox,a=e.className,l=e.style,u=e.title,c=e.desc,f=Ee(e,ke),d=i||{width:r,height:o,x:0,y:0},p=s("recharts-surface",a);return t.createElement("svg",Pe({},ue(f,!0,"svg"),{className:p,width:r,height:o,style:l,viewBox:"".concat(d.x," ").concat(d.y," ").concat(d.width," ").concat(d.height)}),t.createElement("title",null,u),t.createElement("desc",null,c),n)}var Me=["children","className"];function Ae(){return Ae=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ae.apply(this,arguments)}function Ce(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var Te=t.forwardRef(function(e,n){var r=e.children,o=e.className,i=Ce(e,Me),a=s("recharts-layer",o);return t.createElement("g",Ae({className:a},ue(i,!0),{ref:n}),r)});function Ne(e){return Ne="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ne(e)}function De(){return De=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},De.apply(this,arguments)}function Ie(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return ze(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return ze(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ze(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Re(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Le(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Re(Object(n),!0).forEach(function(t){Be(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Re(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Be(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Ne(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Ne(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Ne(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Fe(e){return Array.isArray(e)&&P(e[0])&&P(e[1])?e.join(" ~ "):e}var Ue=function(e){var n=e.separator,r=void 0===n?" : ":n,o=e.contentStyle,i=void 0===o?{}:o,a=e.itemStyle,l=void 0===a?{}:a,u=e.labelStyle,c=void 0===u?{}:u,f=e.payload,d=e.formatter,p=e.itemSorter,h=e.wrapperClassName,y=e.labelClassName,v=e.label,m=e.labelFormatter,g=e.accessibilityLayer,b=void 0!==g&&g,x=Le({margin:0,padding:10,backgroundColor:"#fff",border:"1px solid #ccc",whiteSpace:"nowrap"},i),w=Le({margin:0},c),S=!O()(v),j=S?v:"",k=s("recharts-default-tooltip",h),E=s("recharts-tooltip-label",y);S&&m&&void 0!==f&&null!==f&&(j=m(v,f));var _=b?{role:"status","aria-live":"assertive"}:{};return t.createElement("div",De({className:k,style:x},_),t.createElement("p",{className:E,style:w},t.isValidElement(j)?j:"".concat(j)),function(){if(f&&f.length){var e=(p?Oe()(f,p):f).map(function(e,n){if("none"===e.type)return null;var o=Le({display:"block",paddingTop:4,paddingBottom:4,color:e.color||"#000"},l),i=e.formatter||d||Fe,a=e.value,u=e.name,c=a,s=u;if(i&&null!=c&&null!=s){var p=i(a,u,e,n,f);if(Array.isArray(p)){var h=Ie(p,2);c=h[0],s=h[1]}else c=p}return t.createElement("li",{className:"recharts-tooltip-item",key:"tooltip-item-".concat(n),style:o},P(s)?t.createElement("span",{className:"recharts-tooltip-item-name"},s):null,P(s)?t.createElement("span",{className:"recharts-tooltip-item-separator"},r):null,t.createElement("span",{className:"recharts-tooltip-item-value"},c),t.createElement("span",{className:"recharts-tooltip-item-unit"},e.unit||""))});return t.createElement("ul",{className:"recharts-tooltip-item-list",style:{padding:0,margin:0}},e)}return null}())};function We(e){return We="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},We(e)}function He(e,t,n){return t=function(e){var t=function(e,t){if("object"!=We(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=We(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==We(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var qe="recharts-tooltip-wrapper",Ve={visibility:"hidden"};function Xe(e){var t=e.coordinate,n=e.translateX,r=e.translateY;return s(qe,He(He(He(He({},"".concat(qe,"-right"),k(n)&&t&&k(t.x)&&n>=t.x),"".concat(qe,"-left"),k(n)&&t&&k(t.x)&&n<t.x),"".concat(qe,"-bottom"),k(r)&&t&&k(t.y)&&r>=t.y),"".concat(qe,"-top"),k(r)&&t&&k(t.y)&&r<t.y))}function $e(e){var t=e.allowEscapeViewBox,n=e.coordinate,r=e.key,o=e.offsetTopLeft,i=e.position,a=e.reverseDirection,l=e.tooltipDimension,u=e.viewBox,c=e.viewBoxDimension;if(i&&k(i[r]))return i[r];var s=n[r]-l-o,f=n[r]+o;return t[r]?a[r]?s:f:a[r]?s<u[r]?Math.max(f,u[r]):Math.max(s,u[r]):f+l>u[r]+c?Math.max(s,u[r]):Math.max(f,u[r])}function Ye(e){return Ye="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ye(e)}function Ge(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ke(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Ge(Object(n),!0).forEach(function(t){nt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ge(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Qe(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,rt(r.key),r)}}function Ze(e,t,n){return t=et(t),function(e,t){if(t&&("object"===Ye(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Je()?Reflect.construct(t,n||[],et(e).constructor):t.apply(e,n))}function Je(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(Je=function(){return!!e})()}function et(e){return et=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},et(e)}function tt(e,t){return tt=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},tt(e,t)}function nt(e,t,n){return(t=rt(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function rt(e){var t=function(e,t){if("object"!=Ye(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Ye(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Ye(t)?t:t+""}var ot=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return nt(e=Ze(this,n,[].concat(r)),"state",{dismissed:!1,dismissedAtCoordinate:{x:0,y:0},lastBoundingBox:{width:-1,height:-1}}),nt(e,"handleKeyDown",function(t){var n,r,o,i;"Escape"===t.key&&e.setState({dismissed:!0,dismissedAtCoordinate:{x:null!==(n=null===(r=e.props.coordinate)||void 0===r?void 0:r.x)&&void 0!==n?n:0,y:null!==(o=null===(i=e.props.coordinate)||void 0===i?void 0:i.y)&&void 0!==o?o:0}})}),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&tt(e,t)}(n,e),r=n,(o=[{key:"updateBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var e=this.wrapperNode.getBoundingClientRect();(Math.abs(e.width-this.state.lastBoundingBox.width)>1||Math.abs(e.height-this.state.lastBoundingBox.height)>1)&&this.setState({lastBoundingBox:{width:e.width,height:e.height}})}else-1===this.state.lastBoundingBox.width&&-1===this.state.lastBoundingBox.height||this.setState({lastBoundingBox:{width:-1,height:-1}})}},{key:"componentDidMount",value:function(){document.addEventListener("keydown",this.handleKeyDown),this.updateBBox()}},{key:"componentWillUnmount",value:function(){document.removeEventListener("keydown",this.handleKeyDown)}},{key:"componentDidUpdate",value:function(){var e,t;this.props.active&&this.updateBBox(),this.state.dismissed&&((null===(e=this.props.coordinate)||void 0===e?void 0:e.x)===this.state.dismissedAtCoordinate.x&&(null===(t=this.props.coordinate)||void 0===t?void 0:t.y)===this.state.dismissedAtCoordinate.y||(this.state.dismissed=!1))}},{key:"render",value:function(){var e=this,n=this.props,r=n.active,o=n.allowEscapeViewBox,i=n.animationDuration,a=n.animationEasing,l=n.children,u=n.coordinate,c=n.hasPayload,s=n.isAnimationActive,f=n.offset,d=n.position,p=n.reverseDirection,h=n.useTranslate3d,y=n.viewBox,v=n.wrapperStyle,m=function(e){var t,n,r=e.allowEscapeViewBox,o=e.coordinate,i=e.offsetTopLeft,a=e.position,l=e.reverseDirection,u=e.tooltipBox,c=e.useTranslate3d,s=e.viewBox;return{cssProperties:u.height>0&&u.width>0&&o?function(e){var t=e.translateX,n=e.translateY;return{transform:e.useTranslate3d?"translate3d(".concat(t,"px, ").concat(n,"px, 0)"):"translate(".concat(t,"px, ").concat(n,"px)")}}({translateX:t=$e({allowEscapeViewBox:r,coordinate:o,key:"x",offsetTopLeft:i,position:a,reverseDirection:l,tooltipDimension:u.width,viewBox:s,viewBoxDimension:s.width}),translateY:n=$e({allowEscapeViewBox:r,coordinate:o,key:"y",offsetTopLeft:i,position:a,reverseDirection:l,tooltipDimension:u.height,viewBox:s,viewBoxDimension:s.height}),useTranslate3d:c}):Ve,cssClasses:Xe({translateX:t,translateY:n,coordinate:o})}}({allowEscapeViewBox:o,coordinate:u,offsetTopLeft:f,position:d,reverseDirection:p,tooltipBox:this.state.lastBoundingBox,useTranslate3d:h,viewBox:y}),g=m.cssClasses,b=m.cssProperties,x=Ke(Ke({transition:s&&r?"transform ".concat(i,"ms ").concat(a):void 0},b),{},{pointerEvents:"none",visibility:!this.state.dismissed&&r&&c?"visible":"hidden",position:"absolute",top:0,left:0},v);return t.createElement("div",{tabIndex:-1,className:g,style:x,ref:function(t){e.wrapperNode=t}},l)}}])&&Qe(r.prototype,o),i&&Qe(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent),it={isSsr:!("undefined"!==typeof window&&window.document&&window.document.createElement&&window.setTimeout),get:function(e){return it[e]},set:function(e,t){if("string"===typeof e)it[e]=t;else{var n=Object.keys(e);n&&n.length&&n.forEach(function(t){it[t]=e[t]})}}},at=n(977),lt=n.n(at);function ut(e,t,n){return!0===t?lt()(e,n):z()(t)?lt()(e,t):e}function ct(e){return ct="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ct(e)}function st(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ft(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?st(Object(n),!0).forEach(function(t){mt(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):st(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function dt(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,gt(r.key),r)}}function pt(e,t,n){return t=yt(t),function(e,t){if(t&&("object"===ct(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,ht()?Reflect.construct(t,n||[],yt(e).constructor):t.apply(e,n))}function ht(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(ht=function(){return!!e})()}function yt(e){return yt=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},yt(e)}function vt(e,t){return vt=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},vt(e,t)}function mt(e,t,n){return(t=gt(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function gt(e){var t=function(e,t){if("object"!=ct(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=ct(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==ct(t)?t:t+""}function bt(e){return e.dataKey}var xt=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),pt(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&vt(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){var e=this,n=this.props,r=n.active,o=n.allowEscapeViewBox,i=n.animationDuration,a=n.animationEasing,l=n.content,u=n.coordinate,c=n.filterNull,s=n.isAnimationActive,f=n.offset,d=n.payload,p=n.payloadUniqBy,h=n.position,y=n.reverseDirection,v=n.useTranslate3d,m=n.viewBox,g=n.wrapperStyle,b=null!==d&&void 0!==d?d:[];c&&b.length&&(b=ut(d.filter(function(t){return null!=t.value&&(!0!==t.hide||e.props.includeHidden)}),p,bt));var x=b.length>0;return t.createElement(ot,{allowEscapeViewBox:o,animationDuration:i,animationEasing:a,isAnimationActive:s,active:r,coordinate:u,hasPayload:x,offset:f,position:h,reverseDirection:y,useTranslate3d:v,viewBox:m,wrapperStyle:g},function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):"function"===typeof e?t.createElement(e,n):t.createElement(Ue,n)}(l,ft(ft({},this.props),{},{payload:b})))}}])&&dt(r.prototype,o),i&&dt(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);mt(xt,"displayName","Tooltip"),mt(xt,"defaultProps",{accessibilityLayer:!1,allowEscapeViewBox:{x:!1,y:!1},animationDuration:400,animationEasing:"ease",contentStyle:{},coordinate:{x:0,y:0},cursor:!0,cursorStyle:{},filterNull:!0,isAnimationActive:!it.isSsr,itemStyle:{},labelStyle:{},offset:10,reverseDirection:{x:!1,y:!1},separator:" : ",trigger:"hover",useTranslate3d:!1,viewBox:{x:0,y:0,height:0,width:0},wrapperStyle:{}});var wt=n(643),Ot=n.n(wt);Math.abs,Math.atan2;const St=Math.cos,jt=(Math.max,Math.min,Math.sin),kt=Math.sqrt,Pt=Math.PI,Et=2*Pt;const _t={draw(e,t){const n=kt(t/Pt);e.moveTo(n,0),e.arc(0,0,n,0,Et)}},Mt={draw(e,t){const n=kt(t/5)/2;e.moveTo(-3*n,-n),e.lineTo(-n,-n),e.lineTo(-n,-3*n),e.lineTo(n,-3*n),e.lineTo(n,-n),e.lineTo(3*n,-n),e.lineTo(3*n,n),e.lineTo(n,n),e.lineTo(n,3*n),e.lineTo(-n,3*n),e.lineTo(-n,n),e.lineTo(-3*n,n),e.closePath()}},At=kt(1/3),Ct=2*At,Tt={draw(e,t){const n=kt(t/Ct),r=n*At;e.moveTo(0,-n),e.lineTo(r,0),e.lineTo(0,n),e.lineTo(-r,0),e.closePath()}},Nt={draw(e,t){const n=kt(t),r=-n/2;e.rect(r,r,n,n)}},Dt=jt(Pt/10)/jt(7*Pt/10),It=jt(Et/10)*Dt,zt=-St(Et/10)*Dt,Rt={draw(e,t){const n=kt(.8908130915292852*t),r=It*n,o=zt*n;e.moveTo(0,-n),e.lineTo(r,o);for(let i=1;i<5;++i){const t=Et*i/5,a=St(t),l=jt(t);e.lineTo(l*n,-a*n),e.lineTo(a*r-l*o,l*r+a*o)}e.closePath()}},Lt=kt(3),Bt={draw(e,t){const n=-kt(t/(3*Lt));e.moveTo(0,2*n),e.lineTo(-Lt*n,-n),e.lineTo(Lt*n,-n),e.closePath()}},Ft=-.5,Ut=kt(3)/2,Wt=1/kt(12),Ht=3*(Wt/2+1),qt={draw(e,t){const n=kt(t/Ht),r=n/2,o=n*Wt,i=r,a=n*Wt+n,l=-i,u=a;e.moveTo(r,o),e.lineTo(i,a),e.lineTo(l,u),e.lineTo(Ft*r-Ut*o,Ut*r+Ft*o),e.lineTo(Ft*i-Ut*a,Ut*i+Ft*a),e.lineTo(Ft*l-Ut*u,Ut*l+Ft*u),e.lineTo(Ft*r+Ut*o,Ft*o-Ut*r),e.lineTo(Ft*i+Ut*a,Ft*a-Ut*i),e.lineTo(Ft*l+Ut*u,Ft*u-Ut*l),e.closePath()}};function Vt(e){return function(){return e}}function Xt(e,t){return t||(t=e.slice(0)),Object.freeze(Object.defineProperties(e,{raw:{value:Object.freeze(t)}}))}var $t,Yt,Gt,Kt,Qt,Zt,Jt,en,tn,nn,rn,on,an,ln;const un=Math.PI,cn=2*un,sn=1e-6,fn=cn-sn;function dn(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}class pn{constructor(e){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=null==e?dn:function(e){let t=Math.floor(e);if(!(t>=0))throw new Error("invalid digits: ".concat(e));if(t>15)return dn;const n=10**t;return function(e){this._+=e[0];for(let t=1,r=e.length;t<r;++t)this._+=Math.round(arguments[t]*n)/n+e[t]}}(e)}moveTo(e,t){this._append($t||($t=Xt(["M",",",""])),this._x0=this._x1=+e,this._y0=this._y1=+t)}closePath(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._append(Yt||(Yt=Xt(["Z"]))))}lineTo(e,t){this._append(Gt||(Gt=Xt(["L",",",""])),this._x1=+e,this._y1=+t)}quadraticCurveTo(e,t,n,r){this._append(Kt||(Kt=Xt(["Q",",",",",",",""])),+e,+t,this._x1=+n,this._y1=+r)}bezierCurveTo(e,t,n,r,o,i){this._append(Qt||(Qt=Xt(["C",",",",",",",",",",",""])),+e,+t,+n,+r,this._x1=+o,this._y1=+i)}arcTo(e,t,n,r,o){if(e=+e,t=+t,n=+n,r=+r,(o=+o)<0)throw new Error("negative radius: ".concat(o));let i=this._x1,a=this._y1,l=n-e,u=r-t,c=i-e,s=a-t,f=c*c+s*s;if(null===this._x1)this._append(Zt||(Zt=Xt(["M",",",""])),this._x1=e,this._y1=t);else if(f>sn)if(Math.abs(s*l-u*c)>sn&&o){let d=n-i,p=r-a,h=l*l+u*u,y=d*d+p*p,v=Math.sqrt(h),m=Math.sqrt(f),g=o*Math.tan((un-Math.acos((h+f-y)/(2*v*m)))/2),b=g/m,x=g/v;Math.abs(b-1)>sn&&this._append(en||(en=Xt(["L",",",""])),e+b*c,t+b*s),this._append(tn||(tn=Xt(["A",",",",0,0,",",",",",""])),o,o,+(s*d>c*p),this._x1=e+x*l,this._y1=t+x*u)}else this._append(Jt||(Jt=Xt(["L",",",""])),this._x1=e,this._y1=t);else;}arc(e,t,n,r,o,i){if(e=+e,t=+t,i=!!i,(n=+n)<0)throw new Error("negative radius: ".concat(n));let a=n*Math.cos(r),l=n*Math.sin(r),u=e+a,c=t+l,s=1^i,f=i?r-o:o-r;null===this._x1?this._append(nn||(nn=Xt(["M",",",""])),u,c):(Math.abs(this._x1-u)>sn||Math.abs(this._y1-c)>sn)&&this._append(rn||(rn=Xt(["L",",",""])),u,c),n&&(f<0&&(f=f%cn+cn),f>fn?this._append(on||(on=Xt(["A",",",",0,1,",",",",","A",",",",0,1,",",",",",""])),n,n,s,e-a,t-l,n,n,s,this._x1=u,this._y1=c):f>sn&&this._append(an||(an=Xt(["A",",",",0,",",",",",",",""])),n,n,+(f>=un),s,this._x1=e+n*Math.cos(o),this._y1=t+n*Math.sin(o)))}rect(e,t,n,r){this._append(ln||(ln=Xt(["M",",","h","v","h","Z"])),this._x0=this._x1=+e,this._y0=this._y1=+t,n=+n,+r,-n)}toString(){return this._}}function hn(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(null==n)t=null;else{const e=Math.floor(n);if(!(e>=0))throw new RangeError("invalid digits: ".concat(n));t=e}return e},()=>new pn(t)}kt(3),kt(3);function yn(e){return yn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yn(e)}var vn=["type","size","sizeType"];function mn(){return mn=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},mn.apply(this,arguments)}function gn(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function bn(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?gn(Object(n),!0).forEach(function(t){xn(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):gn(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function xn(e,t,n){return t=function(e){var t=function(e,t){if("object"!=yn(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=yn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==yn(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function wn(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var On={symbolCircle:_t,symbolCross:Mt,symbolDiamond:Tt,symbolSquare:Nt,symbolStar:Rt,symbolTriangle:Bt,symbolWye:qt},Sn=Math.PI/180,jn=function(e){var n=e.type,r=void 0===n?"circle":n,o=e.size,i=void 0===o?64:o,a=e.sizeType,l=void 0===a?"area":a,u=bn(bn({},wn(e,vn)),{},{type:r,size:i,sizeType:l}),c=u.className,f=u.cx,d=u.cy,p=ue(u,!0);return f===+f&&d===+d&&i===+i?t.createElement("path",mn({},p,{className:s("recharts-symbols",c),transform:"translate(".concat(f,", ").concat(d,")"),d:function(){var e=function(e){var t="symbol".concat(Ot()(e));return On[t]||_t}(r),t=function(e,t){let n=null,r=hn(o);function o(){let o;if(n||(n=o=r()),e.apply(this,arguments).draw(n,+t.apply(this,arguments)),o)return n=null,o+""||null}return e="function"===typeof e?e:Vt(e||_t),t="function"===typeof t?t:Vt(void 0===t?64:+t),o.type=function(t){return arguments.length?(e="function"===typeof t?t:Vt(t),o):e},o.size=function(e){return arguments.length?(t="function"===typeof e?e:Vt(+e),o):t},o.context=function(e){return arguments.length?(n=null==e?null:e,o):n},o}().type(e).size(function(e,t,n){if("area"===t)return e;switch(n){case"cross":return 5*e*e/9;case"diamond":return.5*e*e/Math.sqrt(3);case"square":return e*e;case"star":var r=18*Sn;return 1.25*e*e*(Math.tan(r)-Math.tan(2*r)*Math.pow(Math.tan(r),2));case"triangle":return Math.sqrt(3)*e*e/4;case"wye":return(21-10*Math.sqrt(3))*e*e/8;default:return Math.PI*e*e/4}}(i,l,r));return t()}()})):null};function kn(e){return kn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},kn(e)}function Pn(){return Pn=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Pn.apply(this,arguments)}function En(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function _n(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Dn(r.key),r)}}function Mn(e,t,n){return t=Cn(t),function(e,t){if(t&&("object"===kn(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,An()?Reflect.construct(t,n||[],Cn(e).constructor):t.apply(e,n))}function An(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(An=function(){return!!e})()}function Cn(e){return Cn=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Cn(e)}function Tn(e,t){return Tn=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Tn(e,t)}function Nn(e,t,n){return(t=Dn(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Dn(e){var t=function(e,t){if("object"!=kn(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=kn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==kn(t)?t:t+""}jn.registerSymbol=function(e,t){On["symbol".concat(Ot()(e))]=t};var In=32,zn=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),Mn(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Tn(e,t)}(n,e),r=n,o=[{key:"renderIcon",value:function(e){var n=this.props.inactiveColor,r=16,o=In/6,i=In/3,a=e.inactive?n:e.color;if("plainline"===e.type)return t.createElement("line",{strokeWidth:4,fill:"none",stroke:a,strokeDasharray:e.payload.strokeDasharray,x1:0,y1:r,x2:In,y2:r,className:"recharts-legend-icon"});if("line"===e.type)return t.createElement("path",{strokeWidth:4,fill:"none",stroke:a,d:"M0,".concat(r,"h").concat(i,"\n            A").concat(o,",").concat(o,",0,1,1,").concat(2*i,",").concat(r,"\n            H").concat(In,"M").concat(2*i,",").concat(r,"\n            A").concat(o,",").concat(o,",0,1,1,").concat(i,",").concat(r),className:"recharts-legend-icon"});if("rect"===e.type)return t.createElement("path",{stroke:"none",fill:a,d:"M0,".concat(4,"h").concat(In,"v").concat(24,"h").concat(-32,"z"),className:"recharts-legend-icon"});if(t.isValidElement(e.legendIcon)){var l=function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?En(Object(n),!0).forEach(function(t){Nn(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):En(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({},e);return delete l.legendIcon,t.cloneElement(e.legendIcon,l)}return t.createElement(jn,{fill:a,cx:r,cy:r,size:In,sizeType:"diameter",type:e.type})}},{key:"renderItems",value:function(){var e=this,n=this.props,r=n.payload,o=n.iconSize,i=n.layout,a=n.formatter,l=n.inactiveColor,u={x:0,y:0,width:In,height:In},c={display:"horizontal"===i?"inline-block":"block",marginRight:10},f={display:"inline-block",verticalAlign:"middle",marginRight:4};return r.map(function(n,r){var i=n.formatter||a,d=s(Nn(Nn({"recharts-legend-item":!0},"legend-item-".concat(r),!0),"inactive",n.inactive));if("none"===n.type)return null;var p=z()(n.value)?null:n.value;D(!z()(n.value),'The name property is also required when using a function for the dataKey of a chart\'s cartesian components. Ex: <Bar name="Name of my Data"/>');var h=n.inactive?l:n.color;return t.createElement("li",Pn({className:d,style:c,key:"legend-item-".concat(r)},$(e.props,n,r)),t.createElement(_e,{width:o,height:o,viewBox:u,style:f},e.renderIcon(n)),t.createElement("span",{className:"recharts-legend-item-text",style:{color:h}},i?i(p,n,r):p))})}},{key:"render",value:function(){var e=this.props,n=e.payload,r=e.layout,o=e.align;if(!n||!n.length)return null;var i={padding:0,margin:0,textAlign:"horizontal"===r?o:"left"};return t.createElement("ul",{className:"recharts-default-legend",style:i},this.renderItems())}}],o&&_n(r.prototype,o),i&&_n(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function Rn(e){return Rn="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Rn(e)}Nn(zn,"displayName","Legend"),Nn(zn,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"middle",inactiveColor:"#ccc"});var Ln=["ref"];function Bn(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Fn(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Bn(Object(n),!0).forEach(function(t){Xn(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Bn(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Un(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,$n(r.key),r)}}function Wn(e,t,n){return t=qn(t),function(e,t){if(t&&("object"===Rn(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Hn()?Reflect.construct(t,n||[],qn(e).constructor):t.apply(e,n))}function Hn(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(Hn=function(){return!!e})()}function qn(e){return qn=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},qn(e)}function Vn(e,t){return Vn=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Vn(e,t)}function Xn(e,t,n){return(t=$n(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function $n(e){var t=function(e,t){if("object"!=Rn(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Rn(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Rn(t)?t:t+""}function Yn(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Gn(e){return e.value}var Kn=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return Xn(e=Wn(this,n,[].concat(r)),"lastBoundingBox",{width:-1,height:-1}),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Vn(e,t)}(n,e),r=n,i=[{key:"getWithHeight",value:function(e,t){var n=Fn(Fn({},this.defaultProps),e.props).layout;return"vertical"===n&&k(e.props.height)?{height:e.props.height}:"horizontal"===n?{width:e.props.width||t}:null}}],(o=[{key:"componentDidMount",value:function(){this.updateBBox()}},{key:"componentDidUpdate",value:function(){this.updateBBox()}},{key:"getBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var e=this.wrapperNode.getBoundingClientRect();return e.height=this.wrapperNode.offsetHeight,e.width=this.wrapperNode.offsetWidth,e}return null}},{key:"updateBBox",value:function(){var e=this.props.onBBoxUpdate,t=this.getBBox();t?(Math.abs(t.width-this.lastBoundingBox.width)>1||Math.abs(t.height-this.lastBoundingBox.height)>1)&&(this.lastBoundingBox.width=t.width,this.lastBoundingBox.height=t.height,e&&e(t)):-1===this.lastBoundingBox.width&&-1===this.lastBoundingBox.height||(this.lastBoundingBox.width=-1,this.lastBoundingBox.height=-1,e&&e(null))}},{key:"getBBoxSnapshot",value:function(){return this.lastBoundingBox.width>=0&&this.lastBoundingBox.height>=0?Fn({},this.lastBoundingBox):{width:0,height:0}}},{key:"getDefaultPosition",value:function(e){var t,n,r=this.props,o=r.layout,i=r.align,a=r.verticalAlign,l=r.margin,u=r.chartWidth,c=r.chartHeight;return e&&(void 0!==e.left&&null!==e.left||void 0!==e.right&&null!==e.right)||(t="center"===i&&"vertical"===o?{left:((u||0)-this.getBBoxSnapshot().width)/2}:"right"===i?{right:l&&l.right||0}:{left:l&&l.left||0}),e&&(void 0!==e.top&&null!==e.top||void 0!==e.bottom&&null!==e.bottom)||(n="middle"===a?{top:((c||0)-this.getBBoxSnapshot().height)/2}:"bottom"===a?{bottom:l&&l.bottom||0}:{top:l&&l.top||0}),Fn(Fn({},t),n)}},{key:"render",value:function(){var e=this,n=this.props,r=n.content,o=n.width,i=n.height,a=n.wrapperStyle,l=n.payloadUniqBy,u=n.payload,c=Fn(Fn({position:"absolute",width:o||"auto",height:i||"auto"},this.getDefaultPosition(a)),a);return t.createElement("div",{className:"recharts-legend-wrapper",style:c,ref:function(t){e.wrapperNode=t}},function(e,n){if(t.isValidElement(e))return t.cloneElement(e,n);if("function"===typeof e)return t.createElement(e,n);n.ref;var r=Yn(n,Ln);return t.createElement(zn,r)}(r,Fn(Fn({},this.props),{},{payload:ut(u,l,Gn)})))}}])&&Un(r.prototype,o),i&&Un(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function Qn(){return Qn=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Qn.apply(this,arguments)}Xn(Kn,"displayName","Legend"),Xn(Kn,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"bottom"});var Zn=function(e){var n=e.cx,r=e.cy,o=e.r,i=e.className,a=s("recharts-dot",i);return n===+n&&r===+r&&o===+o?t.createElement("circle",Qn({},ue(e,!1),X(e),{className:a,cx:n,cy:r,r:o})):null},Jn=n(5173),er=n.n(Jn);const{getOwnPropertyNames:tr,getOwnPropertySymbols:nr}=Object,{hasOwnProperty:rr}=Object.prototype;function or(e,t){return function(n,r,o){return e(n,r,o)&&t(n,r,o)}}function ir(e){return function(t,n,r){if(!t||!n||"object"!==typeof t||"object"!==typeof n)return e(t,n,r);const{cache:o}=r,i=o.get(t),a=o.get(n);if(i&&a)return i===n&&a===t;o.set(t,n),o.set(n,t);const l=e(t,n,r);return o.delete(t),o.delete(n),l}}function ar(e){return tr(e).concat(nr(e))}const lr=Object.hasOwn||((e,t)=>rr.call(e,t));function ur(e,t){return e===t||!e&&!t&&e!==e&&t!==t}const{getOwnPropertyDescriptor:cr,keys:sr}=Object;function fr(e,t){return e.byteLength===t.byteLength&&jr(new Uint8Array(e),new Uint8Array(t))}function dr(e,t,n){let r=e.length;if(t.length!==r)return!1;for(;r-- >0;)if(!n.equals(e[r],t[r],r,r,e,t,n))return!1;return!0}function pr(e,t){return e.byteLength===t.byteLength&&jr(new Uint8Array(e.buffer,e.byteOffset,e.byteLength),new Uint8Array(t.buffer,t.byteOffset,t.byteLength))}function hr(e,t){return ur(e.getTime(),t.getTime())}function yr(e,t){return e.name===t.name&&e.message===t.message&&e.cause===t.cause&&e.stack===t.stack}function vr(e,t){return e===t}function mr(e,t,n){const r=e.size;if(r!==t.size)return!1;if(!r)return!0;const o=new Array(r),i=e.entries();let a,l,u=0;for(;(a=i.next())&&!a.done;){const r=t.entries();let i=!1,c=0;for(;(l=r.next())&&!l.done;){if(o[c]){c++;continue}const r=a.value,s=l.value;if(n.equals(r[0],s[0],u,c,e,t,n)&&n.equals(r[1],s[1],r[0],s[0],e,t,n)){i=o[c]=!0;break}c++}if(!i)return!1;u++}return!0}const gr=ur;function br(e,t,n){const r=sr(e);let o=r.length;if(sr(t).length!==o)return!1;for(;o-- >0;)if(!Pr(e,t,n,r[o]))return!1;return!0}function xr(e,t,n){const r=ar(e);let o,i,a,l=r.length;if(ar(t).length!==l)return!1;for(;l-- >0;){if(o=r[l],!Pr(e,t,n,o))return!1;if(i=cr(e,o),a=cr(t,o),(i||a)&&(!i||!a||i.configurable!==a.configurable||i.enumerable!==a.enumerable||i.writable!==a.writable))return!1}return!0}function wr(e,t){return ur(e.valueOf(),t.valueOf())}function Or(e,t){return e.source===t.source&&e.flags===t.flags}function Sr(e,t,n){const r=e.size;if(r!==t.size)return!1;if(!r)return!0;const o=new Array(r),i=e.values();let a,l;for(;(a=i.next())&&!a.done;){const r=t.values();let i=!1,u=0;for(;(l=r.next())&&!l.done;){if(!o[u]&&n.equals(a.value,l.value,a.value,l.value,e,t,n)){i=o[u]=!0;break}u++}if(!i)return!1}return!0}function jr(e,t){let n=e.byteLength;if(t.byteLength!==n||e.byteOffset!==t.byteOffset)return!1;for(;n-- >0;)if(e[n]!==t[n])return!1;return!0}function kr(e,t){return e.hostname===t.hostname&&e.pathname===t.pathname&&e.protocol===t.protocol&&e.port===t.port&&e.hash===t.hash&&e.username===t.username&&e.password===t.password}function Pr(e,t,n,r){return!("_owner"!==r&&"__o"!==r&&"__v"!==r||!e.$$typeof&&!t.$$typeof)||lr(t,r)&&n.equals(e[r],t[r],r,r,e,t,n)}const Er={"[object Int8Array]":!0,"[object Uint8Array]":!0,"[object Uint8ClampedArray]":!0,"[object Int16Array]":!0,"[object Uint16Array]":!0,"[object Int32Array]":!0,"[object Uint32Array]":!0,"[object Float16Array]":!0,"[object Float32Array]":!0,"[object Float64Array]":!0,"[object BigInt64Array]":!0,"[object BigUint64Array]":!0},_r=Object.prototype.toString;function Mr(e){let{areArrayBuffersEqual:t,areArraysEqual:n,areDataViewsEqual:r,areDatesEqual:o,areErrorsEqual:i,areFunctionsEqual:a,areMapsEqual:l,areNumbersEqual:u,areObjectsEqual:c,arePrimitiveWrappersEqual:s,areRegExpsEqual:f,areSetsEqual:d,areTypedArraysEqual:p,areUrlsEqual:h,unknownTagComparators:y}=e;return function(e,v,m){if(e===v)return!0;if(null==e||null==v)return!1;const g=typeof e;if(g!==typeof v)return!1;if("object"!==g)return"number"===g?u(e,v,m):"function"===g&&a(e,v,m);const b=e.constructor;if(b!==v.constructor)return!1;if(b===Object)return c(e,v,m);if(Array.isArray(e))return n(e,v,m);if(b===Date)return o(e,v,m);if(b===RegExp)return f(e,v,m);if(b===Map)return l(e,v,m);if(b===Set)return d(e,v,m);const x=_r.call(e);if("[object Date]"===x)return o(e,v,m);if("[object RegExp]"===x)return f(e,v,m);if("[object Map]"===x)return l(e,v,m);if("[object Set]"===x)return d(e,v,m);if("[object Object]"===x)return"function"!==typeof e.then&&"function"!==typeof v.then&&c(e,v,m);if("[object URL]"===x)return h(e,v,m);if("[object Error]"===x)return i(e,v,m);if("[object Arguments]"===x)return c(e,v,m);if(Er[x])return p(e,v,m);if("[object ArrayBuffer]"===x)return t(e,v,m);if("[object DataView]"===x)return r(e,v,m);if("[object Boolean]"===x||"[object Number]"===x||"[object String]"===x)return s(e,v,m);if(y){let t=y[x];if(!t){const n=function(e){return null!=e?e[Symbol.toStringTag]:void 0}(e);n&&(t=y[n])}if(t)return t(e,v,m)}return!1}}const Ar=Cr();Cr({strict:!0}),Cr({circular:!0}),Cr({circular:!0,strict:!0}),Cr({createInternalComparator:()=>ur}),Cr({strict:!0,createInternalComparator:()=>ur}),Cr({circular:!0,createInternalComparator:()=>ur}),Cr({circular:!0,createInternalComparator:()=>ur,strict:!0});function Cr(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const{circular:t=!1,createInternalComparator:n,createState:r,strict:o=!1}=e,i=function(e){let{circular:t,createCustomConfig:n,strict:r}=e,o={areArrayBuffersEqual:fr,areArraysEqual:r?xr:dr,areDataViewsEqual:pr,areDatesEqual:hr,areErrorsEqual:yr,areFunctionsEqual:vr,areMapsEqual:r?or(mr,xr):mr,areNumbersEqual:gr,areObjectsEqual:r?xr:br,arePrimitiveWrappersEqual:wr,areRegExpsEqual:Or,areSetsEqual:r?or(Sr,xr):Sr,areTypedArraysEqual:r?or(jr,xr):jr,areUrlsEqual:kr,unknownTagComparators:void 0};if(n&&(o=Object.assign({},o,n(o))),t){const e=ir(o.areArraysEqual),t=ir(o.areMapsEqual),n=ir(o.areObjectsEqual),r=ir(o.areSetsEqual);o=Object.assign({},o,{areArraysEqual:e,areMapsEqual:t,areObjectsEqual:n,areSetsEqual:r})}return o}(e),a=Mr(i),l=n?n(a):(u=a,function(e,t,n,r,o,i,a){return u(e,t,a)});var u;return function(e){let{circular:t,comparator:n,createState:r,equals:o,strict:i}=e;if(r)return function(e,a){const{cache:l=(t?new WeakMap:void 0),meta:u}=r();return n(e,a,{cache:l,equals:o,meta:u,strict:i})};if(t)return function(e,t){return n(e,t,{cache:new WeakMap,equals:o,meta:void 0,strict:i})};const a={cache:void 0,equals:o,meta:void 0,strict:i};return function(e,t){return n(e,t,a)}}({circular:t,comparator:a,createState:r,equals:l,strict:o})}function Tr(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=-1;requestAnimationFrame(function r(o){n<0&&(n=o),o-n>t?(e(o),n=-1):function(e){"undefined"!==typeof requestAnimationFrame&&requestAnimationFrame(e)}(r)})}function Nr(e){return Nr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Nr(e)}function Dr(e){return function(e){if(Array.isArray(e))return e}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Ir(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Ir(e,t)}(e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ir(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function zr(){var e=function(){return null},t=!1,n=function n(r){if(!t){if(Array.isArray(r)){if(!r.length)return;var o=Dr(r),i=o[0],a=o.slice(1);return"number"===typeof i?void Tr(n.bind(null,a),i):(n(i),void Tr(n.bind(null,a)))}"object"===Nr(r)&&e(r),"function"===typeof r&&r()}};return{stop:function(){t=!0},start:function(e){t=!1,n(e)},subscribe:function(t){return e=t,function(){e=function(){return null}}}}}function Rr(e){return Rr="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Rr(e)}function Lr(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Br(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Lr(Object(n),!0).forEach(function(t){Fr(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Lr(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Fr(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==Rr(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==Rr(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===Rr(t)?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var Ur=function(e){return e},Wr=function(e,t){return Object.keys(t).reduce(function(n,r){return Br(Br({},n),{},Fr({},r,e(r,t[r])))},{})},Hr=function(e,t,n){return e.map(function(e){return"".concat((r=e,r.replace(/([A-Z])/g,function(e){return"-".concat(e.toLowerCase())}))," ").concat(t,"ms ").concat(n);var r}).join(",")};function qr(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||Xr(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Vr(e){return function(e){if(Array.isArray(e))return $r(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||Xr(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Xr(e,t){if(e){if("string"===typeof e)return $r(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?$r(e,t):void 0}}function $r(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var Yr=1e-4,Gr=function(e,t){return[0,3*e,3*t-6*e,3*e-3*t+1]},Kr=function(e,t){return e.map(function(e,n){return e*Math.pow(t,n)}).reduce(function(e,t){return e+t})},Qr=function(e,t){return function(n){var r=Gr(e,t);return Kr(r,n)}},Zr=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=t[0],o=t[1],i=t[2],a=t[3];if(1===t.length)switch(t[0]){case"linear":r=0,o=0,i=1,a=1;break;case"ease":r=.25,o=.1,i=.25,a=1;break;case"ease-in":r=.42,o=0,i=1,a=1;break;case"ease-out":r=.42,o=0,i=.58,a=1;break;case"ease-in-out":r=0,o=0,i=.58,a=1;break;default:var l=t[0].split("(");if("cubic-bezier"===l[0]&&4===l[1].split(")")[0].split(",").length){var u=qr(l[1].split(")")[0].split(",").map(function(e){return parseFloat(e)}),4);r=u[0],o=u[1],i=u[2],a=u[3]}}[r,i,o,a].every(function(e){return"number"===typeof e&&e>=0&&e<=1});var c,s,f=Qr(r,i),d=Qr(o,a),p=(c=r,s=i,function(e){var t=Gr(c,s),n=[].concat(Vr(t.map(function(e,t){return e*t}).slice(1)),[0]);return Kr(n,e)}),h=function(e){return e>1?1:e<0?0:e},y=function(e){for(var t=e>1?1:e,n=t,r=0;r<8;++r){var o=f(n)-t,i=p(n);if(Math.abs(o-t)<Yr||i<Yr)return d(n);n=h(n-o/i)}return d(n)};return y.isStepper=!1,y},Jr=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=t[0];if("string"===typeof r)switch(r){case"ease":case"ease-in-out":case"ease-out":case"ease-in":case"linear":return Zr(r);case"spring":return function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.stiff,n=void 0===t?100:t,r=e.damping,o=void 0===r?8:r,i=e.dt,a=void 0===i?17:i,l=function(e,t,r){var i=r+(-(e-t)*n-r*o)*a/1e3,l=r*a/1e3+e;return Math.abs(l-t)<Yr&&Math.abs(i)<Yr?[t,0]:[l,i]};return l.isStepper=!0,l.dt=a,l}();default:if("cubic-bezier"===r.split("(")[0])return Zr(r)}return"function"===typeof r?r:null};function eo(e){return eo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},eo(e)}function to(e){return function(e){if(Array.isArray(e))return lo(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||ao(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function no(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ro(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?no(Object(n),!0).forEach(function(t){oo(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):no(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function oo(e,t,n){return(t=function(e){var t=function(e,t){if("object"!==eo(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==eo(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===eo(t)?t:String(t)}(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function io(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||ao(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ao(e,t){if(e){if("string"===typeof e)return lo(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?lo(e,t):void 0}}function lo(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var uo=function(e,t,n){return e+(t-e)*n},co=function(e){return e.from!==e.to},so=function e(t,n,r){var o=Wr(function(e,n){if(co(n)){var r=io(t(n.from,n.to,n.velocity),2),o=r[0],i=r[1];return ro(ro({},n),{},{from:o,velocity:i})}return n},n);return r<1?Wr(function(e,t){return co(t)?ro(ro({},t),{},{velocity:uo(t.velocity,o[e].velocity,r),from:uo(t.from,o[e].from,r)}):t},n):e(t,o,r-1)};const fo=function(e,t,n,r,o){var i,a,l,u,c=(i=e,a=t,[Object.keys(i),Object.keys(a)].reduce(function(e,t){return e.filter(function(e){return t.includes(e)})})),s=c.reduce(function(n,r){return ro(ro({},n),{},oo({},r,[e[r],t[r]]))},{}),f=c.reduce(function(n,r){return ro(ro({},n),{},oo({},r,{from:e[r],velocity:0,to:t[r]}))},{}),d=-1,p=function(){return null};return p=n.isStepper?function(r){l||(l=r);var i=(r-l)/n.dt;f=so(n,f,i),o(ro(ro(ro({},e),t),Wr(function(e,t){return t.from},f))),l=r,Object.values(f).filter(co).length&&(d=requestAnimationFrame(p))}:function(i){u||(u=i);var a=(i-u)/r,l=Wr(function(e,t){return uo.apply(void 0,to(t).concat([n(a)]))},s);if(o(ro(ro(ro({},e),t),l)),a<1)d=requestAnimationFrame(p);else{var c=Wr(function(e,t){return uo.apply(void 0,to(t).concat([n(1)]))},s);o(ro(ro(ro({},e),t),c))}},function(){return requestAnimationFrame(p),function(){cancelAnimationFrame(d)}}};function po(e){return po="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},po(e)}var ho=["children","begin","duration","attributeName","easing","isActive","steps","from","to","canBegin","onAnimationEnd","shouldReAnimate","onAnimationReStart"];function yo(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function vo(e){return function(e){if(Array.isArray(e))return mo(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return mo(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return mo(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function mo(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function go(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function bo(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?go(Object(n),!0).forEach(function(t){xo(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):go(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function xo(e,t,n){return(t=Oo(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function wo(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Oo(r.key),r)}}function Oo(e){var t=function(e,t){if("object"!==po(e)||null===e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!==po(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"===po(t)?t:String(t)}function So(e,t){return So=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},So(e,t)}function jo(e){var t=function(){if("undefined"===typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"===typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){})),!0}catch(e){return!1}}();return function(){var n,r=Eo(e);if(t){var o=Eo(this).constructor;n=Reflect.construct(r,arguments,o)}else n=r.apply(this,arguments);return ko(this,n)}}function ko(e,t){if(t&&("object"===po(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return Po(e)}function Po(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Eo(e){return Eo=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Eo(e)}var _o=function(e){!function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&So(e,t)}(a,e);var n,r,o,i=jo(a);function a(e,t){var n;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,a);var r=(n=i.call(this,e,t)).props,o=r.isActive,l=r.attributeName,u=r.from,c=r.to,s=r.steps,f=r.children,d=r.duration;if(n.handleStyleChange=n.handleStyleChange.bind(Po(n)),n.changeStyle=n.changeStyle.bind(Po(n)),!o||d<=0)return n.state={style:{}},"function"===typeof f&&(n.state={style:c}),ko(n);if(s&&s.length)n.state={style:s[0].style};else if(u){if("function"===typeof f)return n.state={style:u},ko(n);n.state={style:l?xo({},l,u):u}}else n.state={style:{}};return n}return n=a,(r=[{key:"componentDidMount",value:function(){var e=this.props,t=e.isActive,n=e.canBegin;this.mounted=!0,t&&n&&this.runAnimation(this.props)}},{key:"componentDidUpdate",value:function(e){var t=this.props,n=t.isActive,r=t.canBegin,o=t.attributeName,i=t.shouldReAnimate,a=t.to,l=t.from,u=this.state.style;if(r)if(n){if(!(Ar(e.to,a)&&e.canBegin&&e.isActive)){var c=!e.canBegin||!e.isActive;this.manager&&this.manager.stop(),this.stopJSAnimation&&this.stopJSAnimation();var s=c||i?l:e.to;if(this.state&&u){var f={style:o?xo({},o,s):s};(o&&u[o]!==s||!o&&u!==s)&&this.setState(f)}this.runAnimation(bo(bo({},this.props),{},{from:s,begin:0}))}}else{var d={style:o?xo({},o,a):a};this.state&&u&&(o&&u[o]!==a||!o&&u!==a)&&this.setState(d)}}},{key:"componentWillUnmount",value:function(){this.mounted=!1;var e=this.props.onAnimationEnd;this.unSubscribe&&this.unSubscribe(),this.manager&&(this.manager.stop(),this.manager=null),this.stopJSAnimation&&this.stopJSAnimation(),e&&e()}},{key:"handleStyleChange",value:function(e){this.changeStyle(e)}},{key:"changeStyle",value:function(e){this.mounted&&this.setState({style:e})}},{key:"runJSAnimation",value:function(e){var t=this,n=e.from,r=e.to,o=e.duration,i=e.easing,a=e.begin,l=e.onAnimationEnd,u=e.onAnimationStart,c=fo(n,r,Jr(i),o,this.changeStyle);this.manager.start([u,a,function(){t.stopJSAnimation=c()},o,l])}},{key:"runStepAnimation",value:function(e){var t=this,n=e.steps,r=e.begin,o=e.onAnimationStart,i=n[0],a=i.style,l=i.duration,u=void 0===l?0:l;return this.manager.start([o].concat(vo(n.reduce(function(e,r,o){if(0===o)return e;var i=r.duration,a=r.easing,l=void 0===a?"ease":a,u=r.style,c=r.properties,s=r.onAnimationEnd,f=o>0?n[o-1]:r,d=c||Object.keys(u);if("function"===typeof l||"spring"===l)return[].concat(vo(e),[t.runJSAnimation.bind(t,{from:f.style,to:u,duration:i,easing:l}),i]);var p=Hr(d,i,l),h=bo(bo(bo({},f.style),u),{},{transition:p});return[].concat(vo(e),[h,i,s]).filter(Ur)},[a,Math.max(u,r)])),[e.onAnimationEnd]))}},{key:"runAnimation",value:function(e){this.manager||(this.manager=zr());var t=e.begin,n=e.duration,r=e.attributeName,o=e.to,i=e.easing,a=e.onAnimationStart,l=e.onAnimationEnd,u=e.steps,c=e.children,s=this.manager;if(this.unSubscribe=s.subscribe(this.handleStyleChange),"function"!==typeof i&&"function"!==typeof c&&"spring"!==i)if(u.length>1)this.runStepAnimation(e);else{var f=r?xo({},r,o):o,d=Hr(Object.keys(f),n,i);s.start([a,t,bo(bo({},f),{},{transition:d}),n,l])}else this.runJSAnimation(e)}},{key:"render",value:function(){var e=this.props,n=e.children,r=(e.begin,e.duration),o=(e.attributeName,e.easing,e.isActive),i=(e.steps,e.from,e.to,e.canBegin,e.onAnimationEnd,e.shouldReAnimate,e.onAnimationReStart,yo(e,ho)),a=t.Children.count(n),l=this.state.style;if("function"===typeof n)return n(l);if(!o||0===a||r<=0)return n;var u=function(e){var n=e.props,r=n.style,o=void 0===r?{}:r,a=n.className;return(0,t.cloneElement)(e,bo(bo({},i),{},{style:bo(bo({},o),l),className:a}))};return 1===a?u(t.Children.only(n)):t.createElement("div",null,t.Children.map(n,function(e){return u(e)}))}}])&&wo(n.prototype,r),o&&wo(n,o),Object.defineProperty(n,"prototype",{writable:!1}),a}(t.PureComponent);_o.displayName="Animate",_o.defaultProps={begin:0,duration:1e3,from:"",to:"",attributeName:"",easing:"ease",isActive:!0,canBegin:!0,steps:[],onAnimationEnd:function(){},onAnimationStart:function(){}},_o.propTypes={from:er().oneOfType([er().object,er().string]),to:er().oneOfType([er().object,er().string]),attributeName:er().string,duration:er().number,begin:er().number,easing:er().oneOfType([er().string,er().func]),steps:er().arrayOf(er().shape({duration:er().number.isRequired,style:er().object.isRequired,easing:er().oneOfType([er().oneOf(["ease","ease-in","ease-out","ease-in-out","linear"]),er().func]),properties:er().arrayOf("string"),onAnimationEnd:er().func})),children:er().oneOfType([er().node,er().func]),isActive:er().bool,canBegin:er().bool,onAnimationEnd:er().func,shouldReAnimate:er().bool,onAnimationStart:er().func,onAnimationReStart:er().func};const Mo=_o;function Ao(e){return Ao="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ao(e)}function Co(){return Co=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Co.apply(this,arguments)}function To(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return No(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return No(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function No(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Do(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Io(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Do(Object(n),!0).forEach(function(t){zo(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Do(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function zo(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Ao(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Ao(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Ao(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var Ro=function(e,t,n,r,o){var i,a=Math.min(Math.abs(n)/2,Math.abs(r)/2),l=r>=0?1:-1,u=n>=0?1:-1,c=r>=0&&n>=0||r<0&&n<0?1:0;if(a>0&&o instanceof Array){for(var s=[0,0,0,0],f=0;f<4;f++)s[f]=o[f]>a?a:o[f];i="M".concat(e,",").concat(t+l*s[0]),s[0]>0&&(i+="A ".concat(s[0],",").concat(s[0],",0,0,").concat(c,",").concat(e+u*s[0],",").concat(t)),i+="L ".concat(e+n-u*s[1],",").concat(t),s[1]>0&&(i+="A ".concat(s[1],",").concat(s[1],",0,0,").concat(c,",\n        ").concat(e+n,",").concat(t+l*s[1])),i+="L ".concat(e+n,",").concat(t+r-l*s[2]),s[2]>0&&(i+="A ".concat(s[2],",").concat(s[2],",0,0,").concat(c,",\n        ").concat(e+n-u*s[2],",").concat(t+r)),i+="L ".concat(e+u*s[3],",").concat(t+r),s[3]>0&&(i+="A ".concat(s[3],",").concat(s[3],",0,0,").concat(c,",\n        ").concat(e,",").concat(t+r-l*s[3])),i+="Z"}else if(a>0&&o===+o&&o>0){var d=Math.min(a,o);i="M ".concat(e,",").concat(t+l*d,"\n            A ").concat(d,",").concat(d,",0,0,").concat(c,",").concat(e+u*d,",").concat(t,"\n            L ").concat(e+n-u*d,",").concat(t,"\n            A ").concat(d,",").concat(d,",0,0,").concat(c,",").concat(e+n,",").concat(t+l*d,"\n            L ").concat(e+n,",").concat(t+r-l*d,"\n            A ").concat(d,",").concat(d,",0,0,").concat(c,",").concat(e+n-u*d,",").concat(t+r,"\n            L ").concat(e+u*d,",").concat(t+r,"\n            A ").concat(d,",").concat(d,",0,0,").concat(c,",").concat(e,",").concat(t+r-l*d," Z")}else i="M ".concat(e,",").concat(t," h ").concat(n," v ").concat(r," h ").concat(-n," Z");return i},Lo=function(e,t){if(!e||!t)return!1;var n=e.x,r=e.y,o=t.x,i=t.y,a=t.width,l=t.height;if(Math.abs(a)>0&&Math.abs(l)>0){var u=Math.min(o,o+a),c=Math.max(o,o+a),s=Math.min(i,i+l),f=Math.max(i,i+l);return n>=u&&n<=c&&r>=s&&r<=f}return!1},Bo={x:0,y:0,width:0,height:0,radius:0,isAnimationActive:!1,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},Fo=function(e){var n=Io(Io({},Bo),e),r=(0,t.useRef)(),o=To((0,t.useState)(-1),2),i=o[0],a=o[1];(0,t.useEffect)(function(){if(r.current&&r.current.getTotalLength)try{var e=r.current.getTotalLength();e&&a(e)}catch(t){}},[]);var l=n.x,u=n.y,c=n.width,f=n.height,d=n.radius,p=n.className,h=n.animationEasing,y=n.animationDuration,v=n.animationBegin,m=n.isAnimationActive,g=n.isUpdateAnimationActive;if(l!==+l||u!==+u||c!==+c||f!==+f||0===c||0===f)return null;var b=s("recharts-rectangle",p);return g?t.createElement(Mo,{canBegin:i>0,from:{width:c,height:f,x:l,y:u},to:{width:c,height:f,x:l,y:u},duration:y,animationEasing:h,isActive:g},function(e){var o=e.width,a=e.height,l=e.x,u=e.y;return t.createElement(Mo,{canBegin:i>0,from:"0px ".concat(-1===i?1:i,"px"),to:"".concat(i,"px 0px"),attributeName:"strokeDasharray",begin:v,duration:y,isActive:m,easing:h},t.createElement("path",Co({},ue(n,!0),{className:b,d:Ro(l,u,o,a,d),ref:r})))}):t.createElement("path",Co({},ue(n,!0),{className:b,d:Ro(l,u,c,f,d)}))};function Uo(e,t){switch(arguments.length){case 0:break;case 1:this.range(e);break;default:this.range(t).domain(e)}return this}function Wo(e,t){switch(arguments.length){case 0:break;case 1:"function"===typeof e?this.interpolator(e):this.range(e);break;default:this.domain(e),"function"===typeof t?this.interpolator(t):this.range(t)}return this}class Ho extends Map{constructor(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:$o;if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:t}}),null!=e)for(const[n,r]of e)this.set(n,r)}get(e){return super.get(qo(this,e))}has(e){return super.has(qo(this,e))}set(e,t){return super.set(Vo(this,e),t)}delete(e){return super.delete(Xo(this,e))}}Set;function qo(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)?n.get(o):t}function Vo(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)?n.get(o):(n.set(o,t),t)}function Xo(e,t){let{_intern:n,_key:r}=e;const o=r(t);return n.has(o)&&(t=n.get(o),n.delete(o)),t}function $o(e){return null!==e&&"object"===typeof e?e.valueOf():e}const Yo=Symbol("implicit");function Go(){var e=new Ho,t=[],n=[],r=Yo;function o(o){let i=e.get(o);if(void 0===i){if(r!==Yo)return r;e.set(o,i=t.push(o)-1)}return n[i%n.length]}return o.domain=function(n){if(!arguments.length)return t.slice();t=[],e=new Ho;for(const r of n)e.has(r)||e.set(r,t.push(r)-1);return o},o.range=function(e){return arguments.length?(n=Array.from(e),o):n.slice()},o.unknown=function(e){return arguments.length?(r=e,o):r},o.copy=function(){return Go(t,n).unknown(r)},Uo.apply(o,arguments),o}function Ko(){var e,t,n=Go().unknown(void 0),r=n.domain,o=n.range,i=0,a=1,l=!1,u=0,c=0,s=.5;function f(){var n=r().length,f=a<i,d=f?a:i,p=f?i:a;e=(p-d)/Math.max(1,n-u+2*c),l&&(e=Math.floor(e)),d+=(p-d-e*(n-u))*s,t=e*(1-u),l&&(d=Math.round(d),t=Math.round(t));var h=function(e,t,n){e=+e,t=+t,n=(o=arguments.length)<2?(t=e,e=0,1):o<3?1:+n;for(var r=-1,o=0|Math.max(0,Math.ceil((t-e)/n)),i=new Array(o);++r<o;)i[r]=e+r*n;return i}(n).map(function(t){return d+e*t});return o(f?h.reverse():h)}return delete n.unknown,n.domain=function(e){return arguments.length?(r(e),f()):r()},n.range=function(e){return arguments.length?([i,a]=e,i=+i,a=+a,f()):[i,a]},n.rangeRound=function(e){return[i,a]=e,i=+i,a=+a,l=!0,f()},n.bandwidth=function(){return t},n.step=function(){return e},n.round=function(e){return arguments.length?(l=!!e,f()):l},n.padding=function(e){return arguments.length?(u=Math.min(1,c=+e),f()):u},n.paddingInner=function(e){return arguments.length?(u=Math.min(1,e),f()):u},n.paddingOuter=function(e){return arguments.length?(c=+e,f()):c},n.align=function(e){return arguments.length?(s=Math.max(0,Math.min(1,e)),f()):s},n.copy=function(){return Ko(r(),[i,a]).round(l).paddingInner(u).paddingOuter(c).align(s)},Uo.apply(f(),arguments)}function Qo(e){var t=e.copy;return e.padding=e.paddingOuter,delete e.paddingInner,delete e.paddingOuter,e.copy=function(){return Qo(t())},e}function Zo(){return Qo(Ko.apply(null,arguments).paddingInner(1))}function Jo(e){return Jo="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Jo(e)}function ei(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ti(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ei(Object(n),!0).forEach(function(t){ni(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ei(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function ni(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Jo(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Jo(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Jo(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var ri={widthCache:{},cacheCount:0},oi={position:"absolute",top:"-20000px",left:0,padding:0,margin:0,border:"none",whiteSpace:"pre"},ii="recharts_measurement_span";var ai=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(void 0===e||null===e||it.isSsr)return{width:0,height:0};var n=function(e){var t=ti({},e);return Object.keys(t).forEach(function(e){t[e]||delete t[e]}),t}(t),r=JSON.stringify({text:e,copyStyle:n});if(ri.widthCache[r])return ri.widthCache[r];try{var o=document.getElementById(ii);o||((o=document.createElement("span")).setAttribute("id",ii),o.setAttribute("aria-hidden","true"),document.body.appendChild(o));var i=ti(ti({},oi),n);Object.assign(o.style,i),o.textContent="".concat(e);var a=o.getBoundingClientRect(),l={width:a.width,height:a.height};return ri.widthCache[r]=l,++ri.cacheCount>2e3&&(ri.cacheCount=0,ri.widthCache={}),l}catch(u){return{width:0,height:0}}};function li(e){return li="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},li(e)}function ui(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return ci(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return ci(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function ci(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function si(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,fi(r.key),r)}}function fi(e){var t=function(e,t){if("object"!=li(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=li(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==li(t)?t:t+""}var di=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([*/])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,pi=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([+-])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,hi=/^px|cm|vh|vw|em|rem|%|mm|in|pt|pc|ex|ch|vmin|vmax|Q$/,yi=/(-?\d+(?:\.\d+)?)([a-zA-Z%]+)?/,vi={cm:96/2.54,mm:96/25.4,pt:96/72,pc:16,in:96,Q:96/101.6,px:1},mi=Object.keys(vi),gi="NaN";var bi=function(){function e(t,n){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.num=t,this.unit=n,this.num=t,this.unit=n,Number.isNaN(t)&&(this.unit=""),""===n||hi.test(n)||(this.num=NaN,this.unit=""),mi.includes(n)&&(this.num=function(e,t){return e*vi[t]}(t,n),this.unit="px")}return t=e,r=[{key:"parse",value:function(t){var n,r=ui(null!==(n=yi.exec(t))&&void 0!==n?n:[],3),o=r[1],i=r[2];return new e(parseFloat(o),null!==i&&void 0!==i?i:"")}}],(n=[{key:"add",value:function(t){return this.unit!==t.unit?new e(NaN,""):new e(this.num+t.num,this.unit)}},{key:"subtract",value:function(t){return this.unit!==t.unit?new e(NaN,""):new e(this.num-t.num,this.unit)}},{key:"multiply",value:function(t){return""!==this.unit&&""!==t.unit&&this.unit!==t.unit?new e(NaN,""):new e(this.num*t.num,this.unit||t.unit)}},{key:"divide",value:function(t){return""!==this.unit&&""!==t.unit&&this.unit!==t.unit?new e(NaN,""):new e(this.num/t.num,this.unit||t.unit)}},{key:"toString",value:function(){return"".concat(this.num).concat(this.unit)}},{key:"isNaN",value:function(){return Number.isNaN(this.num)}}])&&si(t.prototype,n),r&&si(t,r),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,n,r}();function xi(e){if(e.includes(gi))return gi;for(var t=e;t.includes("*")||t.includes("/");){var n,r=ui(null!==(n=di.exec(t))&&void 0!==n?n:[],4),o=r[1],i=r[2],a=r[3],l=bi.parse(null!==o&&void 0!==o?o:""),u=bi.parse(null!==a&&void 0!==a?a:""),c="*"===i?l.multiply(u):l.divide(u);if(c.isNaN())return gi;t=t.replace(di,c.toString())}for(;t.includes("+")||/.-\d+(?:\.\d+)?/.test(t);){var s,f=ui(null!==(s=pi.exec(t))&&void 0!==s?s:[],4),d=f[1],p=f[2],h=f[3],y=bi.parse(null!==d&&void 0!==d?d:""),v=bi.parse(null!==h&&void 0!==h?h:""),m="+"===p?y.add(v):y.subtract(v);if(m.isNaN())return gi;t=t.replace(pi,m.toString())}return t}var wi=/\(([^()]*)\)/;function Oi(e){var t=e.replace(/\s+/g,"");return t=function(e){for(var t=e;t.includes("(");){var n=ui(wi.exec(t),2)[1];t=t.replace(wi,xi(n))}return t}(t),t=xi(t)}function Si(e){var t=function(e){try{return Oi(e)}catch(t){return gi}}(e.slice(5,-1));return t===gi?"":t}var ji=["x","y","lineHeight","capHeight","scaleToFit","textAnchor","verticalAnchor","fill"],ki=["dx","dy","angle","className","breakAll"];function Pi(){return Pi=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Pi.apply(this,arguments)}function Ei(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function _i(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return Mi(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Mi(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Mi(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var Ai=/[ \f\n\r\t\v\u2028\u2029]+/,Ci=function(e){var t=e.children,n=e.breakAll,r=e.style;try{var o=[];return O()(t)||(o=n?t.toString().split(""):t.toString().split(Ai)),{wordsWithComputedWidth:o.map(function(e){return{word:e,width:ai(e,r).width}}),spaceWidth:n?0:ai("\xa0",r).width}}catch(i){return null}},Ti=function(e){return[{words:O()(e)?[]:e.toString().split(Ai)}]},Ni=function(e){var t=e.width,n=e.scaleToFit,r=e.children,o=e.style,i=e.breakAll,a=e.maxLines;if((t||n)&&!it.isSsr){var l=Ci({breakAll:i,children:r,style:o});return l?function(e,t,n,r,o){var i=e.maxLines,a=e.children,l=e.style,u=e.breakAll,c=k(i),s=a,f=function(){return(arguments.length>0&&void 0!==arguments[0]?arguments[0]:[]).reduce(function(e,t){var i=t.word,a=t.width,l=e[e.length-1];if(l&&(null==r||o||l.width+a+n<Number(r)))l.words.push(i),l.width+=a+n;else{var u={words:[i],width:a};e.push(u)}return e},[])},d=f(t);if(!c)return d;for(var p,h=function(e){var t=s.slice(0,e),n=Ci({breakAll:u,style:l,children:t+"\u2026"}).wordsWithComputedWidth,o=f(n),a=o.length>i||function(e){return e.reduce(function(e,t){return e.width>t.width?e:t})}(o).width>Number(r);return[a,o]},y=0,v=s.length-1,m=0;y<=v&&m<=s.length-1;){var g=Math.floor((y+v)/2),b=_i(h(g-1),2),x=b[0],w=b[1],O=_i(h(g),1)[0];if(x||O||(y=g+1),x&&O&&(v=g-1),!x&&O){p=w;break}m++}return p||d}({breakAll:i,children:r,maxLines:a,style:o},l.wordsWithComputedWidth,l.spaceWidth,t,n):Ti(r)}return Ti(r)},Di="#808080",Ii=function(e){var n=e.x,r=void 0===n?0:n,o=e.y,i=void 0===o?0:o,a=e.lineHeight,l=void 0===a?"1em":a,u=e.capHeight,c=void 0===u?"0.71em":u,f=e.scaleToFit,d=void 0!==f&&f,p=e.textAnchor,h=void 0===p?"start":p,y=e.verticalAnchor,v=void 0===y?"end":y,m=e.fill,g=void 0===m?Di:m,b=Ei(e,ji),x=(0,t.useMemo)(function(){return Ni({breakAll:b.breakAll,children:b.children,maxLines:b.maxLines,scaleToFit:d,style:b.style,width:b.width})},[b.breakAll,b.children,b.maxLines,d,b.style,b.width]),w=b.dx,O=b.dy,S=b.angle,j=b.className,E=b.breakAll,_=Ei(b,ki);if(!P(r)||!P(i))return null;var M,A=r+(k(w)?w:0),C=i+(k(O)?O:0);switch(v){case"start":M=Si("calc(".concat(c,")"));break;case"middle":M=Si("calc(".concat((x.length-1)/2," * -").concat(l," + (").concat(c," / 2))"));break;default:M=Si("calc(".concat(x.length-1," * -").concat(l,")"))}var T=[];if(d){var N=x[0].width,D=b.width;T.push("scale(".concat((k(D)?D/N:1)/N,")"))}return S&&T.push("rotate(".concat(S,", ").concat(A,", ").concat(C,")")),T.length&&(_.transform=T.join(" ")),t.createElement("text",Pi({},ue(_,!0),{x:A,y:C,className:s("recharts-text",j),textAnchor:h,fill:g.includes("url")?Di:g}),x.map(function(e,n){var r=e.words.join(E?"":" ");return t.createElement("tspan",{x:A,dy:0===n?M:l,key:"".concat(r,"-").concat(n)},r)}))};const zi=Math.sqrt(50),Ri=Math.sqrt(10),Li=Math.sqrt(2);function Bi(e,t,n){const r=(t-e)/Math.max(0,n),o=Math.floor(Math.log10(r)),i=r/Math.pow(10,o),a=i>=zi?10:i>=Ri?5:i>=Li?2:1;let l,u,c;return o<0?(c=Math.pow(10,-o)/a,l=Math.round(e*c),u=Math.round(t*c),l/c<e&&++l,u/c>t&&--u,c=-c):(c=Math.pow(10,o)*a,l=Math.round(e/c),u=Math.round(t/c),l*c<e&&++l,u*c>t&&--u),u<l&&.5<=n&&n<2?Bi(e,t,2*n):[l,u,c]}function Fi(e,t,n){if(!((n=+n)>0))return[];if((e=+e)===(t=+t))return[e];const r=t<e,[o,i,a]=r?Bi(t,e,n):Bi(e,t,n);if(!(i>=o))return[];const l=i-o+1,u=new Array(l);if(r)if(a<0)for(let c=0;c<l;++c)u[c]=(i-c)/-a;else for(let c=0;c<l;++c)u[c]=(i-c)*a;else if(a<0)for(let c=0;c<l;++c)u[c]=(o+c)/-a;else for(let c=0;c<l;++c)u[c]=(o+c)*a;return u}function Ui(e,t,n){return Bi(e=+e,t=+t,n=+n)[2]}function Wi(e,t,n){n=+n;const r=(t=+t)<(e=+e),o=r?Ui(t,e,n):Ui(e,t,n);return(r?-1:1)*(o<0?1/-o:o)}function Hi(e,t){return null==e||null==t?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function qi(e,t){return null==e||null==t?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function Vi(e){let t,n,r;function o(e,r){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length;if(o<i){if(0!==t(r,r))return i;do{const t=o+i>>>1;n(e[t],r)<0?o=t+1:i=t}while(o<i)}return o}return 2!==e.length?(t=Hi,n=(t,n)=>Hi(e(t),n),r=(t,n)=>e(t)-n):(t=e===Hi||e===qi?e:Xi,n=e,r=e),{left:o,center:function(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0;const i=o(e,t,n,(arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length)-1);return i>n&&r(e[i-1],t)>-r(e[i],t)?i-1:i},right:function(e,r){let o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:e.length;if(o<i){if(0!==t(r,r))return i;do{const t=o+i>>>1;n(e[t],r)<=0?o=t+1:i=t}while(o<i)}return o}}}function Xi(){return 0}function $i(e){return null===e?NaN:+e}const Yi=Vi(Hi),Gi=Yi.right,Ki=(Yi.left,Vi($i).center,Gi);function Qi(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function Zi(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function Ji(){}var ea=.7,ta=1/ea,na="\\s*([+-]?\\d+)\\s*",ra="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",oa="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",ia=/^#([0-9a-f]{3,8})$/,aa=new RegExp("^rgb\\(".concat(na,",").concat(na,",").concat(na,"\\)$")),la=new RegExp("^rgb\\(".concat(oa,",").concat(oa,",").concat(oa,"\\)$")),ua=new RegExp("^rgba\\(".concat(na,",").concat(na,",").concat(na,",").concat(ra,"\\)$")),ca=new RegExp("^rgba\\(".concat(oa,",").concat(oa,",").concat(oa,",").concat(ra,"\\)$")),sa=new RegExp("^hsl\\(".concat(ra,",").concat(oa,",").concat(oa,"\\)$")),fa=new RegExp("^hsla\\(".concat(ra,",").concat(oa,",").concat(oa,",").concat(ra,"\\)$")),da={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function pa(){return this.rgb().formatHex()}function ha(){return this.rgb().formatRgb()}function ya(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=ia.exec(e))?(n=t[1].length,t=parseInt(t[1],16),6===n?va(t):3===n?new ba(t>>8&15|t>>4&240,t>>4&15|240&t,(15&t)<<4|15&t,1):8===n?ma(t>>24&255,t>>16&255,t>>8&255,(255&t)/255):4===n?ma(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|240&t,((15&t)<<4|15&t)/255):null):(t=aa.exec(e))?new ba(t[1],t[2],t[3],1):(t=la.exec(e))?new ba(255*t[1]/100,255*t[2]/100,255*t[3]/100,1):(t=ua.exec(e))?ma(t[1],t[2],t[3],t[4]):(t=ca.exec(e))?ma(255*t[1]/100,255*t[2]/100,255*t[3]/100,t[4]):(t=sa.exec(e))?ka(t[1],t[2]/100,t[3]/100,1):(t=fa.exec(e))?ka(t[1],t[2]/100,t[3]/100,t[4]):da.hasOwnProperty(e)?va(da[e]):"transparent"===e?new ba(NaN,NaN,NaN,0):null}function va(e){return new ba(e>>16&255,e>>8&255,255&e,1)}function ma(e,t,n,r){return r<=0&&(e=t=n=NaN),new ba(e,t,n,r)}function ga(e,t,n,r){return 1===arguments.length?((o=e)instanceof Ji||(o=ya(o)),o?new ba((o=o.rgb()).r,o.g,o.b,o.opacity):new ba):new ba(e,t,n,null==r?1:r);var o}function ba(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}function xa(){return"#".concat(ja(this.r)).concat(ja(this.g)).concat(ja(this.b))}function wa(){const e=Oa(this.opacity);return"".concat(1===e?"rgb(":"rgba(").concat(Sa(this.r),", ").concat(Sa(this.g),", ").concat(Sa(this.b)).concat(1===e?")":", ".concat(e,")"))}function Oa(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function Sa(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function ja(e){return((e=Sa(e))<16?"0":"")+e.toString(16)}function ka(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new Ea(e,t,n,r)}function Pa(e){if(e instanceof Ea)return new Ea(e.h,e.s,e.l,e.opacity);if(e instanceof Ji||(e=ya(e)),!e)return new Ea;if(e instanceof Ea)return e;var t=(e=e.rgb()).r/255,n=e.g/255,r=e.b/255,o=Math.min(t,n,r),i=Math.max(t,n,r),a=NaN,l=i-o,u=(i+o)/2;return l?(a=t===i?(n-r)/l+6*(n<r):n===i?(r-t)/l+2:(t-n)/l+4,l/=u<.5?i+o:2-i-o,a*=60):l=u>0&&u<1?0:a,new Ea(a,l,u,e.opacity)}function Ea(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function _a(e){return(e=(e||0)%360)<0?e+360:e}function Ma(e){return Math.max(0,Math.min(1,e||0))}function Aa(e,t,n){return 255*(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)}function Ca(e,t,n,r,o){var i=e*e,a=i*e;return((1-3*e+3*i-a)*t+(4-6*i+3*a)*n+(1+3*e+3*i-3*a)*r+a*o)/6}Qi(Ji,ya,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:pa,formatHex:pa,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return Pa(this).formatHsl()},formatRgb:ha,toString:ha}),Qi(ba,ga,Zi(Ji,{brighter(e){return e=null==e?ta:Math.pow(ta,e),new ba(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=null==e?ea:Math.pow(ea,e),new ba(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new ba(Sa(this.r),Sa(this.g),Sa(this.b),Oa(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:xa,formatHex:xa,formatHex8:function(){return"#".concat(ja(this.r)).concat(ja(this.g)).concat(ja(this.b)).concat(ja(255*(isNaN(this.opacity)?1:this.opacity)))},formatRgb:wa,toString:wa})),Qi(Ea,function(e,t,n,r){return 1===arguments.length?Pa(e):new Ea(e,t,n,null==r?1:r)},Zi(Ji,{brighter(e){return e=null==e?ta:Math.pow(ta,e),new Ea(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=null==e?ea:Math.pow(ea,e),new Ea(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+360*(this.h<0),t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,o=2*n-r;return new ba(Aa(e>=240?e-240:e+120,o,r),Aa(e,o,r),Aa(e<120?e+240:e-120,o,r),this.opacity)},clamp(){return new Ea(_a(this.h),Ma(this.s),Ma(this.l),Oa(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=Oa(this.opacity);return"".concat(1===e?"hsl(":"hsla(").concat(_a(this.h),", ").concat(100*Ma(this.s),"%, ").concat(100*Ma(this.l),"%").concat(1===e?")":", ".concat(e,")"))}}));const Ta=e=>()=>e;function Na(e,t){return function(n){return e+n*t}}function Da(e){return 1===(e=+e)?Ia:function(t,n){return n-t?function(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}(t,n,e):Ta(isNaN(t)?n:t)}}function Ia(e,t){var n=t-e;return n?Na(e,n):Ta(isNaN(e)?t:e)}const za=function e(t){var n=Da(t);function r(e,t){var r=n((e=ga(e)).r,(t=ga(t)).r),o=n(e.g,t.g),i=n(e.b,t.b),a=Ia(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=o(t),e.b=i(t),e.opacity=a(t),e+""}}return r.gamma=e,r}(1);function Ra(e){return function(t){var n,r,o=t.length,i=new Array(o),a=new Array(o),l=new Array(o);for(n=0;n<o;++n)r=ga(t[n]),i[n]=r.r||0,a[n]=r.g||0,l[n]=r.b||0;return i=e(i),a=e(a),l=e(l),r.opacity=1,function(e){return r.r=i(e),r.g=a(e),r.b=l(e),r+""}}}Ra(function(e){var t=e.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,t-1):Math.floor(n*t),o=e[r],i=e[r+1],a=r>0?e[r-1]:2*o-i,l=r<t-1?e[r+2]:2*i-o;return Ca((n-r/t)*t,a,o,i,l)}}),Ra(function(e){var t=e.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*t),o=e[(r+t-1)%t],i=e[r%t],a=e[(r+1)%t],l=e[(r+2)%t];return Ca((n-r/t)*t,o,i,a,l)}});function La(e,t){var n,r=t?t.length:0,o=e?Math.min(r,e.length):0,i=new Array(o),a=new Array(r);for(n=0;n<o;++n)i[n]=Xa(e[n],t[n]);for(;n<r;++n)a[n]=t[n];return function(e){for(n=0;n<o;++n)a[n]=i[n](e);return a}}function Ba(e,t){var n=new Date;return e=+e,t=+t,function(r){return n.setTime(e*(1-r)+t*r),n}}function Fa(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}function Ua(e,t){var n,r={},o={};for(n in null!==e&&"object"===typeof e||(e={}),null!==t&&"object"===typeof t||(t={}),t)n in e?r[n]=Xa(e[n],t[n]):o[n]=t[n];return function(e){for(n in r)o[n]=r[n](e);return o}}var Wa=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Ha=new RegExp(Wa.source,"g");function qa(e,t){var n,r,o,i=Wa.lastIndex=Ha.lastIndex=0,a=-1,l=[],u=[];for(e+="",t+="";(n=Wa.exec(e))&&(r=Ha.exec(t));)(o=r.index)>i&&(o=t.slice(i,o),l[a]?l[a]+=o:l[++a]=o),(n=n[0])===(r=r[0])?l[a]?l[a]+=r:l[++a]=r:(l[++a]=null,u.push({i:a,x:Fa(n,r)})),i=Ha.lastIndex;return i<t.length&&(o=t.slice(i),l[a]?l[a]+=o:l[++a]=o),l.length<2?u[0]?function(e){return function(t){return e(t)+""}}(u[0].x):function(e){return function(){return e}}(t):(t=u.length,function(e){for(var n,r=0;r<t;++r)l[(n=u[r]).i]=n.x(e);return l.join("")})}function Va(e,t){t||(t=[]);var n,r=e?Math.min(t.length,e.length):0,o=t.slice();return function(i){for(n=0;n<r;++n)o[n]=e[n]*(1-i)+t[n]*i;return o}}function Xa(e,t){var n,r,o=typeof t;return null==t||"boolean"===o?Ta(t):("number"===o?Fa:"string"===o?(n=ya(t))?(t=n,za):qa:t instanceof ya?za:t instanceof Date?Ba:(r=t,!ArrayBuffer.isView(r)||r instanceof DataView?Array.isArray(t)?La:"function"!==typeof t.valueOf&&"function"!==typeof t.toString||isNaN(t)?Ua:Fa:Va))(e,t)}function $a(e,t){return e=+e,t=+t,function(n){return Math.round(e*(1-n)+t*n)}}function Ya(e){return+e}var Ga=[0,1];function Ka(e){return e}function Qa(e,t){return(t-=e=+e)?function(n){return(n-e)/t}:(n=isNaN(t)?NaN:.5,function(){return n});var n}function Za(e,t,n){var r=e[0],o=e[1],i=t[0],a=t[1];return o<r?(r=Qa(o,r),i=n(a,i)):(r=Qa(r,o),i=n(i,a)),function(e){return i(r(e))}}function Ja(e,t,n){var r=Math.min(e.length,t.length)-1,o=new Array(r),i=new Array(r),a=-1;for(e[r]<e[0]&&(e=e.slice().reverse(),t=t.slice().reverse());++a<r;)o[a]=Qa(e[a],e[a+1]),i[a]=n(t[a],t[a+1]);return function(t){var n=Ki(e,t,1,r)-1;return i[n](o[n](t))}}function el(e,t){return t.domain(e.domain()).range(e.range()).interpolate(e.interpolate()).clamp(e.clamp()).unknown(e.unknown())}function tl(){var e,t,n,r,o,i,a=Ga,l=Ga,u=Xa,c=Ka;function s(){var e=Math.min(a.length,l.length);return c!==Ka&&(c=function(e,t){var n;return e>t&&(n=e,e=t,t=n),function(n){return Math.max(e,Math.min(t,n))}}(a[0],a[e-1])),r=e>2?Ja:Za,o=i=null,f}function f(t){return null==t||isNaN(t=+t)?n:(o||(o=r(a.map(e),l,u)))(e(c(t)))}return f.invert=function(n){return c(t((i||(i=r(l,a.map(e),Fa)))(n)))},f.domain=function(e){return arguments.length?(a=Array.from(e,Ya),s()):a.slice()},f.range=function(e){return arguments.length?(l=Array.from(e),s()):l.slice()},f.rangeRound=function(e){return l=Array.from(e),u=$a,s()},f.clamp=function(e){return arguments.length?(c=!!e||Ka,s()):c!==Ka},f.interpolate=function(e){return arguments.length?(u=e,s()):u},f.unknown=function(e){return arguments.length?(n=e,f):n},function(n,r){return e=n,t=r,s()}}function nl(){return tl()(Ka,Ka)}var rl,ol=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function il(e){if(!(t=ol.exec(e)))throw new Error("invalid format: "+e);var t;return new al({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}function al(e){this.fill=void 0===e.fill?" ":e.fill+"",this.align=void 0===e.align?">":e.align+"",this.sign=void 0===e.sign?"-":e.sign+"",this.symbol=void 0===e.symbol?"":e.symbol+"",this.zero=!!e.zero,this.width=void 0===e.width?void 0:+e.width,this.comma=!!e.comma,this.precision=void 0===e.precision?void 0:+e.precision,this.trim=!!e.trim,this.type=void 0===e.type?"":e.type+""}function ll(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf("e"))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]}function ul(e){return(e=ll(Math.abs(e)))?e[1]:NaN}function cl(e,t){var n=ll(e,t);if(!n)return e+"";var r=n[0],o=n[1];return o<0?"0."+new Array(-o).join("0")+r:r.length>o+1?r.slice(0,o+1)+"."+r.slice(o+1):r+new Array(o-r.length+2).join("0")}il.prototype=al.prototype,al.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(void 0===this.width?"":Math.max(1,0|this.width))+(this.comma?",":"")+(void 0===this.precision?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type};const sl={"%":(e,t)=>(100*e).toFixed(t),b:e=>Math.round(e).toString(2),c:e=>e+"",d:function(e){return Math.abs(e=Math.round(e))>=1e21?e.toLocaleString("en").replace(/,/g,""):e.toString(10)},e:(e,t)=>e.toExponential(t),f:(e,t)=>e.toFixed(t),g:(e,t)=>e.toPrecision(t),o:e=>Math.round(e).toString(8),p:(e,t)=>cl(100*e,t),r:cl,s:function(e,t){var n=ll(e,t);if(!n)return e+"";var r=n[0],o=n[1],i=o-(rl=3*Math.max(-8,Math.min(8,Math.floor(o/3))))+1,a=r.length;return i===a?r:i>a?r+new Array(i-a+1).join("0"):i>0?r.slice(0,i)+"."+r.slice(i):"0."+new Array(1-i).join("0")+ll(e,Math.max(0,t+i-1))[0]},X:e=>Math.round(e).toString(16).toUpperCase(),x:e=>Math.round(e).toString(16)};function fl(e){return e}var dl,pl,hl,yl=Array.prototype.map,vl=["y","z","a","f","p","n","\xb5","m","","k","M","G","T","P","E","Z","Y"];function ml(e){var t,n,r=void 0===e.grouping||void 0===e.thousands?fl:(t=yl.call(e.grouping,Number),n=e.thousands+"",function(e,r){for(var o=e.length,i=[],a=0,l=t[0],u=0;o>0&&l>0&&(u+l+1>r&&(l=Math.max(1,r-u)),i.push(e.substring(o-=l,o+l)),!((u+=l+1)>r));)l=t[a=(a+1)%t.length];return i.reverse().join(n)}),o=void 0===e.currency?"":e.currency[0]+"",i=void 0===e.currency?"":e.currency[1]+"",a=void 0===e.decimal?".":e.decimal+"",l=void 0===e.numerals?fl:function(e){return function(t){return t.replace(/[0-9]/g,function(t){return e[+t]})}}(yl.call(e.numerals,String)),u=void 0===e.percent?"%":e.percent+"",c=void 0===e.minus?"\u2212":e.minus+"",s=void 0===e.nan?"NaN":e.nan+"";function f(e){var t=(e=il(e)).fill,n=e.align,f=e.sign,d=e.symbol,p=e.zero,h=e.width,y=e.comma,v=e.precision,m=e.trim,g=e.type;"n"===g?(y=!0,g="g"):sl[g]||(void 0===v&&(v=12),m=!0,g="g"),(p||"0"===t&&"="===n)&&(p=!0,t="0",n="=");var b="$"===d?o:"#"===d&&/[boxX]/.test(g)?"0"+g.toLowerCase():"",x="$"===d?i:/[%p]/.test(g)?u:"",w=sl[g],O=/[defgprs%]/.test(g);function S(e){var o,i,u,d=b,S=x;if("c"===g)S=w(e)+S,e="";else{var j=(e=+e)<0||1/e<0;if(e=isNaN(e)?s:w(Math.abs(e),v),m&&(e=function(e){e:for(var t,n=e.length,r=1,o=-1;r<n;++r)switch(e[r]){case".":o=t=r;break;case"0":0===o&&(o=r),t=r;break;default:if(!+e[r])break e;o>0&&(o=0)}return o>0?e.slice(0,o)+e.slice(t+1):e}(e)),j&&0===+e&&"+"!==f&&(j=!1),d=(j?"("===f?f:c:"-"===f||"("===f?"":f)+d,S=("s"===g?vl[8+rl/3]:"")+S+(j&&"("===f?")":""),O)for(o=-1,i=e.length;++o<i;)if(48>(u=e.charCodeAt(o))||u>57){S=(46===u?a+e.slice(o+1):e.slice(o))+S,e=e.slice(0,o);break}}y&&!p&&(e=r(e,1/0));var k=d.length+e.length+S.length,P=k<h?new Array(h-k+1).join(t):"";switch(y&&p&&(e=r(P+e,P.length?h-S.length:1/0),P=""),n){case"<":e=d+e+S+P;break;case"=":e=d+P+e+S;break;case"^":e=P.slice(0,k=P.length>>1)+d+e+S+P.slice(k);break;default:e=P+d+e+S}return l(e)}return v=void 0===v?6:/[gprs]/.test(g)?Math.max(1,Math.min(21,v)):Math.max(0,Math.min(20,v)),S.toString=function(){return e+""},S}return{format:f,formatPrefix:function(e,t){var n=f(((e=il(e)).type="f",e)),r=3*Math.max(-8,Math.min(8,Math.floor(ul(t)/3))),o=Math.pow(10,-r),i=vl[8+r/3];return function(e){return n(o*e)+i}}}}function gl(e,t,n,r){var o,i=Wi(e,t,n);switch((r=il(null==r?",f":r)).type){case"s":var a=Math.max(Math.abs(e),Math.abs(t));return null!=r.precision||isNaN(o=function(e,t){return Math.max(0,3*Math.max(-8,Math.min(8,Math.floor(ul(t)/3)))-ul(Math.abs(e)))}(i,a))||(r.precision=o),hl(r,a);case"":case"e":case"g":case"p":case"r":null!=r.precision||isNaN(o=function(e,t){return e=Math.abs(e),t=Math.abs(t)-e,Math.max(0,ul(t)-ul(e))+1}(i,Math.max(Math.abs(e),Math.abs(t))))||(r.precision=o-("e"===r.type));break;case"f":case"%":null!=r.precision||isNaN(o=function(e){return Math.max(0,-ul(Math.abs(e)))}(i))||(r.precision=o-2*("%"===r.type))}return pl(r)}function bl(e){var t=e.domain;return e.ticks=function(e){var n=t();return Fi(n[0],n[n.length-1],null==e?10:e)},e.tickFormat=function(e,n){var r=t();return gl(r[0],r[r.length-1],null==e?10:e,n)},e.nice=function(n){null==n&&(n=10);var r,o,i=t(),a=0,l=i.length-1,u=i[a],c=i[l],s=10;for(c<u&&(o=u,u=c,c=o,o=a,a=l,l=o);s-- >0;){if((o=Ui(u,c,n))===r)return i[a]=u,i[l]=c,t(i);if(o>0)u=Math.floor(u/o)*o,c=Math.ceil(c/o)*o;else{if(!(o<0))break;u=Math.ceil(u*o)/o,c=Math.floor(c*o)/o}r=o}return e},e}function xl(){var e=nl();return e.copy=function(){return el(e,xl())},Uo.apply(e,arguments),bl(e)}function wl(e){var t;function n(e){return null==e||isNaN(e=+e)?t:e}return n.invert=n,n.domain=n.range=function(t){return arguments.length?(e=Array.from(t,Ya),n):e.slice()},n.unknown=function(e){return arguments.length?(t=e,n):t},n.copy=function(){return wl(e).unknown(t)},e=arguments.length?Array.from(e,Ya):[0,1],bl(n)}function Ol(e,t){var n,r=0,o=(e=e.slice()).length-1,i=e[r],a=e[o];return a<i&&(n=r,r=o,o=n,n=i,i=a,a=n),e[r]=t.floor(i),e[o]=t.ceil(a),e}function Sl(e){return Math.log(e)}function jl(e){return Math.exp(e)}function kl(e){return-Math.log(-e)}function Pl(e){return-Math.exp(-e)}function El(e){return isFinite(e)?+("1e"+e):e<0?0:e}function _l(e){return(t,n)=>-e(-t,n)}function Ml(e){const t=e(Sl,jl),n=t.domain;let r,o,i=10;function a(){return r=function(e){return e===Math.E?Math.log:10===e&&Math.log10||2===e&&Math.log2||(e=Math.log(e),t=>Math.log(t)/e)}(i),o=function(e){return 10===e?El:e===Math.E?Math.exp:t=>Math.pow(e,t)}(i),n()[0]<0?(r=_l(r),o=_l(o),e(kl,Pl)):e(Sl,jl),t}return t.base=function(e){return arguments.length?(i=+e,a()):i},t.domain=function(e){return arguments.length?(n(e),a()):n()},t.ticks=e=>{const t=n();let a=t[0],l=t[t.length-1];const u=l<a;u&&([a,l]=[l,a]);let c,s,f=r(a),d=r(l);const p=null==e?10:+e;let h=[];if(!(i%1)&&d-f<p){if(f=Math.floor(f),d=Math.ceil(d),a>0){for(;f<=d;++f)for(c=1;c<i;++c)if(s=f<0?c/o(-f):c*o(f),!(s<a)){if(s>l)break;h.push(s)}}else for(;f<=d;++f)for(c=i-1;c>=1;--c)if(s=f>0?c/o(-f):c*o(f),!(s<a)){if(s>l)break;h.push(s)}2*h.length<p&&(h=Fi(a,l,p))}else h=Fi(f,d,Math.min(d-f,p)).map(o);return u?h.reverse():h},t.tickFormat=(e,n)=>{if(null==e&&(e=10),null==n&&(n=10===i?"s":","),"function"!==typeof n&&(i%1||null!=(n=il(n)).precision||(n.trim=!0),n=pl(n)),e===1/0)return n;const a=Math.max(1,i*e/t.ticks().length);return e=>{let t=e/o(Math.round(r(e)));return t*i<i-.5&&(t*=i),t<=a?n(e):""}},t.nice=()=>n(Ol(n(),{floor:e=>o(Math.floor(r(e))),ceil:e=>o(Math.ceil(r(e)))})),t}function Al(){const e=Ml(tl()).domain([1,10]);return e.copy=()=>el(e,Al()).base(e.base()),Uo.apply(e,arguments),e}function Cl(e){return function(t){return Math.sign(t)*Math.log1p(Math.abs(t/e))}}function Tl(e){return function(t){return Math.sign(t)*Math.expm1(Math.abs(t))*e}}function Nl(e){var t=1,n=e(Cl(t),Tl(t));return n.constant=function(n){return arguments.length?e(Cl(t=+n),Tl(t)):t},bl(n)}function Dl(){var e=Nl(tl());return e.copy=function(){return el(e,Dl()).constant(e.constant())},Uo.apply(e,arguments)}function Il(e){return function(t){return t<0?-Math.pow(-t,e):Math.pow(t,e)}}function zl(e){return e<0?-Math.sqrt(-e):Math.sqrt(e)}function Rl(e){return e<0?-e*e:e*e}function Ll(e){var t=e(Ka,Ka),n=1;return t.exponent=function(t){return arguments.length?1===(n=+t)?e(Ka,Ka):.5===n?e(zl,Rl):e(Il(n),Il(1/n)):n},bl(t)}function Bl(){var e=Ll(tl());return e.copy=function(){return el(e,Bl()).exponent(e.exponent())},Uo.apply(e,arguments),e}function Fl(){return Bl.apply(null,arguments).exponent(.5)}function Ul(e){return Math.sign(e)*e*e}function Wl(){var e,t=nl(),n=[0,1],r=!1;function o(n){var o=function(e){return Math.sign(e)*Math.sqrt(Math.abs(e))}(t(n));return isNaN(o)?e:r?Math.round(o):o}return o.invert=function(e){return t.invert(Ul(e))},o.domain=function(e){return arguments.length?(t.domain(e),o):t.domain()},o.range=function(e){return arguments.length?(t.range((n=Array.from(e,Ya)).map(Ul)),o):n.slice()},o.rangeRound=function(e){return o.range(e).round(!0)},o.round=function(e){return arguments.length?(r=!!e,o):r},o.clamp=function(e){return arguments.length?(t.clamp(e),o):t.clamp()},o.unknown=function(t){return arguments.length?(e=t,o):e},o.copy=function(){return Wl(t.domain(),n).round(r).clamp(t.clamp()).unknown(e)},Uo.apply(o,arguments),bl(o)}function Hl(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n<r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let o of e)null!=(o=t(o,++r,e))&&(n<o||void 0===n&&o>=o)&&(n=o)}return n}function ql(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n>r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let o of e)null!=(o=t(o,++r,e))&&(n>o||void 0===n&&o>=o)&&(n=o)}return n}function Vl(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:Hi;if(e===Hi)return Xl;if("function"!==typeof e)throw new TypeError("compare is not a function");return(t,n)=>{const r=e(t,n);return r||0===r?r:(0===e(n,n))-(0===e(t,t))}}function Xl(e,t){return(null==e||!(e>=e))-(null==t||!(t>=t))||(e<t?-1:e>t?1:0)}function $l(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:1/0,o=arguments.length>4?arguments[4]:void 0;if(t=Math.floor(t),n=Math.floor(Math.max(0,n)),r=Math.floor(Math.min(e.length-1,r)),!(n<=t&&t<=r))return e;for(o=void 0===o?Xl:Vl(o);r>n;){if(r-n>600){const i=r-n+1,a=t-n+1,l=Math.log(i),u=.5*Math.exp(2*l/3),c=.5*Math.sqrt(l*u*(i-u)/i)*(a-i/2<0?-1:1);$l(e,t,Math.max(n,Math.floor(t-a*u/i+c)),Math.min(r,Math.floor(t+(i-a)*u/i+c)),o)}const i=e[t];let a=n,l=r;for(Yl(e,n,t),o(e[r],i)>0&&Yl(e,n,r);a<l;){for(Yl(e,a,l),++a,--l;o(e[a],i)<0;)++a;for(;o(e[l],i)>0;)--l}0===o(e[n],i)?Yl(e,n,l):(++l,Yl(e,l,r)),l<=t&&(n=l+1),t<=l&&(r=l-1)}return e}function Yl(e,t,n){const r=e[t];e[t]=e[n],e[n]=r}function Gl(e,t,n){if(e=Float64Array.from(function*(e,t){if(void 0===t)for(let n of e)null!=n&&(n=+n)>=n&&(yield n);else{let n=-1;for(let r of e)null!=(r=t(r,++n,e))&&(r=+r)>=r&&(yield r)}}(e,n)),(r=e.length)&&!isNaN(t=+t)){if(t<=0||r<2)return ql(e);if(t>=1)return Hl(e);var r,o=(r-1)*t,i=Math.floor(o),a=Hl($l(e,i).subarray(0,i+1));return a+(ql(e.subarray(i+1))-a)*(o-i)}}function Kl(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:$i;if((r=e.length)&&!isNaN(t=+t)){if(t<=0||r<2)return+n(e[0],0,e);if(t>=1)return+n(e[r-1],r-1,e);var r,o=(r-1)*t,i=Math.floor(o),a=+n(e[i],i,e);return a+(+n(e[i+1],i+1,e)-a)*(o-i)}}function Ql(){var e,t=[],n=[],r=[];function o(){var e=0,o=Math.max(1,n.length);for(r=new Array(o-1);++e<o;)r[e-1]=Kl(t,e/o);return i}function i(t){return null==t||isNaN(t=+t)?e:n[Ki(r,t)]}return i.invertExtent=function(e){var o=n.indexOf(e);return o<0?[NaN,NaN]:[o>0?r[o-1]:t[0],o<r.length?r[o]:t[t.length-1]]},i.domain=function(e){if(!arguments.length)return t.slice();t=[];for(let n of e)null==n||isNaN(n=+n)||t.push(n);return t.sort(Hi),o()},i.range=function(e){return arguments.length?(n=Array.from(e),o()):n.slice()},i.unknown=function(t){return arguments.length?(e=t,i):e},i.quantiles=function(){return r.slice()},i.copy=function(){return Ql().domain(t).range(n).unknown(e)},Uo.apply(i,arguments)}function Zl(){var e,t=0,n=1,r=1,o=[.5],i=[0,1];function a(t){return null!=t&&t<=t?i[Ki(o,t,0,r)]:e}function l(){var e=-1;for(o=new Array(r);++e<r;)o[e]=((e+1)*n-(e-r)*t)/(r+1);return a}return a.domain=function(e){return arguments.length?([t,n]=e,t=+t,n=+n,l()):[t,n]},a.range=function(e){return arguments.length?(r=(i=Array.from(e)).length-1,l()):i.slice()},a.invertExtent=function(e){var a=i.indexOf(e);return a<0?[NaN,NaN]:a<1?[t,o[0]]:a>=r?[o[r-1],n]:[o[a-1],o[a]]},a.unknown=function(t){return arguments.length?(e=t,a):a},a.thresholds=function(){return o.slice()},a.copy=function(){return Zl().domain([t,n]).range(i).unknown(e)},Uo.apply(bl(a),arguments)}function Jl(){var e,t=[.5],n=[0,1],r=1;function o(o){return null!=o&&o<=o?n[Ki(t,o,0,r)]:e}return o.domain=function(e){return arguments.length?(t=Array.from(e),r=Math.min(t.length,n.length-1),o):t.slice()},o.range=function(e){return arguments.length?(n=Array.from(e),r=Math.min(t.length,n.length-1),o):n.slice()},o.invertExtent=function(e){var r=n.indexOf(e);return[t[r-1],t[r]]},o.unknown=function(t){return arguments.length?(e=t,o):e},o.copy=function(){return Jl().domain(t).range(n).unknown(e)},Uo.apply(o,arguments)}dl=ml({thousands:",",grouping:[3],currency:["$",""]}),pl=dl.format,hl=dl.formatPrefix;const eu=1e3,tu=6e4,nu=36e5,ru=864e5,ou=6048e5,iu=2592e6,au=31536e6,lu=new Date,uu=new Date;function cu(e,t,n,r){function o(t){return e(t=0===arguments.length?new Date:new Date(+t)),t}return o.floor=t=>(e(t=new Date(+t)),t),o.ceil=n=>(e(n=new Date(n-1)),t(n,1),e(n),n),o.round=e=>{const t=o(e),n=o.ceil(e);return e-t<n-e?t:n},o.offset=(e,n)=>(t(e=new Date(+e),null==n?1:Math.floor(n)),e),o.range=(n,r,i)=>{const a=[];if(n=o.ceil(n),i=null==i?1:Math.floor(i),!(n<r)||!(i>0))return a;let l;do{a.push(l=new Date(+n)),t(n,i),e(n)}while(l<n&&n<r);return a},o.filter=n=>cu(t=>{if(t>=t)for(;e(t),!n(t);)t.setTime(t-1)},(e,r)=>{if(e>=e)if(r<0)for(;++r<=0;)for(;t(e,-1),!n(e););else for(;--r>=0;)for(;t(e,1),!n(e););}),n&&(o.count=(t,r)=>(lu.setTime(+t),uu.setTime(+r),e(lu),e(uu),Math.floor(n(lu,uu))),o.every=e=>(e=Math.floor(e),isFinite(e)&&e>0?e>1?o.filter(r?t=>r(t)%e===0:t=>o.count(0,t)%e===0):o:null)),o}const su=cu(()=>{},(e,t)=>{e.setTime(+e+t)},(e,t)=>t-e);su.every=e=>(e=Math.floor(e),isFinite(e)&&e>0?e>1?cu(t=>{t.setTime(Math.floor(t/e)*e)},(t,n)=>{t.setTime(+t+n*e)},(t,n)=>(n-t)/e):su:null);su.range;const fu=cu(e=>{e.setTime(e-e.getMilliseconds())},(e,t)=>{e.setTime(+e+t*eu)},(e,t)=>(t-e)/eu,e=>e.getUTCSeconds()),du=(fu.range,cu(e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*eu)},(e,t)=>{e.setTime(+e+t*tu)},(e,t)=>(t-e)/tu,e=>e.getMinutes())),pu=(du.range,cu(e=>{e.setUTCSeconds(0,0)},(e,t)=>{e.setTime(+e+t*tu)},(e,t)=>(t-e)/tu,e=>e.getUTCMinutes())),hu=(pu.range,cu(e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*eu-e.getMinutes()*tu)},(e,t)=>{e.setTime(+e+t*nu)},(e,t)=>(t-e)/nu,e=>e.getHours())),yu=(hu.range,cu(e=>{e.setUTCMinutes(0,0,0)},(e,t)=>{e.setTime(+e+t*nu)},(e,t)=>(t-e)/nu,e=>e.getUTCHours())),vu=(yu.range,cu(e=>e.setHours(0,0,0,0),(e,t)=>e.setDate(e.getDate()+t),(e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*tu)/ru,e=>e.getDate()-1)),mu=(vu.range,cu(e=>{e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t)},(e,t)=>(t-e)/ru,e=>e.getUTCDate()-1)),gu=(mu.range,cu(e=>{e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t)},(e,t)=>(t-e)/ru,e=>Math.floor(e/ru)));gu.range;function bu(e){return cu(t=>{t.setDate(t.getDate()-(t.getDay()+7-e)%7),t.setHours(0,0,0,0)},(e,t)=>{e.setDate(e.getDate()+7*t)},(e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*tu)/ou)}const xu=bu(0),wu=bu(1),Ou=bu(2),Su=bu(3),ju=bu(4),ku=bu(5),Pu=bu(6);xu.range,wu.range,Ou.range,Su.range,ju.range,ku.range,Pu.range;function Eu(e){return cu(t=>{t.setUTCDate(t.getUTCDate()-(t.getUTCDay()+7-e)%7),t.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+7*t)},(e,t)=>(t-e)/ou)}const _u=Eu(0),Mu=Eu(1),Au=Eu(2),Cu=Eu(3),Tu=Eu(4),Nu=Eu(5),Du=Eu(6),Iu=(_u.range,Mu.range,Au.range,Cu.range,Tu.range,Nu.range,Du.range,cu(e=>{e.setDate(1),e.setHours(0,0,0,0)},(e,t)=>{e.setMonth(e.getMonth()+t)},(e,t)=>t.getMonth()-e.getMonth()+12*(t.getFullYear()-e.getFullYear()),e=>e.getMonth())),zu=(Iu.range,cu(e=>{e.setUTCDate(1),e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCMonth(e.getUTCMonth()+t)},(e,t)=>t.getUTCMonth()-e.getUTCMonth()+12*(t.getUTCFullYear()-e.getUTCFullYear()),e=>e.getUTCMonth())),Ru=(zu.range,cu(e=>{e.setMonth(0,1),e.setHours(0,0,0,0)},(e,t)=>{e.setFullYear(e.getFullYear()+t)},(e,t)=>t.getFullYear()-e.getFullYear(),e=>e.getFullYear()));Ru.every=e=>isFinite(e=Math.floor(e))&&e>0?cu(t=>{t.setFullYear(Math.floor(t.getFullYear()/e)*e),t.setMonth(0,1),t.setHours(0,0,0,0)},(t,n)=>{t.setFullYear(t.getFullYear()+n*e)}):null;Ru.range;const Lu=cu(e=>{e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCFullYear(e.getUTCFullYear()+t)},(e,t)=>t.getUTCFullYear()-e.getUTCFullYear(),e=>e.getUTCFullYear());Lu.every=e=>isFinite(e=Math.floor(e))&&e>0?cu(t=>{t.setUTCFullYear(Math.floor(t.getUTCFullYear()/e)*e),t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)},(t,n)=>{t.setUTCFullYear(t.getUTCFullYear()+n*e)}):null;Lu.range;function Bu(e,t,n,r,o,i){const a=[[fu,1,eu],[fu,5,5e3],[fu,15,15e3],[fu,30,3e4],[i,1,tu],[i,5,3e5],[i,15,9e5],[i,30,18e5],[o,1,nu],[o,3,108e5],[o,6,216e5],[o,12,432e5],[r,1,ru],[r,2,1728e5],[n,1,ou],[t,1,iu],[t,3,7776e6],[e,1,au]];function l(t,n,r){const o=Math.abs(n-t)/r,i=Vi(e=>{let[,,t]=e;return t}).right(a,o);if(i===a.length)return e.every(Wi(t/au,n/au,r));if(0===i)return su.every(Math.max(Wi(t,n,r),1));const[l,u]=a[o/a[i-1][2]<a[i][2]/o?i-1:i];return l.every(u)}return[function(e,t,n){const r=t<e;r&&([e,t]=[t,e]);const o=n&&"function"===typeof n.range?n:l(e,t,n),i=o?o.range(e,+t+1):[];return r?i.reverse():i},l]}const[Fu,Uu]=Bu(Lu,zu,_u,gu,yu,pu),[Wu,Hu]=Bu(Ru,Iu,xu,vu,hu,du);function qu(e){if(0<=e.y&&e.y<100){var t=new Date(-1,e.m,e.d,e.H,e.M,e.S,e.L);return t.setFullYear(e.y),t}return new Date(e.y,e.m,e.d,e.H,e.M,e.S,e.L)}function Vu(e){if(0<=e.y&&e.y<100){var t=new Date(Date.UTC(-1,e.m,e.d,e.H,e.M,e.S,e.L));return t.setUTCFullYear(e.y),t}return new Date(Date.UTC(e.y,e.m,e.d,e.H,e.M,e.S,e.L))}function Xu(e,t,n){return{y:e,m:t,d:n,H:0,M:0,S:0,L:0}}var $u,Yu,Gu,Ku={"-":"",_:" ",0:"0"},Qu=/^\s*\d+/,Zu=/^%/,Ju=/[\\^$*+?|[\]().{}]/g;function ec(e,t,n){var r=e<0?"-":"",o=(r?-e:e)+"",i=o.length;return r+(i<n?new Array(n-i+1).join(t)+o:o)}function tc(e){return e.replace(Ju,"\\$&")}function nc(e){return new RegExp("^(?:"+e.map(tc).join("|")+")","i")}function rc(e){return new Map(e.map((e,t)=>[e.toLowerCase(),t]))}function oc(e,t,n){var r=Qu.exec(t.slice(n,n+1));return r?(e.w=+r[0],n+r[0].length):-1}function ic(e,t,n){var r=Qu.exec(t.slice(n,n+1));return r?(e.u=+r[0],n+r[0].length):-1}function ac(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.U=+r[0],n+r[0].length):-1}function lc(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.V=+r[0],n+r[0].length):-1}function uc(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.W=+r[0],n+r[0].length):-1}function cc(e,t,n){var r=Qu.exec(t.slice(n,n+4));return r?(e.y=+r[0],n+r[0].length):-1}function sc(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.y=+r[0]+(+r[0]>68?1900:2e3),n+r[0].length):-1}function fc(e,t,n){var r=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(t.slice(n,n+6));return r?(e.Z=r[1]?0:-(r[2]+(r[3]||"00")),n+r[0].length):-1}function dc(e,t,n){var r=Qu.exec(t.slice(n,n+1));return r?(e.q=3*r[0]-3,n+r[0].length):-1}function pc(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.m=r[0]-1,n+r[0].length):-1}function hc(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.d=+r[0],n+r[0].length):-1}function yc(e,t,n){var r=Qu.exec(t.slice(n,n+3));return r?(e.m=0,e.d=+r[0],n+r[0].length):-1}function vc(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.H=+r[0],n+r[0].length):-1}function mc(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.M=+r[0],n+r[0].length):-1}function gc(e,t,n){var r=Qu.exec(t.slice(n,n+2));return r?(e.S=+r[0],n+r[0].length):-1}function bc(e,t,n){var r=Qu.exec(t.slice(n,n+3));return r?(e.L=+r[0],n+r[0].length):-1}function xc(e,t,n){var r=Qu.exec(t.slice(n,n+6));return r?(e.L=Math.floor(r[0]/1e3),n+r[0].length):-1}function wc(e,t,n){var r=Zu.exec(t.slice(n,n+1));return r?n+r[0].length:-1}function Oc(e,t,n){var r=Qu.exec(t.slice(n));return r?(e.Q=+r[0],n+r[0].length):-1}function Sc(e,t,n){var r=Qu.exec(t.slice(n));return r?(e.s=+r[0],n+r[0].length):-1}function jc(e,t){return ec(e.getDate(),t,2)}function kc(e,t){return ec(e.getHours(),t,2)}function Pc(e,t){return ec(e.getHours()%12||12,t,2)}function Ec(e,t){return ec(1+vu.count(Ru(e),e),t,3)}function _c(e,t){return ec(e.getMilliseconds(),t,3)}function Mc(e,t){return _c(e,t)+"000"}function Ac(e,t){return ec(e.getMonth()+1,t,2)}function Cc(e,t){return ec(e.getMinutes(),t,2)}function Tc(e,t){return ec(e.getSeconds(),t,2)}function Nc(e){var t=e.getDay();return 0===t?7:t}function Dc(e,t){return ec(xu.count(Ru(e)-1,e),t,2)}function Ic(e){var t=e.getDay();return t>=4||0===t?ju(e):ju.ceil(e)}function zc(e,t){return e=Ic(e),ec(ju.count(Ru(e),e)+(4===Ru(e).getDay()),t,2)}function Rc(e){return e.getDay()}function Lc(e,t){return ec(wu.count(Ru(e)-1,e),t,2)}function Bc(e,t){return ec(e.getFullYear()%100,t,2)}function Fc(e,t){return ec((e=Ic(e)).getFullYear()%100,t,2)}function Uc(e,t){return ec(e.getFullYear()%1e4,t,4)}function Wc(e,t){var n=e.getDay();return ec((e=n>=4||0===n?ju(e):ju.ceil(e)).getFullYear()%1e4,t,4)}function Hc(e){var t=e.getTimezoneOffset();return(t>0?"-":(t*=-1,"+"))+ec(t/60|0,"0",2)+ec(t%60,"0",2)}function qc(e,t){return ec(e.getUTCDate(),t,2)}function Vc(e,t){return ec(e.getUTCHours(),t,2)}function Xc(e,t){return ec(e.getUTCHours()%12||12,t,2)}function $c(e,t){return ec(1+mu.count(Lu(e),e),t,3)}function Yc(e,t){return ec(e.getUTCMilliseconds(),t,3)}function Gc(e,t){return Yc(e,t)+"000"}function Kc(e,t){return ec(e.getUTCMonth()+1,t,2)}function Qc(e,t){return ec(e.getUTCMinutes(),t,2)}function Zc(e,t){return ec(e.getUTCSeconds(),t,2)}function Jc(e){var t=e.getUTCDay();return 0===t?7:t}function es(e,t){return ec(_u.count(Lu(e)-1,e),t,2)}function ts(e){var t=e.getUTCDay();return t>=4||0===t?Tu(e):Tu.ceil(e)}function ns(e,t){return e=ts(e),ec(Tu.count(Lu(e),e)+(4===Lu(e).getUTCDay()),t,2)}function rs(e){return e.getUTCDay()}function os(e,t){return ec(Mu.count(Lu(e)-1,e),t,2)}function is(e,t){return ec(e.getUTCFullYear()%100,t,2)}function as(e,t){return ec((e=ts(e)).getUTCFullYear()%100,t,2)}function ls(e,t){return ec(e.getUTCFullYear()%1e4,t,4)}function us(e,t){var n=e.getUTCDay();return ec((e=n>=4||0===n?Tu(e):Tu.ceil(e)).getUTCFullYear()%1e4,t,4)}function cs(){return"+0000"}function ss(){return"%"}function fs(e){return+e}function ds(e){return Math.floor(+e/1e3)}function ps(e){return new Date(e)}function hs(e){return e instanceof Date?+e:+new Date(+e)}function ys(e,t,n,r,o,i,a,l,u,c){var s=nl(),f=s.invert,d=s.domain,p=c(".%L"),h=c(":%S"),y=c("%I:%M"),v=c("%I %p"),m=c("%a %d"),g=c("%b %d"),b=c("%B"),x=c("%Y");function w(e){return(u(e)<e?p:l(e)<e?h:a(e)<e?y:i(e)<e?v:r(e)<e?o(e)<e?m:g:n(e)<e?b:x)(e)}return s.invert=function(e){return new Date(f(e))},s.domain=function(e){return arguments.length?d(Array.from(e,hs)):d().map(ps)},s.ticks=function(t){var n=d();return e(n[0],n[n.length-1],null==t?10:t)},s.tickFormat=function(e,t){return null==t?w:c(t)},s.nice=function(e){var n=d();return e&&"function"===typeof e.range||(e=t(n[0],n[n.length-1],null==e?10:e)),e?d(Ol(n,e)):s},s.copy=function(){return el(s,ys(e,t,n,r,o,i,a,l,u,c))},s}function vs(){return Uo.apply(ys(Wu,Hu,Ru,Iu,xu,vu,hu,du,fu,Yu).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)}function ms(){return Uo.apply(ys(Fu,Uu,Lu,zu,_u,mu,yu,pu,fu,Gu).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)}function gs(){var e,t,n,r,o,i=0,a=1,l=Ka,u=!1;function c(t){return null==t||isNaN(t=+t)?o:l(0===n?.5:(t=(r(t)-e)*n,u?Math.max(0,Math.min(1,t)):t))}function s(e){return function(t){var n,r;return arguments.length?([n,r]=t,l=e(n,r),c):[l(0),l(1)]}}return c.domain=function(o){return arguments.length?([i,a]=o,e=r(i=+i),t=r(a=+a),n=e===t?0:1/(t-e),c):[i,a]},c.clamp=function(e){return arguments.length?(u=!!e,c):u},c.interpolator=function(e){return arguments.length?(l=e,c):l},c.range=s(Xa),c.rangeRound=s($a),c.unknown=function(e){return arguments.length?(o=e,c):o},function(o){return r=o,e=o(i),t=o(a),n=e===t?0:1/(t-e),c}}function bs(e,t){return t.domain(e.domain()).interpolator(e.interpolator()).clamp(e.clamp()).unknown(e.unknown())}function xs(){var e=bl(gs()(Ka));return e.copy=function(){return bs(e,xs())},Wo.apply(e,arguments)}function ws(){var e=Ml(gs()).domain([1,10]);return e.copy=function(){return bs(e,ws()).base(e.base())},Wo.apply(e,arguments)}function Os(){var e=Nl(gs());return e.copy=function(){return bs(e,Os()).constant(e.constant())},Wo.apply(e,arguments)}function Ss(){var e=Ll(gs());return e.copy=function(){return bs(e,Ss()).exponent(e.exponent())},Wo.apply(e,arguments)}function js(){return Ss.apply(null,arguments).exponent(.5)}function ks(){var e=[],t=Ka;function n(n){if(null!=n&&!isNaN(n=+n))return t((Ki(e,n,1)-1)/(e.length-1))}return n.domain=function(t){if(!arguments.length)return e.slice();e=[];for(let n of t)null==n||isNaN(n=+n)||e.push(n);return e.sort(Hi),n},n.interpolator=function(e){return arguments.length?(t=e,n):t},n.range=function(){return e.map((n,r)=>t(r/(e.length-1)))},n.quantiles=function(t){return Array.from({length:t+1},(n,r)=>Gl(e,r/t))},n.copy=function(){return ks(t).domain(e)},Wo.apply(n,arguments)}function Ps(){var e,t,n,r,o,i,a,l=0,u=.5,c=1,s=1,f=Ka,d=!1;function p(e){return isNaN(e=+e)?a:(e=.5+((e=+i(e))-t)*(s*e<s*t?r:o),f(d?Math.max(0,Math.min(1,e)):e))}function h(e){return function(t){var n,r,o;return arguments.length?([n,r,o]=t,f=function(e,t){void 0===t&&(t=e,e=Xa);for(var n=0,r=t.length-1,o=t[0],i=new Array(r<0?0:r);n<r;)i[n]=e(o,o=t[++n]);return function(e){var t=Math.max(0,Math.min(r-1,Math.floor(e*=r)));return i[t](e-t)}}(e,[n,r,o]),p):[f(0),f(.5),f(1)]}}return p.domain=function(a){return arguments.length?([l,u,c]=a,e=i(l=+l),t=i(u=+u),n=i(c=+c),r=e===t?0:.5/(t-e),o=t===n?0:.5/(n-t),s=t<e?-1:1,p):[l,u,c]},p.clamp=function(e){return arguments.length?(d=!!e,p):d},p.interpolator=function(e){return arguments.length?(f=e,p):f},p.range=h(Xa),p.rangeRound=h($a),p.unknown=function(e){return arguments.length?(a=e,p):a},function(a){return i=a,e=a(l),t=a(u),n=a(c),r=e===t?0:.5/(t-e),o=t===n?0:.5/(n-t),s=t<e?-1:1,p}}function Es(){var e=bl(Ps()(Ka));return e.copy=function(){return bs(e,Es())},Wo.apply(e,arguments)}function _s(){var e=Ml(Ps()).domain([.1,1,10]);return e.copy=function(){return bs(e,_s()).base(e.base())},Wo.apply(e,arguments)}function Ms(){var e=Nl(Ps());return e.copy=function(){return bs(e,Ms()).constant(e.constant())},Wo.apply(e,arguments)}function As(){var e=Ll(Ps());return e.copy=function(){return bs(e,As()).exponent(e.exponent())},Wo.apply(e,arguments)}function Cs(){return As.apply(null,arguments).exponent(.5)}function Ts(e,t){if((o=e.length)>1)for(var n,r,o,i=1,a=e[t[0]],l=a.length;i<o;++i)for(r=a,a=e[t[i]],n=0;n<l;++n)a[n][1]+=a[n][0]=isNaN(r[n][1])?r[n][0]:r[n][1]}!function(e){$u=function(e){var t=e.dateTime,n=e.date,r=e.time,o=e.periods,i=e.days,a=e.shortDays,l=e.months,u=e.shortMonths,c=nc(o),s=rc(o),f=nc(i),d=rc(i),p=nc(a),h=rc(a),y=nc(l),v=rc(l),m=nc(u),g=rc(u),b={a:function(e){return a[e.getDay()]},A:function(e){return i[e.getDay()]},b:function(e){return u[e.getMonth()]},B:function(e){return l[e.getMonth()]},c:null,d:jc,e:jc,f:Mc,g:Fc,G:Wc,H:kc,I:Pc,j:Ec,L:_c,m:Ac,M:Cc,p:function(e){return o[+(e.getHours()>=12)]},q:function(e){return 1+~~(e.getMonth()/3)},Q:fs,s:ds,S:Tc,u:Nc,U:Dc,V:zc,w:Rc,W:Lc,x:null,X:null,y:Bc,Y:Uc,Z:Hc,"%":ss},x={a:function(e){return a[e.getUTCDay()]},A:function(e){return i[e.getUTCDay()]},b:function(e){return u[e.getUTCMonth()]},B:function(e){return l[e.getUTCMonth()]},c:null,d:qc,e:qc,f:Gc,g:as,G:us,H:Vc,I:Xc,j:$c,L:Yc,m:Kc,M:Qc,p:function(e){return o[+(e.getUTCHours()>=12)]},q:function(e){return 1+~~(e.getUTCMonth()/3)},Q:fs,s:ds,S:Zc,u:Jc,U:es,V:ns,w:rs,W:os,x:null,X:null,y:is,Y:ls,Z:cs,"%":ss},w={a:function(e,t,n){var r=p.exec(t.slice(n));return r?(e.w=h.get(r[0].toLowerCase()),n+r[0].length):-1},A:function(e,t,n){var r=f.exec(t.slice(n));return r?(e.w=d.get(r[0].toLowerCase()),n+r[0].length):-1},b:function(e,t,n){var r=m.exec(t.slice(n));return r?(e.m=g.get(r[0].toLowerCase()),n+r[0].length):-1},B:function(e,t,n){var r=y.exec(t.slice(n));return r?(e.m=v.get(r[0].toLowerCase()),n+r[0].length):-1},c:function(e,n,r){return j(e,t,n,r)},d:hc,e:hc,f:xc,g:sc,G:cc,H:vc,I:vc,j:yc,L:bc,m:pc,M:mc,p:function(e,t,n){var r=c.exec(t.slice(n));return r?(e.p=s.get(r[0].toLowerCase()),n+r[0].length):-1},q:dc,Q:Oc,s:Sc,S:gc,u:ic,U:ac,V:lc,w:oc,W:uc,x:function(e,t,r){return j(e,n,t,r)},X:function(e,t,n){return j(e,r,t,n)},y:sc,Y:cc,Z:fc,"%":wc};function O(e,t){return function(n){var r,o,i,a=[],l=-1,u=0,c=e.length;for(n instanceof Date||(n=new Date(+n));++l<c;)37===e.charCodeAt(l)&&(a.push(e.slice(u,l)),null!=(o=Ku[r=e.charAt(++l)])?r=e.charAt(++l):o="e"===r?" ":"0",(i=t[r])&&(r=i(n,o)),a.push(r),u=l+1);return a.push(e.slice(u,l)),a.join("")}}function S(e,t){return function(n){var r,o,i=Xu(1900,void 0,1);if(j(i,e,n+="",0)!=n.length)return null;if("Q"in i)return new Date(i.Q);if("s"in i)return new Date(1e3*i.s+("L"in i?i.L:0));if(t&&!("Z"in i)&&(i.Z=0),"p"in i&&(i.H=i.H%12+12*i.p),void 0===i.m&&(i.m="q"in i?i.q:0),"V"in i){if(i.V<1||i.V>53)return null;"w"in i||(i.w=1),"Z"in i?(o=(r=Vu(Xu(i.y,0,1))).getUTCDay(),r=o>4||0===o?Mu.ceil(r):Mu(r),r=mu.offset(r,7*(i.V-1)),i.y=r.getUTCFullYear(),i.m=r.getUTCMonth(),i.d=r.getUTCDate()+(i.w+6)%7):(o=(r=qu(Xu(i.y,0,1))).getDay(),r=o>4||0===o?wu.ceil(r):wu(r),r=vu.offset(r,7*(i.V-1)),i.y=r.getFullYear(),i.m=r.getMonth(),i.d=r.getDate()+(i.w+6)%7)}else("W"in i||"U"in i)&&("w"in i||(i.w="u"in i?i.u%7:"W"in i?1:0),o="Z"in i?Vu(Xu(i.y,0,1)).getUTCDay():qu(Xu(i.y,0,1)).getDay(),i.m=0,i.d="W"in i?(i.w+6)%7+7*i.W-(o+5)%7:i.w+7*i.U-(o+6)%7);return"Z"in i?(i.H+=i.Z/100|0,i.M+=i.Z%100,Vu(i)):qu(i)}}function j(e,t,n,r){for(var o,i,a=0,l=t.length,u=n.length;a<l;){if(r>=u)return-1;if(37===(o=t.charCodeAt(a++))){if(o=t.charAt(a++),!(i=w[o in Ku?t.charAt(a++):o])||(r=i(e,n,r))<0)return-1}else if(o!=n.charCodeAt(r++))return-1}return r}return b.x=O(n,b),b.X=O(r,b),b.c=O(t,b),x.x=O(n,x),x.X=O(r,x),x.c=O(t,x),{format:function(e){var t=O(e+="",b);return t.toString=function(){return e},t},parse:function(e){var t=S(e+="",!1);return t.toString=function(){return e},t},utcFormat:function(e){var t=O(e+="",x);return t.toString=function(){return e},t},utcParse:function(e){var t=S(e+="",!0);return t.toString=function(){return e},t}}}(e),Yu=$u.format,$u.parse,Gu=$u.utcFormat,$u.utcParse}({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]});Array.prototype.slice;function Ns(e){return"object"===typeof e&&"length"in e?e:Array.from(e)}function Ds(e){for(var t=e.length,n=new Array(t);--t>=0;)n[t]=t;return n}function Is(e,t){return e[t]}function zs(e){const t=[];return t.key=e,t}var Rs=n(539),Ls=n.n(Rs),Bs=n(6745),Fs=n.n(Bs),Us=n(3538),Ws=n.n(Us),Hs=n(9853),qs=n.n(Hs),Vs=n(8210),Xs=n.n(Vs);function $s(e){return function(e){if(Array.isArray(e))return Ys(e)}(e)||function(e){if("undefined"!==typeof Symbol&&Symbol.iterator in Object(e))return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Ys(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Ys(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ys(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var Gs=function(e){return e},Ks={"@@functional/placeholder":!0},Qs=function(e){return e===Ks},Zs=function(e){return function t(){return 0===arguments.length||1===arguments.length&&Qs(arguments.length<=0?void 0:arguments[0])?t:e.apply(void 0,arguments)}},Js=function e(t,n){return 1===t?n:Zs(function(){for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];var a=o.filter(function(e){return e!==Ks}).length;return a>=t?n.apply(void 0,o):e(t-a,Zs(function(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];var i=o.map(function(e){return Qs(e)?t.shift():e});return n.apply(void 0,$s(i).concat(t))}))})},ef=function(e){return Js(e.length,e)},tf=function(e,t){for(var n=[],r=e;r<t;++r)n[r-e]=r;return n},nf=ef(function(e,t){return Array.isArray(t)?t.map(e):Object.keys(t).map(function(e){return t[e]}).map(e)}),rf=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];if(!t.length)return Gs;var r=t.reverse(),o=r[0],i=r.slice(1);return function(){return i.reduce(function(e,t){return t(e)},o.apply(void 0,arguments))}},of=function(e){return Array.isArray(e)?e.reverse():e.split("").reverse.join("")},af=function(e){var t=null,n=null;return function(){for(var r=arguments.length,o=new Array(r),i=0;i<r;i++)o[i]=arguments[i];return t&&o.every(function(e,n){return e===t[n]})?n:(t=o,n=e.apply(void 0,o))}};var lf=ef(function(e,t,n){var r=+e;return r+n*(+t-r)}),uf=ef(function(e,t,n){var r=t-+e;return(n-e)/(r=r||1/0)}),cf=ef(function(e,t,n){var r=t-+e;return r=r||1/0,Math.max(0,Math.min(1,(n-e)/r))});const sf={rangeStep:function(e,t,n){for(var r=new(Xs())(e),o=0,i=[];r.lt(t)&&o<1e5;)i.push(r.toNumber()),r=r.add(n),o++;return i},getDigitCount:function(e){return 0===e?1:Math.floor(new(Xs())(e).abs().log(10).toNumber())+1},interpolateNumber:lf,uninterpolateNumber:uf,uninterpolateTruncation:cf};function ff(e){return function(e){if(Array.isArray(e))return hf(e)}(e)||function(e){if("undefined"!==typeof Symbol&&Symbol.iterator in Object(e))return Array.from(e)}(e)||pf(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function df(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if("undefined"===typeof Symbol||!(Symbol.iterator in Object(e)))return;var n=[],r=!0,o=!1,i=void 0;try{for(var a,l=e[Symbol.iterator]();!(r=(a=l.next()).done)&&(n.push(a.value),!t||n.length!==t);r=!0);}catch(u){o=!0,i=u}finally{try{r||null==l.return||l.return()}finally{if(o)throw i}}return n}(e,t)||pf(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function pf(e,t){if(e){if("string"===typeof e)return hf(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?hf(e,t):void 0}}function hf(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function yf(e){var t=df(e,2),n=t[0],r=t[1],o=n,i=r;return n>r&&(o=r,i=n),[o,i]}function vf(e,t,n){if(e.lte(0))return new(Xs())(0);var r=sf.getDigitCount(e.toNumber()),o=new(Xs())(10).pow(r),i=e.div(o),a=1!==r?.05:.1,l=new(Xs())(Math.ceil(i.div(a).toNumber())).add(n).mul(a).mul(o);return t?l:new(Xs())(Math.ceil(l))}function mf(e,t,n){var r=1,o=new(Xs())(e);if(!o.isint()&&n){var i=Math.abs(e);i<1?(r=new(Xs())(10).pow(sf.getDigitCount(e)-1),o=new(Xs())(Math.floor(o.div(r).toNumber())).mul(r)):i>1&&(o=new(Xs())(Math.floor(e)))}else 0===e?o=new(Xs())(Math.floor((t-1)/2)):n||(o=new(Xs())(Math.floor(e)));var a=Math.floor((t-1)/2);return rf(nf(function(e){return o.add(new(Xs())(e-a).mul(r)).toNumber()}),tf)(0,t)}function gf(e,t,n,r){var o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:0;if(!Number.isFinite((t-e)/(n-1)))return{step:new(Xs())(0),tickMin:new(Xs())(0),tickMax:new(Xs())(0)};var i,a=vf(new(Xs())(t).sub(e).div(n-1),r,o);i=e<=0&&t>=0?new(Xs())(0):(i=new(Xs())(e).add(t).div(2)).sub(new(Xs())(i).mod(a));var l=Math.ceil(i.sub(e).div(a).toNumber()),u=Math.ceil(new(Xs())(t).sub(i).div(a).toNumber()),c=l+u+1;return c>n?gf(e,t,n,r,o+1):(c<n&&(u=t>0?u+(n-c):u,l=t>0?l:l+(n-c)),{step:a,tickMin:i.sub(new(Xs())(l).mul(a)),tickMax:i.add(new(Xs())(u).mul(a))})}var bf=af(function(e){var t=df(e,2),n=t[0],r=t[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),l=df(yf([n,r]),2),u=l[0],c=l[1];if(u===-1/0||c===1/0){var s=c===1/0?[u].concat(ff(tf(0,o-1).map(function(){return 1/0}))):[].concat(ff(tf(0,o-1).map(function(){return-1/0})),[c]);return n>r?of(s):s}if(u===c)return mf(u,o,i);var f=gf(u,c,a,i),d=f.step,p=f.tickMin,h=f.tickMax,y=sf.rangeStep(p,h.add(new(Xs())(.1).mul(d)),d);return n>r?of(y):y}),xf=(af(function(e){var t=df(e,2),n=t[0],r=t[1],o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:6,i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=Math.max(o,2),l=df(yf([n,r]),2),u=l[0],c=l[1];if(u===-1/0||c===1/0)return[n,r];if(u===c)return mf(u,o,i);var s=vf(new(Xs())(c).sub(u).div(a-1),i,0),f=rf(nf(function(e){return new(Xs())(u).add(new(Xs())(e).mul(s)).toNumber()}),tf)(0,a).filter(function(e){return e>=u&&e<=c});return n>r?of(f):f}),af(function(e,t){var n=df(e,2),r=n[0],o=n[1],i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=df(yf([r,o]),2),l=a[0],u=a[1];if(l===-1/0||u===1/0)return[r,o];if(l===u)return[l];var c=Math.max(t,2),s=vf(new(Xs())(u).sub(l).div(c-1),i,0),f=[].concat(ff(sf.rangeStep(new(Xs())(l),new(Xs())(u).sub(new(Xs())(.99).mul(s)),s)),[u]);return r>o?of(f):f})),wf=["offset","layout","width","dataKey","data","dataPointFormatter","xAxis","yAxis"];function Of(e){return Of="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Of(e)}function Sf(){return Sf=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Sf.apply(this,arguments)}function jf(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return kf(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return kf(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function kf(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Pf(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Ef(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Nf(r.key),r)}}function _f(e,t,n){return t=Af(t),function(e,t){if(t&&("object"===Of(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Mf()?Reflect.construct(t,n||[],Af(e).constructor):t.apply(e,n))}function Mf(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(Mf=function(){return!!e})()}function Af(e){return Af=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Af(e)}function Cf(e,t){return Cf=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Cf(e,t)}function Tf(e,t,n){return(t=Nf(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Nf(e){var t=function(e,t){if("object"!=Of(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Of(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Of(t)?t:t+""}var Df=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),_f(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Cf(e,t)}(n,e),r=n,o=[{key:"render",value:function(){var e=this.props,n=e.offset,r=e.layout,o=e.width,i=e.dataKey,a=e.data,l=e.dataPointFormatter,u=e.xAxis,c=e.yAxis,s=Pf(e,wf),f=ue(s,!1);"x"===this.props.direction&&"number"!==u.type&&je(!1);var d=a.map(function(e){var a=l(e,i),s=a.x,d=a.y,p=a.value,h=a.errorVal;if(!h)return null;var y,v,m=[];if(Array.isArray(h)){var g=jf(h,2);y=g[0],v=g[1]}else y=v=h;if("vertical"===r){var b=u.scale,x=d+n,w=x+o,O=x-o,S=b(p-y),j=b(p+v);m.push({x1:j,y1:w,x2:j,y2:O}),m.push({x1:S,y1:x,x2:j,y2:x}),m.push({x1:S,y1:w,x2:S,y2:O})}else if("horizontal"===r){var k=c.scale,P=s+n,E=P-o,_=P+o,M=k(p-y),A=k(p+v);m.push({x1:E,y1:A,x2:_,y2:A}),m.push({x1:P,y1:M,x2:P,y2:A}),m.push({x1:E,y1:M,x2:_,y2:M})}return t.createElement(Te,Sf({className:"recharts-errorBar",key:"bar-".concat(m.map(function(e){return"".concat(e.x1,"-").concat(e.x2,"-").concat(e.y1,"-").concat(e.y2)}))},f),m.map(function(e){return t.createElement("line",Sf({},e,{key:"line-".concat(e.x1,"-").concat(e.x2,"-").concat(e.y1,"-").concat(e.y2)}))}))});return t.createElement(Te,{className:"recharts-errorBars"},d)}}],o&&Ef(r.prototype,o),i&&Ef(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function If(e){return If="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},If(e)}function zf(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Rf(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?zf(Object(n),!0).forEach(function(t){Lf(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):zf(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Lf(e,t,n){return t=function(e){var t=function(e,t){if("object"!=If(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=If(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==If(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}Tf(Df,"defaultProps",{stroke:"black",strokeWidth:1.5,width:5,offset:0,layout:"horizontal"}),Tf(Df,"displayName","ErrorBar");var Bf=function(e){var t=e.children,n=e.formattedGraphicalItems,r=e.legendWidth,o=e.legendContent,i=oe(t,Kn);if(!i)return null;var a,l=Kn.defaultProps,u=void 0!==l?Rf(Rf({},l),i.props):{};return a=i.props&&i.props.payload?i.props&&i.props.payload:"children"===o?(n||[]).reduce(function(e,t){var n=t.item,r=t.props,o=r.sectors||r.data||[];return e.concat(o.map(function(e){return{type:i.props.iconType||n.props.legendType,value:e.name,color:e.fill,payload:e}}))},[]):(n||[]).map(function(e){var t=e.item,n=t.type.defaultProps,r=void 0!==n?Rf(Rf({},n),t.props):{},o=r.dataKey,i=r.name,a=r.legendType;return{inactive:r.hide,dataKey:o,type:u.iconType||a||"square",color:Yf(t),value:i||o,payload:r}}),Rf(Rf(Rf({},u),Kn.getWithHeight(i,r)),{},{payload:a,item:i})};function Ff(e){return Ff="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ff(e)}function Uf(e){return function(e){if(Array.isArray(e))return Wf(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Wf(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Wf(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Wf(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Hf(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function qf(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Hf(Object(n),!0).forEach(function(t){Vf(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Hf(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Vf(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Ff(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Ff(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Ff(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Xf(e,t,n){return O()(e)||O()(t)?n:P(t)?g()(e,t,n):z()(t)?t(e):n}function $f(e,t,n,r){var o=Ws()(e,function(e){return Xf(e,t)});if("number"===n){var i=o.filter(function(e){return k(e)||parseFloat(e)});return i.length?[Fs()(i),Ls()(i)]:[1/0,-1/0]}return(r?o.filter(function(e){return!O()(e)}):o).map(function(e){return P(e)||e instanceof Date?e:""})}var Yf=function(e){var t,n,r=e.type.displayName,o=null!==(t=e.type)&&void 0!==t&&t.defaultProps?qf(qf({},e.type.defaultProps),e.props):e.props,i=o.stroke,a=o.fill;switch(r){case"Line":n=i;break;case"Area":case"Radar":n=i&&"none"!==i?i:a;break;default:n=a}return n},Gf=function(e,t,n,r,o){var i=re(t.props.children,Df).filter(function(e){return function(e,t,n){return!!O()(t)||("horizontal"===e?"yAxis"===t:"vertical"===e||"x"===n?"xAxis"===t:"y"!==n||"yAxis"===t)}(r,o,e.props.direction)});if(i&&i.length){var a=i.map(function(e){return e.props.dataKey});return e.reduce(function(e,t){var r=Xf(t,n);if(O()(r))return e;var o=Array.isArray(r)?[Fs()(r),Ls()(r)]:[r,r],i=a.reduce(function(e,n){var r=Xf(t,n,0),i=o[0]-Math.abs(Array.isArray(r)?r[0]:r),a=o[1]+Math.abs(Array.isArray(r)?r[1]:r);return[Math.min(i,e[0]),Math.max(a,e[1])]},[1/0,-1/0]);return[Math.min(i[0],e[0]),Math.max(i[1],e[1])]},[1/0,-1/0])}return null},Kf=function(e,t,n,r,o){var i=t.map(function(t){var i=t.props.dataKey;return"number"===n&&i&&Gf(e,t,i,r)||$f(e,i,n,o)});if("number"===n)return i.reduce(function(e,t){return[Math.min(e[0],t[0]),Math.max(e[1],t[1])]},[1/0,-1/0]);var a={};return i.reduce(function(e,t){for(var n=0,r=t.length;n<r;n++)a[t[n]]||(a[t[n]]=!0,e.push(t[n]));return e},[])},Qf=function(e,t){return"horizontal"===e&&"xAxis"===t||"vertical"===e&&"yAxis"===t||"centric"===e&&"angleAxis"===t||"radial"===e&&"radiusAxis"===t},Zf=function(e,t,n,r){if(r)return e.map(function(e){return e.coordinate});var o,i,a=e.map(function(e){return e.coordinate===t&&(o=!0),e.coordinate===n&&(i=!0),e.coordinate});return o||a.push(t),i||a.push(n),a},Jf=function(e,t,n){if(!e)return null;var r=e.scale,o=e.duplicateDomain,i=e.type,a=e.range,l="scaleBand"===e.realScaleType?r.bandwidth()/2:2,u=(t||n)&&"category"===i&&r.bandwidth?r.bandwidth()/l:0;return u="angleAxis"===e.axisType&&(null===a||void 0===a?void 0:a.length)>=2?2*S(a[0]-a[1])*u:u,t&&(e.ticks||e.niceTicks)?(e.ticks||e.niceTicks).map(function(e){var t=o?o.indexOf(e):e;return{coordinate:r(t)+u,value:e,offset:u}}).filter(function(e){return!v()(e.coordinate)}):e.isCategorical&&e.categoricalDomain?e.categoricalDomain.map(function(e,t){return{coordinate:r(e)+u,value:e,index:t,offset:u}}):r.ticks&&!n?r.ticks(e.tickCount).map(function(e){return{coordinate:r(e)+u,value:e,offset:u}}):r.domain().map(function(e,t){return{coordinate:r(e)+u,value:o?o[e]:e,index:t,offset:u}})},ed=new WeakMap,td=function(e,t){if("function"!==typeof t)return e;ed.has(e)||ed.set(e,new WeakMap);var n=ed.get(e);if(n.has(t))return n.get(t);var r=function(){e.apply(void 0,arguments),t.apply(void 0,arguments)};return n.set(t,r),r},nd=1e-4,rd={sign:function(e){var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var o=0,i=0,a=0;a<t;++a){var l=v()(e[a][n][1])?e[a][n][0]:e[a][n][1];l>=0?(e[a][n][0]=o,e[a][n][1]=o+l,o=e[a][n][1]):(e[a][n][0]=i,e[a][n][1]=i+l,i=e[a][n][1])}},expand:function(e,t){if((r=e.length)>0){for(var n,r,o,i=0,a=e[0].length;i<a;++i){for(o=n=0;n<r;++n)o+=e[n][i][1]||0;if(o)for(n=0;n<r;++n)e[n][i][1]/=o}Ts(e,t)}},none:Ts,silhouette:function(e,t){if((n=e.length)>0){for(var n,r=0,o=e[t[0]],i=o.length;r<i;++r){for(var a=0,l=0;a<n;++a)l+=e[a][r][1]||0;o[r][1]+=o[r][0]=-l/2}Ts(e,t)}},wiggle:function(e,t){if((o=e.length)>0&&(r=(n=e[t[0]]).length)>0){for(var n,r,o,i=0,a=1;a<r;++a){for(var l=0,u=0,c=0;l<o;++l){for(var s=e[t[l]],f=s[a][1]||0,d=(f-(s[a-1][1]||0))/2,p=0;p<l;++p){var h=e[t[p]];d+=(h[a][1]||0)-(h[a-1][1]||0)}u+=f,c+=d*f}n[a-1][1]+=n[a-1][0]=i,u&&(i-=c/u)}n[a-1][1]+=n[a-1][0]=i,Ts(e,t)}},positive:function(e){var t=e.length;if(!(t<=0))for(var n=0,r=e[0].length;n<r;++n)for(var o=0,i=0;i<t;++i){var a=v()(e[i][n][1])?e[i][n][0]:e[i][n][1];a>=0?(e[i][n][0]=o,e[i][n][1]=o+a,o=e[i][n][1]):(e[i][n][0]=0,e[i][n][1]=0)}}},od=function(e,t,n){var r=t.map(function(e){return e.props.dataKey}),o=rd[n],i=function(){var e=Vt([]),t=Ds,n=Ts,r=Is;function o(o){var i,a,l=Array.from(e.apply(this,arguments),zs),u=l.length,c=-1;for(const e of o)for(i=0,++c;i<u;++i)(l[i][c]=[0,+r(e,l[i].key,c,o)]).data=e;for(i=0,a=Ns(t(l));i<u;++i)l[a[i]].index=i;return n(l,a),l}return o.keys=function(t){return arguments.length?(e="function"===typeof t?t:Vt(Array.from(t)),o):e},o.value=function(e){return arguments.length?(r="function"===typeof e?e:Vt(+e),o):r},o.order=function(e){return arguments.length?(t=null==e?Ds:"function"===typeof e?e:Vt(Array.from(e)),o):t},o.offset=function(e){return arguments.length?(n=null==e?Ts:e,o):n},o}().keys(r).value(function(e,t){return+Xf(e,t,0)}).order(Ds).offset(o);return i(e)};function id(e){var t=e.axis,n=e.ticks,r=e.bandSize,o=e.entry,i=e.index,a=e.dataKey;if("category"===t.type){if(!t.allowDuplicatedCategory&&t.dataKey&&!O()(o[t.dataKey])){var l=T(n,"value",o[t.dataKey]);if(l)return l.coordinate+r/2}return n[i]?n[i].coordinate+r/2:null}var u=Xf(o,O()(a)?t.dataKey:a);return O()(u)?null:t.scale(u)}var ad=function(e){var t=e.axis,n=e.ticks,r=e.offset,o=e.bandSize,i=e.entry,a=e.index;if("category"===t.type)return n[a]?n[a].coordinate+r:null;var l=Xf(i,t.dataKey,t.domain[a]);return O()(l)?null:t.scale(l)-o/2+r},ld=function(e,t,n){return Object.keys(e).reduce(function(r,o){var i=e[o].stackedData.reduce(function(e,r){var o=r.slice(t,n+1).reduce(function(e,t){return[Fs()(t.concat([e[0]]).filter(k)),Ls()(t.concat([e[1]]).filter(k))]},[1/0,-1/0]);return[Math.min(e[0],o[0]),Math.max(e[1],o[1])]},[1/0,-1/0]);return[Math.min(i[0],r[0]),Math.max(i[1],r[1])]},[1/0,-1/0]).map(function(e){return e===1/0||e===-1/0?0:e})},ud=/^dataMin[\s]*-[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,cd=/^dataMax[\s]*\+[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,sd=function(e,t,n){if(z()(e))return e(t,n);if(!Array.isArray(e))return t;var r=[];if(k(e[0]))r[0]=n?e[0]:Math.min(e[0],t[0]);else if(ud.test(e[0])){var o=+ud.exec(e[0])[1];r[0]=t[0]-o}else z()(e[0])?r[0]=e[0](t[0]):r[0]=t[0];if(k(e[1]))r[1]=n?e[1]:Math.max(e[1],t[1]);else if(cd.test(e[1])){var i=+cd.exec(e[1])[1];r[1]=t[1]+i}else z()(e[1])?r[1]=e[1](t[1]):r[1]=t[1];return r},fd=function(e,t,n){if(e&&e.scale&&e.scale.bandwidth){var r=e.scale.bandwidth();if(!n||r>0)return r}if(e&&t&&t.length>=2){for(var o=Oe()(t,function(e){return e.coordinate}),i=1/0,a=1,l=o.length;a<l;a++){var u=o[a],c=o[a-1];i=Math.min((u.coordinate||0)-(c.coordinate||0),i)}return i===1/0?0:i}return n?void 0:0},dd=function(e,t,n){return e&&e.length?qs()(e,g()(n,"type.defaultProps.domain"))?t:e:t},pd=function(e,t){var n=e.type.defaultProps?qf(qf({},e.type.defaultProps),e.props):e.props,r=n.dataKey,o=n.name,i=n.unit,a=n.formatter,l=n.tooltipType,u=n.chartType,c=n.hide;return qf(qf({},ue(e,!1)),{},{dataKey:r,unit:i,formatter:a,name:o||r,color:Yf(e),value:Xf(t,r),type:l,payload:t,chartType:u,hide:c})};function hd(e){return hd="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},hd(e)}function yd(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function vd(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?yd(Object(n),!0).forEach(function(t){md(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):yd(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function md(e,t,n){return t=function(e){var t=function(e,t){if("object"!=hd(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=hd(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==hd(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var gd=["Webkit","Moz","O","ms"];function bd(e){return bd="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},bd(e)}function xd(){return xd=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},xd.apply(this,arguments)}function wd(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Od(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?wd(Object(n),!0).forEach(function(t){_d(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):wd(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Sd(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Md(r.key),r)}}function jd(e,t,n){return t=Pd(t),function(e,t){if(t&&("object"===bd(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,kd()?Reflect.construct(t,n||[],Pd(e).constructor):t.apply(e,n))}function kd(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(kd=function(){return!!e})()}function Pd(e){return Pd=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Pd(e)}function Ed(e,t){return Ed=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Ed(e,t)}function _d(e,t,n){return(t=Md(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Md(e){var t=function(e,t){if("object"!=bd(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=bd(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==bd(t)?t:t+""}var Ad=function(e){return e.changedTouches&&!!e.changedTouches.length},Cd=function(e){function n(e){var t;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),_d(t=jd(this,n,[e]),"handleDrag",function(e){t.leaveTimer&&(clearTimeout(t.leaveTimer),t.leaveTimer=null),t.state.isTravellerMoving?t.handleTravellerMove(e):t.state.isSlideMoving&&t.handleSlideDrag(e)}),_d(t,"handleTouchMove",function(e){null!=e.changedTouches&&e.changedTouches.length>0&&t.handleDrag(e.changedTouches[0])}),_d(t,"handleDragEnd",function(){t.setState({isTravellerMoving:!1,isSlideMoving:!1},function(){var e=t.props,n=e.endIndex,r=e.onDragEnd,o=e.startIndex;null===r||void 0===r||r({endIndex:n,startIndex:o})}),t.detachDragEndListener()}),_d(t,"handleLeaveWrapper",function(){(t.state.isTravellerMoving||t.state.isSlideMoving)&&(t.leaveTimer=window.setTimeout(t.handleDragEnd,t.props.leaveTimeOut))}),_d(t,"handleEnterSlideOrTraveller",function(){t.setState({isTextActive:!0})}),_d(t,"handleLeaveSlideOrTraveller",function(){t.setState({isTextActive:!1})}),_d(t,"handleSlideDragStart",function(e){var n=Ad(e)?e.changedTouches[0]:e;t.setState({isTravellerMoving:!1,isSlideMoving:!0,slideMoveStartX:n.pageX}),t.attachDragEndListener()}),t.travellerDragStartHandlers={startX:t.handleTravellerDragStart.bind(t,"startX"),endX:t.handleTravellerDragStart.bind(t,"endX")},t.state={},t}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Ed(e,t)}(n,e),r=n,o=[{key:"componentWillUnmount",value:function(){this.leaveTimer&&(clearTimeout(this.leaveTimer),this.leaveTimer=null),this.detachDragEndListener()}},{key:"getIndex",value:function(e){var t=e.startX,r=e.endX,o=this.state.scaleValues,i=this.props,a=i.gap,l=i.data.length-1,u=Math.min(t,r),c=Math.max(t,r),s=n.getIndexInRange(o,u),f=n.getIndexInRange(o,c);return{startIndex:s-s%a,endIndex:f===l?l:f-f%a}}},{key:"getTextOfTick",value:function(e){var t=this.props,n=t.data,r=t.tickFormatter,o=t.dataKey,i=Xf(n[e],o,e);return z()(r)?r(i,e):i}},{key:"attachDragEndListener",value:function(){window.addEventListener("mouseup",this.handleDragEnd,!0),window.addEventListener("touchend",this.handleDragEnd,!0),window.addEventListener("mousemove",this.handleDrag,!0)}},{key:"detachDragEndListener",value:function(){window.removeEventListener("mouseup",this.handleDragEnd,!0),window.removeEventListener("touchend",this.handleDragEnd,!0),window.removeEventListener("mousemove",this.handleDrag,!0)}},{key:"handleSlideDrag",value:function(e){var t=this.state,n=t.slideMoveStartX,r=t.startX,o=t.endX,i=this.props,a=i.x,l=i.width,u=i.travellerWidth,c=i.startIndex,s=i.endIndex,f=i.onChange,d=e.pageX-n;d>0?d=Math.min(d,a+l-u-o,a+l-u-r):d<0&&(d=Math.max(d,a-r,a-o));var p=this.getIndex({startX:r+d,endX:o+d});p.startIndex===c&&p.endIndex===s||!f||f(p),this.setState({startX:r+d,endX:o+d,slideMoveStartX:e.pageX})}},{key:"handleTravellerDragStart",value:function(e,t){var n=Ad(t)?t.changedTouches[0]:t;this.setState({isSlideMoving:!1,isTravellerMoving:!0,movingTravellerId:e,brushMoveStartX:n.pageX}),this.attachDragEndListener()}},{key:"handleTravellerMove",value:function(e){var t=this.state,n=t.brushMoveStartX,r=t.movingTravellerId,o=t.endX,i=t.startX,a=this.state[r],l=this.props,u=l.x,c=l.width,s=l.travellerWidth,f=l.onChange,d=l.gap,p=l.data,h={startX:this.state.startX,endX:this.state.endX},y=e.pageX-n;y>0?y=Math.min(y,u+c-s-a):y<0&&(y=Math.max(y,u-a)),h[r]=a+y;var v=this.getIndex(h),m=v.startIndex,g=v.endIndex;this.setState(_d(_d({},r,a+y),"brushMoveStartX",e.pageX),function(){f&&function(){var e=p.length-1;return"startX"===r&&(o>i?m%d===0:g%d===0)||o<i&&g===e||"endX"===r&&(o>i?g%d===0:m%d===0)||o>i&&g===e}()&&f(v)})}},{key:"handleTravellerMoveKeyboard",value:function(e,t){var n=this,r=this.state,o=r.scaleValues,i=r.startX,a=r.endX,l=this.state[t],u=o.indexOf(l);if(-1!==u){var c=u+e;if(!(-1===c||c>=o.length)){var s=o[c];"startX"===t&&s>=a||"endX"===t&&s<=i||this.setState(_d({},t,s),function(){n.props.onChange(n.getIndex({startX:n.state.startX,endX:n.state.endX}))})}}}},{key:"renderBackground",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.fill,l=e.stroke;return t.createElement("rect",{stroke:l,fill:a,x:n,y:r,width:o,height:i})}},{key:"renderPanorama",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.data,l=e.children,u=e.padding,c=t.Children.only(l);return c?t.cloneElement(c,{x:n,y:r,width:o,height:i,margin:u,compact:!0,data:a}):null}},{key:"renderTravellerLayer",value:function(e,r){var o,i,a=this,l=this.props,u=l.y,c=l.travellerWidth,s=l.height,f=l.traveller,d=l.ariaLabel,p=l.data,h=l.startIndex,y=l.endIndex,v=Math.max(e,this.props.x),m=Od(Od({},ue(this.props,!1)),{},{x:v,y:u,width:c,height:s}),g=d||"Min value: ".concat(null===(o=p[h])||void 0===o?void 0:o.name,", Max value: ").concat(null===(i=p[y])||void 0===i?void 0:i.name);return t.createElement(Te,{tabIndex:0,role:"slider","aria-label":g,"aria-valuenow":e,className:"recharts-brush-traveller",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers[r],onTouchStart:this.travellerDragStartHandlers[r],onKeyDown:function(e){["ArrowLeft","ArrowRight"].includes(e.key)&&(e.preventDefault(),e.stopPropagation(),a.handleTravellerMoveKeyboard("ArrowRight"===e.key?1:-1,r))},onFocus:function(){a.setState({isTravellerFocused:!0})},onBlur:function(){a.setState({isTravellerFocused:!1})},style:{cursor:"col-resize"}},n.renderTraveller(f,m))}},{key:"renderSlide",value:function(e,n){var r=this.props,o=r.y,i=r.height,a=r.stroke,l=r.travellerWidth,u=Math.min(e,n)+l,c=Math.max(Math.abs(n-e)-l,0);return t.createElement("rect",{className:"recharts-brush-slide",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.handleSlideDragStart,onTouchStart:this.handleSlideDragStart,style:{cursor:"move"},stroke:"none",fill:a,fillOpacity:.2,x:u,y:o,width:c,height:i})}},{key:"renderText",value:function(){var e=this.props,n=e.startIndex,r=e.endIndex,o=e.y,i=e.height,a=e.travellerWidth,l=e.stroke,u=this.state,c=u.startX,s=u.endX,f={pointerEvents:"none",fill:l};return t.createElement(Te,{className:"recharts-brush-texts"},t.createElement(Ii,xd({textAnchor:"end",verticalAnchor:"middle",x:Math.min(c,s)-5,y:o+i/2},f),this.getTextOfTick(n)),t.createElement(Ii,xd({textAnchor:"start",verticalAnchor:"middle",x:Math.max(c,s)+a+5,y:o+i/2},f),this.getTextOfTick(r)))}},{key:"render",value:function(){var e=this.props,n=e.data,r=e.className,o=e.children,i=e.x,a=e.y,l=e.width,u=e.height,c=e.alwaysShowText,f=this.state,d=f.startX,p=f.endX,h=f.isTextActive,y=f.isSlideMoving,v=f.isTravellerMoving,m=f.isTravellerFocused;if(!n||!n.length||!k(i)||!k(a)||!k(l)||!k(u)||l<=0||u<=0)return null;var g=s("recharts-brush",r),b=1===t.Children.count(o),x=function(e,t){if(!e)return null;var n=e.replace(/(\w)/,function(e){return e.toUpperCase()}),r=gd.reduce(function(e,r){return vd(vd({},e),{},md({},r+n,t))},{});return r[e]=t,r}("userSelect","none");return t.createElement(Te,{className:g,onMouseLeave:this.handleLeaveWrapper,onTouchMove:this.handleTouchMove,style:x},this.renderBackground(),b&&this.renderPanorama(),this.renderSlide(d,p),this.renderTravellerLayer(d,"startX"),this.renderTravellerLayer(p,"endX"),(h||y||v||m||c)&&this.renderText())}}],i=[{key:"renderDefaultTraveller",value:function(e){var n=e.x,r=e.y,o=e.width,i=e.height,a=e.stroke,l=Math.floor(r+i/2)-1;return t.createElement(t.Fragment,null,t.createElement("rect",{x:n,y:r,width:o,height:i,fill:a,stroke:"none"}),t.createElement("line",{x1:n+1,y1:l,x2:n+o-1,y2:l,fill:"none",stroke:"#fff"}),t.createElement("line",{x1:n+1,y1:l+2,x2:n+o-1,y2:l+2,fill:"none",stroke:"#fff"}))}},{key:"renderTraveller",value:function(e,r){return t.isValidElement(e)?t.cloneElement(e,r):z()(e)?e(r):n.renderDefaultTraveller(r)}},{key:"getDerivedStateFromProps",value:function(e,t){var n=e.data,r=e.width,o=e.x,i=e.travellerWidth,a=e.updateId,l=e.startIndex,u=e.endIndex;if(n!==t.prevData||a!==t.prevUpdateId)return Od({prevData:n,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:r},n&&n.length?function(e){var t=e.data,n=e.startIndex,r=e.endIndex,o=e.x,i=e.width,a=e.travellerWidth;if(!t||!t.length)return{};var l=t.length,u=Zo().domain(xe()(0,l)).range([o,o+i-a]),c=u.domain().map(function(e){return u(e)});return{isTextActive:!1,isSlideMoving:!1,isTravellerMoving:!1,isTravellerFocused:!1,startX:u(n),endX:u(r),scale:u,scaleValues:c}}({data:n,width:r,x:o,travellerWidth:i,startIndex:l,endIndex:u}):{scale:null,scaleValues:null});if(t.scale&&(r!==t.prevWidth||o!==t.prevX||i!==t.prevTravellerWidth)){t.scale.range([o,o+r-i]);var c=t.scale.domain().map(function(e){return t.scale(e)});return{prevData:n,prevTravellerWidth:i,prevUpdateId:a,prevX:o,prevWidth:r,startX:t.scale(e.startIndex),endX:t.scale(e.endIndex),scaleValues:c}}return null}},{key:"getIndexInRange",value:function(e,t){for(var n=0,r=e.length-1;r-n>1;){var o=Math.floor((n+r)/2);e[o]>t?r=o:n=o}return t>=e[r]?r:n}}],o&&Sd(r.prototype,o),i&&Sd(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function Td(e){return Td="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Td(e)}function Nd(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Dd(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Nd(Object(n),!0).forEach(function(t){Id(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Nd(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Id(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Td(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Td(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Td(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}_d(Cd,"displayName","Brush"),_d(Cd,"defaultProps",{height:40,travellerWidth:5,gap:1,fill:"#fff",stroke:"#666",padding:{top:1,right:1,bottom:1,left:1},leaveTimeOut:1e3,alwaysShowText:!1});var zd=Math.PI/180,Rd=function(e){return 180*e/Math.PI},Ld=function(e,t,n,r){return{x:e+Math.cos(-zd*r)*n,y:t+Math.sin(-zd*r)*n}},Bd=function(e,t){var n=e.x,r=e.y,o=t.cx,i=t.cy,a=function(e,t){var n=e.x,r=e.y,o=t.x,i=t.y;return Math.sqrt(Math.pow(n-o,2)+Math.pow(r-i,2))}({x:n,y:r},{x:o,y:i});if(a<=0)return{radius:a};var l=(n-o)/a,u=Math.acos(l);return r>i&&(u=2*Math.PI-u),{radius:a,angle:Rd(u),angleInRadian:u}},Fd=function(e,t){var n=t.startAngle,r=t.endAngle,o=Math.floor(n/360),i=Math.floor(r/360);return e+360*Math.min(o,i)},Ud=function(e,t){var n=e.x,r=e.y,o=Bd({x:n,y:r},t),i=o.radius,a=o.angle,l=t.innerRadius,u=t.outerRadius;if(i<l||i>u)return!1;if(0===i)return!0;var c,s=function(e){var t=e.startAngle,n=e.endAngle,r=Math.floor(t/360),o=Math.floor(n/360),i=Math.min(r,o);return{startAngle:t-360*i,endAngle:n-360*i}}(t),f=s.startAngle,d=s.endAngle,p=a;if(f<=d){for(;p>d;)p-=360;for(;p<f;)p+=360;c=p>=f&&p<=d}else{for(;p>f;)p-=360;for(;p<d;)p+=360;c=p>=d&&p<=f}return c?Dd(Dd({},t),{},{radius:i,angle:Fd(p,t)}):null};function Wd(e){return Wd="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Wd(e)}var Hd=["offset"];function qd(e){return function(e){if(Array.isArray(e))return Vd(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Vd(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Vd(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Vd(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Xd(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function $d(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Yd(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?$d(Object(n),!0).forEach(function(t){Gd(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):$d(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Gd(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Wd(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Wd(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Wd(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Kd(){return Kd=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Kd.apply(this,arguments)}var Qd=function(e,n,r){var o,i,a=e.position,l=e.viewBox,u=e.offset,c=e.className,f=l,d=f.cx,p=f.cy,h=f.innerRadius,y=f.outerRadius,v=f.startAngle,m=f.endAngle,g=f.clockWise,b=(h+y)/2,x=function(e,t){return S(t-e)*Math.min(Math.abs(t-e),360)}(v,m),w=x>=0?1:-1;"insideStart"===a?(o=v+w*u,i=g):"insideEnd"===a?(o=m-w*u,i=!g):"end"===a&&(o=m+w*u,i=g),i=x<=0?i:!i;var j=Ld(d,p,b,o),k=Ld(d,p,b,o+359*(i?1:-1)),P="M".concat(j.x,",").concat(j.y,"\n    A").concat(b,",").concat(b,",0,1,").concat(i?0:1,",\n    ").concat(k.x,",").concat(k.y),E=O()(e.id)?_("recharts-radial-line-"):e.id;return t.createElement("text",Kd({},r,{dominantBaseline:"central",className:s("recharts-radial-bar-label",c)}),t.createElement("defs",null,t.createElement("path",{id:E,d:P})),t.createElement("textPath",{xlinkHref:"#".concat(E)},n))};function Zd(e){var n,r=e.offset,o=Yd({offset:void 0===r?5:r},Xd(e,Hd)),i=o.viewBox,a=o.position,l=o.value,u=o.children,c=o.content,f=o.className,d=void 0===f?"":f,p=o.textBreakAll;if(!i||O()(l)&&O()(u)&&!(0,t.isValidElement)(c)&&!z()(c))return null;if((0,t.isValidElement)(c))return(0,t.cloneElement)(c,o);if(z()(c)){if(n=(0,t.createElement)(c,o),(0,t.isValidElement)(n))return n}else n=function(e){var t=e.value,n=e.formatter,r=O()(e.children)?t:e.children;return z()(n)?n(r):r}(o);var h=function(e){return"cx"in e&&k(e.cx)}(i),y=ue(o,!0);if(h&&("insideStart"===a||"insideEnd"===a||"end"===a))return Qd(o,n,y);var v=h?function(e){var t=e.viewBox,n=e.offset,r=e.position,o=t,i=o.cx,a=o.cy,l=o.innerRadius,u=o.outerRadius,c=(o.startAngle+o.endAngle)/2;if("outside"===r){var s=Ld(i,a,u+n,c),f=s.x;return{x:f,y:s.y,textAnchor:f>=i?"start":"end",verticalAnchor:"middle"}}if("center"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"middle"};if("centerTop"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"start"};if("centerBottom"===r)return{x:i,y:a,textAnchor:"middle",verticalAnchor:"end"};var d=Ld(i,a,(l+u)/2,c);return{x:d.x,y:d.y,textAnchor:"middle",verticalAnchor:"middle"}}(o):function(e){var t=e.viewBox,n=e.parentViewBox,r=e.offset,o=e.position,i=t,a=i.x,l=i.y,u=i.width,c=i.height,s=c>=0?1:-1,f=s*r,d=s>0?"end":"start",p=s>0?"start":"end",h=u>=0?1:-1,y=h*r,v=h>0?"end":"start",m=h>0?"start":"end";if("top"===o)return Yd(Yd({},{x:a+u/2,y:l-s*r,textAnchor:"middle",verticalAnchor:d}),n?{height:Math.max(l-n.y,0),width:u}:{});if("bottom"===o)return Yd(Yd({},{x:a+u/2,y:l+c+f,textAnchor:"middle",verticalAnchor:p}),n?{height:Math.max(n.y+n.height-(l+c),0),width:u}:{});if("left"===o){var g={x:a-y,y:l+c/2,textAnchor:v,verticalAnchor:"middle"};return Yd(Yd({},g),n?{width:Math.max(g.x-n.x,0),height:c}:{})}if("right"===o){var b={x:a+u+y,y:l+c/2,textAnchor:m,verticalAnchor:"middle"};return Yd(Yd({},b),n?{width:Math.max(n.x+n.width-b.x,0),height:c}:{})}var x=n?{width:u,height:c}:{};return"insideLeft"===o?Yd({x:a+y,y:l+c/2,textAnchor:m,verticalAnchor:"middle"},x):"insideRight"===o?Yd({x:a+u-y,y:l+c/2,textAnchor:v,verticalAnchor:"middle"},x):"insideTop"===o?Yd({x:a+u/2,y:l+f,textAnchor:"middle",verticalAnchor:p},x):"insideBottom"===o?Yd({x:a+u/2,y:l+c-f,textAnchor:"middle",verticalAnchor:d},x):"insideTopLeft"===o?Yd({x:a+y,y:l+f,textAnchor:m,verticalAnchor:p},x):"insideTopRight"===o?Yd({x:a+u-y,y:l+f,textAnchor:v,verticalAnchor:p},x):"insideBottomLeft"===o?Yd({x:a+y,y:l+c-f,textAnchor:m,verticalAnchor:d},x):"insideBottomRight"===o?Yd({x:a+u-y,y:l+c-f,textAnchor:v,verticalAnchor:d},x):L()(o)&&(k(o.x)||j(o.x))&&(k(o.y)||j(o.y))?Yd({x:a+M(o.x,u),y:l+M(o.y,c),textAnchor:"end",verticalAnchor:"end"},x):Yd({x:a+u/2,y:l+c/2,textAnchor:"middle",verticalAnchor:"middle"},x)}(o);return t.createElement(Ii,Kd({className:s("recharts-label",d)},y,v,{breakAll:p}),n)}Zd.displayName="Label";var Jd=function(e){var t=e.cx,n=e.cy,r=e.angle,o=e.startAngle,i=e.endAngle,a=e.r,l=e.radius,u=e.innerRadius,c=e.outerRadius,s=e.x,f=e.y,d=e.top,p=e.left,h=e.width,y=e.height,v=e.clockWise,m=e.labelViewBox;if(m)return m;if(k(h)&&k(y)){if(k(s)&&k(f))return{x:s,y:f,width:h,height:y};if(k(d)&&k(p))return{x:d,y:p,width:h,height:y}}return k(s)&&k(f)?{x:s,y:f,width:0,height:0}:k(t)&&k(n)?{cx:t,cy:n,startAngle:o||r||0,endAngle:i||r||0,innerRadius:u||0,outerRadius:c||l||a||0,clockWise:v}:e.viewBox?e.viewBox:{}};Zd.parseViewBox=Jd,Zd.renderCallByParent=function(e,n){var r=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!e||!e.children&&r&&!e.label)return null;var o=e.children,i=Jd(e),a=re(o,Zd).map(function(e,r){return(0,t.cloneElement)(e,{viewBox:n||i,key:"label-".concat(r)})});if(!r)return a;var l=function(e,n){return e?!0===e?t.createElement(Zd,{key:"label-implicit",viewBox:n}):P(e)?t.createElement(Zd,{key:"label-implicit",viewBox:n,value:e}):(0,t.isValidElement)(e)?e.type===Zd?(0,t.cloneElement)(e,{key:"label-implicit",viewBox:n}):t.createElement(Zd,{key:"label-implicit",content:e,viewBox:n}):z()(e)?t.createElement(Zd,{key:"label-implicit",content:e,viewBox:n}):L()(e)?t.createElement(Zd,Kd({viewBox:n},e,{key:"label-implicit"})):null:null}(e.label,n||i);return[l].concat(qd(a))};var ep=function(e,t){var n=e.alwaysShow,r=e.ifOverflow;return n&&(r="extendDomain"),r===t},tp=n(1733),np=n.n(tp),rp=n(7002),op=n.n(rp),ip=function(e){return null};ip.displayName="Cell";var ap=n(4065),lp=n.n(ap);function up(e){return up="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},up(e)}var cp=["valueAccessor"],sp=["data","dataKey","clockWise","id","textBreakAll"];function fp(e){return function(e){if(Array.isArray(e))return dp(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return dp(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return dp(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function dp(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function pp(){return pp=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},pp.apply(this,arguments)}function hp(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function yp(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?hp(Object(n),!0).forEach(function(t){vp(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):hp(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function vp(e,t,n){return t=function(e){var t=function(e,t){if("object"!=up(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=up(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==up(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function mp(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var gp=function(e){return Array.isArray(e.value)?lp()(e.value):e.value};function bp(e){var n=e.valueAccessor,r=void 0===n?gp:n,o=mp(e,cp),i=o.data,a=o.dataKey,l=o.clockWise,u=o.id,c=o.textBreakAll,s=mp(o,sp);return i&&i.length?t.createElement(Te,{className:"recharts-label-list"},i.map(function(e,n){var o=O()(a)?r(e,n):Xf(e&&e.payload,a),i=O()(u)?{}:{id:"".concat(u,"-").concat(n)};return t.createElement(Zd,pp({},ue(e,!0),s,i,{parentViewBox:e.parentViewBox,value:o,textBreakAll:c,viewBox:Zd.parseViewBox(O()(l)?e:yp(yp({},e),{},{clockWise:l})),key:"label-".concat(n),index:n}))})):null}bp.displayName="LabelList",bp.renderCallByParent=function(e,n){var r=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if(!e||!e.children&&r&&!e.label)return null;var o=re(e.children,bp).map(function(e,r){return(0,t.cloneElement)(e,{data:n,key:"labelList-".concat(r)})});return r?[function(e,n){return e?!0===e?t.createElement(bp,{key:"labelList-implicit",data:n}):t.isValidElement(e)||z()(e)?t.createElement(bp,{key:"labelList-implicit",data:n,content:e}):L()(e)?t.createElement(bp,pp({data:n},e,{key:"labelList-implicit"})):null:null}(e.label,n)].concat(fp(o)):o};var xp=n(2322),wp=n.n(xp),Op=n(6361),Sp=n.n(Op);function jp(e){return jp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},jp(e)}function kp(){return kp=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},kp.apply(this,arguments)}function Pp(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return Ep(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Ep(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Ep(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function _p(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Mp(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?_p(Object(n),!0).forEach(function(t){Ap(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):_p(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ap(e,t,n){return t=function(e){var t=function(e,t){if("object"!=jp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=jp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==jp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var Cp=function(e,t,n,r,o){var i,a=n-r;return i="M ".concat(e,",").concat(t),i+="L ".concat(e+n,",").concat(t),i+="L ".concat(e+n-a/2,",").concat(t+o),i+="L ".concat(e+n-a/2-r,",").concat(t+o),i+="L ".concat(e,",").concat(t," Z")},Tp={x:0,y:0,upperWidth:0,lowerWidth:0,height:0,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},Np=function(e){var n=Mp(Mp({},Tp),e),r=(0,t.useRef)(),o=Pp((0,t.useState)(-1),2),i=o[0],a=o[1];(0,t.useEffect)(function(){if(r.current&&r.current.getTotalLength)try{var e=r.current.getTotalLength();e&&a(e)}catch(t){}},[]);var l=n.x,u=n.y,c=n.upperWidth,f=n.lowerWidth,d=n.height,p=n.className,h=n.animationEasing,y=n.animationDuration,v=n.animationBegin,m=n.isUpdateAnimationActive;if(l!==+l||u!==+u||c!==+c||f!==+f||d!==+d||0===c&&0===f||0===d)return null;var g=s("recharts-trapezoid",p);return m?t.createElement(Mo,{canBegin:i>0,from:{upperWidth:0,lowerWidth:0,height:d,x:l,y:u},to:{upperWidth:c,lowerWidth:f,height:d,x:l,y:u},duration:y,animationEasing:h,isActive:m},function(e){var o=e.upperWidth,a=e.lowerWidth,l=e.height,u=e.x,c=e.y;return t.createElement(Mo,{canBegin:i>0,from:"0px ".concat(-1===i?1:i,"px"),to:"".concat(i,"px 0px"),attributeName:"strokeDasharray",begin:v,duration:y,easing:h},t.createElement("path",kp({},ue(n,!0),{className:g,d:Cp(u,c,o,a,l),ref:r})))}):t.createElement("g",null,t.createElement("path",kp({},ue(n,!0),{className:g,d:Cp(l,u,c,f,d)})))};function Dp(e){return Dp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Dp(e)}function Ip(){return Ip=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ip.apply(this,arguments)}function zp(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Rp(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?zp(Object(n),!0).forEach(function(t){Lp(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):zp(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Lp(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Dp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Dp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Dp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var Bp=function(e){var t=e.cx,n=e.cy,r=e.radius,o=e.angle,i=e.sign,a=e.isExternal,l=e.cornerRadius,u=e.cornerIsExternal,c=l*(a?1:-1)+r,s=Math.asin(l/c)/zd,f=u?o:o+i*s,d=u?o-i*s:o;return{center:Ld(t,n,c,f),circleTangency:Ld(t,n,r,f),lineTangency:Ld(t,n,c*Math.cos(s*zd),d),theta:s}},Fp=function(e){var t=e.cx,n=e.cy,r=e.innerRadius,o=e.outerRadius,i=e.startAngle,a=function(e,t){return S(t-e)*Math.min(Math.abs(t-e),359.999)}(i,e.endAngle),l=i+a,u=Ld(t,n,o,i),c=Ld(t,n,o,l),s="M ".concat(u.x,",").concat(u.y,"\n    A ").concat(o,",").concat(o,",0,\n    ").concat(+(Math.abs(a)>180),",").concat(+(i>l),",\n    ").concat(c.x,",").concat(c.y,"\n  ");if(r>0){var f=Ld(t,n,r,i),d=Ld(t,n,r,l);s+="L ".concat(d.x,",").concat(d.y,"\n            A ").concat(r,",").concat(r,",0,\n            ").concat(+(Math.abs(a)>180),",").concat(+(i<=l),",\n            ").concat(f.x,",").concat(f.y," Z")}else s+="L ".concat(t,",").concat(n," Z");return s},Up={cx:0,cy:0,innerRadius:0,outerRadius:0,startAngle:0,endAngle:0,cornerRadius:0,forceCornerRadius:!1,cornerIsExternal:!1},Wp=function(e){var n=Rp(Rp({},Up),e),r=n.cx,o=n.cy,i=n.innerRadius,a=n.outerRadius,l=n.cornerRadius,u=n.forceCornerRadius,c=n.cornerIsExternal,f=n.startAngle,d=n.endAngle,p=n.className;if(a<i||f===d)return null;var h,y=s("recharts-sector",p),v=a-i,m=M(l,v,0,!0);return h=m>0&&Math.abs(f-d)<360?function(e){var t=e.cx,n=e.cy,r=e.innerRadius,o=e.outerRadius,i=e.cornerRadius,a=e.forceCornerRadius,l=e.cornerIsExternal,u=e.startAngle,c=e.endAngle,s=S(c-u),f=Bp({cx:t,cy:n,radius:o,angle:u,sign:s,cornerRadius:i,cornerIsExternal:l}),d=f.circleTangency,p=f.lineTangency,h=f.theta,y=Bp({cx:t,cy:n,radius:o,angle:c,sign:-s,cornerRadius:i,cornerIsExternal:l}),v=y.circleTangency,m=y.lineTangency,g=y.theta,b=l?Math.abs(u-c):Math.abs(u-c)-h-g;if(b<0)return a?"M ".concat(p.x,",").concat(p.y,"\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*i,",0\n        a").concat(i,",").concat(i,",0,0,1,").concat(2*-i,",0\n      "):Fp({cx:t,cy:n,innerRadius:r,outerRadius:o,startAngle:u,endAngle:c});var x="M ".concat(p.x,",").concat(p.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(d.x,",").concat(d.y,"\n    A").concat(o,",").concat(o,",0,").concat(+(b>180),",").concat(+(s<0),",").concat(v.x,",").concat(v.y,"\n    A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(m.x,",").concat(m.y,"\n  ");if(r>0){var w=Bp({cx:t,cy:n,radius:r,angle:u,sign:s,isExternal:!0,cornerRadius:i,cornerIsExternal:l}),O=w.circleTangency,j=w.lineTangency,k=w.theta,P=Bp({cx:t,cy:n,radius:r,angle:c,sign:-s,isExternal:!0,cornerRadius:i,cornerIsExternal:l}),E=P.circleTangency,_=P.lineTangency,M=P.theta,A=l?Math.abs(u-c):Math.abs(u-c)-k-M;if(A<0&&0===i)return"".concat(x,"L").concat(t,",").concat(n,"Z");x+="L".concat(_.x,",").concat(_.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(E.x,",").concat(E.y,"\n      A").concat(r,",").concat(r,",0,").concat(+(A>180),",").concat(+(s>0),",").concat(O.x,",").concat(O.y,"\n      A").concat(i,",").concat(i,",0,0,").concat(+(s<0),",").concat(j.x,",").concat(j.y,"Z")}else x+="L".concat(t,",").concat(n,"Z");return x}({cx:r,cy:o,innerRadius:i,outerRadius:a,cornerRadius:Math.min(m,v/2),forceCornerRadius:u,cornerIsExternal:c,startAngle:f,endAngle:d}):Fp({cx:r,cy:o,innerRadius:i,outerRadius:a,startAngle:f,endAngle:d}),t.createElement("path",Ip({},ue(n,!0),{className:y,d:h,role:"img"}))},Hp=["option","shapeType","propTransformer","activeClassName","isActive"];function qp(e){return qp="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},qp(e)}function Vp(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Xp(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function $p(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Xp(Object(n),!0).forEach(function(t){Yp(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Xp(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Yp(e,t,n){return t=function(e){var t=function(e,t){if("object"!=qp(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=qp(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==qp(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Gp(e,t){return $p($p({},t),e)}function Kp(e){var n=e.shapeType,r=e.elementProps;switch(n){case"rectangle":return t.createElement(Fo,r);case"trapezoid":return t.createElement(Np,r);case"sector":return t.createElement(Wp,r);case"symbols":if(function(e){return"symbols"===e}(n))return t.createElement(jn,r);break;default:return null}}function Qp(e){var n,r=e.option,o=e.shapeType,i=e.propTransformer,a=void 0===i?Gp:i,l=e.activeClassName,u=void 0===l?"recharts-active-shape":l,c=e.isActive,s=Vp(e,Hp);if((0,t.isValidElement)(r))n=(0,t.cloneElement)(r,$p($p({},s),function(e){return(0,t.isValidElement)(e)?e.props:e}(r)));else if(z()(r))n=r(s);else if(wp()(r)&&!Sp()(r)){var f=a(r,s);n=t.createElement(Kp,{shapeType:o,elementProps:f})}else{var d=s;n=t.createElement(Kp,{shapeType:o,elementProps:d})}return c?t.createElement(Te,{className:u},n):n}function Zp(e,t){return null!=t&&"trapezoids"in e.props}function Jp(e,t){return null!=t&&"sectors"in e.props}function eh(e,t){return null!=t&&"points"in e.props}function th(e,t){var n,r,o=e.x===(null===t||void 0===t||null===(n=t.labelViewBox)||void 0===n?void 0:n.x)||e.x===t.x,i=e.y===(null===t||void 0===t||null===(r=t.labelViewBox)||void 0===r?void 0:r.y)||e.y===t.y;return o&&i}function nh(e,t){var n=e.endAngle===t.endAngle,r=e.startAngle===t.startAngle;return n&&r}function rh(e,t){var n=e.x===t.x,r=e.y===t.y,o=e.z===t.z;return n&&r&&o}function oh(e){var t=e.activeTooltipItem,n=e.graphicalItem,r=e.itemData,o=function(e,t){var n;return Zp(e,t)?n="trapezoids":Jp(e,t)?n="sectors":eh(e,t)&&(n="points"),n}(n,t),i=function(e,t){var n,r;return Zp(e,t)?null===(n=t.tooltipPayload)||void 0===n||null===(n=n[0])||void 0===n||null===(n=n.payload)||void 0===n?void 0:n.payload:Jp(e,t)?null===(r=t.tooltipPayload)||void 0===r||null===(r=r[0])||void 0===r||null===(r=r.payload)||void 0===r?void 0:r.payload:eh(e,t)?t.payload:{}}(n,t),a=r.filter(function(e,r){var a=qs()(i,e),l=n.props[o].filter(function(e){var r=function(e,t){var n;return Zp(e,t)?n=th:Jp(e,t)?n=nh:eh(e,t)&&(n=rh),n}(n,t);return r(e,t)}),u=n.props[o].indexOf(l[l.length-1]);return a&&r===u});return r.indexOf(a[a.length-1])}var ih=["x","y"];function ah(e){return ah="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},ah(e)}function lh(){return lh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},lh.apply(this,arguments)}function uh(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function ch(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?uh(Object(n),!0).forEach(function(t){sh(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):uh(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function sh(e,t,n){return t=function(e){var t=function(e,t){if("object"!=ah(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=ah(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==ah(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function fh(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function dh(e,t){var n=e.x,r=e.y,o=fh(e,ih),i="".concat(n),a=parseInt(i,10),l="".concat(r),u=parseInt(l,10),c="".concat(t.height||o.height),s=parseInt(c,10),f="".concat(t.width||o.width),d=parseInt(f,10);return ch(ch(ch(ch(ch({},t),o),a?{x:a}:{}),u?{y:u}:{}),{},{height:s,width:d,name:t.name,radius:t.radius})}function ph(e){return t.createElement(Qp,lh({shapeType:"rectangle",propTransformer:dh,activeClassName:"recharts-active-bar"},e))}var hh,yh=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return function(n,r){if("number"===typeof e)return e;var o=k(n)||function(e){return O()(e)}(n);return o?e(n,r):(o||je(!1),t)}},vh=["value","background"];function mh(e){return mh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},mh(e)}function gh(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function bh(){return bh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},bh.apply(this,arguments)}function xh(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function wh(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?xh(Object(n),!0).forEach(function(t){Eh(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):xh(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Oh(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,_h(r.key),r)}}function Sh(e,t,n){return t=kh(t),function(e,t){if(t&&("object"===mh(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,jh()?Reflect.construct(t,n||[],kh(e).constructor):t.apply(e,n))}function jh(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(jh=function(){return!!e})()}function kh(e){return kh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},kh(e)}function Ph(e,t){return Ph=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Ph(e,t)}function Eh(e,t,n){return(t=_h(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function _h(e){var t=function(e,t){if("object"!=mh(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=mh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==mh(t)?t:t+""}var Mh=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return Eh(e=Sh(this,n,[].concat(r)),"state",{isAnimationFinished:!1}),Eh(e,"id",_("recharts-bar-")),Eh(e,"handleAnimationEnd",function(){var t=e.props.onAnimationEnd;e.setState({isAnimationFinished:!0}),t&&t()}),Eh(e,"handleAnimationStart",function(){var t=e.props.onAnimationStart;e.setState({isAnimationFinished:!1}),t&&t()}),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Ph(e,t)}(n,e),r=n,o=[{key:"renderRectanglesStatically",value:function(e){var n=this,r=this.props,o=r.shape,i=r.dataKey,a=r.activeIndex,l=r.activeBar,u=ue(this.props,!1);return e&&e.map(function(e,r){var c=r===a,s=c?l:o,f=wh(wh(wh({},u),e),{},{isActive:c,option:s,index:r,dataKey:i,onAnimationStart:n.handleAnimationStart,onAnimationEnd:n.handleAnimationEnd});return t.createElement(Te,bh({className:"recharts-bar-rectangle"},$(n.props,e,r),{key:"rectangle-".concat(null===e||void 0===e?void 0:e.x,"-").concat(null===e||void 0===e?void 0:e.y,"-").concat(null===e||void 0===e?void 0:e.value,"-").concat(r)}),t.createElement(ph,f))})}},{key:"renderRectanglesWithAnimation",value:function(){var e=this,n=this.props,r=n.data,o=n.layout,i=n.isAnimationActive,a=n.animationBegin,l=n.animationDuration,u=n.animationEasing,c=n.animationId,s=this.state.prevData;return t.createElement(Mo,{begin:a,duration:l,isActive:i,easing:u,from:{t:0},to:{t:1},key:"bar-".concat(c),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},function(n){var i=n.t,a=r.map(function(e,t){var n=s&&s[t];if(n){var r=C(n.x,e.x),a=C(n.y,e.y),l=C(n.width,e.width),u=C(n.height,e.height);return wh(wh({},e),{},{x:r(i),y:a(i),width:l(i),height:u(i)})}if("horizontal"===o){var c=C(0,e.height)(i);return wh(wh({},e),{},{y:e.y+e.height-c,height:c})}var f=C(0,e.width)(i);return wh(wh({},e),{},{width:f})});return t.createElement(Te,null,e.renderRectanglesStatically(a))})}},{key:"renderRectangles",value:function(){var e=this.props,t=e.data,n=e.isAnimationActive,r=this.state.prevData;return!(n&&t&&t.length)||r&&qs()(r,t)?this.renderRectanglesStatically(t):this.renderRectanglesWithAnimation()}},{key:"renderBackground",value:function(){var e=this,n=this.props,r=n.data,o=n.dataKey,i=n.activeIndex,a=ue(this.props.background,!1);return r.map(function(n,r){n.value;var l=n.background,u=gh(n,vh);if(!l)return null;var c=wh(wh(wh(wh(wh({},u),{},{fill:"#eee"},l),a),$(e.props,n,r)),{},{onAnimationStart:e.handleAnimationStart,onAnimationEnd:e.handleAnimationEnd,dataKey:o,index:r,className:"recharts-bar-background-rectangle"});return t.createElement(ph,bh({key:"background-bar-".concat(r),option:e.props.background,isActive:r===i},c))})}},{key:"renderErrorBar",value:function(e,n){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,o=r.data,i=r.xAxis,a=r.yAxis,l=r.layout,u=re(r.children,Df);if(!u)return null;var c="vertical"===l?o[0].height/2:o[0].width/2,s=function(e,t){var n=Array.isArray(e.value)?e.value[1]:e.value;return{x:e.x,y:e.y,value:n,errorVal:Xf(e,t)}},f={clipPath:e?"url(#clipPath-".concat(n,")"):null};return t.createElement(Te,f,u.map(function(e){return t.cloneElement(e,{key:"error-bar-".concat(n,"-").concat(e.props.dataKey),data:o,xAxis:i,yAxis:a,layout:l,offset:c,dataPointFormatter:s})}))}},{key:"render",value:function(){var e=this.props,n=e.hide,r=e.data,o=e.className,i=e.xAxis,a=e.yAxis,l=e.left,u=e.top,c=e.width,f=e.height,d=e.isAnimationActive,p=e.background,h=e.id;if(n||!r||!r.length)return null;var y=this.state.isAnimationFinished,v=s("recharts-bar",o),m=i&&i.allowDataOverflow,g=a&&a.allowDataOverflow,b=m||g,x=O()(h)?this.id:h;return t.createElement(Te,{className:v},m||g?t.createElement("defs",null,t.createElement("clipPath",{id:"clipPath-".concat(x)},t.createElement("rect",{x:m?l:l-c/2,y:g?u:u-f/2,width:m?c:2*c,height:g?f:2*f}))):null,t.createElement(Te,{className:"recharts-bar-rectangles",clipPath:b?"url(#clipPath-".concat(x,")"):null},p?this.renderBackground():null,this.renderRectangles()),this.renderErrorBar(b,x),(!d||y)&&bp.renderCallByParent(this.props,r))}}],i=[{key:"getDerivedStateFromProps",value:function(e,t){return e.animationId!==t.prevAnimationId?{prevAnimationId:e.animationId,curData:e.data,prevData:t.curData}:e.data!==t.curData?{curData:e.data}:null}}],o&&Oh(r.prototype,o),i&&Oh(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function Ah(e){return Ah="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ah(e)}function Ch(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Ih(r.key),r)}}function Th(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Nh(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Th(Object(n),!0).forEach(function(t){Dh(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Th(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Dh(e,t,n){return(t=Ih(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Ih(e){var t=function(e,t){if("object"!=Ah(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Ah(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Ah(t)?t:t+""}hh=Mh,Eh(Mh,"displayName","Bar"),Eh(Mh,"defaultProps",{xAxisId:0,yAxisId:0,legendType:"rect",minPointSize:0,hide:!1,data:[],layout:"vertical",activeBar:!1,isAnimationActive:!it.isSsr,animationBegin:0,animationDuration:400,animationEasing:"ease"}),Eh(Mh,"getComposedData",function(e){var t=e.props,n=e.item,r=e.barPosition,o=e.bandSize,i=e.xAxis,a=e.yAxis,l=e.xAxisTicks,u=e.yAxisTicks,c=e.stackedData,s=e.dataStartIndex,f=e.displayedData,d=e.offset,p=function(e,t){if(!e)return null;for(var n=0,r=e.length;n<r;n++)if(e[n].item===t)return e[n].position;return null}(r,n);if(!p)return null;var h=t.layout,y=n.type.defaultProps,v=void 0!==y?wh(wh({},y),n.props):n.props,m=v.dataKey,g=v.children,b=v.minPointSize,x="horizontal"===h?a:i,w=c?x.scale.domain():null,O=function(e){var t=e.numericAxis,n=t.scale.domain();if("number"===t.type){var r=Math.min(n[0],n[1]),o=Math.max(n[0],n[1]);return r<=0&&o>=0?0:o<0?o:r}return n[0]}({numericAxis:x}),j=re(g,ip),P=f.map(function(e,t){var r,f,d,y,v,g;c?r=function(e,t){if(!t||2!==t.length||!k(t[0])||!k(t[1]))return e;var n=Math.min(t[0],t[1]),r=Math.max(t[0],t[1]),o=[e[0],e[1]];return(!k(e[0])||e[0]<n)&&(o[0]=n),(!k(e[1])||e[1]>r)&&(o[1]=r),o[0]>r&&(o[0]=r),o[1]<n&&(o[1]=n),o}(c[s+t],w):(r=Xf(e,m),Array.isArray(r)||(r=[O,r]));var x=yh(b,hh.defaultProps.minPointSize)(r[1],t);if("horizontal"===h){var P,E=[a.scale(r[0]),a.scale(r[1])],_=E[0],M=E[1];f=ad({axis:i,ticks:l,bandSize:o,offset:p.offset,entry:e,index:t}),d=null!==(P=null!==M&&void 0!==M?M:_)&&void 0!==P?P:void 0,y=p.size;var A=_-M;if(v=Number.isNaN(A)?0:A,g={x:f,y:a.y,width:y,height:a.height},Math.abs(x)>0&&Math.abs(v)<Math.abs(x)){var C=S(v||x)*(Math.abs(x)-Math.abs(v));d-=C,v+=C}}else{var T=[i.scale(r[0]),i.scale(r[1])],N=T[0],D=T[1];if(f=N,d=ad({axis:a,ticks:u,bandSize:o,offset:p.offset,entry:e,index:t}),y=D-N,v=p.size,g={x:i.x,y:d,width:i.width,height:v},Math.abs(x)>0&&Math.abs(y)<Math.abs(x))y+=S(y||x)*(Math.abs(x)-Math.abs(y))}return wh(wh(wh({},e),{},{x:f,y:d,width:y,height:v,value:c?r:r[1],payload:e,background:g},j&&j[t]&&j[t].props),{},{tooltipPayload:[pd(n,e)],tooltipPosition:{x:f+y/2,y:d+v/2}})});return wh({data:P,layout:h},d)});var zh=function(e,t){var n=e.x,r=e.y,o=t.x,i=t.y;return{x:Math.min(n,o),y:Math.min(r,i),width:Math.abs(o-n),height:Math.abs(i-r)}},Rh=function(){function e(t){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.scale=t}return t=e,n=[{key:"domain",get:function(){return this.scale.domain}},{key:"range",get:function(){return this.scale.range}},{key:"rangeMin",get:function(){return this.range()[0]}},{key:"rangeMax",get:function(){return this.range()[1]}},{key:"bandwidth",get:function(){return this.scale.bandwidth}},{key:"apply",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.bandAware,r=t.position;if(void 0!==e){if(r)switch(r){case"start":default:return this.scale(e);case"middle":var o=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+o;case"end":var i=this.bandwidth?this.bandwidth():0;return this.scale(e)+i}if(n){var a=this.bandwidth?this.bandwidth()/2:0;return this.scale(e)+a}return this.scale(e)}}},{key:"isInRange",value:function(e){var t=this.range(),n=t[0],r=t[t.length-1];return n<=r?e>=n&&e<=r:e>=r&&e<=n}}],r=[{key:"create",value:function(t){return new e(t)}}],n&&Ch(t.prototype,n),r&&Ch(t,r),Object.defineProperty(t,"prototype",{writable:!1}),t;var t,n,r}();Dh(Rh,"EPS",1e-4);var Lh=function(e){var t=Object.keys(e).reduce(function(t,n){return Nh(Nh({},t),{},Dh({},n,Rh.create(e[n])))},{});return Nh(Nh({},t),{},{apply:function(e){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=n.bandAware,o=n.position;return np()(e,function(e,n){return t[n].apply(e,{bandAware:r,position:o})})},isInRange:function(e){return op()(e,function(e,n){return t[n].isInRange(e)})}})};function Bh(){return Bh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Bh.apply(this,arguments)}function Fh(e){return Fh="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Fh(e)}function Uh(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Wh(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Uh(Object(n),!0).forEach(function(t){Yh(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Uh(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Hh(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Gh(r.key),r)}}function qh(e,t,n){return t=Xh(t),function(e,t){if(t&&("object"===Fh(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Vh()?Reflect.construct(t,n||[],Xh(e).constructor):t.apply(e,n))}function Vh(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(Vh=function(){return!!e})()}function Xh(e){return Xh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Xh(e)}function $h(e,t){return $h=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},$h(e,t)}function Yh(e,t,n){return(t=Gh(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Gh(e){var t=function(e,t){if("object"!=Fh(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Fh(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Fh(t)?t:t+""}var Kh=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),qh(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&$h(e,t)}(n,e),r=n,o=[{key:"render",value:function(){var e=this.props,r=e.x,o=e.y,i=e.r,a=e.alwaysShow,l=e.clipPathId,u=P(r),c=P(o);if(D(void 0===a,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.'),!u||!c)return null;var f=function(e){var t=e.x,n=e.y,r=e.xAxis,o=e.yAxis,i=Lh({x:r.scale,y:o.scale}),a=i.apply({x:t,y:n},{bandAware:!0});return ep(e,"discard")&&!i.isInRange(a)?null:a}(this.props);if(!f)return null;var d=f.x,p=f.y,h=this.props,y=h.shape,v=h.className,m=Wh(Wh({clipPath:ep(this.props,"hidden")?"url(#".concat(l,")"):void 0},ue(this.props,!0)),{},{cx:d,cy:p});return t.createElement(Te,{className:s("recharts-reference-dot",v)},n.renderDot(y,m),Zd.renderCallByParent(this.props,{x:d-i,y:p-i,width:2*i,height:2*i}))}}],o&&Hh(r.prototype,o),i&&Hh(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);Yh(Kh,"displayName","ReferenceDot"),Yh(Kh,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#fff",stroke:"#ccc",fillOpacity:1,strokeWidth:1}),Yh(Kh,"renderDot",function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):z()(e)?e(n):t.createElement(Zn,Bh({},n,{cx:n.cx,cy:n.cy,className:"recharts-reference-dot-dot"}))});var Qh=n(4597),Zh=n.n(Qh),Jh=n(8990),ey=n.n(Jh),ty=n(5797),ny=n.n(ty)()(function(e){return{x:e.left,y:e.top,width:e.width,height:e.height}},function(e){return["l",e.left,"t",e.top,"w",e.width,"h",e.height].join("")});var ry=(0,t.createContext)(void 0),oy=(0,t.createContext)(void 0),iy=(0,t.createContext)(void 0),ay=(0,t.createContext)({}),ly=(0,t.createContext)(void 0),uy=(0,t.createContext)(0),cy=(0,t.createContext)(0),sy=function(e){var n=e.state,r=n.xAxisMap,o=n.yAxisMap,i=n.offset,a=e.clipPathId,l=e.children,u=e.width,c=e.height,s=ny(i);return t.createElement(ry.Provider,{value:r},t.createElement(oy.Provider,{value:o},t.createElement(ay.Provider,{value:i},t.createElement(iy.Provider,{value:s},t.createElement(ly.Provider,{value:a},t.createElement(uy.Provider,{value:c},t.createElement(cy.Provider,{value:u},l)))))))};var fy=function(e){var n=(0,t.useContext)(ry);null==n&&je(!1);var r=n[e];return null==r&&je(!1),r},dy=function(e){var n=(0,t.useContext)(oy);null==n&&je(!1);var r=n[e];return null==r&&je(!1),r},py=function(){return(0,t.useContext)(cy)},hy=function(){return(0,t.useContext)(uy)};function yy(e){return yy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},yy(e)}function vy(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,jy(r.key),r)}}function my(e,t,n){return t=by(t),function(e,t){if(t&&("object"===yy(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,gy()?Reflect.construct(t,n||[],by(e).constructor):t.apply(e,n))}function gy(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(gy=function(){return!!e})()}function by(e){return by=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},by(e)}function xy(e,t){return xy=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},xy(e,t)}function wy(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Oy(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?wy(Object(n),!0).forEach(function(t){Sy(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):wy(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Sy(e,t,n){return(t=jy(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jy(e){var t=function(e,t){if("object"!=yy(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=yy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==yy(t)?t:t+""}function ky(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||function(e,t){if(!e)return;if("string"===typeof e)return Py(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Py(e,t)}(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Py(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Ey(){return Ey=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ey.apply(this,arguments)}function _y(e){var n=e.x,r=e.y,o=e.segment,i=e.xAxisId,a=e.yAxisId,l=e.shape,u=e.className,c=e.alwaysShow,f=(0,t.useContext)(ly),d=fy(i),p=dy(a),h=(0,t.useContext)(iy);if(!f||!h)return null;D(void 0===c,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var y=function(e,t,n,r,o,i,a,l,u){var c=o.x,s=o.y,f=o.width,d=o.height;if(n){var p=u.y,h=e.y.apply(p,{position:i});if(ep(u,"discard")&&!e.y.isInRange(h))return null;var y=[{x:c+f,y:h},{x:c,y:h}];return"left"===l?y.reverse():y}if(t){var v=u.x,m=e.x.apply(v,{position:i});if(ep(u,"discard")&&!e.x.isInRange(m))return null;var g=[{x:m,y:s+d},{x:m,y:s}];return"top"===a?g.reverse():g}if(r){var b=u.segment.map(function(t){return e.apply(t,{position:i})});return ep(u,"discard")&&Zh()(b,function(t){return!e.isInRange(t)})?null:b}return null}(Lh({x:d.scale,y:p.scale}),P(n),P(r),o&&2===o.length,h,e.position,d.orientation,p.orientation,e);if(!y)return null;var v=ky(y,2),m=v[0],g=m.x,b=m.y,x=v[1],w=x.x,O=x.y,S=Oy(Oy({clipPath:ep(e,"hidden")?"url(#".concat(f,")"):void 0},ue(e,!0)),{},{x1:g,y1:b,x2:w,y2:O});return t.createElement(Te,{className:s("recharts-reference-line",u)},function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):z()(e)?e(n):t.createElement("line",Ey({},n,{className:"recharts-reference-line-line"}))}(l,S),Zd.renderCallByParent(e,function(e){var t=e.x1,n=e.y1,r=e.x2,o=e.y2;return zh({x:t,y:n},{x:r,y:o})}({x1:g,y1:b,x2:w,y2:O})))}var My=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),my(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&xy(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(_y,this.props)}}])&&vy(r.prototype,o),i&&vy(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function Ay(){return Ay=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ay.apply(this,arguments)}function Cy(e){return Cy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Cy(e)}function Ty(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ny(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Ty(Object(n),!0).forEach(function(t){By(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Ty(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Dy(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Fy(r.key),r)}}function Iy(e,t,n){return t=Ry(t),function(e,t){if(t&&("object"===Cy(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,zy()?Reflect.construct(t,n||[],Ry(e).constructor):t.apply(e,n))}function zy(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(zy=function(){return!!e})()}function Ry(e){return Ry=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Ry(e)}function Ly(e,t){return Ly=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Ly(e,t)}function By(e,t,n){return(t=Fy(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Fy(e){var t=function(e,t){if("object"!=Cy(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Cy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Cy(t)?t:t+""}Sy(My,"displayName","ReferenceLine"),Sy(My,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,fill:"none",stroke:"#ccc",fillOpacity:1,strokeWidth:1,position:"middle"});var Uy=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),Iy(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Ly(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){var e=this.props,r=e.x1,o=e.x2,i=e.y1,a=e.y2,l=e.className,u=e.alwaysShow,c=e.clipPathId;D(void 0===u,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var f=P(r),d=P(o),p=P(i),h=P(a),y=this.props.shape;if(!f&&!d&&!p&&!h&&!y)return null;var v=function(e,t,n,r,o){var i=o.x1,a=o.x2,l=o.y1,u=o.y2,c=o.xAxis,s=o.yAxis;if(!c||!s)return null;var f=Lh({x:c.scale,y:s.scale}),d={x:e?f.x.apply(i,{position:"start"}):f.x.rangeMin,y:n?f.y.apply(l,{position:"start"}):f.y.rangeMin},p={x:t?f.x.apply(a,{position:"end"}):f.x.rangeMax,y:r?f.y.apply(u,{position:"end"}):f.y.rangeMax};return!ep(o,"discard")||f.isInRange(d)&&f.isInRange(p)?zh(d,p):null}(f,d,p,h,this.props);if(!v&&!y)return null;var m=ep(this.props,"hidden")?"url(#".concat(c,")"):void 0;return t.createElement(Te,{className:s("recharts-reference-area",l)},n.renderRect(y,Ny(Ny({clipPath:m},ue(this.props,!0)),v)),Zd.renderCallByParent(this.props,v))}}])&&Dy(r.prototype,o),i&&Dy(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function Wy(e){return function(e){if(Array.isArray(e))return Hy(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Hy(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Hy(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Hy(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}By(Uy,"displayName","ReferenceArea"),By(Uy,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#ccc",fillOpacity:.5,stroke:"none",strokeWidth:1}),By(Uy,"renderRect",function(e,n){return t.isValidElement(e)?t.cloneElement(e,n):z()(e)?e(n):t.createElement(Fo,Ay({},n,{className:"recharts-reference-area-rect"}))});var qy=function(e,t,n,r,o){var i=re(e,My),a=re(e,Kh),l=[].concat(Wy(i),Wy(a)),u=re(e,Uy),c="".concat(r,"Id"),s=r[0],f=t;if(l.length&&(f=l.reduce(function(e,t){if(t.props[c]===n&&ep(t.props,"extendDomain")&&k(t.props[s])){var r=t.props[s];return[Math.min(e[0],r),Math.max(e[1],r)]}return e},f)),u.length){var d="".concat(s,"1"),p="".concat(s,"2");f=u.reduce(function(e,t){if(t.props[c]===n&&ep(t.props,"extendDomain")&&k(t.props[d])&&k(t.props[p])){var r=t.props[d],o=t.props[p];return[Math.min(e[0],r,o),Math.max(e[1],r,o)]}return e},f)}return o&&o.length&&(f=o.reduce(function(e,t){return k(t)?[Math.min(e[0],t),Math.max(e[1],t)]:e},f)),f},Vy=n(7283),Xy=new(n.n(Vy)()),$y="recharts.syncMouseEvents";function Yy(e){return Yy="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Yy(e)}function Gy(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Qy(r.key),r)}}function Ky(e,t,n){return(t=Qy(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Qy(e){var t=function(e,t){if("object"!=Yy(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Yy(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Yy(t)?t:t+""}var Zy=function(){return e=function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),Ky(this,"activeIndex",0),Ky(this,"coordinateList",[]),Ky(this,"layout","horizontal")},(t=[{key:"setDetails",value:function(e){var t,n=e.coordinateList,r=void 0===n?null:n,o=e.container,i=void 0===o?null:o,a=e.layout,l=void 0===a?null:a,u=e.offset,c=void 0===u?null:u,s=e.mouseHandlerCallback,f=void 0===s?null:s;this.coordinateList=null!==(t=null!==r&&void 0!==r?r:this.coordinateList)&&void 0!==t?t:[],this.container=null!==i&&void 0!==i?i:this.container,this.layout=null!==l&&void 0!==l?l:this.layout,this.offset=null!==c&&void 0!==c?c:this.offset,this.mouseHandlerCallback=null!==f&&void 0!==f?f:this.mouseHandlerCallback,this.activeIndex=Math.min(Math.max(this.activeIndex,0),this.coordinateList.length-1)}},{key:"focus",value:function(){this.spoofMouse()}},{key:"keyboardEvent",value:function(e){if(0!==this.coordinateList.length)switch(e.key){case"ArrowRight":if("horizontal"!==this.layout)return;this.activeIndex=Math.min(this.activeIndex+1,this.coordinateList.length-1),this.spoofMouse();break;case"ArrowLeft":if("horizontal"!==this.layout)return;this.activeIndex=Math.max(this.activeIndex-1,0),this.spoofMouse()}}},{key:"setIndex",value:function(e){this.activeIndex=e}},{key:"spoofMouse",value:function(){var e,t;if("horizontal"===this.layout&&0!==this.coordinateList.length){var n=this.container.getBoundingClientRect(),r=n.x,o=n.y,i=n.height,a=this.coordinateList[this.activeIndex].coordinate,l=(null===(e=window)||void 0===e?void 0:e.scrollX)||0,u=(null===(t=window)||void 0===t?void 0:t.scrollY)||0,c=r+a+l,s=o+this.offset.top+i/2+u;this.mouseHandlerCallback({pageX:c,pageY:s})}}}])&&Gy(e.prototype,t),n&&Gy(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e;var e,t,n}();function Jy(){}function ev(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function tv(e){this._context=e}function nv(e){this._context=e}function rv(e){this._context=e}tv.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:ev(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1)}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:ev(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}},nv.prototype={areaStart:Jy,areaEnd:Jy,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:this._context.moveTo(this._x2,this._y2),this._context.closePath();break;case 2:this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break;case 3:this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4)}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:ev(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}},rv.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||0!==this._line&&3===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:ev(this,e,t)}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};class ov{constructor(e,t){this._context=e,this._x=t}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line}point(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+e)/2,this._y0,this._x0,t,e,t):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+t)/2,e,this._y0,e,t)}this._x0=e,this._y0=t}}function iv(e){this._context=e}function av(e){this._context=e}function lv(e){return new av(e)}function uv(e){return e<0?-1:1}function cv(e,t,n){var r=e._x1-e._x0,o=t-e._x1,i=(e._y1-e._y0)/(r||o<0&&-0),a=(n-e._y1)/(o||r<0&&-0),l=(i*o+a*r)/(r+o);return(uv(i)+uv(a))*Math.min(Math.abs(i),Math.abs(a),.5*Math.abs(l))||0}function sv(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function fv(e,t,n){var r=e._x0,o=e._y0,i=e._x1,a=e._y1,l=(i-r)/3;e._context.bezierCurveTo(r+l,o+l*t,i-l,a-l*n,i,a)}function dv(e){this._context=e}function pv(e){this._context=new hv(e)}function hv(e){this._context=e}function yv(e){this._context=e}function vv(e){var t,n,r=e.length-1,o=new Array(r),i=new Array(r),a=new Array(r);for(o[0]=0,i[0]=2,a[0]=e[0]+2*e[1],t=1;t<r-1;++t)o[t]=1,i[t]=4,a[t]=4*e[t]+2*e[t+1];for(o[r-1]=2,i[r-1]=7,a[r-1]=8*e[r-1]+e[r],t=1;t<r;++t)n=o[t]/i[t-1],i[t]-=n,a[t]-=n*a[t-1];for(o[r-1]=a[r-1]/i[r-1],t=r-2;t>=0;--t)o[t]=(a[t]-o[t+1])/i[t];for(i[r-1]=(e[r]+o[r-1])/2,t=0;t<r-1;++t)i[t]=2*e[t+1]-o[t+1];return[o,i]}function mv(e,t){this._context=e,this._t=t}function gv(e){return e[0]}function bv(e){return e[1]}function xv(e,t){var n=Vt(!0),r=null,o=lv,i=null,a=hn(l);function l(l){var u,c,s,f=(l=Ns(l)).length,d=!1;for(null==r&&(i=o(s=a())),u=0;u<=f;++u)!(u<f&&n(c=l[u],u,l))===d&&((d=!d)?i.lineStart():i.lineEnd()),d&&i.point(+e(c,u,l),+t(c,u,l));if(s)return i=null,s+""||null}return e="function"===typeof e?e:void 0===e?gv:Vt(e),t="function"===typeof t?t:void 0===t?bv:Vt(t),l.x=function(t){return arguments.length?(e="function"===typeof t?t:Vt(+t),l):e},l.y=function(e){return arguments.length?(t="function"===typeof e?e:Vt(+e),l):t},l.defined=function(e){return arguments.length?(n="function"===typeof e?e:Vt(!!e),l):n},l.curve=function(e){return arguments.length?(o=e,null!=r&&(i=o(r)),l):o},l.context=function(e){return arguments.length?(null==e?r=i=null:i=o(r=e),l):r},l}function wv(e,t,n){var r=null,o=Vt(!0),i=null,a=lv,l=null,u=hn(c);function c(c){var s,f,d,p,h,y=(c=Ns(c)).length,v=!1,m=new Array(y),g=new Array(y);for(null==i&&(l=a(h=u())),s=0;s<=y;++s){if(!(s<y&&o(p=c[s],s,c))===v)if(v=!v)f=s,l.areaStart(),l.lineStart();else{for(l.lineEnd(),l.lineStart(),d=s-1;d>=f;--d)l.point(m[d],g[d]);l.lineEnd(),l.areaEnd()}v&&(m[s]=+e(p,s,c),g[s]=+t(p,s,c),l.point(r?+r(p,s,c):m[s],n?+n(p,s,c):g[s]))}if(h)return l=null,h+""||null}function s(){return xv().defined(o).curve(a).context(i)}return e="function"===typeof e?e:void 0===e?gv:Vt(+e),t="function"===typeof t?t:Vt(void 0===t?0:+t),n="function"===typeof n?n:void 0===n?bv:Vt(+n),c.x=function(t){return arguments.length?(e="function"===typeof t?t:Vt(+t),r=null,c):e},c.x0=function(t){return arguments.length?(e="function"===typeof t?t:Vt(+t),c):e},c.x1=function(e){return arguments.length?(r=null==e?null:"function"===typeof e?e:Vt(+e),c):r},c.y=function(e){return arguments.length?(t="function"===typeof e?e:Vt(+e),n=null,c):t},c.y0=function(e){return arguments.length?(t="function"===typeof e?e:Vt(+e),c):t},c.y1=function(e){return arguments.length?(n=null==e?null:"function"===typeof e?e:Vt(+e),c):n},c.lineX0=c.lineY0=function(){return s().x(e).y(t)},c.lineY1=function(){return s().x(e).y(n)},c.lineX1=function(){return s().x(r).y(t)},c.defined=function(e){return arguments.length?(o="function"===typeof e?e:Vt(!!e),c):o},c.curve=function(e){return arguments.length?(a=e,null!=i&&(l=a(i)),c):a},c.context=function(e){return arguments.length?(null==e?i=l=null:l=a(i=e),c):i},c}function Ov(e){return Ov="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Ov(e)}function Sv(){return Sv=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Sv.apply(this,arguments)}function jv(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function kv(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?jv(Object(n),!0).forEach(function(t){Pv(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):jv(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Pv(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Ov(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Ov(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Ov(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}iv.prototype={areaStart:Jy,areaEnd:Jy,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}},av.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t)}}},dv.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:fv(this,this._t0,sv(this,this._t0))}(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(t=+t,(e=+e)!==this._x1||t!==this._y1){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,fv(this,sv(this,n=cv(this,e,t)),n);break;default:fv(this,this._t0,n=cv(this,e,t))}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}},(pv.prototype=Object.create(dv.prototype)).point=function(e,t){dv.prototype.point.call(this,t,e)},hv.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,o,i){this._context.bezierCurveTo(t,e,r,n,i,o)}},yv.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),2===n)this._context.lineTo(e[1],t[1]);else for(var r=vv(e),o=vv(t),i=0,a=1;a<n;++i,++a)this._context.bezierCurveTo(r[0][i],o[0][i],r[1][i],o[1][i],e[a],t[a]);(this._line||0!==this._line&&1===n)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}},mv.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&2===this._point&&this._context.lineTo(this._x,this._y),(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}}this._x=e,this._y=t}};var Ev={curveBasisClosed:function(e){return new nv(e)},curveBasisOpen:function(e){return new rv(e)},curveBasis:function(e){return new tv(e)},curveBumpX:function(e){return new ov(e,!0)},curveBumpY:function(e){return new ov(e,!1)},curveLinearClosed:function(e){return new iv(e)},curveLinear:lv,curveMonotoneX:function(e){return new dv(e)},curveMonotoneY:function(e){return new pv(e)},curveNatural:function(e){return new yv(e)},curveStep:function(e){return new mv(e,.5)},curveStepAfter:function(e){return new mv(e,1)},curveStepBefore:function(e){return new mv(e,0)}},_v=function(e){return e.x===+e.x&&e.y===+e.y},Mv=function(e){return e.x},Av=function(e){return e.y},Cv=function(e){var t,n=e.type,r=void 0===n?"linear":n,o=e.points,i=void 0===o?[]:o,a=e.baseLine,l=e.layout,u=e.connectNulls,c=void 0!==u&&u,s=function(e,t){if(z()(e))return e;var n="curve".concat(Ot()(e));return"curveMonotone"!==n&&"curveBump"!==n||!t?Ev[n]||lv:Ev["".concat(n).concat("vertical"===t?"Y":"X")]}(r,l),f=c?i.filter(function(e){return _v(e)}):i;if(Array.isArray(a)){var d=c?a.filter(function(e){return _v(e)}):a,p=f.map(function(e,t){return kv(kv({},e),{},{base:d[t]})});return(t="vertical"===l?wv().y(Av).x1(Mv).x0(function(e){return e.base.x}):wv().x(Mv).y1(Av).y0(function(e){return e.base.y})).defined(_v).curve(s),t(p)}return(t="vertical"===l&&k(a)?wv().y(Av).x1(Mv).x0(a):k(a)?wv().x(Mv).y1(Av).y0(a):xv().x(Mv).y(Av)).defined(_v).curve(s),t(f)},Tv=function(e){var n=e.className,r=e.points,o=e.path,i=e.pathRef;if((!r||!r.length)&&!o)return null;var a=r&&r.length?Cv(e):o;return t.createElement("path",Sv({},ue(e,!1),X(e),{className:s("recharts-curve",n),d:a,ref:i}))};function Nv(e){return Nv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Nv(e)}var Dv=["x","y","top","left","width","height","className"];function Iv(){return Iv=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Iv.apply(this,arguments)}function zv(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Rv(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Nv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Nv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Nv(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Lv(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var Bv=function(e,t,n,r,o,i){return"M".concat(e,",").concat(o,"v").concat(r,"M").concat(i,",").concat(t,"h").concat(n)},Fv=function(e){var n=e.x,r=void 0===n?0:n,o=e.y,i=void 0===o?0:o,a=e.top,l=void 0===a?0:a,u=e.left,c=void 0===u?0:u,f=e.width,d=void 0===f?0:f,p=e.height,h=void 0===p?0:p,y=e.className,v=function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?zv(Object(n),!0).forEach(function(t){Rv(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):zv(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}({x:r,y:i,top:l,left:c,width:d,height:h},Lv(e,Dv));return k(r)&&k(i)&&k(d)&&k(h)&&k(l)&&k(c)?t.createElement("path",Iv({},ue(v,!0),{className:s("recharts-cross",y),d:Bv(r,i,d,h,l,c)})):null};function Uv(e){var t=e.cx,n=e.cy,r=e.radius,o=e.startAngle,i=e.endAngle;return{points:[Ld(t,n,r,o),Ld(t,n,r,i)],cx:t,cy:n,radius:r,startAngle:o,endAngle:i}}function Wv(e,t,n){var r,o,i,a;if("horizontal"===e)i=r=t.x,o=n.top,a=n.top+n.height;else if("vertical"===e)a=o=t.y,r=n.left,i=n.left+n.width;else if(null!=t.cx&&null!=t.cy){if("centric"!==e)return Uv(t);var l=t.cx,u=t.cy,c=t.innerRadius,s=t.outerRadius,f=t.angle,d=Ld(l,u,c,f),p=Ld(l,u,s,f);r=d.x,o=d.y,i=p.x,a=p.y}return[{x:r,y:o},{x:i,y:a}]}function Hv(e){return Hv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Hv(e)}function qv(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Vv(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?qv(Object(n),!0).forEach(function(t){Xv(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):qv(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Xv(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Hv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Hv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Hv(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function $v(e){var n,r,o,i=e.element,a=e.tooltipEventType,l=e.isActive,u=e.activeCoordinate,c=e.activePayload,f=e.offset,d=e.activeTooltipIndex,p=e.tooltipAxisBandSize,h=e.layout,y=e.chartName,v=null!==(n=i.props.cursor)&&void 0!==n?n:null===(r=i.type.defaultProps)||void 0===r?void 0:r.cursor;if(!i||!v||!l||!u||"ScatterChart"!==y&&"axis"!==a)return null;var m=Tv;if("ScatterChart"===y)o=u,m=Fv;else if("BarChart"===y)o=function(e,t,n,r){var o=r/2;return{stroke:"none",fill:"#ccc",x:"horizontal"===e?t.x-o:n.left+.5,y:"horizontal"===e?n.top+.5:t.y-o,width:"horizontal"===e?r:n.width-1,height:"horizontal"===e?n.height-1:r}}(h,u,f,p),m=Fo;else if("radial"===h){var g=Uv(u),b=g.cx,x=g.cy,w=g.radius;o={cx:b,cy:x,startAngle:g.startAngle,endAngle:g.endAngle,innerRadius:w,outerRadius:w},m=Wp}else o={points:Wv(h,u,f)},m=Tv;var O=Vv(Vv(Vv(Vv({stroke:"#ccc",pointerEvents:"none"},f),o),ue(v,!1)),{},{payload:c,payloadIndex:d,className:s("recharts-tooltip-cursor",v.className)});return(0,t.isValidElement)(v)?(0,t.cloneElement)(v,O):(0,t.createElement)(m,O)}var Yv=["item"],Gv=["children","className","width","height","style","compact","title","desc"];function Kv(e){return Kv="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Kv(e)}function Qv(){return Qv=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Qv.apply(this,arguments)}function Zv(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,i,a,l=[],u=!0,c=!1;try{if(i=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;u=!1}else for(;!(u=(r=i.call(n)).done)&&(l.push(r.value),l.length!==t);u=!0);}catch(e){c=!0,o=e}finally{try{if(!u&&null!=n.return&&(a=n.return(),Object(a)!==a))return}finally{if(c)throw o}}return l}}(e,t)||am(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Jv(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function em(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,fm(r.key),r)}}function tm(e,t,n){return t=rm(t),function(e,t){if(t&&("object"===Kv(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,nm()?Reflect.construct(t,n||[],rm(e).constructor):t.apply(e,n))}function nm(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(nm=function(){return!!e})()}function rm(e){return rm=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},rm(e)}function om(e,t){return om=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},om(e,t)}function im(e){return function(e){if(Array.isArray(e))return lm(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||am(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function am(e,t){if(e){if("string"===typeof e)return lm(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?lm(e,t):void 0}}function lm(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function um(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function cm(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?um(Object(n),!0).forEach(function(t){sm(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):um(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function sm(e,t,n){return(t=fm(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function fm(e){var t=function(e,t){if("object"!=Kv(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Kv(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Kv(t)?t:t+""}var dm={xAxis:["bottom","top"],yAxis:["left","right"]},pm={width:"100%",height:"100%"},hm={x:0,y:0};function ym(e){return e}var vm=function(e,t){var n=t.graphicalItems,r=t.dataStartIndex,o=t.dataEndIndex,i=(null!==n&&void 0!==n?n:[]).reduce(function(e,t){var n=t.props.data;return n&&n.length?[].concat(im(e),im(n)):e},[]);return i.length>0?i:e&&e.length&&k(r)&&k(o)?e.slice(r,o+1):[]};function mm(e){return"number"===e?[0,"auto"]:void 0}var gm=function(e,t,n,r){var o=e.graphicalItems,i=e.tooltipAxis,a=vm(t,e);return n<0||!o||!o.length||n>=a.length?null:o.reduce(function(o,l){var u,c,s=null!==(u=l.props.data)&&void 0!==u?u:t;(s&&e.dataStartIndex+e.dataEndIndex!==0&&e.dataEndIndex-e.dataStartIndex>=n&&(s=s.slice(e.dataStartIndex,e.dataEndIndex+1)),i.dataKey&&!i.allowDuplicatedCategory)?c=T(void 0===s?a:s,i.dataKey,r):c=s&&s[n]||a[n];return c?[].concat(im(o),[pd(l,c)]):o},[])},bm=function(e,t,n,r){var o=r||{x:e.chartX,y:e.chartY},i=function(e,t){return"horizontal"===t?e.x:"vertical"===t?e.y:"centric"===t?e.angle:e.radius}(o,n),a=e.orderedTooltipTicks,l=e.tooltipAxis,u=e.tooltipTicks,c=function(e){var t,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],r=arguments.length>2?arguments[2]:void 0,o=arguments.length>3?arguments[3]:void 0,i=-1,a=null!==(t=null===n||void 0===n?void 0:n.length)&&void 0!==t?t:0;if(a<=1)return 0;if(o&&"angleAxis"===o.axisType&&Math.abs(Math.abs(o.range[1]-o.range[0])-360)<=1e-6)for(var l=o.range,u=0;u<a;u++){var c=u>0?r[u-1].coordinate:r[a-1].coordinate,s=r[u].coordinate,f=u>=a-1?r[0].coordinate:r[u+1].coordinate,d=void 0;if(S(s-c)!==S(f-s)){var p=[];if(S(f-s)===S(l[1]-l[0])){d=f;var h=s+l[1]-l[0];p[0]=Math.min(h,(h+c)/2),p[1]=Math.max(h,(h+c)/2)}else{d=c;var y=f+l[1]-l[0];p[0]=Math.min(s,(y+s)/2),p[1]=Math.max(s,(y+s)/2)}var v=[Math.min(s,(d+s)/2),Math.max(s,(d+s)/2)];if(e>v[0]&&e<=v[1]||e>=p[0]&&e<=p[1]){i=r[u].index;break}}else{var m=Math.min(c,f),g=Math.max(c,f);if(e>(m+s)/2&&e<=(g+s)/2){i=r[u].index;break}}}else for(var b=0;b<a;b++)if(0===b&&e<=(n[b].coordinate+n[b+1].coordinate)/2||b>0&&b<a-1&&e>(n[b].coordinate+n[b-1].coordinate)/2&&e<=(n[b].coordinate+n[b+1].coordinate)/2||b===a-1&&e>(n[b].coordinate+n[b-1].coordinate)/2){i=n[b].index;break}return i}(i,a,u,l);if(c>=0&&u){var s=u[c]&&u[c].value,f=gm(e,t,c,s),d=function(e,t,n,r){var o=t.find(function(e){return e&&e.index===n});if(o){if("horizontal"===e)return{x:o.coordinate,y:r.y};if("vertical"===e)return{x:r.x,y:o.coordinate};if("centric"===e){var i=o.coordinate,a=r.radius;return cm(cm(cm({},r),Ld(r.cx,r.cy,a,i)),{},{angle:i,radius:a})}var l=o.coordinate,u=r.angle;return cm(cm(cm({},r),Ld(r.cx,r.cy,l,u)),{},{angle:u,radius:l})}return hm}(n,a,c,o);return{activeTooltipIndex:c,activeLabel:s,activePayload:f,activeCoordinate:d}}return null},xm=function(e,t){var n=t.axes,r=t.graphicalItems,o=t.axisType,i=t.axisIdKey,a=t.stackGroups,l=t.dataStartIndex,u=t.dataEndIndex,c=e.layout,s=e.children,f=e.stackOffset,d=Qf(c,o);return n.reduce(function(t,n){var p,h=void 0!==n.type.defaultProps?cm(cm({},n.type.defaultProps),n.props):n.props,y=h.type,v=h.dataKey,m=h.allowDataOverflow,g=h.allowDuplicatedCategory,b=h.scale,x=h.ticks,w=h.includeHidden,S=h[i];if(t[S])return t;var j,P,E,_=vm(e.data,{graphicalItems:r.filter(function(e){var t;return(i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i])===S}),dataStartIndex:l,dataEndIndex:u}),M=_.length;(function(e,t,n){if("number"===n&&!0===t&&Array.isArray(e)){var r=null===e||void 0===e?void 0:e[0],o=null===e||void 0===e?void 0:e[1];if(r&&o&&k(r)&&k(o))return!0}return!1})(h.domain,m,y)&&(j=sd(h.domain,null,m),!d||"number"!==y&&"auto"===b||(E=$f(_,v,"category")));var A=mm(y);if(!j||0===j.length){var C,T=null!==(C=h.domain)&&void 0!==C?C:A;if(v){if(j=$f(_,v,y),"category"===y&&d){var N=function(e){if(!Array.isArray(e))return!1;for(var t=e.length,n={},r=0;r<t;r++){if(n[e[r]])return!0;n[e[r]]=!0}return!1}(j);g&&N?(P=j,j=xe()(0,M)):g||(j=dd(T,j,n).reduce(function(e,t){return e.indexOf(t)>=0?e:[].concat(im(e),[t])},[]))}else if("category"===y)j=g?j.filter(function(e){return""!==e&&!O()(e)}):dd(T,j,n).reduce(function(e,t){return e.indexOf(t)>=0||""===t||O()(t)?e:[].concat(im(e),[t])},[]);else if("number"===y){var D=function(e,t,n,r,o){var i=t.map(function(t){return Gf(e,t,n,o,r)}).filter(function(e){return!O()(e)});return i&&i.length?i.reduce(function(e,t){return[Math.min(e[0],t[0]),Math.max(e[1],t[1])]},[1/0,-1/0]):null}(_,r.filter(function(e){var t,n,r=i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i],o="hide"in e.props?e.props.hide:null===(n=e.type.defaultProps)||void 0===n?void 0:n.hide;return r===S&&(w||!o)}),v,o,c);D&&(j=D)}!d||"number"!==y&&"auto"===b||(E=$f(_,v,"category"))}else j=d?xe()(0,M):a&&a[S]&&a[S].hasStack&&"number"===y?"expand"===f?[0,1]:ld(a[S].stackGroups,l,u):Kf(_,r.filter(function(e){var t=i in e.props?e.props[i]:e.type.defaultProps[i],n="hide"in e.props?e.props.hide:e.type.defaultProps.hide;return t===S&&(w||!n)}),y,c,!0);if("number"===y)j=qy(s,j,S,o,x),T&&(j=sd(T,j,m));else if("category"===y&&T){var I=T;j.every(function(e){return I.indexOf(e)>=0})&&(j=I)}}return cm(cm({},t),{},sm({},S,cm(cm({},h),{},{axisType:o,domain:j,categoricalDomain:E,duplicateDomain:P,originalDomain:null!==(p=h.domain)&&void 0!==p?p:A,isCategorical:d,layout:c})))},{})},wm=function(e,t){var n=t.axisType,r=void 0===n?"xAxis":n,o=t.AxisComp,i=t.graphicalItems,a=t.stackGroups,l=t.dataStartIndex,u=t.dataEndIndex,c=e.children,s="".concat(r,"Id"),f=re(c,o),d={};return f&&f.length?d=xm(e,{axes:f,graphicalItems:i,axisType:r,axisIdKey:s,stackGroups:a,dataStartIndex:l,dataEndIndex:u}):i&&i.length&&(d=function(e,t){var n=t.graphicalItems,r=t.Axis,o=t.axisType,i=t.axisIdKey,a=t.stackGroups,l=t.dataStartIndex,u=t.dataEndIndex,c=e.layout,s=e.children,f=vm(e.data,{graphicalItems:n,dataStartIndex:l,dataEndIndex:u}),d=f.length,p=Qf(c,o),h=-1;return n.reduce(function(e,t){var y,v=(void 0!==t.type.defaultProps?cm(cm({},t.type.defaultProps),t.props):t.props)[i],m=mm("number");return e[v]?e:(h++,p?y=xe()(0,d):a&&a[v]&&a[v].hasStack?(y=ld(a[v].stackGroups,l,u),y=qy(s,y,v,o)):(y=sd(m,Kf(f,n.filter(function(e){var t,n,r=i in e.props?e.props[i]:null===(t=e.type.defaultProps)||void 0===t?void 0:t[i],o="hide"in e.props?e.props.hide:null===(n=e.type.defaultProps)||void 0===n?void 0:n.hide;return r===v&&!o}),"number",c),r.defaultProps.allowDataOverflow),y=qy(s,y,v,o)),cm(cm({},e),{},sm({},v,cm(cm({axisType:o},r.defaultProps),{},{hide:!0,orientation:g()(dm,"".concat(o,".").concat(h%2),null),domain:y,originalDomain:m,isCategorical:p,layout:c}))))},{})}(e,{Axis:o,graphicalItems:i,axisType:r,axisIdKey:s,stackGroups:a,dataStartIndex:l,dataEndIndex:u})),d},Om=function(e){var t=e.children,n=e.defaultShowTooltip,r=oe(t,Cd),o=0,i=0;return e.data&&0!==e.data.length&&(i=e.data.length-1),r&&r.props&&(r.props.startIndex>=0&&(o=r.props.startIndex),r.props.endIndex>=0&&(i=r.props.endIndex)),{chartX:0,chartY:0,dataStartIndex:o,dataEndIndex:i,activeTooltipIndex:-1,isTooltipActive:Boolean(n)}},Sm=function(e){return"horizontal"===e?{numericAxisName:"yAxis",cateAxisName:"xAxis"}:"vertical"===e?{numericAxisName:"xAxis",cateAxisName:"yAxis"}:"centric"===e?{numericAxisName:"radiusAxis",cateAxisName:"angleAxis"}:{numericAxisName:"angleAxis",cateAxisName:"radiusAxis"}},jm=function(e,t){var n=e.props,r=(e.graphicalItems,e.xAxisMap),o=void 0===r?{}:r,i=e.yAxisMap,a=void 0===i?{}:i,l=n.width,u=n.height,c=n.children,s=n.margin||{},f=oe(c,Cd),d=oe(c,Kn),p=Object.keys(a).reduce(function(e,t){var n=a[t],r=n.orientation;return n.mirror||n.hide?e:cm(cm({},e),{},sm({},r,e[r]+n.width))},{left:s.left||0,right:s.right||0}),h=Object.keys(o).reduce(function(e,t){var n=o[t],r=n.orientation;return n.mirror||n.hide?e:cm(cm({},e),{},sm({},r,g()(e,"".concat(r))+n.height))},{top:s.top||0,bottom:s.bottom||0}),y=cm(cm({},h),p),v=y.bottom;f&&(y.bottom+=f.props.height||Cd.defaultProps.height),d&&t&&(y=function(e,t,n,r){var o=n.children,i=n.width,a=n.margin,l=i-(a.left||0)-(a.right||0),u=Bf({children:o,legendWidth:l});if(u){var c=r||{},s=c.width,f=c.height,d=u.align,p=u.verticalAlign,h=u.layout;if(("vertical"===h||"horizontal"===h&&"middle"===p)&&"center"!==d&&k(e[d]))return qf(qf({},e),{},Vf({},d,e[d]+(s||0)));if(("horizontal"===h||"vertical"===h&&"center"===d)&&"middle"!==p&&k(e[p]))return qf(qf({},e),{},Vf({},p,e[p]+(f||0)))}return e}(y,0,n,t));var m=l-y.left-y.right,b=u-y.top-y.bottom;return cm(cm({brushBottom:v},y),{},{width:Math.max(m,0),height:Math.max(b,0)})},km=function(e,t){return"xAxis"===t?e[t].width:"yAxis"===t?e[t].height:void 0},Pm=["type","layout","connectNulls","ref"],Em=["key"];function _m(e){return _m="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},_m(e)}function Mm(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function Am(){return Am=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Am.apply(this,arguments)}function Cm(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Tm(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Cm(Object(n),!0).forEach(function(t){Fm(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Cm(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Nm(e){return function(e){if(Array.isArray(e))return Dm(e)}(e)||function(e){if("undefined"!==typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||function(e,t){if(!e)return;if("string"===typeof e)return Dm(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);"Object"===n&&e.constructor&&(n=e.constructor.name);if("Map"===n||"Set"===n)return Array.from(e);if("Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Dm(e,t)}(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function Dm(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function Im(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Um(r.key),r)}}function zm(e,t,n){return t=Lm(t),function(e,t){if(t&&("object"===_m(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Rm()?Reflect.construct(t,n||[],Lm(e).constructor):t.apply(e,n))}function Rm(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(Rm=function(){return!!e})()}function Lm(e){return Lm=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},Lm(e)}function Bm(e,t){return Bm=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Bm(e,t)}function Fm(e,t,n){return(t=Um(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Um(e){var t=function(e,t){if("object"!=_m(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=_m(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==_m(t)?t:t+""}var Wm=function(e){function n(){var e;!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n);for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];return Fm(e=zm(this,n,[].concat(r)),"state",{isAnimationFinished:!0,totalLength:0}),Fm(e,"generateSimpleStrokeDasharray",function(e,t){return"".concat(t,"px ").concat(e-t,"px")}),Fm(e,"getStrokeDasharray",function(t,r,o){var i=o.reduce(function(e,t){return e+t});if(!i)return e.generateSimpleStrokeDasharray(r,t);for(var a=Math.floor(t/i),l=t%i,u=r-t,c=[],s=0,f=0;s<o.length;f+=o[s],++s)if(f+o[s]>l){c=[].concat(Nm(o.slice(0,s)),[l-f]);break}var d=c.length%2===0?[0,u]:[u];return[].concat(Nm(n.repeat(o,a)),Nm(c),d).map(function(e){return"".concat(e,"px")}).join(", ")}),Fm(e,"id",_("recharts-line-")),Fm(e,"pathRef",function(t){e.mainCurve=t}),Fm(e,"handleAnimationEnd",function(){e.setState({isAnimationFinished:!0}),e.props.onAnimationEnd&&e.props.onAnimationEnd()}),Fm(e,"handleAnimationStart",function(){e.setState({isAnimationFinished:!1}),e.props.onAnimationStart&&e.props.onAnimationStart()}),e}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Bm(e,t)}(n,e),r=n,o=[{key:"componentDidMount",value:function(){if(this.props.isAnimationActive){var e=this.getTotalLength();this.setState({totalLength:e})}}},{key:"componentDidUpdate",value:function(){if(this.props.isAnimationActive){var e=this.getTotalLength();e!==this.state.totalLength&&this.setState({totalLength:e})}}},{key:"getTotalLength",value:function(){var e=this.mainCurve;try{return e&&e.getTotalLength&&e.getTotalLength()||0}catch(t){return 0}}},{key:"renderErrorBar",value:function(e,n){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var r=this.props,o=r.points,i=r.xAxis,a=r.yAxis,l=r.layout,u=re(r.children,Df);if(!u)return null;var c=function(e,t){return{x:e.x,y:e.y,value:e.value,errorVal:Xf(e.payload,t)}},s={clipPath:e?"url(#clipPath-".concat(n,")"):null};return t.createElement(Te,s,u.map(function(e){return t.cloneElement(e,{key:"bar-".concat(e.props.dataKey),data:o,xAxis:i,yAxis:a,layout:l,dataPointFormatter:c})}))}},{key:"renderDots",value:function(e,r,o){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var i=this.props,a=i.dot,l=i.points,u=i.dataKey,c=ue(this.props,!1),s=ue(a,!0),f=l.map(function(e,t){var r=Tm(Tm(Tm({key:"dot-".concat(t),r:3},c),s),{},{index:t,cx:e.x,cy:e.y,value:e.value,dataKey:u,payload:e.payload,points:l});return n.renderDotItem(a,r)}),d={clipPath:e?"url(#clipPath-".concat(r?"":"dots-").concat(o,")"):null};return t.createElement(Te,Am({className:"recharts-line-dots",key:"dots"},d),f)}},{key:"renderCurveStatically",value:function(e,n,r,o){var i=this.props,a=i.type,l=i.layout,u=i.connectNulls,c=(i.ref,Mm(i,Pm)),s=Tm(Tm(Tm({},ue(c,!0)),{},{fill:"none",className:"recharts-line-curve",clipPath:n?"url(#clipPath-".concat(r,")"):null,points:e},o),{},{type:a,layout:l,connectNulls:u});return t.createElement(Tv,Am({},s,{pathRef:this.pathRef}))}},{key:"renderCurveWithAnimation",value:function(e,n){var r=this,o=this.props,i=o.points,a=o.strokeDasharray,l=o.isAnimationActive,u=o.animationBegin,c=o.animationDuration,s=o.animationEasing,f=o.animationId,d=o.animateNewValues,p=o.width,h=o.height,y=this.state,v=y.prevPoints,m=y.totalLength;return t.createElement(Mo,{begin:u,duration:c,isActive:l,easing:s,from:{t:0},to:{t:1},key:"line-".concat(f),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},function(t){var o=t.t;if(v){var l=v.length/i.length,u=i.map(function(e,t){var n=Math.floor(t*l);if(v[n]){var r=v[n],i=C(r.x,e.x),a=C(r.y,e.y);return Tm(Tm({},e),{},{x:i(o),y:a(o)})}if(d){var u=C(2*p,e.x),c=C(h/2,e.y);return Tm(Tm({},e),{},{x:u(o),y:c(o)})}return Tm(Tm({},e),{},{x:e.x,y:e.y})});return r.renderCurveStatically(u,e,n)}var c,s=C(0,m)(o);if(a){var f="".concat(a).split(/[,\s]+/gim).map(function(e){return parseFloat(e)});c=r.getStrokeDasharray(s,m,f)}else c=r.generateSimpleStrokeDasharray(m,s);return r.renderCurveStatically(i,e,n,{strokeDasharray:c})})}},{key:"renderCurve",value:function(e,t){var n=this.props,r=n.points,o=n.isAnimationActive,i=this.state,a=i.prevPoints,l=i.totalLength;return o&&r&&r.length&&(!a&&l>0||!qs()(a,r))?this.renderCurveWithAnimation(e,t):this.renderCurveStatically(r,e,t)}},{key:"render",value:function(){var e,n=this.props,r=n.hide,o=n.dot,i=n.points,a=n.className,l=n.xAxis,u=n.yAxis,c=n.top,f=n.left,d=n.width,p=n.height,h=n.isAnimationActive,y=n.id;if(r||!i||!i.length)return null;var v=this.state.isAnimationFinished,m=1===i.length,g=s("recharts-line",a),b=l&&l.allowDataOverflow,x=u&&u.allowDataOverflow,w=b||x,S=O()(y)?this.id:y,j=null!==(e=ue(o,!1))&&void 0!==e?e:{r:3,strokeWidth:2},k=j.r,P=void 0===k?3:k,E=j.strokeWidth,_=void 0===E?2:E,M=(function(e){return e&&"object"===Q(e)&&"clipDot"in e}(o)?o:{}).clipDot,A=void 0===M||M,C=2*P+_;return t.createElement(Te,{className:g},b||x?t.createElement("defs",null,t.createElement("clipPath",{id:"clipPath-".concat(S)},t.createElement("rect",{x:b?f:f-d/2,y:x?c:c-p/2,width:b?d:2*d,height:x?p:2*p})),!A&&t.createElement("clipPath",{id:"clipPath-dots-".concat(S)},t.createElement("rect",{x:f-C/2,y:c-C/2,width:d+C,height:p+C}))):null,!m&&this.renderCurve(w,S),this.renderErrorBar(w,S),(m||o)&&this.renderDots(w,A,S),(!h||v)&&bp.renderCallByParent(this.props,i))}}],i=[{key:"getDerivedStateFromProps",value:function(e,t){return e.animationId!==t.prevAnimationId?{prevAnimationId:e.animationId,curPoints:e.points,prevPoints:t.curPoints}:e.points!==t.curPoints?{curPoints:e.points}:null}},{key:"repeat",value:function(e,t){for(var n=e.length%2!==0?[].concat(Nm(e),[0]):e,r=[],o=0;o<t;++o)r=[].concat(Nm(r),Nm(n));return r}},{key:"renderDotItem",value:function(e,n){var r;if(t.isValidElement(e))r=t.cloneElement(e,n);else if(z()(e))r=e(n);else{var o=n.key,i=Mm(n,Em),a=s("recharts-line-dot","boolean"!==typeof e?e.className:"");r=t.createElement(Zn,Am({key:o},i,{className:a}))}return r}}],o&&Im(r.prototype,o),i&&Im(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.PureComponent);function Hm(e,t,n){if(t<1)return[];if(1===t&&void 0===n)return e;for(var r=[],o=0;o<e.length;o+=t){if(void 0!==n&&!0!==n(e[o]))return;r.push(e[o])}return r}function qm(e,t,n){return function(e){var t=e.width,n=e.height,r=function(e){return(e%180+180)%180}(arguments.length>1&&void 0!==arguments[1]?arguments[1]:0),o=r*Math.PI/180,i=Math.atan(n/t),a=o>i&&o<Math.PI-i?n/Math.sin(o):t/Math.cos(o);return Math.abs(a)}({width:e.width+t.width,height:e.height+t.height},n)}function Vm(e,t,n,r,o){if(e*t<e*r||e*t>e*o)return!1;var i=n();return e*(t-e*i/2-r)>=0&&e*(t+e*i/2-o)<=0}function Xm(e){return Xm="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Xm(e)}function $m(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Ym(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?$m(Object(n),!0).forEach(function(t){Gm(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):$m(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Gm(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Xm(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Xm(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Xm(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Km(e,t,n){var r=e.tick,o=e.ticks,i=e.viewBox,a=e.minTickGap,l=e.orientation,u=e.interval,c=e.tickFormatter,s=e.unit,f=e.angle;if(!o||!o.length||!r)return[];if(k(u)||it.isSsr)return function(e,t){return Hm(e,t+1)}(o,"number"===typeof u&&k(u)?u:0);var d=[],p="top"===l||"bottom"===l?"width":"height",h=s&&"width"===p?ai(s,{fontSize:t,letterSpacing:n}):{width:0,height:0},y=function(e,r){var o=z()(c)?c(e.value,r):e.value;return"width"===p?qm(ai(o,{fontSize:t,letterSpacing:n}),h,f):ai(o,{fontSize:t,letterSpacing:n})[p]},v=o.length>=2?S(o[1].coordinate-o[0].coordinate):1,m=function(e,t,n){var r="width"===n,o=e.x,i=e.y,a=e.width,l=e.height;return 1===t?{start:r?o:i,end:r?o+a:i+l}:{start:r?o+a:i+l,end:r?o:i}}(i,v,p);return"equidistantPreserveStart"===u?function(e,t,n,r,o){for(var i,a=(r||[]).slice(),l=t.start,u=t.end,c=0,s=1,f=l,d=function(){var t=null===r||void 0===r?void 0:r[c];if(void 0===t)return{v:Hm(r,s)};var i,a=c,d=function(){return void 0===i&&(i=n(t,a)),i},p=t.coordinate,h=0===c||Vm(e,p,d,f,u);h||(c=0,f=l,s+=1),h&&(f=p+e*(d()/2+o),c+=s)};s<=a.length;)if(i=d())return i.v;return[]}(v,m,y,o,a):(d="preserveStart"===u||"preserveStartEnd"===u?function(e,t,n,r,o,i){var a=(r||[]).slice(),l=a.length,u=t.start,c=t.end;if(i){var s=r[l-1],f=n(s,l-1),d=e*(s.coordinate+e*f/2-c);a[l-1]=s=Ym(Ym({},s),{},{tickCoord:d>0?s.coordinate-d*e:s.coordinate}),Vm(e,s.tickCoord,function(){return f},u,c)&&(c=s.tickCoord-e*(f/2+o),a[l-1]=Ym(Ym({},s),{},{isShow:!0}))}for(var p=i?l-1:l,h=function(t){var r,i=a[t],l=function(){return void 0===r&&(r=n(i,t)),r};if(0===t){var s=e*(i.coordinate-e*l()/2-u);a[t]=i=Ym(Ym({},i),{},{tickCoord:s<0?i.coordinate-s*e:i.coordinate})}else a[t]=i=Ym(Ym({},i),{},{tickCoord:i.coordinate});Vm(e,i.tickCoord,l,u,c)&&(u=i.tickCoord+e*(l()/2+o),a[t]=Ym(Ym({},i),{},{isShow:!0}))},y=0;y<p;y++)h(y);return a}(v,m,y,o,a,"preserveStartEnd"===u):function(e,t,n,r,o){for(var i=(r||[]).slice(),a=i.length,l=t.start,u=t.end,c=function(t){var r,c=i[t],s=function(){return void 0===r&&(r=n(c,t)),r};if(t===a-1){var f=e*(c.coordinate+e*s()/2-u);i[t]=c=Ym(Ym({},c),{},{tickCoord:f>0?c.coordinate-f*e:c.coordinate})}else i[t]=c=Ym(Ym({},c),{},{tickCoord:c.coordinate});Vm(e,c.tickCoord,s,l,u)&&(u=c.tickCoord-e*(s()/2+o),i[t]=Ym(Ym({},c),{},{isShow:!0}))},s=a-1;s>=0;s--)c(s);return i}(v,m,y,o,a),d.filter(function(e){return e.isShow}))}Fm(Wm,"displayName","Line"),Fm(Wm,"defaultProps",{xAxisId:0,yAxisId:0,connectNulls:!1,activeDot:!0,dot:!0,legendType:"line",stroke:"#3182bd",strokeWidth:1,fill:"#fff",points:[],isAnimationActive:!it.isSsr,animateNewValues:!0,animationBegin:0,animationDuration:1500,animationEasing:"ease",hide:!1,label:!1}),Fm(Wm,"getComposedData",function(e){var t=e.props,n=e.xAxis,r=e.yAxis,o=e.xAxisTicks,i=e.yAxisTicks,a=e.dataKey,l=e.bandSize,u=e.displayedData,c=e.offset,s=t.layout,f=u.map(function(e,t){var u=Xf(e,a);return"horizontal"===s?{x:id({axis:n,ticks:o,bandSize:l,entry:e,index:t}),y:O()(u)?null:r.scale(u),value:u,payload:e}:{x:O()(u)?null:n.scale(u),y:id({axis:r,ticks:i,bandSize:l,entry:e,index:t}),value:u,payload:e}});return Tm({points:f,layout:s},c)});var Qm=["viewBox"],Zm=["viewBox"],Jm=["ticks"];function eg(e){return eg="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},eg(e)}function tg(){return tg=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},tg.apply(this,arguments)}function ng(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function rg(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?ng(Object(n),!0).forEach(function(t){sg(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ng(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function og(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}function ig(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,fg(r.key),r)}}function ag(e,t,n){return t=ug(t),function(e,t){if(t&&("object"===eg(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,lg()?Reflect.construct(t,n||[],ug(e).constructor):t.apply(e,n))}function lg(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(lg=function(){return!!e})()}function ug(e){return ug=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},ug(e)}function cg(e,t){return cg=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},cg(e,t)}function sg(e,t,n){return(t=fg(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function fg(e){var t=function(e,t){if("object"!=eg(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=eg(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==eg(t)?t:t+""}var dg=function(e){function n(e){var t;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),(t=ag(this,n,[e])).state={fontSize:"",letterSpacing:""},t}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&cg(e,t)}(n,e),r=n,o=[{key:"shouldComponentUpdate",value:function(e,t){var n=e.viewBox,r=og(e,Qm),o=this.props,i=o.viewBox,a=og(o,Zm);return!F(n,i)||!F(r,a)||!F(t,this.state)}},{key:"componentDidMount",value:function(){var e=this.layerReference;if(e){var t=e.getElementsByClassName("recharts-cartesian-axis-tick-value")[0];t&&this.setState({fontSize:window.getComputedStyle(t).fontSize,letterSpacing:window.getComputedStyle(t).letterSpacing})}}},{key:"getTickLineCoord",value:function(e){var t,n,r,o,i,a,l=this.props,u=l.x,c=l.y,s=l.width,f=l.height,d=l.orientation,p=l.tickSize,h=l.mirror,y=l.tickMargin,v=h?-1:1,m=e.tickSize||p,g=k(e.tickCoord)?e.tickCoord:e.coordinate;switch(d){case"top":t=n=e.coordinate,a=(r=(o=c+ +!h*f)-v*m)-v*y,i=g;break;case"left":r=o=e.coordinate,i=(t=(n=u+ +!h*s)-v*m)-v*y,a=g;break;case"right":r=o=e.coordinate,i=(t=(n=u+ +h*s)+v*m)+v*y,a=g;break;default:t=n=e.coordinate,a=(r=(o=c+ +h*f)+v*m)+v*y,i=g}return{line:{x1:t,y1:r,x2:n,y2:o},tick:{x:i,y:a}}}},{key:"getTickTextAnchor",value:function(){var e,t=this.props,n=t.orientation,r=t.mirror;switch(n){case"left":e=r?"start":"end";break;case"right":e=r?"end":"start";break;default:e="middle"}return e}},{key:"getTickVerticalAnchor",value:function(){var e=this.props,t=e.orientation,n=e.mirror,r="end";switch(t){case"left":case"right":r="middle";break;case"top":r=n?"start":"end";break;default:r=n?"end":"start"}return r}},{key:"renderAxisLine",value:function(){var e=this.props,n=e.x,r=e.y,o=e.width,i=e.height,a=e.orientation,l=e.mirror,u=e.axisLine,c=rg(rg(rg({},ue(this.props,!1)),ue(u,!1)),{},{fill:"none"});if("top"===a||"bottom"===a){var f=+("top"===a&&!l||"bottom"===a&&l);c=rg(rg({},c),{},{x1:n,y1:r+f*i,x2:n+o,y2:r+f*i})}else{var d=+("left"===a&&!l||"right"===a&&l);c=rg(rg({},c),{},{x1:n+d*o,y1:r,x2:n+d*o,y2:r+i})}return t.createElement("line",tg({},c,{className:s("recharts-cartesian-axis-line",g()(u,"className"))}))}},{key:"renderTicks",value:function(e,r,o){var i=this,a=this.props,l=a.tickLine,u=a.stroke,c=a.tick,f=a.tickFormatter,d=a.unit,p=Km(rg(rg({},this.props),{},{ticks:e}),r,o),h=this.getTickTextAnchor(),y=this.getTickVerticalAnchor(),v=ue(this.props,!1),m=ue(c,!1),b=rg(rg({},v),{},{fill:"none"},ue(l,!1)),x=p.map(function(e,r){var o=i.getTickLineCoord(e),a=o.line,x=o.tick,w=rg(rg(rg(rg({textAnchor:h,verticalAnchor:y},v),{},{stroke:"none",fill:u},m),x),{},{index:r,payload:e,visibleTicksCount:p.length,tickFormatter:f});return t.createElement(Te,tg({className:"recharts-cartesian-axis-tick",key:"tick-".concat(e.value,"-").concat(e.coordinate,"-").concat(e.tickCoord)},$(i.props,e,r)),l&&t.createElement("line",tg({},b,a,{className:s("recharts-cartesian-axis-tick-line",g()(l,"className"))})),c&&n.renderTickItem(c,w,"".concat(z()(f)?f(e.value,r):e.value).concat(d||"")))});return t.createElement("g",{className:"recharts-cartesian-axis-ticks"},x)}},{key:"render",value:function(){var e=this,n=this.props,r=n.axisLine,o=n.width,i=n.height,a=n.ticksGenerator,l=n.className;if(n.hide)return null;var u=this.props,c=u.ticks,f=og(u,Jm),d=c;return z()(a)&&(d=c&&c.length>0?a(this.props):a(f)),o<=0||i<=0||!d||!d.length?null:t.createElement(Te,{className:s("recharts-cartesian-axis",l),ref:function(t){e.layerReference=t}},r&&this.renderAxisLine(),this.renderTicks(d,this.state.fontSize,this.state.letterSpacing),Zd.renderCallByParent(this.props))}}],i=[{key:"renderTickItem",value:function(e,n,r){var o=s(n.className,"recharts-cartesian-axis-tick-value");return t.isValidElement(e)?t.cloneElement(e,rg(rg({},n),{},{className:o})):z()(e)?e(rg(rg({},n),{},{className:o})):t.createElement(Ii,tg({},n,{className:"recharts-cartesian-axis-tick-value"}),r)}}],o&&ig(r.prototype,o),i&&ig(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function pg(e){return pg="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},pg(e)}function hg(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,xg(r.key),r)}}function yg(e,t,n){return t=mg(t),function(e,t){if(t&&("object"===pg(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,vg()?Reflect.construct(t,n||[],mg(e).constructor):t.apply(e,n))}function vg(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(vg=function(){return!!e})()}function mg(e){return mg=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},mg(e)}function gg(e,t){return gg=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},gg(e,t)}function bg(e,t,n){return(t=xg(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function xg(e){var t=function(e,t){if("object"!=pg(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=pg(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==pg(t)?t:t+""}function wg(){return wg=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},wg.apply(this,arguments)}function Og(e){var n=e.xAxisId,r=py(),o=hy(),i=fy(n);return null==i?null:t.createElement(dg,wg({},i,{className:s("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:o},ticksGenerator:function(e){return Jf(e,!0)}}))}sg(dg,"displayName","CartesianAxis"),sg(dg,"defaultProps",{x:0,y:0,width:0,height:0,viewBox:{x:0,y:0,width:0,height:0},orientation:"bottom",ticks:[],stroke:"#666",tickLine:!0,axisLine:!0,tick:!0,mirror:!1,minTickGap:5,tickSize:6,tickMargin:2,interval:"preserveEnd"});var Sg=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),yg(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&gg(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(Og,this.props)}}])&&hg(r.prototype,o),i&&hg(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);function jg(e){return jg="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},jg(e)}function kg(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Cg(r.key),r)}}function Pg(e,t,n){return t=_g(t),function(e,t){if(t&&("object"===jg(t)||"function"===typeof t))return t;if(void 0!==t)throw new TypeError("Derived constructors may only return object or undefined");return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e)}(e,Eg()?Reflect.construct(t,n||[],_g(e).constructor):t.apply(e,n))}function Eg(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch(e){}return(Eg=function(){return!!e})()}function _g(e){return _g=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(e){return e.__proto__||Object.getPrototypeOf(e)},_g(e)}function Mg(e,t){return Mg=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},Mg(e,t)}function Ag(e,t,n){return(t=Cg(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Cg(e){var t=function(e,t){if("object"!=jg(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=jg(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==jg(t)?t:t+""}function Tg(){return Tg=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Tg.apply(this,arguments)}bg(Sg,"displayName","XAxis"),bg(Sg,"defaultProps",{allowDecimals:!0,hide:!1,orientation:"bottom",width:0,height:30,mirror:!1,xAxisId:0,tickCount:5,type:"category",padding:{left:0,right:0},allowDataOverflow:!1,scale:"auto",reversed:!1,allowDuplicatedCategory:!0});var Ng=function(e){var n=e.yAxisId,r=py(),o=hy(),i=dy(n);return null==i?null:t.createElement(dg,Tg({},i,{className:s("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:r,height:o},ticksGenerator:function(e){return Jf(e,!0)}}))},Dg=function(e){function n(){return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,n),Pg(this,n,arguments)}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Mg(e,t)}(n,e),r=n,(o=[{key:"render",value:function(){return t.createElement(Ng,this.props)}}])&&kg(r.prototype,o),i&&kg(r,i),Object.defineProperty(r,"prototype",{writable:!1}),r;var r,o,i}(t.Component);Ag(Dg,"displayName","YAxis"),Ag(Dg,"defaultProps",{allowDuplicatedCategory:!0,allowDecimals:!0,hide:!1,orientation:"left",width:60,height:0,mirror:!1,yAxisId:0,tickCount:5,type:"number",padding:{top:0,bottom:0},allowDataOverflow:!1,scale:"auto",reversed:!1});var Ig=function(e){var n=e.chartName,r=e.GraphicalChild,o=e.defaultTooltipEventType,i=void 0===o?"axis":o,a=e.validateTooltipEventTypes,l=void 0===a?["axis"]:a,u=e.axisComponents,c=e.legendContent,f=e.formatAxisMap,p=e.defaultProps,h=function(e,t){var n=t.graphicalItems,r=t.stackGroups,o=t.offset,i=t.updateId,a=t.dataStartIndex,l=t.dataEndIndex,c=e.barSize,s=e.layout,f=e.barGap,d=e.barCategoryGap,p=e.maxBarSize,h=Sm(s),y=h.numericAxisName,v=h.cateAxisName,m=function(e){return!(!e||!e.length)&&e.some(function(e){var t=J(e&&e.type);return t&&t.indexOf("Bar")>=0})}(n),g=[];return n.forEach(function(n,h){var b=vm(e.data,{graphicalItems:[n],dataStartIndex:a,dataEndIndex:l}),x=void 0!==n.type.defaultProps?cm(cm({},n.type.defaultProps),n.props):n.props,w=x.dataKey,S=x.maxBarSize,j=x["".concat(y,"Id")],k=x["".concat(v,"Id")],E=u.reduce(function(e,n){var r=t["".concat(n.axisType,"Map")],o=x["".concat(n.axisType,"Id")];r&&r[o]||"zAxis"===n.axisType||je(!1);var i=r[o];return cm(cm({},e),{},sm(sm({},n.axisType,i),"".concat(n.axisType,"Ticks"),Jf(i)))},{}),_=E[v],A=E["".concat(v,"Ticks")],C=r&&r[j]&&r[j].hasStack&&function(e,t){var n,r=(null!==(n=e.type)&&void 0!==n&&n.defaultProps?qf(qf({},e.type.defaultProps),e.props):e.props).stackId;if(P(r)){var o=t[r];if(o){var i=o.items.indexOf(e);return i>=0?o.stackedData[i]:null}}return null}(n,r[j].stackGroups),T=J(n.type).indexOf("Bar")>=0,N=fd(_,A),D=[],I=m&&function(e){var t=e.barSize,n=e.totalSize,r=e.stackGroups,o=void 0===r?{}:r;if(!o)return{};for(var i={},a=Object.keys(o),l=0,u=a.length;l<u;l++)for(var c=o[a[l]].stackGroups,s=Object.keys(c),f=0,d=s.length;f<d;f++){var p=c[s[f]],h=p.items,y=p.cateAxisId,v=h.filter(function(e){return J(e.type).indexOf("Bar")>=0});if(v&&v.length){var m=v[0].type.defaultProps,g=void 0!==m?qf(qf({},m),v[0].props):v[0].props,b=g.barSize,x=g[y];i[x]||(i[x]=[]);var w=O()(b)?t:b;i[x].push({item:v[0],stackList:v.slice(1),barSize:O()(w)?void 0:M(w,n,0)})}}return i}({barSize:c,stackGroups:r,totalSize:km(E,v)});if(T){var z,R,L=O()(S)?p:S,B=null!==(z=null!==(R=fd(_,A,!0))&&void 0!==R?R:L)&&void 0!==z?z:0;D=function(e){var t=e.barGap,n=e.barCategoryGap,r=e.bandSize,o=e.sizeList,i=void 0===o?[]:o,a=e.maxBarSize,l=i.length;if(l<1)return null;var u,c=M(t,r,0,!0),s=[];if(i[0].barSize===+i[0].barSize){var f=!1,d=r/l,p=i.reduce(function(e,t){return e+t.barSize||0},0);(p+=(l-1)*c)>=r&&(p-=(l-1)*c,c=0),p>=r&&d>0&&(f=!0,p=l*(d*=.9));var h={offset:((r-p)/2|0)-c,size:0};u=i.reduce(function(e,t){var n={item:t.item,position:{offset:h.offset+h.size+c,size:f?d:t.barSize}},r=[].concat(Uf(e),[n]);return h=r[r.length-1].position,t.stackList&&t.stackList.length&&t.stackList.forEach(function(e){r.push({item:e,position:h})}),r},s)}else{var y=M(n,r,0,!0);r-2*y-(l-1)*c<=0&&(c=0);var v=(r-2*y-(l-1)*c)/l;v>1&&(v>>=0);var m=a===+a?Math.min(v,a):v;u=i.reduce(function(e,t,n){var r=[].concat(Uf(e),[{item:t.item,position:{offset:y+(v+c)*n+(v-m)/2,size:m}}]);return t.stackList&&t.stackList.length&&t.stackList.forEach(function(e){r.push({item:e,position:r[r.length-1].position})}),r},s)}return u}({barGap:f,barCategoryGap:d,bandSize:B!==N?B:N,sizeList:I[k],maxBarSize:L}),B!==N&&(D=D.map(function(e){return cm(cm({},e),{},{position:cm(cm({},e.position),{},{offset:e.position.offset-B/2})})}))}var F,U,W=n&&n.type&&n.type.getComposedData;W&&g.push({props:cm(cm({},W(cm(cm({},E),{},{displayedData:b,props:e,dataKey:w,item:n,bandSize:N,barPosition:D,offset:o,stackedData:C,layout:s,dataStartIndex:a,dataEndIndex:l}))),{},sm(sm(sm({key:n.key||"item-".concat(h)},y,E[y]),v,E[v]),"animationId",i)),childIndex:(F=n,U=e.children,ne(U).indexOf(F)),item:n})}),g},y=function(e,t){var o=e.props,i=e.dataStartIndex,a=e.dataEndIndex,l=e.updateId;if(!ie({props:o}))return null;var c=o.children,s=o.layout,d=o.stackOffset,p=o.data,y=o.reverseStackOrder,v=Sm(s),m=v.numericAxisName,g=v.cateAxisName,b=re(c,r),x=function(e,t,n,r,o,i){if(!e)return null;var a=(i?t.reverse():t).reduce(function(e,t){var o,i=null!==(o=t.type)&&void 0!==o&&o.defaultProps?qf(qf({},t.type.defaultProps),t.props):t.props,a=i.stackId;if(i.hide)return e;var l=i[n],u=e[l]||{hasStack:!1,stackGroups:{}};if(P(a)){var c=u.stackGroups[a]||{numericAxisId:n,cateAxisId:r,items:[]};c.items.push(t),u.hasStack=!0,u.stackGroups[a]=c}else u.stackGroups[_("_stackId_")]={numericAxisId:n,cateAxisId:r,items:[t]};return qf(qf({},e),{},Vf({},l,u))},{});return Object.keys(a).reduce(function(t,i){var l=a[i];return l.hasStack&&(l.stackGroups=Object.keys(l.stackGroups).reduce(function(t,i){var a=l.stackGroups[i];return qf(qf({},t),{},Vf({},i,{numericAxisId:n,cateAxisId:r,items:a.items,stackedData:od(e,a.items,o)}))},{})),qf(qf({},t),{},Vf({},i,l))},{})}(p,b,"".concat(m,"Id"),"".concat(g,"Id"),d,y),w=u.reduce(function(e,t){var n="".concat(t.axisType,"Map");return cm(cm({},e),{},sm({},n,wm(o,cm(cm({},t),{},{graphicalItems:b,stackGroups:t.axisType===m&&x,dataStartIndex:i,dataEndIndex:a}))))},{}),O=jm(cm(cm({},w),{},{props:o,graphicalItems:b}),null===t||void 0===t?void 0:t.legendBBox);Object.keys(w).forEach(function(e){w[e]=f(o,w[e],O,e.replace("Map",""),n)});var S=function(e){var t=A(e),n=Jf(t,!1,!0);return{tooltipTicks:n,orderedTooltipTicks:Oe()(n,function(e){return e.coordinate}),tooltipAxis:t,tooltipAxisBandSize:fd(t,n)}}(w["".concat(g,"Map")]),j=h(o,cm(cm({},w),{},{dataStartIndex:i,dataEndIndex:a,updateId:l,graphicalItems:b,stackGroups:x,offset:O}));return cm(cm({formattedGraphicalItems:j,graphicalItems:b,offset:O,stackGroups:x},S),w)},v=function(e){function r(e){var o,i,a;return function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,r),sm(a=tm(this,r,[e]),"eventEmitterSymbol",Symbol("rechartsEventEmitter")),sm(a,"accessibilityManager",new Zy),sm(a,"handleLegendBBoxUpdate",function(e){if(e){var t=a.state,n=t.dataStartIndex,r=t.dataEndIndex,o=t.updateId;a.setState(cm({legendBBox:e},y({props:a.props,dataStartIndex:n,dataEndIndex:r,updateId:o},cm(cm({},a.state),{},{legendBBox:e}))))}}),sm(a,"handleReceiveSyncEvent",function(e,t,n){if(a.props.syncId===e){if(n===a.eventEmitterSymbol&&"function"!==typeof a.props.syncMethod)return;a.applySyncEvent(t)}}),sm(a,"handleBrushChange",function(e){var t=e.startIndex,n=e.endIndex;if(t!==a.state.dataStartIndex||n!==a.state.dataEndIndex){var r=a.state.updateId;a.setState(function(){return cm({dataStartIndex:t,dataEndIndex:n},y({props:a.props,dataStartIndex:t,dataEndIndex:n,updateId:r},a.state))}),a.triggerSyncEvent({dataStartIndex:t,dataEndIndex:n})}}),sm(a,"handleMouseEnter",function(e){var t=a.getMouseInfo(e);if(t){var n=cm(cm({},t),{},{isTooltipActive:!0});a.setState(n),a.triggerSyncEvent(n);var r=a.props.onMouseEnter;z()(r)&&r(n,e)}}),sm(a,"triggeredAfterMouseMove",function(e){var t=a.getMouseInfo(e),n=t?cm(cm({},t),{},{isTooltipActive:!0}):{isTooltipActive:!1};a.setState(n),a.triggerSyncEvent(n);var r=a.props.onMouseMove;z()(r)&&r(n,e)}),sm(a,"handleItemMouseEnter",function(e){a.setState(function(){return{isTooltipActive:!0,activeItem:e,activePayload:e.tooltipPayload,activeCoordinate:e.tooltipPosition||{x:e.cx,y:e.cy}}})}),sm(a,"handleItemMouseLeave",function(){a.setState(function(){return{isTooltipActive:!1}})}),sm(a,"handleMouseMove",function(e){e.persist(),a.throttleTriggeredAfterMouseMove(e)}),sm(a,"handleMouseLeave",function(e){a.throttleTriggeredAfterMouseMove.cancel();var t={isTooltipActive:!1};a.setState(t),a.triggerSyncEvent(t);var n=a.props.onMouseLeave;z()(n)&&n(t,e)}),sm(a,"handleOuterEvent",function(e){var t,n=function(e){var t=e&&e.type;return t&&Z[t]?Z[t]:null}(e),r=g()(a.props,"".concat(n));n&&z()(r)&&r(null!==(t=/.*touch.*/i.test(n)?a.getMouseInfo(e.changedTouches[0]):a.getMouseInfo(e))&&void 0!==t?t:{},e)}),sm(a,"handleClick",function(e){var t=a.getMouseInfo(e);if(t){var n=cm(cm({},t),{},{isTooltipActive:!0});a.setState(n),a.triggerSyncEvent(n);var r=a.props.onClick;z()(r)&&r(n,e)}}),sm(a,"handleMouseDown",function(e){var t=a.props.onMouseDown;z()(t)&&t(a.getMouseInfo(e),e)}),sm(a,"handleMouseUp",function(e){var t=a.props.onMouseUp;z()(t)&&t(a.getMouseInfo(e),e)}),sm(a,"handleTouchMove",function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.throttleTriggeredAfterMouseMove(e.changedTouches[0])}),sm(a,"handleTouchStart",function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.handleMouseDown(e.changedTouches[0])}),sm(a,"handleTouchEnd",function(e){null!=e.changedTouches&&e.changedTouches.length>0&&a.handleMouseUp(e.changedTouches[0])}),sm(a,"handleDoubleClick",function(e){var t=a.props.onDoubleClick;z()(t)&&t(a.getMouseInfo(e),e)}),sm(a,"handleContextMenu",function(e){var t=a.props.onContextMenu;z()(t)&&t(a.getMouseInfo(e),e)}),sm(a,"triggerSyncEvent",function(e){void 0!==a.props.syncId&&Xy.emit($y,a.props.syncId,e,a.eventEmitterSymbol)}),sm(a,"applySyncEvent",function(e){var t=a.props,n=t.layout,r=t.syncMethod,o=a.state.updateId,i=e.dataStartIndex,l=e.dataEndIndex;if(void 0!==e.dataStartIndex||void 0!==e.dataEndIndex)a.setState(cm({dataStartIndex:i,dataEndIndex:l},y({props:a.props,dataStartIndex:i,dataEndIndex:l,updateId:o},a.state)));else if(void 0!==e.activeTooltipIndex){var u=e.chartX,c=e.chartY,s=e.activeTooltipIndex,f=a.state,d=f.offset,p=f.tooltipTicks;if(!d)return;if("function"===typeof r)s=r(p,e);else if("value"===r){s=-1;for(var h=0;h<p.length;h++)if(p[h].value===e.activeLabel){s=h;break}}var v=cm(cm({},d),{},{x:d.left,y:d.top}),m=Math.min(u,v.x+v.width),g=Math.min(c,v.y+v.height),b=p[s]&&p[s].value,x=gm(a.state,a.props.data,s),w=p[s]?{x:"horizontal"===n?p[s].coordinate:m,y:"horizontal"===n?g:p[s].coordinate}:hm;a.setState(cm(cm({},e),{},{activeLabel:b,activeCoordinate:w,activePayload:x,activeTooltipIndex:s}))}else a.setState(e)}),sm(a,"renderCursor",function(e){var r,o=a.state,i=o.isTooltipActive,l=o.activeCoordinate,u=o.activePayload,c=o.offset,s=o.activeTooltipIndex,f=o.tooltipAxisBandSize,d=a.getTooltipEventType(),p=null!==(r=e.props.active)&&void 0!==r?r:i,h=a.props.layout,y=e.key||"_recharts-cursor";return t.createElement($v,{key:y,activeCoordinate:l,activePayload:u,activeTooltipIndex:s,chartName:n,element:e,isActive:p,layout:h,offset:c,tooltipAxisBandSize:f,tooltipEventType:d})}),sm(a,"renderPolarAxis",function(e,n,r){var o=g()(e,"type.axisType"),i=g()(a.state,"".concat(o,"Map")),l=e.type.defaultProps,u=void 0!==l?cm(cm({},l),e.props):e.props,c=i&&i[u["".concat(o,"Id")]];return(0,t.cloneElement)(e,cm(cm({},c),{},{className:s(o,c.className),key:e.key||"".concat(n,"-").concat(r),ticks:Jf(c,!0)}))}),sm(a,"renderPolarGrid",function(e){var n=e.props,r=n.radialLines,o=n.polarAngles,i=n.polarRadius,l=a.state,u=l.radiusAxisMap,c=l.angleAxisMap,s=A(u),f=A(c),d=f.cx,p=f.cy,h=f.innerRadius,y=f.outerRadius;return(0,t.cloneElement)(e,{polarAngles:Array.isArray(o)?o:Jf(f,!0).map(function(e){return e.coordinate}),polarRadius:Array.isArray(i)?i:Jf(s,!0).map(function(e){return e.coordinate}),cx:d,cy:p,innerRadius:h,outerRadius:y,key:e.key||"polar-grid",radialLines:r})}),sm(a,"renderLegend",function(){var e=a.state.formattedGraphicalItems,n=a.props,r=n.children,o=n.width,i=n.height,l=a.props.margin||{},u=o-(l.left||0)-(l.right||0),s=Bf({children:r,formattedGraphicalItems:e,legendWidth:u,legendContent:c});if(!s)return null;var f=s.item,d=Jv(s,Yv);return(0,t.cloneElement)(f,cm(cm({},d),{},{chartWidth:o,chartHeight:i,margin:l,onBBoxUpdate:a.handleLegendBBoxUpdate}))}),sm(a,"renderTooltip",function(){var e,n=a.props,r=n.children,o=n.accessibilityLayer,i=oe(r,xt);if(!i)return null;var l=a.state,u=l.isTooltipActive,c=l.activeCoordinate,s=l.activePayload,f=l.activeLabel,d=l.offset,p=null!==(e=i.props.active)&&void 0!==e?e:u;return(0,t.cloneElement)(i,{viewBox:cm(cm({},d),{},{x:d.left,y:d.top}),active:p,label:f,payload:p?s:[],coordinate:c,accessibilityLayer:o})}),sm(a,"renderBrush",function(e){var n=a.props,r=n.margin,o=n.data,i=a.state,l=i.offset,u=i.dataStartIndex,c=i.dataEndIndex,s=i.updateId;return(0,t.cloneElement)(e,{key:e.key||"_recharts-brush",onChange:td(a.handleBrushChange,e.props.onChange),data:o,x:k(e.props.x)?e.props.x:l.left,y:k(e.props.y)?e.props.y:l.top+l.height+l.brushBottom-(r.bottom||0),width:k(e.props.width)?e.props.width:l.width,startIndex:u,endIndex:c,updateId:"brush-".concat(s)})}),sm(a,"renderReferenceElement",function(e,n,r){if(!e)return null;var o=a.clipPathId,i=a.state,l=i.xAxisMap,u=i.yAxisMap,c=i.offset,s=e.type.defaultProps||{},f=e.props,d=f.xAxisId,p=void 0===d?s.xAxisId:d,h=f.yAxisId,y=void 0===h?s.yAxisId:h;return(0,t.cloneElement)(e,{key:e.key||"".concat(n,"-").concat(r),xAxis:l[p],yAxis:u[y],viewBox:{x:c.left,y:c.top,width:c.width,height:c.height},clipPathId:o})}),sm(a,"renderActivePoints",function(e){var t=e.item,n=e.activePoint,o=e.basePoint,i=e.childIndex,a=e.isRange,l=[],u=t.props.key,c=void 0!==t.item.type.defaultProps?cm(cm({},t.item.type.defaultProps),t.item.props):t.item.props,s=c.activeDot,f=cm(cm({index:i,dataKey:c.dataKey,cx:n.x,cy:n.y,r:4,fill:Yf(t.item),strokeWidth:2,stroke:"#fff",payload:n.payload,value:n.value},ue(s,!1)),X(s));return l.push(r.renderActiveDot(s,f,"".concat(u,"-activePoint-").concat(i))),o?l.push(r.renderActiveDot(s,cm(cm({},f),{},{cx:o.x,cy:o.y}),"".concat(u,"-basePoint-").concat(i))):a&&l.push(null),l}),sm(a,"renderGraphicChild",function(e,n,r){var o=a.filterFormatItem(e,n,r);if(!o)return null;var i=a.getTooltipEventType(),l=a.state,u=l.isTooltipActive,c=l.tooltipAxis,s=l.activeTooltipIndex,f=l.activeLabel,d=oe(a.props.children,xt),p=o.props,h=p.points,y=p.isRange,v=p.baseLine,m=void 0!==o.item.type.defaultProps?cm(cm({},o.item.type.defaultProps),o.item.props):o.item.props,g=m.activeDot,b=m.hide,x=m.activeBar,w=m.activeShape,S=Boolean(!b&&u&&d&&(g||x||w)),j={};"axis"!==i&&d&&"click"===d.props.trigger?j={onClick:td(a.handleItemMouseEnter,e.props.onClick)}:"axis"!==i&&(j={onMouseLeave:td(a.handleItemMouseLeave,e.props.onMouseLeave),onMouseEnter:td(a.handleItemMouseEnter,e.props.onMouseEnter)});var k=(0,t.cloneElement)(e,cm(cm({},o.props),j));if(S){if(!(s>=0)){var P,E=(null!==(P=a.getItemByXY(a.state.activeCoordinate))&&void 0!==P?P:{graphicalItem:k}).graphicalItem,_=E.item,M=void 0===_?e:_,A=E.childIndex,C=cm(cm(cm({},o.props),j),{},{activeIndex:A});return[(0,t.cloneElement)(M,C),null,null]}var N,D;if(c.dataKey&&!c.allowDuplicatedCategory){var I="function"===typeof c.dataKey?function(e){return"function"===typeof c.dataKey?c.dataKey(e.payload):null}:"payload.".concat(c.dataKey.toString());N=T(h,I,f),D=y&&v&&T(v,I,f)}else N=null===h||void 0===h?void 0:h[s],D=y&&v&&v[s];if(w||x){var z=void 0!==e.props.activeIndex?e.props.activeIndex:s;return[(0,t.cloneElement)(e,cm(cm(cm({},o.props),j),{},{activeIndex:z})),null,null]}if(!O()(N))return[k].concat(im(a.renderActivePoints({item:o,activePoint:N,basePoint:D,childIndex:s,isRange:y})))}return y?[k,null,null]:[k,null]}),sm(a,"renderCustomized",function(e,n,r){return(0,t.cloneElement)(e,cm(cm({key:"recharts-customized-".concat(r)},a.props),a.state))}),sm(a,"renderMap",{CartesianGrid:{handler:ym,once:!0},ReferenceArea:{handler:a.renderReferenceElement},ReferenceLine:{handler:ym},ReferenceDot:{handler:a.renderReferenceElement},XAxis:{handler:ym},YAxis:{handler:ym},Brush:{handler:a.renderBrush,once:!0},Bar:{handler:a.renderGraphicChild},Line:{handler:a.renderGraphicChild},Area:{handler:a.renderGraphicChild},Radar:{handler:a.renderGraphicChild},RadialBar:{handler:a.renderGraphicChild},Scatter:{handler:a.renderGraphicChild},Pie:{handler:a.renderGraphicChild},Funnel:{handler:a.renderGraphicChild},Tooltip:{handler:a.renderCursor,once:!0},PolarGrid:{handler:a.renderPolarGrid,once:!0},PolarAngleAxis:{handler:a.renderPolarAxis},PolarRadiusAxis:{handler:a.renderPolarAxis},Customized:{handler:a.renderCustomized}}),a.clipPathId="".concat(null!==(o=e.id)&&void 0!==o?o:_("recharts"),"-clip"),a.throttleTriggeredAfterMouseMove=d()(a.triggeredAfterMouseMove,null!==(i=e.throttleDelay)&&void 0!==i?i:1e3/60),a.state={},a}return function(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&om(e,t)}(r,e),o=r,a=[{key:"componentDidMount",value:function(){var e,t;this.addListener(),this.accessibilityManager.setDetails({container:this.container,offset:{left:null!==(e=this.props.margin.left)&&void 0!==e?e:0,top:null!==(t=this.props.margin.top)&&void 0!==t?t:0},coordinateList:this.state.tooltipTicks,mouseHandlerCallback:this.triggeredAfterMouseMove,layout:this.props.layout}),this.displayDefaultTooltip()}},{key:"displayDefaultTooltip",value:function(){var e=this.props,t=e.children,n=e.data,r=e.height,o=e.layout,i=oe(t,xt);if(i){var a=i.props.defaultIndex;if(!("number"!==typeof a||a<0||a>this.state.tooltipTicks.length-1)){var l=this.state.tooltipTicks[a]&&this.state.tooltipTicks[a].value,u=gm(this.state,n,a,l),c=this.state.tooltipTicks[a].coordinate,s=(this.state.offset.top+r)/2,f="horizontal"===o?{x:c,y:s}:{y:c,x:s},d=this.state.formattedGraphicalItems.find(function(e){return"Scatter"===e.item.type.name});d&&(f=cm(cm({},f),d.props.points[a].tooltipPosition),u=d.props.points[a].tooltipPayload);var p={activeTooltipIndex:a,isTooltipActive:!0,activeLabel:l,activePayload:u,activeCoordinate:f};this.setState(p),this.renderCursor(i),this.accessibilityManager.setIndex(a)}}}},{key:"getSnapshotBeforeUpdate",value:function(e,t){return this.props.accessibilityLayer?(this.state.tooltipTicks!==t.tooltipTicks&&this.accessibilityManager.setDetails({coordinateList:this.state.tooltipTicks}),this.props.layout!==e.layout&&this.accessibilityManager.setDetails({layout:this.props.layout}),this.props.margin!==e.margin&&this.accessibilityManager.setDetails({offset:{left:null!==(n=this.props.margin.left)&&void 0!==n?n:0,top:null!==(r=this.props.margin.top)&&void 0!==r?r:0}}),null):null;var n,r}},{key:"componentDidUpdate",value:function(e){ce([oe(e.children,xt)],[oe(this.props.children,xt)])||this.displayDefaultTooltip()}},{key:"componentWillUnmount",value:function(){this.removeListener(),this.throttleTriggeredAfterMouseMove.cancel()}},{key:"getTooltipEventType",value:function(){var e=oe(this.props.children,xt);if(e&&"boolean"===typeof e.props.shared){var t=e.props.shared?"axis":"item";return l.indexOf(t)>=0?t:i}return i}},{key:"getMouseInfo",value:function(e){if(!this.container)return null;var t,n=this.container,r=n.getBoundingClientRect(),o={top:(t=r).top+window.scrollY-document.documentElement.clientTop,left:t.left+window.scrollX-document.documentElement.clientLeft},i={chartX:Math.round(e.pageX-o.left),chartY:Math.round(e.pageY-o.top)},a=r.width/n.offsetWidth||1,l=this.inRange(i.chartX,i.chartY,a);if(!l)return null;var u=this.state,c=u.xAxisMap,s=u.yAxisMap,f=this.getTooltipEventType(),d=bm(this.state,this.props.data,this.props.layout,l);if("axis"!==f&&c&&s){var p=A(c).scale,h=A(s).scale,y=p&&p.invert?p.invert(i.chartX):null,v=h&&h.invert?h.invert(i.chartY):null;return cm(cm({},i),{},{xValue:y,yValue:v},d)}return d?cm(cm({},i),d):null}},{key:"inRange",value:function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,r=this.props.layout,o=e/n,i=t/n;if("horizontal"===r||"vertical"===r){var a=this.state.offset;return o>=a.left&&o<=a.left+a.width&&i>=a.top&&i<=a.top+a.height?{x:o,y:i}:null}var l=this.state,u=l.angleAxisMap,c=l.radiusAxisMap;if(u&&c){var s=A(u);return Ud({x:o,y:i},s)}return null}},{key:"parseEventsOfWrapper",value:function(){var e=this.props.children,t=this.getTooltipEventType(),n=oe(e,xt),r={};return n&&"axis"===t&&(r="click"===n.props.trigger?{onClick:this.handleClick}:{onMouseEnter:this.handleMouseEnter,onDoubleClick:this.handleDoubleClick,onMouseMove:this.handleMouseMove,onMouseLeave:this.handleMouseLeave,onTouchMove:this.handleTouchMove,onTouchStart:this.handleTouchStart,onTouchEnd:this.handleTouchEnd,onContextMenu:this.handleContextMenu}),cm(cm({},X(this.props,this.handleOuterEvent)),r)}},{key:"addListener",value:function(){Xy.on($y,this.handleReceiveSyncEvent)}},{key:"removeListener",value:function(){Xy.removeListener($y,this.handleReceiveSyncEvent)}},{key:"filterFormatItem",value:function(e,t,n){for(var r=this.state.formattedGraphicalItems,o=0,i=r.length;o<i;o++){var a=r[o];if(a.item===e||a.props.key===e.key||t===J(a.item.type)&&n===a.childIndex)return a}return null}},{key:"renderClipPath",value:function(){var e=this.clipPathId,n=this.state.offset,r=n.left,o=n.top,i=n.height,a=n.width;return t.createElement("defs",null,t.createElement("clipPath",{id:e},t.createElement("rect",{x:r,y:o,height:i,width:a})))}},{key:"getXScales",value:function(){var e=this.state.xAxisMap;return e?Object.entries(e).reduce(function(e,t){var n=Zv(t,2),r=n[0],o=n[1];return cm(cm({},e),{},sm({},r,o.scale))},{}):null}},{key:"getYScales",value:function(){var e=this.state.yAxisMap;return e?Object.entries(e).reduce(function(e,t){var n=Zv(t,2),r=n[0],o=n[1];return cm(cm({},e),{},sm({},r,o.scale))},{}):null}},{key:"getXScaleByAxisId",value:function(e){var t;return null===(t=this.state.xAxisMap)||void 0===t||null===(t=t[e])||void 0===t?void 0:t.scale}},{key:"getYScaleByAxisId",value:function(e){var t;return null===(t=this.state.yAxisMap)||void 0===t||null===(t=t[e])||void 0===t?void 0:t.scale}},{key:"getItemByXY",value:function(e){var t=this.state,n=t.formattedGraphicalItems,r=t.activeItem;if(n&&n.length)for(var o=0,i=n.length;o<i;o++){var a=n[o],l=a.props,u=a.item,c=void 0!==u.type.defaultProps?cm(cm({},u.type.defaultProps),u.props):u.props,s=J(u.type);if("Bar"===s){var f=(l.data||[]).find(function(t){return Lo(e,t)});if(f)return{graphicalItem:a,payload:f}}else if("RadialBar"===s){var d=(l.data||[]).find(function(t){return Ud(e,t)});if(d)return{graphicalItem:a,payload:d}}else if(Zp(a,r)||Jp(a,r)||eh(a,r)){var p=oh({graphicalItem:a,activeTooltipItem:r,itemData:c.data}),h=void 0===c.activeIndex?p:c.activeIndex;return{graphicalItem:cm(cm({},a),{},{childIndex:h}),payload:eh(a,r)?c.data[p]:a.props.data[p]}}}return null}},{key:"render",value:function(){var e=this;if(!ie(this))return null;var n,r,o=this.props,i=o.children,a=o.className,l=o.width,u=o.height,c=o.style,f=o.compact,d=o.title,p=o.desc,h=Jv(o,Gv),y=ue(h,!1);if(f)return t.createElement(sy,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},t.createElement(_e,Qv({},y,{width:l,height:u,title:d,desc:p}),this.renderClipPath(),fe(i,this.renderMap)));this.props.accessibilityLayer&&(y.tabIndex=null!==(n=this.props.tabIndex)&&void 0!==n?n:0,y.role=null!==(r=this.props.role)&&void 0!==r?r:"application",y.onKeyDown=function(t){e.accessibilityManager.keyboardEvent(t)},y.onFocus=function(){e.accessibilityManager.focus()});var v=this.parseEventsOfWrapper();return t.createElement(sy,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},t.createElement("div",Qv({className:s("recharts-wrapper",a),style:cm({position:"relative",cursor:"default",width:l,height:u},c)},v,{ref:function(t){e.container=t}}),t.createElement(_e,Qv({},y,{width:l,height:u,title:d,desc:p,style:pm}),this.renderClipPath(),fe(i,this.renderMap)),this.renderLegend(),this.renderTooltip()))}}],a&&em(o.prototype,a),u&&em(o,u),Object.defineProperty(o,"prototype",{writable:!1}),o;var o,a,u}(t.Component);sm(v,"displayName",n),sm(v,"defaultProps",cm({layout:"horizontal",stackOffset:"none",barCategoryGap:"10%",barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:"index"},p)),sm(v,"getDerivedStateFromProps",function(e,t){var n=e.dataKey,r=e.data,o=e.children,i=e.width,a=e.height,l=e.layout,u=e.stackOffset,c=e.margin,s=t.dataStartIndex,f=t.dataEndIndex;if(void 0===t.updateId){var d=Om(e);return cm(cm(cm({},d),{},{updateId:0},y(cm(cm({props:e},d),{},{updateId:0}),t)),{},{prevDataKey:n,prevData:r,prevWidth:i,prevHeight:a,prevLayout:l,prevStackOffset:u,prevMargin:c,prevChildren:o})}if(n!==t.prevDataKey||r!==t.prevData||i!==t.prevWidth||a!==t.prevHeight||l!==t.prevLayout||u!==t.prevStackOffset||!F(c,t.prevMargin)){var p=Om(e),h={chartX:t.chartX,chartY:t.chartY,isTooltipActive:t.isTooltipActive},v=cm(cm({},bm(t,r,l)),{},{updateId:t.updateId+1}),m=cm(cm(cm({},p),h),v);return cm(cm(cm({},m),y(cm({props:e},m),t)),{},{prevDataKey:n,prevData:r,prevWidth:i,prevHeight:a,prevLayout:l,prevStackOffset:u,prevMargin:c,prevChildren:o})}if(!ce(o,t.prevChildren)){var g,b,x,w,S=oe(o,Cd),j=S&&null!==(g=null===(b=S.props)||void 0===b?void 0:b.startIndex)&&void 0!==g?g:s,k=S&&null!==(x=null===(w=S.props)||void 0===w?void 0:w.endIndex)&&void 0!==x?x:f,P=j!==s||k!==f,E=!O()(r)&&!P?t.updateId:t.updateId+1;return cm(cm({updateId:E},y(cm(cm({props:e},t),{},{updateId:E,dataStartIndex:j,dataEndIndex:k}),t)),{},{prevChildren:o,dataStartIndex:j,dataEndIndex:k})}return null}),sm(v,"renderActiveDot",function(e,n,r){var o;return o=(0,t.isValidElement)(e)?(0,t.cloneElement)(e,n):z()(e)?e(n):t.createElement(Zn,n),t.createElement(Te,{className:"recharts-active-dot",key:r},o)});var m=(0,t.forwardRef)(function(e,n){return t.createElement(v,Qv({},e,{ref:n}))});return m.displayName=v.displayName,m}({chartName:"LineChart",GraphicalChild:Wm,axisComponents:[{axisType:"xAxis",AxisComp:Sg},{axisType:"yAxis",AxisComp:Dg}],formatAxisMap:function(t,n,r,o,i){var a=t.width,l=t.height,u=t.layout,c=t.children,s=Object.keys(n),f={left:r.left,leftMirror:r.left,right:a-r.right,rightMirror:a-r.right,top:r.top,topMirror:r.top,bottom:l-r.bottom,bottomMirror:l-r.bottom},d=!!oe(c,Mh);return s.reduce(function(a,l){var c,s,p,y,v,m=n[l],g=m.orientation,b=m.domain,x=m.padding,w=void 0===x?{}:x,O=m.mirror,S=m.reversed,j="".concat(g).concat(O?"Mirror":"");if("number"===m.type&&("gap"===m.padding||"no-gap"===m.padding)){var k=b[1]-b[0],P=1/0,E=m.categoricalDomain.sort(N);if(E.forEach(function(e,t){t>0&&(P=Math.min((e||0)-(E[t-1]||0),P))}),Number.isFinite(P)){var _=P/k,A="vertical"===m.layout?r.height:r.width;if("gap"===m.padding&&(c=_*A/2),"no-gap"===m.padding){var C=M(t.barCategoryGap,_*A),T=_*A/2;c=T-C-(T-C)/A*C}}}s="xAxis"===o?[r.left+(w.left||0)+(c||0),r.left+r.width-(w.right||0)-(c||0)]:"yAxis"===o?"horizontal"===u?[r.top+r.height-(w.bottom||0),r.top+(w.top||0)]:[r.top+(w.top||0)+(c||0),r.top+r.height-(w.bottom||0)-(c||0)]:m.range,S&&(s=[s[1],s[0]]);var D=function(t,n,r){var o=t.scale,i=t.type,a=t.layout,l=t.axisType;if("auto"===o)return"radial"===a&&"radiusAxis"===l?{scale:Ko(),realScaleType:"band"}:"radial"===a&&"angleAxis"===l?{scale:xl(),realScaleType:"linear"}:"category"===i&&n&&(n.indexOf("LineChart")>=0||n.indexOf("AreaChart")>=0||n.indexOf("ComposedChart")>=0&&!r)?{scale:Zo(),realScaleType:"point"}:"category"===i?{scale:Ko(),realScaleType:"band"}:{scale:xl(),realScaleType:"linear"};if(h()(o)){var u="scale".concat(Ot()(o));return{scale:(e[u]||Zo)(),realScaleType:e[u]?u:"point"}}return z()(o)?{scale:o}:{scale:Zo(),realScaleType:"point"}}(m,i,d),I=D.scale,R=D.realScaleType;I.domain(b).range(s),function(e){var t=e.domain();if(t&&!(t.length<=2)){var n=t.length,r=e.range(),o=Math.min(r[0],r[1])-nd,i=Math.max(r[0],r[1])+nd,a=e(t[0]),l=e(t[n-1]);(a<o||a>i||l<o||l>i)&&e.domain([t[0],t[n-1]])}}(I);var L=function(e,t){var n=t.realScaleType,r=t.type,o=t.tickCount,i=t.originalDomain,a=t.allowDecimals,l=n||t.scale;if("auto"!==l&&"linear"!==l)return null;if(o&&"number"===r&&i&&("auto"===i[0]||"auto"===i[1])){var u=e.domain();if(!u.length)return null;var c=bf(u,o,a);return e.domain([Fs()(c),Ls()(c)]),{niceTicks:c}}if(o&&"number"===r){var s=e.domain();return{niceTicks:xf(s,o,a)}}return null}(I,Nh(Nh({},m),{},{realScaleType:R}));"xAxis"===o?(v="top"===g&&!O||"bottom"===g&&O,p=r.left,y=f[j]-v*m.height):"yAxis"===o&&(v="left"===g&&!O||"right"===g&&O,p=f[j]-v*m.width,y=r.top);var B=Nh(Nh(Nh({},m),L),{},{realScaleType:R,x:p,y:y,scale:I,width:"xAxis"===o?r.width:m.width,height:"yAxis"===o?r.height:m.height});return B.bandSize=fd(B,L),m.hide||"xAxis"!==o?m.hide||(f[j]+=(v?-1:1)*B.width):f[j]+=(v?-1:1)*B.height,Nh(Nh({},a),{},Dh({},l,B))},{})}}),zg=["x1","y1","x2","y2","key"],Rg=["offset"];function Lg(e){return Lg="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},Lg(e)}function Bg(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable})),n.push.apply(n,r)}return n}function Fg(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Bg(Object(n),!0).forEach(function(t){Ug(e,t,n[t])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Bg(Object(n)).forEach(function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))})}return e}function Ug(e,t,n){return t=function(e){var t=function(e,t){if("object"!=Lg(e)||!e)return e;var n=e[Symbol.toPrimitive];if(void 0!==n){var r=n.call(e,t||"default");if("object"!=Lg(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===t?String:Number)(e)}(e,"string");return"symbol"==Lg(t)?t:t+""}(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Wg(){return Wg=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Wg.apply(this,arguments)}function Hg(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}var qg=function(e){var n=e.fill;if(!n||"none"===n)return null;var r=e.fillOpacity,o=e.x,i=e.y,a=e.width,l=e.height,u=e.ry;return t.createElement("rect",{x:o,y:i,ry:u,width:a,height:l,stroke:"none",fill:n,fillOpacity:r,className:"recharts-cartesian-grid-bg"})};function Vg(e,n){var r;if(t.isValidElement(e))r=t.cloneElement(e,n);else if(z()(e))r=e(n);else{var o=n.x1,i=n.y1,a=n.x2,l=n.y2,u=n.key,c=Hg(n,zg),s=ue(c,!1),f=(s.offset,Hg(s,Rg));r=t.createElement("line",Wg({},f,{x1:o,y1:i,x2:a,y2:l,fill:"none",key:u}))}return r}function Xg(e){var n=e.x,r=e.width,o=e.horizontal,i=void 0===o||o,a=e.horizontalPoints;if(!i||!a||!a.length)return null;var l=a.map(function(t,o){var a=Fg(Fg({},e),{},{x1:n,y1:t,x2:n+r,y2:t,key:"line-".concat(o),index:o});return Vg(i,a)});return t.createElement("g",{className:"recharts-cartesian-grid-horizontal"},l)}function $g(e){var n=e.y,r=e.height,o=e.vertical,i=void 0===o||o,a=e.verticalPoints;if(!i||!a||!a.length)return null;var l=a.map(function(t,o){var a=Fg(Fg({},e),{},{x1:t,y1:n,x2:t,y2:n+r,key:"line-".concat(o),index:o});return Vg(i,a)});return t.createElement("g",{className:"recharts-cartesian-grid-vertical"},l)}function Yg(e){var n=e.horizontalFill,r=e.fillOpacity,o=e.x,i=e.y,a=e.width,l=e.height,u=e.horizontalPoints,c=e.horizontal;if(!(void 0===c||c)||!n||!n.length)return null;var s=u.map(function(e){return Math.round(e+i-i)}).sort(function(e,t){return e-t});i!==s[0]&&s.unshift(0);var f=s.map(function(e,u){var c=!s[u+1]?i+l-e:s[u+1]-e;if(c<=0)return null;var f=u%n.length;return t.createElement("rect",{key:"react-".concat(u),y:e,x:o,height:c,width:a,stroke:"none",fill:n[f],fillOpacity:r,className:"recharts-cartesian-grid-bg"})});return t.createElement("g",{className:"recharts-cartesian-gridstripes-horizontal"},f)}function Gg(e){var n=e.vertical,r=void 0===n||n,o=e.verticalFill,i=e.fillOpacity,a=e.x,l=e.y,u=e.width,c=e.height,s=e.verticalPoints;if(!r||!o||!o.length)return null;var f=s.map(function(e){return Math.round(e+a-a)}).sort(function(e,t){return e-t});a!==f[0]&&f.unshift(0);var d=f.map(function(e,n){var r=!f[n+1]?a+u-e:f[n+1]-e;if(r<=0)return null;var s=n%o.length;return t.createElement("rect",{key:"react-".concat(n),x:e,y:l,width:r,height:c,stroke:"none",fill:o[s],fillOpacity:i,className:"recharts-cartesian-grid-bg"})});return t.createElement("g",{className:"recharts-cartesian-gridstripes-vertical"},d)}var Kg=function(e,t){var n=e.xAxis,r=e.width,o=e.height,i=e.offset;return Zf(Km(Fg(Fg(Fg({},dg.defaultProps),n),{},{ticks:Jf(n,!0),viewBox:{x:0,y:0,width:r,height:o}})),i.left,i.left+i.width,t)},Qg=function(e,t){var n=e.yAxis,r=e.width,o=e.height,i=e.offset;return Zf(Km(Fg(Fg(Fg({},dg.defaultProps),n),{},{ticks:Jf(n,!0),viewBox:{x:0,y:0,width:r,height:o}})),i.top,i.top+i.height,t)},Zg={horizontal:!0,vertical:!0,horizontalPoints:[],verticalPoints:[],stroke:"#ccc",fill:"none",verticalFill:[],horizontalFill:[]};function Jg(e){var n,r,o,i,a,l,u=py(),c=hy(),s=(0,t.useContext)(ay),f=Fg(Fg({},e),{},{stroke:null!==(n=e.stroke)&&void 0!==n?n:Zg.stroke,fill:null!==(r=e.fill)&&void 0!==r?r:Zg.fill,horizontal:null!==(o=e.horizontal)&&void 0!==o?o:Zg.horizontal,horizontalFill:null!==(i=e.horizontalFill)&&void 0!==i?i:Zg.horizontalFill,vertical:null!==(a=e.vertical)&&void 0!==a?a:Zg.vertical,verticalFill:null!==(l=e.verticalFill)&&void 0!==l?l:Zg.verticalFill,x:k(e.x)?e.x:s.left,y:k(e.y)?e.y:s.top,width:k(e.width)?e.width:s.width,height:k(e.height)?e.height:s.height}),d=f.x,p=f.y,h=f.width,y=f.height,v=f.syncWithTicks,m=f.horizontalValues,g=f.verticalValues,b=function(){var e=(0,t.useContext)(ry);return A(e)}(),x=function(){var e=(0,t.useContext)(oy);return ey()(e,function(e){return op()(e.domain,Number.isFinite)})||A(e)}();if(!k(h)||h<=0||!k(y)||y<=0||!k(d)||d!==+d||!k(p)||p!==+p)return null;var w=f.verticalCoordinatesGenerator||Kg,O=f.horizontalCoordinatesGenerator||Qg,S=f.horizontalPoints,j=f.verticalPoints;if((!S||!S.length)&&z()(O)){var P=m&&m.length,E=O({yAxis:x?Fg(Fg({},x),{},{ticks:P?m:x.ticks}):void 0,width:u,height:c,offset:s},!!P||v);D(Array.isArray(E),"horizontalCoordinatesGenerator should return Array but instead it returned [".concat(Lg(E),"]")),Array.isArray(E)&&(S=E)}if((!j||!j.length)&&z()(w)){var _=g&&g.length,M=w({xAxis:b?Fg(Fg({},b),{},{ticks:_?g:b.ticks}):void 0,width:u,height:c,offset:s},!!_||v);D(Array.isArray(M),"verticalCoordinatesGenerator should return Array but instead it returned [".concat(Lg(M),"]")),Array.isArray(M)&&(j=M)}return t.createElement("g",{className:"recharts-cartesian-grid"},t.createElement(qg,{fill:f.fill,fillOpacity:f.fillOpacity,x:f.x,y:f.y,width:f.width,height:f.height,ry:f.ry}),t.createElement(Xg,Wg({},f,{offset:s,horizontalPoints:S,xAxis:b,yAxis:x})),t.createElement($g,Wg({},f,{offset:s,verticalPoints:j,xAxis:b,yAxis:x})),t.createElement(Yg,Wg({},f,{horizontalPoints:S})),t.createElement(Gg,Wg({},f,{verticalPoints:j})))}function eb(e,t){if(null==e)return{};var n,r,o=function(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n}(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(r=0;r<i.length;r++)n=i[r],-1===t.indexOf(n)&&{}.propertyIsEnumerable.call(e,n)&&(o[n]=e[n])}return o}Jg.displayName="CartesianGrid";var tb={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const nb=["color","size","strokeWidth","absoluteStrokeWidth","children"],rb=e=>e.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase();var ob=(e,n)=>{const r=(0,t.forwardRef)((r,o)=>{let{color:i="currentColor",size:a=24,strokeWidth:l=2,absoluteStrokeWidth:c,children:s}=r,f=eb(r,nb);return(0,t.createElement)("svg",u(u({ref:o},tb),{},{width:a,height:a,stroke:i,strokeWidth:c?24*Number(l)/Number(a):l,className:"lucide lucide-".concat(rb(e))},f),[...n.map(e=>{let[n,r]=e;return(0,t.createElement)(n,r)}),...(Array.isArray(s)?s:[s])||[]])});return r.displayName="".concat(e),r};const ib=ob("Activity",[["path",{d:"M22 12h-4l-3 9L9 3l-3 9H2",key:"d5dnw9"}]]),ab=ob("Server",[["rect",{width:"20",height:"8",x:"2",y:"2",rx:"2",ry:"2",key:"ngkwjq"}],["rect",{width:"20",height:"8",x:"2",y:"14",rx:"2",ry:"2",key:"iecqi9"}],["line",{x1:"6",x2:"6.01",y1:"6",y2:"6",key:"16zg32"}],["line",{x1:"6",x2:"6.01",y1:"18",y2:"18",key:"nzw8ys"}]]),lb=ob("Timer",[["line",{x1:"10",x2:"14",y1:"2",y2:"2",key:"14vaq8"}],["line",{x1:"12",x2:"15",y1:"14",y2:"11",key:"17fdiu"}],["circle",{cx:"12",cy:"14",r:"8",key:"1e1u0o"}]]),ub=ob("Gauge",[["path",{d:"m12 14 4-4",key:"9kzdfg"}],["path",{d:"M3.34 19a10 10 0 1 1 17.32 0",key:"19p75a"}]]),cb=ob("BarChart3",[["path",{d:"M3 3v18h18",key:"1s2lah"}],["path",{d:"M18 17V9",key:"2bz60n"}],["path",{d:"M13 17V5",key:"1frdt8"}],["path",{d:"M8 17v-3",key:"17ska0"}]]),sb=ob("Battery",[["rect",{width:"16",height:"10",x:"2",y:"7",rx:"2",ry:"2",key:"1w10f2"}],["line",{x1:"22",x2:"22",y1:"11",y2:"13",key:"4dh1rd"}]]),fb=ob("Wifi",[["path",{d:"M5 13a10 10 0 0 1 14 0",key:"6v8j51"}],["path",{d:"M8.5 16.5a5 5 0 0 1 7 0",key:"sej527"}],["path",{d:"M2 8.82a15 15 0 0 1 20 0",key:"dnpr2z"}],["line",{x1:"12",x2:"12.01",y1:"20",y2:"20",key:"of4bc4"}]]),db=ob("LayoutGrid",[["rect",{width:"7",height:"7",x:"3",y:"3",rx:"1",key:"1g98yp"}],["rect",{width:"7",height:"7",x:"14",y:"3",rx:"1",key:"6d4xhi"}],["rect",{width:"7",height:"7",x:"14",y:"14",rx:"1",key:"nxv5o0"}],["rect",{width:"7",height:"7",x:"3",y:"14",rx:"1",key:"1bb6yr"}]]),pb=ob("MapPin",[["path",{d:"M20 10c0 6-8 12-8 12s-8-6-8-12a8 8 0 0 1 16 0Z",key:"2oe9fu"}],["circle",{cx:"12",cy:"10",r:"3",key:"ilqhr7"}]]),hb=ob("TrendingUp",[["polyline",{points:"22 7 13.5 15.5 8.5 10.5 2 17",key:"126l90"}],["polyline",{points:"16 7 22 7 22 13",key:"kwv8wd"}]]),yb=ob("ZoomOut",[["circle",{cx:"11",cy:"11",r:"8",key:"4ej97u"}],["line",{x1:"21",x2:"16.65",y1:"21",y2:"16.65",key:"13gj7c"}],["line",{x1:"8",x2:"14",y1:"11",y2:"11",key:"durymu"}]]),vb=ob("ZoomIn",[["circle",{cx:"11",cy:"11",r:"8",key:"4ej97u"}],["line",{x1:"21",x2:"16.65",y1:"21",y2:"16.65",key:"13gj7c"}],["line",{x1:"11",x2:"11",y1:"8",y2:"14",key:"1vmskp"}],["line",{x1:"8",x2:"14",y1:"11",y2:"11",key:"durymu"}]]),mb=ob("WifiOff",[["line",{x1:"2",x2:"22",y1:"2",y2:"22",key:"a6p6uj"}],["path",{d:"M8.5 16.5a5 5 0 0 1 7 0",key:"sej527"}],["path",{d:"M2 8.82a15 15 0 0 1 4.17-2.65",key:"11utq1"}],["path",{d:"M10.66 5c4.01-.36 8.14.9 11.34 3.76",key:"hxefdu"}],["path",{d:"M16.85 11.25a10 10 0 0 1 2.22 1.68",key:"q734kn"}],["path",{d:"M5 13a10 10 0 0 1 5.24-2.76",key:"piq4yl"}],["line",{x1:"12",x2:"12.01",y1:"20",y2:"20",key:"of4bc4"}]]),gb=ob("GripVertical",[["circle",{cx:"9",cy:"12",r:"1",key:"1vctgf"}],["circle",{cx:"9",cy:"5",r:"1",key:"hp0tcf"}],["circle",{cx:"9",cy:"19",r:"1",key:"fkjjf6"}],["circle",{cx:"15",cy:"12",r:"1",key:"1tmaij"}],["circle",{cx:"15",cy:"5",r:"1",key:"19l28e"}],["circle",{cx:"15",cy:"19",r:"1",key:"f4zoj3"}]]),bb=ob("Trash2",[["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M19 6v14c0 1-1 2-2 2H7c-1 0-2-1-2-2V6",key:"4alrt4"}],["path",{d:"M8 6V4c0-1 1-2 2-2h4c1 0 2 1 2 2v2",key:"v07s0e"}],["line",{x1:"10",x2:"10",y1:"11",y2:"17",key:"1uufr5"}],["line",{x1:"14",x2:"14",y1:"11",y2:"17",key:"xtxkd"}]]);function xb(e){const{margin:t,containerPadding:n,containerWidth:r,cols:o}=e;return(r-t[0]*(o-1)-2*n[0])/o}function wb(e,t,n){return Number.isFinite(e)?Math.round(t*e+Math.max(0,e-1)*n):e}function Ob(e,t,n,r,o,i,a){const{margin:l,containerPadding:u,rowHeight:c}=e,s=xb(e);let f,d,p,h;if(a?(f=Math.round(a.width),d=Math.round(a.height)):(f=wb(r,s,l[0]),d=wb(o,c,l[1])),i?(p=Math.round(i.top),h=Math.round(i.left)):a?(p=Math.round(a.top),h=Math.round(a.left)):(p=Math.round((c+l[1])*n+u[1]),h=Math.round((s+l[0])*t+u[0])),!i&&!a){if(Number.isFinite(r)){const e=Math.round((s+l[0])*(t+r)+u[0])-h-f;e!==l[0]&&(f+=e-l[0])}if(Number.isFinite(o)){const e=Math.round((c+l[1])*(n+o)+u[1])-p-d;e!==l[1]&&(d+=e-l[1])}}return{top:p,left:h,width:f,height:d}}function Sb(e,t,n){const{margin:r,containerPadding:o,rowHeight:i}=e,a=xb(e);return{x:Math.round((n-o[0])/(a+r[0])),y:Math.round((t-o[1])/(i+r[1]))}}function jb(e,t,n){return Math.max(Math.min(e,n),t)}function kb(e,t){return e.i!==t.i&&(!(e.x+e.w<=t.x)&&(!(e.x>=t.x+t.w)&&(!(e.y+e.h<=t.y)&&!(e.y>=t.y+t.h))))}function Pb(e,t){for(let n=0;n<e.length;n++){const r=e[n];if(void 0!==r&&kb(r,t))return r}}function Eb(e,t){return e.filter(e=>kb(e,t))}function _b(e,t){return"horizontal"===t?Ab(e):"vertical"===t||"wrap"===t?Mb(e):[...e]}function Mb(e){return[...e].sort((e,t)=>e.y!==t.y?e.y-t.y:e.x-t.x)}function Ab(e){return[...e].sort((e,t)=>e.x!==t.x?e.x-t.x:e.y-t.y)}function Cb(e){let t=0;for(let n=0;n<e.length;n++){const r=e[n];if(void 0!==r){const e=r.y+r.h;e>t&&(t=e)}}return t}function Tb(e,t){for(let n=0;n<e.length;n++){const r=e[n];if(void 0!==r&&r.i===t)return r}}function Nb(e){return e.filter(e=>!0===e.static)}function Db(e){return{i:e.i,x:e.x,y:e.y,w:e.w,h:e.h,minW:e.minW,maxW:e.maxW,minH:e.minH,maxH:e.maxH,moved:Boolean(e.moved),static:Boolean(e.static),isDraggable:e.isDraggable,isResizable:e.isResizable,resizeHandles:e.resizeHandles,constraints:e.constraints,isBounded:e.isBounded}}function Ib(e){const t=new Array(e.length);for(let n=0;n<e.length;n++){const r=e[n];void 0!==r&&(t[n]=Db(r))}return t}function zb(e,t,n){let r=Tb(e,t);if(!r)return[[...e],null];r=n(Db(r));const o=function(e,t){const n=new Array(e.length);for(let r=0;r<e.length;r++){const o=e[r];void 0!==o&&(t.i===o.i?n[r]=t:n[r]=o)}return n}(e,r);return[o,r]}function Rb(e,t,n,r,o,i,a,l,u){if(t.static&&!0!==t.isDraggable)return[...e];if(t.y===r&&t.x===n)return[...e];const c=t.x,s=t.y;"number"===typeof n&&(t.x=n),"number"===typeof r&&(t.y=r),t.moved=!0;let f=_b(e,a);("vertical"===a&&"number"===typeof r?s>=r:"horizontal"===a&&"number"===typeof n&&c>=n)&&(f=f.reverse());const d=Eb(f,t),p=d.length>0;if(p&&u)return Ib(e);if(p&&i)return t.x=c,t.y=s,t.moved=!1,e;let h=[...e];for(let y=0;y<d.length;y++){const e=d[y];void 0!==e&&(e.moved||(h=e.static?Lb(h,e,t,o,a):Lb(h,t,e,o,a)))}return h}function Lb(e,t,n,r,o,i){const a="horizontal"===o,l="vertical"===o,u=t.static;if(r){r=!1;const i={x:a?Math.max(t.x-n.w,0):n.x,y:l?Math.max(t.y-n.h,0):n.y,w:n.w,h:n.h,i:"-1"},c=Pb(e,i),s=void 0!==c&&c.y+c.h>t.y,f=void 0!==c&&t.x+t.w>c.x;if(!c)return Rb(e,n,a?i.x:void 0,l?i.y:void 0,r,u,o);if(s&&l)return Rb(e,n,void 0,n.y+1,r,u,o);if(s&&null===o)return t.y=n.y,n.y=n.y+n.h,[...e];if(f&&a)return Rb(e,t,n.x,void 0,r,u,o)}const c=a?n.x+1:void 0,s=l?n.y+1:void 0;return void 0===c&&void 0===s?[...e]:Rb(e,n,c,s,r,u,o)}function Bb(e,t,n){return Math.max(t,Math.min(n,e))}var Fb=[{name:"gridBounds",constrainPosition(e,t,n,r){let{cols:o,maxRows:i}=r;return{x:Bb(t,0,Math.max(0,o-e.w)),y:Bb(n,0,Math.max(0,i-e.h))}},constrainSize(e,t,n,r,o){let{cols:i,maxRows:a}=o;const l="w"===r||"nw"===r||"sw"===r?e.x+e.w:i-e.x,u="n"===r||"nw"===r||"ne"===r?e.y+e.h:a-e.y;return{w:Bb(t,1,Math.max(1,l)),h:Bb(n,1,Math.max(1,u))}}},{name:"minMaxSize",constrainSize(e,t,n){var r,o,i,a;return{w:Bb(t,null!==(r=e.minW)&&void 0!==r?r:1,null!==(o=e.maxW)&&void 0!==o?o:1/0),h:Bb(n,null!==(i=e.minH)&&void 0!==i?i:1,null!==(a=e.maxH)&&void 0!==a?a:1/0)}}}];function Ub(e,t,n,r,o){let i={x:n,y:r};for(const a of e)a.constrainPosition&&(i=a.constrainPosition(t,i.x,i.y,o));if(t.constraints)for(const a of t.constraints)a.constrainPosition&&(i=a.constrainPosition(t,i.x,i.y,o));return i}function Wb(e){let{top:t,left:n,width:r,height:o}=e;const i="translate(".concat(n,"px,").concat(t,"px)");return{transform:i,WebkitTransform:i,MozTransform:i,msTransform:i,OTransform:i,width:"".concat(r,"px"),height:"".concat(o,"px"),position:"absolute"}}function Hb(e){let{top:t,left:n,width:r,height:o}=e;return{top:"".concat(t,"px"),left:"".concat(n,"px"),width:"".concat(r,"px"),height:"".concat(o,"px"),position:"absolute"}}function qb(e){return 100*e+"%"}function Vb(e,t,n,r){return e+n>r?t:n}function Xb(e,t,n){return e<0?t:n}function $b(e){return Math.max(0,e)}function Yb(e){return Math.max(0,e)}var Gb=(e,t,n)=>{const{left:r,height:o,width:i}=t,a=e.top-(o-e.height);return{left:r,width:i,height:Xb(a,e.height,o),top:Yb(a)}},Kb=(e,t,n)=>{const{top:r,left:o,height:i,width:a}=t;return{top:r,height:i,width:Vb(e.left,e.width,a,n),left:$b(o)}},Qb=(e,t,n)=>{const{top:r,height:o,width:i}=t,a=e.left+e.width-i;return a<0?{height:o,width:e.left+e.width,top:Yb(r),left:0}:{height:o,width:i,top:Yb(r),left:a}},Zb=(e,t,n)=>{const{top:r,left:o,height:i,width:a}=t;return{width:a,left:o,height:Xb(r,e.height,i),top:Yb(r)}},Jb={n:Gb,ne:(e,t,n)=>Gb(e,Kb(e,t,n)),e:Kb,se:(e,t,n)=>Zb(e,Kb(e,t,n)),s:Zb,sw:(e,t,n)=>Zb(e,Qb(e,t)),w:Qb,nw:(e,t,n)=>Gb(e,Qb(e,t))};var ex={type:"transform",scale:1,calcStyle:e=>Wb(e),calcDragPosition:(e,t,n,r)=>({left:e-n,top:t-r})},tx={cols:12,rowHeight:150,margin:[10,10],containerPadding:null,maxRows:1/0},nx={enabled:!0,bounded:!1,threshold:3},rx={enabled:!0,handles:["se"]},ox={enabled:!1,defaultItem:{w:1,h:1}};function ix(e){return e.filter(e=>e.static)}var ax={x:"w",y:"h"};function lx(e,t,n,r,o){const i=ax[r];t[r]+=1;const a=e.findIndex(e=>e.i===t.i),l=null!==o&&void 0!==o?o:ix(e).length>0;for(let u=a+1;u<e.length;u++){const o=e[u];if(void 0!==o&&!o.static){if(!l&&o.y>t.y+t.h)break;kb(t,o)&&lx(e,o,n+t[i],r,l)}}t[r]=n}function ux(e,t,n,r,o,i,a){const l="horizontal"===n;if("vertical"===n)for(t.y="number"===typeof a?Math.min(a,t.y):Math.min(Cb(e),t.y);t.y>0&&!Pb(e,t);)t.y--;else if(l)for(;t.x>0&&!Pb(e,t);)t.x--;let u;for(;void 0!==(u=Pb(e,t))&&(null!==n||!i);)if(l?lx(o,t,u.x+u.w,"x"):lx(o,t,u.y+u.h,"y"),l&&t.x+t.w>r)for(t.x=r-t.w,t.y++;t.x>0&&!Pb(e,t);)t.x--;return t.y=Math.max(t.y,0),t.x=Math.max(t.x,0),t}function cx(e,t,n,r){const o=ix(e);let i=Cb(o);const a=_b(e,t),l=new Array(e.length);for(let u=0;u<a.length;u++){const c=a[u];if(void 0===c)continue;let s=Db(c);s.static||(s=ux(o,s,t,n,a,r,i),i=Math.max(i,s.y+s.h),o.push(s));l[e.indexOf(c)]=s,s.moved=!1}return l}function sx(e,t,n,r,o){const i="x"===r?"w":"h";t[r]+=1;const a=e.findIndex(e=>e.i===t.i),l=null!==o&&void 0!==o?o:Nb(e).length>0;for(let u=a+1;u<e.length;u++){const o=e[u];if(void 0!==o&&!o.static){if(!l&&o.y>t.y+t.h)break;kb(t,o)&&sx(e,o,n+t[i],r,l)}}t[r]=n}function fx(e,t,n,r){for(t.y=Math.min(r,t.y);t.y>0&&!Pb(e,t);)t.y--;let o;for(;void 0!==(o=Pb(e,t));)sx(n,t,o.y+o.h,"y");return t.y=Math.max(t.y,0),t}function dx(e,t,n,r){for(;t.x>0&&!Pb(e,t);)t.x--;let o;for(;void 0!==(o=Pb(e,t));)if(sx(r,t,o.x+o.w,"x"),t.x+t.w>n)for(t.x=n-t.w,t.y++;t.x>0&&!Pb(e,t);)t.x--;return t.x=Math.max(t.x,0),t}var px={type:"vertical",allowOverlap:!1,compact(e,t){const n=Nb(e);let r=Cb(n);const o=Mb(e),i=new Array(e.length);for(let a=0;a<o.length;a++){const t=o[a];if(void 0===t)continue;let l=Db(t);l.static||(l=fx(n,l,o,r),r=Math.max(r,l.y+l.h),n.push(l));i[e.indexOf(t)]=l,l.moved=!1}return i},onMove(e,t,n,r,o){const i=Ib(e),a=i.find(e=>e.i===t.i);return a&&(a.x=n,a.y=r,a.moved=!0),i}},hx={type:"horizontal",allowOverlap:!1,compact(e,t){const n=Nb(e),r=Ab(e),o=new Array(e.length);for(let i=0;i<r.length;i++){const a=r[i];if(void 0===a)continue;let l=Db(a);l.static||(l=dx(n,l,t,r),n.push(l));o[e.indexOf(a)]=l,l.moved=!1}return o},onMove(e,t,n,r,o){const i=Ib(e),a=i.find(e=>e.i===t.i);return a&&(a.x=n,a.y=r,a.moved=!0),i}},yx={type:null,allowOverlap:!1,compact:(e,t)=>Ib(e),onMove(e,t,n,r,o){const i=Ib(e),a=i.find(e=>e.i===t.i);return a&&(a.x=n,a.y=r,a.moved=!0),i}},vx=u(u({},px),{},{allowOverlap:!0,compact:(e,t)=>Ib(e)}),mx=u(u({},hx),{},{allowOverlap:!0,compact:(e,t)=>Ib(e)});var gx=n(1929),bx=n(5003),xx=n(579),wx=n(7790);const Ox=["dragOffsetX","dragOffsetY"];function Sx(e){const{children:n,cols:r,containerWidth:o,margin:i,containerPadding:a,rowHeight:l,maxRows:c,isDraggable:f,isResizable:d,isBounded:p,static:h,useCSSTransforms:y=!0,usePercentages:v=!1,transformScale:m=1,droppingPosition:g,className:b="",style:x,handle:w="",cancel:O="",x:S,y:j,w:k,h:P,minW:E=1,maxW:_=1/0,minH:M=1,maxH:A=1/0,i:C,resizeHandles:T,resizeHandle:N,constraints:D=Fb,layoutItem:I,layout:z=[],onDragStart:R,onDrag:L,onDragStop:B,onResizeStart:F,onResize:U,onResizeStop:W}=e,[H,q]=(0,t.useState)(!1),[V,X]=(0,t.useState)(!1),$=(0,t.useRef)(null),Y=(0,t.useRef)({left:0,top:0}),G=(0,t.useRef)({top:0,left:0,width:0,height:0}),K=(0,t.useRef)(void 0),Q=(0,t.useMemo)(()=>({cols:r,containerPadding:a,containerWidth:o,margin:i,maxRows:c,rowHeight:l}),[r,a,o,i,c,l]),Z=(0,t.useMemo)(()=>({cols:r,maxRows:c,containerWidth:o,containerHeight:0,rowHeight:l,margin:i,layout:z}),[r,c,o,l,i,z]),J=(0,t.useMemo)(()=>null!==I&&void 0!==I?I:{i:C,x:S,y:j,w:k,h:P,minW:E,maxW:_,minH:M,maxH:A},[I,C,S,j,k,P,E,_,M,A]),ee=(0,t.useCallback)(e=>{if(y)return Wb(e);const t=Hb(e);return v?u(u({},t),{},{left:qb(e.left/o),width:qb(e.width/o)}):t},[y,v,o]),te=(0,t.useCallback)((e,t)=>{let{node:n}=t;if(!R)return;const{offsetParent:r}=n;if(!r)return;const o=r.getBoundingClientRect(),i=n.getBoundingClientRect(),a=i.left/m,l=o.left/m,u=i.top/m,c=o.top/m,s={left:a-l+r.scrollLeft,top:u-c+r.scrollTop};Y.current=s,q(!0);const f=Sb(Q,s.top,s.left),{x:d,y:p}=Ub(D,J,f.x,f.y,Z);R(C,d,p,{e:e,node:n,newPosition:s})},[R,m,Q,D,J,Z,C]),ne=(0,t.useCallback)((e,t)=>{let{node:n,deltaX:r,deltaY:a}=t;if(!L||!H)return;let u=Y.current.top+a,c=Y.current.left+r;if(p){const{offsetParent:e}=n;if(e){u=jb(u,0,e.clientHeight-wb(P,l,i[1]));const t=xb(Q);c=jb(c,0,o-wb(k,t,i[0]))}}const s={top:u,left:c};Y.current=s;const f=Sb(Q,u,c),{x:d,y:h}=Ub(D,J,f.x,f.y,Z);L(C,d,h,{e:e,node:n,newPosition:s})},[L,H,p,P,l,i,Q,o,k,C,D,J,Z]),re=(0,t.useCallback)((e,t)=>{let{node:n}=t;if(!B||!H)return;const{left:r,top:o}=Y.current,i={top:o,left:r};q(!1),Y.current={left:0,top:0};const a=Sb(Q,o,r),{x:l,y:u}=Ub(D,J,a.x,a.y,Z);B(C,l,u,{e:e,node:n,newPosition:i})},[B,H,Q,D,J,Z,C]),oe=(0,t.useCallback)((e,t,n,r)=>{let{node:i,size:a,handle:l}=t;const c="onResizeStart"===r?F:"onResize"===r?U:W;if(!c)return;let s;s=i?function(e,t,n,r){const o=Jb[e];return o?o(t,u(u({},t),n),r):n}(l,n,a,o):u(u({},a),{},{top:n.top,left:n.left}),G.current=s;const f=function(e,t,n){const{margin:r,rowHeight:o}=e,i=xb(e);return{w:Math.max(1,Math.round((t+r[0])/(i+r[0]))),h:Math.max(1,Math.round((n+r[1])/(o+r[1])))}}(Q,s.width,s.height),{w:d,h:p}=function(e,t,n,r,o,i){let a={w:n,h:r};for(const l of e)l.constrainSize&&(a=l.constrainSize(t,a.w,a.h,o,i));if(t.constraints)for(const l of t.constraints)l.constrainSize&&(a=l.constrainSize(t,a.w,a.h,o,i));return a}(D,J,f.w,f.h,l,Z);c(C,d,p,{e:e.nativeEvent,node:i,size:s,handle:l})},[F,U,W,o,Q,S,j,C,D,J,Z]),ie=(0,t.useCallback)((e,t)=>{X(!0);const n=Ob(Q,S,j,k,P),r=u(u({},t),{},{handle:t.handle});oe(e,r,n,"onResizeStart")},[oe,Q,S,j,k,P]),ae=(0,t.useCallback)((e,t)=>{const n=Ob(Q,S,j,k,P),r=u(u({},t),{},{handle:t.handle});oe(e,r,n,"onResize")},[oe,Q,S,j,k,P]),le=(0,t.useCallback)((e,t)=>{X(!1),G.current={top:0,left:0,width:0,height:0};const n=Ob(Q,S,j,k,P),r=u(u({},t),{},{handle:t.handle});oe(e,r,n,"onResizeStop")},[oe,Q,S,j,k,P]);(0,t.useEffect)(()=>{if(!g)return;const e=$.current;if(!e)return;const t=K.current||{left:0,top:0},n=H&&(g.left!==t.left||g.top!==t.top);if(H){if(n){const t={node:e,deltaX:g.left-Y.current.left,deltaY:g.top-Y.current.top,lastX:Y.current.left,lastY:Y.current.top,x:g.left,y:g.top};ne(g.e,t)}}else{const t={node:e,deltaX:g.left,deltaY:g.top,lastX:0,lastY:0,x:g.left,y:g.top};te(g.e,t)}K.current=g},[g,H,te,ne]);const ue=Ob(Q,S,j,k,P,H?Y.current:null,V?G.current:null),ce=t.Children.only(n),se=Ob(Q,0,0,1,1),fe=[se.width,se.height],de=[1/0,1/0],pe=ce.props,he=pe.className,ye=pe.style;let ve=t.cloneElement(ce,{ref:$,className:s("react-grid-item",he,b,{static:h,resizing:V,"react-draggable":f,"react-draggable-dragging":H,dropping:Boolean(g),cssTransforms:y}),style:u(u(u({},x),ye),ee(ue))});const me=N;return ve=(0,xx.jsx)(bx.Resizable,{draggableOpts:{disabled:!d},className:d?void 0:"react-resizable-hide",width:ue.width,height:ue.height,minConstraints:fe,maxConstraints:de,onResizeStart:ie,onResize:ae,onResizeStop:le,transformScale:m,resizeHandles:T,handle:me,children:ve}),ve=(0,xx.jsx)(gx.DraggableCore,{disabled:!f,onStart:te,onDrag:ne,onStop:re,handle:w,cancel:".react-resizable-handle"+(O?","+O:""),scale:m,nodeRef:$,children:ve}),ve}var jx=()=>{},kx="react-grid-layout",Px=!1;try{Px=/firefox/i.test(navigator.userAgent)}catch(Vx){}function Ex(e,n,r,o,i){const a=[],l=new Set;t.Children.forEach(n,n=>{if(!t.isValidElement(n)||null===n.key)return;const r=String(n.key);l.add(r);const o=e.find(e=>e.i===r);if(o)a.push(Db(o));else{const e=n.props["data-grid"];var i,u,c,s;if(e)a.push({i:r,x:null!==(i=e.x)&&void 0!==i?i:0,y:null!==(u=e.y)&&void 0!==u?u:0,w:null!==(c=e.w)&&void 0!==c?c:1,h:null!==(s=e.h)&&void 0!==s?s:1,minW:e.minW,maxW:e.maxW,minH:e.minH,maxH:e.maxH,static:e.static,isDraggable:e.isDraggable,isResizable:e.isResizable,resizeHandles:e.resizeHandles,isBounded:e.isBounded});else a.push({i:r,x:0,y:Cb(a),w:1,h:1})}});const u=function(e,t){const n=Nb(e);for(let r=0;r<e.length;r++){const o=e[r];if(void 0!==o)if(o.x+o.w>t.cols&&(o.x=t.cols-o.w),o.x<0&&(o.x=0,o.w=t.cols),o.static)for(;Pb(n,o);)o.y++;else n.push(o)}return e}(a,{cols:r});return cx(u,o,r,i)}function _x(e){var n;const{children:r,width:o,gridConfig:i,dragConfig:a,resizeConfig:l,dropConfig:c,positionStrategy:f=ex,compactor:d,constraints:p=Fb,layout:h=[],droppingItem:y,autoSize:v=!0,className:m="",style:g={},innerRef:b,onLayoutChange:x=jx,onDragStart:w=jx,onDrag:O=jx,onDragStop:S=jx,onResizeStart:j=jx,onResize:k=jx,onResizeStop:P=jx,onDrop:E=jx,onDropDragOver:_=jx}=e,M=(0,t.useMemo)(()=>u(u({},tx),i),[i]),A=(0,t.useMemo)(()=>u(u({},nx),a),[a]),C=(0,t.useMemo)(()=>u(u({},rx),l),[l]),T=(0,t.useMemo)(()=>u(u({},ox),c),[c]),{cols:N,rowHeight:D,maxRows:I,margin:z,containerPadding:R}=M,{enabled:L,bounded:B,handle:F,cancel:U}=A,{enabled:W,handles:H,handleComponent:q}=C,{enabled:V,defaultItem:X}=T,$=null!==d&&void 0!==d?d:function(e){let t,n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];return t=arguments.length>1&&void 0!==arguments[1]&&arguments[1]?"vertical"===e?vx:"horizontal"===e?mx:yx:"vertical"===e?px:"horizontal"===e?hx:yx,n?u(u({},t),{},{preventCollision:n}):t}("vertical"),Y=$.type,G=$.allowOverlap,K=null!==(n=$.preventCollision)&&void 0!==n&&n,Q=(0,t.useMemo)(()=>null!==y&&void 0!==y?y:u({i:"__dropping-elem__"},X),[y,X]),Z="transform"===f.type,J=f.scale,ee=null!==R&&void 0!==R?R:z,[te,ne]=(0,t.useState)(!1),[re,oe]=(0,t.useState)(()=>Ex(h,r,N,Y,G)),[ie,ae]=(0,t.useState)(null),[le,ue]=(0,t.useState)(!1),[ce,se]=(0,t.useState)(null),[fe,de]=(0,t.useState)(),pe=(0,t.useRef)(null),he=(0,t.useRef)(null),ye=(0,t.useRef)(null),ve=(0,t.useRef)(0),me=(0,t.useRef)(re),ge=(0,t.useRef)(h),be=(0,t.useRef)(r),xe=(0,t.useRef)(Y);(0,t.useEffect)(()=>{ne(!0),(0,wx.deepEqual)(re,h)||x(re)},[]),(0,t.useEffect)(()=>{if(ie)return;const e=!(0,wx.deepEqual)(h,ge.current),n=!function(e,n){const r=t.Children.toArray(e),o=t.Children.toArray(n);if(r.length!==o.length)return!1;for(let t=0;t<r.length;t++){const e=r[t],n=o[t];if((null===e||void 0===e?void 0:e.key)!==(null===n||void 0===n?void 0:n.key))return!1}return!0}(r,be.current),o=Y!==xe.current;if(e||n||o){const t=Ex(e?h:re,r,N,Y,G);oe(t)}ge.current=h,be.current=r,xe.current=Y},[h,r,N,Y,G,ie,re]),(0,t.useEffect)(()=>{ie||(0,wx.deepEqual)(re,me.current)||(me.current=re,x(re))},[re,ie,x]);const we=(0,t.useMemo)(()=>{if(!v)return;const e=Cb(re),t=ee[1];return e*D+(e-1)*z[1]+2*t+"px"},[v,re,D,z,ee]),Oe=(0,t.useCallback)((e,t,n,r)=>{const o=Tb(re,e);if(!o)return;const i={w:o.w,h:o.h,x:o.x,y:o.y,i:e};pe.current=Db(o),ye.current=re,ae(i),w(re,o,o,null,r.e,r.node)},[re,w]),Se=(0,t.useCallback)((e,t,n,r)=>{const o=pe.current,i=Tb(re,e);if(!i)return;const a={w:i.w,h:i.h,x:i.x,y:i.y,i:e},l=Rb(re,i,t,n,!0,K,Y,0,G);O(l,o,i,a,r.e,r.node),oe(G?l:cx(l,Y,N)),ae(a)},[re,K,Y,N,G,O]),je=(0,t.useCallback)((e,t,n,r)=>{if(!ie)return;const o=pe.current,i=Tb(re,e);if(!i)return;const a=Rb(re,i,t,n,!0,K,Y,0,G),l=G?a:cx(a,Y,N);S(l,o,i,null,r.e,r.node);const u=ye.current;pe.current=null,ye.current=null,ae(null),oe(l),u&&!(0,wx.deepEqual)(u,l)&&x(l)},[ie,re,K,Y,N,G,S,x]),ke=(0,t.useCallback)((e,t,n,r)=>{const o=Tb(re,e);o&&(he.current=Db(o),ye.current=re,ue(!0),j(re,o,o,null,r.e,r.node))},[re,j]),Pe=(0,t.useCallback)((e,t,n,r)=>{const o=he.current,{handle:i}=r;let a,l,c=!1;const[s,f]=zb(re,e,e=>{if(a=e.x,l=e.y,["sw","w","nw","n","ne"].includes(i)&&(["sw","nw","w"].includes(i)&&(a=e.x+(e.w-t),t=e.x!==a&&a<0?e.w:t,a=a<0?0:a),["ne","n","nw"].includes(i)&&(l=e.y+(e.h-n),n=e.y!==l&&l<0?e.h:n,l=l<0?0:l),c=!0),K&&!G){Eb(re,u(u({},e),{},{w:t,h:n,x:null!==a&&void 0!==a?a:e.x,y:null!==l&&void 0!==l?l:e.y})).filter(t=>t.i!==e.i).length>0&&(l=e.y,n=e.h,a=e.x,t=e.w,c=!1)}return e.w=t,e.h=n,e});if(!f)return;let d=s;c&&void 0!==a&&void 0!==l&&(d=Rb(s,f,a,l,!0,K,Y,0,G));const p={w:f.w,h:f.h,x:f.x,y:f.y,i:e,static:!0};k(d,o,f,p,r.e,r.node),oe(G?d:cx(d,Y,N)),ae(p)},[re,K,G,Y,N,k]),Ee=(0,t.useCallback)((e,t,n,r)=>{const o=he.current,i=Tb(re,e),a=G?re:cx(re,Y,N);P(a,o,null!==i&&void 0!==i?i:null,null,r.e,r.node);const l=ye.current;he.current=null,ye.current=null,ae(null),ue(!1),oe(a),l&&!(0,wx.deepEqual)(l,a)&&x(a)},[re,G,Y,N,P,x]),_e=(0,t.useCallback)(()=>{const e=cx(re.filter(e=>e.i!==Q.i),Y,N,G);oe(e),se(null),ae(null),de(void 0)},[re,Q.i,Y,N,G]),Me=(0,t.useCallback)(e=>{var t;if(e.preventDefault(),e.stopPropagation(),Px&&(null===(t=e.nativeEvent.target)||void 0===t||!t.classList.contains(kx)))return!1;const n=_(e);if(!1===n)return ce&&_e(),!1;const r=null!==n&&void 0!==n?n:{},{dragOffsetX:i=0,dragOffsetY:a=0}=r,l=eb(r,Ox),c=u(u({},Q),l),s=e.currentTarget.getBoundingClientRect(),f={cols:N,margin:z,maxRows:I,rowHeight:D,containerWidth:o,containerPadding:ee},d=xb(f),p=wb(c.w,d,z[0])/2,h=wb(c.h,D,z[1])/2,y=e.clientX-s.left+i-p,v=e.clientY-s.top+a-h,m=Math.max(0,y),g=Math.max(0,v),b={left:m/J,top:g/J,e:e.nativeEvent};if(ce){if(fe){(fe.left!==b.left||fe.top!==b.top)&&de(b)}}else{const e=function(e,t,n,r,o){const{margin:i,containerPadding:a,cols:l,rowHeight:u,maxRows:c}=e,s=xb(e);let f=Math.round((n-a[0])/(s+i[0])),d=Math.round((t-a[1])/(u+i[1]));return f=jb(f,0,l-r),d=jb(d,0,c-o),{x:f,y:d}}(f,g,m,c.w,c.h);se((0,xx.jsx)("div",{},c.i)),de(b),oe([...re,u(u({},c),{},{x:e.x,y:e.y,static:!1,isDraggable:!0})])}},[ce,fe,Q,_,_e,J,N,z,I,D,o,ee,re]),Ae=(0,t.useCallback)(e=>{e.preventDefault(),e.stopPropagation(),ve.current--,0===ve.current&&_e()},[_e]),Ce=(0,t.useCallback)(e=>{e.preventDefault(),e.stopPropagation(),ve.current++},[]),Te=(0,t.useCallback)(e=>{e.preventDefault(),e.stopPropagation();const t=re.find(e=>e.i===Q.i);ve.current=0,_e(),E(re,t,e.nativeEvent)},[re,Q.i,_e,E]),Ne=(0,t.useCallback)((e,t)=>{if(!e||!e.key)return null;const n=Tb(re,String(e.key));if(!n)return null;const r="boolean"===typeof n.isDraggable?n.isDraggable:!n.static&&L,i="boolean"===typeof n.isResizable?n.isResizable:!n.static&&W,a=n.resizeHandles||[...H],l=r&&B&&!1!==n.isBounded,u=q;return(0,xx.jsx)(Sx,{containerWidth:o,cols:N,margin:z,containerPadding:ee,maxRows:I,rowHeight:D,cancel:U,handle:F,onDragStart:Oe,onDrag:Se,onDragStop:je,onResizeStart:ke,onResize:Pe,onResizeStop:Ee,isDraggable:r,isResizable:i,isBounded:l,useCSSTransforms:Z&&te,usePercentages:!te,transformScale:J,w:n.w,h:n.h,x:n.x,y:n.y,i:n.i,minH:n.minH,minW:n.minW,maxH:n.maxH,maxW:n.maxW,static:n.static,droppingPosition:t?fe:void 0,resizeHandles:a,resizeHandle:u,constraints:p,layoutItem:n,layout:re,children:e},n.i)},[re,o,N,z,ee,I,D,U,F,Oe,Se,je,ke,Pe,Ee,L,W,B,Z,te,J,fe,H,q,p]),De=s(kx,m),Ie=u({height:we},g);return(0,xx.jsxs)("div",{ref:b,className:De,style:Ie,onDrop:V?Te:void 0,onDragLeave:V?Ae:void 0,onDragEnter:V?Ce:void 0,onDragOver:V?Me:void 0,children:[t.Children.map(r,e=>t.isValidElement(e)?Ne(e):null),V&&ce&&Ne(ce,!0),ie?(0,xx.jsx)(Sx,{w:ie.w,h:ie.h,x:ie.x,y:ie.y,i:ie.i,className:"react-grid-placeholder ".concat(le?"placeholder-resizing":""),containerWidth:o,cols:N,margin:z,containerPadding:ee,maxRows:I,rowHeight:D,isDraggable:!1,isResizable:!1,isBounded:!1,useCSSTransforms:Z,transformScale:J,constraints:p,layout:re,children:(0,xx.jsx)("div",{})}):null]})}const Mx=e=>{let{value:t,label:n,deviceId:r,unit:o,threshold:i}=e;const a=i&&t>i,l=null!==t&&void 0!==t?t.toFixed(2):"N/A";return(0,xx.jsxs)("div",{className:"h-full w-full bg-white rounded-lg shadow-md hover:shadow-lg transition-shadow border border-gray-200",children:[(0,xx.jsxs)("div",{className:"p-3 border-b border-gray-100",children:[(0,xx.jsx)("div",{className:"text-xs font-semibold text-gray-700 truncate",children:n}),(0,xx.jsx)("div",{className:"text-xs text-gray-500 truncate",children:r})]}),(0,xx.jsxs)("div",{className:"p-4 flex flex-col items-center justify-center h-[calc(100%-60px)]",children:[(0,xx.jsx)("div",{className:"text-3xl lg:text-4xl font-bold ".concat(a?"text-red-600":"text-blue-600"),children:l}),o&&(0,xx.jsx)("div",{className:"text-xs text-gray-600 mt-2",children:o})]})]})},Ax=e=>{let{value:t,label:n,deviceId:r,min:o=0,max:i=100,unit:a}=e;const l=null!==t?(t-o)/(i-o)*100:0,u=Math.max(0,Math.min(100,l)),c=null!==t&&void 0!==t?t.toFixed(1):"N/A",s=(f=u)>80?"#dc2626":f>60?"#f59e0b":"#10b981";var f;return(0,xx.jsxs)("div",{className:"h-full w-full bg-white rounded-lg shadow-md hover:shadow-lg transition-shadow border border-gray-200",children:[(0,xx.jsxs)("div",{className:"p-3 border-b border-gray-100",children:[(0,xx.jsx)("div",{className:"text-xs font-semibold text-gray-700 truncate",children:n}),(0,xx.jsx)("div",{className:"text-xs text-gray-500 truncate",children:r})]}),(0,xx.jsxs)("div",{className:"p-4 flex flex-col justify-center h-[calc(100%-60px)]",children:[(0,xx.jsxs)("div",{className:"text-center mb-3",children:[(0,xx.jsx)("span",{className:"text-3xl font-bold text-gray-900",children:c}),a&&(0,xx.jsx)("span",{className:"text-xs text-gray-600 ml-2",children:a})]}),(0,xx.jsxs)("div",{className:"relative",children:[(0,xx.jsx)("div",{className:"overflow-hidden h-2 text-xs flex rounded-full bg-gray-200",children:(0,xx.jsx)("div",{style:{width:"".concat(u,"%"),backgroundColor:s},className:"shadow-none flex flex-col text-center whitespace-nowrap text-white justify-center transition-all duration-700"})}),(0,xx.jsxs)("div",{className:"flex justify-between text-xs text-gray-500 mt-1",children:[(0,xx.jsx)("span",{children:o}),(0,xx.jsx)("span",{children:i})]})]})]})]})},Cx=e=>{let{history:t,label:n,deviceId:r}=e;const o=(t||[]).slice(-20).map(e=>({time:e.timestamp?new Date(1e3*e.timestamp).toLocaleTimeString():"",value:e.value}));return 0===o.length?(0,xx.jsx)("div",{className:"h-full w-full bg-white rounded-lg shadow-md border border-gray-200 flex items-center justify-center",children:(0,xx.jsx)("div",{className:"text-gray-400 text-xs",children:"Waiting for data\u2026"})}):(0,xx.jsxs)("div",{className:"h-full w-full bg-white rounded-lg shadow-md border border-gray-200",children:[(0,xx.jsx)("div",{className:"p-2 border-b text-xs font-semibold truncate",children:n}),(0,xx.jsx)("div",{className:"p-2",style:{height:"calc(100% - 40px)"},children:(0,xx.jsx)(ge,{width:"100%",height:"100%",children:(0,xx.jsxs)(Ig,{data:o,children:[(0,xx.jsx)(Jg,{strokeDasharray:"3 3"}),(0,xx.jsx)(Sg,{dataKey:"time",tick:{fontSize:10}}),(0,xx.jsx)(Dg,{tick:{fontSize:10}}),(0,xx.jsx)(xt,{}),(0,xx.jsx)(Wm,{type:"monotone",dataKey:"value",stroke:"#3b82f6",strokeWidth:2,dot:!1,isAnimationActive:!1})]},"".concat(o.length))})})]})},Tx=e=>{let{status:t,deviceId:n}=e;const r="online"===t;return(0,xx.jsxs)("div",{className:"h-full w-full bg-white rounded-lg shadow-md hover:shadow-lg transition-shadow border border-gray-200",children:[(0,xx.jsxs)("div",{className:"p-3 border-b border-gray-100",children:[(0,xx.jsx)("div",{className:"text-xs font-semibold text-gray-700",children:"Device Status"}),(0,xx.jsx)("div",{className:"text-xs text-gray-500 truncate",children:n})]}),(0,xx.jsxs)("div",{className:"p-4 flex flex-col items-center justify-center h-[calc(100%-60px)]",children:[(0,xx.jsx)("div",{className:"w-12 h-12 rounded-full flex items-center justify-center ".concat(r?"bg-green-100":"bg-gray-100"),children:(0,xx.jsx)(ib,{size:24,className:r?"text-green-600 animate-pulse":"text-gray-400"})}),(0,xx.jsx)("div",{className:"text-sm font-semibold mt-3 ".concat(r?"text-green-600":"text-gray-500"),children:r?"Online":"Offline"})]})]})},Nx=e=>{let{value:t,label:n,deviceId:r,max:o=100}=e;const i=null!==t?t/o*100:0,a=null!==t?t.toFixed(1):"N/A";return(0,xx.jsxs)("div",{className:"h-full w-full bg-white rounded-lg shadow-md hover:shadow-lg transition-shadow border border-gray-200",children:[(0,xx.jsxs)("div",{className:"p-3 border-b border-gray-100",children:[(0,xx.jsx)("div",{className:"text-xs font-semibold text-gray-700 truncate",children:n}),(0,xx.jsx)("div",{className:"text-xs text-gray-500 truncate",children:r})]}),(0,xx.jsxs)("div",{className:"p-4 flex flex-col justify-center h-[calc(100%-60px)]",children:[(0,xx.jsxs)("div",{className:"flex items-baseline justify-between mb-2",children:[(0,xx.jsx)("span",{className:"text-3xl font-bold text-gray-900",children:a}),(0,xx.jsxs)("span",{className:"text-xs font-semibold text-gray-600",children:[i.toFixed(0),"%"]})]}),(0,xx.jsx)("div",{className:"overflow-hidden h-2 text-xs flex rounded-full bg-gray-200",children:(0,xx.jsx)("div",{style:{width:"".concat(i,"%")},className:"shadow-none flex flex-col text-center whitespace-nowrap text-white justify-center bg-blue-600 transition-all duration-700"})})]})]})},Dx=e=>{let{value:t,label:n,deviceId:r,threshold:o}=e;const i=t>=o;return(0,xx.jsxs)("div",{className:"h-full w-full rounded-lg shadow-md p-4 ".concat(i?"bg-red-600 text-white":"bg-green-500 text-white"),children:[(0,xx.jsx)("div",{className:"text-xs truncate",children:r}),(0,xx.jsx)("div",{className:"text-sm font-bold truncate",children:n}),(0,xx.jsx)("div",{className:"text-3xl font-extrabold mt-2",children:t}),(0,xx.jsxs)("div",{className:"mt-2 text-xs",children:["Threshold: ",o]})]})},Ix=e=>{let{value:t,deviceId:n}=e;const r=Math.min(100,Math.max(0,(t-3)/1.2*100));return(0,xx.jsxs)("div",{className:"h-full w-full bg-white rounded-lg shadow-md p-4",children:[(0,xx.jsx)("div",{className:"text-xs text-gray-500 truncate",children:n}),(0,xx.jsx)("div",{className:"text-sm font-semibold",children:"Battery"}),(0,xx.jsxs)("div",{className:"text-3xl font-bold mt-2",children:[r.toFixed(0),"%"]}),(0,xx.jsx)("div",{className:"bg-gray-200 h-2 rounded mt-3",children:(0,xx.jsx)("div",{className:"h-2 rounded ".concat(r>50?"bg-green-500":"bg-red-500"),style:{width:"".concat(r,"%")}})})]})},zx=e=>{let{label:t,value:n,unit:r}=e;return(0,xx.jsxs)("div",{className:"h-full w-full bg-indigo-600 text-white rounded-lg shadow-md p-4",children:[(0,xx.jsx)("div",{className:"text-xs opacity-80 truncate",children:t}),(0,xx.jsxs)("div",{className:"text-3xl font-extrabold mt-4",children:[n,r]})]})},Rx=e=>{let{online:t,deviceId:n}=e;return(0,xx.jsxs)("div",{className:"h-full w-full rounded-lg shadow-md p-4 ".concat(t?"bg-green-500":"bg-gray-500"," text-white"),children:[(0,xx.jsx)("div",{className:"text-xs truncate",children:n}),(0,xx.jsx)("div",{className:"text-2xl font-bold mt-4",children:t?"ONLINE":"OFFLINE"})]})},Lx=e=>{let{lat:t,lng:n}=e;return(0,xx.jsx)("div",{className:"h-full w-full bg-white rounded-lg shadow-md p-1",children:(0,xx.jsx)("iframe",{title:"map",width:"100%",height:"100%",src:"https://maps.google.com/maps?q=".concat(t,",").concat(n,"&z=15&output=embed"),className:"rounded"})})},Bx=e=>{let{value:t,label:n}=e;return(0,xx.jsxs)("div",{className:"h-full w-full bg-purple-600 text-white rounded-lg shadow-md p-4",children:[(0,xx.jsxs)("div",{className:"text-xs truncate",children:["Predicted ",n]}),(0,xx.jsx)("div",{className:"text-3xl font-bold mt-4",children:(1.05*t).toFixed(1)}),(0,xx.jsx)("div",{className:"text-xs mt-2",children:"Next 10 min"})]})},Fx=e=>{let{metrics:t=[],deviceId:n,telemetryData:r}=e;return(0,xx.jsxs)("div",{className:"h-full w-full bg-white rounded-lg shadow-md p-4 overflow-auto",children:[(0,xx.jsx)("div",{className:"text-xs text-gray-500 mb-2 truncate",children:n}),0===t.length?(0,xx.jsx)("div",{className:"text-gray-400 text-xs",children:"No metrics configured"}):t.map((e,t)=>{var o,i,a;return(0,xx.jsxs)("div",{className:"flex justify-between text-sm mb-1",children:[(0,xx.jsx)("span",{className:"truncate",children:e.key}),(0,xx.jsx)("span",{className:"font-bold ml-2",children:null!==(o=null===(i=r[n])||void 0===i||null===(a=i[e.key])||void 0===a?void 0:a.value)&&void 0!==o?o:"--"})]},t)})]})},Ux=e=>{let{deviceId:n,telemetryData:r,onSave:o,onClose:i}=e;const a=Object.keys(r[n]||[]),[l,u]=t.useState([]);return(0,xx.jsx)("div",{className:"fixed inset-0 bg-black bg-opacity-40 flex items-center justify-center z-50",children:(0,xx.jsxs)("div",{className:"bg-white rounded-xl w-96 p-6",children:[(0,xx.jsx)("h3",{className:"text-lg font-semibold mb-4",children:"Select Metrics"}),(0,xx.jsx)("div",{className:"space-y-2 max-h-60 overflow-y-auto",children:a.map(e=>(0,xx.jsxs)("label",{className:"flex items-center gap-2",children:[(0,xx.jsx)("input",{type:"checkbox",onChange:t=>u(n=>t.target.checked?[...n,{key:e,threshold:null}]:n.filter(t=>t.key!==e))}),e]},e))}),(0,xx.jsxs)("div",{className:"flex justify-end gap-2 mt-6",children:[(0,xx.jsx)("button",{onClick:i,className:"px-3 py-1 border rounded",children:"Cancel"}),(0,xx.jsx)("button",{onClick:()=>o(l),className:"px-4 py-1 bg-blue-600 text-white rounded",children:"Add"})]})]})})},Wx=e=>{var t,n,r,o,i,a,l,u;let{widget:c,telemetryData:s,devices:f}=e;const d=c.bind?c.bind.split(".")[0]:c.deviceId,p=c.bind?c.bind.split(".")[1]:null,h=null===(t=s[d])||void 0===t||null===(n=t[p])||void 0===n?void 0:n.value,y=(null===(r=s[d])||void 0===r||null===(o=r[p])||void 0===o?void 0:o.history)||[],v=f.find(e=>"string"===typeof e?e===d:e.device_id===d);switch(c.type){case"numeric":return(0,xx.jsx)(Mx,{value:h,label:p,deviceId:d,unit:c.unit,threshold:c.threshold});case"gauge":return(0,xx.jsx)(Ax,{value:h,label:p,deviceId:d,min:c.min||0,max:c.max||100,unit:c.unit});case"chart":return(0,xx.jsx)(Cx,{history:y,label:p,deviceId:d});case"status":return(0,xx.jsx)(Tx,{status:null===v||void 0===v?void 0:v.status,deviceId:d});case"progress":return(0,xx.jsx)(Nx,{value:h,label:p,deviceId:d,max:c.max||100});case"alarm":return(0,xx.jsx)(Dx,{value:h,label:p,deviceId:d,threshold:c.threshold});case"battery":return(0,xx.jsx)(Ix,{value:h,deviceId:d});case"kpi":return(0,xx.jsx)(zx,{label:p,value:h,unit:c.unit});case"status_widget":return(0,xx.jsx)(Rx,{online:"online"===(null===v||void 0===v?void 0:v.status),deviceId:d});case"map":return(0,xx.jsx)(Lx,{lat:null===(i=s[d])||void 0===i||null===(a=i.latitude)||void 0===a?void 0:a.value,lng:null===(l=s[d])||void 0===l||null===(u=l.longitude)||void 0===u?void 0:u.value});case"prediction":return(0,xx.jsx)(Bx,{value:h,label:p});case"multi_metric":return(0,xx.jsx)(Fx,{metrics:c.metrics,deviceId:d,telemetryData:s});default:return null}},Hx=e=>{let{type:t,icon:n,label:r,onDragStart:o}=e;return(0,xx.jsxs)("div",{draggable:!0,onDragStart:e=>o(e,t),className:"flex items-center gap-3 p-3 bg-slate-700 rounded cursor-grab active:cursor-grabbing hover:bg-slate-600 transition-colors",children:[(0,xx.jsx)(n,{size:18}),(0,xx.jsx)("span",{className:"text-sm",children:r})]})};function qx(){var e;const[n,r]=(0,t.useState)([]),[o,i]=(0,t.useState)({}),[a,l]=(0,t.useState)([]),[c,s]=(0,t.useState)(null),[f,d]=(0,t.useState)(null),[p,h]=(0,t.useState)(!1),[y,v]=(0,t.useState)(null),[m,g]=(0,t.useState)(!1),[b,x]=(0,t.useState)(null),[w,O]=(0,t.useState)(1),{data:S,isConnected:j}=(e=>{const[n,r]=(0,t.useState)(null),[o,i]=(0,t.useState)(!1),a=(0,t.useRef)(null);return(0,t.useEffect)(()=>{const t=()=>{a.current=new WebSocket(e),a.current.onopen=()=>{i(!0),console.log("[WS] Connected")},a.current.onmessage=e=>{const t=JSON.parse(e.data);r(t)},a.current.onclose=()=>{i(!1),console.log("[WS] Disconnected, reconnecting..."),setTimeout(t,3e3)},a.current.onerror=e=>{console.error("[WS] Error:",e)}};return t(),()=>{a.current&&a.current.close()}},[e]),{data:n,isConnected:o}})("ws://localhost:8000/ws/live");(0,t.useEffect)(()=>{fetch("".concat("http://localhost:8000","/api/devices")).then(e=>e.json()).then(e=>r(e.devices||[])).catch(e=>console.error("Error fetching devices:",e))},[]),(0,t.useEffect)(()=>{if(S)if("initial_state"===S.type)r(S.devices||[]);else if("telemetry_update"===S.type){const{device_id:e,telemetry:t,timestamp:n}=S;i(r=>{const o=u({},r);return o[e]||(o[e]={}),Object.entries(t).forEach(t=>{let[r,i]=t;o[e][r]||(o[e][r]={value:i,history:[]}),o[e][r].value=i,o[e][r].history.push({timestamp:n,value:i}),o[e][r].history.length>100&&o[e][r].history.shift()}),o}),r(t=>{const r=[...t],o=r.findIndex(t=>t.device_id===e);return o>=0&&(r[o].last_seen=n,r[o].status="online"),r})}else"device_status"===S.type&&r(e=>{const t=[...e],n=t.findIndex(e=>e.device_id===S.device_id);return n>=0&&(t[n].status=S.status),t})},[S]);const k=(e,t)=>{d(t),e.dataTransfer.setData("text/plain",t),e.dataTransfer.effectAllowed="copy"},P=c&&n.length>0?"string"===typeof n[0]?Object.keys(o[c]||{}):(null===(e=n.find(e=>e.device_id===c))||void 0===e?void 0:e.telemetry_keys)||[]:[],E=a.map(e=>{var t,n,r,o,i,a;return{i:e.id,x:null!==(t=e.x)&&void 0!==t?t:0,y:null!==(n=e.y)&&void 0!==n?n:1/0,w:null!==(r=e.w)&&void 0!==r?r:4,h:null!==(o=e.h)&&void 0!==o?o:4,minW:null!==(i=e.minW)&&void 0!==i?i:2,minH:null!==(a=e.minH)&&void 0!==a?a:2}});return(0,xx.jsxs)("div",{className:"h-screen flex bg-gray-50",children:[(0,xx.jsxs)("div",{className:"w-72 bg-slate-800 text-white flex flex-col shadow-xl overflow-hidden",children:[(0,xx.jsx)("div",{className:"p-6 border-b border-slate-700",children:(0,xx.jsxs)("div",{className:"flex items-center gap-3",children:[(0,xx.jsx)(ab,{size:28,className:"text-blue-400"}),(0,xx.jsxs)("div",{children:[(0,xx.jsx)("h1",{className:"text-xl font-bold",children:"IoT Dashboard"}),(0,xx.jsx)("p",{className:"text-xs text-slate-400",children:"Real-time Monitoring"})]})]})}),(0,xx.jsxs)("div",{className:"p-4 border-b border-slate-700",children:[(0,xx.jsx)("div",{className:"text-xs font-semibold text-slate-400 uppercase tracking-wide mb-3",children:"Select Device"}),0===n.length?(0,xx.jsx)("div",{className:"text-sm text-slate-500 text-center py-4",children:"No devices discovered"}):(0,xx.jsx)("div",{className:"space-y-2",children:n.map(e=>{var t;return(0,xx.jsx)("button",{onClick:()=>s(e.device_id),className:"w-full text-left p-3 rounded-lg transition-all ".concat(c===e.device_id?"bg-blue-600 shadow-lg":"bg-slate-700 hover:bg-slate-600"),children:(0,xx.jsx)("div",{className:"flex items-start justify-between",children:(0,xx.jsxs)("div",{className:"flex-1 min-w-0",children:[(0,xx.jsxs)("div",{className:"flex items-center gap-2 mb-1",children:[(0,xx.jsx)("div",{className:"w-2 h-2 rounded-full ".concat("online"===e.status?"bg-green-400 animate-pulse":"bg-gray-500")}),(0,xx.jsx)("span",{className:"text-sm font-medium truncate",children:e.device_id})]}),(0,xx.jsxs)("div",{className:"text-xs text-slate-400",children:[(null===(t=e.telemetry_keys)||void 0===t?void 0:t.length)||0," telemetry keys"]})]})})},e.device_id)})})]}),(0,xx.jsxs)("div",{className:"flex-1 w-full overflow-y-auto p-4",children:[(0,xx.jsx)("div",{className:"text-xs font-semibold text-slate-400 uppercase tracking-wide mb-3",children:"Widget Library"}),(0,xx.jsx)("div",{className:"text-xs text-slate-400 mb-3",children:c?"Drag & drop widgets to canvas":"Select a device first"}),(0,xx.jsxs)("div",{className:"space-y-2",children:[(0,xx.jsx)(Hx,{type:"numeric",icon:lb,label:"Numeric Card",onDragStart:k}),(0,xx.jsx)(Hx,{type:"gauge",icon:ub,label:"Gauge",onDragStart:k}),(0,xx.jsx)(Hx,{type:"chart",icon:cb,label:"Line Chart",onDragStart:k}),(0,xx.jsx)(Hx,{type:"status",icon:ib,label:"Status Indicator",onDragStart:k}),(0,xx.jsx)(Hx,{type:"progress",icon:sb,label:"Progress Bar",onDragStart:k}),(0,xx.jsx)(Hx,{type:"alarm",icon:fb,label:"Alarm Indicator",onDragStart:k}),(0,xx.jsx)(Hx,{type:"battery",icon:sb,label:"Battery Widget",onDragStart:k}),(0,xx.jsx)(Hx,{type:"kpi",icon:db,label:"KPI Widget",onDragStart:k}),(0,xx.jsx)(Hx,{type:"status_widget",icon:ab,label:"Status Widget",onDragStart:k}),(0,xx.jsx)(Hx,{type:"map",icon:pb,label:"Map Widget",onDragStart:k}),(0,xx.jsx)(Hx,{type:"prediction",icon:hb,label:"Prediction Widget",onDragStart:k}),(0,xx.jsx)(Hx,{type:"multi_metric",icon:cb,label:"Multi-Metric Widget",onDragStart:k})]})]})]}),(0,xx.jsxs)("div",{className:"flex-1 flex flex-col overflow-hidden",children:[(0,xx.jsxs)("div",{className:"bg-white border-b border-gray-200 px-6 py-4 flex items-center justify-between shadow-sm",children:[(0,xx.jsxs)("div",{className:"flex items-center gap-4",children:[(0,xx.jsx)(db,{size:24,className:"text-gray-600"}),(0,xx.jsxs)("div",{children:[(0,xx.jsx)("h2",{className:"text-xl font-semibold text-gray-800",children:"Dashboard Canvas"}),c&&(0,xx.jsxs)("p",{className:"text-xs text-gray-500",children:["Building dashboard for: ",c]})]})]}),(0,xx.jsxs)("div",{className:"flex items-center gap-4",children:[(0,xx.jsxs)("div",{className:"flex items-center gap-2 bg-gray-100 rounded-lg px-3 py-2",children:[(0,xx.jsx)("button",{onClick:()=>{O(e=>Math.max(e-.1,.5))},className:"p-1 hover:bg-gray-200 rounded transition-colors",title:"Zoom Out",children:(0,xx.jsx)(yb,{size:18,className:"text-gray-700"})}),(0,xx.jsxs)("span",{className:"text-sm font-medium text-gray-700 min-w-[60px] text-center",children:[(100*w).toFixed(0),"%"]}),(0,xx.jsx)("button",{onClick:()=>{O(e=>Math.min(e+.1,2))},className:"p-1 hover:bg-gray-200 rounded transition-colors",title:"Zoom In",children:(0,xx.jsx)(vb,{size:18,className:"text-gray-700"})}),(0,xx.jsx)("button",{onClick:()=>{O(1)},className:"ml-2 px-2 py-1 text-xs bg-gray-200 hover:bg-gray-300 rounded transition-colors",title:"Reset Zoom",children:"Reset"})]}),(0,xx.jsx)("div",{className:"flex items-center gap-2 px-3 py-1.5 rounded-full text-sm font-medium ".concat(j?"bg-green-100 text-green-700":"bg-red-100 text-red-700"),children:j?(0,xx.jsxs)(xx.Fragment,{children:[(0,xx.jsx)(fb,{size:16}),(0,xx.jsx)("span",{children:"Connected"})]}):(0,xx.jsxs)(xx.Fragment,{children:[(0,xx.jsx)(mb,{size:16}),(0,xx.jsx)("span",{children:"Disconnected"})]})})]})]}),(0,xx.jsx)("div",{className:"flex-1 overflow-auto bg-gray-50",style:{backgroundImage:"radial-gradient(circle, #e5e7eb 1px, transparent 1px)",backgroundSize:"20px 20px"},children:(0,xx.jsx)("div",{style:{transform:"scale(".concat(w,")"),transformOrigin:"top left",minWidth:"".concat(100/w,"%"),minHeight:"".concat(100/w,"%")},children:(0,xx.jsxs)(_x,{className:"layout",layout:E,cols:12,rowHeight:60,width:1200,isDraggable:!0,isResizable:!0,isDroppable:!0,droppingItem:{i:"__dropping__",w:4,h:3},compactType:null,preventCollision:!1,resizeHandles:["se","e","s","sw"],onDrop:(e,t,n)=>{f&&c?(v({type:f,x:t.x,y:t.y,w:t.w,h:t.h}),h(!0)):alert("Please select a device first!")},onLayoutChange:e=>{l(t=>t.map(t=>{const n=e.find(e=>e.i===t.id);return n?u(u({},t),{},{x:n.x,y:n.y,w:n.w,h:n.h}):t}))},draggableHandle:".drag-handle",children:[0===a.length?(0,xx.jsx)("div",{"data-grid":{x:0,y:0,w:12,h:8,static:!0},className:"flex items-center justify-center",children:(0,xx.jsxs)("div",{className:"text-center text-gray-500",children:[(0,xx.jsx)(gb,{size:48,className:"mx-auto mb-4 text-gray-400"}),(0,xx.jsx)("h3",{className:"text-xl font-semibold mb-2",children:"Drag & Drop Widgets"}),(0,xx.jsx)("p",{className:"text-sm",children:"Drag widgets from the left panel and drop them here"})]})},"empty"):null,a.map(e=>(0,xx.jsxs)("div",{className:"relative group bg-transparent",children:[(0,xx.jsx)("div",{className:"drag-handle absolute top-2 left-2 z-10 cursor-move text-gray-400 opacity-0 group-hover:opacity-100 transition-opacity",children:(0,xx.jsx)(gb,{size:16})}),(0,xx.jsx)(Wx,{widget:e,telemetryData:o,devices:n}),(0,xx.jsx)("button",{onClick:()=>{return t=e.id,void l(a.filter(e=>e.id!==t));var t},className:"absolute top-2 right-2 bg-red-600 text-white p-1.5 rounded opacity-0 group-hover:opacity-100 transition-opacity z-10",children:(0,xx.jsx)(bb,{size:14})})]},e.id))]})})}),p&&(0,xx.jsx)("div",{className:"fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50",children:(0,xx.jsxs)("div",{className:"bg-white rounded-xl shadow-2xl w-96 max-h-[80vh] flex flex-col",children:[(0,xx.jsxs)("div",{className:"px-6 py-4 border-b border-gray-200",children:[(0,xx.jsx)("h3",{className:"text-lg font-semibold",children:"Select Telemetry Key"}),(0,xx.jsx)("p",{className:"text-sm text-gray-500 mt-1",children:"Choose a data point for this widget"})]}),(0,xx.jsx)("div",{className:"p-6 overflow-y-auto flex-1",children:0===P.length?(0,xx.jsx)("div",{className:"text-center text-gray-500 py-8",children:"No telemetry keys available for this device"}):(0,xx.jsx)("div",{className:"space-y-2",children:P.map(e=>{var t,n;return(0,xx.jsxs)("button",{onClick:()=>(e=>{if(!c||!y)return;if("multi_metric"===y.type)return x(c),h(!1),void g(!0);const t=u({id:"widget_".concat(Date.now()),type:y.type,bind:"".concat(c,".").concat(e),x:y.x,y:y.y,w:y.w,h:y.h,minW:2,minH:2},"alarm"===y.type&&{threshold:50});l(e=>[...e,t]),h(!1),v(null)})(e),className:"w-full text-left px-4 py-3 rounded-lg border border-gray-200 hover:border-blue-500 hover:bg-blue-50 transition-colors",children:[(0,xx.jsx)("div",{className:"font-medium text-gray-900",children:e}),(null===(t=o[c])||void 0===t?void 0:t[e])&&(0,xx.jsxs)("div",{className:"text-sm text-gray-500 mt-1",children:["Current: ",null===(n=o[c][e].value)||void 0===n?void 0:n.toFixed(2)]})]},e)})})}),(0,xx.jsx)("div",{className:"px-6 py-4 border-t border-gray-200 flex justify-end gap-2",children:(0,xx.jsx)("button",{onClick:()=>{h(!1),v(null)},className:"px-4 py-2 text-gray-700 bg-gray-100 hover:bg-gray-200 rounded-lg transition-colors",children:"Cancel"})})]})}),m&&b&&(0,xx.jsx)(Ux,{deviceId:b,telemetryData:o,onClose:()=>{g(!1),v(null)},onSave:e=>{l(t=>{var n,r;return[...t,{id:"widget_".concat(Date.now()),type:"multi_metric",deviceId:b,metrics:e,x:null!==(n=null===y||void 0===y?void 0:y.x)&&void 0!==n?n:0,y:null!==(r=null===y||void 0===y?void 0:y.y)&&void 0!==r?r:1/0,w:4,h:Math.max(3,e.length+1),minW:2,minH:2}]}),g(!1),v(null)}})]})]})}r.createRoot(document.getElementById("root")).render((0,xx.jsx)(t.StrictMode,{children:(0,xx.jsx)(qx,{})}))})()})();
-//# sourceMappingURL=main.4dc1360a.js.map
\ No newline at end of file
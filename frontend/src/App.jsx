@@ -7,24 +7,55 @@ import 'react-resizable/css/styles.css';
 import { AdvancedLineChart, BarChartWidget, ScatterPlotWidget, MultiStreamChart } from './AdvancedCharts';
 import { PinMappingWidget, PinReferenceWidget } from './ESP32PinWidget';
 import MachineStateIndicator from './components/MachineStateIndicator';
+import { BINARY_PROTOCOL, createFrameDecoder } from './wsBinaryProtocol';
 
 // ==================== WEBSOCKET HOOK ====================
-const useWebSocket = (url) => {
+// Without the binary subprotocol the backend sends JSON as binary frames
+// (UTF-8 bytes); text frames still parse
+const frameDecoder = new TextDecoder();
+const parseFrame = (data) => JSON.parse(typeof data === 'string' ? data : frameDecoder.decode(data));
+
+// Pass `devices` to only receive telemetry for those devices (empty = everything)
+const useWebSocket = (url, devices = []) => {
   const [data, setData] = useState(null);
   const [isConnected, setIsConnected] = useState(false);
   const ws = useRef(null);
+  const subscription = useRef(null);
+  const devicesKey = devices.join('\n');
+
+  const sendSubscription = () => {
+    if (ws.current && ws.current.readyState === WebSocket.OPEN && subscription.current) {
+      ws.current.send(JSON.stringify(subscription.current));
+    }
+  };
+
+  // Re-subscribe whenever the set of devices on the dashboard changes
+  useEffect(() => {
+    subscription.current = devices.length > 0
+      ? { type: 'subscribe', devices, replace: true }
+      : { type: 'unsubscribe', all: true };
+    sendSubscription();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [devicesKey]);
 
   useEffect(() => {
     const connect = () => {
-      ws.current = new WebSocket(url);
+      // Offer the compact binary protocol; a backend without it answers in JSON
+      const socket = new WebSocket(url, [BINARY_PROTOCOL]);
+      const decodeBinary = createFrameDecoder();
+      ws.current = socket;
+      socket.binaryType = 'arraybuffer';
 
       ws.current.onopen = () => {
         setIsConnected(true);
         console.log('[WS] Connected');
+        sendSubscription();
       };
 
       ws.current.onmessage = (event) => {
-        const message = JSON.parse(event.data);
+        const message = socket.protocol === BINARY_PROTOCOL
+          ? decodeBinary(event.data)
+          : parseFrame(event.data);
         setData(message);
       };
 
@@ -631,7 +662,13 @@ export default function IoTDashboard() {
   const WS_URL = `${protocolHTTP === 'https:' ? 'wss' : 'ws'}://${host}:8000/ws/live`;
 
 
-  const { data: wsData, isConnected } = useWebSocket(WS_URL);
+  // Only stream devices shown on the dashboard plus the one being configured
+  const subscribedDevices = [...new Set([
+    ...widgets.map(w => (w.bind ? w.bind.split('.')[0] : w.deviceId)),
+    selectedDevice
+  ].filter(Boolean))].sort();
+
+  const { data: wsData, isConnected } = useWebSocket(WS_URL, subscribedDevices);
 
   // Fetch initial devices
   useEffect(() => {
@@ -672,52 +709,93 @@ export default function IoTDashboard() {
 
     if (wsData.type === 'initial_state') {
       setDevices(wsData.devices || []);
-    } else if (wsData.type === 'telemetry_update') {
-      const { device_id, telemetry, timestamp } = wsData;
+      // Current states; afterwards state_update only arrives on changes
+      const states = {};
+      Object.entries(wsData.states || {}).forEach(([device_id, info]) => {
+        if (info) {
+          states[device_id] = {
+            state: info.state,
+            confidence: info.confidence,
+            reasons: info.reasons || []
+          };
+        }
+      });
+      setMachineStates(states);
+    } else if (wsData.type === 'telemetry_update' || wsData.type === 'telemetry_batch') {
+      // Batched frames carry many updates; single updates are a batch of one
+      const updates = wsData.type === 'telemetry_batch' ? wsData.updates : [wsData];
 
       setTelemetryData(prev => {
         const newData = { ...prev };
-        if (!newData[device_id]) newData[device_id] = {};
 
-        Object.entries(telemetry).forEach(([key, value]) => {
-          // Skip internal state fields from being stored as regular telemetry
-          if (key.startsWith('_')) return;
+        updates.forEach(({ device_id, telemetry, timestamp }) => {
+          if (!newData[device_id]) newData[device_id] = {};
 
-          if (!newData[device_id][key]) {
-            newData[device_id][key] = { value, history: [] };
-          }
-          newData[device_id][key].value = value;
-          newData[device_id][key].history.push({ timestamp, value });
+          Object.entries(telemetry).forEach(([key, value]) => {
+            // Skip internal state fields from being stored as regular telemetry
+            if (key.startsWith('_')) return;
 
-          if (newData[device_id][key].history.length > 100) {
-            newData[device_id][key].history.shift();
-          }
+            if (!newData[device_id][key]) {
+              newData[device_id][key] = { value, history: [] };
+            }
+            newData[device_id][key].value = value;
+            newData[device_id][key].history.push({ timestamp, value });
+
+            if (newData[device_id][key].history.length > 100) {
+              newData[device_id][key].history.shift();
+            }
+          });
         });
 
         return newData;
       });
 
       // Extract machine state if present
-      if (telemetry._machine_state) {
-        setMachineStates(prev => ({
-          ...prev,
-          [device_id]: {
+      const stateUpdates = {};
+      updates.forEach(({ device_id, telemetry }) => {
+        if (telemetry._machine_state) {
+          stateUpdates[device_id] = {
             state: telemetry._machine_state,
             confidence: telemetry._state_confidence,
             reasons: telemetry._state_reasons
-          }
-        }));
+          };
+        }
+      });
+      if (Object.keys(stateUpdates).length > 0) {
+        setMachineStates(prev => ({ ...prev, ...stateUpdates }));
       }
 
       setDevices(prev => {
         const updated = [...prev];
-        const idx = updated.findIndex(d => d.device_id === device_id);
-        if (idx >= 0) {
-          updated[idx].last_seen = timestamp;
-          updated[idx].status = 'online';
-        }
+        updates.forEach(({ device_id, timestamp }) => {
+          const idx = updated.findIndex(d => d.device_id === device_id);
+          if (idx >= 0) {
+            updated[idx].last_seen = timestamp;
+            updated[idx].status = 'online';
+          }
+        });
         return updated;
       });
+    } else if (wsData.type === 'state_update') {
+      // State inferred off the telemetry path (sent on state changes)
+      setMachineStates(prev => ({
+        ...prev,
+        [wsData.device_id]: {
+          state: wsData.state,
+          confidence: wsData.confidence,
+          reasons: wsData.reasons || []
+        }
+      }));
+    } else if (wsData.type === 'anomaly') {
+      // Streaming detector events; kept on the series for widgets to flag
+      setTelemetryData(prev => {
+        const newData = { ...prev };
+        wsData.events.forEach((event) => {
+          const series = newData[event.device_id]?.[event.key];
+          if (series) series.anomaly = event;
+        });
+        return newData;
+      });
     } else if (wsData.type === 'device_status') {
       setDevices(prev => {
         const updated = [...prev];
@@ -0,0 +1,97 @@
+// Decoder for the `iot-telemetry.v1` WebSocket subprotocol of /ws/live.
+// Frame layout is documented in backend/ws_binary.py. Decoded messages have
+// the same shape as the JSON ones, except that telemetry timestamps are
+// integer milliseconds since the epoch (null when the device sent none).
+
+export const BINARY_PROTOCOL = 'iot-telemetry.v1';
+
+const KIND_JSON = 0;
+const KIND_UPDATE = 2;
+const FLAG_DICTIONARY = 1;
+const FLAG_OFFSETS = 2;
+const NO_TIMESTAMP = -2147483648;
+
+const textDecoder = new TextDecoder();
+
+// One decoder per connection: it keeps the name and key layout definitions
+// the server has sent on it, so create a new one after every (re)connect.
+export const createFrameDecoder = () => {
+  const names = [];
+  const layouts = [];  // layout id -> [[key, type], ...]
+
+  return (buffer) => {
+    const bytes = new Uint8Array(buffer);
+    const view = new DataView(buffer);
+    const kind = bytes[0];
+    if (kind === KIND_JSON) {
+      return JSON.parse(textDecoder.decode(bytes.subarray(1)));
+    }
+
+    const flags = bytes[1];
+    let offset = 2;
+    const u16 = () => { const v = view.getUint16(offset, true); offset += 2; return v; };
+    const u32 = () => { const v = view.getUint32(offset, true); offset += 4; return v; };
+    const text = (length) => {
+      const v = textDecoder.decode(bytes.subarray(offset, offset + length));
+      offset += length;
+      return v;
+    };
+    const int16 = () => { const v = view.getInt16(offset, true); offset += 2; return v; };
+    const value = (type) => {
+      let v;
+      switch (type) {
+        case 0: v = +view.getFloat32(offset, true).toPrecision(7); offset += 4; return v;
+        case 1: v = view.getFloat64(offset, true); offset += 8; return v;
+        case 2: v = view.getInt32(offset, true); offset += 4; return v;
+        case 3: return false;
+        case 4: return true;
+        case 5: return null;
+        case 6: return text(u16());
+        case 7: return JSON.parse(text(u32()));
+        case 8: return names[u16()];
+        case 9: return int16();
+        case 10: return int16() / 10;
+        case 11: return int16() / 100;
+        case 12: return int16() / 1000;
+        default: throw new Error(`Unknown value type ${type}`);
+      }
+    };
+
+    if (flags & FLAG_DICTIONARY) {
+      for (let count = u16(); count > 0; count--) {
+        const id = u16();
+        names[id] = text(u16());
+      }
+      for (let count = u16(); count > 0; count--) {
+        const id = u16();
+        const layout = [];
+        for (let keys = u16(); keys > 0; keys--) {
+          const key = names[u16()];
+          layout.push([key, bytes[offset++]]);
+        }
+        layouts[id] = layout;
+      }
+    }
+
+    const base = view.getFloat64(offset, true);
+    offset += 8;
+    const updates = [];
+    for (let count = kind === KIND_UPDATE ? 1 : u32(); count > 0; count--) {
+      const deviceId = names[u16()];
+      const layout = layouts[u16()];
+      let timestamp = base;
+      if (flags & FLAG_OFFSETS) {
+        const delta = view.getInt32(offset, true);
+        offset += 4;
+        timestamp = delta === NO_TIMESTAMP ? null : base + delta;
+      }
+      const telemetry = {};
+      for (const [key, type] of layout) telemetry[key] = value(type);
+      updates.push({ device_id: deviceId, telemetry, timestamp });
+    }
+
+    return kind === KIND_UPDATE
+      ? { type: 'telemetry_update', ...updates[0] }
+      : { type: 'telemetry_batch', updates };
+  };
+};
@@ -1,13 +1,23 @@
 """
 Simple MQTT Broker using Python
 This is a lightweight MQTT broker for development/testing purposes.
+
+Two modes:
+- async (default): AsyncMQTTBroker, every connection on one asyncio loop
+- threaded: SimpleMQTTBroker, one OS thread per connection (legacy)
 """
 
+import argparse
+import asyncio
 import socket
 import threading
 import json
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 import time
+import zlib
+
+# Frames gathered into one sendmsg() call (well under IOV_MAX)
+SENDMSG_MAX_BUFFERS = 64
 
 class SimpleMQTTBroker:
     """
@@ -15,11 +25,13 @@ class SimpleMQTTBroker:
     Supports: CONNECT, PUBLISH, SUBSCRIBE
     """
     
-    def __init__(self, host='0.0.0.0', port=1883):
+    def __init__(self, host='0.0.0.0', port=1883, max_buffer=1 << 20):
         self.host = host
         self.port = port
-        self.clients = {}
-        self.subscriptions = defaultdict(list)
+        self.max_buffer = max_buffer  # Queued bytes per subscriber before QoS 0 drops
+        self.clients = {}  # client_id -> Outbox
+        self.topics = TopicTrie()  # Subscriptions, shared by all client threads
+        self.topics_lock = threading.Lock()
         self.running = False
         
     def start(self):
@@ -58,27 +70,31 @@ class SimpleMQTTBroker:
     def handle_client(self, client_socket, address):
         """Handle MQTT client connection."""
         client_id = f"client_{address[0]}:{address[1]}"
-        self.clients[client_id] = client_socket
+        # Everything sent to this client goes through its outbox thread
+        client = Outbox(client_socket, client_id, self.max_buffer)
+        self.clients[client_id] = client
+        decoder = PacketDecoder()
         
         try:
             while self.running:
                 try:
-                    # Read MQTT packet
+                    # A read may hold several packets or part of one
                     data = client_socket.recv(4096)
                     if not data:
                         break
                         
-                    # Parse MQTT packet type
-                    packet_type = (data[0] >> 4) & 0x0F
-                    
-                    if packet_type == 1:  # CONNECT
-                        self.handle_connect(client_socket, client_id, data)
-                    elif packet_type == 3:  # PUBLISH
-                        self.handle_publish(client_socket, client_id, data)
-                    elif packet_type == 8:  # SUBSCRIBE
-                        self.handle_subscribe(client_socket, client_id, data)
-                    elif packet_type == 12:  # PINGREQ
-                        self.handle_ping(client_socket)
+                    for header, body in decoder.feed(data):
+                        # Parse MQTT packet type
+                        packet_type = (header >> 4) & 0x0F
+                        
+                        if packet_type == 1:  # CONNECT
+                            self.handle_connect(client, client_id, body)
+                        elif packet_type == 3:  # PUBLISH
+                            self.handle_publish(client, client_id, header, body)
+                        elif packet_type == 8:  # SUBSCRIBE
+                            self.handle_subscribe(client, client_id, body)
+                        elif packet_type == 12:  # PINGREQ
+                            self.handle_ping(client)
                         
                 except Exception as e:
                     print(f"[MQTT Broker] Error handling client {client_id}: {e}")
@@ -88,63 +104,30 @@ class SimpleMQTTBroker:
             print(f"[MQTT Broker] Client {client_id} disconnected")
             if client_id in self.clients:
                 del self.clients[client_id]
-            client_socket.close()
+            with self.topics_lock:
+                self.topics.remove_client(client_id)
+            client.close()
             
-    def handle_connect(self, client_socket, client_id, data):
+    def handle_connect(self, client, client_id, data):
         """Handle MQTT CONNECT packet."""
         # Send CONNACK
         connack = bytes([0x20, 0x02, 0x00, 0x00])  # Connection accepted
-        client_socket.send(connack)
+        client.send(connack)
         print(f"[MQTT Broker] Client {client_id} connected")
         
-    def handle_publish(self, client_socket, client_id, data):
+    def handle_publish(self, client, client_id, header, body):
         """Handle MQTT PUBLISH packet."""
         try:
-            # Parse remaining length (variable length encoding)
-            multiplier = 1
-            value = 0
-            pos = 1
-            while True:
-                byte = data[pos]
-                value += (byte & 127) * multiplier
-                multiplier *= 128
-                if (byte & 128) == 0:
-                    break
-                pos += 1
-            remaining_length = value
-            pos += 1
-            
-            # Topic length
-            if pos + 1 >= len(data):
-                return
-            topic_length = (data[pos] << 8) | data[pos + 1]
-            pos += 2
-            
-            # Topic
-            if pos + topic_length >= len(data):
-                return
-            topic = data[pos:pos + topic_length].decode('utf-8')
-            pos += topic_length
-            
-            # QoS and packet identifier
-            qos = (data[0] >> 1) & 0x03
-            if qos > 0:
-                if pos + 1 >= len(data):
-                    return
-                packet_id = (data[pos] << 8) | data[pos + 1]
-                pos += 2
-                # Send PUBACK for QoS 1
-                if qos == 1:
-                    puback = bytes([0x40, 0x02, (packet_id >> 8) & 0xFF, packet_id & 0xFF])
-                    client_socket.send(puback)
+            topic, qos, packet_id, payload = parse_publish(header, body)
             
-            # Payload
-            payload = data[pos:]
+            # Send PUBACK for QoS 1
+            if qos == 1:
+                client.send(b'\x40\x02' + packet_id)
             
             print(f"[MQTT Broker] PUBLISH from {client_id}")
             print(f"              Topic: {topic}")
             try:
-                payload_str = payload.decode('utf-8', errors='ignore')[:200]
+                payload_str = bytes(payload[:200]).decode('utf-8', errors='ignore')
                 print(f"              Payload: {payload_str}")
             except:
                 print(f"              Payload: <binary data>")
@@ -157,112 +140,916 @@ class SimpleMQTTBroker:
             import traceback
             traceback.print_exc()
             
-    def handle_subscribe(self, client_socket, client_id, data):
+    def handle_subscribe(self, client, client_id, body):
         """Handle MQTT SUBSCRIBE packet."""
         try:
-            pos = 2
-            packet_id = (data[pos] << 8) | data[pos + 1]
-            pos += 2
-            
-            # Topic filter length
-            topic_length = (data[pos] << 8) | data[pos + 1]
-            pos += 2
-            
-            # Topic filter
-            topic_filter = data[pos:pos + topic_length].decode('utf-8')
-            pos += topic_length
-            
-            # QoS
-            requested_qos = data[pos]
-            
-            # Store subscription
-            if client_id not in self.subscriptions[topic_filter]:
-                self.subscriptions[topic_filter].append(client_id)
+            packet_id, filters = parse_subscribe(body)
             
-            print(f"[MQTT Broker] Client {client_id} subscribed to: {topic_filter}")
+            granted = bytearray()
+            for topic_filter, requested_qos in filters:
+                # Store subscription
+                with self.topics_lock:
+                    self.topics.subscribe(topic_filter, client_id)
+                granted.append(requested_qos)
+                print(f"[MQTT Broker] Client {client_id} subscribed to: {topic_filter}")
             
             # Send SUBACK
-            suback = bytes([0x90, 0x03, (packet_id >> 8) & 0xFF, packet_id & 0xFF, requested_qos])
-            client_socket.send(suback)
+            suback = b'\x90' + encode_remaining_length(2 + len(granted)) + packet_id + granted
+            client.send(suback)
             
         except Exception as e:
             print(f"[MQTT Broker] Error in SUBSCRIBE: {e}")
             
-    def handle_ping(self, client_socket):
+    def handle_ping(self, client):
         """Handle MQTT PINGREQ."""
         # Send PINGRESP
         pingresp = bytes([0xD0, 0x00])
-        client_socket.send(pingresp)
+        client.send(pingresp)
         
     def forward_message(self, topic, payload, sender_id):
         """Forward published message to subscribers."""
-        for topic_filter, subscribers in self.subscriptions.items():
-            # Simple wildcard matching
-            if self.topic_matches(topic, topic_filter):
-                for client_id in subscribers:
-                    if client_id != sender_id and client_id in self.clients:
-                        try:
-                            # Encode topic
-                            topic_bytes = topic.encode('utf-8')
-                            topic_length = len(topic_bytes)
-                            
-                            # Variable header (topic length + topic)
-                            var_header = bytes([(topic_length >> 8) & 0xFF, topic_length & 0xFF])
-                            var_header += topic_bytes
-                            
-                            # Full message = variable header + payload
-                            message = var_header + payload
-                            remaining_length = len(message)
-                            
-                            # Encode remaining length (variable length encoding)
-                            encoded_length = []
-                            while True:
-                                byte = remaining_length % 128
-                                remaining_length = remaining_length // 128
-                                if remaining_length > 0:
-                                    byte |= 0x80
-                                encoded_length.append(byte)
-                                if remaining_length == 0:
-                                    break
-                            
-                            # Build packet: fixed header + remaining length + message
-                            packet = bytearray([0x30])  # PUBLISH, QoS 0
-                            packet.extend(encoded_length)
-                            packet.extend(message)
-                            
-                            self.clients[client_id].send(bytes(packet))
-                            
-                        except Exception as e:
-                            print(f"[MQTT Broker] Error forwarding to {client_id}: {e}")
-                            
+        with self.topics_lock:
+            subscribers = self.topics.match(topic)
+        # One frame for every subscriber; outboxes queue the same object
+        packet = None
+        for client_id in subscribers:
+            client = self.clients.get(client_id)
+            if client_id != sender_id and client is not None:
+                if packet is None:
+                    packet = encode_publish(topic, payload)
+                client.put(packet)
+                
     def topic_matches(self, topic, topic_filter):
         """Check if topic matches topic filter (with wildcards)."""
-        # Simple implementation: exact match or single-level wildcard (+)
-        if topic_filter == topic:
-            return True
+        return topic_matches(topic, topic_filter)
+
+
+def encode_remaining_length(length):
+    """MQTT variable-length encoding of a packet's remaining length."""
+    encoded = bytearray()
+    while True:
+        byte = length % 128
+        length //= 128
+        if length > 0:
+            byte |= 0x80
+        encoded.append(byte)
+        if length == 0:
+            return bytes(encoded)
+
+
+def encode_publish(topic, payload, qos=0, packet_id=None, retain=False):
+    """PUBLISH packet for `topic` (str) and `payload` (bytes); QoS 1 needs a packet_id."""
+    topic_bytes = topic.encode('utf-8')
+    variable = len(topic_bytes).to_bytes(2, 'big') + topic_bytes
+    if qos:
+        variable += packet_id.to_bytes(2, 'big')
+    header = 0x30 | (qos << 1) | (0x01 if retain else 0)
+    return (bytes([header]) + encode_remaining_length(len(variable) + len(payload))
+            + variable + payload)
+
+
+def parse_publish(header, body):
+    """(topic, qos, packet_id bytes or None, payload) of a PUBLISH body."""
+    topic_length = (body[0] << 8) | body[1]
+    topic = bytes(body[2:2 + topic_length]).decode('utf-8')
+    pos = 2 + topic_length
+    qos = (header >> 1) & 0x03
+    packet_id = None
+    if qos > 0:
+        packet_id = bytes(body[pos:pos + 2])
+        pos += 2
+    return topic, qos, packet_id, body[pos:]
+
+
+def parse_connect(body):
+    """(client_id, clean_session, keepalive) of a CONNECT body."""
+    name_length = (body[0] << 8) | body[1]
+    pos = 2 + name_length + 1  # Protocol name, protocol level
+    flags = body[pos]
+    keepalive = (body[pos + 1] << 8) | body[pos + 2]
+    pos += 3
+    id_length = (body[pos] << 8) | body[pos + 1]
+    client_id = bytes(body[pos + 2:pos + 2 + id_length]).decode('utf-8')
+    return client_id, bool(flags & 0x02), keepalive
+
+
+def parse_shared(topic_filter):
+    """(group, filter) of a $share/{group}/{filter} subscription, else None."""
+    if not topic_filter.startswith('$share/'):
+        return None
+    group, _, shared_filter = topic_filter[7:].partition('/')
+    if not group or not shared_filter or '+' in group or '#' in group:
+        raise ValueError(f"Invalid shared subscription: {topic_filter}")
+    return group, shared_filter
+
+
+def parse_subscribe(body):
+    """(packet_id bytes, [(topic_filter, requested_qos)]) of a SUBSCRIBE body."""
+    filters = []
+    pos = 2
+    while pos < len(body):
+        length = (body[pos] << 8) | body[pos + 1]
+        topic_filter = bytes(body[pos + 2:pos + 2 + length]).decode('utf-8')
+        pos += 2 + length
+        filters.append((topic_filter, body[pos] & 0x03))
+        pos += 1
+    return bytes(body[0:2]), filters
+
+
+def parse_unsubscribe(body):
+    """(packet_id bytes, [topic_filter]) of an UNSUBSCRIBE body."""
+    filters = []
+    pos = 2
+    while pos < len(body):
+        length = (body[pos] << 8) | body[pos + 1]
+        filters.append(bytes(body[pos + 2:pos + 2 + length]).decode('utf-8'))
+        pos += 2 + length
+    return bytes(body[0:2]), filters
+
+
+class Outbox:
+    """
+    Bounded outgoing queue of one threaded-broker client.
+    
+    Publishers only append frames (the same bytes object for every
+    subscriber); a per-client writer thread sends them, gathering queued
+    frames into one sendmsg() call where available. A subscriber that
+    stops reading fills only its own queue: further QoS 0 frames to it are
+    dropped instead of blocking the publisher's thread.
+    """
+    
+    def __init__(self, sock, client_id, max_bytes=1 << 20):
+        self.sock = sock
+        self.client_id = client_id
+        self.max_bytes = max_bytes
+        self.frames = deque()
+        self.queued_bytes = 0
+        self.dropped = 0
+        self.closed = False
+        self.ready = threading.Condition(threading.Lock())
+        self.thread = threading.Thread(target=self._run, name=f"outbox-{client_id}", daemon=True)
+        self.thread.start()
+        
+    def send(self, data):
+        """Queue a control packet (acks are never dropped)."""
+        self.put(data, droppable=False)
+        
+    def put(self, frame, droppable=True):
+        """Queue a frame; returns False if it was dropped."""
+        with self.ready:
+            if self.closed or (droppable and self.queued_bytes + len(frame) > self.max_bytes):
+                self.dropped += 1
+                return False
+            self.frames.append(frame)
+            self.queued_bytes += len(frame)
+            if len(self.frames) == 1:
+                self.ready.notify()
+        return True
+        
+    def close(self):
+        """Stop the writer (queued frames are discarded) and close the socket."""
+        with self.ready:
+            self.closed = True
+            self.frames.clear()
+            self.ready.notify()
+        self.sock.close()
+        
+    def _run(self):
+        while True:
+            with self.ready:
+                while not self.frames and not self.closed:
+                    self.ready.wait()
+                if self.closed:
+                    return
+                batch = [self.frames.popleft() for _ in range(min(len(self.frames), SENDMSG_MAX_BUFFERS))]
+                self.queued_bytes -= sum(len(frame) for frame in batch)
+            try:
+                send_frames(self.sock, batch)
+            except OSError:
+                return  # The reader thread sees the closed connection
+
+
+def send_frames(sock, frames):
+    """Send frames in order without joining them (scatter/gather I/O)."""
+    if not hasattr(sock, 'sendmsg'):  # Windows
+        for frame in frames:
+            sock.sendall(frame)
+        return
+    views = [memoryview(frame) for frame in frames]
+    while views:
+        sent = sock.sendmsg(views)
+        # Skip what was written; a partially sent frame continues from a slice
+        while sent:
+            if sent >= len(views[0]):
+                sent -= len(views.pop(0))
+            else:
+                views[0] = views[0][sent:]
+                sent = 0
+
+
+class _TrieNode:
+    __slots__ = ("children", "subscribers", "qos1")
+    
+    def __init__(self):
+        self.children = {}      # topic level (or '+' / '#') -> _TrieNode
+        self.subscribers = {}   # client_id -> granted QoS
+        self.qos1 = set()       # client_ids granted QoS 1 here
+
+
+class TopicTrie:
+    """
+    Subscription filters stored as a tree of topic levels.
+    
+    match() walks the topic's levels once, following the literal child,
+    the '+' child and collecting '#' children on the way, so its cost
+    depends on topic depth and wildcard fan-out, not on the number of
+    filters. Returns each subscriber once even if several filters match,
+    with the highest QoS granted by any of them (0 or 1; the merge relies
+    on QoS 2 never being granted).
+    
+    Why: Checking every filter against every publish (topic_matches per
+    filter, each splitting two strings) is O(filters) per message.
+    """
+    
+    def __init__(self):
+        self.root = _TrieNode()
+        self.filters = defaultdict(set)  # client_id -> its filters (for cleanup)
+        
+    def subscribe(self, topic_filter, client_id, qos=0):
+        node = self.root
+        for level in topic_filter.split('/'):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TrieNode()
+            node = child
+        node.subscribers[client_id] = qos
+        if qos:
+            node.qos1.add(client_id)
+        else:
+            node.qos1.discard(client_id)
+        self.filters[client_id].add(topic_filter)
+        
+    def unsubscribe(self, topic_filter, client_id):
+        path = [self.root]
+        for level in topic_filter.split('/'):
+            node = path[-1].children.get(level)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].subscribers.pop(client_id, None)
+        path[-1].qos1.discard(client_id)
+        filters = self.filters.get(client_id)
+        if filters is not None:
+            filters.discard(topic_filter)
+            if not filters:
+                del self.filters[client_id]
+        # Prune branches left without subscribers
+        levels = topic_filter.split('/')
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.subscribers or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
             
-        filter_parts = topic_filter.split('/')
-        topic_parts = topic.split('/')
-        
-        if len(filter_parts) != len(topic_parts):
-            # Check for multi-level wildcard (#)
-            if filter_parts[-1] == '#':
-                filter_parts = filter_parts[:-1]
-                if len(topic_parts) >= len(filter_parts):
-                    topic_parts = topic_parts[:len(filter_parts)]
-                else:
-                    return False
+    def remove_client(self, client_id):
+        """Drop every subscription of a client."""
+        for topic_filter in list(self.filters.get(client_id, ())):
+            self.unsubscribe(topic_filter, client_id)
+            
+    def match(self, topic):
+        """{client_id: QoS} of subscribers whose filters match `topic`."""
+        matched = {}
+        upgraded = set()  # Matched at QoS 1 by at least one filter
+        levels = topic.split('/')
+        # Wildcards at the first level do not match $-topics ($SYS/...)
+        system = topic.startswith('$')
+        nodes = [self.root]
+        for depth, level in enumerate(levels):
+            wildcards = not (system and depth == 0)
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                if wildcards:
+                    multi = children.get('#')
+                    if multi is not None:
+                        matched.update(multi.subscribers)
+                        upgraded |= multi.qos1
+                    single = children.get('+')
+                    if single is not None:
+                        next_nodes.append(single)
+                child = children.get(level)
+                if child is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+        else:
+            for node in nodes:
+                matched.update(node.subscribers)
+                upgraded |= node.qos1
+                multi = node.children.get('#')  # 'a/#' also matches 'a'
+                if multi is not None:
+                    matched.update(multi.subscribers)
+                    upgraded |= multi.qos1
+        for client_id in upgraded:
+            matched[client_id] = 1
+        return matched
+        
+    def __len__(self):
+        return sum(len(filters) for filters in self.filters.values())
+
+
+class PacketDecoder:
+    """
+    Incremental MQTT framing for one connection.
+    
+    feed() takes whatever the socket returned and gives back every complete
+    packet in it as (first header byte, body memoryview); a trailing partial
+    packet is kept for the next call. Bodies are views into the read (or
+    the carry-over buffer), not copies, and are valid until the next feed();
+    copy anything that must outlive that.
+    
+    Why: TCP is a byte stream. Treating each recv() as one packet drops
+    coalesced packets and truncates split ones.
+    """
+    
+    def __init__(self, max_packet_size=1 << 20):
+        self.max_packet_size = max_packet_size
+        self.buffer = bytearray()  # Unconsumed bytes carried between reads
+        self._consumed = 0         # Prefix of `buffer` handed out by the last feed
+        
+    def feed(self, data):
+        """Packets completed by `data`; raises ValueError on a malformed stream."""
+        if self._consumed:
+            self._compact()
+        if self.buffer:
+            self.buffer += data
+            source = self.buffer
+        else:
+            source = data  # Common case: parse the read in place
+        view = memoryview(source)
+        packets = []
+        pos, end = 0, len(source)
+        while end - pos >= 2:
+            # Remaining length: 1-4 bytes, 7 bits each, least significant first
+            length, shift, i = 0, 0, pos + 1
+            while i < end:
+                byte = source[i]
+                i += 1
+                length |= (byte & 127) << shift
+                if not byte & 128:
+                    break
+                shift += 7
+                if shift > 21:
+                    raise ValueError("Malformed remaining length")
             else:
-                return False
+                break  # Length bytes not complete yet
+            if length > self.max_packet_size:
+                raise ValueError(f"Packet of {length} bytes exceeds {self.max_packet_size}")
+            if end - i < length:
+                break
+            packets.append((source[pos], view[i:i + length]))
+            pos = i + length
+        if source is self.buffer:
+            self._consumed = pos
+        elif pos < end:
+            self.buffer += view[pos:]
+        return packets
+        
+    def _compact(self):
+        # Drop the handed-out prefix; if a caller still holds a view of the
+        # buffer it cannot be resized, so continue in a fresh one
+        try:
+            del self.buffer[:self._consumed]
+        except BufferError:
+            self.buffer = bytearray(self.buffer[self._consumed:])
+        self._consumed = 0
+
+
+class RetainedStore:
+    """
+    Last retained message per topic, bounded by topic count and bytes.
+    
+    The least recently updated topics are evicted first, so a fleet that
+    outgrows the limits keeps the retained values of its active devices.
+    """
+    
+    def __init__(self, max_topics=10000, max_bytes=16 << 20):
+        self.max_topics = max_topics
+        self.max_bytes = max_bytes
+        self.messages = OrderedDict()  # topic -> (payload bytes, qos)
+        self.bytes = 0
+        self.evicted = 0
+        
+    def set(self, topic, payload, qos):
+        """Store (or with an empty payload, clear) the retained message of a topic."""
+        old = self.messages.pop(topic, None)
+        if old is not None:
+            self.bytes -= len(topic) + len(old[0])
+        if not payload:
+            return
+        self.messages[topic] = (bytes(payload), qos)
+        self.bytes += len(topic) + len(payload)
+        while len(self.messages) > self.max_topics or self.bytes > self.max_bytes:
+            old_topic, (old_payload, _) = self.messages.popitem(last=False)
+            self.bytes -= len(old_topic) + len(old_payload)
+            self.evicted += 1
+            
+    def matching(self, topic_filter):
+        """[(topic, payload, qos)] retained under a subscription filter."""
+        if '+' not in topic_filter and '#' not in topic_filter:
+            message = self.messages.get(topic_filter)
+            return [(topic_filter, *message)] if message else []
+        return [(topic, payload, qos) for topic, (payload, qos) in self.messages.items()
+                if topic_matches(topic, topic_filter)]
+
+
+class _Session:
+    """Subscriptions and QoS 1 delivery state of one MQTT client_id."""
+    
+    __slots__ = ("client_id", "clean", "client", "inflight", "pending", "next_id",
+                 "disconnected_at", "dropped")
+    
+    def __init__(self, client_id, clean):
+        self.client_id = client_id
+        self.clean = clean            # Clean sessions end with their connection
+        self.client = None            # Connected _BrokerProtocol, if any
+        self.inflight = OrderedDict()  # packet_id -> [frame, sent_at], oldest first
+        self.pending = deque()        # (topic, payload, retain) waiting for the window
+        self.next_id = 1
+        self.disconnected_at = None
+        self.dropped = 0              # QoS 1 messages dropped from a full queue
+        
+    def packet_id(self):
+        """Next free 16-bit packet identifier."""
+        while True:
+            packet_id = self.next_id
+            self.next_id = packet_id % 65535 + 1
+            if packet_id not in self.inflight:
+                return packet_id
+
+
+class _BrokerProtocol(asyncio.Protocol):
+    """One client connection of AsyncMQTTBroker."""
+    
+    def __init__(self, broker):
+        self.broker = broker
+        self.decoder = PacketDecoder()
+        self.transport = None
+        self.client_id = None  # Set by CONNECT
+        self.session = None
+        
+    def connection_made(self, transport):
+        self.transport = transport
+        self.broker.register(self)
+        
+    def data_received(self, data):
+        try:
+            packets = self.decoder.feed(data)
+        except ValueError as e:
+            print(f"[MQTT Broker] Closing {self.client_id}: {e}")
+            self.transport.close()
+            return
+        for header, body in packets:
+            try:
+                self.broker.handle_packet(self, header, body)
+            except Exception as e:
+                print(f"[MQTT Broker] Error handling client {self.client_id}: {e}")
+                self.transport.close()
+                return
                 
-        for f_part, t_part in zip(filter_parts, topic_parts):
-            if f_part != '+' and f_part != t_part:
-                return False
+    def connection_lost(self, exc):
+        self.broker.unregister(self)
+        
+    # Backpressure: stop reading from a client that is not reading its acks
+    def pause_writing(self):
+        self.transport.pause_reading()
+        
+    def resume_writing(self):
+        self.transport.resume_reading()
+
+
+class AsyncMQTTBroker:
+    """
+    MQTT broker with every client on one asyncio event loop.
+    Supports: CONNECT, PUBLISH (QoS 0/1, retain), PUBACK, SUBSCRIBE,
+    UNSUBSCRIBE, PINGREQ, DISCONNECT
+    
+    Why: SimpleMQTTBroker spends an OS thread (and its stack) per device
+    and its accept backlog is 5, so a few hundred devices is the ceiling.
+    Here a connection is a protocol object and a read buffer; thousands
+    fit on one loop.
+    
+    Shared subscriptions ($share/{group}/{filter}) deliver each message to
+    one member of the group. The member is picked by a hash of the topic,
+    so one device's messages keep going to the same consumer, in order,
+    while the group membership is unchanged; connected members are
+    preferred. Retained messages are not sent on shared subscriptions.
+    
+    Sessions are keyed by MQTT client_id. A client that connects with
+    clean_session=0 keeps its subscriptions across reconnects, and QoS 1
+    messages published while it is away are queued for it. QoS 1 delivery
+    keeps at most `max_inflight` unacknowledged messages per client and
+    resends them (DUP) after `retry_interval` seconds and on reconnect.
+    
+    Memory bounds: per session `max_inflight` + `max_queued` messages;
+    retained messages `max_retained` topics / `max_retained_bytes`;
+    disconnected persistent sessions expire after `session_expiry` seconds.
+    """
+    
+    def __init__(self, host='0.0.0.0', port=1883, backlog=4096, verbose=False,
+                 max_buffer=1 << 20, max_inflight=32, max_queued=10000, retry_interval=10.0,
+                 session_expiry=3600.0, max_retained=10000, max_retained_bytes=16 << 20):
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.max_buffer = max_buffer  # Unsent bytes per subscriber before QoS 0 drops
+        self.max_inflight = max_inflight
+        self.max_queued = max_queued
+        self.retry_interval = retry_interval
+        self.session_expiry = session_expiry
+        self.verbose = verbose  # Log every PUBLISH (slow under load)
+        self.clients = {}  # client_id -> connected _BrokerProtocol
+        self.sessions = {}  # client_id -> _Session
+        self.topics = TopicTrie()  # Subscriptions, by session client_id
+        self.retained = RetainedStore(max_retained, max_retained_bytes)
+        self.listeners = {}  # ("local", n) -> callback(topic, payload), see add_listener
+        self.shared = {}  # (group, filter) -> {client_id: granted QoS}
+        self._shared_candidates = {}  # (group, filter) -> sorted members to pick from
+        self.server = None
+        self._housekeeping = None
+        self._anonymous = 0
+        
+        # Metrics
+        self.connections = 0
+        self.peak_connections = 0
+        self.messages_in = 0
+        self.messages_out = 0
+        self.dropped = 0  # Frames not queued for subscribers over max_buffer
+        self.retries = 0
+        
+    def start(self):
+        """Run the broker until interrupted."""
+        asyncio.run(self.serve_forever())
+        
+    async def serve_forever(self):
+        await self.serve()
+        async with self.server:
+            await self.server.serve_forever()
+            
+    async def serve(self):
+        """Start listening on the running loop."""
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(
+            lambda: _BrokerProtocol(self), self.host, self.port, backlog=self.backlog)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._housekeeping = loop.create_task(self.housekeeping())
+        print(f"[MQTT Broker] Started on {self.host}:{self.port} (asyncio, backlog={self.backlog})")
+        
+    def close(self):
+        """Stop accepting connections and stop housekeeping."""
+        if self._housekeeping:
+            self._housekeeping.cancel()
+        if self.server:
+            self.server.close()
+            
+    def add_listener(self, topic_filter, callback):
+        """
+        Deliver messages matching `topic_filter` to callback(topic, payload).
+        
+        Why: An application that embeds the broker gets its messages
+        without a loopback MQTT client, i.e. no socket hop and no second
+        packet decode. `payload` is a memoryview into the read buffer and
+        is only valid during the call; callbacks run on the broker loop.
+        """
+        listener_id = ("local", len(self.listeners))  # Not a valid MQTT client_id
+        self.listeners[listener_id] = callback
+        self.topics.subscribe(topic_filter, listener_id)
+        
+    def register(self, client):
+        self.connections += 1
+        self.peak_connections = max(self.peak_connections, self.connections)
+        
+    def unregister(self, client):
+        self.connections -= 1
+        session = client.session
+        if session is None or session.client is not client:
+            return  # Never connected, or taken over by a newer connection
+        session.client = None
+        del self.clients[session.client_id]
+        self._shared_candidates.clear()  # Connected members changed
+        if session.clean:
+            self.end_session(session)
+        else:
+            session.disconnected_at = time.monotonic()
+        if self.verbose:
+            print(f"[MQTT Broker] Client {client.client_id} disconnected")
+            
+    def end_session(self, session):
+        self.sessions.pop(session.client_id, None)
+        self.topics.remove_client(session.client_id)
+        for group, shared_filter in list(self.shared):
+            self.unsubscribe_shared(group, shared_filter, session.client_id)
+            
+    def subscribe_shared(self, group, shared_filter, client_id, qos):
+        members = self.shared.get((group, shared_filter))
+        if members is None:
+            members = self.shared[(group, shared_filter)] = {}
+            self.topics.subscribe(shared_filter, ("share", group, shared_filter))
+        members[client_id] = qos
+        self._shared_candidates.clear()
+        
+    def unsubscribe_shared(self, group, shared_filter, client_id):
+        members = self.shared.get((group, shared_filter))
+        if members is None or members.pop(client_id, None) is None:
+            return
+        if not members:
+            del self.shared[(group, shared_filter)]
+            self.topics.unsubscribe(shared_filter, ("share", group, shared_filter))
+        self._shared_candidates.clear()
+        
+    def pick_shared(self, share_id, topic, exclude=None):
+        """
+        (client_id, granted QoS) of the group member that gets a message on
+        `topic`, or (None, 0) if `exclude` (the publisher) is the only one.
+        """
+        key = share_id[1:]
+        candidates = self._shared_candidates.get(key)
+        if candidates is None:
+            members = self.shared[key]
+            # Connected members first; offline persistent members queue QoS 1
+            candidates = sorted(m for m in members if m in self.clients) or sorted(members)
+            self._shared_candidates[key] = candidates
+        index = zlib.crc32(topic.encode()) % len(candidates)
+        client_id = candidates[index]
+        if client_id == exclude:
+            # The publisher does not get its own message; the next member does
+            if len(candidates) == 1:
+                return None, 0
+            client_id = candidates[(index + 1) % len(candidates)]
+        return client_id, self.shared[key][client_id]
+        
+    def handle_packet(self, client, header, body):
+        """Dispatch one decoded packet."""
+        packet_type = header >> 4
+        write = client.transport.write
+        
+        if client.session is None and packet_type != 1:
+            raise ValueError("Expected CONNECT")
+            
+        if packet_type == 3:  # PUBLISH
+            self.handle_publish(client, header, body)
+        elif packet_type == 4:  # PUBACK
+            session = client.session
+            session.inflight.pop((body[0] << 8) | body[1], None)
+            self.send_pending(session)
+        elif packet_type == 1:  # CONNECT
+            self.handle_connect(client, body)
+        elif packet_type == 8:  # SUBSCRIBE
+            self.handle_subscribe(client, body)
+        elif packet_type == 10:  # UNSUBSCRIBE
+            packet_id, filters = parse_unsubscribe(body)
+            for topic_filter in filters:
+                shared = parse_shared(topic_filter)
+                if shared:
+                    self.unsubscribe_shared(*shared, client.client_id)
+                else:
+                    self.topics.unsubscribe(topic_filter, client.client_id)
+            write(b'\xb0\x02' + packet_id)  # UNSUBACK
+        elif packet_type == 12:  # PINGREQ
+            write(b'\xd0\x00')
+        elif packet_type == 14:  # DISCONNECT
+            client.transport.close()
+            
+    def handle_connect(self, client, body):
+        """Attach the connection to its client_id session (new or resumed)."""
+        if client.session is not None:
+            raise ValueError("Second CONNECT")
+        client_id, clean, _ = parse_connect(body)
+        if not client_id:
+            self._anonymous += 1
+            client_id, clean = f"anonymous-{self._anonymous}", True
+            
+        # A client_id can only be connected once: the newer connection wins
+        previous = self.clients.get(client_id)
+        if previous is not None:
+            previous.session.client = None
+            previous.transport.close()
+            
+        session = self.sessions.get(client_id)
+        if session is not None and clean:
+            self.end_session(session)
+            session = None
+        present = session is not None
+        if session is None:
+            session = self.sessions[client_id] = _Session(client_id, clean)
+        session.clean = clean
+        session.client = client
+        session.disconnected_at = None
+        client.client_id = client_id
+        client.session = session
+        self.clients[client_id] = client
+        self._shared_candidates.clear()
+        
+        client.transport.write(b'\x20\x02' + (b'\x01' if present else b'\x00') + b'\x00')  # CONNACK
+        if self.verbose:
+            print(f"[MQTT Broker] Client {client_id} connected ({'resumed' if present else 'new'} session)")
+        if present:
+            # Unacknowledged messages first, in order, then the backlog
+            for entry in session.inflight.values():
+                entry[0] = _with_dup(entry[0])
+                entry[1] = time.monotonic()
+                client.transport.write(entry[0])
+            self.send_pending(session)
+            
+    def handle_subscribe(self, client, body):
+        """Handle MQTT SUBSCRIBE packet, then send matching retained messages."""
+        packet_id, filters = parse_subscribe(body)
+        granted = bytearray()
+        for topic_filter, requested_qos in filters:
+            qos = min(requested_qos, 1)  # QoS 2 is granted as 1
+            try:
+                shared = parse_shared(topic_filter)
+            except ValueError as e:
+                print(f"[MQTT Broker] Client {client.client_id}: {e}")
+                granted.append(0x80)  # Failure
+                continue
+            if shared:
+                self.subscribe_shared(*shared, client.client_id, qos)
+            else:
+                self.topics.subscribe(topic_filter, client.client_id, qos)
+            granted.append(qos)
+            print(f"[MQTT Broker] Client {client.client_id} subscribed to: {topic_filter} (QoS {qos})")
+        client.transport.write(b'\x90' + encode_remaining_length(2 + len(granted)) + packet_id + granted)
+        
+        for (topic_filter, _), qos in zip(filters, granted):
+            if qos == 0x80 or topic_filter.startswith('$share/'):
+                continue
+            for topic, payload, retained_qos in self.retained.matching(topic_filter):
+                self.deliver(client.session, topic, payload, min(qos, retained_qos), retain=True)
                 
-        return True
+    def handle_publish(self, client, header, body):
+        """Handle MQTT PUBLISH packet."""
+        topic, qos, packet_id, payload = parse_publish(header, body)
+        if qos == 1:
+            client.transport.write(b'\x40\x02' + packet_id)  # PUBACK
+        self.messages_in += 1
+        if self.verbose:
+            print(f"[MQTT Broker] PUBLISH from {client.client_id}: {topic} "
+                  f"{bytes(payload[:200]).decode('utf-8', errors='ignore')}")
+        if header & 0x01:  # RETAIN
+            self.retained.set(topic, payload, min(qos, 1))
+        self.forward_message(topic, payload, client.client_id, min(qos, 1))
+        
+    def forward_message(self, topic, payload, sender_id, qos=0):
+        """
+        Forward a published message to matching subscribers.
+        
+        Each subscriber gets min(publish QoS, granted QoS). The QoS 0 frame
+        is encoded once and the same bytes go to every transport. Each
+        transport is its own non-blocking write buffer, so a subscriber
+        that stops reading only grows its own buffer, up to max_buffer;
+        after that its QoS 0 frames are dropped.
+        """
+        packet = None
+        listeners = self.listeners
+        for client_id, granted in self.topics.match(topic).items():
+            if client_id == sender_id:
+                continue
+            if type(client_id) is tuple:  # In-process listener or shared subscription
+                if client_id in listeners:
+                    try:
+                        listeners[client_id](topic, payload)
+                    except Exception as e:
+                        print(f"[MQTT Broker] Listener error on {topic}: {e}")
+                    continue
+                client_id, granted = self.pick_shared(client_id, topic, exclude=sender_id)
+                if client_id is None:
+                    continue
+            if qos and granted:
+                if not isinstance(payload, bytes):
+                    payload = bytes(payload)  # Queued messages outlive the read buffer
+                self.deliver(self.sessions[client_id], topic, payload, 1)
+                continue
+            client = self.clients.get(client_id)
+            if client is None:
+                continue  # QoS 0 is not queued for offline sessions
+            transport = client.transport
+            if transport.get_write_buffer_size() > self.max_buffer:
+                self.dropped += 1
+                continue
+            if packet is None:
+                packet = encode_publish(topic, payload)
+            transport.write(packet)
+            self.messages_out += 1
+            
+    def deliver(self, session, topic, payload, qos, retain=False):
+        """Send one message to a session (QoS 1 through its in-flight window)."""
+        if qos == 0:
+            if session.client is not None:
+                frame = encode_publish(topic, payload)
+                if retain:
+                    frame = bytes([frame[0] | 0x01]) + frame[1:]
+                session.client.transport.write(frame)
+                self.messages_out += 1
+            return
+        session.pending.append((topic, payload, retain))
+        if len(session.pending) > self.max_queued:
+            session.pending.popleft()
+            session.dropped += 1
+            self.dropped += 1
+        self.send_pending(session)
+        
+    def send_pending(self, session):
+        """Move queued QoS 1 messages into the in-flight window."""
+        client = session.client
+        if client is None:
+            return
+        now = time.monotonic()
+        while session.pending and len(session.inflight) < self.max_inflight:
+            topic, payload, retain = session.pending.popleft()
+            packet_id = session.packet_id()
+            frame = encode_publish(topic, payload, qos=1, packet_id=packet_id, retain=retain)
+            session.inflight[packet_id] = [frame, now]
+            client.transport.write(frame)
+            self.messages_out += 1
+            
+    async def housekeeping(self, interval=1.0):
+        """Retry unacknowledged QoS 1 messages and expire offline sessions."""
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for session in list(self.sessions.values()):
+                if session.client is not None:
+                    for entry in session.inflight.values():
+                        if now - entry[1] < self.retry_interval:
+                            break  # Oldest first: the rest are newer
+                        entry[0] = _with_dup(entry[0])
+                        entry[1] = now
+                        session.client.transport.write(entry[0])
+                        self.retries += 1
+                elif now - session.disconnected_at > self.session_expiry:
+                    self.end_session(session)
+                    
+    def metrics(self):
+        return {
+            "connections": self.connections,
+            "peak_connections": self.peak_connections,
+            "sessions": len(self.sessions),
+            "messages_in": self.messages_in,
+            "messages_out": self.messages_out,
+            "dropped": self.dropped,
+            "retries": self.retries,
+            "inflight": sum(len(session.inflight) for session in self.sessions.values()),
+            "queued": sum(len(session.pending) for session in self.sessions.values()),
+            "retained": len(self.retained.messages),
+            "retained_bytes": self.retained.bytes,
+            "subscriptions": len(self.topics),
+            "listeners": len(self.listeners),
+            "shared_groups": len(self.shared),
+        }
+
+
+def _with_dup(frame):
+    """The same PUBLISH frame with the DUP flag set (for redelivery)."""
+    return frame if frame[0] & 0x08 else bytes([frame[0] | 0x08]) + frame[1:]
+
+
+def topic_matches(topic, topic_filter):
+    """Check if topic matches topic filter (with + and # wildcards)."""
+    filter_parts = topic_filter.split('/')
+    topic_parts = topic.split('/')
+    
+    # Wildcards at the first level do not match $-topics ($SYS/...)
+    if topic.startswith('$') and filter_parts[0] in ('+', '#'):
+        return False
+        
+    for i, f_part in enumerate(filter_parts):
+        if f_part == '#':
+            return True  # Also matches the parent level ('a/#' matches 'a')
+        if i >= len(topic_parts):
+            return False
+        if f_part != '+' and f_part != topic_parts[i]:
+            return False
+            
+    return len(filter_parts) == len(topic_parts)
+
 
 if __name__ == "__main__":
-    broker = SimpleMQTTBroker(host='0.0.0.0', port=1883)
+    parser = argparse.ArgumentParser(description="Simple MQTT broker for IoT Dashboard")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=1883)
+    parser.add_argument("--mode", choices=("async", "threaded"), default="async")
+    parser.add_argument("--verbose", action="store_true", help="log every PUBLISH (async mode)")
+    parser.add_argument("--max-inflight", type=int, default=32, help="unacked QoS 1 messages per client (async mode)")
+    parser.add_argument("--max-queued", type=int, default=10000, help="queued QoS 1 messages per session (async mode)")
+    args = parser.parse_args()
+    
+    if args.mode == "async":
+        broker = AsyncMQTTBroker(host=args.host, port=args.port, verbose=args.verbose,
+                                 max_inflight=args.max_inflight, max_queued=args.max_queued)
+    else:
+        broker = SimpleMQTTBroker(host=args.host, port=args.port)
     
     print("=" * 60)
     print("Simple MQTT Broker for IoT Dashboard")
@@ -164,7 +164,8 @@ class ESP32MQTTSimulator:
             result = self.client.publish(
                 self.topic,
                 json.dumps(payload),
-                qos=1  # At least once delivery
+                qos=1,  # At least once delivery
+                retain=True  # Broker keeps the last value for subscribers that (re)connect
             )
             
             if result.rc == mqtt.MQTT_ERR_SUCCESS: